@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import time
+
+from yt_dlp.aes import (
+    BLOCK_SIZE_BYTES,
+    _native_cbc_decrypt,
+    _native_ctr_crypt,
+    _native_ghash,
+    aes_decrypt,
+    aes_encrypt,
+    key_expansion,
+    xor,
+)
+from yt_dlp.dependencies import Cryptodome
+from yt_dlp.utils import bytes_to_intlist, intlist_to_bytes
+
+
+def bytewise_cbc_decrypt(data, key, iv):
+    """The byte-by-byte implementation that was used before the word-oriented one"""
+    data, expanded_key = bytes_to_intlist(data), key_expansion(bytes_to_intlist(key))
+    decrypted, previous = [], bytes_to_intlist(iv)
+    for i in range(0, len(data), BLOCK_SIZE_BYTES):
+        block = data[i: i + BLOCK_SIZE_BYTES]
+        decrypted += xor(aes_decrypt(block, expanded_key), previous)
+        previous = block
+    return intlist_to_bytes(decrypted)
+
+
+def bytewise_ctr_crypt(data, key, iv):
+    data, expanded_key = bytes_to_intlist(data), key_expansion(bytes_to_intlist(key))
+    counter, out = int.from_bytes(iv, 'big'), []
+    for i in range(0, len(data), BLOCK_SIZE_BYTES):
+        keystream = aes_encrypt(bytes_to_intlist(counter.to_bytes(BLOCK_SIZE_BYTES, 'big')), expanded_key)
+        out += xor(data[i: i + BLOCK_SIZE_BYTES], keystream)
+        counter += 1
+    return intlist_to_bytes(out)
+
+
+def measure(func, size, repeat):
+    best = min(timeit(func) for _ in range(repeat))
+    return size / best / 1024
+
+
+def timeit(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the throughput of the AES implementations')
+    parser.add_argument('--size', type=int, default=256, help='Size of the data in KiB (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per case (default: %(default)s)')
+    parser.add_argument('--skip-bytewise', action='store_true', help='Skip the (slow) byte-by-byte implementation')
+    opts = parser.parse_args()
+
+    data = os.urandom(opts.size * 1024)
+    key, iv = os.urandom(16), os.urandom(16)
+    cases = {
+        'CBC': {
+            'word': lambda: _native_cbc_decrypt(data, key, iv),
+            'bytewise': lambda: bytewise_cbc_decrypt(data, key, iv),
+        },
+        'CTR': {
+            'word': lambda: _native_ctr_crypt(data, key, iv),
+            'bytewise': lambda: bytewise_ctr_crypt(data, key, iv),
+        },
+        # GCM is CTR plus GHASH
+        'GHASH': {
+            'word': lambda: _native_ghash(key, data),
+        },
+    }
+    if Cryptodome.AES:
+        cases['CBC']['pycryptodome'] = lambda: Cryptodome.AES.new(key, Cryptodome.AES.MODE_CBC, iv).decrypt(data)
+        cases['CTR']['pycryptodome'] = lambda: Cryptodome.AES.new(
+            key, Cryptodome.AES.MODE_CTR, nonce=b'', initial_value=iv).decrypt(data)
+
+    for mode, implementations in cases.items():
+        for name, func in implementations.items():
+            if name == 'bytewise' and opts.skip_bytewise:
+                continue
+            print(f'{mode:>5} {name:>12}: {measure(func, len(data), opts.repeat):10.1f} KiB/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import http.server
+import multiprocessing
+import tempfile
+import time
+
+from yt_dlp import YoutubeDL
+from yt_dlp.downloader.http import HttpFD
+
+CHUNK = os.urandom(1024 * 1024)
+
+
+class ReadHttpFD(HttpFD):
+    _USE_READINTO = False
+
+
+class QuietLogger:
+    def debug(self, msg):
+        pass
+
+    warning = error = debug
+
+
+def serve(size, port_queue):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'video/mp4')
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            for pos in range(0, size, len(CHUNK)):
+                self.wfile.write(CHUNK[:size - pos])
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    port_queue.put(httpd.server_address[1])
+    httpd.serve_forever()
+
+
+def run(fd_class, url, filename, params):
+    params = {'logger': QuietLogger(), 'noprogress': True, **params}
+    downloader = fd_class(YoutubeDL(params), params)
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    assert downloader.real_download(filename, {'url': url})
+    elapsed_wall, elapsed_cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+    os.remove(filename)
+    return elapsed_wall, elapsed_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the read loops of HttpFD against a local HTTP server')
+    parser.add_argument('--size', type=int, default=512, help='Size of the file in MiB (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of downloads per mode (default: %(default)s)')
+    parser.add_argument('--buffer-size', type=int, default=1024, help='Initial block size (default: %(default)s)')
+    parser.add_argument('--no-resize-buffer', action='store_true', help='Keep the block size fixed')
+    opts = parser.parse_args()
+
+    # The server runs in its own process, so that its CPU time is not counted
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(opts.size * 1024 * 1024, port_queue), daemon=True)
+    server.start()
+    url = f'http://127.0.0.1:{port_queue.get()}/file.mp4'
+    params = {'buffersize': opts.buffer_size, 'noresizebuffer': opts.no_resize_buffer}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'file.mp4')
+        for name, fd_class in (('read', ReadHttpFD), ('readinto', HttpFD)):
+            results = [run(fd_class, url, filename, params) for _ in range(opts.repeat)]
+            wall, cpu = min(r[0] for r in results), min(r[1] for r in results)
+            print(f'{name:>8}: {opts.size / wall:8.1f} MiB/s, {cpu:6.2f}s CPU ({wall:.2f}s wall, best of {opts.repeat})')
+
+    server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import ast
+import time
+
+from test.helper import FakeYDL
+from yt_dlp.extractor.common import InfoExtractor
+from yt_dlp.utils import iter_js_to_json, js_to_json
+
+TEST_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test')
+
+
+def string_arguments(fn, func_name):
+    """Collect the string literals that are passed as first argument to func_name in a test file"""
+    with open(os.path.join(TEST_DIR, fn), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [node.args[0].value for node in ast.walk(tree)
+            if isinstance(node, ast.Call) and getattr(node.func, 'id', getattr(node.func, 'attr', None)) == func_name
+            and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)]
+
+
+def build_corpus():
+    """@returns the JS snippets of the js_to_json tests and the JWPlayer configs of the InfoExtractor tests"""
+    snippets = string_arguments('test_utils.py', 'js_to_json')
+    configs = []
+    ie = InfoExtractor(FakeYDL())
+    for webpage in string_arguments('test_InfoExtractor.py', '_extract_jwplayer_data'):
+        ie._find_jwplayer_data(webpage, transform_source=lambda code: configs.append(code) or js_to_json(code))
+    return snippets, configs
+
+
+def measure(func, repeat):
+    """@returns the time of the fastest of repeat runs in milliseconds"""
+    def timeit():
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    return min(timeit() for _ in range(repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure js_to_json on a corpus built from the test fixtures')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of rounds, the fastest is shown (default: %(default)s)')
+    parser.add_argument('--size', type=int, default=4, help='Size of the large document in MiB (default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='Chunk size for iter_js_to_json in KiB (default: %(default)s)')
+    opts = parser.parse_args()
+
+    snippets, configs = build_corpus()
+    # Large configs like the ones of Nuxt.js or JWPlayer are arrays or objects of such values
+    element = ',\n'.join(configs + [snippet for snippet in snippets if snippet.lstrip()[:1] in ('{', '[')])
+    document = f'[{element}'
+    while len(document) < opts.size * 1024 * 1024:
+        document += f',\n{element}'
+    document += ']'
+    chunk_size = opts.chunk_size * 1024
+    chunks = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+    if ''.join(iter_js_to_json(chunks)) != js_to_json(document):
+        print('iter_js_to_json differs from js_to_json', file=sys.stderr)
+
+    print(f'{"corpus":>20} {"size [KiB]":>11} {"js_to_json [ms]":>16} {"iter_js_to_json [ms]":>21}')
+    for name, codes in (('snippets', snippets), ('jwplayer configs', configs), ('large document', [document])):
+        size = sum(map(len, codes)) / 1024
+        whole = measure(lambda: [js_to_json(code) for code in codes], opts.repeat)
+        chunked = measure(lambda: [''.join(iter_js_to_json(
+            code[i:i + chunk_size] for i in range(0, len(code), chunk_size))) for code in codes], opts.repeat)
+        print(f'{name:>20} {size:11.1f} {whole:16.1f} {chunked:21.1f}')
+
+
+if __name__ == '__main__':
+    main()
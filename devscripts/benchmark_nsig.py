@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import re
+import time
+import urllib.request
+
+from test.helper import FakeYDL
+from test.test_youtube_signature import _NSIG_TESTS
+from yt_dlp.extractor import YoutubeIE
+from yt_dlp.jsinterp import JSInterpreter
+
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test', 'testdata', 'sigs')
+
+
+def load_player(url, player_id):
+    """Read the player from the directory that test_youtube_signature uses, downloading it if needed"""
+    fn = os.path.join(TESTDATA_DIR, f'player-nsig-{player_id}.js')
+    if not os.path.exists(fn):
+        os.makedirs(TESTDATA_DIR, exist_ok=True)
+        urllib.request.urlretrieve(url, fn)
+    with open(fn, encoding='utf-8') as f:
+        return f.read()
+
+
+def clear_caches():
+    for func in (JSInterpreter._separate, JSInterpreter._separate_at_operator, JSInterpreter._literal_json):
+        func.cache_clear()
+
+
+def timeit(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the time the nsig functions of the test players take')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs with warm caches (default: %(default)s)')
+    parser.add_argument('players', nargs='*', help='Only measure these player ids')
+    opts = parser.parse_args()
+
+    ie = YoutubeIE(FakeYDL())
+    print(f'{"player":>10} {"parse [ms]":>11} {"cold [ms]":>10} {"warm [ms]":>10}')
+    total_cold = total_warm = 0
+    for url, n, expected in _NSIG_TESTS:
+        player_id = re.match(r'.+/player/(?P<id>[a-zA-Z0-9_-]+)/.+.js$', url).group('id')
+        if opts.players and player_id not in opts.players:
+            continue
+        jscode = load_player(url, player_id)
+        clear_caches()
+        jsi = JSInterpreter(jscode)
+        start = time.perf_counter()
+        func = jsi.extract_function_from_code(*jsi.extract_function_code(ie._extract_n_function_name(jscode)))
+        parse = time.perf_counter() - start
+
+        results = []
+        cold = timeit(lambda: results.append(func([n])))
+        warm = min(timeit(lambda: results.append(func([n]))) for _ in range(opts.repeat))
+        if any(result != expected for result in results):
+            print(f'{player_id}: expected {expected!r}, got {results[0]!r}', file=sys.stderr)
+        total_cold, total_warm = total_cold + cold, total_warm + warm
+        print(f'{player_id:>10} {parse * 1000:11.1f} {cold * 1000:10.1f} {warm * 1000:10.1f}')
+    print(f'{"total":>10} {"":>11} {total_cold * 1000:10.1f} {total_warm * 1000:10.1f}')
+
+
+if __name__ == '__main__':
+    main()
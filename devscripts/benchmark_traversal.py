@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import json
+import time
+
+from yt_dlp.utils import compile_path, traverse_obj
+from yt_dlp.utils.traversal import _COMPILED_PATHS
+
+# Paths in the style of the ones that the YouTube extractor uses
+PLAYER_RESPONSE_PATHS = [
+    (('streamingData', ('formats', 'adaptiveFormats'), ..., {dict}),),
+    (('videoDetails', 'title'), ('microformat', 'playerMicroformatRenderer', 'title', 'simpleText')),
+    (('microformat', 'playerMicroformatRenderer', 'publishDate'),),
+    (('streamingData', 'adaptiveFormats', lambda _, v: v['itag'] == 251, 'url'),),
+    (('videoDetails', {'id': 'videoId', 'title': 'title', 'tags': ('keywords', ..., {str})}),),
+    (('playabilityStatus', 'status'),),
+]
+INITIAL_DATA_PATHS = [
+    (('contents', 'twoColumnWatchNextResults', 'results', 'results', 'contents', ...,
+      'videoPrimaryInfoRenderer', 'title', 'runs', ..., 'text'),),
+    (('contents', 'twoColumnWatchNextResults', 'results', 'results', 'contents', ...,
+      'videoSecondaryInfoRenderer', 'owner', 'videoOwnerRenderer', 'title', 'runs', 0, 'text'),),
+    (('contents', 'twoColumnWatchNextResults', 'secondaryResults', 'secondaryResults', 'results', ...,
+      'compactVideoRenderer', {'id': 'videoId', 'title': ('title', 'simpleText')}),),
+    (('engagementPanels', ..., 'engagementPanelSectionListRenderer', 'content', 'macroMarkersListRenderer',
+      'contents', ..., 'macroMarkersListItemRenderer', 'timeDescription', 'simpleText'),),
+]
+
+
+def synthetic_player_response():
+    return {
+        'playabilityStatus': {'status': 'OK'},
+        'streamingData': {
+            'formats': [{'itag': 18, 'url': 'https://example.com/18', 'mimeType': 'video/mp4'}],
+            'adaptiveFormats': [{
+                'itag': itag, 'url': f'https://example.com/{itag}', 'mimeType': 'video/mp4',
+                'bitrate': itag * 1000, 'width': 1920, 'height': 1080, 'quality': 'hd1080',
+            } for itag in range(100, 400, 5)],
+        },
+        'videoDetails': {'videoId': 'x' * 11, 'title': 'title', 'keywords': [f'tag {i}' for i in range(20)]},
+        'microformat': {'playerMicroformatRenderer': {'publishDate': '2023-01-01', 'title': {'simpleText': 'title'}}},
+    }
+
+
+def synthetic_initial_data():
+    video = lambda i: {'compactVideoRenderer': {
+        'videoId': f'{i:011d}', 'title': {'simpleText': f'video {i}'}, 'thumbnail': {'thumbnails': [{}] * 4}}}
+    return {
+        'contents': {'twoColumnWatchNextResults': {
+            'results': {'results': {'contents': [
+                {'videoPrimaryInfoRenderer': {'title': {'runs': [{'text': 'title'}] * 3}}},
+                {'videoSecondaryInfoRenderer': {'owner': {'videoOwnerRenderer': {'title': {'runs': [{'text': 'owner'}]}}}}},
+            ]}},
+            'secondaryResults': {'secondaryResults': {'results': [video(i) for i in range(40)]}},
+        }},
+        'engagementPanels': [{'engagementPanelSectionListRenderer': {'content': {'macroMarkersListRenderer': {
+            'contents': [{'macroMarkersListItemRenderer': {'timeDescription': {'simpleText': f'{i}:00'}}}
+                         for i in range(20)]}}}}] * 3,
+    }
+
+
+def measure(obj, paths, repeat, prepare=None):
+    """@returns the average time per call in microseconds, of the fastest of 5 rounds"""
+    def timeit():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for path in paths:
+                if prepare:
+                    prepare()
+                traverse_obj(obj, *path)
+        return time.perf_counter() - start
+
+    return min(timeit() for _ in range(5)) / repeat / len(paths) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure traverse_obj on YouTube player responses and initial data')
+    parser.add_argument('--repeat', type=int, default=500, help='Number of runs per path and round (default: %(default)s)')
+    parser.add_argument(
+        'fixtures', nargs='*', metavar='FILE',
+        help='JSON files of recorded ytInitialPlayerResponse/ytInitialData; synthetic ones are used by default')
+    opts = parser.parse_args()
+
+    fixtures = []
+    for fn in opts.fixtures:
+        with open(fn, encoding='utf-8') as f:
+            fixtures.append((os.path.basename(fn), json.load(f)))
+    if not fixtures:
+        fixtures = [('player response', synthetic_player_response()), ('initial data', synthetic_initial_data())]
+
+    print(f'{"fixture":>20} {"uncached [us]":>14} {"cached [us]":>12} {"compiled [us]":>14}')
+    for name, obj in fixtures:
+        paths = PLAYER_RESPONSE_PATHS if 'streamingData' in obj else INITIAL_DATA_PATHS
+        compiled = [tuple(map(compile_path, path)) for path in paths]
+        print(f'{name:>20} {measure(obj, paths, opts.repeat, _COMPILED_PATHS.clear):14.1f} '
+              f'{measure(obj, paths, opts.repeat):12.1f} {measure(obj, compiled, opts.repeat):14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import argparse
+import re
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(statement, python=sys.executable):
+    """Run the statement in a new interpreter and return {module: (self, cumulative, depth)} of what it imports"""
+    stderr = subprocess.run(
+        [python, '-X', 'importtime', '-c', statement], cwd=ROOT_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True).stderr
+    times = {}
+    for mobj in re.finditer(r'(?m)^import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)$', stderr):
+        self_us, cumulative_us, indent, module = mobj.groups()
+        times[module] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show what is imported at startup and how long it takes')
+    parser.add_argument(
+        'statement', nargs='?', default='import yt_dlp', help='Statement to measure (default: %(default)r)')
+    parser.add_argument('--top', type=int, default=25, help='Number of modules to show (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs; the fastest is kept (default: %(default)s)')
+    parser.add_argument('--sort', choices=('cumulative', 'self'), default='cumulative',
+                        help='Order of the modules (default: %(default)s)')
+    parser.add_argument('--prefix', default='', help='Only show the modules that start with this')
+    opts = parser.parse_args()
+
+    runs = [import_times(opts.statement) for _ in range(opts.repeat)]
+    times = {module: min(run[module] for run in runs if module in run) for module in runs[0]}
+    total = sum(self_us for self_us, _, _ in times.values())
+    print(f'{opts.statement!r} imports {len(times)} modules in {total / 1000:.1f} ms')
+
+    key = (lambda item: item[1][0]) if opts.sort == 'self' else (lambda item: item[1][1])
+    shown = sorted((item for item in times.items() if item[0].startswith(opts.prefix)), key=key, reverse=True)
+    print(f'{"self [ms]":>10} {"cumulative [ms]":>16}  module')
+    for module, (self_us, cumulative_us, depth) in shown[:opts.top]:
+        print(f'{self_us / 1000:10.1f} {cumulative_us / 1000:16.1f}  {"  " * depth}{module}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 import random
 import re
 
+from ._instances import InstanceList  # noqa: F401
 from ..utils import (
     age_restricted,
     bug_reports_message,
@@ -18,6 +18,8 @@
     '_WORKING', 'IE_DESC', '_NETRC_MACHINE', 'SEARCH_KEY',  # Used for --extractor-descriptions
     'age_limit',  # Used for --age-limit (evaluated)
     '_RETURN_TYPE',  # Accessed in CLI only with instance (evaluated)
+    '_SELF_HOSTED', '_PREFIX_GROUPS', '_HOSTNAME_GROUPS',  # Used for URL matching of self-hosted services
+    '_IMPOSSIBLE_HOSTNAMES', '_INSTANCE_LIST',
 ]
 CLASS_METHODS = [
     'ie_key', 'suitable', '_match_valid_url',  # Used for URL matching
@@ -25,6 +27,7 @@
     'description',  # Used for --extractor-descriptions
     'is_suitable',  # Used for --age-limit
     'supports_login', 'is_single_video',  # Accessed in CLI only with instance
+    '_test_selfhosted_instance',  # Used for URL matching of self-hosted services
 ]
 IE_TEMPLATE = '''
 class {name}({bases}):
@@ -41,6 +44,7 @@ def main():
     _ALL_CLASSES = get_all_ies()  # Must be before import
 
     import yt_dlp.plugins
+    from yt_dlp.extractor._host_index import ExtractorHostIndex
     from yt_dlp.extractor.common import InfoExtractor, SearchInfoExtractor
 
     # Filter out plugins
@@ -53,6 +57,8 @@ def main():
         *extra_ie_code(DummyInfoExtractor),
         '\nclass LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n',
         *build_ies(_ALL_CLASSES, (InfoExtractor, SearchInfoExtractor), DummyInfoExtractor),
+        '\nfrom ._host_index import ExtractorHostIndex  # noqa: E402',
+        f'_HOST_INDEX = {ExtractorHostIndex.build(_ALL_CLASSES)!r}',
     ))
 
     write_file(lazy_extractors_filename, f'{module_src}\n')
@@ -74,14 +80,14 @@ def get_all_ies():
 
 def extra_ie_code(ie, base=None):
     for var in STATIC_CLASS_PROPERTIES:
-        val = getattr(ie, var)
-        if val != (getattr(base, var) if base else NO_ATTR):
+        val = getattr(ie, var, NO_ATTR)
+        if val is not NO_ATTR and val != (getattr(base, var, NO_ATTR) if base else NO_ATTR):
             yield f'    {var} = {val!r}'
     yield ''
 
     for name in CLASS_METHODS:
-        f = getattr(ie, name)
-        if not base or f.__func__ != getattr(base, name).__func__:
+        f = getattr(ie, name, None)
+        if f and (not base or f.__func__ != getattr(getattr(base, name, None), '__func__', None)):
             yield getsource(f)
 
 
@@ -44,18 +44,13 @@
 ie.to_screen(f'{script_id}: excluded temporary domain names, len(results)={len(results)}')
 
 lf = '\n'
-pycode = f'''# coding: utf-8
-# AUTOMATICALLY GENERATED FILE. DO NOT EDIT.
+pycode = f'''# AUTOMATICALLY GENERATED FILE. DO NOT EDIT.
 # Generated by ./devscripts/make_misskey_instance_list.py
-from __future__ import unicode_literals
-
-instances = {{
-    # list of instances here
-{lf.join(f'    "{r}",' for r in sorted(results))}
-}}
 
-__all__ = ['instances']
+# Sorted, one hostname per line; looked up by yt_dlp.extractor._instances.InstanceList
+instances = \'\'\'\\
+{lf.join(sorted(results))}\'\'\'
 '''
 
-with open('./yt_dlp/extractor/misskey/instances.py', 'w') as w:
+with open('./yt_dlp/extractor/_instances/misskey.py', 'w') as w:
     w.write(pycode)
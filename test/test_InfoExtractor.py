@@ -9,16 +9,23 @@
 
 
 import http.server
+import json
+import shutil
+import tempfile
 import threading
+import time
+from unittest import mock
 
 from test.helper import FakeYDL, expect_dict, expect_value, http_server_port
 from yt_dlp.compat import compat_etree_fromstring
-from yt_dlp.extractor import YoutubeIE, get_info_extractor
-from yt_dlp.extractor.common import InfoExtractor
+from yt_dlp.extractor import PeerTubeIE, YoutubeIE, get_info_extractor
+from yt_dlp.extractor.common import InfoExtractor, SelfHostedInfoExtractor
 from yt_dlp.utils import (
     ExtractorError,
+    PageIndex,
     RegexNotFoundError,
     encode_data_uri,
+    js_to_json,
     strip_jsonp,
 )
 
@@ -107,6 +114,42 @@ def test_html_search_meta(self):
         self.assertRaises(RegexNotFoundError, ie._html_search_meta, 'z', html, None, fatal=True)
         self.assertRaises(RegexNotFoundError, ie._html_search_meta, ('z', 'x'), html, None, fatal=True)
 
+    def test_search_meta_indexed(self):
+        ie = self.ie
+        html = '''
+            <meta name="og:title" content='Foo'/>
+            <meta content="Some video's description " name="og:description"/>
+            <p>content="bar" property="og:foobar"</p>
+            <meta property=og:test4 content=unquoted-value/>
+            <meta name="a" content="1" /><meta content="6" name="f">
+        '''
+        expected = (ie._og_search_title(html), ie._og_search_description(html), ie._og_search_property('test4', html),
+                    ie._html_search_meta(('z', 'f', 'a'), html), ie._html_search_meta('a', html))
+        PageIndex(html)
+        self.assertEqual(expected, ('Foo', 'Some video\'s description ', 'unquoted-value', '6', '1'))
+        self.assertEqual((ie._og_search_title(html), ie._og_search_description(html), ie._og_search_property('test4', html),
+                          ie._html_search_meta(('z', 'f', 'a'), html), ie._html_search_meta('a', html)), expected)
+        self.assertEqual(ie._og_search_property('foobar', html, default=None), None)
+        self.assertRaises(RegexNotFoundError, ie._html_search_meta, 'z', html, None, fatal=True)
+
+    def test_search_json(self):
+        ie = self.ie
+        html = '''<script>var a = {"b": [1, "};"], "c": {}};</script><script>var d = {e: 1}; var f = {"g": 2}</script>'''
+        self.assertEqual(ie._search_json(r'var a\s*=', html, 'a', None), {'b': [1, '};'], 'c': {}})
+        self.assertEqual(ie._search_json(r'var a\s*=', html, 'a', None, end_pattern=r';\s*</script>'), {'b': [1, '};'], 'c': {}})
+        self.assertEqual(ie._search_json(r'var d\s*=', html, 'd', None, transform_source=js_to_json), {'e': 1})
+        self.assertEqual(ie._search_json(r'var f\s*=', html, 'f', None), {'g': 2})
+        self.assertEqual(ie._search_json(r'var f\s*=', html, 'f', None, end_pattern='</script>'), {'g': 2})
+        self.assertEqual(ie._search_json(r'var d\s*=', html, 'd', None, default=None), None)
+        self.assertEqual(ie._search_json(r'var z\s*=', html, 'z', None, default='default'), 'default')
+        self.assertRaises(RegexNotFoundError, ie._search_json, r'var z\s*=', html, 'z', None)
+        self.assertRaises(ExtractorError, ie._search_json, r'var a\s*=', html, 'a', None, end_pattern='"}')
+
+        # The objects are not shared between calls
+        obj = ie._search_json(r'var a\s*=', html, 'a', None)
+        obj['b'].pop()
+        self.assertEqual(ie._search_json(r'var a\s*=', html, 'a', None), {'b': [1, '};'], 'c': {}})
+
     def test_search_json_ld_realworld(self):
         _TESTS = [
             # https://github.com/ytdl-org/youtube-dl/issues/23306
@@ -1917,5 +1960,159 @@ def test_response_with_expected_status_returns_content(self):
         self.assertEqual(content, TEAPOT_RESPONSE_BODY)
 
 
+class TestSelfHostedNodeinfoCache(unittest.TestCase):
+    def setUp(self):
+        self.cachedir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cachedir)
+        self.requests = []
+
+    def fetch(self, hostname, params={}):
+        def download_webpage_handle(url, *args, **kwargs):
+            self.requests.append(url)
+            if hostname == 'nodeinfo.invalid':
+                content, status = json.dumps({'links': [{'href': f'https://{hostname}/nodeinfo/2.0'}]}), 200
+            elif hostname == 'no-nodeinfo.invalid':
+                content, status = '<html>Not Found</html>', 404
+            else:
+                return False
+            return content, mock.Mock(getcode=lambda: status)
+
+        def download_json(url, *args, **kwargs):
+            self.requests.append(url)
+            return {'software': {'name': 'peertube'}}
+
+        # Every call is like a new process, with only the cache on disk
+        SelfHostedInfoExtractor._NODEINFO_CACHE.clear()
+        ie = PeerTubeIE(FakeYDL({'cachedir': self.cachedir, **params}))
+        with mock.patch.object(ie, '_download_webpage_handle', download_webpage_handle), \
+                mock.patch.object(ie, '_download_json', download_json):
+            return ie._fetch_nodeinfo_software(ie, hostname)
+
+    def test_cache(self):
+        self.assertEqual(self.fetch('nodeinfo.invalid'), 'peertube')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.fetch('nodeinfo.invalid'), 'peertube')
+        self.assertEqual(len(self.requests), 2)
+        # Negative results are cached too
+        self.assertIsNone(self.fetch('no-nodeinfo.invalid'))
+        self.assertIsNone(self.fetch('no-nodeinfo.invalid'))
+        self.assertEqual(len(self.requests), 3)
+        # but not failed requests
+        self.assertIsNone(self.fetch('down.invalid'))
+        self.assertIsNone(self.fetch('down.invalid'))
+        self.assertEqual(len(self.requests), 5)
+
+    def test_ttl(self):
+        self.fetch('nodeinfo.invalid')
+        self.assertEqual(self.fetch('nodeinfo.invalid', {'extractor_args': {'selfhosted': {'nodeinfo_cache_ttl': ['0']}}}),
+                         'peertube')
+        self.assertEqual(len(self.requests), 4)
+        with mock.patch('time.time', return_value=time.time() + SelfHostedInfoExtractor._NODEINFO_CACHE_TTL + 1):
+            self.fetch('nodeinfo.invalid')
+        self.assertEqual(len(self.requests), 6)
+
+    def test_no_cachedir(self):
+        self.fetch('nodeinfo.invalid', {'cachedir': False})
+        self.fetch('nodeinfo.invalid', {'cachedir': False})
+        self.assertEqual(len(self.requests), 4)
+        self.assertFalse(os.listdir(self.cachedir))
+
+
+class HTTPCacheTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+        path = self.path.partition('?')[0]
+        body = f'{self.path} {self.server.version}'.encode()
+        etag = f'"{self.server.version}"'
+        if path != '/no-etag' and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if path != '/no-etag':
+            self.send_header('ETag', etag)
+        if path in ('/fresh', '/set-cookie'):
+            self.send_header('Cache-Control', 'max-age=3600')
+        elif path == '/private':
+            self.send_header('Cache-Control', 'private, max-age=3600')
+        elif path == '/no-store':
+            self.send_header('Cache-Control', 'no-store')
+        if path == '/set-cookie':
+            self.send_header('Set-Cookie', f'version={self.server.version}; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self.cachedir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cachedir)
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), HTTPCacheTestRequestHandler)
+        self.httpd.requests, self.httpd.version = [], 1
+        self.port = http_server_port(self.httpd)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.addCleanup(self.httpd.server_close)
+        self.addCleanup(self.httpd.shutdown)
+
+    def download(self, path, params={}, cookies={}):
+        ie = DummyIE(FakeYDL({'cachedir': self.cachedir, 'http_cache_size': 1024 * 1024, **params}))
+        for name, value in cookies.items():
+            ie._set_cookie('127.0.0.1', name, value)
+        return ie._download_webpage(f'http://127.0.0.1:{self.port}{path}', None)
+
+    def test_revalidation(self):
+        self.assertEqual(self.download('/etag'), '/etag 1')
+        self.assertEqual(self.download('/etag'), '/etag 1')
+        self.assertEqual(self.httpd.requests, [('/etag', None), ('/etag', '"1"')])
+        self.httpd.version = 2
+        self.assertEqual(self.download('/etag'), '/etag 2')
+        self.assertEqual(self.download('/etag'), '/etag 2')
+        self.assertEqual(self.httpd.requests[2:], [('/etag', '"1"'), ('/etag', '"2"')])
+
+    def test_fresh(self):
+        self.assertEqual(self.download('/fresh'), '/fresh 1')
+        self.httpd.version = 2
+        self.assertEqual(self.download('/fresh'), '/fresh 1')
+        self.assertEqual(len(self.httpd.requests), 1)
+
+    def test_not_cached(self):
+        for path in ('/no-etag', '/no-store', '/private', '/set-cookie'):
+            self.assertEqual(self.download(path), f'{path} {self.httpd.version}')
+            self.httpd.version += 1
+            self.assertEqual(self.download(path), f'{path} {self.httpd.version}')
+            self.assertEqual(self.httpd.requests[-2:], [(path, None), (path, None)])
+
+    def test_cookies(self):
+        self.assertEqual(self.download('/fresh', cookies={'session': 'a'}), '/fresh 1')
+        self.httpd.version = 2
+        # The response may depend on the cookies that are sent
+        self.assertEqual(self.download('/fresh', cookies={'session': 'b'}), '/fresh 2')
+        self.assertEqual(self.download('/fresh', cookies={'session': 'a'}), '/fresh 1')
+        self.assertEqual(len(self.httpd.requests), 2)
+
+    def test_disabled(self):
+        for params in ({'http_cache_size': None}, {'cachedir': False}):
+            self.download('/fresh', params)
+        self.assertEqual(len(self.httpd.requests), 2)
+        self.assertFalse(os.listdir(self.cachedir))
+
+    def test_eviction(self):
+        for i in range(10):
+            self.download(f'/fresh?{i}', {'http_cache_size': 1000})
+            time.sleep(0.01)
+        self.httpd.requests.clear()
+        # The least recently used responses were evicted
+        self.download('/fresh?9', {'http_cache_size': 1000})
+        self.download('/fresh?0', {'http_cache_size': 1000})
+        self.assertEqual(self.httpd.requests, [('/fresh?0', None)])
+        cache_size = sum(f.stat().st_size for f in os.scandir(os.path.join(self.cachedir, 'http')))
+        self.assertLessEqual(cache_size, 1000)
+
+
 if __name__ == '__main__':
     unittest.main()
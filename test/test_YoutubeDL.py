@@ -11,6 +11,10 @@
 
 import copy
 import json
+import tempfile
+import threading
+import time
+from unittest import mock
 
 from test.helper import FakeYDL, assertRegexpMatches
 from yt_dlp import YoutubeDL
@@ -19,8 +23,10 @@
 from yt_dlp.extractor.common import InfoExtractor
 from yt_dlp.postprocessor.common import PostProcessor
 from yt_dlp.utils import (
+    ExistingVideoReached,
     ExtractorError,
     LazyList,
+    MaxDownloadsReached,
     OnDemandPagedList,
     int_or_none,
     match_filter_func,
@@ -536,6 +542,37 @@ def test_default_format_spec(self):
         self.assertEqual(ydl._default_format_spec({}, download=False), 'bestvideo*+bestaudio/best')
         self.assertEqual(ydl._default_format_spec({'is_live': True}), 'best/bestvideo+bestaudio')
 
+    def test_format_selector_cache(self):
+        ydl = YDL()
+        format_selector = ydl.build_format_selector('bv*[height<=720]+ba/b')
+        self.assertIs(ydl.build_format_selector('bv*[height<=720]+ba/b'), format_selector)
+        ydl.params['allow_multiple_audio_streams'] = True
+        self.assertIsNot(ydl.build_format_selector('bv*[height<=720]+ba/b'), format_selector)
+
+        # The default format spec is compiled only once for all the videos
+        formats = [{'format_id': str(i), 'ext': 'mp4', 'height': 360 * i, 'url': TEST_URL} for i in (1, 2)]
+        ydl = YDL({'format': None, 'simulate': True})
+        with mock.patch.object(ydl, '_compile_format_selector', wraps=ydl._compile_format_selector) as compile_mock:
+            for i in range(3):
+                ydl.process_ie_result(_make_result(copy.deepcopy(formats), id=f'testid{i}'))
+        self.assertEqual(compile_mock.call_count, 1)
+        self.assertEqual([info['format_id'] for info in ydl.downloaded_info_dicts], ['2', '2', '2'])
+
+    def test_explain_format(self):
+        formats = [
+            {'format_id': 'video', 'ext': 'mp4', 'height': 720, 'vcodec': 'avc1', 'acodec': 'none', 'url': TEST_URL},
+            {'format_id': 'audio', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a', 'url': TEST_URL},
+        ]
+        ydl = YDL({'format': 'bv*[height<=?720]+ba/22/b', 'explain_format': True, 'simulate': None})
+        with mock.patch.object(ydl, 'to_stdout') as to_stdout:
+            ydl.process_ie_result(_make_result(formats))
+        self.assertEqual(ydl.downloaded_info_dicts, [])
+
+        lines = to_stdout.call_args[0][0].splitlines()
+        self.assertEqual(lines[:-1], ['/ first of', '  + merge of', "    bv* [height <=? 720]", '    ba', '  22', '  b'])
+        assertRegexpMatches(
+            self, lines[-1], r'^Compiled "bv\*\[height<=\?720\]\+ba/22/b" in [\d.]+ms; selected video\+audio in [\d.]+ms$')
+
 
 class TestYoutubeDL(unittest.TestCase):
     def test_subtitles(self):
@@ -1228,6 +1265,244 @@ def _real_extract(self, url):
         self.assertEqual(downloaded['extractor_key'], 'Video')
 
 
+class TestConcurrentPlaylist(unittest.TestCase):
+    ENTRY_COUNT = 8
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.archive = os.path.join(self.tmpdir.name, 'archive.txt')
+
+    def extract(self, params, archived=(), video_ids=None, download_time=0):
+        with open(self.archive, 'w') as f:
+            f.writelines(f'video {video_id}\n' for video_id in archived)
+
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        class VideoIE(InfoExtractor):
+            _VALID_URL = r'video:(?P<id>\d+)'
+
+            def _real_extract(self, url):
+                video_id = self._match_id(url)
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                # The first entries take the longest
+                time.sleep(0.01 * (10 - int(video_id)))
+                with lock:
+                    running[0] -= 1
+                return {'id': video_id, 'title': video_id, 'url': TEST_URL, 'ext': 'mp4'}
+
+        class _YDL(FakeYDL):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.downloaded_info_dicts = []
+
+            def process_info(self, info_dict):
+                self.downloaded_info_dicts.append(info_dict.copy())
+                super().process_info(info_dict)
+                time.sleep(download_time)
+
+            def to_screen(self, *args, **kwargs):
+                pass
+
+        ydl = _YDL({
+            'simulate': True,
+            'force_write_download_archive': True,
+            'download_archive': self.archive,
+            **params,
+        })
+        ydl.add_info_extractor(VideoIE(ydl))
+        try:
+            ydl.process_ie_result({
+                '_type': 'playlist',
+                'id': 'test',
+                'extractor': 'test:playlist',
+                'extractor_key': 'test:playlist',
+                'entries': [{
+                    '_type': 'url',
+                    'url': f'video:{i}',
+                    'ie_key': VideoIE.ie_key(),
+                } for i in video_ids or range(1, self.ENTRY_COUNT + 1)],
+            })
+        finally:
+            with open(self.archive) as f:
+                self.recorded = [line.split()[1] for line in f.read().splitlines()]
+            self.downloaded = sorted(
+                (int(info['id']), info['playlist_index'], info['playlist_autonumber'])
+                for info in ydl.downloaded_info_dicts)
+            self.peak = peak[0]
+
+    def test_concurrent(self):
+        self.extract({'concurrent_playlist_entries': 4})
+        self.assertEqual(self.peak, 4)
+        self.assertEqual(self.recorded, [str(i) for i in range(1, self.ENTRY_COUNT + 1)])
+        self.assertEqual(self.downloaded, [(i, i, i) for i in range(1, self.ENTRY_COUNT + 1)])
+
+    def test_sequential(self):
+        self.extract({})
+        self.assertEqual(self.peak, 1)
+        self.assertEqual(self.recorded, [str(i) for i in range(1, self.ENTRY_COUNT + 1)])
+
+    def test_max_downloads(self):
+        with self.assertRaises(MaxDownloadsReached):
+            self.extract({'concurrent_playlist_entries': 4, 'max_downloads': 3})
+        self.assertEqual(self.recorded, ['1', '2', '3'])
+        self.assertEqual([i for i, *_ in self.downloaded], [1, 2, 3])
+
+    def test_break_on_existing(self):
+        with self.assertRaises(ExistingVideoReached):
+            self.extract({'concurrent_playlist_entries': 4, 'break_on_existing': True}, archived=['4'])
+        self.assertEqual(self.recorded, ['4', '1', '2', '3'])
+        self.assertEqual([i for i, *_ in self.downloaded], [1, 2, 3])
+
+    def test_duplicate_entries(self):
+        # The second copy is checked against the archive while the first one is still downloaded
+        self.extract({'concurrent_playlist_entries': 4}, video_ids=[1, 1, 2], download_time=0.2)
+        self.assertEqual(self.recorded, ['1', '2'])
+        self.assertEqual([i for i, *_ in self.downloaded], [1, 2])
+
+    def test_nested_same_url(self):
+        class VideoIE(InfoExtractor):
+            _VALID_URL = r'video:(?P<id>\d+)'
+
+            def _real_extract(self, url):
+                video_id = self._match_id(url)
+                # The first nested playlist is still being processed when the second one is reached
+                time.sleep(0.5 if video_id == '1' else 0)
+                return {'id': video_id, 'title': video_id, 'url': TEST_URL, 'ext': 'mp4'}
+
+        class NestedIE(InfoExtractor):
+            _VALID_URL = r'nested:(?P<id>\d+)'
+
+            def _real_extract(self, url):
+                video_id = self._match_id(url)
+                time.sleep(0.1 if video_id == '2' else 0)
+                return self.playlist_result(
+                    [self.url_result(f'video:{video_id}', VideoIE)], 'nested', 'Nested',
+                    webpage_url='https://example.com/nested')
+
+        for params in ({}, {'concurrent_playlist_entries': 2}):
+            ydl = FakeYDL({'simulate': True, **params})
+            ydl.to_screen = lambda *_, **__: None
+            ydl.add_info_extractor(VideoIE(ydl))
+            ydl.add_info_extractor(NestedIE(ydl))
+            info = ydl.process_ie_result({
+                '_type': 'playlist',
+                'id': 'test',
+                'extractor': 'test:playlist',
+                'extractor_key': 'test:playlist',
+                'webpage_url': 'https://example.com/playlist',
+                'entries': [{'_type': 'url', 'url': f'nested:{i}', 'ie_key': NestedIE.ie_key()} for i in (1, 2)],
+            })
+            # The playlist with the same URL is skipped like a recursive one
+            self.assertEqual(
+                [e and [entry['id'] for entry in e['entries']] for e in info['entries']], [['1'], None], params)
+            self.assertEqual(ydl._playlist_urls, set())
+
+
+class TestExtractionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.extracted = []
+
+    def extract(self, url, params={}, info={}):
+        extracted = self.extracted
+
+        class VideoIE(InfoExtractor):
+            _VALID_URL = r'video:(?P<id>\d+)'
+
+            def _real_extract(self, url):
+                video_id = self._match_id(url)
+                extracted.append(video_id)
+                return {'id': video_id, 'title': video_id, 'url': TEST_URL, 'ext': 'mp4', **info}
+
+        class PlaylistIE(InfoExtractor):
+            _VALID_URL = r'playlist:(?P<id>\d+)'
+
+            def _real_extract(self, url):
+                playlist_id = self._match_id(url)
+                extracted.append(playlist_id)
+                return self.playlist_result(
+                    (self.url_result(f'video:{i}', VideoIE) for i in range(int(playlist_id))), playlist_id)
+
+        ydl = FakeYDL({
+            'cachedir': self.tmpdir.name,
+            'extraction_cache_ttl': 3600,
+            'simulate': True,
+            **params,
+        })
+        ydl.to_screen = lambda *_, **__: None
+        ydl.add_info_extractor(VideoIE(ydl))
+        ydl.add_info_extractor(PlaylistIE(ydl))
+        return ydl.extract_info(url)
+
+    def test_reuse(self):
+        first = self.extract('video:1')
+        second = self.extract('video:1')
+        self.assertEqual(self.extracted, ['1'])
+        self.assertEqual(second['title'], first['title'])
+        self.assertEqual(second['webpage_url'], 'video:1')
+        self.extract('video:2')
+        self.assertEqual(self.extracted, ['1', '2'])
+
+    def test_auth(self):
+        cookiefile = os.path.join(self.tmpdir.name, 'cookies.txt')
+        with open(cookiefile, 'w') as f:
+            f.write('# Netscape HTTP Cookie File\n')
+        # Another account or country may get another result
+        for params in ({}, {'cookiefile': cookiefile}, {'username': 'user'}, {'geo_bypass_country': 'US'}):
+            self.extract('video:1', params)
+            self.extract('video:1', params)
+        self.assertEqual(self.extracted, ['1'] * 4)
+
+    def test_disabled(self):
+        for params in ({'extraction_cache_ttl': None}, {'extraction_cache_ttl': {'default': 3600, 'video': 0}},
+                       {'cachedir': False}):
+            self.extracted.clear()
+            self.extract('video:1', params)
+            self.extract('video:1', params)
+            self.assertEqual(self.extracted, ['1', '1'], params)
+
+    def test_ttl(self):
+        self.extract('video:1', {'extraction_cache_ttl': {'video': 60}})
+        now = time.time()
+        with mock.patch('time.time', lambda: now + 120):
+            self.extract('video:1', {'extraction_cache_ttl': {'video': 60}})
+        self.assertEqual(self.extracted, ['1', '1'])
+
+    def test_expiring_urls(self):
+        url = f'{TEST_URL}?expire={int(time.time()) + 60}&sig=abc'
+        self.extract('video:1', info={'url': url})
+        self.extract('video:1', info={'url': url})
+        self.assertEqual(self.extracted, ['1', '1'])
+
+        url = f'{TEST_URL}?expire={int(time.time()) + 86400}&sig=abc'
+        self.extract('video:2', info={'formats': [{'url': url, 'ext': 'mp4'}]})
+        self.extract('video:2', info={'formats': [{'url': url, 'ext': 'mp4'}]})
+        self.assertEqual(self.extracted, ['1', '1', '2'])
+
+    def test_live(self):
+        self.extract('video:1', info={'live_status': 'is_live'})
+        self.extract('video:1', info={'live_status': 'is_live'})
+        self.assertEqual(self.extracted, ['1', '1'])
+
+    def test_flat_playlist(self):
+        first = self.extract('playlist:3', {'extract_flat': True})
+        second = self.extract('playlist:3', {'extract_flat': True})
+        self.assertEqual(self.extracted, ['3'])
+        self.assertEqual([entry['url'] for entry in second['entries']], ['video:0', 'video:1', 'video:2'])
+        self.assertEqual(len(first['entries']), 3)
+
+    def test_partial_playlist(self):
+        # The playlist is only cached if all of its entries were extracted
+        self.extract('playlist:3', {'extract_flat': True, 'playlistend': 1})
+        self.extract('playlist:3', {'extract_flat': True})
+        self.assertEqual(self.extracted, ['3', '3'])
+
+
 class TestFilenameTest(unittest.TestCase):
     def test_filenames(self):
         class _YDL(YDL):
@@ -83,6 +83,39 @@ def test_gcm_decrypt(self):
                 data, intlist_to_bytes(self.key), authentication_tag, intlist_to_bytes(self.iv[:12]))
             self.assertEqual(decrypted.rstrip(b'\x08'), self.secret_msg)
 
+    def test_gcm_decrypt_block_aligned(self):
+        # NIST GCM test case 3
+        key = bytes.fromhex('feffe9928665731c6d6a8f9467308308')
+        nonce = bytes.fromhex('cafebabefacedbaddecaf888')
+        data = bytes.fromhex(
+            '42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e'
+            '21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091473f5985')
+        authentication_tag = bytes.fromhex('4d5c2af327cd64a62cf35abd2ba6fab4')
+        expected = bytes.fromhex(
+            'd9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a72'
+            '1c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b391aafd255')
+
+        self.assertEqual(intlist_to_bytes(aes_gcm_decrypt_and_verify(
+            *map(bytes_to_intlist, (data, key, authentication_tag, nonce)))), expected)
+        self.assertEqual(aes_gcm_decrypt_and_verify_bytes(data, key, authentication_tag, nonce), expected)
+        with self.assertRaises(ValueError):
+            aes_gcm_decrypt_and_verify_bytes(data, key, authentication_tag[::-1], nonce)
+
+    def test_key_sizes(self):
+        # FIPS-197 Appendix C
+        data = bytes.fromhex('00112233445566778899aabbccddeeff')
+        for key_size, expected in (
+                (16, '69c4e0d86a7b0430d8cdb78070b4c55a'),
+                (24, 'dda97ca4864cdfe06eaf70a0ec0d7191'),
+                (32, '8ea2b7ca516745bfeafc49904b496089')):
+            key, iv = list(range(key_size)), [0] * 16
+            encrypted = aes_cbc_encrypt(bytes_to_intlist(data), key, iv)
+            self.assertEqual(intlist_to_bytes(encrypted), bytes.fromhex(expected))
+            self.assertEqual(intlist_to_bytes(aes_cbc_decrypt(encrypted, key, iv)), data)
+            self.assertEqual(aes_cbc_decrypt_bytes(bytes.fromhex(expected), bytes(key), bytes(iv)), data)
+            self.assertEqual(intlist_to_bytes(aes_encrypt(bytes_to_intlist(data), key_expansion(key))),
+                             bytes.fromhex(expected))
+
     def test_decrypt_text(self):
         password = intlist_to_bytes(self.key).decode()
         encrypted = base64.b64encode(
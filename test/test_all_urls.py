@@ -9,9 +9,21 @@
 
 
 import collections
+from unittest import mock
 
 from test.helper import gettestcases
-from yt_dlp.extractor import FacebookIE, YoutubeIE, gen_extractors
+from yt_dlp import YoutubeDL
+from yt_dlp.extractor import (
+    FacebookIE,
+    MastodonIE,
+    PeerTubeIE,
+    YoutubeIE,
+    gen_extractor_classes,
+    gen_extractors,
+    get_extractor_host_index,
+)
+from yt_dlp.extractor._host_index import ExtractorHostIndex
+from yt_dlp.extractor._instances import InstanceList, _table_contains
 
 
 class TestAllURLsMatching(unittest.TestCase):
@@ -118,5 +130,75 @@ def test_no_duplicated_ie_names(self):
                 f'Multiple extractors with the same IE_NAME "{ie_name}" ({", ".join(ie_list)})')
 
 
+class TestExtractorHostIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The generated index is tested if the lazy extractors are in use
+        cls.host_index = get_extractor_host_index() or ExtractorHostIndex.build(gen_extractor_classes())
+
+    def test_testcases(self):
+        for ie in gen_extractor_classes():
+            if ie.ie_key() not in self.host_index.indexed:
+                continue
+            for tc in ie.get_testcases(include_onlymatching=True):
+                url = tc.get('url')
+                if not isinstance(url, str) or not ie.suitable(url):
+                    continue
+                candidates = self.host_index.candidates(url)
+                self.assertTrue(candidates is None or ie.ie_key() in candidates,
+                                f'{ie.ie_key()} is not a candidate for {url}')
+
+    def test_candidates(self):
+        candidates = self.host_index.candidates
+        self.assertIn('YoutubeTab', candidates('https://www.youtube.com/channel/HCtnHdj3df7iM'))
+        self.assertIn('YoutubeTab', candidates('HTTPS://M.YouTube.com:443/channel/HCtnHdj3df7iM'))
+        self.assertNotIn('Vimeo', candidates('https://www.youtube.com/channel/HCtnHdj3df7iM'))
+        self.assertIn('Vimeo', candidates('https://vimeo.com/56015672'))
+        self.assertIn('Vimeo', candidates('//player.vimeo.com/video/56015672'))
+        self.assertEqual(candidates('https://unknown.invalid/video'), set())
+        # URLs without a hostname can only be matched by trying every extractor
+        self.assertIsNone(candidates('ytsearch5:youtube-dl test video'))
+        self.assertIsNone(candidates('BaW_jenozKc'))
+
+    def test_unindexed(self):
+        for ie_key in ('Generic', 'UnsupportedURL'):
+            self.assertNotIn(ie_key, self.host_index.indexed)
+
+    def test_youtubedl(self):
+        with mock.patch('yt_dlp.YoutubeDL.get_extractor_host_index', lambda: self.host_index):
+            ydl = YoutubeDL({'quiet': True})
+            url = 'https://vimeo.com/56015672'
+            candidates = [ie_key for ie_key, _ in ydl._candidate_ies(url)]
+            self.assertIn('Vimeo', candidates)
+            self.assertEqual(candidates[-1], 'Generic')
+            self.assertEqual(candidates, [ie_key for ie_key in ydl._ies if ie_key in candidates])
+            self.assertLess(len(candidates), len(ydl._ies) / 4)
+            self.assertEqual(ydl._make_archive_id({'id': '56015672', 'url': url}), 'vimeo 56015672')
+
+
+class TestInstanceList(unittest.TestCase):
+    def test_table_contains(self):
+        hostnames = sorted(['a.example', 'b.example', 'bb.example', 'c.example', 'example.com', 'z.z'])
+        table = '\n'.join(hostnames)
+        for hostname in hostnames:
+            self.assertTrue(_table_contains(table, hostname), hostname)
+        for hostname in ('', 'a', 'b.exampl', 'b.example.', 'ba.example', 'd.example', 'zz'):
+            self.assertFalse(_table_contains(table, hostname), hostname)
+        self.assertFalse(_table_contains('', 'a.example'))
+
+    def test_instances(self):
+        self.assertIn('framatube.org', PeerTubeIE._INSTANCE_LIST)
+        self.assertIs(InstanceList('peertube'), PeerTubeIE._INSTANCE_LIST)
+        self.assertTrue(PeerTubeIE.suitable('https://framatube.org/w/9c9de5e8-0a1e-484a-b099-e80766180a6d'))
+        self.assertTrue(MastodonIE.suitable('https://mastodon.social/@Ed/103447926925290052'))
+
+    def test_found_instances(self):
+        url = 'https://peertube.invalid/w/9c9de5e8-0a1e-484a-b099-e80766180a6d'
+        self.assertFalse(PeerTubeIE.suitable(url))
+        self.assertTrue(PeerTubeIE.suitable(f'peertube:{url}'))
+        InstanceList('peertube').add('peertube.invalid')
+        self.assertTrue(PeerTubeIE.suitable(url))
+
+
 if __name__ == '__main__':
     unittest.main()
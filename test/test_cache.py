@@ -9,6 +9,7 @@
 
 
 import shutil
+import time
 
 from test.helper import FakeYDL
 from yt_dlp.cache import Cache
@@ -52,6 +53,15 @@ def test_cache(self):
         self.assertFalse(os.path.exists(self.test_dir))
         self.assertEqual(c.load('test_cache', 'k.'), None)
 
+    def test_prune(self):
+        c = Cache(FakeYDL({'cachedir': self.test_dir}))
+        for key in ('a', 'b', 'c'):
+            c.store('test_cache', key, key)
+            time.sleep(0.01)
+        c.prune('test_cache', 2)
+        self.assertEqual([c.load('test_cache', key) for key in ('a', 'b', 'c')], [None, 'b', 'c'])
+        c.prune('test_cache2', 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import http.server
+import json
+import re
+import threading
+import time
+import urllib.error
+from unittest import mock
+
+from test.helper import http_server_port, try_rm
+from yt_dlp import YoutubeDL
+from yt_dlp.downloader import get_suitable_downloader
+from yt_dlp.downloader.dash import DashSegmentsFD
+from yt_dlp.downloader.fragment import AdaptiveConcurrency, FragmentScheduler
+from yt_dlp.utils import encodeFilename
+
+FRAGMENT_COUNT = 20
+
+
+def fragment_content(track, index):
+    return (b'%s-%03d;' % (track.encode(), index)) * 64
+
+
+class HTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requested_paths.append(self.path)
+        mobj = re.fullmatch(r'/(?P<track>\w+)/(?P<index>\d+)', self.path)
+        assert mobj
+        content = fragment_content(mobj.group('track'), int(mobj.group('index')))
+        self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class FakeLogger:
+    def debug(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+
+class TestFragmentScheduler(unittest.TestCase):
+    def test_map_order(self):
+        job = FragmentScheduler(4).open_job()
+        self.assertEqual(list(job.map(lambda x: time.sleep(0.01 * (x % 3)) or x * 2, range(20))),
+                         [x * 2 for x in range(20)])
+
+    def test_map_live(self):
+        reloaded = threading.Event()
+
+        def fragments():
+            yield from (1, 2)
+            self.assertTrue(reloaded.wait(5))
+            yield 3
+
+        # The results of the first items come before the iterable gives the next one
+        results = FragmentScheduler(4).open_job().map_live(lambda x: x * 2, fragments())
+        self.assertEqual([next(results), next(results)], [2, 4])
+        reloaded.set()
+        self.assertEqual(list(results), [6])
+
+    def test_job_limit(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def func(x):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return x
+
+        job = FragmentScheduler(8).open_job(3)
+        self.assertEqual(list(job.map(func, range(30))), list(range(30)))
+        self.assertLessEqual(peak[0], 3)
+
+    def test_shared_workers(self):
+        scheduler = FragmentScheduler(4)
+        threads = {}
+
+        def func(track, x):
+            threads.setdefault(track, set()).add(threading.current_thread().name)
+            time.sleep(0.01)
+            return x
+
+        short_job, long_job = scheduler.open_job(), scheduler.open_job()
+        short_result = short_job.map(lambda x: func('short', x), range(2))
+        self.assertEqual(list(short_result), [0, 1])
+        self.assertEqual(list(long_job.map(lambda x: func('long', x), range(40))), list(range(40)))
+        # The workers of the finished job are reused by the remaining one
+        self.assertLessEqual(len(threads['short'] | threads['long']), 4)
+        self.assertEqual(len(threads['long']), 4)
+
+    def test_exception(self):
+        def func(x):
+            if x == 5:
+                raise ValueError(x)
+            return x
+
+        job = FragmentScheduler(2).open_job()
+        with self.assertRaises(ValueError):
+            list(job.map(func, range(10)))
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.clock = 0
+        patcher = mock.patch('time.monotonic', lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.job = FragmentScheduler(16).open_job(16)
+        self.concurrency = AdaptiveConcurrency(self.job)
+
+    def run_round(self, duration, latency):
+        self.clock += duration
+        for _ in range(self.job.limit):
+            self.concurrency.report_success(1000, latency)
+        return self.job.limit
+
+    def http_error(self, code):
+        return urllib.error.HTTPError('http://127.0.0.1/', code, 'error', {}, None)
+
+    def test_aimd(self):
+        self.assertEqual(self.job.limit, 2)
+        # Slow start, up to the maximum
+        self.assertEqual(self.run_round(1, 1), 4)
+        self.assertEqual(self.run_round(1, 1), 8)
+        self.assertEqual(self.run_round(1, 1), 16)
+        self.assertEqual(self.run_round(1, 1), 16)
+
+        self.concurrency.report_error(self.http_error(404))
+        self.assertEqual(self.job.limit, 16)
+        self.concurrency.report_error(self.http_error(429))
+        self.assertEqual(self.job.limit, 8)
+        # The fragments that were running at the time fail too
+        self.concurrency.report_error(self.http_error(503))
+        self.assertEqual(self.job.limit, 8)
+
+        # Additive increase after congestion
+        self.assertEqual(self.run_round(1, 1), 9)
+        # Throughput dropped after the increase
+        self.assertEqual(self.run_round(2, 2), 8)
+        self.assertEqual(self.run_round(1, 1), 9)
+        # Fragments got much slower
+        self.assertEqual(self.run_round(1, 10), 4)
+
+
+class TestDashSegmentsFD(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), HTTPTestRequestHandler)
+        self.httpd.requested_paths = []
+        self.port = http_server_port(self.httpd)
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _fragments(self, track):
+        return [{'url': f'http://127.0.0.1:{self.port}/{track}/{i}'} for i in range(FRAGMENT_COUNT)]
+
+    def _expected(self, track):
+        return b''.join(fragment_content(track, i) for i in range(FRAGMENT_COUNT))
+
+    def download(self, params, info_dict):
+        params = {'logger': FakeLogger(), 'noprogress': True, **params}
+        ydl = YoutubeDL(params)
+        downloader = DashSegmentsFD(ydl, params)
+        progress = []
+        downloader.add_progress_hook(lambda s: progress.append(s.copy()))
+        return downloader.real_download(info_dict['filepath'], info_dict), progress
+
+    def _test_download(self, params):
+        filename = 'testfile.mp4'
+        try_rm(encodeFilename(filename))
+        try:
+            success, progress = self.download(params, {
+                'filepath': filename,
+                'protocol': 'http_dash_segments',
+                'ext': 'mp4',
+                'url': f'http://127.0.0.1:{self.port}/',
+                'fragments': self._fragments('video'),
+            })
+            self.assertTrue(success)
+            with open(filename, 'rb') as f:
+                self.assertEqual(f.read(), self._expected('video'))
+            self.assertEqual(progress[-1]['status'], 'finished')
+            downloading = [p for p in progress if p['status'] == 'downloading']
+            self.assertEqual(downloading[-1]['fragment_index'], FRAGMENT_COUNT)
+            self.assertEqual(downloading[-1]['downloaded_bytes'], len(self._expected('video')))
+        finally:
+            try_rm(encodeFilename(filename))
+
+    def test_sequential(self):
+        self._test_download({})
+
+    def test_concurrent(self):
+        self._test_download({'concurrent_fragment_downloads': 4})
+
+    def test_http_connections(self):
+        # The fragments are not split into ranges
+        self._test_download({'concurrent_fragment_downloads': 4, 'http_connections': 4})
+        self.assertEqual(len(self.httpd.requested_paths), FRAGMENT_COUNT)
+
+    def test_adaptive_concurrency(self):
+        self._test_download({'concurrent_fragment_downloads': 4, 'adaptive_fragment_concurrency': True})
+
+    def test_in_memory(self):
+        self._test_download({'fragment_memory_budget': 1024 * 1024})
+
+    def test_in_memory_concurrent(self):
+        self._test_download({'concurrent_fragment_downloads': 4, 'fragment_memory_budget': 1024 * 1024})
+
+    def test_in_memory_no_overwrites(self):
+        for params in ({}, {'concurrent_fragment_downloads': 4}):
+            self._test_download({'fragment_memory_budget': 1024 * 1024, 'overwrites': False, **params})
+
+    def test_in_memory_spill(self):
+        # Budget for a single fragment; the others have to be spilled to disk
+        self._test_download({'concurrent_fragment_downloads': 4, 'fragment_memory_budget': 1000})
+        self.assertFalse([f for f in os.listdir('.') if f.startswith('testfile.mp4')])
+
+    def _test_resume(self, params):
+        filename = 'testfile.mp4'
+        fragments = [fragment_content('video', i) for i in range(FRAGMENT_COUNT)]
+        appended = b''.join(fragments[:3])
+        with open(filename + '.part', 'wb') as f:
+            # Interrupted while appending the 4th fragment
+            f.write(appended + fragments[3][:100])
+        with open(filename + '.part-Frag6', 'wb') as f:
+            f.write(fragments[5])
+        with open(filename + '.part-Frag9', 'wb') as f:
+            # Incomplete; has to be downloaded again
+            f.write(fragments[8][:100])
+        with open(filename + '.ytdl', 'w') as f:
+            f.write(json.dumps({'downloader': {
+                'current_fragment': {'index': 2, 'offset': len(b''.join(fragments[:2]))},
+                'completed_fragments': {'bitmap': 'QA==', 'sizes': [len(fragments[5])]},  # fragment 6
+                'fragment_count': FRAGMENT_COUNT,
+            }}) + '\n')
+            f.write(json.dumps({'appended': 3, 'offset': len(appended)}) + '\n')
+            f.write(json.dumps({'completed': 9, 'size': len(fragments[8])}) + '\n')
+            f.write('{"completed": 12, "si')
+        try:
+            self._test_download(params)
+            self.assertEqual(
+                sorted(int(path.split('/')[-1]) + 1 for path in self.httpd.requested_paths),
+                [i for i in range(4, FRAGMENT_COUNT + 1) if i != 6])
+            self.assertFalse(os.path.exists(filename + '.ytdl'))
+            self.assertFalse(os.path.exists(filename + '.part-Frag6'))
+        finally:
+            for suffix in ('.part', '.ytdl', '.part-Frag6', '.part-Frag9'):
+                try_rm(encodeFilename(filename + suffix))
+
+    def test_resume(self):
+        self._test_resume({})
+
+    def test_resume_concurrent(self):
+        self._test_resume({'concurrent_fragment_downloads': 4})
+
+    def test_completed_fragments_bitmap(self):
+        completed = {3: 10, 4: 20, 17: 5}
+        encoded = DashSegmentsFD._encode_completed_fragments(completed)
+        self.assertEqual(DashSegmentsFD._decode_completed_fragments(encoded), completed)
+        self.assertEqual(DashSegmentsFD._decode_completed_fragments(None), {})
+
+    def test_multiple_tracks(self):
+        filenames = {track: f'testfile.f{track}.mp4' for track in ('video', 'audio')}
+        for filename in filenames.values():
+            try_rm(encodeFilename(filename))
+        try:
+            success, _ = self.download({'concurrent_fragment_downloads': 4}, {
+                'filepath': 'testfile.mp4',
+                'protocol': 'http_dash_segments+http_dash_segments',
+                'ext': 'mp4',
+                'url': f'http://127.0.0.1:{self.port}/',
+                'requested_formats': [{
+                    'filepath': filename,
+                    'fragments': self._fragments(track),
+                } for track, filename in filenames.items()],
+            })
+            self.assertTrue(success)
+            for track, filename in filenames.items():
+                with open(filename, 'rb') as f:
+                    self.assertEqual(f.read(), self._expected(track))
+        finally:
+            for filename in filenames.values():
+                try_rm(encodeFilename(filename))
+
+    def test_suitable_downloader_for_merged_formats(self):
+        info_dict = {
+            'protocol': 'http_dash_segments+http_dash_segments',
+            'url': f'http://127.0.0.1:{self.port}/',
+        }
+        self.assertIsNone(get_suitable_downloader(dict(info_dict), {}))
+        params = {'concurrent_format_downloads': True}
+        self.assertIs(get_suitable_downloader(dict(info_dict), params), DashSegmentsFD)
+        self.assertIsNone(get_suitable_downloader(dict(info_dict), params, to_stdout=True))
+        self.assertIsNone(get_suitable_downloader({**info_dict, 'protocol': 'http_dash_segments+https'}, params))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import http.server
+import re
+import struct
+import threading
+
+from test.helper import http_server_port, try_rm
+from yt_dlp import YoutubeDL
+from yt_dlp.aes import aes_cbc_encrypt_bytes
+from yt_dlp.downloader import get_suitable_downloader
+from yt_dlp.downloader.external import FFmpegFD
+from yt_dlp.downloader.hls import HlsFD
+from yt_dlp.utils import encodeFilename
+
+KEY = b'0123456789abcdef'
+
+# Media sequence numbers in the playlist at each reload; None ends the playlist
+LIVE_WINDOWS = [(0, 1, 2), (1, 2, 3), (5, 6), (5, 6, 7, None)]
+
+
+def segment_content(sequence):
+    return (b'segment-%03d;' % sequence) * 101
+
+
+class HTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_content(self, content, content_type='video/mp2t'):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        if self.path == '/key':
+            return self.send_content(KEY, 'application/octet-stream')
+        mobj = re.fullmatch(r'/(?P<kind>live|encrypted)/(?:(?P<seq>\d+)\.ts|index\.m3u8)', self.path)
+        assert mobj
+        if mobj.group('seq'):
+            sequence = int(mobj.group('seq'))
+            content = segment_content(sequence)
+            if mobj.group('kind') == 'encrypted':
+                content = aes_cbc_encrypt_bytes(content, KEY, struct.pack('>8xq', sequence))
+            return self.send_content(content)
+
+        reloads = self.server.playlist_requests
+        self.server.playlist_requests += 1
+        window = LIVE_WINDOWS[min(reloads, len(LIVE_WINDOWS) - 1)]
+        lines = ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-TARGETDURATION:1', f'#EXT-X-MEDIA-SEQUENCE:{window[0]}']
+        if mobj.group('kind') == 'encrypted':
+            lines.append('#EXT-X-KEY:METHOD=AES-128,URI="/key"')
+        for sequence in window:
+            lines.extend(['#EXT-X-ENDLIST'] if sequence is None else ['#EXTINF:1.0,', f'{sequence}.ts'])
+        self.send_content('\n'.join(lines).encode(), 'application/vnd.apple.mpegurl')
+
+
+class WarningLogger:
+    def __init__(self):
+        self.warnings = []
+
+    def debug(self, msg):
+        pass
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+    def error(self, msg):
+        pass
+
+
+class TestHlsFDLive(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), HTTPTestRequestHandler)
+        self.httpd.playlist_requests = 0
+        self.port = http_server_port(self.httpd)
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+        self.filename = 'testfile.ts'
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        for suffix in ('', '.part', '.ytdl'):
+            try_rm(encodeFilename(self.filename + suffix))
+
+    def download(self, kind, params=None):
+        logger = WarningLogger()
+        params = {'logger': logger, 'noprogress': True, **(params or {})}
+        downloader = HlsFD(YoutubeDL(params), params)
+        self.assertTrue(downloader.real_download(self.filename, {
+            'url': f'http://127.0.0.1:{self.port}/{kind}/index.m3u8',
+            'ext': 'ts',
+            'protocol': 'm3u8_native',
+            'is_live': True,
+        }))
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), b''.join(segment_content(i) for i in (0, 1, 2, 3, 5, 6, 7)))
+        self.assertEqual(self.httpd.playlist_requests, 4)
+        self.assertTrue([w for w in logger.warnings if '1 fragments were removed' in w])
+
+    def test_live(self):
+        self.download('live')
+
+    def test_live_concurrent(self):
+        self.download('live', {'concurrent_fragment_downloads': 3})
+
+    def test_live_encrypted(self):
+        self.download('encrypted')
+
+    def test_suitable_downloader(self):
+        info_dict = {'url': 'http://127.0.0.1/index.m3u8', 'protocol': 'm3u8_native', 'is_live': True}
+        self.assertEqual(get_suitable_downloader(info_dict, {}), FFmpegFD)
+        self.assertEqual(get_suitable_downloader(info_dict, {'external_downloader': {'m3u8': 'native'}}), HlsFD)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,16 @@
 
 
 import http.server
+import json
 import re
+import tempfile
 import threading
+import time
+from unittest import mock
 
 from test.helper import http_server_port, try_rm
 from yt_dlp import YoutubeDL
+from yt_dlp.downloader.common import RateLimiter
 from yt_dlp.downloader.http import HttpFD
 from yt_dlp.utils import encodeFilename
 
@@ -21,6 +26,7 @@
 
 
 TEST_SIZE = 10 * 1024
+LARGE_TEST_DATA = bytes(range(256)) * 1024
 
 
 class HTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
@@ -67,6 +73,61 @@ def do_GET(self):
             assert False
 
 
+class RangeHTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requested_ranges.append(self.headers.get('Range'))
+        mobj = re.fullmatch(r'bytes=(\d+)-(\d+)', self.headers.get('Range') or '')
+        if not mobj or self.path == '/no-range':
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(LARGE_TEST_DATA)))
+            self.end_headers()
+            self.wfile.write(LARGE_TEST_DATA)
+            return
+        start, end = int(mobj.group(1)), int(mobj.group(2))
+        if self.path == '/fail-rest' and start > 0:
+            # Interrupts the download after the first range
+            self.send_error(404)
+            return
+        content = LARGE_TEST_DATA[start:end + 1]
+        self.send_response(206)
+        self.send_header('Content-Range', f'bytes {start}-{end}/{len(LARGE_TEST_DATA)}')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if self.path == '/stall-first' and start == 0 and end > 0:
+            # A slow connection; the rest of its range should be taken over
+            for i in range(0, len(content), 1024):
+                self.wfile.write(content[i:i + 1024])
+                time.sleep(0.01)
+            return
+        self.wfile.write(content)
+
+
+class SlowHTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        content = self.path.encode() * 1024
+        self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        # Every connection is capped by the server
+        for i in range(0, len(content) - 1024, 1024):
+            time.sleep(0.01)
+            self.wfile.write(content[i:i + 1024])
+        # The download is done once the client has read the last chunk
+        with self.server.lock:
+            self.server.active -= 1
+        self.wfile.write(content[-1024:])
+
+
 class FakeLogger:
     def debug(self, msg):
         pass
@@ -112,5 +173,176 @@ def test_chunked(self):
         })
 
 
+class SmallRangeHttpFD(HttpFD):
+    _MIN_RANGE_SIZE = 16 * 1024
+
+
+class ReadHttpFD(HttpFD):
+    _USE_READINTO = False
+
+
+class TestHttpFDConnections(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), RangeHTTPTestRequestHandler)
+        self.httpd.requested_ranges = []
+        self.port = http_server_port(self.httpd)
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+        self.filename = 'testfile.mp4'
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        for suffix in ('', '.part', '.ytdl'):
+            try_rm(encodeFilename(self.filename + suffix))
+
+    def download(self, ep, params=None, fd_class=SmallRangeHttpFD):
+        params = {'logger': FakeLogger(), 'http_connections': 4, **(params or {})}
+        downloader = fd_class(YoutubeDL(params), params)
+        self.assertTrue(downloader.real_download(self.filename, {
+            'url': 'http://127.0.0.1:%d/%s' % (self.port, ep),
+        }), ep)
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), LARGE_TEST_DATA)
+        self.assertFalse(os.path.exists(self.filename + '.ytdl'))
+
+    def test_connections(self):
+        self.download('regular')
+        ranges = self.httpd.requested_ranges
+        self.assertEqual(ranges[0], 'bytes=0-0')
+        self.assertGreaterEqual(len(ranges), 5)
+
+    def test_no_range_support(self):
+        self.download('no-range')
+        self.assertEqual(len(self.httpd.requested_ranges), 2)
+
+    def test_rebalance(self):
+        self.download('stall-first')
+        # The ranges of the fast connections are done first and they take over the slow one
+        self.assertGreater(len(self.httpd.requested_ranges), 5)
+
+    def test_single_connection(self):
+        # The chunks start at offsets that are not aligned
+        params = {'http_connections': 1, 'http_chunk_size': 50000, 'buffersize': 6000}
+        for fd_class in (HttpFD, ReadHttpFD):
+            self.download('regular', params, fd_class)
+            try_rm(encodeFilename(self.filename))
+
+    def test_resume(self):
+        half = len(LARGE_TEST_DATA) // 2
+        with open(self.filename + '.part', 'wb') as f:
+            f.write(LARGE_TEST_DATA[:half] + bytes(len(LARGE_TEST_DATA) - half))
+        with open(self.filename + '.ytdl', 'w') as f:
+            json.dump({'downloader': {'http_ranges': {
+                'size': len(LARGE_TEST_DATA),
+                'ranges': [[half, len(LARGE_TEST_DATA)]],
+            }}}, f)
+        self.download('regular', {'http_connections': 2})
+        ranges = self.httpd.requested_ranges
+        self.assertEqual(ranges[0], 'bytes=0-0')
+        self.assertGreaterEqual(len(ranges), 3)
+        self.assertTrue(all(int(re.match(r'bytes=(\d+)', r).group(1)) >= half for r in ranges[1:]))
+
+    def test_resume_single_connection(self):
+        for ep in ('regular', 'no-range'):
+            params = {'logger': FakeLogger(), 'http_connections': 4}
+            downloader = SmallRangeHttpFD(YoutubeDL(params), params)
+            with self.assertRaises(Exception):
+                downloader.real_download(self.filename, {'url': f'http://127.0.0.1:{self.port}/fail-rest'})
+            # The .part file is preallocated, so only the state tells how much of it was downloaded
+            self.assertEqual(os.path.getsize(self.filename + '.part'), len(LARGE_TEST_DATA))
+            self.assertTrue(os.path.exists(self.filename + '.ytdl'))
+
+            self.httpd.requested_ranges.clear()
+            self.download(ep, {'http_connections': 1})
+            self.assertEqual(self.httpd.requested_ranges[0], 'bytes=0-0', ep)
+            try_rm(encodeFilename(self.filename))
+
+
+class TestConcurrentFormats(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), SlowHTTPTestRequestHandler)
+        self.httpd.lock, self.httpd.active, self.httpd.peak = threading.Lock(), 0, 0
+        self.port = http_server_port(self.httpd)
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmpdir.cleanup()
+
+    def download(self, params):
+        ydl = YoutubeDL({
+            'logger': FakeLogger(),
+            'noprogress': True,
+            # The formats are not merged, so that ffmpeg is not needed
+            'allow_unplayable_formats': True,
+            'format': 'video+audio',
+            'outtmpl': os.path.join(self.tmpdir.name, '%(id)s.%(ext)s'),
+            **params,
+        })
+        progress = []
+        ydl.add_progress_hook(lambda s: progress.append(s.copy()))
+        ydl.process_ie_result({
+            'id': 'testid',
+            'title': 'test',
+            'formats': [{
+                'format_id': format_id,
+                'url': f'http://127.0.0.1:{self.port}/{format_id}',
+                'ext': 'mp4',
+                'vcodec': 'avc1' if format_id == 'video' else 'none',
+                'acodec': 'mp4a' if format_id == 'audio' else 'none',
+            } for format_id in ('video', 'audio')],
+        })
+        for format_id in ('video', 'audio'):
+            with open(os.path.join(self.tmpdir.name, f'testid.f{format_id}.mp4'), 'rb') as f:
+                self.assertEqual(f.read(), f'/{format_id}'.encode() * 1024)
+        return progress
+
+    def test_sequential(self):
+        progress = self.download({})
+        self.assertEqual(self.httpd.peak, 1)
+        self.assertFalse([p for p in progress if p.get('progress_idx')])
+
+    def test_concurrent(self):
+        progress = self.download({'concurrent_format_downloads': True})
+        self.assertEqual(self.httpd.peak, 2)
+        finished = {p['progress_idx'] for p in progress if p['status'] == 'finished'}
+        self.assertEqual(finished, {0, 1})
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = 0
+        patchers = (
+            mock.patch('time.monotonic', lambda: self.clock),
+            mock.patch('time.sleep', self.sleep))
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def test_shared_budget(self):
+        limiter = RateLimiter(1000)
+        # Two downloads that alternate get half of the rate each
+        for _ in range(4):
+            limiter.consume(500)
+        self.assertEqual(self.clock, 2)
+        # Up to a second of unused budget can be caught up on
+        self.clock += 10
+        limiter.consume(1000)
+        self.assertEqual(self.clock, 12)
+        limiter.consume(1000)
+        self.assertEqual(self.clock, 13)
+
+
 if __name__ == '__main__':
     unittest.main()
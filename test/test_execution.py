@@ -31,6 +31,16 @@ def test_main_exec(self):
     def test_import(self):
         self.run_yt_dlp(exe=(sys.executable, '-c', 'import yt_dlp'))
 
+    def test_import_budget(self):
+        # These are only needed to download, postprocess or parse the options;
+        # see devscripts/import_times.py for what is imported instead
+        stdout, _ = self.run_yt_dlp(exe=(sys.executable, '-c', 'import sys, yt_dlp; print(*sys.modules)'), opts=())
+        imported = set(stdout.split())
+        for module in ('asyncio', 'optparse', 'yt_dlp.aes', 'yt_dlp.cookies', 'yt_dlp.downloader',
+                       'yt_dlp.extractor.adobepass', 'yt_dlp.extractor.common', 'yt_dlp.options',
+                       'yt_dlp.postprocessor', 'yt_dlp.websocket.websockets'):
+            self.assertNotIn(module, imported)
+
     def test_module_exec(self):
         self.run_yt_dlp(exe=(sys.executable, '-m', 'yt_dlp'))
 
@@ -18,11 +18,13 @@
 import urllib.error
 import urllib.request
 import zlib
+from unittest import mock
 
 from test.helper import http_server_port
 from yt_dlp import YoutubeDL
 from yt_dlp.dependencies import brotli
 from yt_dlp.utils import sanitized_Request, urlencode_postdata
+from yt_dlp.utils._utils import _HTTPConnectionPoolEntry
 
 from .helper import FakeYDL
 
@@ -496,5 +498,79 @@ def test_file_urls(self):
         os.unlink(tf.name)
 
 
+class KeepAliveRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        # The client port identifies the connection the request was sent over
+        payload = str(self.client_address[1]).encode() * (1000 if self.path == '/large' else 1)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(payload)))
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(payload)
+        if self.path in ('/close', '/drop'):
+            self.close_connection = True
+
+
+class TestKeepAlive(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveRequestHandler)
+        self.port = http_server_port(self.httpd)
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _client_port(self, ydl, path='/'):
+        with ydl.urlopen(sanitized_Request(f'http://127.0.0.1:{self.port}{path}')) as r:
+            return r.read()[:5]
+
+    def test_reuse(self):
+        with FakeYDL() as ydl:
+            self.assertEqual(self._client_port(ydl), self._client_port(ydl))
+
+    def test_released_when_closed(self):
+        # Another thread may take the connection as soon as it is released
+        release, closed = _HTTPConnectionPoolEntry.release, []
+
+        def check_release(entry):
+            response = entry.conn._HTTPConnection__response
+            closed.append(response is None or response.isclosed())
+            release(entry)
+
+        with FakeYDL() as ydl, mock.patch.object(_HTTPConnectionPoolEntry, 'release', check_release):
+            self._client_port(ydl)
+        self.assertEqual(closed, [True])
+
+    def test_no_keep_alive(self):
+        with FakeYDL({'http_keep_alive': False}) as ydl:
+            self.assertNotEqual(self._client_port(ydl), self._client_port(ydl))
+
+    def test_connection_close(self):
+        with FakeYDL() as ydl:
+            self.assertNotEqual(self._client_port(ydl, '/close'), self._client_port(ydl))
+
+    def test_partially_read(self):
+        with FakeYDL() as ydl:
+            r = ydl.urlopen(sanitized_Request(f'http://127.0.0.1:{self.port}/large'))
+            first = r.read(5)
+            r.close()
+            self.assertNotEqual(first, self._client_port(ydl))
+
+    def test_closed_by_server(self):
+        with FakeYDL() as ydl:
+            # The server drops the connection without announcing it
+            first = self._client_port(ydl, '/drop')
+            self.assertNotEqual(first, self._client_port(ydl))
+
+
 if __name__ == '__main__':
     unittest.main()
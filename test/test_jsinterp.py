@@ -7,6 +7,7 @@
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import json
 import math
 
 from yt_dlp.jsinterp import JS_Undefined, JSInterpreter
@@ -328,6 +329,23 @@ def test_negative(self):
         self._test('function f(){return 2    -    + + - -2;}', 0)
         self._test('function f(){return 2    +    - + - -2;}', 0)
 
+    def test_repeated_calls(self):
+        # The parsed code is cached, but the values must not be
+        jsi = JSInterpreter('''
+            function f(a){var b=[1, 2], c={"x": [3]}, d = 4; for(var i=0;i<a;i++){b.push(i*d)}; c["x"].push(b.length); return [b, c]}
+        ''')
+        self.assertEqual(jsi.call_function('f', 2), [[1, 2, 0, 4], {'x': [3, 4]}])
+        self.assertEqual(jsi.call_function('f', 2), [[1, 2, 0, 4], {'x': [3, 4]}])
+        self.assertEqual(jsi.call_function('f', 1), [[1, 2, 0], {'x': [3, 3]}])
+
+    def test_parse_function_code(self):
+        jsi = JSInterpreter('')
+        parsed = jsi.parse_function_code(
+            ['a'], '{var b=function(c){var d=function(e){return e*2};return d(c)+1};return b(a)}')
+        self.assertEqual(parsed, json.loads(json.dumps(parsed)))
+        self.assertNotIn('function', json.dumps(parsed))
+        self.assertEqual(jsi.build_parsed_function(parsed)([3]), 7)
+
     @unittest.skip('Not implemented')
     def test_packed(self):
         jsi = JSInterpreter('''function f(p,a,c,k,e,d){while(c--)if(k[c])p=p.replace(new RegExp('\\b'+c.toString(a)+'\\b','g'),k[c]);return p}''')
@@ -22,12 +22,16 @@
     compat_os_name,
 )
 from yt_dlp.utils import (
+    JSON_LD_RE,
     Config,
     DateRange,
     ExtractorError,
+    FormatFilter,
     InAdvancePagedList,
+    JSONScanner,
     LazyList,
     OnDemandPagedList,
+    PageIndex,
     age_restricted,
     args_to_str,
     base_url,
@@ -37,6 +41,7 @@
     cli_bool_option,
     cli_option,
     cli_valueless_option,
+    compile_path,
     date_from_str,
     datetime_from_str,
     detect_exe_version,
@@ -70,6 +75,7 @@
     intlist_to_bytes,
     iri_to_uri,
     is_html,
+    iter_js_to_json,
     js_to_json,
     limit_length,
     locked_file,
@@ -1218,6 +1224,57 @@ def test_js_to_json_template_literal(self):
         self.assertEqual(js_to_json('`${name}"${name}"`', {'name': '5'}), '"5\\"5\\""')
         self.assertEqual(js_to_json('`${name}`', {}), '"name"')
 
+    def test_iter_js_to_json(self):
+        for code in (
+            '{"a": [1, 1.05, 0x1F, -2e-7, true, null,], b: \'c\\\'d\', 3: "e\\/f", /* g */}',
+            '[//*a*/ 1, //b\n 2, `h${i}`, !0, void 0, undefined]',
+            '{a: new Date("2020"), b: new Foo(1), c: new Map([[1, 2]])}',
+            '{a: parseInt("x12y"), b: (function(a){return a})("s"), c: new Date("2020")}',
+            '{\n  "a": "x",\n  "b": new Map([["y", 1]]),\n  c: 042\n}\n',
+        ):
+            for size in (1, 2, 3, 5, 8):
+                chunks = [code[i:i + size] for i in range(0, len(code), size)]
+                self.assertEqual(''.join(iter_js_to_json(chunks, {'i': '"I"'})), js_to_json(code, {'i': '"I"'}),
+                                 msg=f'{code!r} in chunks of {size}')
+
+        consumed = []
+
+        def chunks():
+            yield '['
+            for i in range(100):
+                consumed.append(i)
+                yield f'{{"a": {i}, b: \'{i}\'}},\n'
+            yield ']'
+
+        pieces = iter_js_to_json(chunks())
+        first = next(pieces)
+        self.assertLess(len(consumed), 5, msg='Converted pieces should be yielded before the end of the code')
+        self.assertEqual(json.loads(first + ''.join(pieces)), [{'a': i, 'b': str(i)} for i in range(100)])
+
+    def test_JSONScanner(self):
+        page = '''
+            <script>var a = {"b": "</script>"};</script>
+            <script type="application/ld+json">{"@type": "VideoObject"}</script>
+            <script type=application/ld+json>[{"c": "</script>"}] </SCRIPT>
+            <script type="application/ld+json">{}</script><script>{"d": 1}</script>
+        '''
+        scanner = JSONScanner.of(page)
+        self.assertIs(JSONScanner.of(page), scanner)
+        self.assertIsNot(JSONScanner.of(''.join(list(page))), scanner)
+
+        self.assertEqual(scanner.search_object(r'var a\s*='), {'b': '</script>'})
+        self.assertEqual(scanner.search_object(r'var a\s*=', r';\s*</script>'), {'b': '</script>'})
+        self.assertEqual(scanner.search_object(r'var a\s*=', r'"\s*</script>'), None)
+        self.assertEqual(scanner.search_object(r'var z\s*='), None)
+        obj = scanner.search_object(r'var a\s*=')
+        self.assertIsNot(scanner.search_object(r'var a\s*='), obj)
+
+        # Where the object cannot be decoded in place, the json_ld group of JSON_LD_RE is returned
+        expected = [{'@type': 'VideoObject'}, '[{"c": "</script>"}]', '{}</script><script>{"d": 1}']
+        self.assertEqual(list(scanner.iter_json_ld()), expected)
+        self.assertEqual(list(scanner.iter_json_ld()), expected)
+        self.assertEqual([mobj.group('json_ld') for mobj in re.finditer(JSON_LD_RE, page)][1:], expected[1:])
+
     def test_extract_attributes(self):
         self.assertEqual(extract_attributes('<e x="y">'), {'x': 'y'})
         self.assertEqual(extract_attributes("<e x='y'>"), {'x': 'y'})
@@ -1410,6 +1467,27 @@ def test_render_table(self):
             '123    4\n'
             '9999   51')
 
+    def test_FormatFilter(self):
+        fmt = {'height': 720, 'filesize': 2 * 1024 ** 2, 'vcodec': 'avc1.64001F', 'format_id': 'hls-720p'}
+        for filter_spec, expected in (
+            ('height<=?720', True),
+            ('height > 720', False),
+            ('filesize<2MiB', False),
+            ('filesize<=2MiB', True),
+            ('fps>?30', True),
+            ('fps>30', False),
+            ('vcodec^=avc1', True),
+            ('vcodec!^=avc1', False),
+            ('format_id ~= \'\\d+p$\'', True),
+            ('format_id*="dash"', False),
+        ):
+            self.assertEqual(bool(FormatFilter(filter_spec)(fmt)), expected, msg=filter_spec)
+
+        self.assertEqual(str(FormatFilter('height <=? 720')), 'height <=? 720')
+        self.assertEqual(str(FormatFilter('vcodec!^=avc1')), "vcodec !^= 'avc1'")
+        self.assertRaises(SyntaxError, FormatFilter, '720<height')
+        self.assertRaises(ValueError, FormatFilter, 'filesize<1.2.3')
+
     def test_match_str(self):
         # Unary
         self.assertFalse(match_str('xy', {'x': 1200}))
@@ -1824,6 +1902,31 @@ def test_get_element_text_and_html_by_tag(self):
             (self.GET_ELEMENT_BY_TAG_RES_INNERSPAN_TEXT, self.GET_ELEMENT_BY_TAG_RES_INNERSPAN_HTML))
         self.assertRaises(compat_HTMLParseError, get_element_text_and_html_by_tag, 'article', html)
 
+    def test_page_index(self):
+        html = '''
+        <div id="main" class="foo bar"><span class=foo>nice</span><span data-x='y' class="baz foo">also nice</span>
+        <a class="foo" href="#">link</a><div>inner</div></div><meta property="og:title" content="title">
+        '''
+        lookups = (
+            lambda html: get_elements_text_and_html_by_attribute('class', 'foo', html),
+            lambda html: get_elements_text_and_html_by_attribute('data-x', 'y', html),
+            lambda html: get_elements_text_and_html_by_attribute('id', 'main', html, tag='div'),
+            lambda html: get_elements_by_class('foo', html),
+            lambda html: get_elements_html_by_class('bar', html),
+            lambda html: [get_element_by_class('no-such-class', html)],
+            lambda html: get_element_text_and_html_by_tag('div', html),
+            lambda html: get_element_text_and_html_by_tag('a', html),
+        )
+        expected = [list(lookup(html)) for lookup in lookups]
+        self.assertIsNone(PageIndex.get(html))
+
+        index = PageIndex(html)
+        self.assertIs(PageIndex.get(html), index)
+        self.assertIsNone(PageIndex.get(''.join(list(html))))
+        self.assertEqual([list(lookup(html)) for lookup in lookups], expected)
+        self.assertEqual(get_elements_by_class('baz', html), ['also nice'])
+        self.assertRaises(compat_HTMLParseError, get_element_text_and_html_by_tag, 'article', html)
+
     def test_iri_to_uri(self):
         self.assertEqual(
             iri_to_uri('https://www.google.com/search?q=foo&ie=utf-8&oe=utf-8&client=firefox-b'),
@@ -2340,6 +2443,35 @@ def test_traverse_obj(self):
         self.assertEqual(traverse_obj(mobj, lambda k, _: k in (0, 'group')), ['0123', '3'],
                          msg='function on a `re.Match` should give group name as well')
 
+    def test_compile_path(self):
+        _TEST_DATA = {
+            'urls': [
+                {'index': 0, 'url': 'https://www.example.com/0'},
+                {'index': 1, 'url': 'https://www.example.com/1'},
+            ],
+            'Str': 'str',
+            0: 'int',
+        }
+        for path, kwargs in (
+            (('urls', ..., 'url'), {}),
+            (('urls', lambda _, v: v['index'], {'url': 'url', 'int': 'index'}), {}),
+            (('urls', ('0', '1:'), 'index'), {'is_user_input': True}),
+            ('str', {'casesense': False}),
+            (('Str', 1), {'traverse_string': True}),
+            (['urls', 0, {dict}], {}),
+        ):
+            self.assertEqual(traverse_obj(_TEST_DATA, compile_path(path, **kwargs)),
+                             traverse_obj(_TEST_DATA, path, **kwargs), msg=f'{path!r}, {kwargs!r}')
+
+        self.assertEqual(traverse_obj(_TEST_DATA, compile_path('str'), casesense=False), None,
+                         msg='compiled path should keep the options it was compiled with')
+        self.assertEqual(traverse_obj(_TEST_DATA, ('urls', 1, 'index')), 1)
+        self.assertEqual(traverse_obj(_TEST_DATA, ('urls', 1.0, 'index')), None,
+                         msg='cached path should not be confused with an equal key')
+        self.assertEqual(traverse_obj(_TEST_DATA, (key for key in ('Str',))), 'str')
+        self.assertEqual(traverse_obj(_TEST_DATA, (key for key in ('urls', 0, 'index'))), 0,
+                         msg='path from an iterator should not be cached')
+
 
 if __name__ == '__main__':
     unittest.main()
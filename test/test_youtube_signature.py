@@ -10,8 +10,11 @@
 
 import contextlib
 import re
+import shutil
 import string
+import time
 import urllib.request
+from unittest import mock
 
 from test.helper import FakeYDL, is_download_test
 from yt_dlp.extractor import YoutubeIE
@@ -177,6 +180,103 @@ def test_youtube_extract_player_info(self):
             self.assertEqual(player_id, expected_player_id)
 
 
+_PLAYER_URL = 'https://www.youtube.com/s/player/0123abcd/player_ias.vflset/en_US/base.js'
+_PLAYER_JS = '''
+var Xa=function(a){var b=a.split(""),c=function(d){return d.reverse()};c(b);return b.join("")};
+(b=a.get("n"))&&(b=Xa(b),a.set("n",b))
+'''
+
+
+class TestPlayerCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'testdata', 'player_cache')
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _make_ie(self, params={}):
+        ie = YoutubeIE(FakeYDL({'cachedir': self.cache_dir, **params}))
+        ie.downloads = []
+
+        def download_webpage(url, video_id, *args, **kwargs):
+            ie.downloads.append(url)
+            return _PLAYER_JS
+        ie._download_webpage = download_webpage
+        return ie
+
+    def test_player(self):
+        ie = self._make_ie()
+        self.assertEqual(ie._load_player('id', _PLAYER_URL), _PLAYER_JS)
+        self.assertEqual(ie._load_player('id', _PLAYER_URL), _PLAYER_JS)
+        self.assertEqual(ie.downloads, [_PLAYER_URL])
+
+        ie = self._make_ie()
+        self.assertEqual(ie._load_player('id', _PLAYER_URL), _PLAYER_JS)
+        self.assertEqual(ie.downloads, [])
+
+    def test_player_cache_size(self):
+        ie = self._make_ie()
+        ie._PLAYER_CACHE_SIZE = 2
+        for player_id in ('0123abcd', '1234abcd', '2345abcd'):
+            ie._load_player('id', _PLAYER_URL.replace('0123abcd', player_id))
+            time.sleep(0.01)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.cache_dir, 'youtube-player'))),
+                         ['1234abcd.json', '2345abcd.json'])
+
+    def test_nsig(self):
+        ie = self._make_ie()
+        self.assertEqual(ie._decrypt_nsig('abcdef', 'id', _PLAYER_URL), 'fedcba')
+        self.assertEqual(ie.downloads, [_PLAYER_URL])
+        argnames, code, functions = ie.cache.load('youtube-nsig-parsed', '0123abcd')
+        self.assertEqual(argnames, ['a'])
+        self.assertEqual(len(functions), 1)
+        self.assertNotIn('function', code)
+        # Older versions still find the code in the format that they expect
+        argnames, code = ie.cache.load('youtube-nsig', '0123abcd')
+        self.assertEqual(argnames, ['a'])
+        self.assertIn('function', code)
+
+        ie = self._make_ie()
+        ie._code_cache = None  # the parsed function is enough
+        self.assertEqual(ie._decrypt_nsig('ghijkl', 'id', _PLAYER_URL), 'lkjihg')
+        self.assertEqual(
+            ie.cache.load('youtube-nsig-values', '0123abcd'), [['abcdef', 'fedcba'], ['ghijkl', 'lkjihg']])
+
+        ie = self._make_ie()
+        ie._extract_n_function_code = None  # the value is cached
+        self.assertEqual(ie._decrypt_nsig('abcdef', 'id', _PLAYER_URL), 'fedcba')
+
+    def test_nsig_batch(self):
+        ie = self._make_ie()
+        self.assertEqual(
+            ie._decrypt_nsig_batch(['abc', 'def', 'abc'], 'id', _PLAYER_URL), {'abc': 'cba', 'def': 'fed'})
+        self.assertEqual(ie.downloads, [_PLAYER_URL])
+        self.assertEqual(ie.cache.load('youtube-nsig-values', '0123abcd'), [['abc', 'cba'], ['def', 'fed']])
+
+        ie._extract_n_function_code = None  # only the new value is decrypted
+        with self.assertRaises(TypeError):
+            ie._decrypt_nsig_batch(['abc', 'ghi'], 'id', _PLAYER_URL)
+        self.assertEqual(ie._decrypt_nsig_batch(['def', 'abc'], 'id', _PLAYER_URL), {'abc': 'cba', 'def': 'fed'})
+
+    def test_print_sig_code(self):
+        for n in ('abc', 'def'):
+            ie = self._make_ie({'youtube_print_sig_code': True})
+            ie.to_screen = mock.Mock()
+            ie._decrypt_nsig_batch([n], 'id', _PLAYER_URL)
+            # The code is printed as found in the player, also when it is cached
+            output = ie.to_screen.call_args[0][0]
+            self.assertIn('function(d){return d.reverse()}', output)
+            self.assertNotIn('__yt_dlp_jsinterp_func', output)
+
+    def test_nsig_cache_size(self):
+        ie = self._make_ie()
+        ie._NSIG_CACHE_SIZE = 2
+        for s in ('abc', 'def', 'abc', 'ghi'):
+            ie._decrypt_nsig(s, 'id', _PLAYER_URL)
+        self.assertEqual(list(ie._load_nsig_cache(_PLAYER_URL)), ['abc', 'ghi'])
+
+
 @is_download_test
 class TestSignature(unittest.TestCase):
     def setUp(self):
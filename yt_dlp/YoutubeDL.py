@@ -1,14 +1,15 @@
 import collections
+import collections.abc
 import contextlib
 import datetime
 import errno
 import fileinput
 import functools
+import hashlib
 import io
 import itertools
 import json
 import locale
-import operator
 import os
 import random
 import re
@@ -17,37 +18,19 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import tokenize
 import traceback
 import unicodedata
 
-from .cache import Cache
+from .cache import Cache, HTTPCache
 from .compat import urllib  # isort: split
 from .compat import compat_os_name, compat_shlex_quote
-from .cookies import load_cookies
-from .downloader import LDM_EXCEPTIONS, FFmpegFD, get_suitable_downloader, shorten_protocol_name
-from .downloader.rtmp import rtmpdump_version
-from .extractor import gen_extractor_classes, get_info_extractor
-from .extractor.common import UnsupportedURLIE
-from .extractor.openload import PhantomJSwrapper
+from .compat.compat_utils import lazy_attributes
+from .extractor import gen_extractor_classes, get_extractor_host_index, get_info_extractor
 from .minicurses import format_text
 from .plugins import directories as plugin_directories
-from .postprocessor import _PLUGIN_CLASSES as plugin_pps
-from .postprocessor import (
-    FFmpegFixupDuplicateMoovPP,
-    FFmpegFixupDurationPP,
-    FFmpegFixupM3u8PP,
-    FFmpegFixupM4aPP,
-    FFmpegFixupStretchedPP,
-    FFmpegFixupTimestampPP,
-    FFmpegMergerPP,
-    FFmpegPostProcessor,
-    FFmpegVideoConvertorPP,
-    MoveFilesAfterDownloadPP,
-    get_postprocessor,
-)
-from .postprocessor.ffmpeg import resolve_mapping as resolve_recode_mapping
 from .update import REPOSITORY, current_git_head, detect_variant
 from .utils import (
     DEFAULT_OUTTMPL,
@@ -68,9 +51,11 @@
     ExclusivelyLockedError,
     ExistingVideoReached,
     ExtractorError,
+    FormatFilter,
     FormatSorter,
     GeoRestrictedError,
     HEADRequest,
+    HTTPConnectionPool,
     ISO3166Utils,
     LazyList,
     MaxDownloadsReached,
@@ -78,6 +63,7 @@
     PagedList,
     PerRequestProxyHandler,
     PlaylistEntries,
+    PlaylistEntryPool,
     Popen,
     PostProcessingError,
     ReExtractInfo,
@@ -123,7 +109,6 @@
     number_of_digits,
     orderedSet,
     orderedSet_from_options,
-    parse_filesize,
     preferredencoding,
     prepend_extension,
     remove_terminal_sequences,
@@ -180,6 +165,29 @@
 if compat_os_name == 'nt':
     import ctypes
 
+# The downloaders, postprocessors and cookies are imported where they are used,
+# so that they are not loaded by `import yt_dlp`. These are kept for compatibility
+lazy_attributes(__name__, {
+    'load_cookies': '.cookies',
+    **dict.fromkeys(('LDM_EXCEPTIONS', 'FFmpegFD', 'get_suitable_downloader', 'shorten_protocol_name'), '.downloader'),
+    'rtmpdump_version': '.downloader.rtmp',
+    'UnsupportedURLIE': '.extractor.common',
+    'PhantomJSwrapper': '.extractor.openload',
+    **dict.fromkeys((
+        'FFmpegFixupDuplicateMoovPP',
+        'FFmpegFixupDurationPP',
+        'FFmpegFixupM3u8PP',
+        'FFmpegFixupM4aPP',
+        'FFmpegFixupStretchedPP',
+        'FFmpegFixupTimestampPP',
+        'FFmpegMergerPP',
+        'FFmpegPostProcessor',
+        'FFmpegVideoConvertorPP',
+        'MoveFilesAfterDownloadPP',
+        'get_postprocessor',
+    ), '.postprocessor'),
+})
+
 
 class YoutubeDL:
     """YoutubeDL class.
@@ -231,7 +239,8 @@ class YoutubeDL:
     force_write_download_archive: Force writing download archive regardless
                        of 'skip_download' or 'simulate'.
     simulate:          Do not download the video files. If unset (or None),
-                       simulate only if listsubtitles, listformats or list_thumbnails is used
+                       simulate only if listsubtitles, listformats, explain_format
+                       or list_thumbnails is used
     format:            Video format code. see "FORMAT SELECTION" for more details.
                        You can also pass a function. The function takes 'ctx' as
                        argument and returns the formats to download.
@@ -250,6 +259,12 @@ class YoutubeDL:
                        into a single file
     allow_multiple_audio_streams:   Allow multiple audio streams to be merged
                        into a single file
+    concurrent_format_downloads: Download the formats that are merged into a
+                       single file at the same time instead of one after the other
+    concurrent_playlist_entries: Number of playlist entries that are extracted and
+                       downloaded at the same time (default: 1). The archive,
+                       filter and --max-downloads checks are still done in
+                       playlist order
     check_formats      Whether to test if the formats are downloadable.
                        Can be True (check all), False (check none),
                        'selected' (check selected formats),
@@ -310,6 +325,15 @@ class YoutubeDL:
     skip_download:     Skip the actual download of the video file
     cachedir:          Location of the cache files in the filesystem.
                        False to disable filesystem cache.
+    extraction_cache_ttl: Reuse the extraction results from the filesystem cache
+                       if they are not older than this many seconds. Either a number,
+                       or a dictionary of lowercase extractor keys (and "default")
+                       to the number of seconds. Results with format URLs that
+                       expire earlier and live streams are not reused
+    http_cache_size:   Maximum size in bytes of the filesystem cache of the web pages
+                       requested by the extractors. The cached pages are revalidated
+                       with their ETag/Last-Modified unless still fresh according
+                       to their Cache-Control/Expires. None/0 to disable
     noplaylist:        Download single video instead of a playlist if in doubt.
     age_limit:         An integer representing the user's age in years.
                        Unsuitable videos for the given age are skipped.
@@ -416,6 +440,8 @@ class YoutubeDL:
                        - "detect_or_warn": check whether we can do anything
                                            about it, warn otherwise (default)
     source_address:    Client-side IP address to bind to.
+    http_keep_alive:   Reuse idle HTTP connections for later requests to the
+                       same server (default: True)
     sleep_interval_requests: Number of seconds to sleep between requests
                        during extraction
     sleep_interval:    Number of seconds to sleep before each download when
@@ -440,6 +466,8 @@ class YoutubeDL:
                               [sleep_before_extract; max_sleep_before_extract].
     sleep_interval_subtitles: Number of seconds to sleep before each subtitle download
     listformats:       Print an overview of available video formats and exit.
+    explain_format:    Print the compiled format selection of each video, the
+                       formats it selects and the time it takes, and exit.
     list_thumbnails:   Print a table of all thumbnails and exit.
     match_filter:      A function that gets called for every video with the signature
                        (info_dict, *, incomplete: bool) -> Optional[str]
@@ -517,7 +545,8 @@ class YoutubeDL:
     nopart, updatetime, buffersize, ratelimit, throttledratelimit, min_filesize,
     max_filesize, test, noresizebuffer, retries, file_access_retries, fragment_retries,
     continuedl, xattr_set_filesize, hls_use_mpegts, http_chunk_size,
-    external_downloader_args, concurrent_fragment_downloads.
+    external_downloader_args, concurrent_fragment_downloads, fragment_memory_budget,
+    http_connections, adaptive_fragment_concurrency.
 
     The following options are used by the post processors:
     ffmpeg_location:   Location of the ffmpeg/avconv binary; either the path
@@ -636,6 +665,7 @@ def __init__(self, params=None, auto_init=True):
         self.params = params
         self._ies = {}
         self._ies_instances = {}
+        self._ie_order = None
         self._pps = {k: [] for k in POSTPROCESS_WHEN}
         self._printed_messages = set()
         self._first_webpage_request = True
@@ -648,7 +678,14 @@ def __init__(self, params=None, auto_init=True):
         self._num_videos = 0
         self._playlist_level = 0
         self._playlist_urls = set()
+        # Also shared with the threads of the PlaylistEntryPool
+        self._playlist_lock = threading.Lock()
+        self._archive_lock = threading.Lock()
+        self._pending_archive_ids = set()
+        self._playlist_entry_pool = None
+        self._format_selectors = {}
         self.cache = Cache(self)
+        self.http_cache = HTTPCache(self)
 
         stdout = sys.stderr if self.params.get('logtostderr') else sys.stdout
         self._out_files = Namespace(
@@ -762,6 +799,7 @@ def check_deprecated(param, option, suggestion):
         if self.params.get('simulate') is None and any((
             self.params.get('list_thumbnails'),
             self.params.get('listformats'),
+            self.params.get('explain_format'),
             self.params.get('listsubtitles'),
         )):
             self.params['simulate'] = 'list_only'
@@ -806,6 +844,8 @@ def check_deprecated(param, option, suggestion):
             for ph in self.params.get(opt, []):
                 fn(ph)
 
+        from .postprocessor import get_postprocessor
+
         for pp_def_raw in self.params.get('postprocessors', []):
             pp_def = dict(pp_def_raw)
             when = pp_def.pop('when', 'post_process')
@@ -855,10 +895,26 @@ def add_info_extractor(self, ie):
         """Add an InfoExtractor object to the end of the list."""
         ie_key = ie.ie_key()
         self._ies[ie_key] = ie
+        self._ie_order = None
         if not isinstance(ie, type):
             self._ies_instances[ie_key] = ie
             ie.set_downloader(self)
 
+    def _candidate_ies(self, url):
+        """
+        Get the (ie_key, ie) of the extractors that may be suitable for the URL, in order.
+        Only the extractors that are not in the host index are tried for every URL
+        """
+        host_index = get_extractor_host_index()
+        ie_keys = host_index and host_index.candidates(url)
+        if ie_keys is None:
+            return self._ies.items()
+        if self._ie_order is None:
+            self._ie_order = {ie_key: i for i, ie_key in enumerate(self._ies)}
+            self._unindexed_ies = [ie_key for ie_key in self._ies if ie_key not in host_index.indexed]
+        ie_keys = {*filter(self._ie_order.__contains__, ie_keys), *self._unindexed_ies}
+        return [(ie_key, self._ies[ie_key]) for ie_key in sorted(ie_keys, key=self._ie_order.__getitem__)]
+
     def get_info_extractor(self, ie_key):
         """
         Get an instance of an IE with name ie_key, it will try to get one from
@@ -875,6 +931,8 @@ def add_default_info_extractors(self):
         """
         Add the InfoExtractors returned by gen_extractors to the end of the list
         """
+        from .extractor.common import UnsupportedURLIE
+
         all_ies = {ie.IE_NAME.lower(): ie for ie in gen_extractor_classes()}
         all_ies['end'] = UnsupportedURLIE()
         try:
@@ -999,6 +1057,9 @@ def __exit__(self, *args):
             except BaseException as ex:
                 self.report_warning('Failed to save cookies: %s' % ex)
 
+        if getattr(self, '_connection_pool', None):
+            self._connection_pool.clear()
+
     def trouble(self, message=None, tb=None, is_error=True):
         """Determine action to take when a download problem appears.
 
@@ -1587,11 +1648,11 @@ def extract_info(self, url, download=True, ie_key=None, extra_info=None,
             ie_key = 'Generic'
 
         if ie_key:
-            ies = {ie_key: self._ies[ie_key]} if ie_key in self._ies else {}
+            ies = {ie_key: self._ies[ie_key]}.items() if ie_key in self._ies else ()
         else:
-            ies = self._ies
+            ies = self._candidate_ies(url)
 
-        for key, ie in ies.items():
+        for key, ie in ies:
             if not ie.suitable(url):
                 continue
 
@@ -1691,6 +1752,33 @@ def progress(msg):
 
     @_handle_extraction_exceptions
     def __extract_info(self, url, ie, download, extra_info, process):
+        cache_key = self._extraction_cache_key(ie, url)
+        ie_result = cache_key and self._load_extraction_cache(ie, cache_key)
+        if ie_result:
+            self.to_screen(f'[{ie.IE_NAME}] Reusing the extraction result of {url} from cache')
+        else:
+            ie_result = self.__extract_info_from_site(url, ie, process)
+            if cache_key and isinstance(ie_result, dict):
+                ie_result = self._store_extraction_cache(cache_key, ie_result)
+        if ie_result is None:  # Finished already (backwards compatibility; listformats and friends should be moved here)
+            self.report_warning(f'Extractor {ie.IE_NAME} returned nothing{bug_reports_message()}')
+            return
+        if isinstance(ie_result, list):
+            # Backwards compatibility: old IE result format
+            ie_result = {
+                '_type': 'compat_list',
+                'entries': ie_result,
+            }
+        if extra_info.get('original_url'):
+            ie_result.setdefault('original_url', extra_info['original_url'])
+        self.add_default_extra_info(ie_result, ie, url)
+        if process:
+            self._wait_for_video(ie_result)
+            return self.process_ie_result(ie_result, download, extra_info)
+        else:
+            return ie_result
+
+    def __extract_info_from_site(self, url, ie, process):
         min_sleep_interval = self.params.get('sleep_before_extract')
         if min_sleep_interval:
             max_sleep_interval = self.params.get('max_sleep_before_extract') or min_sleep_interval
@@ -1702,31 +1790,107 @@ def __extract_info(self, url, ie, download, extra_info, process):
             time.sleep(sleep_interval)
 
         try:
-            ie_result = ie.extract(url)
+            return ie.extract(url)
         except UserNotLive as e:
             if process:
                 if self.params.get('wait_for_video'):
                     self.report_warning(e)
                 self._wait_for_video()
             raise
-        if ie_result is None:  # Finished already (backwards compatibility; listformats and friends should be moved here)
-            self.report_warning(f'Extractor {ie.IE_NAME} returned nothing{bug_reports_message()}')
-            return
-        if isinstance(ie_result, list):
-            # Backwards compatibility: old IE result format
-            ie_result = {
-                '_type': 'compat_list',
-                'entries': ie_result,
-            }
-        if extra_info.get('original_url'):
-            ie_result.setdefault('original_url', extra_info['original_url'])
-        self.add_default_extra_info(ie_result, ie, url)
-        if process:
-            self._wait_for_video(ie_result)
-            return self.process_ie_result(ie_result, download, extra_info)
+
+    def _extraction_cache_ttl(self, ie):
+        ttl = self.params.get('extraction_cache_ttl')
+        if isinstance(ttl, dict):
+            ttl = ttl.get(ie.ie_key().lower(), ttl.get('default'))
+        return ttl
+
+    def _extraction_cache_key(self, ie, url):
+        if not self._extraction_cache_ttl(ie) or not self.cache.enabled:
+            return None
+        # The result also depends on the options that change what is extracted,
+        # and on the account or the country that it is extracted for
+        url_hash = hashlib.sha256(json.dumps([url, *map(self.params.get, (
+            'noplaylist', 'extractor_args', 'cookiefile', 'cookiesfrombrowser', 'username', 'usenetrc',
+            'netrc_location', 'ap_mso', 'ap_username', 'geo_bypass', 'geo_bypass_country', 'geo_bypass_ip_block',
+        ))]).encode()).hexdigest()[:16]
+        return join_nonempty(ie.ie_key(), ie.get_temp_id(url), url_hash, delim='_')
+
+    @staticmethod
+    def _extraction_cache_copy(obj):
+        """Return a JSON-serializable copy of an extraction result, or None if it cannot be cached"""
+        def copy(obj):
+            if isinstance(obj, dict):
+                if obj.get('is_live') or obj.get('live_status') in ('is_live', 'is_upcoming', 'post_live'):
+                    raise ValueError('Live streams are not cached')
+                return {k: copy(v) for k, v in obj.items()}
+            elif isinstance(obj, (list, tuple)):
+                return list(map(copy, obj))
+            elif obj is None or isinstance(obj, (str, int, float, bool)):
+                return obj
+            raise ValueError(f'{type(obj).__name__} cannot be cached')
+
+        try:
+            return copy(obj)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _extraction_cache_expiry(obj):
+        """Earliest expiry time given in the URLs of an extraction result"""
+        if isinstance(obj, dict):
+            expiries = (YoutubeDL._extraction_cache_expiry(v) for v in obj.values())
+            expiries = [*expiries, *(
+                int(mobj.group(1)) for mobj in (
+                    re.search(r'(?i)(?:^|[?&;~/,])(?:expires?|exp)[=/](\d{10})(?!\d)', obj.get(key) or '')
+                    for key in ('url', 'manifest_url', 'fragment_base_url') if isinstance(obj.get(key), str))
+                if mobj)]
+        elif isinstance(obj, list):
+            expiries = map(YoutubeDL._extraction_cache_expiry, obj)
         else:
+            return None
+        return min(filter(None, expiries), default=None)
+
+    def _store_extraction_cache(self, key, ie_result):
+        entries = ie_result.get('entries')
+        if not isinstance(entries, collections.abc.Iterator):
+            data = self._extraction_cache_copy(ie_result)
+            if data is not None:
+                self.cache.store('extraction', key, {
+                    'timestamp': time.time(),
+                    'expires': self._extraction_cache_expiry(data),
+                    'info': data,
+                })
             return ie_result
 
+        # The playlist can only be cached once all of its entries have been extracted
+        def cache_entries():
+            cached, cacheable = [], True
+            for entry in entries:
+                if cacheable:
+                    data = self._extraction_cache_copy(entry)
+                    if data is None:
+                        cacheable = False
+                        cached.clear()
+                    else:
+                        cached.append(data)
+                yield entry
+            if cacheable:
+                self._store_extraction_cache(key, {**ie_result, 'entries': cached})
+
+        return {**ie_result, 'entries': cache_entries()}
+
+    def _load_extraction_cache(self, ie, key):
+        # Format URLs that are about to expire would not be usable for the download
+        EXPIRY_MARGIN = 10 * 60
+
+        cached = self.cache.load('extraction', key, min_ver=__version__)
+        now = time.time()
+        if (not isinstance(cached, dict)
+                or (cached.get('timestamp') or 0) + self._extraction_cache_ttl(ie) < now
+                or (cached.get('expires') or float('inf')) < now + EXPIRY_MARGIN):
+            return None
+        return cached.get('info')
+
     def add_default_extra_info(self, ie_result, ie, url):
         if url is not None:
             self.add_extra_info(ie_result, {
@@ -1841,22 +2005,26 @@ def process_ie_result(self, ie_result, download=True, extra_info=None):
             # Protect from infinite recursion due to recursively nested playlists
             # (see https://github.com/ytdl-org/youtube-dl/issues/27833)
             webpage_url = ie_result.get('webpage_url')  # Playlists maynot have webpage_url
-            if webpage_url and webpage_url in self._playlist_urls:
+            with self._playlist_lock:
+                visited = webpage_url and webpage_url in self._playlist_urls
+                if not visited:
+                    self._playlist_level += 1
+                    self._playlist_urls.add(webpage_url)
+            if visited:
                 self.to_screen(
                     '[download] Skipping already downloaded playlist: %s'
                     % ie_result.get('title') or ie_result.get('id'))
                 return
 
-            self._playlist_level += 1
-            self._playlist_urls.add(webpage_url)
             self._fill_common_fields(ie_result, False)
             self._sanitize_thumbnails(ie_result)
             try:
                 return self.__process_playlist(ie_result, download)
             finally:
-                self._playlist_level -= 1
-                if not self._playlist_level:
-                    self._playlist_urls.clear()
+                with self._playlist_lock:
+                    self._playlist_level -= 1
+                    if not self._playlist_level:
+                        self._playlist_urls.clear()
         elif result_type == 'compat_list':
             self.report_warning(
                 'Extractor %s returned a compat_list result. '
@@ -1971,45 +2139,62 @@ def __process_playlist(self, ie_result, download):
         if keep_resolved_entries:
             self.write_debug('The information of all playlist entries will be held in memory')
 
-        failures = 0
-        max_failures = self.params.get('skip_playlist_after_errors') or float('inf')
-        for i, (playlist_index, entry) in enumerate(entries):
-            if lazy:
-                resolved_entries.append((playlist_index, entry))
-            if not entry:
-                continue
+        pool, turn = None, self._playlist_entry_turn()
+        if turn:
+            # Nested playlists are processed by the thread of their entry
+            turn.hold = True
+        elif (self.params.get('concurrent_playlist_entries') or 1) > 1 and not self._playlist_entry_pool:
+            pool = self._playlist_entry_pool = PlaylistEntryPool(self.params['concurrent_playlist_entries'])
+
+        def entry_tasks():
+            for i, (playlist_index, entry) in enumerate(entries):
+                if lazy:
+                    resolved_entries.append((playlist_index, entry))
+                if not entry:
+                    continue
 
-            entry['__x_forwarded_for_ip'] = ie_result.get('__x_forwarded_for_ip')
-            if not lazy and 'playlist-index' in self.params.get('compat_opts', []):
-                playlist_index = ie_result['requested_entries'][i]
+                entry['__x_forwarded_for_ip'] = ie_result.get('__x_forwarded_for_ip')
+                if not lazy and 'playlist-index' in self.params.get('compat_opts', []):
+                    playlist_index = ie_result['requested_entries'][i]
 
-            entry_copy = collections.ChainMap(entry, {
-                **common_info,
-                'n_entries': int_or_none(n_entries),
-                'playlist_index': playlist_index,
-                'playlist_autonumber': i + 1,
-            })
+                entry_copy = collections.ChainMap(entry, {
+                    **common_info,
+                    'n_entries': int_or_none(n_entries),
+                    'playlist_index': playlist_index,
+                    'playlist_autonumber': i + 1,
+                })
 
-            if self._match_entry(entry_copy, incomplete=True) is not None:
-                # For compatabilty with youtube-dl. See https://github.com/yt-dlp/yt-dlp/issues/4369
-                resolved_entries[i] = (playlist_index, NO_DEFAULT)
-                continue
+                if self._match_entry(entry_copy, incomplete=True) is not None:
+                    # For compatabilty with youtube-dl. See https://github.com/yt-dlp/yt-dlp/issues/4369
+                    resolved_entries[i] = (playlist_index, NO_DEFAULT)
+                    continue
 
-            self.to_screen('[download] Downloading item %s of %s' % (
-                self._format_screen(i + 1, self.Styles.ID), self._format_screen(n_entries, self.Styles.EMPHASIS)))
-
-            entry_result = self.__process_iterable_entry(entry, download, collections.ChainMap({
-                'playlist_index': playlist_index,
-                'playlist_autonumber': i + 1,
-            }, extra))
-            if not entry_result:
-                failures += 1
-            if failures >= max_failures:
-                self.report_error(
-                    f'Skipping the remaining entries in playlist "{title}" since {failures} items failed extraction')
-                break
-            if keep_resolved_entries:
-                resolved_entries[i] = (playlist_index, entry_result)
+                self.to_screen('[download] Downloading item %s of %s' % (
+                    self._format_screen(i + 1, self.Styles.ID), self._format_screen(n_entries, self.Styles.EMPHASIS)))
+
+                yield (i, playlist_index), functools.partial(
+                    self.__process_iterable_entry, entry, download, collections.ChainMap({
+                        'playlist_index': playlist_index,
+                        'playlist_autonumber': i + 1,
+                    }, extra))
+
+        failures = 0
+        max_failures = self.params.get('skip_playlist_after_errors') or float('inf')
+        results = pool.map(entry_tasks()) if pool else ((key, func()) for key, func in entry_tasks())
+        try:
+            for (i, playlist_index), entry_result in results:
+                if not entry_result:
+                    failures += 1
+                if failures >= max_failures:
+                    self.report_error(
+                        f'Skipping the remaining entries in playlist "{title}" since {failures} items failed extraction')
+                    break
+                if keep_resolved_entries:
+                    resolved_entries[i] = (playlist_index, entry_result)
+        finally:
+            results.close()
+            if pool:
+                self._playlist_entry_pool = None
 
         # Update with processed data
         ie_result['entries'] = [e for _, e in resolved_entries if e is not NO_DEFAULT]
@@ -2033,72 +2218,22 @@ def __process_iterable_entry(self, entry, download, extra_info):
         return self.process_ie_result(
             entry, download=download, extra_info=extra_info)
 
-    def _build_format_filter(self, filter_spec):
-        " Returns a function to filter the formats according to the filter_spec "
-
-        OPERATORS = {
-            '<': operator.lt,
-            '<=': operator.le,
-            '>': operator.gt,
-            '>=': operator.ge,
-            '=': operator.eq,
-            '!=': operator.ne,
-        }
-        operator_rex = re.compile(r'''(?x)\s*
-            (?P<key>[\w.-]+)\s*
-            (?P<op>%s)(?P<none_inclusive>\s*\?)?\s*
-            (?P<value>[0-9.]+(?:[kKmMgGtTpPeEzZyY]i?[Bb]?)?)\s*
-            ''' % '|'.join(map(re.escape, OPERATORS.keys())))
-        m = operator_rex.fullmatch(filter_spec)
-        if m:
-            try:
-                comparison_value = int(m.group('value'))
-            except ValueError:
-                comparison_value = parse_filesize(m.group('value'))
-                if comparison_value is None:
-                    comparison_value = parse_filesize(m.group('value') + 'B')
-                if comparison_value is None:
-                    raise ValueError(
-                        'Invalid value %r in format specification %r' % (
-                            m.group('value'), filter_spec))
-            op = OPERATORS[m.group('op')]
-
-        if not m:
-            STR_OPERATORS = {
-                '=': operator.eq,
-                '^=': lambda attr, value: attr.startswith(value),
-                '$=': lambda attr, value: attr.endswith(value),
-                '*=': lambda attr, value: value in attr,
-                '~=': lambda attr, value: value.search(attr) is not None
-            }
-            str_operator_rex = re.compile(r'''(?x)\s*
-                (?P<key>[a-zA-Z0-9._-]+)\s*
-                (?P<negation>!\s*)?(?P<op>%s)\s*(?P<none_inclusive>\?\s*)?
-                (?P<quote>["'])?
-                (?P<value>(?(quote)(?:(?!(?P=quote))[^\\]|\\.)+|[\w.-]+))
-                (?(quote)(?P=quote))\s*
-                ''' % '|'.join(map(re.escape, STR_OPERATORS.keys())))
-            m = str_operator_rex.fullmatch(filter_spec)
-            if m:
-                if m.group('op') == '~=':
-                    comparison_value = re.compile(m.group('value'))
-                else:
-                    comparison_value = re.sub(r'''\\([\\"'])''', r'\1', m.group('value'))
-                str_op = STR_OPERATORS[m.group('op')]
-                if m.group('negation'):
-                    op = lambda attr, value: not str_op(attr, value)
-                else:
-                    op = str_op
+    def _playlist_entry_turn(self):
+        """The turn of the playlist entry that is processed by this thread, when it is concurrent"""
+        return self._playlist_entry_pool and self._playlist_entry_pool.current_turn
 
-        if not m:
-            raise SyntaxError('Invalid filter specification %r' % filter_spec)
+    def _take_playlist_entry_turn(self):
+        turn = self._playlist_entry_turn()
+        if not turn or turn.taken:
+            return
+        turn.take()
+        # The previous entries may have used up --max-downloads in the meantime
+        if self._num_downloads >= float(self.params.get('max_downloads') or 'inf'):
+            raise MaxDownloadsReached()
 
-        def _filter(f):
-            actual_value = f.get(m.group('key'))
-            if actual_value is None:
-                return m.group('none_inclusive')
-            return op(actual_value, comparison_value)
-        return _filter
+    def _build_format_filter(self, filter_spec):
+        " Returns a function to filter the formats according to the filter_spec "
+        return FormatFilter(filter_spec)
 
     def _check_formats(self, formats):
         for f in formats:
@@ -2126,6 +2261,8 @@ def _check_formats(self, formats):
     def _default_format_spec(self, info_dict, download=True):
 
         def can_merge():
+            from .postprocessor import FFmpegMergerPP
+
             merger = FFmpegMergerPP(self)
             return merger.available and merger.can_merge()
 
@@ -2146,7 +2283,23 @@ def can_merge():
             else 'bestvideo*+bestaudio/best' if not compat
             else 'bestvideo+bestaudio/best')
 
+    def _format_selector_key(self, format_spec):
+        # The parameters that are read when the selector is compiled
+        return (format_spec, bool(self.params.get('allow_multiple_audio_streams')),
+                bool(self.params.get('allow_multiple_video_streams')),
+                self.params.get('check_formats') == 'selected', bool(self.params.get('verbose')))
+
     def build_format_selector(self, format_spec):
+        """
+        Returns the selector function of the format_spec, see "format" in the params.
+        It is compiled only once per YoutubeDL instance, e.g. for all the entries of a playlist
+        """
+        key = self._format_selector_key(format_spec)
+        if key not in self._format_selectors:
+            self._format_selectors[key] = self._compile_format_selector(format_spec)
+        return self._format_selectors[key]
+
+    def _compile_format_selector(self, format_spec):
         def syntax_error(note, start):
             message = (
                 'Invalid format specification: '
@@ -2515,8 +2668,21 @@ def restore_last_token(self):
             # perform format debugging when -Fv
             all_single_selectors = list(filter(lambda x: x.type == SINGLE, _visit_selectors(parsed_selector)))
             final_selector_func.selectors = list(zip(all_single_selectors, map(_build_selector_function, all_single_selectors)))
+        final_selector_func.plan = parsed_selector
         return final_selector_func
 
+    @staticmethod
+    def _format_selection_ctx(formats):
+        return {
+            'formats': formats,
+            'has_merged_format': any('none' not in (f.get('acodec'), f.get('vcodec')) for f in formats),
+            'incomplete_formats': (
+                # All formats are video-only or
+                all(f.get('vcodec') != 'none' and f.get('acodec') == 'none' for f in formats)
+                # all formats are audio-only
+                or all(f.get('vcodec') == 'none' and f.get('acodec') != 'none' for f in formats)),
+        }
+
     def _calc_headers(self, info_dict):
         res = merge_headers(self.params['http_headers'], info_dict.get('http_headers') or {})
         if 'Youtubedl-No-Compression' in res:  # deprecated
@@ -2640,6 +2806,7 @@ def sort_formats(self, info_dict):
 
     def process_video_result(self, info_dict, download=True):
         assert info_dict.get('_type', 'video') == 'video'
+        self._take_playlist_entry_turn()
         self._num_videos += 1
 
         if 'id' not in info_dict:
@@ -2873,6 +3040,8 @@ def fms():
             self.list_subtitles(info_dict['id'], subtitles, 'subtitles')
         if self.params.get('listformats') or interactive_format_selection:
             self.list_formats(info_dict, fms())
+        if self.params.get('explain_format'):
+            self.explain_format(info_dict, download=download)
         if list_only:
             # Without this printing, -F --print-json will not work
             self.__forced_printings(info_dict)
@@ -2895,15 +3064,7 @@ def fms():
                 self.write_debug(f'Default format spec: {req_format}')
                 format_selector = self.build_format_selector(req_format)
 
-            formats_to_download = list(format_selector({
-                'formats': formats,
-                'has_merged_format': any('none' not in (f.get('acodec'), f.get('vcodec')) for f in formats),
-                'incomplete_formats': (
-                    # All formats are video-only or
-                    all(f.get('vcodec') != 'none' and f.get('acodec') == 'none' for f in formats)
-                    # all formats are audio-only
-                    or all(f.get('vcodec') == 'none' and f.get('acodec') != 'none' for f in formats)),
-            }))
+            formats_to_download = list(format_selector(self._format_selection_ctx(formats)))
             if interactive_format_selection and not formats_to_download:
                 self.report_error('Requested format is not available', tb=False, is_error=False)
                 continue
@@ -2931,37 +3092,45 @@ def to_screen(*msg):
                     to_screen(f'Downloading {len(requested_ranges)} time ranges:',
                               (f'{c["start_time"]:.1f}-{c["end_time"]:.1f}' for c in requested_ranges))
             max_downloads_reached = False
+            turn = self._playlist_entry_turn()
+            if turn:
+                # The following entries can go on once all the downloads of this one are counted
+                turn.end_after(len(formats_to_download) * len(requested_ranges))
 
-            for fmt, chapter in itertools.product(formats_to_download, requested_ranges):
-                new_info = self._copy_infodict(info_dict)
-                new_info.update(fmt)
-                offset, duration = info_dict.get('section_start') or 0, info_dict.get('duration') or float('inf')
-                end_time = offset + min(chapter.get('end_time', duration), duration)
-                if chapter or offset:
-                    new_info.update({
-                        'section_start': offset + chapter.get('start_time', 0),
-                        # duration may not be accurate. So allow deviations <1sec
-                        'section_end': end_time if end_time <= offset + duration + 1 else None,
-                        'section_title': chapter.get('title'),
-                        'section_number': chapter.get('index'),
-                    })
-                downloaded_formats.append(new_info)
-                try:
-                    self.process_info(new_info)
-                except MaxDownloadsReached:
-                    max_downloads_reached = True
-                self._raise_pending_errors(new_info)
-                # Remove copied info
-                for key, val in tuple(new_info.items()):
-                    if info_dict.get(key) == val:
-                        new_info.pop(key)
-                if max_downloads_reached:
-                    break
+            try:
+                for fmt, chapter in itertools.product(formats_to_download, requested_ranges):
+                    new_info = self._copy_infodict(info_dict)
+                    new_info.update(fmt)
+                    offset, duration = info_dict.get('section_start') or 0, info_dict.get('duration') or float('inf')
+                    end_time = offset + min(chapter.get('end_time', duration), duration)
+                    if chapter or offset:
+                        new_info.update({
+                            'section_start': offset + chapter.get('start_time', 0),
+                            # duration may not be accurate. So allow deviations <1sec
+                            'section_end': end_time if end_time <= offset + duration + 1 else None,
+                            'section_title': chapter.get('title'),
+                            'section_number': chapter.get('index'),
+                        })
+                    downloaded_formats.append(new_info)
+                    try:
+                        self.process_info(new_info)
+                    except MaxDownloadsReached:
+                        max_downloads_reached = True
+                    self._raise_pending_errors(new_info)
+                    # Remove copied info
+                    for key, val in tuple(new_info.items()):
+                        if info_dict.get(key) == val:
+                            new_info.pop(key)
+                    if max_downloads_reached:
+                        break
 
-            write_archive = {f.get('__write_download_archive', False) for f in downloaded_formats}
-            assert write_archive.issubset({True, False, 'ignore'})
-            if True in write_archive and False not in write_archive:
-                self.record_download_archive(info_dict)
+                write_archive = {f.get('__write_download_archive', False) for f in downloaded_formats}
+                assert write_archive.issubset({True, False, 'ignore'})
+                if True in write_archive and False not in write_archive:
+                    self.record_download_archive(info_dict)
+            finally:
+                # Either recorded in the archive now, or free to be downloaded again
+                self._release_archive_id(info_dict)
 
             info_dict['requested_downloads'] = downloaded_formats
             info_dict = self.run_all_pps('after_video', info_dict)
@@ -3106,6 +3275,41 @@ def print_field(field, actual_field=None, optional=False):
             self.to_stdout(json.dumps(self.sanitize_info(info_dict)))
 
     def dl(self, name, info, subtitle=False, test=False):
+        fd, new_info = self._prepare_dl(name, info, subtitle, test)
+        return fd.download(name, new_info, subtitle)
+
+    def _dl_concurrently(self, downloads):
+        """Run self.dl for each (name, info) of downloads at the same time"""
+        prepared = [self._prepare_dl(name, info) for name, info in downloads]
+        fds = [fd for fd, _ in prepared]
+        multiline = fds[0].share_multiline_status(*fds[1:])
+        results = [None] * len(prepared)
+
+        def download(idx, fd, name, info):
+            try:
+                results[idx] = fd.download(name, info)
+            except BaseException as e:
+                results[idx] = e
+
+        # Daemon threads do not hold up exiting when the user interrupts the download
+        threads = [
+            threading.Thread(target=download, args=(idx, fd, name, info), daemon=True)
+            for idx, ((fd, info), (name, _)) in enumerate(zip(prepared, downloads))]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            multiline.end()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _prepare_dl(self, name, info, subtitle=False, test=False):
+        from .downloader import get_suitable_downloader
+
         if not info.get('url'):
             self.raise_no_formats(info, True)
 
@@ -3138,7 +3342,7 @@ def dl(self, name, info, subtitle=False, test=False):
         new_info = self._copy_infodict(info)
         if new_info.get('http_headers') is None:
             new_info['http_headers'] = self._calc_headers(new_info)
-        return fd.download(name, new_info, subtitle)
+        return fd, new_info
 
     def existing_file(self, filepaths, *, default_overwrite=True):
         existing_files = list(filter(os.path.exists, orderedSet(filepaths)))
@@ -3206,6 +3410,8 @@ def wrapper(self: 'YoutubeDL', *args, **kwargs):
     @__clean_fd
     def process_info(self, info_dict):
         """Process a single resolved IE result. (Modifies it in-place)"""
+        from .downloader import LDM_EXCEPTIONS, FFmpegFD, get_suitable_downloader
+        from .postprocessor import FFmpegMergerPP, MoveFilesAfterDownloadPP
 
         assert info_dict.get('_type', 'video') == 'video'
         original_infodict = info_dict
@@ -3239,6 +3445,11 @@ def replace_info_dict(new_info):
         # info_dict['_filename'] needs to be set for backward compatibility
         info_dict['_filename'] = full_filename = self.prepare_filename(info_dict, warn=True)
         temp_filename = self.prepare_filename(info_dict, 'temp')
+        turn = self._playlist_entry_turn()
+        if turn:
+            # The following entries must not pass the archive check while this one is downloaded
+            self._reserve_archive_id(info_dict)
+            turn.step()
         files_to_move = {}
 
         # Forced printings
@@ -3445,6 +3656,7 @@ def correct_ext(filename, ext=new_ext):
                                 f'You have requested downloading multiple formats to stdout {reason}. '
                                 'The formats will be streamed one after the other')
                             fname = temp_filename
+                        downloads = []
                         for f in requested_formats:
                             new_info = dict(info_dict)
                             del new_info['requested_formats']
@@ -3457,7 +3669,14 @@ def correct_ext(filename, ext=new_ext):
                                     return
                                 f['filepath'] = fname
                                 downloaded.append(fname)
-                            partial_success, real_download = self.dl(fname, new_info)
+                            downloads.append((fname, new_info))
+
+                        if (self.params.get('concurrent_format_downloads')
+                                and temp_filename != '-' and len(downloads) > 1):
+                            results = self._dl_concurrently(downloads)
+                        else:
+                            results = itertools.starmap(self.dl, downloads)
+                        for partial_success, real_download in results:
                             info_dict['__real_download'] = info_dict['__real_download'] or real_download
                             success = success and partial_success
 
@@ -3496,6 +3715,17 @@ def correct_ext(filename, ext=new_ext):
             if success and full_filename != '-':
 
                 def fixup():
+                    from .postprocessor import (
+                        FFmpegFixupDuplicateMoovPP,
+                        FFmpegFixupDurationPP,
+                        FFmpegFixupM3u8PP,
+                        FFmpegFixupM4aPP,
+                        FFmpegFixupStretchedPP,
+                        FFmpegFixupTimestampPP,
+                        FFmpegVideoConvertorPP,
+                    )
+                    from .postprocessor.ffmpeg import resolve_mapping as resolve_recode_mapping
+
                     do_fixup = True
                     fixup_policy = self.params.get('fixup')
                     vid = info_dict['id']
@@ -3731,6 +3961,8 @@ def pre_process(self, ie_info, key='pre_process', files_to_move=None):
 
     def post_process(self, filename, info, files_to_move=None):
         """Run all the postprocessors on the given file."""
+        from .postprocessor import MoveFilesAfterDownloadPP
+
         info['filepath'] = filename
         info['__files_to_move'] = files_to_move or {}
         info = self.run_all_pps('post_process', info, additional_pps=info.get('__postprocessors'))
@@ -3750,7 +3982,7 @@ def _make_archive_id(self, info_dict):
             if not url:
                 return
             # Try to find matching extractor for the URL and take its ie_key
-            for ie_key, ie in self._ies.items():
+            for ie_key, ie in self._candidate_ies(url):
                 if ie.suitable(url):
                     extractor = ie_key
                     break
@@ -3785,12 +4017,24 @@ def test_filename_external(self, filename):
             return True
 
     def in_download_archive(self, info_dict):
-        if not self.archive:
+        if not self.archive and not self._pending_archive_ids:
             return False
 
         vid_ids = [self._make_archive_id(info_dict)]
         vid_ids.extend(info_dict.get('_old_archive_ids') or [])
-        return any(id_ in self.archive for id_ in vid_ids)
+        with self._archive_lock:
+            return any(id_ in self.archive or id_ in self._pending_archive_ids for id_ in vid_ids)
+
+    def _reserve_archive_id(self, info_dict):
+        """Count the video as archived while it is downloaded by a thread of the PlaylistEntryPool"""
+        if self.params.get('download_archive') is None:
+            return
+        with self._archive_lock:
+            self._pending_archive_ids.add(self._make_archive_id(info_dict))
+
+    def _release_archive_id(self, info_dict):
+        with self._archive_lock:
+            self._pending_archive_ids.discard(self._make_archive_id(info_dict))
 
     def record_download_archive(self, info_dict):
         fn = self.params.get('download_archive')
@@ -3801,9 +4045,18 @@ def record_download_archive(self, info_dict):
 
         self.write_debug(f'Adding to archive: {vid_id}')
         if is_path_like(fn):
-            with locked_file(fn, 'a', encoding='utf-8') as archive_file:
-                archive_file.write(vid_id + '\n')
-        self.archive.add(vid_id)
+            def write_archive():
+                with locked_file(fn, 'a', encoding='utf-8') as archive_file:
+                    archive_file.write(vid_id + '\n')
+
+            turn = self._playlist_entry_turn()
+            if turn:
+                # Keep the archive in playlist order
+                turn.defer(write_archive)
+            else:
+                write_archive()
+        with self._archive_lock:
+            self.archive.add(vid_id)
 
     def lock_file(self, info_dict):
         if not self.params.get('lock_exclusive', True):
@@ -3924,6 +4177,8 @@ def _get_formats(self, info_dict):
         return info_dict['formats']
 
     def render_formats_table(self, info_dict, format_selector=None):
+        from .downloader import shorten_protocol_name
+
         formats = self._get_formats(info_dict)
         if not formats:
             return
@@ -4070,6 +4325,50 @@ def __list_table(self, video_id, name, func, *args):
     def list_formats(self, info_dict, format_selector=None):
         self.__list_table(info_dict['id'], 'formats', self.render_formats_table, info_dict, format_selector)
 
+    def explain_format(self, info_dict, download=True):
+        """Print the compiled format selector of the video and the formats it selects, with timings"""
+        format_spec = self.params.get('format')
+        if callable(format_spec):
+            self.to_screen(f'[info] {info_dict["id"]}: The format selector is a function and cannot be explained')
+            return
+        elif format_spec in (None, '-'):
+            format_spec = self._default_format_spec(info_dict, download=download)
+
+        start = time.perf_counter()
+        format_selector = self._compile_format_selector(format_spec)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        selected = list(format_selector(self._format_selection_ctx(self._get_formats(info_dict))))
+        select_time = time.perf_counter() - start
+
+        def render(selector, depth=0):
+            if isinstance(selector, list):  # ,
+                if len(selector) > 1:
+                    yield depth, ', all of'
+                    depth += 1
+                for sel in selector:
+                    yield from render(sel, depth)
+                return
+            filters = ''.join(f' [{self._build_format_filter(f)}]' for f in selector.filters)
+            if selector.type == 'SINGLE':
+                yield depth, f'{selector.selector or "best"}{filters}'
+                return
+            yield depth, {'GROUP': '() group of', 'PICKFIRST': '/ first of', 'MERGE': '+ merge of'}[selector.type] + filters
+            children = [selector.selector] if selector.type == 'GROUP' else list(selector.selector)
+            # a/b/c and a+b+c are parsed as a/(b/c) and a+(b+c)
+            while (selector.type != 'GROUP' and len(children[-1]) == 1
+                    and children[-1][0].type == selector.type and not children[-1][0].filters):
+                children[-1:] = children[-1][0].selector
+            for sel in children:
+                yield from render(sel, depth + 1)
+
+        self.to_screen(f'[info] Format selection plan for {info_dict["id"]}:')
+        self.to_stdout('\n'.join([
+            *(f'{"  " * depth}{line}' for depth, line in render(format_selector.plan)),
+            f'Compiled "{format_spec}" in {compile_time * 1000:.2f}ms; '
+            f'selected {", ".join(f.get("format_id") or "?" for f in selected) or "nothing"} in {select_time * 1000:.2f}ms',
+        ]))
+
     def list_thumbnails(self, info_dict):
         self.__list_table(info_dict['id'], 'thumbnails', self.render_thumbnails_table, info_dict)
 
@@ -4090,11 +4389,15 @@ def print_debug_header(self):
         from . import _IN_CLI  # Must be delayed import
 
         # These imports can be slow. So import them only as needed
+        from .downloader.rtmp import rtmpdump_version
         from .extractor.extractors import _LAZY_LOADER
         from .extractor.extractors import (
             _PLUGIN_CLASSES as plugin_ies,
             _PLUGIN_OVERRIDES as plugin_ie_overrides
         )
+        from .extractor.openload import PhantomJSwrapper
+        from .postprocessor import _PLUGIN_CLASSES as plugin_pps
+        from .postprocessor import FFmpegPostProcessor
 
         def get_encoding(stream):
             ret = str(getattr(stream, 'encoding', 'missing (%s)' % type(stream).__name__))
@@ -4221,6 +4524,8 @@ def _setup_opener(self):
         opts_cookiefile = self.params.get('cookiefile')
         opts_proxy = self.params.get('proxy')
 
+        from .cookies import load_cookies
+
         self.cookiejar = load_cookies(opts_cookiefile, opts_cookiesfrombrowser, self)
 
         cookie_processor = YoutubeDLCookieProcessor(self.cookiejar)
@@ -4236,9 +4541,15 @@ def _setup_opener(self):
                 proxies['https'] = proxies['http']
         proxy_handler = PerRequestProxyHandler(proxies)
 
+        self._connection_pool = None
+        if self.params.get('http_keep_alive', True):
+            self._connection_pool = HTTPConnectionPool(maxsize=max(
+                10, self.params.get('concurrent_fragment_downloads') or 1, self.params.get('http_connections') or 1))
+
         debuglevel = 1 if self.params.get('debug_printtraffic') else 0
-        https_handler = make_HTTPS_handler(self.params, debuglevel=debuglevel)
-        ydlh = YoutubeDLHandler(self.params, debuglevel=debuglevel)
+        https_handler = make_HTTPS_handler(
+            self.params, debuglevel=debuglevel, connection_pool=self._connection_pool)
+        ydlh = YoutubeDLHandler(self.params, debuglevel=debuglevel, connection_pool=self._connection_pool)
         redirect_handler = YoutubeDLRedirectHandler()
         data_handler = urllib.request.DataHandler()
 
@@ -9,29 +9,14 @@
 import collections
 import getpass
 import itertools
-import optparse
 import os
 import re
 import sys
 import traceback
 
 from .compat import compat_shlex_quote
-from .cookies import SUPPORTED_BROWSERS, SUPPORTED_KEYRINGS
-from .downloader.external import get_external_downloader
+from .compat.compat_utils import lazy_attributes
 from .extractor import list_extractor_classes
-from .extractor.adobepass import MSO_INFO
-from .options import parseOpts
-from .postprocessor import (
-    FFmpegExtractAudioPP,
-    FFmpegMergerPP,
-    FFmpegPostProcessor,
-    FFmpegSubtitlesConvertorPP,
-    FFmpegThumbnailsConvertorPP,
-    FFmpegVideoConvertorPP,
-    FFmpegVideoRemuxerPP,
-    MetadataFromFieldPP,
-    MetadataParserPP,
-)
 from .update import Updater
 from .utils import (
     NO_DEFAULT,
@@ -67,6 +52,27 @@
 
 _IN_CLI = False
 
+# The options parser, cookies, downloaders and postprocessors are imported where they are used,
+# so that they are not loaded by `import yt_dlp`. These are kept for compatibility
+lazy_attributes(__name__, {
+    'SUPPORTED_BROWSERS': '.cookies',
+    'SUPPORTED_KEYRINGS': '.cookies',
+    'get_external_downloader': '.downloader.external',
+    'MSO_INFO': '.extractor.adobepass',
+    'parseOpts': '.options',
+    **dict.fromkeys((
+        'FFmpegExtractAudioPP',
+        'FFmpegMergerPP',
+        'FFmpegPostProcessor',
+        'FFmpegSubtitlesConvertorPP',
+        'FFmpegThumbnailsConvertorPP',
+        'FFmpegVideoConvertorPP',
+        'FFmpegVideoRemuxerPP',
+        'MetadataFromFieldPP',
+        'MetadataParserPP',
+    ), '.postprocessor'),
+})
+
 
 def _exit(status=0, *args):
     for msg in args:
@@ -113,6 +119,8 @@ def print_extractor_information(opts, urls):
             ie.description(markdown=False, search_examples=_SEARCHES)
             for ie in list_extractor_classes(opts.age_limit) if ie.working() and ie.IE_DESC is not False)
     elif opts.ap_list_mso:
+        from .extractor.adobepass import MSO_INFO
+
         out = 'Supported TV Providers:\n%s\n' % render_table(
             ['mso', 'mso name'],
             [[mso_id, mso_info['name']] for mso_id, mso_info in MSO_INFO.items()])
@@ -177,6 +185,20 @@ def set_default_compat(compat_name, opt_name, default=True, remove_compat=True):
 
 
 def validate_options(opts):
+    from .cookies import SUPPORTED_BROWSERS, SUPPORTED_KEYRINGS
+    from .downloader.external import get_external_downloader
+    from .extractor.adobepass import MSO_INFO
+    from .postprocessor import (
+        FFmpegExtractAudioPP,
+        FFmpegMergerPP,
+        FFmpegSubtitlesConvertorPP,
+        FFmpegThumbnailsConvertorPP,
+        FFmpegVideoConvertorPP,
+        FFmpegVideoRemuxerPP,
+        MetadataFromFieldPP,
+        MetadataParserPP,
+    )
+
     def validate(cndn, name, value=None, msg=None):
         if cndn:
             return True
@@ -212,6 +234,10 @@ def validate_minmax(min_val, max_val, min_name, max_name=None):
     validate_positive('autonumber start', opts.autonumber_start)
     validate_positive('autonumber size', opts.autonumber_size, True)
     validate_positive('concurrent fragments', opts.concurrent_fragment_downloads, True)
+    validate_positive('concurrent playlist entries', opts.concurrent_playlist_entries, True)
+    for ie_key, ttl in opts.extraction_cache_ttl.items():
+        validate_positive(f'extraction cache TTL{format_field(ie_key, None, " for %s", ignore="default")}', ttl)
+    validate_positive('http connections', opts.http_connections, True)
     validate_positive('playlist start', opts.playliststart, True)
     if opts.playlistend != -1:
         validate_minmax(opts.playliststart, opts.playlistend, 'playlist start', 'playlist end')
@@ -302,10 +328,12 @@ def validate_bytes(name, value):
 
     opts.ratelimit = validate_bytes('rate limit', opts.ratelimit)
     opts.throttledratelimit = validate_bytes('throttled rate limit', opts.throttledratelimit)
+    opts.http_cache_size = validate_bytes('HTTP cache size', opts.http_cache_size)
     opts.min_filesize = validate_bytes('min filesize', opts.min_filesize)
     opts.max_filesize = validate_bytes('max filesize', opts.max_filesize)
     opts.buffersize = validate_bytes('buffer size', opts.buffersize)
     opts.http_chunk_size = validate_bytes('http chunk size', opts.http_chunk_size)
+    opts.fragment_memory_budget = validate_bytes('fragment memory budget', opts.fragment_memory_budget)
 
     # Output templates
     def validate_outtmpl(tmpl, msg):
@@ -717,6 +745,9 @@ def get_postprocessors(opts):
 
 def parse_options(argv=None, ignore_config_files='if_override'):
     """@returns ParsedOptions(parser, opts, urls, ydl_opts)"""
+    from .options import parseOpts
+    from .postprocessor import FFmpegExtractAudioPP, FFmpegVideoConvertorPP, FFmpegVideoRemuxerPP
+
     parser, opts, urls = parseOpts(argv, ignore_config_files)
     urls = get_urls(urls, opts.batchfile, opts.verbose)
 
@@ -796,6 +827,7 @@ def parse_options(argv=None, ignore_config_files='if_override'):
         'allow_multiple_audio_streams': opts.allow_multiple_audio_streams,
         'check_formats': opts.check_formats,
         'listformats': opts.listformats,
+        'explain_format': opts.explain_format,
         'listformats_table': opts.listformats_table,
         'outtmpl': opts.outtmpl,
         'outtmpl_na_placeholder': opts.outtmpl_na_placeholder,
@@ -818,6 +850,11 @@ def parse_options(argv=None, ignore_config_files='if_override'):
         'skip_unavailable_fragments': opts.skip_unavailable_fragments,
         'keep_fragments': opts.keep_fragments,
         'concurrent_fragment_downloads': opts.concurrent_fragment_downloads,
+        'adaptive_fragment_concurrency': opts.adaptive_fragment_concurrency,
+        'concurrent_format_downloads': opts.concurrent_format_downloads,
+        'concurrent_playlist_entries': opts.concurrent_playlist_entries,
+        'fragment_memory_budget': opts.fragment_memory_budget,
+        'http_connections': opts.http_connections,
         'buffersize': opts.buffersize,
         'noresizebuffer': opts.noresizebuffer,
         'http_chunk_size': opts.http_chunk_size,
@@ -870,6 +907,8 @@ def parse_options(argv=None, ignore_config_files='if_override'):
         'max_views': opts.max_views,
         'daterange': opts.date,
         'cachedir': opts.cachedir,
+        'extraction_cache_ttl': opts.extraction_cache_ttl,
+        'http_cache_size': opts.http_cache_size,
         'youtube_print_sig_code': opts.youtube_print_sig_code,
         'age_limit': opts.age_limit,
         'download_archive': opts.download_archive,
@@ -883,6 +922,7 @@ def parse_options(argv=None, ignore_config_files='if_override'):
         'nocheckcertificate': opts.no_check_certificate,
         'prefer_insecure': opts.prefer_insecure,
         'enable_file_urls': opts.enable_file_urls,
+        'http_keep_alive': opts.http_keep_alive,
         'http_headers': opts.headers,
         'proxy': opts.proxy,
         'socket_timeout': opts.socket_timeout,
@@ -965,6 +1005,8 @@ def _real_main(argv=None):
     # We may need ffmpeg_location without having access to the YoutubeDL instance
     # See https://github.com/yt-dlp/yt-dlp/issues/2191
     if opts.ffmpeg_location:
+        from .postprocessor import FFmpegPostProcessor
+
         FFmpegPostProcessor._ffmpeg_location.set(opts.ffmpeg_location)
 
     with YoutubeDL(ydl_opts) as ydl:
@@ -1010,6 +1052,8 @@ def _real_main(argv=None):
 
 
 def main(argv=None):
+    import optparse
+
     global _IN_CLI
     _IN_CLI = True
     try:
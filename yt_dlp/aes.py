@@ -1,6 +1,8 @@
 import base64
+import struct
 from math import ceil
 
+from .compat import functools  # isort: split
 from .compat import compat_ord
 from .dependencies import Cryptodome
 from .utils import bytes_to_intlist, intlist_to_bytes
@@ -17,11 +19,11 @@ def aes_gcm_decrypt_and_verify_bytes(data, key, tag, nonce):
 else:
     def aes_cbc_decrypt_bytes(data, key, iv):
         """ Decrypt bytes with AES-CBC using native implementation since pycryptodome is unavailable """
-        return intlist_to_bytes(aes_cbc_decrypt(*map(bytes_to_intlist, (data, key, iv))))
+        return _native_cbc_decrypt(data, key, iv)
 
     def aes_gcm_decrypt_and_verify_bytes(data, key, tag, nonce):
         """ Decrypt bytes with AES-GCM using native implementation since pycryptodome is unavailable """
-        return intlist_to_bytes(aes_gcm_decrypt_and_verify(*map(bytes_to_intlist, (data, key, tag, nonce))))
+        return _native_gcm_decrypt_and_verify(data, key, tag, nonce)
 
 
 def aes_cbc_encrypt_bytes(data, key, iv, **kwargs):
@@ -136,21 +138,7 @@ def aes_ctr_encrypt(data, key, iv):
     @param {int[]} iv          16-Byte initialization vector
     @returns {int[]}           encrypted data
     """
-    expanded_key = key_expansion(key)
-    block_count = int(ceil(float(len(data)) / BLOCK_SIZE_BYTES))
-    counter = iter_vector(iv)
-
-    encrypted_data = []
-    for i in range(block_count):
-        counter_block = next(counter)
-        block = data[i * BLOCK_SIZE_BYTES: (i + 1) * BLOCK_SIZE_BYTES]
-        block += [0] * (BLOCK_SIZE_BYTES - len(block))
-
-        cipher_counter_block = aes_encrypt(counter_block, expanded_key)
-        encrypted_data += xor(block, cipher_counter_block)
-    encrypted_data = encrypted_data[:len(data)]
-
-    return encrypted_data
+    return bytes_to_intlist(_native_ctr_crypt(data, key, iv))
 
 
 def aes_cbc_decrypt(data, key, iv):
@@ -162,21 +150,7 @@ def aes_cbc_decrypt(data, key, iv):
     @param {int[]} iv          16-Byte IV
     @returns {int[]}           decrypted data
     """
-    expanded_key = key_expansion(key)
-    block_count = int(ceil(float(len(data)) / BLOCK_SIZE_BYTES))
-
-    decrypted_data = []
-    previous_cipher_block = iv
-    for i in range(block_count):
-        block = data[i * BLOCK_SIZE_BYTES: (i + 1) * BLOCK_SIZE_BYTES]
-        block += [0] * (BLOCK_SIZE_BYTES - len(block))
-
-        decrypted_block = aes_decrypt(block, expanded_key)
-        decrypted_data += xor(decrypted_block, previous_cipher_block)
-        previous_cipher_block = block
-    decrypted_data = decrypted_data[:len(data)]
-
-    return decrypted_data
+    return bytes_to_intlist(_native_cbc_decrypt(data, key, iv))
 
 
 def aes_cbc_encrypt(data, key, iv, *, padding_mode='pkcs7'):
@@ -189,23 +163,10 @@ def aes_cbc_encrypt(data, key, iv, *, padding_mode='pkcs7'):
     @param padding_mode        Padding mode to use
     @returns {int[]}           encrypted data
     """
-    expanded_key = key_expansion(key)
-    block_count = int(ceil(float(len(data)) / BLOCK_SIZE_BYTES))
-
-    encrypted_data = []
-    previous_cipher_block = iv
-    for i in range(block_count):
-        block = data[i * BLOCK_SIZE_BYTES: (i + 1) * BLOCK_SIZE_BYTES]
-        block = pad_block(block, padding_mode)
-
-        mixed_block = xor(block, previous_cipher_block)
-
-        encrypted_block = aes_encrypt(mixed_block, expanded_key)
-        encrypted_data += encrypted_block
-
-        previous_cipher_block = encrypted_block
-
-    return encrypted_data
+    if data:
+        last_block_start = len(data) - (len(data) % BLOCK_SIZE_BYTES or BLOCK_SIZE_BYTES)
+        data = data[:last_block_start] + pad_block(data[last_block_start:], padding_mode)
+    return bytes_to_intlist(_native_cbc_encrypt(data, key, iv))
 
 
 def aes_gcm_decrypt_and_verify(data, key, tag, nonce):
@@ -218,37 +179,7 @@ def aes_gcm_decrypt_and_verify(data, key, tag, nonce):
     @param {int[]} nonce       IV (recommended 12-Byte)
     @returns {int[]}           decrypted data
     """
-
-    # XXX: check aes, gcm param
-
-    hash_subkey = aes_encrypt([0] * BLOCK_SIZE_BYTES, key_expansion(key))
-
-    if len(nonce) == 12:
-        j0 = nonce + [0, 0, 0, 1]
-    else:
-        fill = (BLOCK_SIZE_BYTES - (len(nonce) % BLOCK_SIZE_BYTES)) % BLOCK_SIZE_BYTES + 8
-        ghash_in = nonce + [0] * fill + bytes_to_intlist((8 * len(nonce)).to_bytes(8, 'big'))
-        j0 = ghash(hash_subkey, ghash_in)
-
-    # TODO: add nonce support to aes_ctr_decrypt
-
-    # nonce_ctr = j0[:12]
-    iv_ctr = inc(j0)
-
-    decrypted_data = aes_ctr_decrypt(data, key, iv_ctr + [0] * (BLOCK_SIZE_BYTES - len(iv_ctr)))
-    pad_len = len(data) // 16 * 16
-    s_tag = ghash(
-        hash_subkey,
-        data
-        + [0] * (BLOCK_SIZE_BYTES - len(data) + pad_len)        # pad
-        + bytes_to_intlist((0 * 8).to_bytes(8, 'big')           # length of associated data
-                           + ((len(data) * 8).to_bytes(8, 'big')))  # length of data
-    )
-
-    if tag != aes_ctr_encrypt(s_tag, key, j0):
-        raise ValueError("Mismatching authentication tag")
-
-    return decrypted_data
+    return bytes_to_intlist(_native_gcm_decrypt_and_verify(data, key, tag, nonce))
 
 
 def aes_encrypt(data, expanded_key):
@@ -433,12 +364,6 @@ def key_expansion(data):
     return data
 
 
-def iter_vector(iv):
-    while True:
-        yield iv
-        iv = inc(iv)
-
-
 def sub_bytes(data):
     return [SBOX[x] for x in data]
 
@@ -482,66 +407,223 @@ def shift_rows_inv(data):
     return [data[((column - row) & 0b11) * 4 + row] for column in range(4) for row in range(4)]
 
 
-def shift_block(data):
-    data_shifted = []
+# Word-oriented implementation used when pycryptodome is unavailable.
+# The state is kept as four big-endian 32-bit columns and each round is done
+# with table lookups ("T-tables"), so that a block takes 16 lookups per round
+# instead of the byte-by-byte operations of aes_encrypt/aes_decrypt
 
-    bit = 0
-    for n in data:
-        if bit:
-            n |= 0x100
-        bit = n & 1
-        n >>= 1
-        data_shifted.append(n)
 
-    return data_shifted
+def _xtime(x):
+    x <<= 1
+    return x ^ 0x11B if x & 0x100 else x
 
 
-def inc(data):
-    data = data[:]  # copy
-    for i in range(len(data) - 1, -1, -1):
-        if data[i] == 255:
-            data[i] = 0
-        else:
-            data[i] = data[i] + 1
-            break
-    return data
+def _gf_mul(x, y):
+    result = 0
+    while y:
+        if y & 1:
+            result ^= x
+        x, y = _xtime(x), y >> 1
+    return result
 
 
-def block_product(block_x, block_y):
-    # NIST SP 800-38D, Algorithm 1
+def _rotate_tables(table):
+    return (table, *(tuple(((x >> n) | (x << (32 - n))) & 0xFFFFFFFF for x in table) for n in (8, 16, 24)))
 
-    if len(block_x) != BLOCK_SIZE_BYTES or len(block_y) != BLOCK_SIZE_BYTES:
-        raise ValueError("Length of blocks need to be %d bytes" % BLOCK_SIZE_BYTES)
 
-    block_r = [0xE1] + [0] * (BLOCK_SIZE_BYTES - 1)
-    block_v = block_y[:]
-    block_z = [0] * BLOCK_SIZE_BYTES
+@functools.cache
+def _t_tables():
+    """Encryption and decryption round tables (Te0-Te3, Td0-Td3)"""
+    te = _rotate_tables(tuple(
+        (_gf_mul(s, 2) << 24) | (s << 16) | (s << 8) | _gf_mul(s, 3) for s in SBOX))
+    td = _rotate_tables(tuple(
+        (_gf_mul(s, 14) << 24) | (_gf_mul(s, 9) << 16) | (_gf_mul(s, 13) << 8) | _gf_mul(s, 11) for s in SBOX_INV))
+    return te, td
 
-    for i in block_x:
-        for bit in range(7, -1, -1):
-            if i & (1 << bit):
-                block_z = xor(block_z, block_v)
-
-            do_xor = block_v[-1] & 1
-            block_v = shift_block(block_v)
-            if do_xor:
-                block_v = xor(block_v, block_r)
-
-    return block_z
 
+@functools.lru_cache(maxsize=16)
+def _expand_key_words(key):
+    """
+    Key schedules of a key as 32-bit words
 
-def ghash(subkey, data):
-    # NIST SP 800-38D, Algorithm 2
+    @param {bytes} key  16/24/32-Byte cipher key
+    @returns            (encryption round keys, decryption round keys) with
+                        4 words per round; the decryption round keys are in
+                        reverse order, with InvMixColumns applied for the
+                        equivalent inverse cipher
+    """
+    if len(key) not in (16, 24, 32):
+        raise ValueError(f'Invalid AES key length: {len(key)}')
+    words = list(struct.unpack(f'>{len(key) // 4}I', key))
+    key_words = len(words)
+    rounds = key_words + 6
+    for i in range(key_words, 4 * (rounds + 1)):
+        temp = words[-1]
+        if i % key_words == 0:
+            temp = ((SBOX[(temp >> 16) & 0xFF] << 24) | (SBOX[(temp >> 8) & 0xFF] << 16)
+                    | (SBOX[temp & 0xFF] << 8) | SBOX[temp >> 24]) ^ (RCON[i // key_words] << 24)
+        elif key_words > 6 and i % key_words == 4:
+            temp = ((SBOX[temp >> 24] << 24) | (SBOX[(temp >> 16) & 0xFF] << 16)
+                    | (SBOX[(temp >> 8) & 0xFF] << 8) | SBOX[temp & 0xFF])
+        words.append(words[i - key_words] ^ temp)
+
+    _, (td0, td1, td2, td3) = _t_tables()
+    dec_words = []
+    for r in range(rounds, -1, -1):
+        round_key = words[4 * r: 4 * r + 4]
+        if 0 < r < rounds:
+            round_key = [td0[SBOX[w >> 24]] ^ td1[SBOX[(w >> 16) & 0xFF]]
+                         ^ td2[SBOX[(w >> 8) & 0xFF]] ^ td3[SBOX[w & 0xFF]] for w in round_key]
+        dec_words.extend(round_key)
+    return tuple(words), tuple(dec_words)
+
+
+def _block_encryptor(key):
+    """Get a function that encrypts a block given as four 32-bit words"""
+    rk, _ = _expand_key_words(bytes(key))
+    (te0, te1, te2, te3), _ = _t_tables()
+    rounds, sbox = len(rk) // 4 - 1, SBOX
+
+    def encrypt(s0, s1, s2, s3):
+        s0, s1, s2, s3 = s0 ^ rk[0], s1 ^ rk[1], s2 ^ rk[2], s3 ^ rk[3]
+        for i in range(4, 4 * rounds, 4):
+            s0, s1, s2, s3 = (
+                te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ rk[i],
+                te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ rk[i + 1],
+                te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ rk[i + 2],
+                te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ rk[i + 3])
+        i = 4 * rounds
+        return (
+            ((sbox[s0 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16)
+             | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ rk[i],
+            ((sbox[s1 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16)
+             | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ rk[i + 1],
+            ((sbox[s2 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16)
+             | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ rk[i + 2],
+            ((sbox[s3 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16)
+             | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ rk[i + 3])
+
+    return encrypt
+
+
+def _block_decryptor(key):
+    """Get a function that decrypts a block given as four 32-bit words"""
+    _, rk = _expand_key_words(bytes(key))
+    _, (td0, td1, td2, td3) = _t_tables()
+    rounds, sbox = len(rk) // 4 - 1, SBOX_INV
+
+    def decrypt(s0, s1, s2, s3):
+        s0, s1, s2, s3 = s0 ^ rk[0], s1 ^ rk[1], s2 ^ rk[2], s3 ^ rk[3]
+        for i in range(4, 4 * rounds, 4):
+            s0, s1, s2, s3 = (
+                td0[s0 >> 24] ^ td1[(s3 >> 16) & 0xFF] ^ td2[(s2 >> 8) & 0xFF] ^ td3[s1 & 0xFF] ^ rk[i],
+                td0[s1 >> 24] ^ td1[(s0 >> 16) & 0xFF] ^ td2[(s3 >> 8) & 0xFF] ^ td3[s2 & 0xFF] ^ rk[i + 1],
+                td0[s2 >> 24] ^ td1[(s1 >> 16) & 0xFF] ^ td2[(s0 >> 8) & 0xFF] ^ td3[s3 & 0xFF] ^ rk[i + 2],
+                td0[s3 >> 24] ^ td1[(s2 >> 16) & 0xFF] ^ td2[(s1 >> 8) & 0xFF] ^ td3[s0 & 0xFF] ^ rk[i + 3])
+        i = 4 * rounds
+        return (
+            ((sbox[s0 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16)
+             | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ rk[i],
+            ((sbox[s1 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16)
+             | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ rk[i + 1],
+            ((sbox[s2 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16)
+             | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ rk[i + 2],
+            ((sbox[s3 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16)
+             | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ rk[i + 3])
+
+    return decrypt
+
+
+def _pad_to_blocks(data):
+    return bytes(data) + bytes(-len(data) % BLOCK_SIZE_BYTES)
+
+
+def _native_cbc_decrypt(data, key, iv):
+    """AES-CBC decryption of bytes; a partial last block is decrypted as if padded with zeros"""
+    decrypt = _block_decryptor(key)
+    padded = _pad_to_blocks(data)
+    words = struct.unpack(f'>{len(padded) // 4}I', padded)
+    p0, p1, p2, p3 = struct.unpack('>4I', bytes(iv))
+    out = []
+    for i in range(0, len(words), 4):
+        c0, c1, c2, c3 = words[i: i + 4]
+        d0, d1, d2, d3 = decrypt(c0, c1, c2, c3)
+        out += (d0 ^ p0, d1 ^ p1, d2 ^ p2, d3 ^ p3)
+        p0, p1, p2, p3 = c0, c1, c2, c3
+    return struct.pack(f'>{len(out)}I', *out)[:len(data)]
+
+
+def _native_cbc_encrypt(data, key, iv):
+    """AES-CBC encryption of bytes, which must be a multiple of the block size"""
+    encrypt = _block_encryptor(key)
+    words = struct.unpack(f'>{len(data) // 4}I', bytes(data))
+    c0, c1, c2, c3 = struct.unpack('>4I', bytes(iv))
+    out = []
+    for i in range(0, len(words), 4):
+        p0, p1, p2, p3 = words[i: i + 4]
+        c0, c1, c2, c3 = encrypt(p0 ^ c0, p1 ^ c1, p2 ^ c2, p3 ^ c3)
+        out += (c0, c1, c2, c3)
+    return struct.pack(f'>{len(out)}I', *out)
+
+
+def _native_ctr_crypt(data, key, iv):
+    """AES-CTR encryption/decryption of bytes with a 128-bit big-endian counter starting at iv"""
+    encrypt = _block_encryptor(key)
+    padded = _pad_to_blocks(data)
+    words = struct.unpack(f'>{len(padded) // 4}I', padded)
+    counter = int.from_bytes(bytes(iv), 'big')
+    out = []
+    for i in range(0, len(words), 4):
+        k0, k1, k2, k3 = encrypt(
+            counter >> 96, (counter >> 64) & 0xFFFFFFFF, (counter >> 32) & 0xFFFFFFFF, counter & 0xFFFFFFFF)
+        out += (words[i] ^ k0, words[i + 1] ^ k1, words[i + 2] ^ k2, words[i + 3] ^ k3)
+        counter = (counter + 1) & ((1 << 128) - 1)
+    return struct.pack(f'>{len(out)}I', *out)[:len(data)]
+
+
+def _ghash_tables(subkey):
+    """Tables of the products of the hash subkey with every byte value at every position of a block"""
+    # NIST SP 800-38D: the first bit of a block is the coefficient of x^0
+    powers, v = [], int.from_bytes(subkey, 'big')
+    for _ in range(128):
+        powers.append(v)
+        v = (v >> 1) ^ (0xE1 << 120) if v & 1 else v >> 1
+    tables = []
+    for i in range(BLOCK_SIZE_BYTES):
+        table = [0] * 256
+        for b in range(1, 256):
+            low_bit = b & -b
+            table[b] = table[b ^ low_bit] ^ powers[8 * i + 8 - low_bit.bit_length()]
+        tables.append(table)
+    return tables
+
+
+def _native_ghash(subkey, data):
+    tables = _ghash_tables(subkey)
+    y = 0
+    for i in range(0, len(data), BLOCK_SIZE_BYTES):
+        x = y ^ int.from_bytes(data[i: i + BLOCK_SIZE_BYTES], 'big')
+        y = 0
+        for table, shift in zip(tables, range(120, -8, -8)):
+            y ^= table[(x >> shift) & 0xFF]
+    return y.to_bytes(BLOCK_SIZE_BYTES, 'big')
 
-    if len(data) % BLOCK_SIZE_BYTES:
-        raise ValueError("Length of data should be %d bytes" % BLOCK_SIZE_BYTES)
 
-    last_y = [0] * BLOCK_SIZE_BYTES
-    for i in range(0, len(data), BLOCK_SIZE_BYTES):
-        block = data[i: i + BLOCK_SIZE_BYTES]
-        last_y = block_product(xor(last_y, block), subkey)
+def _native_gcm_decrypt_and_verify(data, key, tag, nonce):
+    """AES-GCM decryption of bytes without associated data"""
+    data, nonce = bytes(data), bytes(nonce)
+    hash_subkey = struct.pack('>4I', *_block_encryptor(key)(0, 0, 0, 0))
+    if len(nonce) == 12:
+        j0 = nonce + b'\x00\x00\x00\x01'
+    else:
+        j0 = _native_ghash(hash_subkey, _pad_to_blocks(nonce) + (8 * len(nonce)).to_bytes(16, 'big'))
 
-    return last_y
+    iv_ctr = ((int.from_bytes(j0, 'big') + 1) & ((1 << 128) - 1)).to_bytes(BLOCK_SIZE_BYTES, 'big')
+    decrypted_data = _native_ctr_crypt(data, key, iv_ctr)
+    s_tag = _native_ghash(hash_subkey, _pad_to_blocks(data) + (8 * len(data)).to_bytes(16, 'big'))
+    if bytes(tag) != _native_ctr_crypt(s_tag, key, j0):
+        raise ValueError('Mismatching authentication tag')
+    return decrypted_data
 
 
 __all__ = [
@@ -1,12 +1,19 @@
 import contextlib
+import email.utils
+import hashlib
+import http.client
+import io
 import json
 import os
 import re
 import shutil
+import tempfile
+import time
 import traceback
 import urllib.parse
+import urllib.response
 
-from .utils import expand_path, traverse_obj, version_tuple, write_json_file
+from .utils import expand_path, int_or_none, traverse_obj, version_tuple, write_json_file
 from .version import __version__
 
 
@@ -74,6 +81,20 @@ def load(self, section, key, dtype='json', default=None, *, min_ver=None):
 
         return default
 
+    def prune(self, section, keep):
+        """Remove all but the `keep` most recently stored entries of the section"""
+        if not self.enabled:
+            return
+
+        cache_dir = os.path.join(self._get_root_dir(), section)
+        with contextlib.suppress(OSError):
+            with os.scandir(cache_dir) as it:
+                entries = sorted((f for f in it if f.is_file()), key=lambda f: f.stat().st_mtime, reverse=True)
+            for f in entries[keep:]:
+                self._ydl.write_debug(f'Removing {section}.{f.name} from cache')
+                with contextlib.suppress(OSError):
+                    os.remove(f.path)
+
     def remove(self):
         if not self.enabled:
             self._ydl.to_screen('Cache is disabled (Did you combine --no-cache-dir and --rm-cache-dir?)')
@@ -89,3 +110,164 @@ def remove(self):
             self._ydl.to_screen('.', skip_eol=True)
             shutil.rmtree(cachedir)
         self._ydl.to_screen('.')
+
+
+class HTTPCache:
+    """
+    On-disk cache of the responses to the GET requests of the extractors
+
+    Stored responses are revalidated with If-None-Match/If-Modified-Since, unless
+    they are still fresh according to their Cache-Control/Expires headers.
+    The cookies sent with a request are part of its key, and responses that set
+    cookies or are private to the user are never stored.
+    The least recently used responses are evicted once the cache grows over
+    the size given by the "http_cache_size" param
+    """
+
+    _SECTION = 'http'
+    # The body is stored decoded
+    _DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+    _CONDITIONAL_HEADERS = ('If-none-match', 'If-modified-since')
+
+    def __init__(self, ydl):
+        self._ydl = ydl
+
+    @property
+    def enabled(self):
+        return self._ydl.cache.enabled and bool(self._ydl.params.get('http_cache_size'))
+
+    def _get_cache_fn(self, request):
+        key = hashlib.sha256(json.dumps([
+            request.get_method(), request.get_full_url(),
+            sorted(item for item in request.header_items() if item[0] not in self._CONDITIONAL_HEADERS),
+            # The cookies are only added to the request when it is sent
+            self._ydl.cookiejar.get_cookie_header(request.get_full_url()),
+        ]).encode()).hexdigest()
+        return os.path.join(self._ydl.cache._get_root_dir(), self._SECTION, key)
+
+    def load(self, request):
+        """Return the cached response to the request, or None"""
+        if not self.enabled or request.get_method() != 'GET':
+            return None
+        fn = self._get_cache_fn(request)
+        with contextlib.suppress(OSError, ValueError):
+            with open(f'{fn}.json', encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(f'{fn}.body', 'rb') as f:
+                entry['body'] = f.read()
+            # Used for evicting the least recently used responses
+            os.utime(f'{fn}.json')
+            return entry
+        return None
+
+    @staticmethod
+    def is_fresh(entry):
+        return (entry.get('fresh_until') or 0) > time.time()
+
+    @staticmethod
+    def _headers(items):
+        headers = http.client.HTTPMessage()
+        for name, value in items:
+            del headers[name]
+            headers[name] = value
+        return headers
+
+    @classmethod
+    def conditional_headers(cls, entry):
+        headers = cls._headers(entry['headers'])
+        return {name: headers[header] for name, header in (
+            ('If-None-Match', 'ETag'), ('If-Modified-Since', 'Last-Modified')) if headers.get(header)}
+
+    @staticmethod
+    def _freshness(headers):
+        """Return whether the response can be stored, and until when it is fresh"""
+        directives = {}
+        for directive in (headers.get('Cache-Control') or '').split(','):
+            name, _, value = directive.partition('=')
+            directives[name.strip().lower()] = value.strip().strip('"')
+        # The cookies of a cached response would never reach the cookiejar
+        if 'no-store' in directives or 'private' in directives or headers.get('Set-Cookie'):
+            return False, None
+        elif 'no-cache' in directives:
+            return True, None
+
+        now = time.time()
+        max_age = int_or_none(directives.get('max-age'))
+        if max_age is None:
+            expires, date = (
+                email.utils.parsedate_tz(headers.get(name) or '') for name in ('Expires', 'Date'))
+            if not expires:
+                return True, None
+            max_age = email.utils.mktime_tz(expires) - (email.utils.mktime_tz(date) if date else now)
+        return True, now + max_age - (int_or_none(headers.get('Age')) or 0)
+
+    def _write(self, fn, entry, body=None):
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        if body is not None:
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(fn), suffix='.tmp', delete=False) as f:
+                f.write(body)
+            os.replace(f.name, f'{fn}.body')
+        write_json_file(entry, f'{fn}.json')
+
+    def store(self, request, urlh):
+        """Store the response if it can be cached, and return a handle to read it again"""
+        body = urlh.read()
+        urlh.close()
+        headers = [(k, v) for k, v in urlh.headers.items() if k.lower() not in self._DROPPED_HEADERS]
+        entry = {'url': urlh.geturl(), 'status': urlh.getcode(), 'headers': headers}
+
+        storable, entry['fresh_until'] = self._freshness(urlh.headers)
+        if (self.enabled and request.get_method() == 'GET' and entry['status'] == 200 and storable
+                and (self.conditional_headers(entry) or self.is_fresh(entry))):
+            fn = self._get_cache_fn(request)
+            try:
+                self._write(fn, entry, body)
+                self._evict()
+            except Exception:
+                self._ydl.report_warning(f'Writing HTTP cache to {fn!r} failed: {traceback.format_exc()}')
+        return self.response({**entry, 'body': body})
+
+    def revalidated(self, request, entry, urlh):
+        """Update the cached response with the headers of a 304 response to the conditional request"""
+        urlh.close()
+        headers = self._headers([
+            *entry['headers'], *((k, v) for k, v in urlh.headers.items() if k.lower() not in self._DROPPED_HEADERS)])
+        entry = {**entry, 'headers': headers.items()}
+        storable, entry['fresh_until'] = self._freshness(headers)
+        fn = self._get_cache_fn(request)
+        if not storable:
+            self._remove(fn)
+        else:
+            with contextlib.suppress(OSError):
+                self._write(fn, {k: v for k, v in entry.items() if k != 'body'})
+        return self.response(entry)
+
+    @classmethod
+    def response(cls, entry):
+        return urllib.response.addinfourl(
+            io.BytesIO(entry['body']), cls._headers(entry['headers']), entry['url'], entry['status'])
+
+    def _evict(self):
+        cache_dir = os.path.join(self._ydl.cache._get_root_dir(), self._SECTION)
+        entries = {}
+        with os.scandir(cache_dir) as it:
+            for f in it:
+                key, ext = os.path.splitext(f.name)
+                if ext in ('.json', '.body'):
+                    with contextlib.suppress(OSError):
+                        stat = f.stat()
+                        size, mtime = entries.get(key, (0, 0))
+                        entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime) if ext == '.json' else mtime)
+
+        total = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self._ydl.params['http_cache_size']:
+                break
+            self._remove(os.path.join(cache_dir, key))
+            total -= size
+
+    @staticmethod
+    def _remove(fn):
+        for ext in ('.json', '.body'):
+            with contextlib.suppress(OSError):
+                os.remove(f'{fn}{ext}')
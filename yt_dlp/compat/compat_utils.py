@@ -81,3 +81,27 @@ def from_child(attr):
     parent.__class__ = EnhancedModule
     parent.__getattr__ = __getattr__
     return parent
+
+
+def lazy_attributes(module, attributes):
+    """
+    Import the attributes of a module from other modules only when they are first accessed
+
+    @param attributes   {attribute name: name of the module to import it from,
+                         relative to the package of the module, or a function that returns it}
+
+    NB: Unlike attribute access, lookups of global names inside the module itself
+    do not go through the module's __getattr__; the module has to import them locally
+    """
+    module = sys.modules[module]
+
+    def __getattr__(attr):
+        if attr not in attributes:
+            raise AttributeError(f'module {module.__name__} has no attribute {attr}')
+        source = attributes[attr]
+        ret = source() if callable(source) else getattr(importlib.import_module(source, module.__package__), attr)
+        setattr(module, attr, ret)
+        return ret
+
+    module.__getattr__ = __getattr__
+    return module
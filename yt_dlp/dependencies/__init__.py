@@ -2,6 +2,10 @@
 """Imports all optional dependencies for the project.
 An attribute "_yt_dlp__identifier" may be inserted into the module if it uses an ambiguous namespace"""
 
+import sys as _sys
+
+from ..compat.compat_utils import lazy_attributes as _lazy_attributes
+
 try:
     import brotlicffi as brotli
 except ImportError:
@@ -49,12 +53,15 @@
     sqlite3 = None
 
 
-try:
-    import websockets
-except (ImportError, SyntaxError):
-    # websockets 3.10 on python 3.6 causes SyntaxError
-    # See https://github.com/yt-dlp/yt-dlp/issues/2633
-    websockets = None
+def _import_websockets():
+    # websockets imports asyncio, which is slow to import; so it is only imported when it is used
+    try:
+        import websockets
+    except (ImportError, SyntaxError):
+        # websockets 3.10 on python 3.6 causes SyntaxError
+        # See https://github.com/yt-dlp/yt-dlp/issues/2633
+        return None
+    return websockets
 
 
 from ..websocket import WebSocket
@@ -71,8 +78,18 @@
 
 from . import Cryptodome
 
-all_dependencies = {k: v for k, v in globals().items() if not k.startswith('_')}
-available_dependencies = {k: v for k, v in all_dependencies.items() if v}
+_DEPENDENCY_NAMES = [*(k for k in globals() if not k.startswith('_')), 'websockets']
+
+
+def _all_dependencies():
+    return {name: getattr(_sys.modules[__name__], name) for name in _DEPENDENCY_NAMES}
+
+
+_lazy_attributes(__name__, {
+    'websockets': _import_websockets,
+    'all_dependencies': _all_dependencies,
+    'available_dependencies': lambda: {k: v for k, v in _all_dependencies().items() if v},
+})
 
 
 # Deprecated
@@ -82,5 +99,5 @@
 __all__ = [
     'all_dependencies',
     'available_dependencies',
-    *all_dependencies.keys(),
+    *_DEPENDENCY_NAMES,
 ]
@@ -1,7 +1,13 @@
+import sys
+
+from ..compat.compat_utils import lazy_attributes
 from ..utils import NO_DEFAULT, determine_protocol
 
 
 def get_suitable_downloader(info_dict, params={}, default=NO_DEFAULT, protocol=None, to_stdout=False):
+    from .dash import DashSegmentsFD
+    from .external import FFmpegFD
+
     info_dict['protocol'] = determine_protocol(info_dict)
     info_copy = info_dict.copy()
     info_copy['to_stdout'] = to_stdout
@@ -15,51 +21,69 @@ def get_suitable_downloader(info_dict, params={}, default=NO_DEFAULT, protocol=N
           and not (to_stdout and len(protocols) > 1)
           and set(protocols) == {'http_dash_segments_generator'}):
         return DashSegmentsFD
+    elif (len(protocols) > 1 and set(downloaders) == {DashSegmentsFD} and set(protocols) == {'http_dash_segments'}
+          and params.get('concurrent_format_downloads') and not to_stdout and not info_copy.get('is_live')
+          and not get_suitable_downloader(info_dict, params, None, protocol='dash_frag_urls')):
+        # The tracks are downloaded together by DashSegmentsFD
+        return DashSegmentsFD
     elif len(downloaders) == 1:
         return downloaders[0]
     return None
 
 
-# Some of these require get_suitable_downloader
-from .common import FileDownloader
-from .dash import DashSegmentsFD
-from .external import FFmpegFD, get_external_downloader
-from .f4m import F4mFD
-from .hls import HlsFD
-from .http import HttpFD
-from .ism import IsmFD
-from .mhtml import MhtmlFD
-from .niconico import NiconicoLiveFD
-from .rtmp import RtmpFD
-from .rtsp import RtspFD
-from .websocket import WebSocketFragmentFD
-from .youtube_live_chat import YoutubeLiveChatFD
-from .serial import SerialFD
-from .images import ImageSeriesFD
-
-PROTOCOL_MAP = {
-    'rtmp': RtmpFD,
-    'rtmpe': RtmpFD,
-    'rtmp_ffmpeg': FFmpegFD,
-    'ffmpeg': FFmpegFD,  # for backward compatibility with old code
-    'live_ffmpeg': FFmpegFD,
-    'm3u8_native': HlsFD,
-    'm3u8': FFmpegFD,
-    'mms': RtspFD,
-    'rtsp': RtspFD,
-    'f4m': F4mFD,
-    'http_dash_segments': DashSegmentsFD,
-    'http_dash_segments_generator': DashSegmentsFD,
-    'ism': IsmFD,
-    'mhtml': MhtmlFD,
-    'niconico_live': NiconicoLiveFD,
-    'websocket_frag': WebSocketFragmentFD,
-    'serial': SerialFD,
-    'image_series': ImageSeriesFD,
-    'youtube_live_chat': YoutubeLiveChatFD,
-    'youtube_live_chat_replay': YoutubeLiveChatFD,
+# The downloaders are only imported when they are first accessed
+_DOWNLOADERS = {
+    'FileDownloader': '.common',
+    'DashSegmentsFD': '.dash',
+    'FFmpegFD': '.external',
+    'get_external_downloader': '.external',
+    'F4mFD': '.f4m',
+    'HlsFD': '.hls',
+    'HttpFD': '.http',
+    'IsmFD': '.ism',
+    'MhtmlFD': '.mhtml',
+    'NiconicoLiveFD': '.niconico',
+    'RtmpFD': '.rtmp',
+    'RtspFD': '.rtsp',
+    'WebSocketFragmentFD': '.websocket',
+    'YoutubeLiveChatFD': '.youtube_live_chat',
+    'SerialFD': '.serial',
+    'ImageSeriesFD': '.images',
 }
 
+_PROTOCOLS = {
+    'rtmp': 'RtmpFD',
+    'rtmpe': 'RtmpFD',
+    'rtmp_ffmpeg': 'FFmpegFD',
+    'ffmpeg': 'FFmpegFD',  # for backward compatibility with old code
+    'live_ffmpeg': 'FFmpegFD',
+    'm3u8_native': 'HlsFD',
+    'm3u8': 'FFmpegFD',
+    'mms': 'RtspFD',
+    'rtsp': 'RtspFD',
+    'f4m': 'F4mFD',
+    'http_dash_segments': 'DashSegmentsFD',
+    'http_dash_segments_generator': 'DashSegmentsFD',
+    'ism': 'IsmFD',
+    'mhtml': 'MhtmlFD',
+    'niconico_live': 'NiconicoLiveFD',
+    'websocket_frag': 'WebSocketFragmentFD',
+    'serial': 'SerialFD',
+    'image_series': 'ImageSeriesFD',
+    'youtube_live_chat': 'YoutubeLiveChatFD',
+    'youtube_live_chat_replay': 'YoutubeLiveChatFD',
+}
+
+
+def _get_downloader(name):
+    return getattr(sys.modules[__name__], name)
+
+
+lazy_attributes(__name__, {
+    **_DOWNLOADERS,
+    'PROTOCOL_MAP': lambda: {protocol: _get_downloader(name) for protocol, name in _PROTOCOLS.items()},
+})
+
 # exceptions for --live-download-mkv
 # adding here will bypass protocol change
 LDM_EXCEPTIONS = (
@@ -96,6 +120,10 @@ def shorten_protocol_name(proto, simplify=False):
 
 def _get_suitable_downloader(info_dict, protocol, params, default):
     """Get the downloader class that can handle the info dict."""
+    from .external import FFmpegFD, get_external_downloader
+    from .hls import HlsFD
+    from .http import HttpFD
+
     if default is NO_DEFAULT:
         default = HttpFD
 
@@ -122,7 +150,9 @@ def _get_suitable_downloader(info_dict, protocol, params, default):
 
     if protocol in ('m3u8', 'm3u8_native'):
         if info_dict.get('is_live'):
-            return FFmpegFD
+            # Live playlists are only recorded natively when asked to
+            native = (external_downloader or '').lower() == 'native' or params.get('hls_prefer_native') is True
+            return HlsFD if native else FFmpegFD
         elif (external_downloader or '').lower() == 'native':
             return HlsFD
         elif protocol == 'm3u8_native' and get_suitable_downloader(
@@ -133,7 +163,7 @@ def _get_suitable_downloader(info_dict, protocol, params, default):
         elif params.get('hls_prefer_native') is False:
             return FFmpegFD
 
-    return PROTOCOL_MAP.get(protocol, default)
+    return _get_downloader(_PROTOCOLS[protocol]) if protocol in _PROTOCOLS else default
 
 
 __all__ = [
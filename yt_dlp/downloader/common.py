@@ -3,6 +3,7 @@
 import functools
 import random
 import re
+import threading
 import time
 
 from ..utils import (
@@ -27,6 +28,29 @@
 from .augment import AUGMENT_MAP
 
 
+class RateLimiter:
+    """
+    Download rate budget that is shared by the downloads that run at the same time
+
+    A download reserves the time its data takes at the given rate and sleeps
+    until the reservation starts. Up to a second of unused budget may be
+    caught up on, so that short stalls do not lower the average rate.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._available_at = time.monotonic()
+
+    def consume(self, byte_count):
+        with self._lock:
+            now = time.monotonic()
+            self._available_at = max(self._available_at, now - 1) + byte_count / self.rate
+            delay = self._available_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
 class FileDownloader(ShowsProgress):
     """File Downloader class.
 
@@ -41,7 +65,8 @@ class FileDownloader(ShowsProgress):
 
     verbose:            Print additional info to stdout.
     quiet:              Do not print messages to stdout.
-    ratelimit:          Download speed limit, in bytes/sec.
+    ratelimit:          Download speed limit, in bytes/sec. The limit applies to
+                        all the downloads of the YoutubeDL instance together
     continuedl:         Attempt to continue downloads if possible
     throttledratelimit: Assume the download is being throttled below this speed (bytes/sec)
     retries:            Number of times to retry for expected network errors.
@@ -74,6 +99,9 @@ class FileDownloader(ShowsProgress):
 
     _TEST_FILE_SIZE = 10241
     params = None
+    # (progress_idx, max_progress) when the progress is printed on a status shared with other downloads
+    _shared_progress = None
+    _rate_limiter_lock = threading.Lock()
 
     def __init__(self, ydl, params):
         """Create a FileDownloader object with the given options."""
@@ -126,6 +154,17 @@ def slow_down(self, start_time, now, byte_counter):
             if sleep_time > 0:
                 time.sleep(sleep_time)
 
+    def throttle(self, byte_count):
+        """Sleep if the downloads of the YoutubeDL instance are over the rate limit."""
+        rate_limit = self.params.get('ratelimit')
+        if not rate_limit or not byte_count:
+            return
+        with self._rate_limiter_lock:
+            limiter = getattr(self.ydl, '_rate_limiter', None)
+            if limiter is None or limiter.rate != rate_limit:
+                limiter = self.ydl._rate_limiter = RateLimiter(rate_limit)
+        limiter.consume(byte_count)
+
     def temp_name(self, filename):
         """Returns a temporary filename for the given filename."""
         if self.params.get('nopart', False) or filename == '-' or \
@@ -230,12 +269,12 @@ def download(self, filename, info_dict, subtitle=False):
         Return True on success and False otherwise
         """
 
-        nooverwrites_and_exists = (
-            not self.params.get('overwrites', True)
-            and self.ydl.exists(encodeFilename(filename))
-        )
-
         if not hasattr(filename, 'write'):
+            nooverwrites_and_exists = (
+                not self.params.get('overwrites', True)
+                and self.ydl.exists(encodeFilename(filename))
+            )
+
             continuedl_and_exists = (
                 self.params.get('continuedl', True)
                 and self.ydl.isfile(encodeFilename(filename))
@@ -272,9 +311,33 @@ def real_download(self, filename, info_dict):
         """Real download process. Redefine in subclasses."""
         raise NotImplementedError('This method must be implemented by subclasses')
 
+    def share_multiline_status(self, *downloaders):
+        """
+        Print the progress of this and the other downloaders on the lines of a single status,
+        so that they can download at the same time. The caller has to end the returned status
+        """
+        downloaders = (self, *downloaders)
+        self._prepare_multiline_status(len(downloaders))
+        for idx, fd in enumerate(downloaders):
+            if fd is not self:
+                fd._finish_multiline_status()
+                fd._multiline = self._multiline
+            fd._shared_progress = (idx, len(downloaders))
+        return self._multiline
+
+    def _prepare_multiline_status(self, lines=1):
+        if not self._shared_progress:
+            super()._prepare_multiline_status(lines)
+
+    def _finish_multiline_status(self):
+        if not self._shared_progress:
+            super()._finish_multiline_status()
+
     def _hook_progress(self, status, info_dict):
         # Ideally we want to make a copy of the dict, but that is too slow
         status['info_dict'] = info_dict
+        if self._shared_progress and status.get('progress_idx') is None:
+            status['progress_idx'], status['max_progress'] = self._shared_progress
         # youtube-dl passes the same status object to all the hooks.
         # Some third party scripts seems to be relying on this.
         # So keep this behavior if possible
@@ -1,9 +1,14 @@
+import base64
+import collections
 import concurrent.futures
 import contextlib
 import http.client
+import io
+import itertools
 import json
-import math
+import queue
 import struct
+import threading
 import time
 import urllib.error
 
@@ -28,6 +33,290 @@ def to_screen(self, *args, **kargs):
     to_console_title = to_screen
 
 
+if compat_os_name == 'nt':
+    def _future_result(future):
+        # future.result() can't be interrupted by Ctrl+C on Windows
+        while True:
+            try:
+                return future.result(0.1)
+            except KeyboardInterrupt:
+                raise
+            except concurrent.futures.TimeoutError:
+                continue
+else:
+    def _future_result(future):
+        return future.result()
+
+
+class FragmentScheduler:
+    """
+    Process-wide pool of fragment download workers.
+
+    Every concurrent fragment download opens a FragmentJob on the shared
+    scheduler instead of owning a thread pool. Idle workers take the next
+    queued fragment from the open jobs in round-robin order, so the workers of a
+    track (or a download) that runs out of fragments are handed over to the
+    ones that still have fragments left.
+    """
+
+    # Seconds an idle worker waits for new fragments before exiting
+    IDLE_TIMEOUT = 5
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._cond = threading.Condition()
+        # Jobs with queued fragments, in the order they will be served
+        self._jobs = collections.deque()
+        self._workers = self._idle = 0
+
+    @classmethod
+    def get(cls, max_workers):
+        """Get the shared scheduler, making sure it has at least max_workers workers"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(max_workers)
+            else:
+                cls._instance.max_workers = max(cls._instance.max_workers, max_workers)
+            return cls._instance
+
+    def open_job(self, limit=None):
+        """@param limit  Maximum number of fragments of the job to download at the same time"""
+        return FragmentJob(self, limit or self.max_workers)
+
+    def _enqueue(self, job, item):
+        with self._cond:
+            job._queue.append(item)
+            if job not in self._jobs:
+                self._jobs.append(job)
+            self._dispatch()
+
+    def _dispatch(self):
+        """Wake up or start a worker for the queued fragments. Must be called with _cond held"""
+        queued = sum(len(j._queue) for j in self._jobs)
+        if self._workers < self.max_workers and queued > self._idle:
+            self._workers += 1
+            threading.Thread(target=self._work, name='FragmentScheduler-%d' % self._workers, daemon=True).start()
+        else:
+            self._cond.notify()
+
+    def _next_task(self):
+        for _ in range(len(self._jobs)):
+            job = self._jobs.popleft()
+            if not job._queue:  # cancelled
+                continue
+            if job._running >= job.limit:
+                self._jobs.append(job)
+                continue
+            job._running += 1
+            item = job._queue.popleft()
+            if job._queue:
+                self._jobs.append(job)
+            return job, item
+        return None, None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                job, item = self._next_task()
+                if job is None:
+                    self._idle += 1
+                    self._cond.wait(self.IDLE_TIMEOUT)
+                    self._idle -= 1
+                    job, item = self._next_task()
+                    if job is None:
+                        self._workers -= 1
+                        return
+
+            future, func, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+            with self._cond:
+                job._running -= 1
+                if job._queue:
+                    # The job may have been held back by its limit
+                    self._cond.notify()
+
+
+class FragmentJob:
+    """A group of fragment downloads sharing the workers of a FragmentScheduler"""
+
+    def __init__(self, scheduler, limit):
+        self.scheduler = scheduler
+        self.limit = self.max_limit = limit
+        self._queue = collections.deque()
+        self._running = 0
+
+    def set_limit(self, limit):
+        """Change the number of fragments to download at the same time, between 1 and max_limit"""
+        with self.scheduler._cond:
+            limit, increased = min(max(limit, 1), self.max_limit), limit > self.limit
+            self.limit = limit
+            if increased and self._queue:
+                self.scheduler._dispatch()
+        return limit
+
+    def submit(self, func, *args):
+        future = concurrent.futures.Future()
+        self.scheduler._enqueue(self, (future, func, args))
+        return future
+
+    def map(self, func, iterable):
+        """
+        Like Executor.map, but only keeps a bounded number of calls queued ahead
+        of the consumer so that the other jobs are not starved
+        """
+        iterable = iter(iterable)
+        futures = collections.deque(
+            self.submit(func, item) for item in itertools.islice(iterable, 2 * self.max_limit))
+        try:
+            while futures:
+                result = _future_result(futures.popleft())
+                futures.extend(self.submit(func, item) for item in itertools.islice(iterable, 1))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def map_live(self, func, iterable):
+        """
+        Like map, but the items are taken from iterable in a thread of their own and submitted
+        as soon as they come, so that an iterable that blocks (e.g. a live playlist waiting
+        for its next reload) does not hold up the results of the items it already gave
+        """
+        futures, stopped = queue.Queue(), threading.Event()
+
+        def produce():
+            try:
+                for item in iterable:
+                    if stopped.is_set():
+                        return
+                    futures.put((self.submit(func, item), None))
+            except BaseException as e:
+                futures.put((None, e))
+            else:
+                futures.put((None, None))
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                try:
+                    # Waits in short steps, so that it can be interrupted by Ctrl+C on Windows
+                    future, error = futures.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if error is not None:
+                    raise error
+                elif future is None:
+                    return
+                yield _future_result(future)
+        finally:
+            stopped.set()
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    future, _ = futures.get_nowait()
+                    if future is not None:
+                        future.cancel()
+
+    def cancel(self):
+        """Cancel all the queued calls. Calls that are already running are not interrupted"""
+        with self.scheduler._cond:
+            while self._queue:
+                self._queue.popleft()[0].cancel()
+
+
+class AdaptiveConcurrency:
+    """
+    Adjusts the limit of a FragmentJob while it runs, AIMD-style.
+
+    The fragments are measured in rounds of as many fragments as the limit.
+    The limit is doubled after each round until the first sign of congestion
+    (slow start), and then raised by one per round as long as the throughput
+    keeps up. It is halved when the server signals that it is overloaded
+    (HTTP 429 or 5xx, unrecoverable HTTP errors, incomplete reads) or when
+    the fragments take much longer than the extra concurrency explains,
+    and lowered by one when raising it made the throughput drop.
+    """
+
+    # Throughput drop after an increase that is still counted as noise
+    RATE_TOLERANCE = 0.1
+    # How much slower than the fastest round a fragment may get, after
+    # accounting for the concurrency, before the limit is halved
+    LATENCY_FACTOR = 4
+
+    def __init__(self, job, initial=2):
+        self.job = job
+        self._lock = threading.Lock()
+        self._slow_start, self._increased = True, False
+        self._prev_rate = None
+        # (median fragment download time, limit) of the round with the lowest time per fragment
+        self._base_latency = None
+        self._decreased_at = 0
+        self.job.set_limit(initial)
+        self._start_round()
+
+    @staticmethod
+    def is_congestion(err):
+        if isinstance(err, urllib.error.HTTPError):
+            return err.code == 429 or err.code >= 500
+        return isinstance(err, (UnrecoverableHttpError, http.client.IncompleteRead))
+
+    def _start_round(self):
+        self._round_start = time.monotonic()
+        self._round_bytes, self._round_times = 0, []
+
+    def _set_limit(self, limit, congestion=False):
+        if congestion:
+            self._slow_start = False
+            self._decreased_at = time.monotonic()
+        old_limit = self.job.limit
+        self._increased = self.job.set_limit(limit) > old_limit
+        self._start_round()
+
+    def report_success(self, size, elapsed):
+        """Account a fragment of size bytes that was downloaded in elapsed seconds"""
+        with self._lock:
+            self._round_bytes += size or 0
+            self._round_times.append(elapsed)
+            limit = self.job.limit
+            if len(self._round_times) < limit:
+                return
+            rate = self._round_bytes / max(time.monotonic() - self._round_start, 1e-3)
+            latency = sorted(self._round_times)[len(self._round_times) // 2]
+            if not self._base_latency or latency / limit < self._base_latency[0] / self._base_latency[1]:
+                self._base_latency = (latency, limit)
+            base_latency, base_limit = self._base_latency
+
+            if latency > self.LATENCY_FACTOR * base_latency * max(limit / base_limit, 1):
+                self._set_limit(limit // 2, congestion=True)
+            elif self._increased and rate < self._prev_rate * (1 - self.RATE_TOLERANCE):
+                self._set_limit(limit - 1, congestion=True)
+            else:
+                self._set_limit(limit * 2 if self._slow_start else limit + 1)
+            self._prev_rate = rate
+
+    def report_error(self, err):
+        """Account a failed attempt to download a fragment"""
+        if not self.is_congestion(err):
+            return
+        with self._lock:
+            # The fragments that were already running when the limit was lowered
+            # are likely to fail as well; don't lower it again for them
+            cooldown = max(self._base_latency[0] if self._base_latency else 0, 1)
+            if time.monotonic() - self._decreased_at < cooldown:
+                return
+            self._set_limit(self.job.limit // 2, congestion=True)
+            self._prev_rate = None
+
+
 class FragmentFD(FileDownloader):
     """
     A base file downloader class for fragmented media (e.g. f4m/m3u8 manifests).
@@ -40,15 +329,26 @@ class FragmentFD(FileDownloader):
                         Skip unavailable fragments (DASH and hlsnative only)
     keep_fragments:     Keep downloaded fragments on disk after downloading is
                         finished
-    concurrent_fragment_downloads:  The number of threads to use for native hls and dash downloads
+    concurrent_fragment_downloads:  The number of threads to use for native hls and dash downloads.
+                        The threads are shared by all the formats being downloaded
+                        (see FragmentScheduler)
+    adaptive_fragment_concurrency: Adjust the number of fragments that are
+                        downloaded at the same time to the throughput and
+                        the errors, up to concurrent_fragment_downloads
+                        (see AdaptiveConcurrency)
+    fragment_memory_budget: Keep the fragments in memory instead of writing
+                        each of them to a temporary file. This is the maximum
+                        number of bytes of fragments that finished out of order
+                        to hold in memory; the ones over it are spilled to disk.
+                        Ignored with keep_fragments
     _no_ytdl_file:      Don't use .ytdl file
 
     For each incomplete fragment download yt-dlp keeps on disk a special
     bookkeeping file with download state and metadata (in future such files will
     be used for any incomplete download handled by yt-dlp). This file is
     used to properly handle resuming, check download file consistency and detect
-    potential errors. The file has a .ytdl extension and represents a standard
-    JSON file of the following format:
+    potential errors. The file has a .ytdl extension and its first line is
+    a standard JSON object of the following format:
 
     extractor:
         Dictionary of extractor related data. TBD.
@@ -58,12 +358,37 @@ class FragmentFD(FileDownloader):
             current_fragment:
                 Dictionary with current (being downloaded) fragment data:
                 index:  0-based index of current fragment among all fragments
+                offset: Size of the destination file after appending the
+                        fragments before the current one
+            completed_fragments:
+                Fragments after the current one that are already downloaded
+                to their own temporary files:
+                bitmap: Base64 encoded bitmap in which bit N (LSB first) is set
+                        if the fragment with 1-based index N is complete
+                sizes:  List of the sizes of these fragments, in the order
+                        of the set bits
             fragment_count:
                 Total count of fragments
+            extra_state:
+                Downloader specific state
+
+    Instead of rewriting the whole file as the download progresses, the
+    changes are appended to it as JSON objects, one per line:
+
+    {"completed": N, "size": S}
+                Fragment N has been downloaded to a temporary file of S bytes
+    {"appended": N, "offset": O, "extra_state": ...}
+                All the fragments up to N have been appended to the destination
+                file, which is now O bytes long. extra_state is optional
+
+    The file is compacted into the first line again every
+    _YTDL_FILE_COMPACT_INTERVAL changes.
 
     This feature is experimental and file format may change in future.
     """
 
+    _YTDL_FILE_COMPACT_INTERVAL = 256
+
     def report_retry_fragment(self, err, frag_index, count, retries):
         self.deprecation_warning('yt_dlp.downloader.FragmentFD.report_retry_fragment is deprecated. '
                                  'Use yt_dlp.downloader.FileDownloader.report_retry instead')
@@ -88,16 +413,64 @@ def _read_ytdl_file(self, ctx):
         assert 'ytdl_corrupt' not in ctx
         stream, _ = self.sanitize_open(self.ytdl_filename(ctx['filename']), 'r')
         try:
-            ytdl_data = json.loads(stream.read())
+            ytdl_data, *records = stream.read().splitlines()
+            ytdl_data = json.loads(ytdl_data)
             ctx['fragment_index'] = ytdl_data['downloader']['current_fragment']['index']
+            ctx['fragment_dest_offset'] = ytdl_data['downloader']['current_fragment'].get('offset')
+            ctx['completed_fragments'] = self._decode_completed_fragments(
+                ytdl_data['downloader'].get('completed_fragments'))
             if 'extra_state' in ytdl_data['downloader']:
                 ctx['extra_state'] = ytdl_data['downloader']['extra_state']
+            for record in records:
+                try:
+                    record = json.loads(record)
+                except json.JSONDecodeError:
+                    # The last change was not completely written
+                    break
+                self._apply_ytdl_record(ctx, record)
         except Exception:
             ctx['ytdl_corrupt'] = True
         finally:
             stream.close()
 
+    @staticmethod
+    def _apply_ytdl_record(ctx, record):
+        if 'completed' in record:
+            ctx['completed_fragments'][record['completed']] = record['size']
+        elif 'appended' in record:
+            ctx['fragment_index'] = record['appended']
+            ctx['fragment_dest_offset'] = record['offset']
+            if 'extra_state' in record:
+                ctx['extra_state'] = record['extra_state']
+            for frag_index in [i for i in ctx['completed_fragments'] if i <= record['appended']]:
+                del ctx['completed_fragments'][frag_index]
+
+    @staticmethod
+    def _encode_completed_fragments(completed_fragments):
+        indices = sorted(completed_fragments)
+        bitmap = bytearray(indices[-1] // 8 + 1 if indices else 0)
+        for frag_index in indices:
+            bitmap[frag_index // 8] |= 1 << (frag_index % 8)
+        return {
+            'bitmap': base64.b64encode(bitmap).decode('ascii'),
+            'sizes': [completed_fragments[frag_index] for frag_index in indices],
+        }
+
+    @staticmethod
+    def _decode_completed_fragments(data):
+        if not data:
+            return {}
+        bitmap = base64.b64decode(data['bitmap'])
+        indices = (i for i in range(len(bitmap) * 8) if bitmap[i // 8] & (1 << (i % 8)))
+        return dict(zip(indices, data['sizes']))
+
+    def _close_ytdl_file(self, ctx):
+        ytdl_stream = ctx.pop('ytdl_stream', None)
+        if ytdl_stream:
+            ytdl_stream.close()
+
     def _write_ytdl_file(self, ctx):
+        self._close_ytdl_file(ctx)
         frag_index_stream, _ = self.sanitize_open(self.ytdl_filename(ctx['filename']), 'w')
         try:
             downloader = {
@@ -105,13 +478,55 @@ def _write_ytdl_file(self, ctx):
                     'index': ctx['fragment_index'],
                 },
             }
+            if ctx.get('fragment_dest_offset') is not None:
+                downloader['current_fragment']['offset'] = ctx['fragment_dest_offset']
+            if ctx.get('completed_fragments'):
+                downloader['completed_fragments'] = self._encode_completed_fragments(ctx['completed_fragments'])
             if 'extra_state' in ctx:
                 downloader['extra_state'] = ctx['extra_state']
             if ctx.get('fragment_count') is not None:
                 downloader['fragment_count'] = ctx['fragment_count']
-            frag_index_stream.write(json.dumps({'downloader': downloader}))
+            frag_index_stream.write(json.dumps({'downloader': downloader}) + '\n')
         finally:
             frag_index_stream.close()
+        ctx['ytdl_records'] = 0
+
+    def _update_ytdl_file(self, ctx, record):
+        """Record a change of the download state in the .ytdl file"""
+        if not self.__do_ytdl_file(ctx):
+            return
+        with ctx['ytdl_lock']:
+            self._apply_ytdl_record(ctx, record)
+            if ctx.get('ytdl_records', 0) >= self._YTDL_FILE_COMPACT_INTERVAL:
+                self._write_ytdl_file(ctx)
+                return
+            if not ctx.get('ytdl_stream'):
+                ctx['ytdl_stream'], _ = self.sanitize_open(self.ytdl_filename(ctx['filename']), 'a')
+            ctx['ytdl_stream'].write(json.dumps(record) + '\n')
+            ctx['ytdl_stream'].flush()
+            ctx['ytdl_records'] += 1
+
+    def _restore_fragment(self, ctx, frag_index):
+        """Use the fragment downloaded before the download was interrupted, if it is still intact"""
+        size = ctx.get('completed_fragments', {}).get(frag_index)
+        if not size:
+            return False
+        fragment_filename = '%s-Frag%d' % (ctx['tmpfilename'], frag_index)
+        if self.filesize_or_none(fragment_filename) != size:
+            if self.ydl.isfile(encodeFilename(fragment_filename)):
+                self.try_remove(encodeFilename(fragment_filename))
+            return False
+        ctx['fragment_filename_sanitized'] = fragment_filename
+        ctx['dl']._hook_progress({
+            'status': 'finished',
+            'filename': fragment_filename,
+            'total_bytes': size,
+            'ctx_id': ctx.get('ctx_id'),
+        }, {})
+        return True
+
+    def _fragments_in_memory(self):
+        return bool(self.params.get('fragment_memory_budget')) and not self.params.get('keep_fragments', False)
 
     def _download_fragment(self, ctx, frag_url, info_dict, headers=None, request_data=None):
         fragment_filename = '%s-Frag%d' % (ctx['tmpfilename'], ctx['fragment_index'])
@@ -123,19 +538,36 @@ def _download_fragment(self, ctx, frag_url, info_dict, headers=None, request_dat
             'unrecoverable_http_error': info_dict.get('unrecoverable_http_error'),
         }
         frag_resume_len = 0
-        if ctx['dl'].params.get('continuedl', True):
+        in_memory = self._fragments_in_memory()
+        if ctx['dl'].params.get('continuedl', True) and not in_memory:
             frag_resume_len = self.filesize_or_none(self.temp_name(fragment_filename))
         fragment_info_dict['frag_resume_len'] = ctx['frag_resume_len'] = frag_resume_len
 
-        success, _ = ctx['dl'].download(fragment_filename, fragment_info_dict)
+        frag_buffer = io.BytesIO() if in_memory else None
+        success, _ = ctx['dl'].download(frag_buffer or fragment_filename, fragment_info_dict)
         if not success:
             return False
         if fragment_info_dict.get('filetime'):
             ctx['fragment_filetime'] = fragment_info_dict.get('filetime')
-        ctx['fragment_filename_sanitized'] = fragment_filename
+        if in_memory:
+            ctx['fragment_content'] = frag_buffer.getvalue()
+        else:
+            ctx['fragment_filename_sanitized'] = fragment_filename
         return True
 
+    def _spill_fragment(self, ctx):
+        """Move the in-memory content of the fragment to a temporary file"""
+        fragment_filename = '%s-Frag%d' % (ctx['tmpfilename'], ctx['fragment_index'])
+        stream, tmp_fragment_filename = self.sanitize_open(self.temp_name(fragment_filename), 'wb')
+        with stream:
+            stream.write(ctx.pop('fragment_content'))
+        # An existing fragment file is assumed to be complete on resume
+        self.try_rename(tmp_fragment_filename, fragment_filename)
+        ctx['fragment_filename_sanitized'] = fragment_filename
+
     def _read_fragment(self, ctx):
+        if 'fragment_content' in ctx:
+            return ctx.pop('fragment_content')
         if not ctx.get('fragment_filename_sanitized'):
             return None
         try:
@@ -154,10 +586,13 @@ def _append_fragment(self, ctx, frag_content):
             ctx['dest_stream'].flush()
         finally:
             if self.__do_ytdl_file(ctx):
-                self._write_ytdl_file(ctx)
-            if not self.params.get('keep_fragments', False):
-                self.try_remove(encodeFilename(ctx['fragment_filename_sanitized']))
-            del ctx['fragment_filename_sanitized']
+                record = {'appended': ctx['fragment_index'], 'offset': ctx['dest_stream'].tell()}
+                if 'extra_state' in ctx:
+                    record['extra_state'] = ctx['extra_state']
+                self._update_ytdl_file(ctx, record)
+            fragment_filename = ctx.pop('fragment_filename_sanitized', None)
+            if fragment_filename and not self.params.get('keep_fragments', False):
+                self.try_remove(encodeFilename(fragment_filename))
 
     def _prepare_frag_download(self, ctx):
         if not ctx.setdefault('live', False):
@@ -174,6 +609,8 @@ def _prepare_frag_download(self, ctx):
             'noprogress': True,
             'test': False,
             'throttledratelimit': 0,
+            # The fragments are already downloaded concurrently
+            'http_connections': 1,
         })
         tmpfilename = self.temp_name(ctx['filename'])
         open_mode = 'wb'
@@ -182,11 +619,14 @@ def _prepare_frag_download(self, ctx):
         resume_len = self.filesize_or_none(tmpfilename)
         if resume_len > 0:
             open_mode = 'ab'
+        truncate_to = None
 
         # Should be initialized before ytdl file check
         ctx.update({
             'tmpfilename': tmpfilename,
             'fragment_index': 0,
+            'completed_fragments': {},
+            'ytdl_lock': threading.Lock(),
         })
 
         if self.__do_ytdl_file(ctx):
@@ -195,7 +635,9 @@ def _prepare_frag_download(self, ctx):
             if continuedl and ytdl_file_exists:
                 self._read_ytdl_file(ctx)
                 is_corrupt = ctx.get('ytdl_corrupt') is True
-                is_inconsistent = ctx['fragment_index'] > 0 and resume_len == 0
+                dest_offset = ctx.get('fragment_dest_offset')
+                is_inconsistent = (ctx['fragment_index'] > 0 and resume_len == 0
+                                   or dest_offset is not None and resume_len < dest_offset)
                 if is_corrupt or is_inconsistent:
                     message = (
                         '.ytdl file is corrupt' if is_corrupt else
@@ -203,19 +645,36 @@ def _prepare_frag_download(self, ctx):
                     self.report_warning(
                         '%s. Restarting from the beginning ...' % message)
                     ctx['fragment_index'] = resume_len = 0
+                    ctx['completed_fragments'] = {}
+                    ctx.pop('fragment_dest_offset', None)
                     if 'ytdl_corrupt' in ctx:
                         del ctx['ytdl_corrupt']
                     self._write_ytdl_file(ctx)
+                else:
+                    if dest_offset is not None and resume_len > dest_offset:
+                        # Interrupted while appending a fragment
+                        resume_len = dest_offset
+                        truncate_to = dest_offset
+                    if ctx['completed_fragments']:
+                        self.to_screen(
+                            f'[{self.FD_NAME}] Resuming with {len(ctx["completed_fragments"])} '
+                            'fragments already downloaded')
+                    # Compact the changes of the previous run
+                    self._write_ytdl_file(ctx)
 
             else:
                 if not continuedl:
                     if ytdl_file_exists:
                         self._read_ytdl_file(ctx)
                     ctx['fragment_index'] = resume_len = 0
+                    ctx['completed_fragments'] = {}
+                    ctx.pop('fragment_dest_offset', None)
                 self._write_ytdl_file(ctx)
                 assert ctx['fragment_index'] == 0
 
         dest_stream, tmpfilename = self.sanitize_open(tmpfilename, open_mode)
+        if truncate_to is not None:
+            dest_stream.truncate(truncate_to)
 
         ctx.update({
             'dl': dl,
@@ -244,10 +703,11 @@ def _start_frag_download(self, ctx, info_dict):
         ctx.update({
             'started': start,
             'fragment_started': start,
-            # Amount of fragment's bytes downloaded by the time of the previous
-            # frag progress hook invocation
-            'prev_frag_downloaded_bytes': 0,
         })
+        # Bytes downloaded so far of each fragment in flight, keyed by the id of its info_dict.
+        # With concurrent fragment downloads, the hook is called from several worker threads at once
+        frags_in_flight = {}
+        lock = threading.Lock()
 
         def frag_progress_hook(s):
             if s['status'] not in ('downloading', 'finished'):
@@ -262,34 +722,36 @@ def frag_progress_hook(s):
             state['max_progress'] = ctx.get('max_progress')
             state['progress_idx'] = ctx.get('progress_idx')
 
-            time_now = time.time()
-            state['elapsed'] = time_now - start
-            frag_total_bytes = s.get('total_bytes') or 0
             s['fragment_info_dict'] = s.pop('info_dict', {})
-            if not ctx['live']:
-                estimated_size = (
-                    (ctx['complete_frags_downloaded_bytes'] + frag_total_bytes)
-                    / (state['fragment_index'] + 1) * total_frags)
-                state['total_bytes_estimate'] = estimated_size
-
-            if s['status'] == 'finished':
-                state['fragment_index'] += 1
-                ctx['fragment_index'] = state['fragment_index']
-                state['downloaded_bytes'] += frag_total_bytes - ctx['prev_frag_downloaded_bytes']
-                ctx['complete_frags_downloaded_bytes'] = state['downloaded_bytes']
-                ctx['speed'] = state['speed'] = self.calc_speed(
-                    ctx['fragment_started'], time_now, frag_total_bytes)
-                ctx['fragment_started'] = time.time()
-                ctx['prev_frag_downloaded_bytes'] = 0
-            else:
-                frag_downloaded_bytes = s['downloaded_bytes']
-                state['downloaded_bytes'] += frag_downloaded_bytes - ctx['prev_frag_downloaded_bytes']
+            frag_key = id(s['fragment_info_dict'])
+            frag_total_bytes = s.get('total_bytes') or 0
+            with lock:
+                time_now = time.time()
+                state['elapsed'] = time_now - start
+                prev_frag_downloaded_bytes = frags_in_flight.pop(frag_key, 0)
+                if not ctx['live']:
+                    estimated_size = (
+                        (ctx['complete_frags_downloaded_bytes'] + frag_total_bytes)
+                        / (state['fragment_index'] + 1) * total_frags)
+                    state['total_bytes_estimate'] = estimated_size
+
+                if s['status'] == 'finished':
+                    state['fragment_index'] += 1
+                    if not ctx.get('concurrent'):
+                        # Concurrent downloads advance the index when the fragment is appended
+                        ctx['fragment_index'] = state['fragment_index']
+                    state['downloaded_bytes'] += frag_total_bytes - prev_frag_downloaded_bytes
+                    ctx['complete_frags_downloaded_bytes'] += frag_total_bytes
+                else:
+                    frag_downloaded_bytes = frags_in_flight[frag_key] = s['downloaded_bytes']
+                    state['downloaded_bytes'] += frag_downloaded_bytes - prev_frag_downloaded_bytes
+
+                # Speed and ETA of all the fragments together, not only of the reporting one
                 ctx['speed'] = state['speed'] = self.calc_speed(
-                    ctx['fragment_started'], time_now, frag_downloaded_bytes - ctx.get('frag_resume_len', 0))
+                    start, time_now, state['downloaded_bytes'] - resume_len)
                 if not ctx['live']:
                     state['eta'] = self.calc_eta(state['speed'], estimated_size - state['downloaded_bytes'])
-                ctx['prev_frag_downloaded_bytes'] = frag_downloaded_bytes
-            self._hook_progress(state, info_dict)
+                self._hook_progress(state, info_dict)
 
         ctx['dl'].add_progress_hook(frag_progress_hook)
 
@@ -297,6 +759,7 @@ def frag_progress_hook(s):
 
     def _finish_frag_download(self, ctx, info_dict):
         ctx['dest_stream'].close()
+        self._close_ytdl_file(ctx)
         if self.__do_ytdl_file(ctx):
             ytdl_filename = encodeFilename(self.ytdl_filename(ctx['filename']))
             if self.ydl.isfile(ytdl_filename):
@@ -389,34 +852,15 @@ def download_and_append_fragments_multiple(self, *args, **kwargs):
         max_progress = len(args)
         if max_progress == 1:
             return self.download_and_append_fragments(*args[0], **kwargs)
-        max_workers = self.params.get('concurrent_fragment_downloads', 1)
         if max_progress > 1:
             self._prepare_multiline_status(max_progress)
         is_live = any(traverse_obj(args, (..., 2, 'is_live')))
 
-        def thread_func(idx, ctx, fragments, info_dict, tpe):
+        def thread_func(idx, ctx, fragments, info_dict):
             ctx['max_progress'] = max_progress
             ctx['progress_idx'] = idx
             return self.download_and_append_fragments(
-                ctx, fragments, info_dict, **kwargs, tpe=tpe, interrupt_trigger=interrupt_trigger)
-
-        class FTPE(concurrent.futures.ThreadPoolExecutor):
-            # has to stop this or it's going to wait on the worker thread itself
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                pass
-
-        if compat_os_name == 'nt':
-            def future_result(future):
-                while True:
-                    try:
-                        return future.result(0.1)
-                    except KeyboardInterrupt:
-                        raise
-                    except concurrent.futures.TimeoutError:
-                        continue
-        else:
-            def future_result(future):
-                return future.result()
+                ctx, fragments, info_dict, **kwargs, interrupt_trigger=interrupt_trigger)
 
         def interrupt_trigger_iter(fg):
             for f in fg:
@@ -424,16 +868,18 @@ def interrupt_trigger_iter(fg):
                     break
                 yield f
 
+        # These threads only append the fragments in order;
+        # the fragments themselves are downloaded by the shared FragmentScheduler
         spins = []
         for idx, (ctx, fragments, info_dict) in enumerate(args):
-            tpe = FTPE(math.ceil(max_workers / max_progress))
-            job = tpe.submit(thread_func, idx, ctx, interrupt_trigger_iter(fragments), info_dict, tpe)
+            tpe = concurrent.futures.ThreadPoolExecutor(1)
+            job = tpe.submit(thread_func, idx, ctx, interrupt_trigger_iter(fragments), info_dict)
             spins.append((tpe, job))
 
         result = True
         for tpe, job in spins:
             try:
-                result = result and future_result(job)
+                result = result and _future_result(job)
             except KeyboardInterrupt:
                 interrupt_trigger[0] = False
             finally:
@@ -448,10 +894,12 @@ def download_and_append_fragments(
             self, ctx, fragments, info_dict, *, is_fatal=(lambda idx: False),
             pack_func=(lambda content, idx: content), finish_func=None,
             tpe=None, interrupt_trigger=(True, )):
+        # tpe is ignored; concurrent fragments are downloaded by the shared FragmentScheduler
 
         bad_status_code = info_dict.get('unrecoverable_http_error') or tuple()
         if not self.params.get('skip_unavailable_fragments', True):
             is_fatal = lambda _: True
+        concurrency = None
 
         def download_fragment(fragment, ctx):
             if not interrupt_trigger[0]:
@@ -464,6 +912,9 @@ def download_fragment(fragment, ctx):
             if byte_range:
                 headers['Range'] = 'bytes=%d-%d' % (byte_range['start'], byte_range['end'] - 1)
 
+            if self._restore_fragment(ctx, frag_index):
+                return
+
             # Never skip the first fragment
             fatal = is_fatal(fragment.get('index') or (frag_index - 1))
 
@@ -472,13 +923,21 @@ def error_callback(err, count, retries):
                     ctx['dest_stream'].close()
                 self.report_retry(err, count, retries, frag_index, fatal)
                 ctx['last_error'] = err
+                if concurrency:
+                    concurrency.report_error(err)
 
             for retry in RetryManager(self.params.get('fragment_retries'), error_callback):
                 try:
                     ctx['fragment_count'] = fragment.get('fragment_count')
+                    start = time.monotonic()
                     if not self._download_fragment(
                             ctx, fragment['url'], info_dict, headers, info_dict.get('request_data')):
                         return
+                    if concurrency:
+                        concurrency.report_success(
+                            len(ctx['fragment_content']) if 'fragment_content' in ctx
+                            else self.filesize_or_none(ctx['fragment_filename_sanitized']),
+                            time.monotonic() - start)
                 except (urllib.error.HTTPError, http.client.IncompleteRead) as err:
                     if isinstance(err, urllib.error.HTTPError) and err.code in bad_status_code:
                         retry.error = UnrecoverableHttpError()
@@ -502,30 +961,64 @@ def append_fragment(frag_content, frag_index, ctx):
 
         decrypt_fragment = self.decrypter(info_dict)
 
-        max_workers = math.ceil(
-            self.params.get('concurrent_fragment_downloads', 1) / ctx.get('max_progress', 1))
+        max_workers = self.params.get('concurrent_fragment_downloads', 1)
         if max_workers > 1:
+            memory_budget = self.params.get('fragment_memory_budget') or 0
+            # Bytes of downloaded fragments waiting in memory to be appended
+            memory_used, memory_lock = [0], threading.Lock()
+
+            def hold_in_memory(frag_content):
+                with memory_lock:
+                    if memory_used[0] + len(frag_content) > memory_budget:
+                        return False
+                    memory_used[0] += len(frag_content)
+                    return True
+
             def _download_fragment(fragment):
                 ctx_copy = ctx.copy()
+                # Don't pick up the fragment that is being appended
+                ctx_copy.pop('fragment_content', None)
+                ctx_copy.pop('fragment_filename_sanitized', None)
                 download_fragment(fragment, ctx_copy)
                 ctx['fragment_count'] = ctx_copy.get('fragment_count')
-                return fragment, fragment['frag_index'], ctx_copy.get('fragment_filename_sanitized')
-
-            self.report_warning('The download speed shown is only of one thread. This is a known issue')
-            with tpe or concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
-                try:
-                    for fragment, frag_index, frag_filename in pool.map(_download_fragment, fragments):
-                        ctx.update({
-                            'fragment_filename_sanitized': frag_filename,
-                            'fragment_index': frag_index,
-                        })
-                        if not append_fragment(decrypt_fragment(fragment, self._read_fragment(ctx)), frag_index, ctx):
-                            return False
-                except KeyboardInterrupt:
-                    self._finish_multiline_status()
-                    self.report_error(
-                        'Interrupted by user. Waiting for all threads to shutdown...', is_error=False, tb=False)
-                    pool.shutdown(wait=False)
+                frag_content = ctx_copy.get('fragment_content')
+                if frag_content is not None and not hold_in_memory(frag_content):
+                    self._spill_fragment(ctx_copy)
+                    frag_content = None
+                frag_filename = ctx_copy.get('fragment_filename_sanitized')
+                if frag_filename and fragment['frag_index'] not in ctx['completed_fragments']:
+                    # Remember the fragments finished ahead of the appended ones across interruptions
+                    self._update_ytdl_file(ctx, {
+                        'completed': fragment['frag_index'],
+                        'size': self.filesize_or_none(frag_filename),
+                    })
+                return (fragment, fragment['frag_index'],
+                        ctx_copy.get('fragment_filename_sanitized'), frag_content)
+
+            ctx['concurrent'] = True
+            job = FragmentScheduler.get(max_workers).open_job(max_workers)
+            if self.params.get('adaptive_fragment_concurrency'):
+                concurrency = AdaptiveConcurrency(job)
+            try:
+                # A live playlist is reloaded while the fragments it already gave are downloaded and appended
+                job_map = job.map_live if info_dict.get('is_live') else job.map
+                for fragment, frag_index, frag_filename, frag_content in job_map(_download_fragment, fragments):
+                    ctx.update({
+                        'fragment_filename_sanitized': frag_filename,
+                        'fragment_index': frag_index,
+                    })
+                    if frag_content is not None:
+                        ctx['fragment_content'] = frag_content
+                        with memory_lock:
+                            memory_used[0] -= len(frag_content)
+                    if not append_fragment(decrypt_fragment(fragment, self._read_fragment(ctx)), frag_index, ctx):
+                        return False
+            except KeyboardInterrupt:
+                self._finish_multiline_status()
+                self.report_error(
+                    'Interrupted by user. Waiting for all threads to shutdown...', is_error=False, tb=False)
+                job.cancel()
+                if not info_dict.get('is_live'):
                     raise
         else:
             for fragment in fragments:
@@ -1,6 +1,8 @@
 import binascii
+import http.client
 import io
 import re
+import time
 import urllib.parse
 
 from . import get_suitable_downloader
@@ -9,7 +11,9 @@
 from .. import webvtt
 from ..dependencies import Cryptodome
 from ..utils import (
+    RetryManager,
     bug_reports_message,
+    float_or_none,
     parse_m3u8_attributes,
     remove_start,
     traverse_obj,
@@ -23,6 +27,8 @@ class HlsFD(FragmentFD):
     Download segments in a m3u8 manifest. External downloaders can take over
     the fragment downloads by supporting the 'm3u8_frag_urls' protocol and
     re-defining 'supports_manifest' function
+
+    Live playlists (is_live) are reloaded while they are recorded, until they end
     """
 
     FD_NAME = 'hlsnative'
@@ -54,11 +60,69 @@ def can_download(manifest, info_dict, allow_unplayable_formats=False):
             ]
 
         def check_results():
-            yield not info_dict.get('is_live')
             for feature in UNSUPPORTED_FEATURES:
                 yield not re.search(feature, manifest)
         return all(check_results())
 
+    # Reloads of a live playlist without new fragments, in target durations, before giving up
+    _LIVE_IDLE_LIMIT = 6
+
+    def _live_fragments(self, fragments, manifest, man_url, info_dict, parse_fragments, frag_index):
+        """
+        Yield the fragments of a live playlist as they are added to it,
+        reloading the playlist until it has EXT-X-ENDLIST
+
+        Fragments already seen are recognized by their media sequence number,
+        and a jump in it means that fragments were removed before they could be downloaded
+        """
+        last_sequence = None
+        idle_since = time.monotonic()
+        while True:
+            media_fragments = [f for f in fragments if not f.get('is_init')]
+            if last_sequence is None:
+                new_fragments = fragments
+            else:
+                new_fragments = [f for f in media_fragments if f['media_sequence'] > last_sequence]
+                missed = new_fragments and new_fragments[0]['media_sequence'] - last_sequence - 1
+                if missed:
+                    self.report_warning(
+                        f'[{self.FD_NAME}] {missed} fragments were removed from the playlist before they could be downloaded')
+            for fragment in new_fragments:
+                frag_index += 1
+                fragment['frag_index'] = frag_index
+                yield fragment
+            if media_fragments:
+                last_sequence = max(last_sequence or 0, media_fragments[-1]['media_sequence'])
+
+            if re.search(r'(?m)^#EXT-X-ENDLIST', manifest):
+                return
+            target_duration = float_or_none(traverse_obj(
+                re.search(r'#EXT-X-TARGETDURATION:(\d+(?:\.\d+)?)', manifest), 1)) or 10
+            if new_fragments:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since > self._LIVE_IDLE_LIMIT * target_duration:
+                self.report_warning(
+                    f'[{self.FD_NAME}] The playlist has not been updated for {int(time.monotonic() - idle_since)}s; '
+                    'assuming that the stream has ended')
+                return
+            # RFC 8216, 6.3.4: wait for the target duration after a change, and half of it otherwise
+            time.sleep(target_duration if new_fragments else target_duration / 2)
+
+            for retry in RetryManager(self.params.get('fragment_retries'), self.report_retry, fatal=False):
+                try:
+                    urlh = self.ydl.urlopen(self._prepare_url(info_dict, man_url))
+                    man_url = urlh.geturl()
+                    manifest = urlh.read().decode('utf-8', 'ignore')
+                except (OSError, http.client.HTTPException) as err:
+                    retry.error = err
+                    continue
+            if retry.error:
+                self.report_warning(f'[{self.FD_NAME}] Unable to reload the playlist; stopping the recording')
+                return
+            fragments = parse_fragments(manifest, man_url)
+            if fragments is None:
+                return
+
     def real_download(self, filename, info_dict):
         man_url = info_dict['url']
         self.to_screen('[%s] Downloading m3u8 manifest' % self.FD_NAME)
@@ -75,7 +139,7 @@ def real_download(self, filename, info_dict):
                 can_download, message = False, 'The stream has AES-128 encryption and pycryptodomex is not available'
             elif no_crypto:
                 message = ('The stream has AES-128 encryption and neither ffmpeg nor pycryptodomex are available; '
-                           'Decryption will be performed natively, but will be extremely slow')
+                           'Decryption will be performed natively, but will be slow')
             elif info_dict.get('extractor_key') == 'Generic' and re.search(r'(?m)#EXT-X-MEDIA-SEQUENCE:(?!0$)', s):
                 install_ffmpeg = '' if has_ffmpeg else 'install ffmpeg and '
                 message = ('Live HLS streams are not supported by the native downloader. If this is a livestream, '
@@ -97,9 +161,11 @@ def real_download(self, filename, info_dict):
         elif message:
             self.report_warning(message)
 
+        is_live = bool(info_dict.get('is_live'))
         is_webvtt = info_dict['ext'] == 'vtt'
-        if is_webvtt:
-            real_downloader = None  # Packing the fragments is not currently supported for external downloader
+        if is_webvtt or is_live:
+            # Packing the fragments and refreshing the playlist are not currently supported for external downloader
+            real_downloader = None
         else:
             real_downloader = get_suitable_downloader(
                 info_dict, self.params, None, protocol='m3u8_frag_urls', to_stdout=(filename == '-'))
@@ -116,8 +182,6 @@ def is_ad_fragment_end(s):
             return (s.startswith('#ANVATO-SEGMENT-INFO') and 'type=master' in s
                     or s.startswith('#UPLYNK-SEGMENT') and s.endswith(',segment'))
 
-        fragments = []
-
         media_frags = 0
         ad_frags = 0
         ad_frag_next = False
@@ -138,8 +202,9 @@ def is_ad_fragment_end(s):
 
         ctx = {
             'filename': filename,
-            'fragment_count': media_frags,
+            'fragment_count': None if is_live else media_frags,
             'ad_frags': ad_frags,
+            'live': is_live,
         }
 
         if real_downloader:
@@ -154,9 +219,6 @@ def is_ad_fragment_end(s):
         extra_param_to_segment_url = info_dict.get('extra_param_to_segment_url')
         if extra_param_to_segment_url:
             extra_query = urllib.parse.parse_qs(extra_param_to_segment_url)
-        i = 0
-        media_sequence = 0
-        decrypt_info = {'METHOD': 'NONE'}
         external_aes_key = traverse_obj(info_dict, ('hls_aes', 'key'))
         if external_aes_key:
             external_aes_key = binascii.unhexlify(remove_start(external_aes_key, '0x'))
@@ -164,101 +226,115 @@ def is_ad_fragment_end(s):
         external_aes_iv = traverse_obj(info_dict, ('hls_aes', 'iv'))
         if external_aes_iv:
             external_aes_iv = binascii.unhexlify(remove_start(external_aes_iv, '0x').zfill(32))
-        byte_range = {}
-        discontinuity_count = 0
-        frag_index = 0
-        ad_frag_next = False
-        for line in s.splitlines():
-            line = line.strip()
-            if line:
-                if not line.startswith('#'):
-                    if format_index and discontinuity_count != format_index:
-                        continue
-                    if ad_frag_next:
-                        continue
-                    frag_index += 1
-                    if frag_index <= ctx['fragment_index']:
-                        continue
-                    frag_url = urljoin(man_url, line)
-                    if extra_query:
-                        frag_url = update_url_query(frag_url, extra_query)
-
-                    fragments.append({
-                        'frag_index': frag_index,
-                        'url': frag_url,
-                        'decrypt_info': decrypt_info,
-                        'byte_range': byte_range,
-                        'media_sequence': media_sequence,
-                    })
-                    media_sequence += 1
-
-                elif line.startswith('#EXT-X-MAP'):
-                    if format_index and discontinuity_count != format_index:
-                        continue
-                    if frag_index > 0:
-                        self.report_error(
-                            'Initialization fragment found after media fragments, unable to download')
-                        return False
-                    frag_index += 1
-                    map_info = parse_m3u8_attributes(line[11:])
-                    frag_url = urljoin(man_url, map_info.get('URI'))
-                    if extra_query:
-                        frag_url = update_url_query(frag_url, extra_query)
-
-                    if map_info.get('BYTERANGE'):
-                        splitted_byte_range = map_info.get('BYTERANGE').split('@')
+
+        def parse_fragments(s, man_url):
+            """Get the fragments of the playlist, without their frag_index; None on error"""
+            fragments = []
+            media_sequence = 0
+            decrypt_info = {'METHOD': 'NONE'}
+            byte_range = {}
+            discontinuity_count = 0
+            ad_frag_next = False
+            for line in s.splitlines():
+                line = line.strip()
+                if line:
+                    if not line.startswith('#'):
+                        if format_index and discontinuity_count != format_index:
+                            continue
+                        if ad_frag_next:
+                            continue
+                        frag_url = urljoin(man_url, line)
+                        if extra_query:
+                            frag_url = update_url_query(frag_url, extra_query)
+
+                        fragments.append({
+                            'url': frag_url,
+                            'decrypt_info': decrypt_info,
+                            'byte_range': byte_range,
+                            'media_sequence': media_sequence,
+                        })
+                        media_sequence += 1
+
+                    elif line.startswith('#EXT-X-MAP'):
+                        if format_index and discontinuity_count != format_index:
+                            continue
+                        if fragments:
+                            self.report_error(
+                                'Initialization fragment found after media fragments, unable to download')
+                            return None
+                        map_info = parse_m3u8_attributes(line[11:])
+                        frag_url = urljoin(man_url, map_info.get('URI'))
+                        if extra_query:
+                            frag_url = update_url_query(frag_url, extra_query)
+
+                        if map_info.get('BYTERANGE'):
+                            splitted_byte_range = map_info.get('BYTERANGE').split('@')
+                            sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
+                            byte_range = {
+                                'start': sub_range_start,
+                                'end': sub_range_start + int(splitted_byte_range[0]),
+                            }
+
+                        fragments.append({
+                            'url': frag_url,
+                            'decrypt_info': decrypt_info,
+                            'byte_range': byte_range,
+                            'media_sequence': media_sequence,
+                            'is_init': True,
+                        })
+                        media_sequence += 1
+
+                    elif line.startswith('#EXT-X-KEY'):
+                        decrypt_url = decrypt_info.get('URI')
+                        decrypt_info = parse_m3u8_attributes(line[11:])
+                        if decrypt_info['METHOD'] == 'AES-128':
+                            if external_aes_iv:
+                                decrypt_info['IV'] = external_aes_iv
+                            elif 'IV' in decrypt_info:
+                                decrypt_info['IV'] = binascii.unhexlify(decrypt_info['IV'][2:].zfill(32))
+                            if external_aes_key:
+                                decrypt_info['KEY'] = external_aes_key
+                            else:
+                                decrypt_info['URI'] = urljoin(man_url, decrypt_info['URI'])
+                                if extra_query:
+                                    decrypt_info['URI'] = update_url_query(decrypt_info['URI'], extra_query)
+                                if decrypt_url != decrypt_info['URI']:
+                                    decrypt_info['KEY'] = None
+
+                    elif line.startswith('#EXT-X-MEDIA-SEQUENCE'):
+                        media_sequence = int(line[22:])
+                    elif line.startswith('#EXT-X-BYTERANGE'):
+                        splitted_byte_range = line[17:].split('@')
                         sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
                         byte_range = {
                             'start': sub_range_start,
                             'end': sub_range_start + int(splitted_byte_range[0]),
                         }
-
-                    fragments.append({
-                        'frag_index': frag_index,
-                        'url': frag_url,
-                        'decrypt_info': decrypt_info,
-                        'byte_range': byte_range,
-                        'media_sequence': media_sequence
-                    })
-                    media_sequence += 1
-
-                elif line.startswith('#EXT-X-KEY'):
-                    decrypt_url = decrypt_info.get('URI')
-                    decrypt_info = parse_m3u8_attributes(line[11:])
-                    if decrypt_info['METHOD'] == 'AES-128':
-                        if external_aes_iv:
-                            decrypt_info['IV'] = external_aes_iv
-                        elif 'IV' in decrypt_info:
-                            decrypt_info['IV'] = binascii.unhexlify(decrypt_info['IV'][2:].zfill(32))
-                        if external_aes_key:
-                            decrypt_info['KEY'] = external_aes_key
-                        else:
-                            decrypt_info['URI'] = urljoin(man_url, decrypt_info['URI'])
-                            if extra_query:
-                                decrypt_info['URI'] = update_url_query(decrypt_info['URI'], extra_query)
-                            if decrypt_url != decrypt_info['URI']:
-                                decrypt_info['KEY'] = None
-
-                elif line.startswith('#EXT-X-MEDIA-SEQUENCE'):
-                    media_sequence = int(line[22:])
-                elif line.startswith('#EXT-X-BYTERANGE'):
-                    splitted_byte_range = line[17:].split('@')
-                    sub_range_start = int(splitted_byte_range[1]) if len(splitted_byte_range) == 2 else byte_range['end']
-                    byte_range = {
-                        'start': sub_range_start,
-                        'end': sub_range_start + int(splitted_byte_range[0]),
-                    }
-                elif is_ad_fragment_start(line):
-                    ad_frag_next = True
-                elif is_ad_fragment_end(line):
-                    ad_frag_next = False
-                elif line.startswith('#EXT-X-DISCONTINUITY'):
-                    discontinuity_count += 1
-                i += 1
+                    elif is_ad_fragment_start(line):
+                        ad_frag_next = True
+                    elif is_ad_fragment_end(line):
+                        ad_frag_next = False
+                    elif line.startswith('#EXT-X-DISCONTINUITY'):
+                        discontinuity_count += 1
+            return fragments
+
+        fragments = parse_fragments(s, man_url)
+        if fragments is None:
+            return False
+        if is_live:
+            # The fragments are numbered in the order they are appended;
+            # a resumed recording continues after the fragments it already has
+            ctx['completed_fragments'] = {}
+            fragments = self._live_fragments(
+                fragments, s, man_url, info_dict, parse_fragments, ctx['fragment_index'])
+        else:
+            for frag_index, fragment in enumerate(fragments, 1):
+                fragment['frag_index'] = frag_index
+            fragments = [fragment for fragment in fragments if fragment['frag_index'] > ctx['fragment_index']]
 
         # We only download the first fragment during the test
         if self.params.get('test', False):
-            fragments = [fragments[0] if fragments else None]
+            fragments = [next(iter(fragments), None)]
 
         if real_downloader:
             info_dict['fragments'] = fragments
@@ -1,13 +1,18 @@
+import concurrent.futures
 import http.client
+import json
 import random
 import socket
 import ssl
+import threading
 import time
 import urllib.error
 
 from .common import FileDownloader
+from ..compat import compat_os_name
 from ..utils import (
     ContentTooShortError,
+    DownloadError,
     RetryManager,
     ThrottledDownload,
     UnrecoverableHttpError,
@@ -17,6 +22,7 @@
     int_or_none,
     parse_http_range,
     sanitized_Request,
+    timeconvert,
     try_call,
     write_xattr,
 )
@@ -31,6 +37,27 @@
 
 
 class HttpFD(FileDownloader):
+    """
+    File downloader for plain HTTP(S) URLs.
+
+    filename may also be a writable binary file object (e.g. io.BytesIO),
+    in which case the data is written into it instead of a file on disk
+
+    Available options:
+
+    http_connections:   Number of connections to download the file with.
+                        When more than 1, the file is split into byte ranges
+                        which are downloaded in parallel into a preallocated
+                        .part file (if the server supports range requests)
+    """
+
+    # Ranges are not split further than this when rebalancing the connections
+    _MIN_RANGE_SIZE = 1024 * 1024
+    # Blocks larger than this are trimmed so that the writes end at multiples of it in the file
+    _WRITE_ALIGNMENT = 4096
+    # Read the response into a reusable buffer instead of allocating each block
+    _USE_READINTO = True
+
     def real_download(self, filename, info_dict):
         url = info_dict['url']
         request_data = info_dict.get('request_data', None)
@@ -43,7 +70,8 @@ class DownloadContext(dict):
 
         ctx = DownloadContext()
         ctx.filename = filename
-        ctx.tmpfilename = self.temp_name(filename)
+        ctx.to_buffer = hasattr(filename, 'write')
+        ctx.tmpfilename = filename if ctx.to_buffer else self.temp_name(filename)
         ctx.stream = None
 
         # Disable compression
@@ -66,7 +94,19 @@ class DownloadContext(dict):
         # parse given Range
         req_start, req_end, _ = parse_http_range(headers.get('Range'))
 
-        if self.params.get('continuedl', True):
+        connections = self.params.get('http_connections') or 1
+        # A download that was started with several connections has a preallocated .part file,
+        # so it must not be resumed by the single connection code below
+        if (not is_test and not ctx.to_buffer and ctx.tmpfilename != '-'
+                and request_data is None and req_start is None and req_end is None
+                and (connections > 1 or self.params.get('continuedl', True) and self.ydl.isfile(
+                    encodeFilename(self.ytdl_filename(filename))))):
+            success = self._download_ranges(
+                filename, ctx.tmpfilename, info_dict, headers, connections)
+            if success is not None:
+                return success
+
+        if self.params.get('continuedl', True) and not ctx.to_buffer:
             # Establish possible resume length
             if self.ydl.isfile(encodeFilename(ctx.tmpfilename)):
                 ctx.resume_len = self.ydl.getsize(
@@ -211,7 +251,7 @@ def establish_connection():
 
         def close_stream():
             if ctx.stream is not None:
-                if not ctx.tmpfilename == '-':
+                if not ctx.tmpfilename == '-' and not ctx.to_buffer:
                     ctx.stream.close()
                 ctx.stream = None
 
@@ -246,22 +286,31 @@ def download():
 
             byte_counter = 0 + ctx.resume_len
             block_size = ctx.block_size
+            readinto = getattr(ctx.data, 'readinto', None) if self._USE_READINTO else None
+            buffer = memoryview(bytearray(0))
             start = time.time()
 
-            # measure time over whole while-loop, so slow_down() and best_block_size() work together properly
-            now = None  # needed for slow_down() in the first loop run
+            # measure time over whole while-loop, so throttle() and best_block_size() work together properly
             before = start  # start measuring
 
             def retry(e):
                 close_stream()
-                ctx.resume_len = (byte_counter if ctx.tmpfilename == '-'
+                ctx.resume_len = (byte_counter if ctx.tmpfilename == '-' or ctx.to_buffer
                                   else self.ydl.getsize(encodeFilename(ctx.tmpfilename)))
                 raise RetryDownload(e)
 
             while True:
+                read_size = block_size if not is_test else min(block_size, data_len - byte_counter)
+                if read_size > self._WRITE_ALIGNMENT:
+                    read_size -= (byte_counter + read_size) % self._WRITE_ALIGNMENT
                 try:
                     # Download and write
-                    data_block = ctx.data.read(block_size if not is_test else min(block_size, data_len - byte_counter))
+                    if readinto:
+                        if len(buffer) < read_size:
+                            buffer = memoryview(bytearray(read_size))
+                        data_block = buffer[:readinto(buffer[:read_size])]
+                    else:
+                        data_block = ctx.data.read(read_size)
                 except RESPONSE_READ_EXCEPTIONS as err:
                     retry(err)
 
@@ -272,7 +321,12 @@ def retry(e):
                     break
 
                 # Open destination file just in time
-                if ctx.stream is None:
+                if ctx.stream is None and ctx.to_buffer:
+                    ctx.stream = ctx.tmpfilename
+                    if ctx.open_mode == 'wb':
+                        ctx.stream.seek(0)
+                        ctx.stream.truncate()
+                elif ctx.stream is None:
                     try:
                         ctx.stream, ctx.tmpfilename = self.sanitize_open(
                             ctx.tmpfilename, ctx.open_mode)
@@ -299,7 +353,7 @@ def retry(e):
                     return False
 
                 # Apply rate limit
-                self.slow_down(start, now, byte_counter - ctx.resume_len)
+                self.throttle(len(data_block))
 
                 # end measuring of one loop run
                 now = time.time()
@@ -339,8 +393,7 @@ def retry(e):
                     if ctx.throttle_start is None:
                         ctx.throttle_start = now
                     elif now - ctx.throttle_start > 3:
-                        if ctx.stream is not None and ctx.tmpfilename != '-':
-                            ctx.stream.close()
+                        close_stream()
                         raise ThrottledDownload()
                 elif speed:
                     ctx.throttle_start = None
@@ -354,18 +407,21 @@ def retry(e):
                 self.to_stderr('\n')
                 self.report_error('Did not get any data blocks')
                 return False
-            if ctx.tmpfilename != '-':
+            if ctx.tmpfilename != '-' and not ctx.to_buffer:
                 ctx.stream.close()
 
             if data_len is not None and byte_counter != data_len:
                 err = ContentTooShortError(byte_counter, int(data_len))
                 retry(err)
 
-            self.try_rename(ctx.tmpfilename, ctx.filename)
+            if ctx.to_buffer:
+                info_dict['filetime'] = timeconvert(ctx.data.info().get('last-modified', None)) or None
+            else:
+                self.try_rename(ctx.tmpfilename, ctx.filename)
 
-            # Update file modification time
-            if self.params.get('updatetime', True):
-                info_dict['filetime'] = self.try_utime(ctx.filename, ctx.data.info().get('last-modified', None))
+                # Update file modification time
+                if self.params.get('updatetime', True):
+                    info_dict['filetime'] = self.try_utime(ctx.filename, ctx.data.info().get('last-modified', None))
 
             self._hook_progress({
                 'downloaded_bytes': byte_counter,
@@ -395,3 +451,223 @@ def retry(e):
                 close_stream()
                 raise
         return False
+
+    def _download_ranges(self, filename, tmpfilename, info_dict, headers, connections):
+        """
+        Download the file over several connections at once, each of them fetching a byte range.
+        Returns None if the server does not support it
+        """
+        url = info_dict['url']
+        ytdl_filename = self.ytdl_filename(filename)
+        ranges = None  # list of [position, end] of the parts of the file left to download
+
+        has_state = self.params.get('continuedl', True) and self.ydl.isfile(encodeFilename(ytdl_filename))
+        if has_state:
+            try:
+                with open(encodeFilename(ytdl_filename), encoding='utf-8') as f:
+                    state = json.load(f)['downloader']['http_ranges']
+                if self.filesize_or_none(tmpfilename) == state['size']:
+                    ranges = state['ranges']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        elif self.filesize_or_none(tmpfilename):
+            # Resume the download that was started with a single connection
+            return None
+
+        def fall_back():
+            if has_state:
+                # The single connection download would take the preallocated .part file as complete
+                self.to_screen('[download] Unable to resume the download with several connections, restarting it')
+                self.try_remove(encodeFilename(tmpfilename))
+                self.try_remove(encodeFilename(ytdl_filename))
+            return None
+
+        try:
+            probe = self.ydl.urlopen(sanitized_Request(url, None, {**headers, 'Range': 'bytes=0-0'}))
+        except (urllib.error.URLError, *RESPONSE_READ_EXCEPTIONS) as err:
+            if has_state:
+                self.report_error(f'Unable to resume the download: {err}')
+                return False
+            return None
+        with probe:
+            _, _, size = parse_http_range(probe.headers.get('Content-Range'))
+            last_modified = probe.headers.get('Last-Modified')
+            if probe.status != 206 or not size or probe.headers.get('Content-Encoding'):
+                return fall_back()
+        if size < 2 * self._MIN_RANGE_SIZE:
+            return fall_back()
+
+        min_data_len, max_data_len = self.params.get('min_filesize'), self.params.get('max_filesize')
+        if min_data_len is not None and size < min_data_len:
+            self.to_screen(
+                f'\r[download] File is smaller than min-filesize ({size} bytes < {min_data_len} bytes). Aborting.')
+            return False
+        if max_data_len is not None and size > max_data_len:
+            self.to_screen(
+                f'\r[download] File is larger than max-filesize ({size} bytes > {max_data_len} bytes). Aborting.')
+            return False
+
+        progress = {'state_written': time.time(), 'throttle_start': None}
+
+        def write_state():
+            with open(encodeFilename(ytdl_filename), 'w', encoding='utf-8') as f:
+                json.dump({'downloader': {'http_ranges': {
+                    'size': size,
+                    'ranges': [r for r in ranges if r[0] < r[1]],
+                }}}, f)
+            progress['state_written'] = time.time()
+
+        if ranges is None:
+            range_size = -(-size // connections)
+            ranges = [[start, min(start + range_size, size)] for start in range(0, size, range_size)]
+            # The state is written first, so that there is never a preallocated .part file without it
+            write_state()
+            stream, tmpfilename = self.sanitize_open(tmpfilename, 'wb')
+            with stream:
+                stream.truncate(size)
+        else:
+            self.report_resuming_byte(size - sum(end - pos for pos, end in ranges))
+        self.report_destination(filename)
+        if self.params.get('xattr_set_filesize', False):
+            try:
+                write_xattr(tmpfilename, 'user.ytdl.filesize', str(size).encode())
+            except (XAttrUnavailableError, XAttrMetadataError) as err:
+                self.report_error('unable to set filesize xattr: %s' % str(err))
+
+        lock = threading.Lock()
+        interrupted = threading.Event()
+        resume_len = downloaded = size - sum(end - pos for pos, end in ranges)
+        start = time.time()
+        block_size = self.params.get('buffersize', 1024)
+
+        def report_progress():
+            now = time.time()
+            speed = self.calc_speed(start, now, downloaded - resume_len)
+            self._hook_progress({
+                'status': 'downloading',
+                'downloaded_bytes': downloaded,
+                'total_bytes': size,
+                'tmpfilename': tmpfilename,
+                'filename': filename,
+                'eta': self.calc_eta(start, now, size - resume_len, downloaded - resume_len),
+                'speed': speed,
+                'elapsed': now - start,
+                'ctx_id': info_dict.get('ctx_id'),
+            }, info_dict)
+            if now - progress['state_written'] > 1:
+                write_state()
+            if speed and speed < (self.params.get('throttledratelimit') or 0):
+                if progress['throttle_start'] is None:
+                    progress['throttle_start'] = now
+                elif now - progress['throttle_start'] > 3:
+                    raise ThrottledDownload()
+            elif speed:
+                progress['throttle_start'] = None
+
+        def fetch_range(rng, stream):
+            nonlocal downloaded
+            with lock:
+                pos, end = rng
+            if pos >= end:
+                return
+            data = self.ydl.urlopen(sanitized_Request(url, None, {**headers, 'Range': f'bytes={pos}-{end - 1}'}))
+            with data:
+                if parse_http_range(data.headers.get('Content-Range'))[0] != pos:
+                    raise DownloadError('The server does not support range requests consistently')
+                readinto = getattr(data, 'readinto', None) if self._USE_READINTO else None
+                buffer = memoryview(bytearray(block_size))
+                stream.seek(pos)
+                while not interrupted.is_set():
+                    data_block = buffer[:readinto(buffer)] if readinto else data.read(block_size)
+                    with lock:
+                        # The end of the range may have been taken over by another connection
+                        data_block = data_block[:rng[1] - rng[0]]
+                        if not data_block:
+                            break
+                        stream.write(data_block)
+                        rng[0] += len(data_block)
+                        downloaded += len(data_block)
+                        report_progress()
+                        if rng[0] >= rng[1]:
+                            break
+                    # The rate limit applies to all the connections together
+                    self.throttle(len(data_block))
+            with lock:
+                if rng[0] < rng[1] and not interrupted.is_set():
+                    raise ContentTooShortError(rng[0], rng[1])
+
+        def take_over_range():
+            # Split the range with the most data left, so that a slow or stalled
+            # connection does not hold up the whole download
+            with lock:
+                rng = max(ranges, key=lambda r: r[1] - r[0])
+                left = rng[1] - rng[0]
+                if left < 2 * self._MIN_RANGE_SIZE:
+                    return None
+                new_range = [rng[0] + left // 2, rng[1]]
+                rng[1] = new_range[0]
+                ranges.append(new_range)
+                return new_range
+
+        def worker(rng=None):
+            # Unbuffered, so that the saved state never gets ahead of the file
+            with open(encodeFilename(tmpfilename), 'r+b', buffering=0) as stream:
+                while not interrupted.is_set():
+                    rng = rng or take_over_range()
+                    if not rng:
+                        break
+                    for retry in RetryManager(self.params.get('retries'), self.report_retry):
+                        try:
+                            fetch_range(rng, stream)
+                        except (urllib.error.URLError, ContentTooShortError, *RESPONSE_READ_EXCEPTIONS) as err:
+                            if isinstance(err, urllib.error.HTTPError) and not 500 <= err.code < 600:
+                                raise
+                            retry.error = err
+                    rng = None
+
+        if compat_os_name == 'nt':
+            def future_result(future):
+                while True:
+                    try:
+                        return future.result(0.1)
+                    except concurrent.futures.TimeoutError:
+                        continue
+        else:
+            def future_result(future):
+                return future.result()
+
+        self.write_debug(f'Downloading {size} bytes with {connections} connections')
+        with concurrent.futures.ThreadPoolExecutor(connections) as pool:
+            # Any connection left over starts by taking over a part of another range
+            futures = [pool.submit(worker, rng) for rng in list(ranges)]
+            futures.extend(pool.submit(worker) for _ in range(connections - len(futures)))
+            try:
+                for future in futures:
+                    future_result(future)
+            except BaseException:
+                interrupted.set()
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                with lock:
+                    write_state()
+
+        if any(pos < end for pos, end in ranges):
+            self.report_error(f'Downloaded {downloaded} bytes, expected {size} bytes')
+            return False
+
+        self.try_remove(encodeFilename(ytdl_filename))
+        self.try_rename(tmpfilename, filename)
+        if self.params.get('updatetime', True):
+            info_dict['filetime'] = self.try_utime(filename, last_modified)
+
+        self._hook_progress({
+            'downloaded_bytes': size,
+            'total_bytes': size,
+            'filename': filename,
+            'status': 'finished',
+            'elapsed': time.time() - start,
+            'ctx_id': info_dict.get('ctx_id'),
+        }, info_dict)
+        return True
@@ -26,6 +26,16 @@ def gen_selfhosted_extractor_classes() -> 'List[Type[SelfHostedInfoExtractor]]':
     return _SELFHOSTED_CLASSES
 
 
+def get_extractor_host_index():
+    """
+    Return the index of the extractors by the hostnames they match,
+    or None if it is not available (the lazy extractors are not in use)
+    """
+    from .extractors import _HOST_INDEX
+
+    return _HOST_INDEX
+
+
 def gen_extractors():
     """ Return a list of an instance of every supported extractor.
     The order does matter; the first extractor matched is the one handling the URL.
@@ -0,0 +1,233 @@
+import itertools
+import re
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+class _Unindexable(Exception):
+    pass
+
+
+# Placeholder for a part of the URL that is not a fixed string, and whether it can contain a "/"
+_WILDCARD, _SLASH_WILDCARD = '\0', '\2'
+# Placeholder for the end of the URL
+_END = '\1'
+# Characters that end the hostname
+_HOST_END = '/?#:' + _END
+_SCHEME_RE = re.compile(r'(?:[a-z][a-z0-9+.-]*:)?//')
+# More alternatives than this in a single pattern are not worth indexing
+_MAX_ALTERNATIVES = 4096
+
+
+def _category_matches_slash(category):
+    # "/" is not a digit, a word character nor a space
+    return str(category).startswith('CATEGORY_NOT_')
+
+
+def _matches_slash(op, av):
+    if op == sre_parse.ANY:
+        return True
+    elif op == sre_parse.NOT_LITERAL:
+        return av != ord('/')
+    elif op == sre_parse.CATEGORY:
+        return _category_matches_slash(av)
+    elif op == sre_parse.IN:
+        negate = bool(av) and av[0][0] == sre_parse.NEGATE
+        for item_op, item_av in av[negate:]:
+            if (item_op == sre_parse.LITERAL and item_av == ord('/')
+                    or item_op == sre_parse.RANGE and item_av[0] <= ord('/') <= item_av[1]
+                    or item_op == sre_parse.CATEGORY and _category_matches_slash(item_av)):
+                return not negate
+        return negate
+    return True
+
+
+def _is_complete(prefix):
+    """Whether the hostname (or the lack of it) is already known from the prefix of the URL"""
+    scheme_end = prefix.find('//')
+    if scheme_end == -1:
+        # Either the pattern can only match URLs that start with the literal prefix,
+        # or it is followed to the end to find out whether it can match a hostname at all
+        return bool(re.search(rf'[{_SLASH_WILDCARD}{_END}]|/(?!/|$)', prefix))
+    return any(c in _HOST_END for c in prefix[scheme_end + 2:])
+
+
+def _expand(pattern, prefixes):
+    """Expand the parsed pattern into all the prefixes of the URLs that it can match"""
+    for op, av in pattern:
+        done = {p for p in prefixes if _is_complete(p)}
+        prefixes = prefixes - done
+        if not prefixes:
+            return done
+
+        # URLs are matched case-insensitively, which also keeps [yY][oO][uU]... from multiplying the alternatives
+        if op == sre_parse.LITERAL:
+            prefixes = {p + chr(av).lower() for p in prefixes}
+        elif op == sre_parse.IN and len(av) <= 4 and all(item_op == sre_parse.LITERAL for item_op, _ in av):
+            prefixes = {p + chr(c).lower() for p in prefixes for _, c in av}
+        elif op in (sre_parse.ANY, sre_parse.NOT_LITERAL, sre_parse.IN, sre_parse.CATEGORY):
+            wildcard = _SLASH_WILDCARD if _matches_slash(op, av) else _WILDCARD
+            prefixes = {p + wildcard for p in prefixes}
+        elif op == sre_parse.SUBPATTERN:
+            prefixes = _expand(av[-1], prefixes)
+        elif op == getattr(sre_parse, 'ATOMIC_GROUP', None):
+            prefixes = _expand(av, prefixes)
+        elif op == sre_parse.BRANCH:
+            prefixes = set(itertools.chain.from_iterable(_expand(alt, prefixes) for alt in av[1]))
+        elif op == sre_parse.GROUPREF_EXISTS:
+            # Either branch of the conditional
+            prefixes = set(itertools.chain.from_iterable(
+                _expand(branch, prefixes) if branch else prefixes for branch in av[1:]))
+        elif op == sre_parse.GROUPREF:
+            prefixes = {p + _SLASH_WILDCARD for p in prefixes}
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, 'POSSESSIVE_REPEAT', None)):
+            min_count, max_count, item = av
+            if max_count == 1:
+                repeated = _expand(item, prefixes)
+            elif max_count:
+                # The repetition is not expanded, but a subdomain wildcard like (?:[^/]+\.)+ is kept as such
+                once = _expand(item, {''})
+                wildcard = _SLASH_WILDCARD if any(_SLASH_WILDCARD in p for p in once) else _WILDCARD
+                if all(p.endswith('.') for p in once):
+                    wildcard += '.'
+                repeated = {p + wildcard for p in prefixes}
+                if '' in once:
+                    min_count = 0
+            else:
+                repeated = set()
+            prefixes = (prefixes | repeated) if min_count == 0 else repeated
+        elif op == sre_parse.AT:
+            if av in (sre_parse.AT_END, sre_parse.AT_END_STRING):
+                prefixes = {p + _END for p in prefixes}
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            # Assertions can only restrict what is matched
+            pass
+        else:
+            raise _Unindexable(f'Unsupported regex operator {op}')
+
+        prefixes |= done
+        if len(prefixes) > _MAX_ALTERNATIVES:
+            raise _Unindexable('Too many alternatives')
+    return prefixes
+
+
+def _index_keys(regex):
+    """
+    Return the index keys of the URLs with a hostname that can be matched by the regex:
+    ('host', hostname), ('subdomain', domain) and ('prefix', literal prefix of URLs without a "//")
+    """
+    keys = set()
+    for prefix in _expand(sre_parse.parse(regex), {''}):
+        scheme_end = prefix.find('//')
+        if scheme_end == -1:
+            if _SLASH_WILDCARD not in prefix and (
+                    prefix.endswith(_END) or '/' not in prefix and re.search(rf'[^a-z0-9+.:{_WILDCARD}-]', prefix)):
+                # Cannot match anything with a "//" (e.g. a bare video id), or at least not after a scheme
+                continue
+            literal = re.match(f'[^{_WILDCARD}{_SLASH_WILDCARD}{_END}]*', prefix).group()
+            if not literal:
+                raise _Unindexable('The pattern may match any URL')
+            keys.add(('prefix', literal))
+            continue
+        if _WILDCARD in prefix[:scheme_end] or _SLASH_WILDCARD in prefix[:scheme_end]:
+            raise _Unindexable('The scheme is not fixed')
+        elif not _SCHEME_RE.fullmatch(prefix[:scheme_end + 2]):
+            # Only URLs that start with a scheme are looked up in the index
+            continue
+        mobj = re.match(f'([^{re.escape(_HOST_END)}]*)[{re.escape(_HOST_END)}]', prefix[scheme_end + 2:])
+        if not mobj:
+            raise _Unindexable('The hostname may continue')
+        host = mobj.group(1)
+        if _SLASH_WILDCARD in host:
+            raise _Unindexable('The hostname may contain a path')
+        subdomain = host.startswith(f'{_WILDCARD}.')
+        if subdomain:
+            host = host[2:]
+        if not host or _WILDCARD in host or '@' in host:
+            raise _Unindexable(f'The hostname {host!r} is not fixed')
+        keys.add(('subdomain' if subdomain else 'host', host))
+    return keys
+
+
+def _is_indexable_class(ie):
+    import inspect
+
+    from .common import InfoExtractor, SelfHostedInfoExtractor
+
+    if ie.suitable.__func__ in (InfoExtractor.suitable.__func__, SelfHostedInfoExtractor.suitable.__func__):
+        return True
+    # An overridden suitable() that calls the original one can only narrow down what is matched
+    return 'super(' in inspect.getsource(ie.suitable)
+
+
+class ExtractorHostIndex:
+    """
+    Index of the extractors by the hostnames in their _VALID_URL
+
+    The index is generated together with the lazy extractors. It is used
+    to narrow down the extractors whose suitable() has to be tried for a URL;
+    the extractors that are not in the index have to be tried for every URL
+    """
+
+    def __init__(self, hosts, subdomains, prefixes, hostless=()):
+        self.hosts, self.subdomains, self.prefixes = hosts, subdomains, prefixes
+        self.hostless = tuple(hostless)
+        self._all_prefixes = tuple(prefixes)
+        self.indexed = frozenset(itertools.chain(
+            *hosts.values(), *subdomains.values(), *prefixes.values(), hostless))
+
+    @classmethod
+    def build(cls, ies):
+        from .common import InfoExtractor
+
+        index = {'host': {}, 'subdomain': {}, 'prefix': {}}
+        hostless = []
+        for ie in ies:
+            if ie._VALID_URL is False and ie.suitable.__func__ is InfoExtractor.suitable.__func__:
+                keys = ()
+            elif not isinstance(ie._VALID_URL, str) or not _is_indexable_class(ie):
+                continue
+            else:
+                try:
+                    keys = _index_keys(ie._VALID_URL)
+                except (_Unindexable, re.error):
+                    continue
+            if not keys:
+                hostless.append(ie.ie_key())
+            for kind, value in keys:
+                index[kind].setdefault(value, []).append(ie.ie_key())
+        return cls(
+            *({value: tuple(ie_keys) for value, ie_keys in sorted(index[kind].items())}
+              for kind in ('host', 'subdomain', 'prefix')),
+            tuple(hostless))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.hosts!r}, {self.subdomains!r}, {self.prefixes!r}, {self.hostless!r})'
+
+    def candidates(self, url):
+        """
+        Return the keys of the indexed extractors that may be suitable for the URL,
+        or None if any extractor may be
+        """
+        url = url.lower()
+        ie_keys = set()
+        if url.startswith(self._all_prefixes):
+            for prefix, prefix_keys in self.prefixes.items():
+                if url.startswith(prefix):
+                    ie_keys.update(prefix_keys)
+
+        scheme = _SCHEME_RE.match(url)
+        if not scheme:
+            return None
+        netloc = url[scheme.end():].partition('/')[0]
+        # The hostname ends at whichever of these the pattern expects
+        for host_end in {len(netloc), *(i for i, c in enumerate(netloc) if c in '?#:')}:
+            host = netloc[:host_end]
+            ie_keys.update(self.hosts.get(host, ()))
+            labels = host.split('.')
+            for i in range(1, len(labels)):
+                ie_keys.update(self.subdomains.get('.'.join(labels[i:]), ()))
+        return ie_keys
@@ -0,0 +1,60 @@
+import importlib
+
+
+def _table_contains(table, hostname):
+    """Binary search in a sorted table of hostnames, one per line"""
+    lo, hi = 0, len(table)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = table.rfind('\n', lo, mid) + 1 or lo
+        end = table.find('\n', mid)
+        if end == -1:
+            end = len(table)
+        line = table[start:end]
+        if line == hostname:
+            return True
+        elif line < hostname:
+            lo = end + 1
+        else:
+            hi = start
+    return False
+
+
+class InstanceList:
+    """
+    Hostnames of the instances of a self-hosted service
+
+    The known instances are generated into a sorted table in the submodule of
+    the same name, which is only imported on the first lookup.
+    The instances that are found at runtime are added to the list.
+
+    There is a single list per service, so that it is shared between
+    the extractors and their lazy counterparts
+    """
+
+    _LISTS = {}
+
+    def __new__(cls, name, default=()):
+        if name not in cls._LISTS:
+            self = cls._LISTS[name] = super().__new__(cls)
+            self.name, self.default = name, tuple(default)
+            self._table, self._found = None, set()
+        return cls._LISTS[name]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r}, {self.default!r})'
+
+    @property
+    def table(self):
+        if self._table is None:
+            try:
+                self._table = importlib.import_module(f'.{self.name}', __name__).instances
+            except ImportError:
+                self._table = '\n'.join(sorted(self.default))
+        return self._table
+
+    def __contains__(self, hostname):
+        return hostname in self._found or _table_contains(self.table, hostname)
+
+    def add(self, hostname):
+        self._found.add(hostname)
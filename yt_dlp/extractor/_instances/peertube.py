@@ -0,0 +1,1379 @@
+# AUTOMATICALLY GENERATED FILE. DO NOT EDIT.
+# Generated by ./devscripts/make_peertube_instance_list.py
+
+# Sorted, one hostname per line; looked up by yt_dlp.extractor._instances.InstanceList
+instances = '''\
+0ch.tv
+22x22.ru
+3dctube.3dcandy.social
+all.electric.kitchen
+allies.video
+alterscope.fr
+anarchy.tube
+apathy.tv
+aperi.tube
+apertatube.net
+apollo.lanofthedead.xyz
+archive.nocopyrightintended.tv
+archive.reclaim.tv
+area51.media
+artitube.artifaille.fr
+astrotube-ufe.obspm.fr
+astrotube.obspm.fr
+audio.freediverse.com
+auf1.eu
+avantwhatever.xyz
+bark.video
+battlepenguin.video
+bava.tv
+beardedtek.net
+bee-tube.fr
+beetoons.tv
+beta.ra.no
+betamax.donotsta.re
+biblion.refchat.net
+biblioteca.theowlclub.net
+bideoak.argia.eus
+bideoteka.eus
+bimbo.video
+birdtu.be
+birkeundnymphe.de
+bitcointv.com
+bolha.tube
+bonn.video
+breeze.tube
+brioco.live
+brocosoup.fr
+canal.facil.services
+canard.tube
+cdn01.tilvids.com
+celluloid-media.huma-num.fr
+christian.freediverse.com
+christunscripted.com
+cinema.yunohost.support
+classe.iro.umontreal.ca
+cliptube.org
+cloudtube.ise.fraunhofer.de
+comf.tube
+comics.peertube.biz
+commons.tube
+communitymedia.video
+conf.tube
+conspiracydistillery.com
+crank.recoil.org
+cybercast.duckdns.org
+dalek.zone
+dalliance.network
+dangly.parts
+darkvapor.nohost.me
+daschauher.aksel.rocks
+davbot.media
+dev.dollarvigilante.tv
+digitalcourage.video
+diode.zone
+displayeurope.video
+docker.videos.lecygnenoir.info
+dreiecksnebel.alex-detsch.de
+ds106.tv
+dud-video.inf.tu-dresden.de
+dud175.inf.tu-dresden.de
+dytube.com
+ebildungslabor.video
+evangelisch.video
+evilfactorylabs.social
+exo.tube
+exode.me
+faf.watch
+fair.tube
+fedi.video
+fedimovie.com
+fediverse.tv
+fightforinfo.com
+film.k-prod.fr
+film.node9.org
+flashist.health
+flim.txmn.tk
+flipboard.video
+fontube.fr
+foss.video
+fossfarmers.company
+fotogramas.politicaconciencia.org
+foubtube.com
+framatube.org
+freediverse.com
+freesoto-u2151.vm.elestio.app
+freesoto.tv
+fstube.net
+gade.o-k-i.net
+garr.tv
+goredb.com
+gorf.tube
+greatview.video
+grypstube.uni-greifswald.de
+gultsch.video
+h3h3.club
+hitchtube.fr
+hpstube.fr
+hyperreal.tube
+ilbjach.ru
+indymotion.fr
+infothema.net
+irrsinn.video
+itvplus.iiens.net
+jetstream.watch
+johnydeep.net
+juggling.digital
+jupiter.tube
+kadras.live
+kino.kompot.si
+kino.schuerz.at
+kinowolnosc.pl
+kirche.peertube-host.de
+kiwi.froggirl.club
+kodcast.com
+kolektiva.media
+kpop.22x22.ru
+kraut.zone
+krdtube.org
+kumi.tube
+la2.peertube.support
+la3.peertube.support
+la4.peertube.support
+lastbreach.tv
+lawsplaining.peertube.biz
+lemmy-test.toldi.eu
+leopard.tube
+libre.video
+linhtran.eu
+live.codinglab.ch
+live.dragontrove.fun
+live.libratoi.org
+live.nanao.moe
+live.oldskool.fi
+live.solari.com
+lostpod.space
+lounges.monster
+lucarne.balsamine.be
+luxtube.lu
+maindreieck-tv.de
+makertube.net
+media.aldiserver.de
+media.assassinate-you.net
+media.cooleysekula.net
+media.curious.bio
+media.econoalchemist.com
+media.exo.cat
+media.fsfe.org
+media.gzevd.de
+media.inno3.eu
+media.interior.edu.uy
+media.krashboyz.org
+media.mwit.ac.th
+media.mzhd.de
+media.notfunk.radio
+media.over-world.org
+media.privacyinternational.org
+media.smz-ma.de
+media.theplattform.net
+media.undeadnetwork.de
+media.zat.im
+medias.debrouillonet.org
+medias.pingbase.net
+mediathek.rzgierskopp.de
+mediatube.fermalo.fr
+megatube.lilomoino.fr
+melsungen.peertube-host.de
+merci-la-police.fr
+mirror.peertube.metalbanana.net
+mirrored.rocks
+mirtube.ru
+mix.video
+mla.moe
+moderndaywizards.org
+mountaintown.video
+movie.tkngh.jp
+movies.metricsmaster.eu
+mp-tube.de
+mplayer.demouliere.eu
+mtube.mooo.com
+music.freediverse.com
+my-sunshine.video
+mytube.kn-cloud.de
+mytube.le5emeaxe.fr
+mytube.madzel.de
+mytube.malenfant.net
+nadajemy.com
+nanawel-peertube.dyndns.org
+nastub.cz
+neat.tube
+nethack.tv
+nicecrew.tv
+nightshift.minnix.dev
+noagendatube.com
+nolog.media
+notretube.asselma.eu
+nya.show
+nyltube.nylarea.com
+ocfedtest.hosted.spacebear.ee
+offenes.tv
+onair.sbs
+openmedia.edunova.it
+ovaltube.codinglab.ch
+p.eertu.be
+p.lu
+p.ms.vg
+p.nintendojo.fr
+p2ptube.us
+p2ptv.ru
+pace.rip
+pastafriday.club
+patriottube.sonsofliberty.red
+pcbu.nl
+peer.d0g4.me
+peer.lukeog.com
+peer.madiator.cloud
+peer.philoxweb.be
+peer.raise-uav.com
+peer.tube
+peershare.togart.de
+peertube-blablalinux.be
+peertube-demo.learning-hub.fr
+peertube-docker.cpy.re
+peertube-eu.howlround.com
+peertube-u5014.vm.elestio.app
+peertube-us.howlround.com
+peertube.020.pl
+peertube.0x5e.eu
+peertube.1312.media
+peertube.1984.cz
+peertube.2i2l.net
+peertube.adjutor.xyz
+peertube.adresse.data.gouv.fr
+peertube.aegrel.ee
+peertube.alpharius.io
+peertube.alt.tata.casa
+peertube.am-networks.fr
+peertube.amicale.net
+peertube.anduin.net
+peertube.anon-kenkai.com
+peertube.anti-logic.com
+peertube.anzui.dev
+peertube.arch-linux.cz
+peertube.archive.pocketnet.app
+peertube.art3mis.de
+peertube.artica.center
+peertube.artsrn.ualberta.ca
+peertube.askan.info
+peertube.astral0pitek.synology.me
+peertube.atilla.org
+peertube.atsuchan.page
+peertube.aukfood.net
+peertube.automat.click
+peertube.b38.rural-it.org
+peertube.be
+peertube.beeldengeluid.nl
+peertube.behostings.net
+peertube.bgzashtita.es
+peertube.bike
+peertube.bilange.ca
+peertube.bildung-ekhn.de
+peertube.bingo-ev.de
+peertube.biz
+peertube.br0.fr
+peertube.bridaahost.ynh.fr
+peertube.brigadadigital.tec.br
+peertube.bubbletea.dev
+peertube.bubuit.net
+peertube.ch
+peertube.chantierlibre.org
+peertube.chatinbit.com
+peertube.chaunchy.com
+peertube.chir.rs
+peertube.christianpacaud.com
+peertube.chtisurel.net
+peertube.chuggybumba.com
+peertube.cipherbliss.com
+peertube.cirkau.art
+peertube.cloud.nerdraum.de
+peertube.cloud.sans.pub
+peertube.coko.foundation
+peertube.communecter.org
+peertube.concordia.social
+peertube.cpge-brizeux.fr
+peertube.cpy.re
+peertube.crazy-to-bike.de
+peertube.ctrl-c.liu.se
+peertube.ctseuro.com
+peertube.cuatrolibertades.org
+peertube.cube4fun.net
+peertube.dair-institute.org
+peertube.datagueule.tv
+peertube.davigge.com
+peertube.dc.pini.fr
+peertube.deadtom.me
+peertube.debian.social
+peertube.delfinpe.de
+peertube.delta0189.xyz
+peertube.demonix.fr
+peertube.designersethiques.org
+peertube.desmu.fr
+peertube.devol.it
+peertube.dk
+peertube.doesstuff.social
+peertube.dryusdan.fr
+peertube.dsmouse.net
+peertube.dtmf.ca
+peertube.dynlinux.io
+peertube.easter.fr
+peertube.eb8.org
+peertube.ecologie.bzh
+peertube.education-forum.com
+peertube.elforcer.ru
+peertube.elydan.site
+peertube.em.id.lv
+peertube.erikkemp.eu
+peertube.ethibox.fr
+peertube.eu.org
+peertube.european-pirates.eu
+peertube.eus
+peertube.euskarabildua.eus
+peertube.expi.studio
+peertube.f-si.org
+peertube.familie-berner.de
+peertube.familleboisteau.fr
+peertube.fedihost.website
+peertube.fenarinarsa.com
+peertube.festnoz.de
+peertube.ffs2play.fr
+peertube.florentcurk.com
+peertube.floss-marketing-school.com
+peertube.forteza.fr
+peertube.fr
+peertube.freespeech.club
+peertube.frontmediatique.fr
+peertube.futo.org
+peertube.gaialabs.ch
+peertube.gargantia.fr
+peertube.geekgalaxy.fr
+peertube.gegeweb.eu
+peertube.gemlog.ca
+peertube.genma.fr
+peertube.get-racing.de
+peertube.ghis94.ovh
+peertube.gidikroon.eu
+peertube.giftedmc.com
+peertube.grosist.fr
+peertube.gruntwerk.org
+peertube.gsugambit.com
+peertube.habets.house
+peertube.hackerfoo.com
+peertube.hellsite.net
+peertube.helvetet.eu
+peertube.heraut.eu
+peertube.histoirescrepues.fr
+peertube.hoerli.net
+peertube.home.x0r.fr
+peertube.hosnet.fr
+peertube.hostservice.nl
+peertube.hyperfreedom.org
+peertube.ichigo.everydayimshuflin.com
+peertube.ifwo.eu
+peertube.ignifi.me
+peertube.ii.md
+peertube.imaag.de
+peertube.in.ua
+peertube.inapurna.org
+peertube.informaction.info
+peertube.interhop.org
+peertube.inubo.ch
+peertube.iriseden.eu
+peertube.it
+peertube.it-arts.net
+peertube.jackbot.fr
+peertube.johntheserg.al
+peertube.kaleidos.net
+peertube.kalua.im
+peertube.kcore.org
+peertube.keazilla.net
+peertube.klaewyss.fr
+peertube.kleph.eu
+peertube.kodein.be
+peertube.kriom.net
+peertube.kx.studio
+peertube.kyriog.eu
+peertube.la-famille-muller.fr
+peertube.laas.fr
+peertube.lab.how
+peertube.labeuropereunion.eu
+peertube.lagob.fr
+peertube.lagvoid.com
+peertube.laveinal.cat
+peertube.lhc.net.br
+peertube.libresolutions.network
+peertube.libretic.fr
+peertube.librosphere.fr
+peertube.linuxrocks.online
+peertube.livingutopia.org
+peertube.logilab.fr
+peertube.lon.tv
+peertube.louisematic.site
+peertube.luckow.org
+peertube.luga.at
+peertube.lulusworld.art
+peertube.lyceeconnecte.fr
+peertube.madixam.xyz
+peertube.magicstone.dev
+peertube.makotoworkshop.org
+peertube.manalejandro.com
+peertube.marienschule.de
+peertube.marud.fr
+peertube.metalbanana.net
+peertube.miguelcr.me
+peertube.mikemestnik.net
+peertube.minetestserver.ru
+peertube.mobilsicher.de
+peertube.modspil.dk
+peertube.monlycee.net
+peertube.musicstudio.pro
+peertube.mxinfo.fr
+peertube.mygaia.org
+peertube.n1l.dev
+peertube.naln1.ca
+peertube.nayya.org
+peertube.netzbegruenung.de
+peertube.nicolastissot.fr
+peertube.nighty.name
+peertube.nissesdomain.org
+peertube.nodja.com
+peertube.nogafam.fr
+peertube.nomagic.uk
+peertube.normalgamingcommunity.cz
+peertube.nortel.cloud
+peertube.nuage-libre.fr
+peertube.nz
+peertube.offerman.com
+peertube.ohioskates.com
+peertube.opencloud.lu
+peertube.openstreetmap.fr
+peertube.otakufarms.com
+peertube.pablopernot.fr
+peertube.paladyn.org
+peertube.parleur.net
+peertube.pcservice46.fr
+peertube.pix-n-chill.fr
+peertube.plataformess.org
+peertube.platta.at
+peertube.protagio.org
+peertube.public.cat
+peertube.r2.enst.fr
+peertube.r5c3.fr
+peertube.radres.xyz
+peertube.rainbowswingers.net
+peertube.ramram.ink
+peertube.red
+peertube.redpill-insight.com
+peertube.researchinstitute.at
+peertube.revelin.fr
+peertube.rlp.schule
+peertube.roflcopter.fr
+peertube.rokugan.fr
+peertube.rougevertbleu.tv
+peertube.roundpond.net
+peertube.rural-it.org
+peertube.s2s.video
+peertube.satoshishop.de
+peertube.scd31.com
+peertube.scyldings.com
+peertube.se
+peertube.securitymadein.lu
+peertube.semperpax.com
+peertube.semweb.pro
+peertube.sensin.eu
+peertube.serveur.slv-valbonne.fr
+peertube.sidh.bzh
+peertube.sieprawski.pl
+peertube.simounet.net
+peertube.skorpil.cz
+peertube.slat.org
+peertube.smertrios.com
+peertube.solidev.net
+peertube.sqweeb.net
+peertube.stattzeitung.org
+peertube.steamedfish.org
+peertube.stream
+peertube.su
+peertube.swarm.solvingmaz.es
+peertube.swrs.net
+peertube.takeko.cyou
+peertube.tangentfox.com
+peertube.taxinachtegel.de
+peertube.tazy.xyz
+peertube.techsupporter.net
+peertube.teftera.com
+peertube.teutronic-services.de
+peertube.th3rdsergeevich.xyz
+peertube.thele.me
+peertube.ti-fr.com
+peertube.tiennot.net
+peertube.tmp.rcp.tf
+peertube.touhoppai.moe
+peertube.travelpandas.eu
+peertube.tspu.edu.ru
+peertube.tv
+peertube.tweb.tv
+peertube.ucy.de
+peertube.underworld.fr
+peertube.uno
+peertube.urkob.com
+peertube.vapronva.pw
+peertube.veen.world
+peertube.vesdia.eu
+peertube.videosafehaven.com
+peertube.virtual-assembly.org
+peertube.viviers-fibre.net
+peertube.vlaki.cz
+peertube.we-keys.fr
+peertube.wiesbaden.social
+peertube.wtfayla.net
+peertube.xrcb.cat
+peertube.xwiki.com
+peertube.yuuki.pictures
+peertube.zd.do
+peertube.zergy.net
+peertube.zmuuf.org
+peertube.zoz-serv.org
+peertube.zvcdn.de
+peertube.zwindler.fr
+peertube2.cpy.re
+peertube3.cpy.re
+peervideo.club
+peervideo.ru
+periscope.numenaute.org
+pete.warpnine.de
+petitlutinartube.fr
+phijkchu.com
+phoenixproject.group
+piraten.space
+pire.artisanlogiciel.net
+pirtube.calut.fr
+pityu.flaki.hu
+play-my.video
+play.mittdata.se
+play.shirtless.gay
+player.ojamajo.moe
+po0.online
+podlibre.video
+pony.tube
+portal.digilab.nfa.cz
+praxis.su
+praxis.tube
+private.fedimovie.com
+przej.me
+pt.borgcube.eu
+pt.freedomwolf.cc
+pt.gordons.gen.nz
+pt.ilyamikcoder.com
+pt.irnok.net
+pt.mezzo.moe
+pt.na4.eu
+pt.netcraft.ch
+pt.pube.tk
+pt.rwx.ch
+pt.secnd.me
+pt.sfunk1x.com
+pt.thishorsie.rocks
+pt.vern.cc
+pt01.lehrerfortbildung-bw.de
+ptb.lunarviews.net
+ptube.ranranhome.info
+ptube.rousset.nom.fr
+puffy.tube
+punktube.net
+puppet.zone
+qtube.qlyoung.net
+quantube.win
+quebec1.freediverse.com
+rankett.net
+raptube.antipub.org
+refuznik.video
+regarder.sans.pub
+replay.jres.org
+repro.video
+review.peertube.biz
+runtube.re
+sc07.tv
+scitech.video
+sdmtube.fr
+secure.direct-live.net
+secure.icn.press
+secure.scanovid.com
+seka.pona.la
+serv1.wiki-tube.de
+serv2.wiki-tube.de
+serv3.wiki-tube.de
+share.tube
+skeptikon.fr
+skeptube.fr
+social.fedimovie.com
+socpeertube.ru
+sovran.video
+spacepub.space
+special.videovortex.tv
+spectra.video
+staging.gegenstimme.tv
+stl1988.peertube-host.de
+stream.biovisata.lt
+stream.conesphere.cloud
+stream.elven.pw
+stream.jurnalfm.md
+stream.k-prod.fr
+stream.litera.tools
+stream.nuemedia.se
+stream.rlp-media.de
+stream.vrse.be
+streamarchive.manicphase.me
+streamsource.video
+studios.racer159.com
+styxhexenhammer666.com
+subscribeto.me
+swebbtube.se
+swebbtv.se
+syrteplay.obspm.fr
+t.0x0.st
+t.wtyl.live
+tbh.co-shaoghal.net
+terakoya-backstage.com
+testube.distrilab.fr
+tezarland.ru
+tgi.hosted.spacebear.ee
+theater.ethernia.net
+thevideoverse.com
+tilvids.com
+tinkerbetter.tube
+tinsley.video
+toobnix.org
+trailers.ddigest.com
+troll.tv
+tube-action-educative.apps.education.fr
+tube-arts-lettres-sciences-humaines.apps.education.fr
+tube-cycle-2.apps.education.fr
+tube-cycle-3.apps.education.fr
+tube-education-physique-et-sportive.apps.education.fr
+tube-enseignement-professionnel.apps.education.fr
+tube-institutionnel.apps.education.fr
+tube-langues-vivantes.apps.education.fr
+tube-maternelle.apps.education.fr
+tube-numerique-educatif.apps.education.fr
+tube-sciences-technologies.apps.education.fr
+tube-test.apps.education.fr
+tube.4e6a.ru
+tube.abolivier.bzh
+tube.ac-lyon.fr
+tube.acheney.xyz
+tube.alado.space
+tube.amic37.fr
+tube.anjara.eu
+tube.anufrij.de
+tube.aquilenet.fr
+tube.archworks.co
+tube.area404.cloud
+tube.arthack.nz
+tube.asulia.fr
+tube.avensio.de
+tube.awkward.company
+tube.azbyka.ru
+tube.azkware.net
+tube.balamb.fr
+tube.beit.hinrichs.cc
+tube.belowtoxic.media
+tube.beteigeuze.space
+tube.bit-friends.de
+tube.bitwaves.de
+tube.bremen-social-sciences.de
+tube.bstly.de
+tube.buchstoa-tv.at
+tube.calculate.social
+tube.childrenshealthdefense.eu
+tube.chosto.me
+tube.cms.garden
+tube.cnr.it
+tube.communia.org
+tube.conferences-gesticulees.net
+tube.crapaud-fou.org
+tube.croustifed.net
+tube.cyano.at
+tube.cyberia.club
+tube.danq.me
+tube.dembased.xyz
+tube.derlemue.com
+tube.dev.displ.eu
+tube.dianaband.info
+tube.die-rote-front.de
+tube.digitalesozialearbeit.de
+tube.distrilab.fr
+tube.dnet.one
+tube.doctors4covidethics.org
+tube.doortofreedom.org
+tube.dragonpsi.xyz
+tube.dsocialize.net
+tube.e-jeremy.com
+tube.ebin.club
+tube.edufor.me
+tube.elemac.fr
+tube.empathic-leon.de
+tube.emy.plus
+tube.emy.world
+tube.erzbistum-hamburg.de
+tube.exozy.me
+tube.extinctionrebellion.fr
+tube.fdn.fr
+tube.fede.re
+tube.fedi.quebec
+tube.fedisphere.net
+tube.fediverse.at
+tube.felinn.org
+tube.flokinet.is
+tube.foad.me.uk
+tube.freepeople.fr
+tube.friloux.me
+tube.froth.zone
+tube.fulda.social
+tube.funil.de
+tube.furax37.org
+tube.futuretic.fr
+tube.g1zm0.de
+tube.g4rf.net
+tube.gaiac.io
+tube.garrlab.it
+tube.gayfr.online
+tube.geekyboo.net
+tube.genb.de
+tube.ghk-academy.info
+tube.gi-it.de
+tube.govital.net
+tube.grap.coop
+tube.graz.social
+tube.grin.hu
+tube.hamakor.org.il
+tube.hoga.fr
+tube.hokai.lol
+tube.homecomputing.fr
+tube.hunterjozwiak.com
+tube.int5.net
+tube.interhacker.space
+tube.invisible.ch
+tube.io18.top
+tube.itsg.host
+tube.jeena.net
+tube.kai-stuht.com
+tube.kansanvalta.org
+tube.kekmahub.com
+tube.kenfm.de
+tube.kh-berlin.de
+tube.kher.nl
+tube.kicou.info
+tube.kockatoo.org
+tube.kotur.org
+tube.koweb.fr
+tube.ksl-bmx.de
+tube.la-dina.net
+tube.lab.nrw
+tube.lacaveatonton.ovh
+tube.laurent-malys.fr
+tube.laurentclaude.fr
+tube.leetdreams.ch
+tube.linkse.media
+tube.lokad.com
+tube.lubakiagenda.net
+tube.lucie-philou.com
+tube.maiti.info
+tube.media-techport.de
+tube.mediainformationcenter.de
+tube.metadocs.cc
+tube.mfraters.net
+tube.morozoff.pro
+tube.neshweb.net
+tube.nestor.coop
+tube.network.europa.eu
+tube.nicfab.eu
+tube.nieuwwestbrabant.nl
+tube.nogafa.org
+tube.novg.net
+tube.nox-rhea.org
+tube.nuagelibre.fr
+tube.numerique.gouv.fr
+tube.nuxnik.com
+tube.nx-pod.de
+tube.nx12.net
+tube.octaplex.net
+tube.ofloo.io
+tube.oisux.org
+tube.okcinfo.news
+tube.onlinekirche.net
+tube.opportunis.me
+tube.oraclefilms.com
+tube.org.il
+tube.otter.sh
+tube.p2p.legal
+tube.pacapime.ovh
+tube.parinux.org
+tube.pastwind.top
+tube.pawelko.net
+tube.picasoft.net
+tube.pilgerweg-21.de
+tube.plaf.fr
+tube.pmj.rocks
+tube.pol.social
+tube.polytech-reseau.org
+tube.ponsonaille.fr
+tube.portes-imaginaire.org
+tube.postblue.info
+tube.public.apolut.net
+tube.pustule.org
+tube.pyngu.com
+tube.querdenken-711.de
+tube.rebellion.global
+tube.reck.dk
+tube.reseau-canope.fr
+tube.revertron.com
+tube.revue-farouest.fr
+tube.rfc1149.net
+tube.rhythms-of-resistance.org
+tube.risedsky.ovh
+tube.rooty.fr
+tube.rsi.cnr.it
+tube.ruslo.pro
+tube.ryne.moe
+tube.sbcloud.cc
+tube.schleuss.online
+tube.schule.social
+tube.sebastix.com
+tube.sekretaerbaer.net
+tube.shanti.cafe
+tube.shela.nu
+tube.skrep.in
+tube.sleeping.town
+tube.sloth.network
+tube.solidcharity.net
+tube.source.news
+tube.sp-codes.de
+tube.spdns.org
+tube.systerserver.net
+tube.systest.eu
+tube.taker.fr
+tube.tappret.fr
+tube.tchncs.de
+tube.techeasy.org
+tube.thechangebook.org
+tube.thierrytalbert.fr
+tube.tinfoil-hat.net
+tube.todon.eu
+tube.toldi.eu
+tube.tpshd.de
+tube.trax.im
+tube.troopers.agency
+tube.ttk.is
+tube.tuxfriend.fr
+tube.tylerdavis.xyz
+tube.ullihome.de
+tube.ulne.be
+tube.undernet.uy
+tube.unif.app
+tube.vrpnet.org
+tube.wolfe.casa
+tube.xd0.de
+tube.xn--baw-joa.social
+tube.xy-space.de
+tube1.it.tuwien.ac.at
+tube1.perron-service.de
+tube4.apolut.net
+tubedu.org
+tubo.novababilonia.me
+tubulus.openlatin.org
+turtleisland.video
+tututu.tube
+tv.adast.dk
+tv.adn.life
+tv.arns.lt
+tv.atmx.ca
+tv.based.quest
+tv.farewellutopia.com
+tv.filmfreedom.net
+tv.gravitons.org
+tv.lumbung.space
+tv.mattchristiansenmedia.com
+tv.pirateradio.social
+tv.pirati.cz
+tv.santic-zombie.ru
+tv.suwerenni.org
+tv.undersco.re
+tv.zonepl.net
+tvox.ru
+twctube.twc-zone.eu
+twobeek.com
+urbanists.video
+uwu.yip.gay
+v.9tail.net
+v.basspistol.org
+v.blustery.day
+v.esd.cc
+v.j4.lc
+v.kisombrella.top
+v.koa.im
+v.kretschmann.social
+v.kyaru.xyz
+v.lor.sh
+v.mkp.ca
+v.posm.gay
+v1.smartit.nu
+vamzdis.group.lt
+vdo.greboca.com
+vdo.unvanquished.greboca.com
+veedeo.org
+veedeo.sncft.com.tn
+vhs.absturztau.be
+vid.blackfamily.one
+vid.cthos.dev
+vid.femboyfurry.net
+vid.fossdle.org
+vid.kinuseka.us
+vid.mattedwards.org
+vid.mkp.ca
+vid.nocogabriel.fr
+vid.norbipeti.eu
+vid.northbound.online
+vid.ohboii.de
+vid.plantplotting.co.uk
+vid.pretok.tv
+vid.prometheus.systems
+vid.samtripoli.com
+vid.soafen.love
+vid.twhtv.club
+vid.wildeboer.net
+vid.y-y.li
+video-cave-v2.de
+video-liberty.com
+video.076.moe
+video.076.ne.jp
+video.1146.nohost.me
+video.9wd.eu
+video.abraum.de
+video.administrieren.net
+video.ados.accoord.fr
+video.altertek.org
+video.amiga-ng.org
+video.anartist.org
+video.angrynerdspodcast.nl
+video.antopie.org
+video.aokami.codelib.re
+video.arghacademy.org
+video.asgardius.company
+video.audiovisuel-participatif.org
+video.barbed.fr
+video.barcelo.ynh.fr
+video.bards.online
+video.barkoczy.social
+video.benetou.fr
+video.beyondwatts.social
+video.bgeneric.net
+video.bilecik.edu.tr
+video.binarydad.com
+video.blast-info.fr
+video.blender.org
+video.blueline.mg
+video.bmu.cloud
+video.canadiancivil.com
+video.catgirl.biz
+video.cats-home.net
+video.causa-arcana.com
+video.cerclearistote.com
+video.chadwaltercummings.me
+video.chasmcity.net
+video.chbmeyer.de
+video.chipio.industries
+video.cigliola.com
+video.citizen4.eu
+video.clumsy.computer
+video.cm-en-transition.fr
+video.cnnumerique.fr
+video.cnr.it
+video.cnt.social
+video.coales.co
+video.codefor.de
+video.coffeebean.social
+video.colibris-outilslibres.org
+video.comun.al
+video.comune.trento.it
+video.coop.tools
+video.coyp.us
+video.cpn.so
+video.csc49.fr
+video.davduf.net
+video.davejansen.com
+video.dlearning.nl
+video.dnfi.no
+video.dresden.network
+video.dudenas.lt
+video.echirolles.fr
+video.eientei.org
+video.ellijaymakerspace.org
+video.emergeheart.info
+video.eradicatinglove.xyz
+video.espr.cloud
+video.espr.moe
+video.everythingbagel.me
+video.expiredpopsicle.com
+video.extremelycorporate.ca
+video.fabiomanganiello.com
+video.fabriquedelatransition.fr
+video.fdlibre.eu
+video.fedi.bzh
+video.fhtagn.org
+video.firehawk-systems.com
+video.fission.social
+video.foofus.com
+video.fox-romka.ru
+video.freie-linke.de
+video.fuss.bz.it
+video.g3l.org
+video.gamerstavern.online
+video.gemeinde-pflanzen.net
+video.genky.duckdns.org
+video.glassbeadcollective.org
+video.graine-pdl.org
+video.greenmycity.eu
+video.gresille.org
+video.gustavlindqvist.se
+video.gyt.is
+video.hacklab.fi
+video.hainry.fr
+video.hammons.llc
+video.hardlimit.com
+video.hostux.net
+video.icic-net.com
+video.icic.law
+video.igem.org
+video.infojournal.fr
+video.infosec.exchange
+video.internet-czas-dzialac.pl
+video.interru.io
+video.iphodase.fr
+video.ipng.ch
+video.irem.univ-paris-diderot.fr
+video.ironsysadmin.com
+video.islameye.com
+video.jacen.moe
+video.jacquesetmichel.fr
+video.jadin.me
+video.jeffmcbride.net
+video.jigmedatse.com
+video.jtworld.xyz
+video.kuba-orlik.name
+video.lacalligramme.fr
+video.lanceurs-alerte.fr
+video.laotra.red
+video.lapineige.fr
+video.laraffinerie.re
+video.latavernedejohnjohn.fr
+video.lavolte.net
+video.lemediatv.fr
+video.liberta.vip
+video.libreti.net
+video.licentia.net
+video.linc.systems
+video.linux.it
+video.linuxtrent.it
+video.livecchi.cloud
+video.liveitlive.show
+video.lono.space
+video.lqdn.fr
+video.lrose.de
+video.lunago.net
+video.lundi.am
+video.lw1.at
+video.lycee-experimental.org
+video.maechler.cloud
+video.marcorennmaus.de
+video.mass-trespass.uk
+video.matomocamp.org
+video.medienzentrum-harburg.de
+video.mentality.rip
+video.metaccount.de
+video.metaversum.wtf
+video.midreality.com
+video.migennes.net
+video.mikepj.dev
+video.mobile-adenum.fr
+video.monsieurbidouille.fr
+video.motoreitaliacarlonegri.it
+video.mttv.it
+video.mugoreve.fr
+video.mundodesconocido.com
+video.mxtthxw.art
+video.mycrowd.ca
+video.na-prostem.si
+video.ncot.uk
+video.nesven.eu
+video.netsyms.com
+video.niboe.info
+video.nogafam.es
+video.nonewabnormal.com
+video.nstr.no
+video.nuage-libre.fr
+video.occm.cc
+video.off-investigation.fr
+video.oh14.de
+video.okaris.de
+video.olisti.co
+video.olos311.org
+video.omniatv.com
+video.ordinobsolete.fr
+video.osgeo.org
+video.osvoj.ru
+video.ourcommon.cloud
+video.ozgurkon.org
+video.paradigmthreat.net
+video.passageenseine.fr
+video.pcf.fr
+video.pcgaldo.com
+video.phyrone.de
+video.ploud.fr
+video.ploud.jp
+video.poul.org
+video.publicspaces.net
+video.pullopen.xyz
+video.qoto.org
+video.r3s.nrw
+video.rastapuls.com
+video.resolutions.it
+video.retroedge.tech
+video.rhizome.org
+video.rlp-media.de
+video.rs-einrich.de
+video.rubdos.be
+video.sadmin.io
+video.shitposter.club
+video.silex.me
+video.simplex-software.ru
+video.slipfox.xyz
+video.snug.moe
+video.software-fuer-engagierte.de
+video.soi.ch
+video.squeak.social
+video.subak.ovh
+video.surazal.net
+video.taboulisme.com
+video.taskcards.eu
+video.team-lcbs.eu
+video.techforgood.social
+video.techtransthai.org
+video.tedomum.net
+video.telemillevaches.net
+video.thepolarbear.co.uk
+video.thinkof.name
+video.thomaspreece.net
+video.thoshis.net
+video.tii.space
+video.tippetarius.ru
+video.tkz.es
+video.toby3d.me
+video.trankil.info
+video.triplea.fr
+video.tryptophonic.com
+video.tum.social
+video.turbo.chat
+video.typica.us
+video.uriopss-pdl.fr
+video.ut0pia.org
+video.vaku.org.ua
+video.valme.io
+video.vegafjord.me
+video.veloma.org
+video.violoncello.ch
+video.vny.fr
+video.voidconspiracy.band
+video.wakkeren.nl
+video.windfluechter.org
+video.writeas.org
+video.ziez.eu
+videoer.riversouldiers.dk
+videohaven.com
+videonaute.fr
+videos-libr.es
+videos-passages.huma-num.fr
+videos.aadtp.be
+videos.adhocmusic.com
+videos.ahp-numerique.fr
+videos.alamaisondulibre.org
+videos.ananace.dev
+videos.archigny.net
+videos.avency.de
+videos.b4tech.org
+videos.benjaminbrady.ie
+videos.bik.opencloud.lu
+videos.brookslawson.com
+videos.buceoluegoexisto.com
+videos.capas.se
+videos.cassidypunchmachine.com
+videos.cemea.org
+videos.cloudron.io
+videos.codingotaku.com
+videos.coletivos.org
+videos.collate.social
+videos.coopgo.fr
+videos.craddock.org
+videos.danksquad.org
+videos.digitaldragons.eu
+videos.domainepublic.net
+videos.draculo.net
+videos.dromeadhere.fr
+videos.enisa.europa.eu
+videos.explain-it.org
+videos.factsonthegroundshow.com
+videos.festivalparminous.org
+videos.figucarolina.org
+videos.foilen.com
+videos.fsci.in
+videos.funkwhale.audio
+videos.gamercast.net
+videos.gianmarco.gg
+videos.globenet.org
+videos.grafo.zone
+videos.hack2g2.fr
+videos.hardcoredevs.com
+videos.hauspie.fr
+videos.hush.is
+videos.hyphalfusion.network
+videos.icum.to
+videos.idiocy.xyz
+videos.im.allmendenetz.de
+videos.iut-orsay.fr
+videos.jacksonchen666.com
+videos.john-livingston.fr
+videos.knazarov.com
+videos.koumoul.com
+videos.kuoushi.com
+videos.laliguepaysdelaloire.org
+videos.lemnoslife.com
+videos.lemouvementassociatif-pdl.org
+videos.lescommuns.org
+videos.leslionsfloorball.fr
+videos.librescrum.org
+videos.lukesmith.xyz
+videos.martyn.berlin
+videos.metus.ca
+videos.miolo.org
+videos.mykdeen.com
+videos.netwaver.xyz
+videos.noeontheend.com
+videos.npo.city
+videos.offroad.town
+videos.openmandriva.org
+videos.ourselves.space
+videos.pair2jeux.tube
+videos.parleur.net
+videos.pcorp.us
+videos.pkutalk.com
+videos.pop.eu.com
+videos.pueseso.club
+videos.rampin.org
+videos.rauten.co.za
+videos.realnephestate.xyz
+videos.rights.ninja
+videos.ritimo.org
+videos.sarcasmstardust.com
+videos.scanlines.xyz
+videos.shmalls.pw
+videos.side-ways.net
+videos.stadtfabrikanten.org
+videos.supertuxkart.net
+videos.tcit.fr
+videos.testimonia.org
+videos.tfcconnection.org
+videos.thinkerview.com
+videos.torrenezzi10.xyz
+videos.trom.tf
+videos.ubuntu-paris.org
+videos.upr.fr
+videos.utsukta.org
+videos.viorsan.com
+videos.webcoaches.net
+videos.wherelinux.xyz
+videos.wikilibriste.fr
+videos.wirtube.de
+videos.yesil.club
+videos.yeswiki.net
+videoteca.ibict.br
+videoteca.kenobit.it
+videotube.duckdns.org
+videovortex.tv
+vids.capypara.de
+vids.mariusdavid.fr
+vids.neovibe.app
+vids.plan9.rocks
+vids.roshless.me
+vids.stary.pc.pl
+vids.tekdmn.me
+vidz.dou.bet
+vidz.julien.ovh
+views.southfox.me
+vigilante.tv
+virtual-girls-are.definitely-for.me
+viste.pt
+vn.zohup.net
+vnchich.com
+vnop.org
+vod.ksite.de
+vod.newellijay.tv
+vods.juni.tube
+voluntarytube.com
+vtr.chikichiki.tube
+vulgarisation-informatique.fr
+wacha.punks.cc
+watch.44con.com
+watch.dinoleaf.com
+watch.easya.solutions
+watch.eeg.cl.cam.ac.uk
+watch.goodluckgabe.life
+watch.ignorance.eu
+watch.jimmydore.com
+watch.libertaria.space
+watch.nuked.social
+watch.ocaml.org
+watch.snoot.tube
+watch.softinio.com
+watch.thelema.social
+watch.tubelab.video
+weare.dcnh.tv
+webtv.vandoeuvre.net
+wetubevid.online
+widemus.de
+wikileaks.video
+wirtube.de
+wiwi.video
+wow.such.disappointment.fail
+wur.pm
+ww3.vnchich.cc
+www.birkeundnymphe.de
+www.jvideos.net
+www.kotikoff.net
+www.makertube.net
+www.mypeer.tube
+www.nadajemy.com
+www.neptube.io
+www.rocaguinarda.tv
+www.vev.su
+www.videos-libr.es
+www.vidyaley.com
+www.vnshow.net
+www.wuwox.com
+www.yiny.org
+www.zohup.net
+xxivproduction.video
+yeshuafreedom.com
+yiny.org
+yt.orokoro.ru
+ytube.retronerd.at
+yuitobe.wikiwiki.li
+zapping.no-ip.info
+zumvideo.de'''
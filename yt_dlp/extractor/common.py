@@ -31,14 +31,15 @@
 from ..downloader.f4m import get_base_url, remove_encrypted_media
 from ..utils import (
     IDENTITY,
-    JSON_LD_RE,
     NO_DEFAULT,
     ExtractorError,
     FormatSorter,
     GeoRestrictedError,
     GeoUtils,
     HEADRequest,
+    JSONScanner,
     LenientJSONDecoder,
+    PageIndex,
     RegexNotFoundError,
     RetryManager,
     UnsupportedError,
@@ -100,6 +101,10 @@
 )
 
 
+class _MetaTagRegex(str):
+    """A regex that can only match at the start of a <meta> tag, see PageIndex.search_meta"""
+
+
 class InfoExtractor:
     """Information Extractor class.
 
@@ -555,6 +560,11 @@ class InfoExtractor:
     - websocket - Requires WebSocket-related package
     - yaml - pyyaml package
     """
+    _INDEX_WEBPAGES = False
+    """
+    Create a PageIndex for each downloaded webpage, which speeds up the get_element(s)_* helpers
+    and the OpenGraph/meta helpers when the extractor calls many of them on the same page
+    """
 
     def _login_hint(self, method=NO_DEFAULT, netrc=None):
         password_hint = f'--username and --password, or --netrc ({netrc or self._NETRC_MACHINE}) to provide account credentials'
@@ -935,10 +945,31 @@ def _download_webpage_handle(
             elif form_params:
                 data = urlencode_postdata(form_params)
 
-        urlh = self._request_webpage(url_or_request, video_id, note, errnote, fatal, data=data, headers=headers, query=query, expected_status=expected_status)
-        if urlh is False:
-            assert not fatal
-            return False
+        http_cache = self._downloader.http_cache
+        cached = None
+        if data is None and http_cache.enabled:
+            url_or_request = self._create_request(url_or_request, None, headers, query)
+            headers = query = None
+            cached = http_cache.load(url_or_request)
+
+        if cached and http_cache.is_fresh(cached):
+            self.write_debug(f'Using the cached response for {url_or_request.get_full_url()}')
+            urlh = http_cache.response(cached)
+        else:
+            request = url_or_request
+            if cached:
+                request = update_Request(url_or_request, headers=http_cache.conditional_headers(cached))
+                accept_status = expected_status
+                expected_status = lambda status: status == 304 or (
+                    accept_status(status) is True if callable(accept_status) else status in variadic(accept_status or ()))
+            urlh = self._request_webpage(request, video_id, note, errnote, fatal, data=data, headers=headers, query=query, expected_status=expected_status)
+            if urlh is False:
+                assert not fatal
+                return False
+            if cached and urlh.getcode() == 304:
+                urlh = http_cache.revalidated(url_or_request, cached, urlh)
+            elif http_cache.enabled and data is None:
+                urlh = http_cache.store(url_or_request, urlh)
         content = self._webpage_read_content(urlh, url_or_request, video_id, note, errnote, fatal, encoding=encoding)
         return (content, urlh)
 
@@ -1028,6 +1059,8 @@ def _webpage_read_content(self, urlh, url_or_request, video_id, note=None, errno
 
         content = self.__decode_webpage(webpage_bytes, encoding, urlh.headers)
         self.__check_blocked(content)
+        if self._INDEX_WEBPAGES:
+            PageIndex(content)
 
         return content
 
@@ -1281,13 +1314,20 @@ def _search_regex(self, pattern, string, name, default=NO_DEFAULT, fatal=True, f
         In case of failure return a default value or raise a WARNING or a
         RegexNotFoundError, depending on fatal, specifying the field name.
         """
+        index = string is not None and PageIndex.get(string)
+
+        def search(pattern):
+            if index and isinstance(pattern, _MetaTagRegex):
+                return index.search_meta(pattern, flags)
+            return re.search(pattern, string, flags)
+
         if string is None:
             mobj = None
         elif isinstance(pattern, (str, re.Pattern)):
-            mobj = re.search(pattern, string, flags)
+            mobj = search(pattern)
         else:
             for p in pattern:
-                mobj = re.search(p, string, flags)
+                mobj = search(p)
                 if mobj:
                     break
 
@@ -1318,6 +1358,13 @@ def _search_json(self, start_pattern, string, name, video_id, *, end_pattern='',
         else:
             fatal, has_default = False, True
 
+        if (isinstance(string, str) and contains_pattern == r'{(?s:.+)}' and not kwargs.get('transform_source')
+                and kwargs.keys() <= {'transform_source', 'errnote', 'close_objects'}):
+            # Decode the object in place instead of slicing it out of the string first
+            json_obj = JSONScanner.of(string).search_object(start_pattern, end_pattern)
+            if json_obj is not None:
+                return json_obj
+
         json_string = self._search_regex(
             rf'(?:{start_pattern})\s*(?P<json>{contains_pattern})\s*(?:{end_pattern})',
             string, name, group='json', fatal=fatal, default=None if has_default else NO_DEFAULT)
@@ -1409,15 +1456,15 @@ def _og_regexes(prop):
                        % {'prop': re.escape(prop), 'sep': '(?:&#x3A;|[:-])'})
         template = r'<meta[^>]+?%s[^>]+?%s'
         return [
-            template % (property_re, content_re),
-            template % (content_re, property_re),
+            _MetaTagRegex(template % (property_re, content_re)),
+            _MetaTagRegex(template % (content_re, property_re)),
         ]
 
     @staticmethod
     def _meta_regex(prop):
-        return r'''(?isx)<meta
+        return _MetaTagRegex(r'''(?isx)<meta
                     (?=[^>]+(?:itemprop|name|property|id|http-equiv)=(["\']?)%s\1)
-                    [^>]+?content=(["\'])(?P<content>.*?)\2''' % re.escape(prop)
+                    [^>]+?content=(["\'])(?P<content>.*?)\2''' % re.escape(prop))
 
     def _og_search_property(self, prop, html, name=None, **kargs):
         prop = variadic(prop)
@@ -1525,8 +1572,9 @@ def _yield_json_ld(self, html, video_id, *, fatal=True, default=NO_DEFAULT):
         """Yield all json ld objects in the html"""
         if default is not NO_DEFAULT:
             fatal = False
-        for mobj in re.finditer(JSON_LD_RE, html):
-            json_ld_item = self._parse_json(mobj.group('json_ld'), video_id, fatal=fatal)
+        for json_ld_item in JSONScanner.of(html).iter_json_ld():
+            if isinstance(json_ld_item, str):
+                json_ld_item = self._parse_json(json_ld_item, video_id, fatal=fatal)
             for json_ld in variadic(json_ld_item):
                 if isinstance(json_ld, dict):
                     yield json_ld
@@ -3947,13 +3995,13 @@ class SelfHostedInfoExtractor(InfoExtractor):
     """
 
     _NODEINFO_CACHE = {}
+    _NODEINFO_CACHE_TTL = 7 * 24 * 60 * 60
     _SELF_HOSTED = True
 
     _IMPOSSIBLE_HOSTNAMES = ()
     _PREFIX_GROUPS = ('prefix', )
     _HOSTNAME_GROUPS = ()
-    _INSTANCE_LIST = ()
-    _DYNAMIC_INSTANCE_LIST = ()
+    _INSTANCE_LIST = ()  # an InstanceList for the service
     _NODEINFO_SOFTWARE = ()
     _SOFTWARE_NAME = 'self-hosted'
 
@@ -3981,8 +4029,6 @@ def _test_selfhosted_instance(cls, ie, hostname: str, skip, prefix, webpage=None
 
         if hostname in cls._INSTANCE_LIST:
             return True
-        if hostname in cls._DYNAMIC_INSTANCE_LIST:
-            return True
 
         if hostname in cls._IMPOSSIBLE_HOSTNAMES:
             return False
@@ -3999,7 +4045,7 @@ def _test_selfhosted_instance(cls, ie, hostname: str, skip, prefix, webpage=None
 
         if cls._probe_webpage(webpage) or cls._fetch_nodeinfo_software(ie, hostname) in cls._NODEINFO_SOFTWARE:
             # this is probably acceptable instance
-            cls._DYNAMIC_INSTANCE_LIST.add(hostname)
+            cls._INSTANCE_LIST.add(hostname)
             return True
 
         return False
@@ -4039,20 +4085,38 @@ def _probe_webpage(cls, webpage):
 
     @staticmethod
     def _fetch_nodeinfo_software(ie: 'InfoExtractor', hostname: 'str'):
+        """
+        Returns the software name in the nodeinfo of the host, or None if it has none.
+        Unless the request failed, the results are also cached on disk, for the number of seconds given by the
+        "selfhosted:nodeinfo_cache_ttl" extractor argument (default: a week)
+        """
         if hostname in SelfHostedInfoExtractor._NODEINFO_CACHE:
-            nodeinfo = SelfHostedInfoExtractor._NODEINFO_CACHE[hostname]
+            return SelfHostedInfoExtractor._NODEINFO_CACHE[hostname]
+
+        ttl = int_or_none(traverse_obj(ie._configuration_arg('nodeinfo_cache_ttl', ie_key='selfhosted'), 0))
+        if ttl is None:
+            ttl = SelfHostedInfoExtractor._NODEINFO_CACHE_TTL
+        cached = ie.cache.load('selfhosted-nodeinfo', hostname)
+        if cached and time.time() - (cached.get('timestamp') or 0) < ttl:
+            software = cached.get('software')
         else:
-            nodeinfo_href = ie._download_json(
+            res = ie._download_webpage_handle(
                 f'https://{hostname}/.well-known/nodeinfo', hostname,
-                'Downloading instance nodeinfo link', fatal=False)
-            nodeinfo_url = traverse_obj(nodeinfo_href, ('links', -1, 'href'))
-            if not nodeinfo_url:
-                return False
-
-            nodeinfo = ie._download_json(nodeinfo_url, hostname, 'Downloading instance nodeinfo')
-            SelfHostedInfoExtractor._NODEINFO_CACHE[hostname] = nodeinfo
-
-        return traverse_obj(nodeinfo, ('software', 'name'))
+                'Downloading instance nodeinfo link', fatal=False, expected_status=404)
+            if res is False:
+                # The host may only be down for now, so ask it again the next time
+                return None
+            content, urlh = res
+            software = None
+            nodeinfo_url = urlh.getcode() != 404 and traverse_obj(
+                ie._parse_json(content, hostname, fatal=False), ('links', -1, 'href'))
+            if nodeinfo_url:
+                nodeinfo = ie._download_json(nodeinfo_url, hostname, 'Downloading instance nodeinfo')
+                software = traverse_obj(nodeinfo, ('software', 'name'))
+            ie.cache.store('selfhosted-nodeinfo', hostname, {'software': software, 'timestamp': time.time()})
+
+        SelfHostedInfoExtractor._NODEINFO_CACHE[hostname] = software
+        return software
 
 
 class UnsupportedURLIE(InfoExtractor):
@@ -10,22 +10,23 @@
 if not os.environ.get('YTDLP_NO_LAZY_EXTRACTORS'):
     with contextlib.suppress(ImportError):
         from .lazy_extractors import *  # noqa: F403
-        from .lazy_extractors import _ALL_CLASSES
-        _SELFHOSTED_CLASSES = []
+        from .lazy_extractors import _ALL_CLASSES, _HOST_INDEX
         _LAZY_LOADER = True
 
 if not _LAZY_LOADER:
     from ._extractors import *  # noqa: F403
+    _HOST_INDEX = None  # noqa: F811
     _ALL_CLASSES = [  # noqa: F811
         klass
         for name, klass in globals().items()
         if name.endswith('IE') and name != 'GenericIE'
     ]
-    _SELFHOSTED_CLASSES = [
-        ie for ie in _ALL_CLASSES if ie._SELF_HOSTED
-    ]
     _ALL_CLASSES.append(GenericIE)  # noqa: F405
 
+_SELFHOSTED_CLASSES = [
+    ie for ie in _ALL_CLASSES if ie._SELF_HOSTED
+]
+
 globals().update(_PLUGIN_CLASSES)
 _ALL_CLASSES[:0] = _PLUGIN_CLASSES.values()
 
@@ -1,17638 +0,0 @@
-# coding: utf-8
-# AUTOMATICALLY GENERATED FILE. DO NOT EDIT.
-# Generated by ./devscripts/make_mastodon_instance_list.py
-from __future__ import unicode_literals
-
-instances = {
-    # list of instances here
-    "0.0n.ee",
-    "001.testing.cawfee.club",
-    "02.owncast.net",
-    "0371.uk",
-    "0lb.be",
-    "0rb.it",
-    "0v0.ch",
-    "0verti.me",
-    "0w0.is",
-    "0x123.org",
-    "0x237.net",
-    "0x3c.pl",
-    "0x40.au",
-    "0x4655.co.uk",
-    "0x50.ch",
-    "0xee.io",
-    "1.test.jorisgutjahr.eu",
-    "100terres.social",
-    "101010.pl",
-    "10211104.fedicity.net",
-    "103.social",
-    "1040ste.net",
-    "10mb.social",
-    "1132don.com",
-    "11n.org",
-    "1210.nl",
-    "1234.as",
-    "137i.de",
-    "13bells.com",
-    "1435.es",
-    "15-15-15.social",
-    "1745.info",
-    "17th.me",
-    "184.im",
-    "19marbles.org",
-    "1d6.lol",
-    "1dhfsbbdpv4wshuyc6197nymcfeqqkfvy9.tupambae.org",
-    "1girl.vip",
-    "1m2lab.anvil.top",
-    "1nd33d.social",
-    "1password.social",
-    "1uca.com",
-    "200418.xyz",
-    "23.illuminati.org",
-    "23.social",
-    "280562.com",
-    "285936586.masto.host",
-    "2c.taoetc.org",
-    "2pxnl.de",
-    "2sheds.online",
-    "30d.org",
-    "333thats33s.cc",
-    "338338.xyz",
-    "3615.computer",
-    "366.koyomi.online",
-    "386898.xyz",
-    "39sounds.net",
-    "3dart.social",
-    "3deca.official.jp",
-    "3dp.chat",
-    "3rdstone.cc",
-    "3rdwall.net",
-    "3v.is",
-    "3xhelix.com",
-    "3zi.ru",
-    "41020.social",
-    "430022.xyz",
-    "433.world",
-    "438punk.house",
-    "4458644.xyz",
-    "451.place",
-    "4791.hinusif.work",
-    "4bear.com",
-    "4four.org",
-    "4liberty.one",
-    "500plus.slavistapl.eu.org",
-    "503junk.house",
-    "5280.city",
-    "56kbits.cloud",
-    "5dollah.click",
-    "5lb.co",
-    "60228.dev",
-    "60jj.masto.host",
-    "6502.social",
-    "6510.nu",
-    "666.glitchwit.ch",
-    "67nb.com",
-    "6paperplanes.net",
-    "6t.vc",
-    "7144.party",
-    "7a4.pp.ua",
-    "7group.social",
-    "7rg.de",
-    "7snowrin.net",
-    "7td.org",
-    "802.3ether.net",
-    "8030a0.social",
-    "80chars.io",
-    "8633.pm",
-    "8bit.red",
-    "8bit.social",
-    "8bitar.io",
-    "8d5m.club",
-    "8shiki.moo.jp",
-    "907.life",
-    "915.social",
-    "9600bps.com",
-    "9dd39ea1-2b18-4484-a29b-701efe543226.tvt.moe",
-    "9kb.me",
-    "a-l-e-x.cz",
-    "a-social.techtransthai.org",
-    "a.bnuuy.fyi",
-    "a.brody.zone",
-    "a.dags.dk",
-    "a.dhbit.ca",
-    "a.doskel.net",
-    "a.farook.org",
-    "a.gawlinski.com",
-    "a.jerl.zone",
-    "a.katgirl.club",
-    "a.lufimianet.jp",
-    "a.minuscule.space",
-    "a.n0id.space",
-    "a.nti.social",
-    "a.palindro.me.uk",
-    "a.rathersafe.social",
-    "a.sapphic.online",
-    "a.softer.network",
-    "a.soopy.moe",
-    "a.tela.moe",
-    "a.xerimorph.net",
-    "a11y.info",
-    "a11y.social",
-    "a16zw.com",
-    "a17k.social",
-    "a1computers.social",
-    "a2mi.social",
-    "aa.nikola.love",
-    "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa.aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa.aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa.aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa.firefish.nz",
-    "aachen.social",
-    "aadils.computer",
-    "aana.site",
-    "ababil.au",
-    "abairthusa.scot",
-    "abando.social",
-    "abandoned.systems",
-    "abc.mika.xyz",
-    "abcro.cloud",
-    "abdl.link",
-    "abend.social",
-    "aberrantwinds.bond",
-    "abide.social",
-    "abitmu.ch",
-    "abolish.social",
-    "about-the-author.online",
-    "about.krivosik.cz",
-    "about.to.be.nota.live",
-    "abouthere.uk",
-    "abpe.org",
-    "abraham.social",
-    "abraham.su",
-    "abraum.social",
-    "abshoff.social",
-    "absurd.social",
-    "abypom.work",
-    "abyss.fun",
-    "abyssdomain.expert",
-    "academe.social",
-    "academia.pub",
-    "academiccloud.social",
-    "academictalk.org",
-    "acc4e.com",
-    "accessibility.social",
-    "accessnow.social",
-    "accioly.social",
-    "acespace.social",
-    "acg.mn",
-    "acg.ngo",
-    "acgn.ca",
-    "achi.masto.host",
-    "achrilock.social",
-    "acidental.de",
-    "acillba-coeur.com",
-    "acillba-lux.com",
-    "ack.nerdfight.online",
-    "acra.network",
-    "acrion.social",
-    "activity.kammeyer.me",
-    "activity.moobi.monster",
-    "activitypub.academy",
-    "activitypub.agates.io",
-    "activitypub.chariz.com",
-    "activitypub.cryptography.dog",
-    "activitypub.garmy.jp",
-    "activitypub.good.news",
-    "activitypub.kkdev.org",
-    "activitypub.lucamatei.com",
-    "activitypub.mnethome.de",
-    "activitypub.moziz.fi",
-    "activitypub.natalenko.name",
-    "activitypub.owenryan.us",
-    "activitypub.ssgmedia.net",
-    "activitypub.stigatle.no",
-    "ad-astra.moe",
-    "adamharis.com",
-    "adamisacson.com",
-    "adastra234.info",
-    "adforward.org",
-    "adg.tech",
-    "adhd.energy",
-    "adhd.recipes",
-    "adinfinitum.social",
-    "adistance.tk",
-    "adney.land",
-    "adtech.land",
-    "adtech.life",
-    "adulthood.lol",
-    "adultsocial.inet.party",
-    "advent.social",
-    "adventures.social",
-    "adventurousbeastie.eu",
-    "adxm.social",
-    "aelf.ee",
-    "aeternam.hostdon.ne.jp",
-    "aether.run",
-    "aethernet.social",
-    "aethy.com",
-    "aethyria.tech",
-    "afk.social",
-    "afn.game-host.mydns.jp",
-    "afnsocial.co",
-    "afop.social",
-    "afternoonauthor.online",
-    "afterspace.rocks",
-    "ag.ecarlate.app",
-    "agda.club",
-    "agency.spaceagency.space",
-    "agencycollective.masto.host",
-    "aggregator.social",
-    "agilealliance.social",
-    "agilodon.social",
-    "agnesta.ch",
-    "agora-thinktanks.social",
-    "agora.echelon.pl",
-    "agora.ilot.io",
-    "ahlers.xyz",
-    "ai.wiki",
-    "aidoru.cafe",
-    "ailbhean.co-shaoghal.net",
-    "aile.shark-harmonic.ts.net",
-    "aincrad.lol",
-    "aint.johnmark.org",
-    "aipub.social",
-    "air11.social",
-    "aircrew.rocks",
-    "airpollution.science",
-    "airwaves.social",
-    "aisler.social",
-    "aitor-sama.es",
-    "aiyoku.xyz",
-    "ajin.la",
-    "ajm-central.duckdns.org",
-    "ajtaci.club",
-    "ak-002.lab.void.lgbt",
-    "ak.angelstrapped.com",
-    "ak.banii.cafe",
-    "ak.cute.rest",
-    "ak.foxgirl.land",
-    "ak.gensokyo.shop",
-    "ak.hrmk.uk",
-    "ak.kabukimono.top",
-    "ak.kawen.space",
-    "ak.kazuma.family",
-    "ak.kumis.industries",
-    "ak.kyaruc.moe",
-    "ak.lavenderfield.xyz",
-    "ak.shinamikaidou42.com",
-    "ak.suzu-ya.info",
-    "ak.vern.cc",
-    "ak.yakumo.moe",
-    "ak.yumeka.xyz",
-    "ak.z.org",
-    "ak.zweitekassabitte.jetzt",
-    "ak1.monolith-rave.xyz",
-    "akademienl.social",
-    "akanechan.love",
-    "akari-network.jp",
-    "akasa.red",
-    "akasaka.org",
-    "akiba.party",
-    "akiba.social",
-    "akirin.hostdon.ne.jp",
-    "akk.de-lacom.be",
-    "akk.joelanders.net",
-    "akk.skelly.boo",
-    "akk.spacehost.dev",
-    "akk2.eniehack.net",
-    "akko.airis.dev",
-    "akko.bussy.pics",
-    "akko.cat-wo.men",
-    "akko.chir.rs",
-    "akko.constellatory.net",
-    "akko.contref.eu",
-    "akko.cuddlegirls.cafe",
-    "akko.disqordia.space",
-    "akko.eepy.zone",
-    "akko.elysium.gay",
-    "akko.erincandescent.net",
-    "akko.floofy.city",
-    "akko.gay-garden.no",
-    "akko.kalasarn.se",
-    "akko.lea.moe",
-    "akko.lightnovel-dungeon.de",
-    "akko.mornie.org",
-    "akko.quad.moe",
-    "akko.remorse.us",
-    "akko.spla.tech",
-    "akko.staging.e2net.social",
-    "akko.tuiter.ovh",
-    "akko.unix.dog",
-    "akko.wtf",
-    "akkoma-test.hiwaga.tech",
-    "akkoma.andho.xyz",
-    "akkoma.ascyltos.social",
-    "akkoma.asdfzdfj.xyz",
-    "akkoma.barkshark.xyz",
-    "akkoma.bat-pike.ts.net",
-    "akkoma.becutewith.me",
-    "akkoma.chez.chat",
-    "akkoma.clerval.com",
-    "akkoma.cormont.cyou",
-    "akkoma.cryptoschizo.club",
-    "akkoma.dev.wafrn.net",
-    "akkoma.dianthus.site",
-    "akkoma.dogphilosophy.net",
-    "akkoma.fawks.ie",
-    "akkoma.fireturtle.net",
-    "akkoma.flicke.red",
-    "akkoma.flitpix.net",
-    "akkoma.flyerdonut.net",
-    "akkoma.haru3.me",
-    "akkoma.kikuri.moe",
-    "akkoma.lilypadding.me",
-    "akkoma.marud.fr",
-    "akkoma.meows.gay",
-    "akkoma.mercurywork.shop",
-    "akkoma.miaowi.ng",
-    "akkoma.newt.li",
-    "akkoma.nl",
-    "akkoma.paranoiamachinery.com",
-    "akkoma.pfcd.me",
-    "akkoma.riley-tech.net",
-    "akkoma.sandhill.social",
-    "akkoma.scarlet.house",
-    "akkoma.shi4home.com",
-    "akkoma.social.raku.party",
-    "akkoma.spacehost.dev",
-    "akkoma.tbqdrn.de",
-    "akkoma.thesandbox.net",
-    "akkoma.till0196.com",
-    "akkoma.trwnh.com",
-    "akkoma.tungstenocean.xyz",
-    "akkoma.xn--pikabl-0xa.se",
-    "akkoma.yae.gay",
-    "akkoremaji.club",
-    "akkos.fritu.re",
-    "aklp.club",
-    "akm.hora.win",
-    "akm.longyap.name.my",
-    "akm.worldc.one",
-    "akuanduba.masto.host",
-    "ala.masto.host",
-    "alaskan.social",
-    "albanian.social",
-    "albaruthenica.masto.host",
-    "alcatir.com",
-    "alcove.website",
-    "aldr.social",
-    "alentours.cc",
-    "aleph.land",
-    "alex.kirk.at",
-    "alexandria.the1977project.org",
-    "alexcrawford.co.uk",
-    "alexvielmav.com",
-    "alexzeecomedy.com",
-    "alfajet.masto.host",
-    "algebra.chat",
-    "algufr.com",
-    "alice.haconiwa.hostdon.ne.jp",
-    "alice01.lab.rinsuki.net",
-    "alice486.com",
-    "alico.nexus",
-    "alien.insurrection.tech",
-    "aliensoup.social",
-    "alinke.com",
-    "alittle.social",
-    "alive.bar",
-    "allagar.masto.host",
-    "allamaraine.io",
-    "allegedly.illegitimate.technology",
-    "alleysmith.family",
-    "allforall.network",
-    "alliec.at",
-    "allies.buzz",
-    "allies.rocks",
-    "allies.social",
-    "allison.social",
-    "allovertheplace.ca",
-    "allowlist.fedi.tax",
-    "allpeep.social",
-    "allpro.social",
-    "allships.run",
-    "allthingsmusic.space",
-    "allthingstech.social",
-    "alltomorrows.party",
-    "almajlis.me",
-    "aloha-pink.monster",
-    "alonecomplex.xyz",
-    "alongtheray.social",
-    "alpaca.dad",
-    "alpaca.gold",
-    "alpaka.garden",
-    "alpaka.pictures",
-    "alpaka.social",
-    "alpha.polymaths.social",
-    "alphabetica.masto.host",
-    "alphapi.me",
-    "alpherg.fedicity.net",
-    "alpines.club",
-    "alt.lawndale.space",
-    "alteholz.social",
-    "altelectron.org.uk",
-    "altparty.social",
-    "alva.host",
-    "alvarado.social",
-    "alwayssleeping.com",
-    "alwyzon.social",
-    "amala.schwartzwelt.xyz",
-    "amami.paradigm-x.tokyo",
-    "amapin.love",
-    "amastodon.uk",
-    "amateurfunk.social",
-    "amaurot.city",
-    "ambercons.masto.host",
-    "amberpapilio.masto.host",
-    "ambition.rip",
-    "amble.quest",
-    "ambrosia.cafe",
-    "ambrosia.moe",
-    "amefur.asia",
-    "amenti.eu.org",
-    "america.social",
-    "amicale.net",
-    "amiga.team",
-    "amigos.family",
-    "amigosblasterradio.masto.host",
-    "amity.zone",
-    "amling.social",
-    "amok.recoil.org",
-    "amormor.art",
-    "amour.social",
-    "amphora.social",
-    "amst.io",
-    "amungus.duckdns.org",
-    "amynews.social",
-    "amyos.net",
-    "an.eldritch.gift",
-    "an.errant.cloud",
-    "an.exchange",
-    "an.uura.site",
-    "anagram.adapulawska.org",
-    "anakmanis.com",
-    "analogpixels.nl",
-    "anancus.fr",
-    "anandamide.net",
-    "anar.chi.st",
-    "anarchism.space",
-    "anarchy.center",
-    "anarchydica.net",
-    "anarres.family",
-    "anarshy.social",
-    "anasodon.com",
-    "andalucia.social",
-    "andeby.city",
-    "andersen.social",
-    "andrew.masto.host",
-    "andrew.xyz",
-    "andrews.me",
-    "androidbook2020.keiji.io",
-    "androiddev.social",
-    "androidmanife.st",
-    "andybalaam.uk.to",
-    "andyd.uk",
-    "andypiper.co.uk",
-    "angelou.club",
-    "anglophone.world",
-    "angrydome.au",
-    "angrytoday.com",
-    "ani.work",
-    "anikeen.social",
-    "animal-crossing.mastportal.info",
-    "animal.business",
-    "animalliberation.social",
-    "animeomake.com",
-    "aniy.jp",
-    "anml.io",
-    "annihilation.cafe",
-    "annihilation.social",
-    "anothersuper.social",
-    "ansible.jshwlkr.info",
-    "ansico.dk",
-    "ansiktsburk.se",
-    "antabaka.me",
-    "antani.cyou",
-    "antani.pm",
-    "antenna.toby.sh",
-    "anthem.shadowlan.net",
-    "anti-social.online",
-    "anti.undeadnetwork.de",
-    "anticapitalist.party",
-    "anticapitalista.it",
-    "anticapitalistcatgirl.club",
-    "anticom.world",
-    "antiquated.systems",
-    "antisleepdevice.de",
-    "antisocial.existentialdread.com",
-    "antisocial.kdn.hu",
-    "antisocial.ly",
-    "antisocial.science",
-    "antisocial.thebubble.noho.st",
-    "antisocial.worsethannothing.net",
-    "antisocialsocialnetwork.it",
-    "anubis.social",
-    "anus-jokes.social",
-    "anvil.social",
-    "any.dev",
-    "anythingdotshop.com",
-    "anywise.net",
-    "aoikaze.social",
-    "aoir.social",
-    "aovivo.millenium.red",
-    "ap-test-hf.yunochi.com",
-    "ap.alexjanka.com",
-    "ap.arkanosis.net",
-    "ap.dev.seungjin.net",
-    "ap.diegoveralli.net",
-    "ap.dny.social",
-    "ap.duh.org",
-    "ap.flogth.net",
-    "ap.hacktk.net",
-    "ap.insertapp.net",
-    "ap.ketsuben.red",
-    "ap.kinktodd.com",
-    "ap.ledeuns.net",
-    "ap.lep.wtf",
-    "ap.maladaptive.art",
-    "ap.mzyy94.com",
-    "ap.nil.im",
-    "ap.pachy.social",
-    "ap.remote-shell.net",
-    "ap.samueldr.com",
-    "ap.sanwon.kr",
-    "ap.silverseams.com",
-    "ap.stereo-graphica.com",
-    "ap.teletoot.nl",
-    "ap.third-branches.net",
-    "ap.tukejonny.net",
-    "ap.umedasp.co.jp",
-    "ap.wtr.app",
-    "ap.xabirequejo.eus",
-    "apeiron.aire.ml",
-    "apen.app",
-    "apkallu.us",
-    "apobangpo.space",
-    "apocalypse.net",
-    "apogee.polaris-1.work",
-    "apontaeclica.com",
-    "aposimz.net",
-    "apotheke.social",
-    "app.bikers.social",
-    "app.ediscovery.social",
-    "app.piberio.com",
-    "appcentric.social",
-    "appdot.net",
-    "appellate.ninja",
-    "appellate.social",
-    "apple2.org.za",
-    "appsignal.social",
-    "appy.cat",
-    "apricot.social",
-    "aprs.internaluse.net",
-    "apub.abstract.properties",
-    "aquariumofyourbrain.masto.host",
-    "aquatan.net",
-    "arabi.gay",
-    "arachnibot.masto.host",
-    "arachnid.town",
-    "araiguma.space",
-    "arasaka.biz",
-    "arasaka.vip",
-    "arbitrarymusings.com",
-    "arbre.chat",
-    "arc-en-ciel.hostdon.ne.jp",
-    "arcadellama.com",
-    "archaeo.social",
-    "archaeology.social",
-    "architektur.social",
-    "archived.software",
-    "arcticwind.social",
-    "arcww.network",
-    "ard.social",
-    "are.sexy",
-    "area51.social",
-    "arewe.social",
-    "arezzo.one",
-    "arff.archandle.net",
-    "argilus.pl",
-    "argon.city",
-    "argonauten.space",
-    "arguos.com",
-    "arielfinn.social",
-    "ariesmc21.com",
-    "arihi.me",
-    "arilinghl.masto.host",
-    "arion.social",
-    "arkm.social",
-    "arktos.social",
-    "arnesocial.de",
-    "arousal.support",
-    "arrifana.org",
-    "arroyo.novoa.nagoya",
-    "arrrgh.online",
-    "arsenalfc.social",
-    "arsrobotics.org",
-    "art-software.fr",
-    "art.glitch.monster",
-    "art.librepunk.club",
-    "art.mara.guru",
-    "art.rainevixen.com",
-    "artatomic.social",
-    "arthropod.social",
-    "arti.stic.earth",
-    "artichokenetwork.com",
-    "artindekker.com",
-    "artistalley.space",
-    "artoot.xyz",
-    "artsandculture.social",
-    "artsio.com",
-    "artsocial.boston",
-    "arvr.social",
-    "arxiv.social",
-    "as89.it",
-    "as9136.social",
-    "asaps-sm.lafayettegroup.com",
-    "asbestosden.org",
-    "aschaffenburg.social",
-    "asciifortrouble.com",
-    "asciisnowman.yachts",
-    "ascule.mooo.com",
-    "asentientbot.ca",
-    "asha-varadhi.com",
-    "ashka.me",
-    "ashlande.rs",
-    "ashworth.io",
-    "asimon.org",
-    "aso.moe",
-    "asocial.cabin.digital",
-    "asocial.dauden.me",
-    "asocial.dk",
-    "asocial.grimstack.xyz",
-    "asocial.jacquesetmichel.fr",
-    "asocial.social",
-    "aspa.masto.host",
-    "asphodel.rip",
-    "aspiringknight.com",
-    "ass.matus.cc",
-    "assemblag.es",
-    "asso.lgbt",
-    "assonance.org",
-    "assortedflotsam.com",
-    "asstodon.social",
-    "astatide.lgbt",
-    "astatidelgbt.wpcomstaging.com",
-    "astheriver.art",
-    "astolfo.social",
-    "astoundingteam.com",
-    "astral.camp",
-    "astrel.la",
-    "astrian.social",
-    "astro.clinic",
-    "astrodon.social",
-    "astrolaboratory.club",
-    "astronomy.city",
-    "astronomy.social",
-    "astrosocial.space",
-    "astrotwitter.masto.host",
-    "astrum.social",
-    "asylum.nz",
-    "asylum.void.rehab",
-    "async.social",
-    "ataakkoma.spacehost.dev",
-    "ataakkoma2.spacehost.dev",
-    "atamastodon22.spacehost.dev",
-    "atanazmastodon.spacehost.dev",
-    "atanazmastodon2.spacehost.dev",
-    "atdt.cc",
-    "atelier-schweighofer.at",
-    "atergens.com",
-    "atheopagan.net",
-    "atilla.im",
-    "atis.social",
-    "atmasto.com",
-    "atomicpoet.org",
-    "atsuchan.page",
-    "atsudon.fedicity.net",
-    "atta.ch.to",
-    "attractive.space",
-    "attreno.fr",
-    "atx.pub",
-    "atx.social",
-    "aucubin.social",
-    "audax.social",
-    "audio-video.tech",
-    "audiophile-mastodon.com",
-    "augsburg.social",
-    "august-don.site",
-    "auralis.space",
-    "aurochs.moosecow.net",
-    "aurorign.social",
-    "aus.lgbt",
-    "aus.social",
-    "ausglam.space",
-    "ausmed.social",
-    "austintexas.social",
-    "aut.social",
-    "autism.social",
-    "autisticnomad.social",
-    "autisticpri.de",
-    "autistics.life",
-    "autobots.run",
-    "autonomous.zone",
-    "auxim.social",
-    "av8r.ca",
-    "avali.hu",
-    "avali.one",
-    "avantwhatever.org",
-    "avatastic.uk",
-    "avery.garden",
-    "averyfun.party",
-    "avgeek.social",
-    "avision-it.social",
-    "avventurierosolitario.zeruhur.icu",
-    "awai.hostdon.ne.jp",
-    "awau.social",
-    "awawa.cat",
-    "awawa.club",
-    "awawa.meo.ws",
-    "awaymessage.club",
-    "awes.one",
-    "awesomein.space",
-    "awjeez.help",
-    "awoo.chat",
-    "awoo.chown.me",
-    "awoo.fai.st",
-    "awoo.fi",
-    "awoo.space",
-    "awoo.st",
-    "awoo.stormcrest.org",
-    "awoo.studio",
-    "awoo.town",
-    "awp.news",
-    "awscommunity.social",
-    "awwter.online",
-    "axbom.me",
-    "axiomeval.social",
-    "axle.social",
-    "ayom.media",
-    "az.social",
-    "azemet.space",
-    "b.falai.se",
-    "b.kretschmann.social",
-    "b.skobk.in",
-    "b0.ax",
-    "b0x.social",
-    "b612.icu",
-    "b612.me",
-    "b65.me.in",
-    "babaded.tk",
-    "babblebox.net",
-    "babicz.social",
-    "babka.social",
-    "babyfurs.social",
-    "babyhollywood.social",
-    "babymetal.party",
-    "bachmann.social",
-    "backend-staging.newsmast.org",
-    "backend.newsmast.org",
-    "backpacklife.social",
-    "backs.day",
-    "backyard.cloud",
-    "bad.posts.gallery",
-    "badgay.net",
-    "badgergirl.games",
-    "badpixels.be",
-    "bae.st",
-    "bagarrosphere.fr",
-    "baguette-it.social",
-    "bahn.social",
-    "baka.social",
-    "bakedbean.xyz",
-    "bakunet.me",
-    "balfolk.social",
-    "balkan.fedive.rs",
-    "ballhaus.community",
-    "baltic.social",
-    "bambuswald.social",
-    "bananachips.club",
-    "bananen.software",
-    "bangdream.space",
-    "bangdream.tokyo",
-    "banjo.town",
-    "banter.danny.page",
-    "bantu.social",
-    "baraag.net",
-    "baracek.online",
-    "baram.me",
-    "baranovski.info",
-    "baraposting.online",
-    "barca.dix.asia",
-    "barcamp.social",
-    "bardown.space",
-    "barelysocial.org",
-    "barisa.social",
-    "bark.lgbt",
-    "barkclub.xyz",
-    "barkle.chat",
-    "barkoczy.social",
-    "barkshark.xyz",
-    "barnes.social",
-    "barrow.social",
-    "barrowof.gay",
-    "barruf.eu",
-    "bart.tobskep.com",
-    "bas.tn",
-    "base.lc",
-    "base.nospy.net",
-    "based.zone",
-    "basidium.club",
-    "basilisk.gallery",
-    "bassam.social",
-    "bassrock.social",
-    "basstdn.jp",
-    "bat.chat",
-    "bat.netbat.net",
-    "batchats.net",
-    "bath.social",
-    "battle7.net",
-    "battleangels.net",
-    "baudigital.social",
-    "baum.social",
-    "bauphysik.social",
-    "bayern-online.news",
-    "bayes.club",
-    "bb.010206.xyz",
-    "bb5.social",
-    "bbbdn.jp",
-    "bbiz.io",
-    "bbq.golf",
-    "bbq.snoot.com",
-    "bbs.aerian.icu",
-    "bbs.kawa-kun.com",
-    "bcast.guru",
-    "bcn.fedi.cat",
-    "bcom.moe",
-    "bcostodon.lol",
-    "bdx.town",
-    "be-lieve.hostdon.ne.jp",
-    "be58.co",
-    "beach.city",
-    "beam.ta.rdis.dev",
-    "beamship.mpaq.org",
-    "bean.place",
-    "beantown.space",
-    "bearologics.social",
-    "bears.town",
-    "bearvideo.win",
-    "beatles.social",
-    "beaulieu.social",
-    "beausimensen.feder8.io",
-    "beautifullosers.org",
-    "bechster.dk",
-    "becker.pizza",
-    "beckerbyrd.com",
-    "become.trainsgender.today",
-    "bedlamnsqualor.masto.host",
-    "bee.owncast.jerma.party",
-    "beef-chicken-pork.beer",
-    "beef.moe",
-    "beefus.camp",
-    "beekeeping.ninja",
-    "beep.africa",
-    "beep.flawbee.net",
-    "beep.town",
-    "beepboop.one",
-    "beergeek.social",
-    "beerweek.lol",
-    "beery.beer",
-    "beeslink.com",
-    "behold.mylegendary.quest",
-    "beige.party",
-    "bell.bz",
-    "bellaciao.veer66.rocks",
-    "bellow.el.drit.ch",
-    "beltaine.day",
-    "bemrose.social",
-    "bencarneiro.com",
-    "bencollier.uk",
-    "bend.town",
-    "benedikts.social",
-    "benehomini.social",
-    "benis8bits.stream",
-    "benjamin.social",
-    "benlikestoco.de",
-    "bensie.social",
-    "benten.ch",
-    "benward.social",
-    "benz.masto.host",
-    "benz.social",
-    "benzo.fans",
-    "beo.social",
-    "beoriginal.social",
-    "beppo.online",
-    "bequeme-couch.de",
-    "beratna.net",
-    "bergamot.social",
-    "berlin-berlin.de",
-    "berlin.social",
-    "bern.social",
-    "berserker.town",
-    "bertha.social",
-    "bertshouse.social",
-    "best-friends.chat",
-    "besties.com",
-    "beta.5550d.xyz",
-    "beta.shimanami.online",
-    "beta.tapbots.social",
-    "betagravity.com",
-    "better.boston",
-    "betterconversations.online",
-    "betweenthelions.link",
-    "beutl.space",
-    "bewegung.social",
-    "beyond.forum",
-    "beyondgender.social",
-    "beyondwatts.social",
-    "beyonoyasashiisekai.hostdon.ne.jp",
-    "bfd.so",
-    "bfs.llc",
-    "bgarr.com",
-    "bgme.me",
-    "bhis.social",
-    "bhre.social",
-    "bibletalk.social",
-    "biblio.thekambattu.rocks",
-    "biblio.yargl.eu",
-    "biblioteca.lorelounge.it",
-    "biblioverse.online",
-    "biddul.ph",
-    "biden.lgbt",
-    "bidet.skibidi.social",
-    "bidule.menf.in",
-    "bien-etre.social",
-    "bifrost.berzerk.pl",
-    "big.cluboftone.com",
-    "big.trash.haus",
-    "bigballchunkyverse.online",
-    "bigchat.social",
-    "biggs.social",
-    "bigrat.social",
-    "bigshoulders.city",
-    "bihar.social",
-    "bikesare.cool",
-    "bikeshed.party",
-    "bikeshed.vibber.net",
-    "biketravel.photos",
-    "bilboed.tech",
-    "bild.maechler.cloud",
-    "bilder.kwk21.de",
-    "bildung.social",
-    "billsmafia.social",
-    "billys.mom",
-    "bimbo.social",
-    "binarystar.social",
-    "binarytales.social",
-    "binky.fish",
-    "biologists.social",
-    "bipeds.onl",
-    "biplus.date",
-    "biplus.social",
-    "birb.casa",
-    "birb.site",
-    "bird.rodeo",
-    "birdbox.party",
-    "birdbutt.com",
-    "birdhouse.social",
-    "birdinter.net",
-    "birdity.club",
-    "birdon.social",
-    "birds.social",
-    "birds.town",
-    "birdsite.jupiterslanding.social",
-    "birdsite.space",
-    "biscuit.town",
-    "bisset.me.uk",
-    "bitbang.social",
-    "bitforged.social",
-    "bitfudge.com",
-    "bitrot.cafe",
-    "bits.social",
-    "bitsandpixels.dev",
-    "bitwoods.duckdns.org",
-    "biu.im",
-    "bjd.social",
-    "bjgp.social",
-    "bk.cx",
-    "bkcastle.net",
-    "bla.daanberg.net",
-    "blaahaj.com",
-    "blabber.lu-rp.net",
-    "blabber.rocks",
-    "blackbirb.dev",
-    "blackqueer.life",
-    "blackrock.city",
-    "blackrocks.social",
-    "blackshuck.net",
-    "blackstar.cafe",
-    "blacksun.snowcrash.ovh",
-    "blacksun.social",
-    "blacktwitter.io",
-    "bladerunner.social",
-    "blah.rako.space",
-    "blahaj.finch.ink",
-    "blahaj.love",
-    "blahaj.ovh",
-    "blahaj.social",
-    "blahaj.tech",
-    "blahaj.zone",
-    "blahajbay.askiiart.net",
-    "blaisehartley.com",
-    "blan.cc",
-    "blander.ddnsfree.com",
-    "blankpad.net",
-    "blasius.club",
-    "blasmusik.social",
-    "blasto.cbc.lol",
-    "blat.at",
-    "blazinggophers.com",
-    "blieb.net",
-    "blimey.social",
-    "blimps.xyz",
-    "blind.lol",
-    "blips2.club",
-    "bliry.fr",
-    "bloade.social",
-    "blob.cat",
-    "blob.coffee",
-    "blobfox.coffee",
-    "blobfox.es",
-    "blockfowl.com",
-    "blockriot.com",
-    "blog.3dcandy.live",
-    "blog.arsrobotics.org",
-    "blog.auengun.net",
-    "blog.beaware.live",
-    "blog.everythingbagel.me",
-    "blog.fami.ga",
-    "blog.geekgo.tech",
-    "blog.gotosan.jp",
-    "blog.linux-help.org",
-    "blog.mapblog.xyz",
-    "blog.mbe.tv",
-    "blog.mistlake.net",
-    "blog.moth.social",
-    "blog.nizarus.tn",
-    "blog.rolandmoriz.de",
-    "blog.serverok.pl",
-    "blog.shiton.xyz",
-    "blog.sn4il.site",
-    "blog.stegemann.de",
-    "blog.troch.org",
-    "blog.wiwie.dk",
-    "blogator.com",
-    "blogg.helvetet.eu",
-    "blogi.social",
-    "blogsequenz.net",
-    "bloodfames.monster",
-    "bloom.surf",
-    "bloomfield.social",
-    "blooming-land.icu",
-    "bloor.tw",
-    "blop.social",
-    "blorbo.social",
-    "blovice.bahnhof.cz",
-    "blu.social",
-    "blub.social",
-    "blubrry.chat",
-    "blue-sky.world",
-    "blue-write.com",
-    "blue.misteli.in.net",
-    "blue.syaku.me",
-    "blue.yuv.pink",
-    "blueadair.net",
-    "blueand.red",
-    "bluebell.social",
-    "bluechakra.cloud",
-    "bluecifer.social",
-    "bluefox.social",
-    "bluelupine.social",
-    "bluenoser.me",
-    "blueplanet.social",
-    "bluetoot.hardill.me.uk",
-    "blueviolet.monster",
-    "blumenwie.se",
-    "blumpus.com",
-    "blurts.net",
-    "bmbl.fun",
-    "bms.social",
-    "bnamed.social",
-    "bne.social",
-    "bnnuy.space",
-    "bnuy.space",
-    "bnuy.zone",
-    "bobbinsrobots.com",
-    "bobs.social",
-    "bocchi.yamako-ya.com",
-    "body.social",
-    "boeck.social",
-    "boerdica.de",
-    "bog.social",
-    "boilerbeach.xyz",
-    "boilingcong.ee",
-    "boing.pieterhiemstra.nl",
-    "boing.world",
-    "boisterous.community",
-    "boitam.eu",
-    "bokantaj.o-k-i.net",
-    "bol.social",
-    "boldcity.social",
-    "boles.xyz",
-    "bolha.network",
-    "bolha.one",
-    "bolha.photos",
-    "bolha.review",
-    "bolha.us",
-    "bolingbroke.kr",
-    "bologna.one",
-    "bols.games",
-    "bondine.social",
-    "bondsdogs.com",
-    "bonequest.net",
-    "boner.camp",
-    "bonga.nu",
-    "bongo.social",
-    "bonito.cafe",
-    "bonk.expert",
-    "bonk.social",
-    "bonn.live",
-    "bonn.pics",
-    "bonn.rocks",
-    "bonn.social",
-    "bonobo.net",
-    "bonzi.uk",
-    "book.dadalo.pl",
-    "book.dansmonorage.blue",
-    "book.everythingbagel.me",
-    "book.fabulousfabs.fr",
-    "book.snailhuddle.org",
-    "bookclub.masto.host",
-    "bookish.community",
-    "bookrastinating.com",
-    "bookrastination.anyaforger.art",
-    "books.aleteoryx.me",
-    "books.babb.no",
-    "books.bimbiribase.xyz",
-    "books.boxpleats.com",
-    "books.brunn.email",
-    "books.casuallyblue.dev",
-    "books.chriswb.dev",
-    "books.duck.cafe",
-    "books.hccp.org",
-    "books.hvn.network",
-    "books.idas.social",
-    "books.ignifi.social",
-    "books.ihatebeinga.live",
-    "books.infosec.exchange",
-    "books.jacobhaddon.com",
-    "books.josh.tel",
-    "books.kestrelsnest.social",
-    "books.lightnovel-dungeon.de",
-    "books.maxzor.eu",
-    "books.mxhdr.net",
-    "books.norse.social",
-    "books.nvitucci.social",
-    "books.ourselves.space",
-    "books.paladyn.org",
-    "books.pfft.lol",
-    "books.pifferi.info",
-    "books.raphus.social",
-    "books.regenpfeifer.net",
-    "books.rhumbs.fr",
-    "books.rollnotice.com",
-    "books.solarpunk.moe",
-    "books.stoner.cafe",
-    "books.storydragon.nl",
-    "books.superawesomecorp.space",
-    "books.theunseen.city",
-    "books.underscore.world",
-    "books.variousbits.net",
-    "bookstodon.com",
-    "bookstodon.es",
-    "bookstodon.net",
-    "bookstodon.thestorygraph.com",
-    "booktodon.me",
-    "booktoot.club",
-    "booktoot.social",
-    "bookwor.ms",
-    "bookworm.nz",
-    "bookwyrm.adikos.net",
-    "bookwyrm.arroserlesnenuphars.ch",
-    "bookwyrm.cincodenada.com",
-    "bookwyrm.communitarium.org",
-    "bookwyrm.de",
-    "bookwyrm.fivest.one",
-    "bookwyrm.gatti.ninja",
-    "bookwyrm.hinanawi.net",
-    "bookwyrm.internationalotaku.com",
-    "bookwyrm.it",
-    "bookwyrm.joeydrew.studio",
-    "bookwyrm.kizaing.ca",
-    "bookwyrm.lond.com.br",
-    "bookwyrm.lovetux.net",
-    "bookwyrm.nops.red",
-    "bookwyrm.nx-pod.de",
-    "bookwyrm.offby1.net",
-    "bookwyrm.runarcn.no",
-    "bookwyrm.saayaa.space",
-    "bookwyrm.social",
-    "bookwyrm.steamedfish.org",
-    "bookwyrm.tardis.pw",
-    "bookwyrm.teamb.space",
-    "bookwyrm.tilde.zone",
-    "bookwyrm.undef.org.uk",
-    "bookwyrm.welhaba.mx",
-    "bookwyrm.wimmer-edv.de",
-    "bookwyrm.world",
-    "boop.city",
-    "boop.network",
-    "boopsnoot.de",
-    "boost.anotherfauxtographer.com",
-    "boosted.science",
-    "boosterfive.com",
-    "boostie.social",
-    "boosts.squirrel.pictures",
-    "bootblackcub.com",
-    "boothcomputing.social",
-    "boothtml.social",
-    "bopjoy.cafe",
-    "bora.army",
-    "borahae.love",
-    "borderland.tokyo",
-    "borderlandkeep.com",
-    "borderline.city",
-    "borg.social",
-    "borkr.one",
-    "boskovice.social",
-    "bostonmusic.online",
-    "bot.ave5.dev",
-    "bot.country",
-    "bot.fediver.se",
-    "bot.swiss.social",
-    "botany.social",
-    "boteden.com",
-    "bots.automatica.dev",
-    "bots.defencegeeks.net",
-    "bots.fedi.cr",
-    "bots.krohsnest.com",
-    "bots.kurator.tech",
-    "bots.social.balpha.de",
-    "botsin.space",
-    "botta.social",
-    "bottom.team",
-    "bottrill.social",
-    "botwerks.social",
-    "bouma.social",
-    "boumi.me",
-    "boundcovers.com",
-    "bouquins.zbeul.fr",
-    "bovi.social",
-    "bowlofpetunias.net",
-    "boy.s.cz",
-    "boymilk.cafe",
-    "boymoder.biz",
-    "boys-love.xyz",
-    "bqri.us",
-    "bracamontesman.cloud",
-    "brain.d.on-t.work",
-    "brain.worm.pink",
-    "brain404.com",
-    "brainofshawn.com",
-    "brainport.social",
-    "brainsteam.co.uk",
-    "brainstew.co",
-    "brainworms.io",
-    "brandenburg.social",
-    "brandontemplar.social",
-    "brands.town",
-    "brasiliana.museus.gov.br",
-    "braunschweig.social",
-    "brbn.social",
-    "breadandroses.cloud",
-    "breakdown.moe",
-    "breakpoint.cafe",
-    "breastcancer.biocomm.net",
-    "breastmilk.club",
-    "breeze.pictures",
-    "breeze.town",
-    "breizh.social",
-    "breloma.m0xee.net",
-    "bremen.digital",
-    "brettiverse.com",
-    "brettspiel.space",
-    "brettvormkopf.de",
-    "brgrealty.ap.social",
-    "brians.town",
-    "bridgy-federated.uc.r.appspot.com",
-    "bridport.pics",
-    "bridport.social",
-    "briefly.eric.pe",
-    "brien.hosted.spacebear.ee",
-    "bright.rosy-colored.space",
-    "brighteon.social",
-    "brignell.co",
-    "brinjal.org",
-    "brioco.art",
-    "brisingr.uk",
-    "broadcast.dduel.dev",
-    "broadcast.kyou.systems",
-    "broadcast.looplab.net",
-    "brockha.us",
-    "brocks.social",
-    "broken.graphics",
-    "brokenhedge.org",
-    "brokkoli.social",
-    "brontosin.space",
-    "bronyfurry.com",
-    "bropartment.party",
-    "brotka.st",
-    "brotkru.me",
-    "brso.social",
-    "brucknerite.net",
-    "bruder.space",
-    "bruh.social",
-    "brunch.zone",
-    "brunetti.social",
-    "brunic.com",
-    "brunskif.home.kg",
-    "brunty.social",
-    "brvt.telent.net",
-    "bs-x.org",
-    "bscabl.ddns.net",
-    "bsd.network",
-    "bsljo.life",
-    "btr.net",
-    "btrfly.social",
-    "bts.chat",
-    "buc.ci",
-    "bucher.naturesmeatcandy.org",
-    "buckaroo.city",
-    "buecher.pnpde.social",
-    "buff.tomboyfan.club",
-    "buildthatwallandmakeamericagreatagain.trumpislovetrumpis.life",
-    "bullcity.space",
-    "bumscode.com",
-    "bun.social",
-    "bunbers.org",
-    "bundyo.com",
-    "buni.ee",
-    "bunni.social",
-    "bunny.blue",
-    "bunny.cafe",
-    "bunny.cloud",
-    "bunny.family",
-    "bunny.social",
-    "bunnyanarchy.org",
-    "buns.work",
-    "bunsan-sugoi.xyz",
-    "bunt.social",
-    "bunte-kuechenabenteuer.de",
-    "burgetts.net",
-    "burgh.umenoka.link",
-    "burma.social",
-    "burningbird.net",
-    "burningboard.net",
-    "burningnebula.net",
-    "burnout.cafe",
-    "burnthis.town",
-    "burro.win",
-    "bushwacker.masto.host",
-    "bussela.de",
-    "bussmann.social",
-    "buttplug.engineer",
-    "buttplug.zone",
-    "butts.team",
-    "buttsex.restaurant",
-    "bv.umbrellix.org",
-    "bvb.social",
-    "bvp.me",
-    "bw.bierzilla.fr",
-    "bw.fiat-tux.fr",
-    "bw.hainry.fr",
-    "bw.heraut.eu",
-    "bw.kudomaru.com",
-    "bw.travelpandas.eu",
-    "bwa.social",
-    "by8.space",
-    "bygg.land",
-    "bynight.cafe",
-    "byrdbrnz.me",
-    "bytearray.eu",
-    "byteheaven.net",
-    "bytepark.social",
-    "bytes.programming.dev",
-    "bytetower.social",
-    "byteunion.com",
-    "bzh.social",
-    "c-onner.de",
-    "c-onner.net",
-    "c-onr.de",
-    "c.im",
-    "c.ryanccn.dev",
-    "c.wtf",
-    "c18.masto.host",
-    "c1t0d0.ch",
-    "c2bdon.net",
-    "c3d2.social",
-    "c4.social",
-    "c4b4-2409-8a50-4420-e960-845-4fa1-394f-f2d.ngrok-free.app",
-    "c64.social",
-    "c7.io",
-    "cackl.io",
-    "cackle.doop.coop",
-    "cadexos.com",
-    "cafe.diagonalley.club",
-    "cafe.marquiskurt.net",
-    "cafe.mycelium.locahlo.st",
-    "caffeinated.nb-tort.com",
-    "cailincat.cloud",
-    "calamity.masto.host",
-    "calamity.world",
-    "calc.04.si",
-    "calckey.7ka.org",
-    "calckey.warrows.fr",
-    "calculate.social",
-    "calders.us",
-    "caleida.com",
-    "calendario-lunar.com",
-    "calico.social",
-    "caliguehunters.monster",
-    "calobar.club",
-    "caluettefamily.com",
-    "caluser.social",
-    "cambrian.social",
-    "camp.crates.im",
-    "camp.smolnet.org",
-    "campdarling.com",
-    "campduffel.social",
-    "camthoms.com",
-    "canada.masto.host",
-    "canard.club",
-    "canary.fedibird.com",
-    "canarygateway.com",
-    "canbaysal.com",
-    "candycorn.club",
-    "cannibal.cafe",
-    "cansoccer.social",
-    "cantina.tatooine.space",
-    "cantrika.id",
-    "canzan.chat",
-    "capcom.social",
-    "capitalism.party",
-    "carabunga.net",
-    "careers.lesbianblockbuster.com",
-    "carelesswhisper.nl",
-    "carfree.city",
-    "carhenge.club",
-    "cariad.social",
-    "carl.fish",
-    "carman.social",
-    "carpdiem.online",
-    "cartbefore.horse",
-    "cartersville.social",
-    "cartoons.guido-kuehn.de",
-    "cas.social",
-    "cascadia.games",
-    "cascarilla.social",
-    "caseitor.masto.host",
-    "cashscam.us",
-    "cast.craftam.app",
-    "cast.drownthewitch.com",
-    "cast.hidyn.com",
-    "cast.iamtalon.me",
-    "cast.kyanos.one",
-    "cast.lmao.sh",
-    "cast.samsai.eu",
-    "cast.schuerenbo.de",
-    "cast.whytheyfight.com",
-    "castelia.cafe",
-    "castilla.social",
-    "castlecannon.house",
-    "castodon.nl",
-    "cat.nekoea.red",
-    "catalan.social",
-    "catboomer.net",
-    "catcatnya.com",
-    "catdog.masto.host",
-    "catdon.life",
-    "catfood.electronblueberry.xyz",
-    "catgirl.center",
-    "catgirl.download",
-    "catgirls.party",
-    "catharsis.cafe",
-    "cathode.church",
-    "cathrow.social",
-    "catnerdz.thoshis.net",
-    "catnest.net",
-    "catodon.social",
-    "catops.social",
-    "cats.city",
-    "cats.mastodon.musk.sucks",
-    "cats.social",
-    "catskill.social",
-    "catswords.social",
-    "cau.se",
-    "cauchy.ap.social",
-    "cavalina.net",
-    "cave.mancave.de",
-    "cave.tunstall.in",
-    "cawfee.club",
-    "cb.janusworx.com",
-    "cbctech.app",
-    "cbulock.social",
-    "cc.bi",
-    "cc.chat",
-    "cc.pwntoney.com",
-    "cc2.at",
-    "cccccmake.de",
-    "ccccoding.club",
-    "cccwi.social",
-    "ccghell.com",
-    "ccrvb.com",
-    "cd0.nl",
-    "cdrum.photos",
-    "cdrum.social",
-    "cdt.social",
-    "ceejayoz.io",
-    "ceilidh.online",
-    "celehner.com",
-    "celsius.letemps.social",
-    "celt.social",
-    "celtic.blue",
-    "censurion.tk",
-    "centertown.fun",
-    "cerb.monster",
-    "cerb.social",
-    "cerulean.ink",
-    "cesarstwokwadratowe.com",
-    "cesspool.city",
-    "cfultz.com",
-    "cgtest.masto.host",
-    "ch.9zn.net",
-    "chabant.social",
-    "chablis.social",
-    "chai.kibbutz.gay",
-    "chai.simcha.gay",
-    "chai.wtf",
-    "chain.closetoya.com",
-    "chalet.soda.jp.eu.org",
-    "chalk.moe",
-    "champion-walker.uk",
-    "champis.social",
-    "chan.thebeans.zip",
-    "changelog.social",
-    "channels.im",
-    "chaos-gp.social",
-    "chaos.futbol",
-    "chaos.social",
-    "chaos.xmitter.net",
-    "chaosfem.tw",
-    "chaosfurs.social",
-    "chaosphere.hostdon.jp",
-    "chaotic.fun",
-    "chaotic.social",
-    "chaoticneutral.space",
-    "chaoticqueers.org",
-    "characters.cafe",
-    "charade.social",
-    "charafre.noela.moe",
-    "charcha.cc",
-    "charmander.us.to",
-    "charr.engineer",
-    "chasmcity.net",
-    "chat.globulous.com",
-    "chat.kagu-tsuchi.com",
-    "chat.noelle.codes",
-    "chat.qca.net",
-    "chat.radialbog9.com",
-    "chat.trueffzido.de",
-    "chat.vr3d.social",
-    "chats.camjam.page",
-    "chatsubo.bar",
-    "chatter.llamarific.social",
-    "chatter.monster",
-    "chatter.quux.world",
-    "chatterchannel.social",
-    "chattergrid.com",
-    "chattervista.com",
-    "chattingdarkly.org",
-    "chatty.littleblue.men",
-    "checked.social",
-    "cheddarcrackers.club",
-    "chee.party",
-    "cheekibreeki.express",
-    "cheeseburger.social",
-    "chelmi.info",
-    "chelseafc.social",
-    "cheney.net",
-    "cherprang.xfk48.com",
-    "cherryberry.pink",
-    "cherrykitten.gay",
-    "chiasm.app",
-    "chicklens.foolbazar.eu",
-    "chik.social",
-    "childcare.hostdon.ne.jp",
-    "chilemasto.casa",
-    "chillout.chat",
-    "chillpeep.zone",
-    "chillr.de",
-    "chin-co-ne.co",
-    "chinwag.org",
-    "chipprbots.com",
-    "chireiden.chaotic.ninja",
-    "chirp.enworld.org",
-    "chirp.zadzmo.org",
-    "chirpi.de",
-    "chirpnest.net",
-    "chirpr.terrenly.com",
-    "chitter.xyz",
-    "chittr.sbargv2.com",
-    "cho.yukiya.me",
-    "chocot.art",
-    "choom.club",
-    "chrisalemany.ca",
-    "christenson.social",
-    "christmas.tattoo",
-    "christuncensored.com",
-    "chriswood.social",
-    "chromachan.net",
-    "chromium.social",
-    "chswx.social",
-    "chtn.uk",
-    "chuckya-testing.owo69.me",
-    "chud.space",
-    "ciberlandia.pt",
-    "ciecuo.club",
-    "cijber.social",
-    "cincy.social",
-    "cinematicftp.com",
-    "cinephile-social.me",
-    "cinnamond.social",
-    "ciprianisbsmnt.space",
-    "circle.lab.occm.cc",
-    "circle.wolfi.ee",
-    "circleofamber.com",
-    "circumstances.run",
-    "circus.town",
-    "cirno9.mynetgear.com",
-    "cirrus.zinzolin.fr",
-    "citrus.farm",
-    "citycountry.town",
-    "citydweller.social",
-    "cityofchicago.live",
-    "ciurdarea.nu",
-    "ck.katzen.cafe",
-    "ck.villisek.fr",
-    "cl0ckw0rkw1nd.world",
-    "clacks.link",
-    "clacks.social",
-    "claes.social",
-    "clanwood.com",
-    "clar.ke",
-    "claris.cf",
-    "claristdon.link",
-    "classicalmusic.social",
-    "classicchirp.com",
-    "claudia-knit.com",
-    "claudreenjackson.tv",
-    "clearpilled.lgbt",
-    "cleary.au",
-    "cleverdevil.club",
-    "clew.lol",
-    "click.ba.it",
-    "click.unternet.org",
-    "cliff.social",
-    "climatejustice.global",
-    "climatejustice.rocks",
-    "climatejustice.social",
-    "climatescienc.es",
-    "clj.social",
-    "cloaca.social",
-    "clocktower.social",
-    "clockwork.monster",
-    "closed.place",
-    "closednetwork.social",
-    "cloth.social",
-    "clothesfreelife.com",
-    "cloud-native.social",
-    "cloud-social.xyz",
-    "cloud.goat.rocks",
-    "cloud.zannoni.eu",
-    "cloudfiction.social",
-    "cloudflare.social",
-    "cloudhub.social",
-    "cloudisland.nz",
-    "cloudkeeper.dev",
-    "cloudycrux.es",
-    "clown.center",
-    "clown.hiho.jp",
-    "clown.university",
-    "clowntown.app",
-    "clq.im",
-    "clrk.space",
-    "clttr.it",
-    "club.ctrlist.org",
-    "club.elephantus.moe",
-    "club.pati.to",
-    "clubcyberia.co",
-    "clube.social",
-    "clubnf.us",
-    "clvr.bfan.cc",
-    "cmdr.social",
-    "cmm.fyi",
-    "cn.fedi.bar",
-    "coach.masto.host",
-    "coales.co",
-    "coasterfreak88.net",
-    "cobaltkiss.blue",
-    "cocaine.moe",
-    "cock.fish",
-    "cock.social",
-    "cockandballtortu.re",
-    "cocks.network",
-    "cocoaheads.social",
-    "coconatsu.co",
-    "cocoronavi.net",
-    "code4lib.social",
-    "cofe.rocks",
-    "coffeebean.social",
-    "coffeeeldritch.art",
-    "coffeesip-np-glow.fly.dev",
-    "coinop.social",
-    "col.social",
-    "coldrick.me.uk",
-    "colearn.social",
-    "coleman.social",
-    "coletivos.org",
-    "collantes.social",
-    "collapsible.systems",
-    "collar.place",
-    "colliderbias.net",
-    "collins-corner.cc",
-    "colloquium.social",
-    "colloquy.social",
-    "colonels.world",
-    "colony.red",
-    "colorid.es",
-    "colourless.solar",
-    "colovo.com",
-    "colter.social",
-    "com.thephysics.xyz",
-    "coma.pictures",
-    "coma.social",
-    "comal.app",
-    "comam.es",
-    "come-together.nl",
-    "comelibros.club",
-    "comfy.blue",
-    "comfyboy.club",
-    "comics.mitch.science",
-    "comics.town",
-    "comicscamp.club",
-    "comm.cx",
-    "comm.shotinthegun.com",
-    "commfurnity.com",
-    "commodore.social",
-    "commons.whatiwanttoknow.org",
-    "comms.gsd.foundation",
-    "commune.anarchist.gay",
-    "communicating.cypherpunk.observer",
-    "communist.accountant",
-    "community.ballhaus.dk",
-    "community.uncensoredwisdom.com",
-    "comp.lain.la",
-    "companies.social",
-    "compassion.host",
-    "compliance-hub.social",
-    "compostintraining.club",
-    "compound.social",
-    "computational.agency",
-    "computer-club.online",
-    "computerclub.social",
-    "computerfairi.es",
-    "computering.pro",
-    "computermuseum.social",
-    "comunidad.nvda.es",
-    "comunitate.ascorcluj.com",
-    "con.tar.mx",
-    "conejo.network",
-    "conesphere.social",
-    "configure.ac",
-    "confraria.xyz",
-    "congressof.rave.nz",
-    "conidia2023.masto.host",
-    "conjectures.org",
-    "connect.american-online.net",
-    "connect.braydmedia.de",
-    "connect.daniel.digital",
-    "connect.mbl.social",
-    "connect.milesnmiles.net",
-    "connected.so",
-    "connectified.com",
-    "connectop.us",
-    "considerate.social",
-    "construction.social",
-    "consudon.club",
-    "contentnation.net",
-    "contenttechtodon.org",
-    "continuousdelivery.social",
-    "controlfreak.live",
-    "conventionexplorers.com",
-    "conversafiada.net",
-    "convo.casa",
-    "conwayfamily.org",
-    "coofdylabs.social",
-    "cooler.mom",
-    "coolkids.house",
-    "coolmathgam.es",
-    "cooltrans.men",
-    "coolworld.cc",
-    "coop.masto.host",
-    "cooperate.social",
-    "copland.social",
-    "coplus.social",
-    "core.s-config.com",
-    "corgi.farm",
-    "corkboard.social",
-    "corn.social",
-    "corneill.es",
-    "cornerbooth.chat",
-    "cornerof.world",
-    "cornichon.me",
-    "cornputer.org",
-    "corp.social",
-    "corponauts.net",
-    "corporaterunaways.social",
-    "corporatetravel.social",
-    "correctiv.social",
-    "corrigan.moe",
-    "corteximplant.com",
-    "cosmedn.net",
-    "cosmic-purple.monster",
-    "cosmicsmack.me",
-    "cosmin.at",
-    "cosmos.social",
-    "cosocial.ca",
-    "cosocial.engineering",
-    "cosplay.earth",
-    "costodon.social",
-    "cosy.inkling.social",
-    "cottoncandy.cafe",
-    "couch.beerriot.com",
-    "countrycharmnews.com",
-    "courbet.social",
-    "cousteaudivers.social",
-    "covelline.social",
-    "cow.army",
-    "coywolf.social",
-    "cozy.chat",
-    "cozy.lgbt",
-    "cozy.seraph.red",
-    "cozymech.com",
-    "cpunks.xyz",
-    "cr8r.gg",
-    "crab.garden",
-    "craba.cab",
-    "crabby.fyi",
-    "crabcake.social",
-    "crabsin.space",
-    "craftbeer.social",
-    "craftgoblin.club",
-    "craftodon.social",
-    "craftopi.art",
-    "crag.social",
-    "craigmurdo.co.uk",
-    "crashloop.social",
-    "crashtodon.net",
-    "cratersedge.ca",
-    "crazylab.online",
-    "crb.re",
-    "creative.ai",
-    "creativewriting.social",
-    "creators.social",
-    "creature.social",
-    "crescent.ct2.io",
-    "crime-net.org",
-    "crime.st",
-    "crimew.gay",
-    "criomagan.scot",
-    "crisps.papill0n.org",
-    "crispsandwi.ch",
-    "crispycone.social",
-    "critcare.social",
-    "criticalrolestats.com",
-    "crittercave.net",
-    "critters.us.to",
-    "critz.social",
-    "crlf.ninja",
-    "cro.pics",
-    "cro.social",
-    "cromulent.social",
-    "crooklyn.social",
-    "crossdon.com",
-    "crosshatch.fun",
-    "crosspage.nl",
-    "crosstalk.tech",
-    "crowleyclub.com",
-    "crows.icu",
-    "crowsnest.social",
-    "cruisers.social",
-    "crunchy.social",
-    "crxb.cc",
-    "cryofault.net",
-    "crypt.lol",
-    "crypto-don.net",
-    "cryptodon.chat",
-    "cryptodon.lol",
-    "cryptotooter.com",
-    "crystallake.camp",
-    "cs.social",
-    "csaba.crcr.works",
-    "csed.social",
-    "csisac.social",
-    "csu.coffee",
-    "csunday95.space",
-    "ctdl.co",
-    "cthonic.club",
-    "cthulhu.love",
-    "cubalibre.social",
-    "cubes.link",
-    "cubhub.social",
-    "cuche.cc",
-    "cuddly.space",
-    "cultiv.social",
-    "cultofshiv.wtf",
-    "cultofzoe.com",
-    "cultur.social",
-    "cultusmechanic.us",
-    "cum.camp",
-    "cum.salon",
-    "cunnin.me",
-    "cuonda.social",
-    "cupoftea.social",
-    "curious.simio.us",
-    "curious.social",
-    "curiouscabbit.social",
-    "curling.social",
-    "curmudgeon.cafe",
-    "cursoryreview.org",
-    "curttech.com",
-    "cute.butts.moe",
-    "cute.church",
-    "cute.is",
-    "cuteferret.party",
-    "cuthrell.com",
-    "cutie.city",
-    "cutiecluster.cc",
-    "cuties.cloud",
-    "cuties.social",
-    "cuyes.mooo.com",
-    "cville.online",
-    "cvjca.xn--q9jyb4c",
-    "cwb.social",
-    "cya.grandcyan.com",
-    "cyanistes.daedelys.org",
-    "cyber-dragon-sphere.x10.mx",
-    "cyber.digital-cache.cloud",
-    "cyber.ms",
-    "cyber.pnyhf.eu",
-    "cyber.scamdemic.party",
-    "cybercult.biz",
-    "cybercuties.net",
-    "cyberdeck.social",
-    "cyberfurz.social",
-    "cybergladius.social",
-    "cyberglot.lol",
-    "cybergov.de",
-    "cybermage.sh",
-    "cyberpasti.me",
-    "cyberplace.social",
-    "cyberpunk.earth",
-    "cyberpunk.lol",
-    "cybersecurity.masto.host",
-    "cybersecurity.theater",
-    "cyberspace.rodeo",
-    "cybersulu.ninja",
-    "cybervillains.com",
-    "cyboot.in.ua",
-    "cybr.es",
-    "cynikobecny.cz",
-    "cyphered.masto.host",
-    "cypherpunk.life",
-    "cytag.nl",
-    "czech-press.eu",
-    "czinege.social",
-    "cztwitter.cz",
-    "d-64.social",
-    "d-shoot.net",
-    "d.c-cha.cc",
-    "d.mrzm.io",
-    "d.ntauthority.me",
-    "d.sh",
-    "d20.social",
-    "d3f4ult.space",
-    "d3stodon.com",
-    "daan.social",
-    "dabr.ca",
-    "dabzyum.masto.host",
-    "dacharycarey.social",
-    "dads.cool",
-    "dads.so",
-    "daedal.io",
-    "daemonica.net",
-    "dagegenbewegen.social",
-    "dair-community.social",
-    "daisippai.f5.si",
-    "dan.mastohon.com",
-    "danampersanderic.social",
-    "danaskallman.es",
-    "dancefight.club",
-    "danlife.co",
-    "dannythe.site",
-    "danonidon.azarakko.net",
-    "dansu.org",
-    "dantappanphotos.com",
-    "dao.chinese.org",
-    "daotodon.me",
-    "dara.li",
-    "dariox.club",
-    "dark-elves.social",
-    "darkfriend.social",
-    "darkmoon.social",
-    "darknight-coffee-cannabis.club",
-    "darknight-coffee.de",
-    "darkpenguin.social",
-    "darkshade.social",
-    "darksky.social",
-    "darktundra.xyz",
-    "darkwitch.net",
-    "darmstadt.social",
-    "darnell.ooo",
-    "darringaming.com",
-    "darticulate.com",
-    "darui.work",
-    "dasforum.org",
-    "dasgelobteland.art",
-    "dasnetzundich.de",
-    "dasuniversum.social",
-    "dat-a.com",
-    "data-folks.masto.host",
-    "dataare.cool",
-    "database.club",
-    "databug.social",
-    "datachimps.eu",
-    "datacorner.social",
-    "datak.duckdns.org",
-    "dataplatform.social",
-    "datasci.social",
-    "datboi.network",
-    "datflow.tech",
-    "davewinter.dev",
-    "davidized.social",
-    "dawdling.net",
-    "daydream.ink",
-    "daystorm.netz.org",
-    "daytongang.social",
-    "dbcohen.rocks",
-    "dbg.social",
-    "dc801.space",
-    "dcae.fyi",
-    "dcentralisedmedia.com",
-    "dcerberus.com",
-    "dcj.me",
-    "dcntrlzd.co",
-    "dctr.uk",
-    "dcxxiv.com",
-    "dea42.social",
-    "deacon.social",
-    "deadbeef.social",
-    "deadbirdsite.com",
-    "deadinsi.de",
-    "deadlymilehigh.club",
-    "deadreckoning.cc",
-    "deaf.group",
-    "debula.ml",
-    "decayable.ink",
-    "decco.net",
-    "decentralis.social",
-    "decentralised.social",
-    "decept.org",
-    "deception.codes",
-    "deckard.pub",
-    "declin.eu",
-    "decommodify.com",
-    "deep13.social",
-    "deepalenight.com",
-    "deepmay.social",
-    "deepspace.cafe",
-    "deepspace.gay",
-    "deepspace.social",
-    "deepthought.infullflow.net",
-    "deepwoodsocial.net",
-    "defcon.social",
-    "deff.no",
-    "definitely.social",
-    "degrowth.social",
-    "dekadensverket.se",
-    "dekain.icu",
-    "dekkia.com",
-    "delab.re",
-    "delaeuforia.com",
-    "delaylama.de",
-    "delirium.masto.host",
-    "deliverabilit.ie",
-    "delmenhorst.social",
-    "delregno.social",
-    "dembowski.social",
-    "dementedandsadbut.social",
-    "demiboy.gay",
-    "demigod.bar",
-    "demo.allpeep.com",
-    "demo.kirk.at",
-    "democ.horse",
-    "demon.haus",
-    "demon.princess.pet",
-    "demon.social",
-    "demoncore.info",
-    "demons.social",
-    "demonview.wito.bar",
-    "demtech.global",
-    "den.420131269.xyz",
-    "den.den.nohost.me",
-    "den.shuymn.me",
-    "denden.world",
-    "denizens.social",
-    "dennis.dieploegers.de",
-    "denton.social",
-    "denvr.social",
-    "deppenkessel.de",
-    "derekhockett.com",
-    "derekmartinorg.network.thedoodleproject.net",
-    "derez.zone",
-    "derg.one",
-    "derg.social",
-    "derg.zone",
-    "dergnation.org",
-    "dergz.com",
-    "derpy.masto.host",
-    "dersonic.de",
-    "desir.social",
-    "destabled.com",
-    "desu.social",
-    "det.social",
-    "detmi.social",
-    "detroit.lol",
-    "detroitriotcity.com",
-    "dev-friendica.mrpetovan.com",
-    "dev-null.io",
-    "dev.ard.social",
-    "dev.bolha.us",
-    "dev.brighteon.social",
-    "dev.equel.social",
-    "dev.evazero.club",
-    "dev.fedibird.com",
-    "dev.furries.club",
-    "dev.goonj.xyz",
-    "dev.handon.club",
-    "dev.ipv6.social",
-    "dev.joinkitsune.org",
-    "dev.joinsharkey.org",
-    "dev.magincia.cafe",
-    "dev.mstdn-jp.site",
-    "dev.mw.nmfun.net",
-    "dev.neodb.prvcy.page",
-    "dev.opensocial.space",
-    "dev.pixelfed.ch",
-    "dev.timotheejulien.fr",
-    "dev.toot.earth",
-    "dev.uwuzu.net",
-    "dev.win-bit.ru",
-    "dev.winscloud.net",
-    "dev.zeroes.ca",
-    "dev01.mstdn.misaca.network",
-    "dev1.nya.social",
-    "dev2.fedibird.com",
-    "devaneios.millenium.red",
-    "devco.social",
-    "devdilettante.com",
-    "developerlink.com",
-    "developers.live",
-    "developerszion.com",
-    "devianze.city",
-    "devil-children-alitaso.com",
-    "devolver.social",
-    "devon.social",
-    "devotion.al",
-    "devs.live",
-    "devschile.social",
-    "devsigner.best",
-    "devsociety.eu",
-    "devsrv.farhan.codes",
-    "devtest.zhoal.pw",
-    "devtools.social",
-    "dewbert.mastodon.site",
-    "dewbert.social",
-    "dewp.space",
-    "dfir.social",
-    "dftba.club",
-    "dh.social",
-    "dhbenihana.jp",
-    "dhelonious.letz.dev",
-    "dhtstudios.space",
-    "dhub.social",
-    "diablocanyon1.com",
-    "dial.modem.show",
-    "dialog.mikroblog.at",
-    "dialup.cafe",
-    "dialup.space",
-    "diaspodon.fr",
-    "diaspora.im",
-    "diblasio.social",
-    "dica.interfel.de",
-    "dica.siverlag.de",
-    "dice.camp",
-    "diddlyfx.space",
-    "die-linke.social",
-    "die-partei.social",
-    "digforfire.org",
-    "digineko.net",
-    "digipres.club",
-    "digisociety.social",
-    "digitaal66.social",
-    "digital.kitsune.construction",
-    "digitalcourage.photo",
-    "digitalcourage.social",
-    "digitaldarkage.cc",
-    "digitaldata.social",
-    "digitalnomads.social",
-    "digitalpioneers.social",
-    "digitalstuntfactory.com",
-    "digressive.me",
-    "dima.wiso.uni-hamburg.de",
-    "dimension.host",
-    "dimick.social",
-    "dimspace.com",
-    "dimsumdams.xyz",
-    "dindon.one",
-    "dingdash.com",
-    "dingo.network",
-    "dingus.business",
-    "dipshit.space",
-    "dis-le.de",
-    "disabled.social",
-    "disco.grtsk.com",
-    "discordian.social",
-    "discourse.helenprejean.org",
-    "discover.freedica.org",
-    "discuss.smash.today",
-    "discuss.systems",
-    "disiviva.tips",
-    "diskette.online",
-    "disobey.net",
-    "disperfected.com",
-    "display.whenpeople.live",
-    "displayeurope.social",
-    "dissociat.ing",
-    "distant.social",
-    "distraction.party",
-    "ditto.ngrok.app",
-    "ditto.pub",
-    "divas.joburg",
-    "diversity.kitchen",
-    "dizl.de",
-    "dizmal.red",
-    "djanzu.tokyo",
-    "dje.li",
-    "djs.social",
-    "djsumdog.com",
-    "dju.social",
-    "dkm.cloud",
-    "dline.xyz",
-    "dlvn.cc",
-    "dlx.pink",
-    "dly.se",
-    "dlyang.tk",
-    "dm824.fedicity.net",
-    "dmb.bfan.cc",
-    "dmrty.net",
-    "dmv.community",
-    "dnk.todon.de",
-    "dnsimple.social",
-    "dobbs.town",
-    "doble.ee",
-    "docker.masto.pt",
-    "docviper.de",
-    "does.social",
-    "doesnm.cc",
-    "doesstuff.social",
-    "doesthings.online",
-    "dog-pound.de",
-    "dogbottom.com",
-    "doggo.masto.host",
-    "doghouse.social",
-    "dogno.se",
-    "dogo.pictures",
-    "dogs.chat",
-    "dogs.photos",
-    "dogsports.social",
-    "dogtyping.net",
-    "doll.social",
-    "dolphin.rodeo",
-    "dom.ke",
-    "dom.social",
-    "domentus.nl",
-    "dommes.supremegoddesses.com",
-    "don-dev.r-pe.net",
-    "don.academist.jp",
-    "don.blognot.co",
-    "don.dondododon.com",
-    "don.fetus.jp",
-    "don.gomasy.jp",
-    "don.hammons.llc",
-    "don.kenmo.fm",
-    "don.kofuk.org",
-    "don.kumarin.co",
-    "don.kuropon.dev",
-    "don.leno3s.net",
-    "don.linxx.net",
-    "don.luhrck.com",
-    "don.m2hq.net",
-    "don.mamemo.online",
-    "don.mosasa.dog",
-    "don.n00q.net",
-    "don.nakochi.me",
-    "don.naritapoyo.net",
-    "don.neet.co.jp",
-    "don.nekoport.com",
-    "don.nemuimon.jp",
-    "don.neso.tech",
-    "don.nzws.me",
-    "don.paltee.net",
-    "don.r-pe.net",
-    "don.rag.pub",
-    "don.secretbatcave.co.uk",
-    "don.taprix.org",
-    "don.tbully.me",
-    "don.tpc3.org",
-    "don.vonbergcompany.de",
-    "don.wakamesoba98.net",
-    "don.wsoft.ws",
-    "don.zr23.aomori.jp",
-    "don.zu2.org",
-    "don2.inux39.me",
-    "donadvr.de",
-    "dondon.breydon.id.au",
-    "dondondon.installation00.org",
-    "donkey.social",
-    "donot.dot1x.me",
-    "donotban.com",
-    "donotsta.re",
-    "donphan.social",
-    "dont-panic.quest",
-    "dood.net",
-    "doodeman.org",
-    "dook.business",
-    "dootdoot.comnetcomdotnet.org",
-    "dope.bz",
-    "dorset.social",
-    "dosgame.club",
-    "dotexperiment.org",
-    "dotgr.id",
-    "dotnet.social",
-    "douban.city",
-    "doublemalt.social",
-    "douchi.space",
-    "doujin.biz",
-    "doulxamer.carnetdepunitions.fr",
-    "dovac.org",
-    "downbad.fr",
-    "dowondam.space",
-    "doyle.boston",
-    "dpm.social",
-    "dpw.social",
-    "dr.xn--eckxdwa8bwdza.com",
-    "draggar.cat",
-    "dragn.gay",
-    "dragon-fly.club",
-    "dragon-lair.social",
-    "dragon.navy",
-    "dragon.style",
-    "dragonchat.org",
-    "dragons.social",
-    "dragonscave.space",
-    "dragonsnest.online",
-    "dragontavern.social",
-    "dram.group",
-    "drcassone.social",
-    "drcit.social",
-    "dre.casa",
-    "dreamers-guild.net",
-    "dreamersreality.dev",
-    "dreamin.online",
-    "dresden.network",
-    "dresserfamily.social",
-    "drewtoot.com",
-    "drewwestcott.co.uk",
-    "drg.nz",
-    "drgns.cc",
-    "drgns.org",
-    "dri.masto.host",
-    "driveinsaturday.org",
-    "drizzle-damp.net",
-    "drk.network",
-    "drk.st",
-    "drobny.blog",
-    "drohm.eu",
-    "droolware.social",
-    "dropshare.social",
-    "drosophila.social",
-    "drosselkom.de",
-    "drum.afrocenter.com",
-    "drumbum42.com",
-    "drumcorps.social",
-    "drumstodon.net",
-    "drupal.community",
-    "drykath.red",
-    "dsc.re",
-    "dsj-toot.com",
-    "dt.gl",
-    "dtg.social",
-    "dtp-mstdn.jp",
-    "du.capricom.info",
-    "dubnation.social",
-    "duchess.gay",
-    "duck.haus",
-    "duckbridge.immigrantcity.social",
-    "duckpon.de",
-    "dudes.keinpfusch.net",
-    "dudu.best",
-    "dudu.sdnie.fun",
-    "duisburg.social",
-    "duk.space",
-    "dulc.es",
-    "dumbfuckingweb.site",
-    "dumbo.e-kobi.com",
-    "dumpster.social",
-    "duncanstephen.net",
-    "dungeoncrawler.world",
-    "dungeons.social",
-    "durdle.social",
-    "durel.org",
-    "durugotasawu.ecymbe.com",
-    "dusky.photos",
-    "dustbuster.club",
-    "dutchcaribbean.social",
-    "duwa.ng",
-    "dwx.social",
-    "dylanjuran.me",
-    "dym.sh",
-    "dymersion.com",
-    "dynasty.football",
-    "dynlinux.io",
-    "dysfunction.social",
-    "dz.social",
-    "dznr.org",
-    "e.co.za",
-    "e.fo",
-    "e.jymuoyu.com",
-    "e5n.cc",
-    "e621.one",
-    "ear.li",
-    "earfolds.com",
-    "earldouglas.social",
-    "earpnation.social",
-    "earthclub.one",
-    "earthlings.social",
-    "earthstream.social",
-    "east17.org",
-    "easttexas.social",
-    "easy.saramara.ai",
-    "eat.fruits.social",
-    "eattra.sh",
-    "eay.social",
-    "ebel.social",
-    "ebf.social",
-    "ebin.eila.me",
-    "ebooks.social",
-    "ebrt.eu",
-    "ebuds.world",
-    "echidna.chimaira.net",
-    "echo.tinyblip.com",
-    "echoes.stolen.day",
-    "ecko.magicstone.dev",
-    "eclecticmedia.owncast.tv",
-    "ecoevo.social",
-    "ecologie.social",
-    "econtwitter.net",
-    "ecotri.be",
-    "ed-beck.com",
-    "edafe.social",
-    "eddyssofa.com",
-    "ede.social",
-    "edensama.moe",
-    "edequalsaweso.me",
-    "edfoc.org.uk",
-    "edge.allpeep.com",
-    "edge.dunkel.cloud",
-    "edge.taruntarun.net",
-    "edgy.social",
-    "edi.social",
-    "ediverse.vip",
-    "edm.haus",
-    "edolas.world",
-    "edtechme.org",
-    "edtechyogi.com",
-    "education.masto.host",
-    "educhat.social",
-    "edumasto.org",
-    "edusocial.it",
-    "edutalk.social",
-    "eeee.no",
-    "eegle.cloud",
-    "eepy.life",
-    "eepy.moe",
-    "eepy.space",
-    "eepy.zone",
-    "efdn.club",
-    "effy.space",
-    "eggcult.org",
-    "eggplant.place",
-    "eggplant.social",
-    "egirl.social",
-    "egovernment-podcast.com",
-    "ehakat.manfre.net",
-    "ehnit.com",
-    "ehr.scot",
-    "eicker.news",
-    "eientei.org",
-    "eigadon.net",
-    "eight-bamboo.com",
-    "eightpoint.app",
-    "eihei.net",
-    "eikon.refchat.net",
-    "eimsbuettel.social",
-    "einbeck.social",
-    "einestages.friediversum.de",
-    "eitelh.uber.space",
-    "eka.rodeo",
-    "el-spot.xyz",
-    "el5.net",
-    "elb.cloud",
-    "elbfotos.de",
-    "elbmatsch.de",
-    "elcofre.social",
-    "eldon.phukuile.com",
-    "eldritch.cafe",
-    "ele.godshome.info",
-    "electric.marf.space",
-    "electricglen.com",
-    "electro.social",
-    "electron.ninja",
-    "electronic-sports.club",
-    "electrospek.com",
-    "electroverse.tech",
-    "elefant.onetwoxu.de",
-    "elefant.social",
-    "elefanti.co",
-    "elekk.xyz",
-    "eleph.social",
-    "elephant.crime.group",
-    "elephantelephantelephant.com",
-    "eletusk.club",
-    "eleusis.social",
-    "eleutheria.masto.host",
-    "elevenjpnxi.hostdon.ne.jp",
-    "elezen.club",
-    "elict.net",
-    "eliitin-some.fi",
-    "eliyap.social",
-    "elizur.me",
-    "elle.systems",
-    "ellie.chat",
-    "ellie.social",
-    "ellieayla.net",
-    "ellis.social",
-    "elm.re",
-    "elmar.live",
-    "elmoncho.cc",
-    "eloi.social",
-    "elonsucks.org",
-    "elqadosh.synology.me",
-    "elquilosonriente.com",
-    "elsie.photo",
-    "elysian.city",
-    "elytra15.com",
-    "emacs.ch",
-    "emacsen.net",
-    "emancipe.es",
-    "embassy.social",
-    "embersof.life",
-    "embracing.space",
-    "emdev.ddns.net",
-    "emegilimma.sungo.cloud",
-    "emeraldsocial.org",
-    "emergencyalerts.app",
-    "emgv.social",
-    "emilcar.social",
-    "empty.cafe",
-    "emsdetten.mastodon.info",
-    "emu.social",
-    "en.gy",
-    "en.knubbel.me",
-    "en.osm.town",
-    "enby.army",
-    "enby.life",
-    "enchanted.social",
-    "enchantedherb.social",
-    "encom.social",
-    "end0.ru",
-    "enda.mccallig.com",
-    "endtimebelievers.com",
-    "endurance.racing",
-    "energiewende.social",
-    "energydon.fi",
-    "enfants-et-famille.podcasts.chat",
-    "engage.nonia.net",
-    "engasjert.mdg.no",
-    "engineered.space",
-    "enshittification.social",
-    "entangledstates.org",
-    "entire.social",
-    "entomophagy.world",
-    "entrepreneurlibre.org",
-    "entropyservice.com",
-    "entropysource.ru",
-    "eocene.epochal.quest",
-    "eorzea.photos",
-    "eorzea.social",
-    "eozygodon.com",
-    "ephemeral.glitch.social",
-    "ephemeralleo.x10.mx",
-    "epic.dansmonorage.blue",
-    "epicsheep.com",
-    "epicure.social",
-    "epicyon-test.fly.dev",
-    "epicyon.gemnoc.ca",
-    "epicyon.libreserver.org",
-    "epicyon.matoken.org",
-    "epicyon.sds-ip.de",
-    "epicyon.vikshepa.com",
-    "episcodon.net",
-    "epistolary.org",
-    "eplanets.univ-lyon1.fr",
-    "eponaauthor.social",
-    "epsilon-ix.masto.host",
-    "epsom.social",
-    "equel.social",
-    "equestria.social",
-    "equestrian.social",
-    "equinux.social",
-    "erfolgs-karma.masto.host",
-    "erginn.com",
-    "eri.narandu.de",
-    "eric.blog",
-    "erica.moe",
-    "ericf.social",
-    "ericpuryear.com",
-    "ericscouten.social",
-    "ernestoacosta.org",
-    "erotic.social",
-    "erotica.social",
-    "erratic.social",
-    "erscheinung47.com",
-    "ertona.net",
-    "es5nhc.ee",
-    "escaperooms.social",
-    "escobar.social",
-    "esglife.social",
-    "eskate.world",
-    "esolis.social",
-    "esoteric.party",
-    "esper.lol",
-    "esperanto.masto.host",
-    "espr.moe",
-    "espressoapps.social",
-    "esq.social",
-    "essjax.com",
-    "est.social",
-    "estrogen.cat",
-    "estrogen.network",
-    "estrogen.plus",
-    "et-position-targeted-christine.trycloudflare.com",
-    "etc.passwd.org",
-    "eternalaugust.com",
-    "etheirys.masto.host",
-    "etheirys.org",
-    "etnedal.net",
-    "etnedal.social",
-    "ettanity.uk",
-    "etvoila.blackleaf.ca",
-    "etw.uk",
-    "ety.cybre.stream",
-    "eu.mastodon.green",
-    "euonymus.xyz",
-    "euphorian.net",
-    "eupolicy.social",
-    "euproject.info",
-    "europhiles.uk",
-    "eutech.social",
-    "evamadeonline.com",
-    "eveningzoo.club",
-    "evenpace.social",
-    "eventide.town",
-    "everything.happens.horse",
-    "everythingbagel.social",
-    "evidence.town",
-    "evilcyberhacker.net",
-    "evilmeow.com",
-    "evokegts.umbrellix.org",
-    "eworld.social",
-    "exae.co",
-    "exapieco.jp",
-    "exercise.cafe",
-    "exile.social",
-    "existentialcrisis.link",
-    "existiert.ch",
-    "exito.social",
-    "exmormon.social",
-    "exoticsatlarge.apes.org.uk",
-    "expacahn.dedyn.io",
-    "expatasia.social",
-    "expersense.com",
-    "expl.red",
-    "exploit.social",
-    "explore.beer",
-    "explorer.niwego.com",
-    "expressional.social",
-    "exquisite.social",
-    "extec.uk",
-    "extraordinarygeeks.social",
-    "extropian.net",
-    "ey.montanha.de",
-    "eyes4you.org",
-    "eza.link",
-    "ezdog.org",
-    "ezone.fun",
-    "ezra.social",
-    "ezzz.au",
-    "f-ckendehoelle.de",
-    "f-social.techtransthai.org",
-    "f-t.net.pl",
-    "f.3ischn.de",
-    "f.akyr.one",
-    "f.aznas.eu.org",
-    "f.cz",
-    "f.decoherent.net",
-    "f.e4.pm",
-    "f.freinetz.ch",
-    "f.haeder.net",
-    "f.iroiro.party",
-    "f.kawa-kun.com",
-    "f.kidi.ng",
-    "f.kretschmann.social",
-    "f.kw8.eu",
-    "f.l4.pm",
-    "f.lakes.com.au",
-    "f.lapo.it",
-    "f.mae.wtf",
-    "f.matdoes.dev",
-    "f.openbdsm.org",
-    "f.praschnig.com",
-    "f.pressed.press",
-    "f.qdnx.org",
-    "f.reun.de",
-    "f.rubyowo.me",
-    "f.s2i4.us",
-    "f.slowblog.eu",
-    "f.spc.dedyn.io",
-    "f.thesolarrepublic.org",
-    "f.tkte.ch",
-    "f.vanbever.ch",
-    "f2b4791d1555.7988276.xyz",
-    "f2p.ms",
-    "f451.page",
-    "fabler.su",
-    "fabulous.social",
-    "face-house.fedicity.net",
-    "facebook.iamincredibly.gay",
-    "faculty.mastodon.stanford.edu",
-    "fadrienn.irlnc.org",
-    "faerie.tel",
-    "faerie.town",
-    "faf.photos",
-    "faf.social",
-    "faggot.zone",
-    "fairground.moe",
-    "fairly.social",
-    "fairmove.net",
-    "fairmuenchen.eineweltnetz.org",
-    "fairpoints.social",
-    "fairy.id",
-    "faith.2pp.uk",
-    "faithcollapsing.com",
-    "fakenham.cc",
-    "falafelprostitute.gay",
-    "falk.cafe",
-    "famichiki.jp",
-    "famick.social",
-    "familiar.moonlitfiction.com",
-    "famille.social",
-    "family.awcook.com",
-    "family.jmstevens.ca",
-    "family.unityds.co.uk",
-    "famline.ru",
-    "fanboys.social",
-    "fandom.garden",
-    "fandom.ink",
-    "fandomonium.space",
-    "fanfare.horse",
-    "fanfou.social",
-    "fangl.in",
-    "fantastic.earth",
-    "fantasyhockey.social",
-    "farbun.social",
-    "farlands.cafe",
-    "farmgarden.nora.social",
-    "farsi.cloud",
-    "farts.social",
-    "fashionsocial.host",
-    "fashionviz.xyz",
-    "faso.social",
-    "fasol.org",
-    "fastblur.win",
-    "fastcompany.social",
-    "fastly.social",
-    "fatlads.lol",
-    "fatpikachu.com",
-    "fault.stsecurity.moe",
-    "fauxtographer.ca",
-    "fax.social",
-    "fb.paulgeanta.com",
-    "fc.r8z.us",
-    "fca.fyrfli.social",
-    "fckmsk.social",
-    "fd.app.ftqq.com",
-    "fd.korako.me",
-    "fd.ooio.org",
-    "fd.s4if.dev",
-    "fd.toripota.com",
-    "fd.winklerfamilie.eu",
-    "fd00.de",
-    "fd00.space",
-    "fd8oz4oesnvit.hopto.org",
-    "fe.disroot.org",
-    "fe.dver.se",
-    "fearness.org",
-    "fed.2k36.org",
-    "fed.alexvan.in",
-    "fed.alteregocreations.com",
-    "fed.amodernist.com",
-    "fed.andinfinity.de",
-    "fed.brid.gy",
-    "fed.chris-shaw.dev",
-    "fed.contact",
-    "fed.dddug.in",
-    "fed.foad.me.uk",
-    "fed.freakaria.com",
-    "fed.fsub.de",
-    "fed.hacktastic.org",
-    "fed.hafs.in",
-    "fed.hvn.network",
-    "fed.jpegs.forsale",
-    "fed.kirbo.xyz",
-    "fed.leiden.digital",
-    "fed.m4cgyver.net",
-    "fed.mmhf.com",
-    "fed.morphtown.de",
-    "fed.moxco.fun",
-    "fed.mthie.com",
-    "fed.netr.cc",
-    "fed.qaz.red",
-    "fed.sakuyo.net",
-    "fed.sbcloud.cc",
-    "fed.sfl.pro.br",
-    "fed.sonnenmulde.at",
-    "fed.tardisproject.uk",
-    "fed.tomd.org",
-    "fed.toniotti.be",
-    "fed.uninsane.org",
-    "fed.uu.org",
-    "fed.vulpo.one",
-    "fed.wjboll.es",
-    "fed.xnor.in",
-    "fedded.melikule.xyz",
-    "federate.blogpocket.com",
-    "federate.me.uk",
-    "federate.social",
-    "federated.avtobiografia.com",
-    "federated.coffee",
-    "federated.glacier.dog",
-    "federated.hal.codes",
-    "federated.place",
-    "federated.press",
-    "federated.saagarjha.com",
-    "federatedfandom.net",
-    "federation.network",
-    "federation.p1k3.com",
-    "federation.sopelj.ca",
-    "federator.de",
-    "fedi-01.starlight.quest",
-    "fedi-02.starlight.quest",
-    "fedi.0x42.ch",
-    "fedi.1337lounge.de",
-    "fedi.5013.es",
-    "fedi.aap.my.id",
-    "fedi.abbie.cc",
-    "fedi.absturztau.be",
-    "fedi.acornfarmer.dev",
-    "fedi.adyxax.org",
-    "fedi.aeracode.org",
-    "fedi.ahavah.gay",
-    "fedi.ahfrom.synology.me",
-    "fedi.ajmaradiaga.com",
-    "fedi.almeroth.com",
-    "fedi.anarchy.moe",
-    "fedi.andrlik.org",
-    "fedi.aniskov.com",
-    "fedi.arcane.blue",
-    "fedi.aria.dog",
-    "fedi.arkadi.one",
-    "fedi.ashhhleyyy.dev",
-    "fedi.ashl.dev",
-    "fedi.astrid.tech",
-    "fedi.at",
-    "fedi.azumanga.gay",
-    "fedi.b0bmagic.eu.org",
-    "fedi.bapril.pl",
-    "fedi.bar",
-    "fedi.beehive.gay",
-    "fedi.beyleyisnot.moe",
-    "fedi.bpc.wtf",
-    "fedi.bry.so",
-    "fedi.buckket.org",
-    "fedi.bunny.church",
-    "fedi.byecorps.com",
-    "fedi.caliandroid.de",
-    "fedi.cass-dlcm.dev",
-    "fedi.cassfae.page",
-    "fedi.catboy.agency",
-    "fedi.catgirlin.space",
-    "fedi.cc",
-    "fedi.charlie2alpha.org",
-    "fedi.circuitlocution.com",
-    "fedi.ckir.net",
-    "fedi.co.za",
-    "fedi.codepenguin.io",
-    "fedi.commcon.xyz",
-    "fedi.complecwaft.com",
-    "fedi.computernewb.com",
-    "fedi.concho.bar",
-    "fedi.cr-net.be",
-    "fedi.cress.space",
-    "fedi.criminallycute.fi",
-    "fedi.ctu.cx",
-    "fedi.cyan.gay",
-    "fedi.cyberwitches.club",
-    "fedi.darlow.co.uk",
-    "fedi.datengraben.com",
-    "fedi.datenkastl.de",
-    "fedi.dav1d.xyz",
-    "fedi.decoded.legal",
-    "fedi.deemos.club",
-    "fedi.demelt.net",
-    "fedi.dequis.org",
-    "fedi.derg.world",
-    "fedi.donncha.is",
-    "fedi.donthaveaclueman.com",
-    "fedi.dors.et",
-    "fedi.dysphoric.space",
-    "fedi.ecdfeaa2.moe",
-    "fedi.ee",
-    "fedi.engineergam.ing",
-    "fedi.epix.icu",
-    "fedi.erin.lgbt",
-    "fedi.esgeroth.org",
-    "fedi.everycastlabs.uk",
-    "fedi.fancycade.xyz",
-    "fedi.fanlan.net",
-    "fedi.feltmarker.uk",
-    "fedi.femby.page",
-    "fedi.floof.social",
-    "fedi.flw5.de",
-    "fedi.fourhappylions.com",
-    "fedi.freevariable.com",
-    "fedi.friendzone.lol",
-    "fedi.fullstuck.net",
-    "fedi.fun",
-    "fedi.furfag.biz",
-    "fedi.fuzzy.click",
-    "fedi.gallegoiv.com",
-    "fedi.gang.st",
-    "fedi.garfieldairlines.net",
-    "fedi.gaykitty.lol",
-    "fedi.gbdev.io",
-    "fedi.gemlog.ca",
-    "fedi.gerwitz.com",
-    "fedi.getimiskon.xyz",
-    "fedi.gimon.zone",
-    "fedi.girlth.ing",
-    "fedi.grahamc.com",
-    "fedi.grh.am",
-    "fedi.gvisoc.com",
-    "fedi.halcyon-is.land",
-    "fedi.here.dk",
-    "fedi.hi.ls",
-    "fedi.home.ctu.cx",
-    "fedi.hu-e.uk",
-    "fedi.hyperreal.coffee",
-    "fedi.ikeran.org",
-    "fedi.imu.li",
-    "fedi.inclementaviary.uk",
-    "fedi.intragon.org",
-    "fedi.itepechi.me",
-    "fedi.jaenis.ch",
-    "fedi.jametek.com",
-    "fedi.jamiethegeek.com",
-    "fedi.jamsharp.net",
-    "fedi.jankjellin.se",
-    "fedi.jawsh.xyz",
-    "fedi.jayfreestone.com",
-    "fedi.jeremy.hu",
-    "fedi.joeydrew.studio",
-    "fedi.jordanh.net",
-    "fedi.jorun.dev",
-    "fedi.justinian.codes",
-    "fedi.karthikb351.com",
-    "fedi.karthikbalakrishnan.com",
-    "fedi.katze.sh",
-    "fedi.kcore.org",
-    "fedi.keinpfusch.net",
-    "fedi.kemonomimi.gay",
-    "fedi.kevinisageek.org",
-    "fedi.konsolenknecht.de",
-    "fedi.kugetsu.blog",
-    "fedi.kuiper.dev",
-    "fedi.labs.lgbt",
-    "fedi.lair.be",
-    "fedi.laker.tech",
-    "fedi.lamer-ethos.site",
-    "fedi.larlet.fr",
-    "fedi.lat",
-    "fedi.latenightpopcorn.com",
-    "fedi.lawngno.me",
-    "fedi.layer02.net",
-    "fedi.lecturify.net",
-    "fedi.lesbianforest.club",
-    "fedi.limes.pink",
-    "fedi.linus.dev",
-    "fedi.lt",
-    "fedi.lukelambert.com",
-    "fedi.lumey.dev",
-    "fedi.lur.no",
-    "fedi.lynnesbian.space",
-    "fedi.lzspz.nohost.me",
-    "fedi.machaj.info",
-    "fedi.makary.online",
-    "fedi.maneisacutie.club",
-    "fedi.marcoabis.it",
-    "fedi.marisakirisame.net",
-    "fedi.matsuu.org",
-    "fedi.mischivous.com",
-    "fedi.ml",
-    "fedi.mtth.org",
-    "fedi.munir.tokyo",
-    "fedi.mxrlkn.com",
-    "fedi.nano.lgbt",
-    "fedi.neon.moe",
-    "fedi.neuwirth.priv.at",
-    "fedi.niklas.network",
-    "fedi.nimblea.pe",
-    "fedi.nlpagan.net",
-    "fedi.nyc.what.if.ua",
-    "fedi.nzyme.org",
-    "fedi.oh2cil.radio",
-    "fedi.omada.cafe",
-    "fedi.openmtx.com",
-    "fedi.opensourcestories.org",
-    "fedi.osp.gay",
-    "fedi.owldog.dev",
-    "fedi.owo.justdied.com",
-    "fedi.pavluk.org",
-    "fedi.pcwizards.nl",
-    "fedi.phun.club",
-    "fedi.phy25.com",
-    "fedi.pupbrained.xyz",
-    "fedi.python-podcast.de",
-    "fedi.qrok.me",
-    "fedi.queercomputerclub.ca",
-    "fedi.queerdorks.club",
-    "fedi.quiescent.nexus",
-    "fedi.quiet.horse",
-    "fedi.rafal06.dev",
-    "fedi.raventhemaker.com",
-    "fedi.recursivegarden.com",
-    "fedi.redsky.monster",
-    "fedi.reflog.me",
-    "fedi.reimu.info",
-    "fedi.rfiori.com",
-    "fedi.rib.gay",
-    "fedi.rosiemma.online",
-    "fedi.rrr.sh",
-    "fedi.rubikoid.ru",
-    "fedi.sal.dev",
-    "fedi.sbnet.uk",
-    "fedi.science",
-    "fedi.science-practice.com",
-    "fedi.selfprivacy.org",
-    "fedi.serena.lgbt",
-    "fedi.seriousbusiness.international",
-    "fedi.sernik.tech",
-    "fedi.shard.news",
-    "fedi.shinomin.me",
-    "fedi.shorks.gay",
-    "fedi.simonwillison.net",
-    "fedi.skladka.net",
-    "fedi.slimegirl.social",
-    "fedi.sloppylinux.com",
-    "fedi.snowyhills.xyz",
-    "fedi.sofita.noho.st",
-    "fedi.softwareguild.org",
-    "fedi.solibre.de",
-    "fedi.solimano.org",
-    "fedi.space",
-    "fedi.sphericalcow.space",
-    "fedi.splatoon3.ink",
-    "fedi.srijan.dev",
-    "fedi.sszczyrb.dev",
-    "fedi.steph.tools",
-    "fedi.stuvel.eu",
-    "fedi.suffix.be",
-    "fedi.summershome.org",
-    "fedi.sutty.nl",
-    "fedi.suzi.moe",
-    "fedi.svita.cz",
-    "fedi.sysartist.com",
-    "fedi.system64.dev",
-    "fedi.t0z.org",
-    "fedi.talktodan.com",
-    "fedi.tasossah.com",
-    "fedi.tax",
-    "fedi.tengu.space",
-    "fedi.tesaguri.club",
-    "fedi.tfnux.org",
-    "fedi.theepicblock.nl",
-    "fedi.tilde.green",
-    "fedi.timstrutzi.at",
-    "fedi.tin-can.tech",
-    "fedi.topaz.id.au",
-    "fedi.treeoflifecomic.com",
-    "fedi.trenkner.net",
-    "fedi.triodug.com",
-    "fedi.truth-sandwich.com",
-    "fedi.turbofish.cc",
-    "fedi.tycho.space",
-    "fedi.underscore.world",
-    "fedi.vale.rocks",
-    "fedi.valtlai.fi",
-    "fedi.vimmy.cfd",
-    "fedi.vinodjam.com",
-    "fedi.vision",
-    "fedi.vituperio.xyz",
-    "fedi.voc.pet",
-    "fedi.voltaicforge.com",
-    "fedi.walrusz.hu",
-    "fedi.wersdoerfer.de",
-    "fedi.wilde.pl",
-    "fedi.winscloud.net",
-    "fedi.wlcx.industries",
-    "fedi.wolfe.garden",
-    "fedi.wondernetwork.com",
-    "fedi.worf.win",
-    "fedi.wormers.net",
-    "fedi.xaloc.space",
-    "fedi.xamk.fi",
-    "fedi.xerz.one",
-    "fedi.xinu.me",
-    "fedi.xirion.net",
-    "fedi.yaf.ai",
-    "fedi.yesmap.net",
-    "fedi.yrret.me",
-    "fedi.yuka.dev",
-    "fedi.yukari.in",
-    "fedi.z8s.de",
-    "fedi.zak.ee",
-    "fedi.zvr.gr",
-    "fedi1.net",
-    "fedia.social",
-    "fedibird.com",
-    "fediblock.ing",
-    "fedibot.dev",
-    "fedibulle.com",
-    "fedica.ch",
-    "fedicy.us.to",
-    "fedida.com",
-    "fedifeed.net",
-    "fediffusion.art",
-    "fedified.com",
-    "fedifriends.social",
-    "fedigram.me",
-    "fedigroups.social",
-    "fedihome.stefanomarinelli.it",
-    "fedihub.de",
-    "fedihum.org",
-    "fedii.xn--n3haa.ws",
-    "fedilab.de",
-    "fedilove.cyou",
-    "fedimon.uk",
-    "fedinerds.net",
-    "fedinerds.social",
-    "fediphilosophy.org",
-    "fediphoto.cc",
-    "fedipix.de",
-    "fedipixel.com",
-    "fedired.lat",
-    "fedirunner.com",
-    "fedisabled.social",
-    "fediscience.org",
-    "fediserv.fox.gal",
-    "fediserve.com",
-    "fedisnap.com",
-    "fedispace.de",
-    "fedist.me",
-    "fediunam.site",
-    "fediv.giov.dev",
-    "fediver.de",
-    "fediverse-lite.com",
-    "fediverse.andy-bell.com",
-    "fediverse.antho.dev",
-    "fediverse.au",
-    "fediverse.bitals.xyz",
-    "fediverse.carleton.social",
-    "fediverse.christopherlopes.com",
-    "fediverse.confraria.me",
-    "fediverse.cyou",
-    "fediverse.cz",
-    "fediverse.dotslashplay.it",
-    "fediverse.elbehnon.de",
-    "fediverse.fossfreelancers.com",
-    "fediverse.fun",
-    "fediverse.giorgiocomai.eu",
-    "fediverse.jarv.is",
-    "fediverse.jdotc.xyz",
-    "fediverse.jefflembeck.com",
-    "fediverse.jrcichra.dev",
-    "fediverse.keithzg.ca",
-    "fediverse.krohsnest.com",
-    "fediverse.langow.ski",
-    "fediverse.lavcorps.xyz",
-    "fediverse.leavingorbit.de",
-    "fediverse.live",
-    "fediverse.midala.net",
-    "fediverse.monster",
-    "fediverse.nicknisi.com",
-    "fediverse.omaramin.me",
-    "fediverse.one",
-    "fediverse.radiorandom.org",
-    "fediverse.randomfoo.net",
-    "fediverse.repc.co",
-    "fediverse.rm-rf.club",
-    "fediverse.science",
-    "fediverse.sideras.net",
-    "fediverse.sloped.me",
-    "fediverse.spearman.xyz",
-    "fediverse.speckledmonkey.com",
-    "fediverse.teomahk.de",
-    "fediverse.thefloatinglab.world",
-    "fediverse.wesnoth.org",
-    "fediverse.xavin.net",
-    "fediverse.yapbreak.fr",
-    "fediverse.zachleat.com",
-    "fediverso.club",
-    "fediverso.jbox.com.br",
-    "fedivote.com",
-    "fediworld.de",
-    "fedizens.perchinup.top",
-    "fedpic.com",
-    "feed.bad-dragon.ch",
-    "feed.casa",
-    "feed.ciql.net",
-    "feed.hella.cheap",
-    "feed.hive.institute",
-    "feed.mccormick.cx",
-    "feed.nxs3.com",
-    "feed.possumgraveyard.com",
-    "feed.victor.earth",
-    "feed.yopp.me",
-    "feedbeat.me",
-    "feedbin.social",
-    "feeds.social",
-    "fefu.social",
-    "feistycricket.org",
-    "felesitas.cloud",
-    "felin.social",
-    "felixmueller.social",
-    "fellies.social",
-    "fem.social",
-    "femboy.breeding.college",
-    "femboys.love",
-    "femdom.solutions",
-    "femto.pub",
-    "fendek.net",
-    "fenetre.dev",
-    "fennec.town",
-    "feral.cafe",
-    "ferelith.blue",
-    "ferme.masto.host",
-    "ferretfrizz.biz",
-    "ferrovipath.es",
-    "ferry.host",
-    "ferry.pm",
-    "fetistodon.com",
-    "feuerwehr.social",
-    "fex.techbio.eu",
-    "fez.social",
-    "ff.doskel.net",
-    "fff.gay",
-    "fff.roelof.info",
-    "ffxiv-mastodon.com",
-    "fgc.network",
-    "fi.meyer-guillot.fr",
-    "fiasco.social",
-    "fiberart.club",
-    "fidelis.social",
-    "fiedlerfamily.net",
-    "fieldnotes.social",
-    "fietkau.social",
-    "fietser.social",
-    "fifteen.wtf",
-    "fifthdread.tv",
-    "fightthis.net",
-    "fika.grin.hu",
-    "fikaverse.club",
-    "file-explorers.club",
-    "fili.to",
-    "filly.social",
-    "fils.bastien-dumont.onmypc.net",
-    "fim.social",
-    "fimpern.de",
-    "final.town",
-    "find-me.femboys-who.top",
-    "finkasaur.us",
-    "finndom.space",
-    "finnish.social.pekkasipila.com",
-    "finops.social",
-    "finotto.social",
-    "fins.fish",
-    "finsup.social",
-    "fintech.eco",
-    "fire.asta.lgbt",
-    "fire.madiator.cloud",
-    "fire.masto.host",
-    "firebird.zone",
-    "firedragons.net",
-    "firefish.oomfie.city",
-    "firefish.xprmnt42.de",
-    "firekitten.social",
-    "fireplace.cafe",
-    "fireshark.social",
-    "firetribe.org",
-    "firstmasters.me",
-    "fish.apach.dev",
-    "fish.ofdisorder.de",
-    "fission.social",
-    "fissionator.com",
-    "fisting.social",
-    "fitt.au",
-    "fivem.social",
-    "fjall.net",
-    "flagada.org",
-    "flaki.social",
-    "flanintheface.com",
-    "flashist.live",
-    "flashist.video",
-    "flatland.town",
-    "flausch.social",
-    "flauschhausen.de",
-    "flaximus.net",
-    "flecken.monster",
-    "fleur.social",
-    "flexnet.social",
-    "flightclub.social",
-    "flimpie.net",
-    "flinta.social",
-    "flipboard.social",
-    "flipping.rocks",
-    "flipscreen.social",
-    "flittermice.club",
-    "floe.earth",
-    "flokinet.social",
-    "flooded.club",
-    "floof.link",
-    "floof.org",
-    "floofy.city",
-    "floofy.tech",
-    "floss.social",
-    "flower.afn.social",
-    "flowerpot.fyi",
-    "flowers.unit520.wtf",
-    "flowlab5.social",
-    "flownative.social",
-    "flows.energyflow.rodeo",
-    "floyds.io",
-    "fluf.club",
-    "fluff.land",
-    "fluffcord.social",
-    "fluffpri.de",
-    "fluffs.au",
-    "fluffy.family",
-    "fluffytail.gay",
-    "fluffytail.org",
-    "flumph.masto.host",
-    "fluttercommunity.social",
-    "fluttershy.club",
-    "fluxo.millenium.red",
-    "flx.masto.host",
-    "flyingbattery.zone",
-    "flyingflux.net",
-    "flyingsquirrel.ca",
-    "flyovercountry.social",
-    "fm7878.com",
-    "fmb.ftls.xyz",
-    "fnando.com",
-    "fnlog.page",
-    "fnordon.de",
-    "fnya.ggtea.org",
-    "fo0bar.org",
-    "focal.love",
-    "focal.social",
-    "fog.highspirits.games",
-    "foggyminds.com",
-    "foggymtndrifter.social",
-    "fogtype.com",
-    "folium-learning.social",
-    "folksocial.org",
-    "follow.agwa.name",
-    "follow.brunopedro.com",
-    "follow.ethanmarcotte.com",
-    "follow.proofgeist.com",
-    "fomx.gay",
-    "foo.sx",
-    "foodhub-muenchen.social",
-    "foojay.social",
-    "footbrid.ge",
-    "footprints.community",
-    "fops.cloud",
-    "forcefemm.ing",
-    "forensicpsychiatry.social",
-    "foresdon.jp",
-    "forestodon.com",
-    "forestver.se",
-    "forfuture.social",
-    "forgforgf.org",
-    "forgi.social",
-    "forlorn.computer",
-    "formansbasement.club",
-    "formu1a.social",
-    "forsaken.technology",
-    "forster.pro",
-    "fortunaexmachina.com",
-    "forum-lucifer.com",
-    "forum.friendi.ca",
-    "forum.virctuary.com",
-    "fosspri.de",
-    "fosstodon.org",
-    "fostergram.uk",
-    "foto.libre.bzh",
-    "fotofed.nl",
-    "fotos.ilustrelina.li",
-    "fotos.lukas-schieren.de",
-    "fotz.cc",
-    "foule.net",
-    "founding.space",
-    "fountainpen.social",
-    "four-nine.club",
-    "fouroclockfarms.club",
-    "fox.masto.host",
-    "fox.nexus",
-    "foxden.social",
-    "foxes.rocks",
-    "foxfamily.online",
-    "foxgirl.eu",
-    "foxgirl.land",
-    "foxgirl.social",
-    "foxhold.net",
-    "foxi.sh",
-    "foxpile.online",
-    "foxsay.southfox.me",
-    "foxy.social",
-    "foxylo.xyz",
-    "foygl.com",
-    "fpl.social",
-    "fpv.social",
-    "fr.droidbuilders.uk",
-    "fr.hlad.org",
-    "fr.osm.social",
-    "fractalego.social",
-    "fractalthreads.net",
-    "fraktalworks.de",
-    "framapiaf.org",
-    "frameperfect.space",
-    "fran.cr",
-    "franken.social",
-    "frankenwolke.com",
-    "frankfurt.social",
-    "frankwiles.social",
-    "frawas.de",
-    "freaklab.es",
-    "freaks.social",
-    "free.gaycatgirl.sex",
-    "free.gluten.space",
-    "freeatlantis.com",
-    "freedomofspee.ch",
-    "freeflow.dananglin.me.uk",
-    "freefortnitegift.cards",
-    "freeframe.masto.host",
-    "freemasonry.social",
-    "freeradical.zone",
-    "freesewing.social",
-    "freesocial.co",
-    "freesoftwareextremist.com",
-    "freespeech.chat",
-    "freespeech.gaac2.com",
-    "freespeech.group",
-    "freethought.online",
-    "freezepeach.online",
-    "freiburg.social",
-    "freie-radios.org",
-    "freie-re.de",
-    "freiewaehler.social",
-    "freifunk-fediverse.de",
-    "freifunk.social",
-    "freight.fan",
-    "freizeitparks.social",
-    "freja.zone",
-    "frenfiverse.net",
-    "frequency.app",
-    "freshies.community",
-    "freude.social",
-    "freund.aksel.at",
-    "freunde.imstadtpark.de",
-    "freunde.ma-nic.de",
-    "freunde.topitz.de",
-    "freundica.de",
-    "freundlich.schinbo.de",
-    "freundliches.de",
-    "fri.bitcast.info",
-    "fri.dxz.ch",
-    "fribby.social",
-    "fribygda.no",
-    "friend.baai.ac.cn",
-    "friend.camp",
-    "friend.cuyes.mooo.com",
-    "friend.enby-box.de",
-    "friend.fmal.com",
-    "friend.geoffray-levasseur.org",
-    "friend.ketterle.ch",
-    "friend.propoleo.xyz",
-    "friend.sbcloud.cc",
-    "friendhole.masto.host",
-    "friendhole.social",
-    "friendica-dev.gidikroon.eu",
-    "friendica-dev.mbbit.de",
-    "friendica-leipzig.de",
-    "friendica.a-zwenkau.de",
-    "friendica.a3a-services.de",
-    "friendica.alfter.us",
-    "friendica.ambag.es",
-    "friendica.andreaskilgus.de",
-    "friendica.appwatch.de",
-    "friendica.astatu.berlin",
-    "friendica.bachgau.social",
-    "friendica.biebje.nl",
-    "friendica.bosio.info",
-    "friendica.chilemasto.casa",
-    "friendica.communitarium.org",
-    "friendica.cord.de",
-    "friendica.cracrayol.org",
-    "friendica.cucitofacile.it",
-    "friendica.cyberveins.eu",
-    "friendica.d1nu.de",
-    "friendica.daniel-siepmann.de",
-    "friendica.dekay.org",
-    "friendica.deliquescence.net",
-    "friendica.deredvdienst.de",
-    "friendica.djan-gicquel.fr",
-    "friendica.donburnside.com",
-    "friendica.doskel.net",
-    "friendica.dresden.network",
-    "friendica.elastiscale.net",
-    "friendica.erabo.de",
-    "friendica.eskimo.com",
-    "friendica.exon.name",
-    "friendica.freunde-des-punk.de",
-    "friendica.gidikroon.eu",
-    "friendica.glasserholdings.eu",
-    "friendica.glytch.dev",
-    "friendica.gnomos.org",
-    "friendica.goltzsche.de",
-    "friendica.gourmetkater.com",
-    "friendica.greyhat.chat",
-    "friendica.hagew.blog",
-    "friendica.harkonen.pw",
-    "friendica.hashy-net.de",
-    "friendica.hellquist.eu",
-    "friendica.hubup.pro",
-    "friendica.humboldtgymnasium-solingen.de",
-    "friendica.icb.at",
-    "friendica.inclusion.cc",
-    "friendica.ingram-braun.net",
-    "friendica.ironbug.org",
-    "friendica.j62.de",
-    "friendica.jenovarain.com",
-    "friendica.keithhacks.cyou",
-    "friendica.kmkz.moe",
-    "friendica.knizefamily.net",
-    "friendica.knowbility.nl",
-    "friendica.kommune4.de",
-    "friendica.lukepetrolekas.com",
-    "friendica.massimog.homepc.it",
-    "friendica.mbbit.de",
-    "friendica.me",
-    "friendica.mgtow.pl",
-    "friendica.mifritscher.de",
-    "friendica.minecloud.ro",
-    "friendica.misc.x10host.com",
-    "friendica.mrpetovan.com",
-    "friendica.multisum.info",
-    "friendica.myportal.social",
-    "friendica.namestaci.cz",
-    "friendica.nerdhaven.de",
-    "friendica.net.0307.one",
-    "friendica.nthomas20.net",
-    "friendica.nx-pod.de",
-    "friendica.nz",
-    "friendica.olafscharpf.de",
-    "friendica.one",
-    "friendica.opencloud.lu",
-    "friendica.opensocial.space",
-    "friendica.os-service.eu",
-    "friendica.osn.social",
-    "friendica.others.tide.tk",
-    "friendica.ownbox.be",
-    "friendica.pflanzmit.28apps-software.de",
-    "friendica.philipp.info",
-    "friendica.poppelreuter.de",
-    "friendica.produnis.de",
-    "friendica.ramoonus.nl",
-    "friendica.re-coded.net",
-    "friendica.realmat.de",
-    "friendica.reparierecke.de",
-    "friendica.retiisi.eu",
-    "friendica.retronerd.at",
-    "friendica.rlp.schule",
-    "friendica.roelfrenkema.com",
-    "friendica.ru",
-    "friendica.s-a.at",
-    "friendica.schmidham.net",
-    "friendica.sds-ip.de",
-    "friendica.se1.eu",
-    "friendica.shnoulle.net",
-    "friendica.simon-a.info",
-    "friendica.slowblog.eu",
-    "friendica.ssd.death.id.au",
-    "friendica.steckel-bonn.de",
-    "friendica.swrlab.org",
-    "friendica.tigvarts.com",
-    "friendica.utzer.de",
-    "friendica.virusschleuder.de",
-    "friendica.visionroot.org",
-    "friendica.vrije-mens.org",
-    "friendica.waldstepperbu.de",
-    "friendica.wige.erabo.de",
-    "friendica.wynnwyrm.cyou",
-    "friendica.xanderwharts.us",
-    "friendica.xyz",
-    "friendicabox.inet.place",
-    "friendicadev.sekretaerbaer.de",
-    "friendicarg.nsupdate.info",
-    "friendl.y-y.li",
-    "friendlica.de",
-    "friends.andreaalbertini.ch",
-    "friends.cafe",
-    "friends.deko.cloud",
-    "friends.desk-apps.com",
-    "friends.devinemarsa.com",
-    "friends.dialogundsinn.com",
-    "friends.grishka.me",
-    "friends.johalla.org",
-    "friends.librescrum.org",
-    "friends.polli.social",
-    "friends.ravergram.club",
-    "friends.speck.blue",
-    "friends.stefanoprenna.com",
-    "friends.thoshis.net",
-    "friends.undeadnetwork.de",
-    "friends.unixweb.net",
-    "friends.wimmer-edv.de",
-    "friendshavingfuntogether.com",
-    "friendship.quest",
-    "friendsocial.inet.place",
-    "friendsofdesoto.social",
-    "friendzone.social",
-    "frieren.quest",
-    "frikiverse.zone",
-    "frinx.online",
-    "friskypaws.social",
-    "frisphook.hilciferous.nl",
-    "frittaten.at",
-    "frmsn.network",
-    "frnd.t-rg.ws",
-    "frndc.saschaschroeder.eu",
-    "frnds.network",
-    "frog.camp",
-    "frogdrool.net",
-    "froggie.gay",
-    "froggo.garden",
-    "frogs.lgbt",
-    "from.corentin.eu",
-    "fromm.social",
-    "front-end.social",
-    "frontrange.co",
-    "frootmig.net",
-    "frostmn.social",
-    "froth.zone",
-    "fruef.social",
-    "fruitade.xyz",
-    "fruitingbodies.xyz",
-    "fsk.im",
-    "fsmi.social",
-    "ftl.chat",
-    "ftp.crysp.org",
-    "ftrv.se",
-    "fub.pub",
-    "fuckgov.org",
-    "fuckyou.plus",
-    "fudo.live",
-    "fuerth.social",
-    "fuglies.club",
-    "ful.social",
-    "fulda.social",
-    "fun.schenklklopfer.de",
-    "funcoland.net",
-    "functional.cafe",
-    "functional.pizza",
-    "fundraising.social",
-    "fur.lgbt",
-    "furality.social",
-    "furdon.com",
-    "furfag.de",
-    "furnu.org",
-    "furpark.kr",
-    "furries.club",
-    "furry.band",
-    "furry.energy",
-    "furry.engineer",
-    "furry.horse",
-    "furry.pet",
-    "furryfandom.me",
-    "furrypride.org",
-    "furs.social",
-    "furs.town",
-    "fursuit.me",
-    "fursuit.social",
-    "furtenbach.social",
-    "fusionpros.social",
-    "fusky.social",
-    "futen.work",
-    "future-generation.social",
-    "futuregadgetlab.cc",
-    "futurist.info",
-    "fuwa.pink",
-    "fuwafuwa.town",
-    "fuzaxx.de",
-    "fuzz.network",
-    "fuzzbutt.link",
-    "fuzzyfox.social",
-    "fuzzyroots.net",
-    "fuzzytacular.net",
-    "fv.convergence.cx",
-    "fv.reveca.es",
-    "fv.technogothic.net",
-    "fv.xonia.es",
-    "fvnki.town",
-    "fwoof.space",
-    "fyrfli.social",
-    "g0o.net",
-    "g0v.social",
-    "g2s.azbycx.xyz",
-    "g2s.engelke.contact",
-    "g2s.mountainmoss.nz",
-    "g33ks.coffee",
-    "gab.com",
-    "gabi.is",
-    "gabvp.masto.host",
-    "gachi.masto.host",
-    "gadget.inpocket.net",
-    "gadgetboy.social",
-    "gaeilge.social",
-    "gainer.cloud",
-    "gaken.social",
-    "gal.muri.zip",
-    "galacticaactu.al",
-    "galaxians.garden",
-    "galaxy.quest",
-    "galaxyrailway.link",
-    "galbo.io",
-    "galegale.online",
-    "gallifrey.social",
-    "gamache.org",
-    "game-tecx.de",
-    "gamedev.berlin",
-    "gamedev.lgbt",
-    "gamedev.social",
-    "gamelan.social",
-    "gameliberty.club",
-    "gamelinks007.net",
-    "gamemaking.social",
-    "gamepad.club",
-    "gamerfort.social",
-    "gamerr.cyou",
-    "gamerscharisma.social",
-    "games.ghoti.me",
-    "games.ngo",
-    "games.retrotalk.live",
-    "gameswithcode.net",
-    "gametech.masto.host",
-    "gametoots.de",
-    "gaminginthe.cloud",
-    "gamingjp.org",
-    "gandi.social",
-    "gardenstate.social",
-    "gardons.contact",
-    "garratt.social",
-    "garrison.su",
-    "garver.social",
-    "gascoigne.social",
-    "gast.social",
-    "gathernorust.net",
-    "gatorcountry.club",
-    "gay.camera",
-    "gay.lesaoras.xyz",
-    "gay.skid.do",
-    "gaybdsm.group",
-    "gaycast.lxd.bsocat.net",
-    "gaydadon.jp",
-    "gayfr.social",
-    "gaygeek.social",
-    "gayhorse.club",
-    "gaymer.social",
-    "gaypirates.club",
-    "gayrobot.club",
-    "gayssues.club",
-    "gayweeb.vip",
-    "gazette.live",
-    "gazouiller.fr",
-    "gazuji.com",
-    "gbo.social",
-    "gc2.jp",
-    "gdcm.space",
-    "gdev.fedibird.com",
-    "gear.pictures",
-    "gearheads.social",
-    "gearlandia.haus",
-    "gearpaws.com",
-    "gedankenlie.be",
-    "geek.gay",
-    "geekdad.com",
-    "geekdom.social",
-    "geekhaven.social",
-    "geeklife.com",
-    "geeknews.chat",
-    "geekodon.org",
-    "geeks.cafe",
-    "geeksociety.social",
-    "geekspot.com",
-    "geekstodon.com",
-    "geekstream.org",
-    "geese.lol",
-    "gefahrengebiet.org",
-    "gehenna.moe",
-    "gei.st",
-    "geilomati.co",
-    "geldmacher.io",
-    "gemini-tech.be",
-    "genart.social",
-    "genco.me",
-    "gender.systems",
-    "genderheretics.xyz",
-    "geneadon.social",
-    "genealogie.social",
-    "genealysis.social",
-    "genericsocialmediapage.com",
-    "genista.osrx.chat",
-    "genix.ink",
-    "genomic.social",
-    "genserver.social",
-    "genshin.social",
-    "gensokyo.social",
-    "gensokyo.town",
-    "gentlemanloser.cafe",
-    "gentlyflowing.anymanystreams.cc",
-    "genxer.nz",
-    "geofront.rocks",
-    "geraffel.social",
-    "gerardbentley.com",
-    "gervtuber.de",
-    "gesichtsbu.ch",
-    "getoote.de",
-    "gfk.social",
-    "gh0st.live",
-    "ghetti.monster",
-    "ghetto-fabulo.us",
-    "ghost.cafe",
-    "ghostly.garden",
-    "ghoti.au",
-    "giantheart.social",
-    "gib.schmus.is",
-    "gidam666.com",
-    "giersig.net",
-    "giesing.space",
-    "gigant.social",
-    "gigaohm.bio",
-    "gigq.com",
-    "gilbertredman.masto.host",
-    "gilkenson.social",
-    "gilotinx.art",
-    "gimme5.club",
-    "gingadon.com",
-    "ginny.chat",
-    "ginpatu.moe",
-    "gioia.photos",
-    "gioia.social",
-    "giraffe.eepy.cloud",
-    "giraffe.josh.me.uk",
-    "girlboss.ing",
-    "girlcock.club",
-    "girldick.gay",
-    "girldick.party",
-    "girllich.link",
-    "girlthing.chat",
-    "giveupalready.com",
-    "glaceon.social",
-    "gladtech.social",
-    "glammr.us",
-    "glaros.xyz",
-    "glasgow.social",
-    "glassrivermedia.me",
-    "glauca.space",
-    "gleasonator.com",
-    "gleasonator.dev",
-    "glee.li",
-    "glen.social",
-    "glennfitzpatrick.com",
-    "glib.social",
-    "glie.old-home.org",
-    "glitch.cat.family",
-    "glitch.dumbly.net",
-    "glitch.hanntac.net",
-    "glitch.lgbt",
-    "glitch.social",
-    "glitch.taks.garden",
-    "glitch.wtf",
-    "glitch.zowi.ee",
-    "glitchsoc.sds-ip.de",
-    "glitterkitten.co.uk",
-    "glittr.social",
-    "globalskywatch.social",
-    "glod.org",
-    "gloom.nexus",
-    "gloria.social",
-    "glowingcu.be",
-    "gluck.cc",
-    "glyph.city",
-    "gm-cloud.org.uk",
-    "gn-tronics.dev",
-    "gn2.social",
-    "gndh.net",
-    "gnu.gl",
-    "gnubox.org",
-    "gnulinux.social",
-    "gnurfl.de",
-    "go.besteam.top",
-    "go.ecarlate.app",
-    "go.lefti.sh",
-    "go.myfed.party",
-    "go.phocks.org",
-    "go.to.fey.cafe",
-    "go.warpspeedtv.com",
-    "go2.elstabloserver.de",
-    "go5.dev",
-    "goark.fedicity.net",
-    "goat2.breydon.id.au",
-    "goatdaddy.net",
-    "goblackcat.social",
-    "goblin.camp",
-    "goblin.technology",
-    "gochisou.dev",
-    "gochisou.photo",
-    "goddess.fedicity.net",
-    "godforsaken.website",
-    "goeppingen.social",
-    "goettingen.social",
-    "gohan-oisii.net",
-    "gohardforv.jp",
-    "gomastodon.cz",
-    "gonk.social",
-    "gonottowittenberg.masto.host",
-    "good.franv.site",
-    "good.news",
-    "goodass.dog",
-    "goodfeeds.net",
-    "goodlett.social",
-    "goodste.in",
-    "goos.social",
-    "goose.directory",
-    "goreslut.xyz",
-    "gorgon.city",
-    "gorone.xyz",
-    "gos.penclub.club",
-    "goshdarn.fun",
-    "gosocial.au",
-    "gosuslugi.social",
-    "gotgoat.com",
-    "goth.land",
-    "goth.social",
-    "gotham.social",
-    "goto.77nn.it",
-    "goto.alldnb.com",
-    "goto.axtch.net",
-    "goto.catbutts.today",
-    "goto.clown.garden",
-    "goto.derpsin.space",
-    "goto.devianze.city",
-    "goto.distantserver.org",
-    "goto.fi",
-    "goto.hardcoredevs.com",
-    "goto.hellsite.site",
-    "goto.kessoku.band",
-    "goto.mello.moe",
-    "goto.pym.industries",
-    "goto.ryuslash.org",
-    "goto.sirenabea.ch",
-    "goto.socis.ax",
-    "goto.spaceling.sh",
-    "goto.starfall.systems",
-    "goto.televerse.mov",
-    "goto.veer66.rocks",
-    "goto.vsta.org",
-    "gotocard.site",
-    "gotosocial-dev.ovo.st",
-    "gotosocial-dev.svc.0x0a.network",
-    "gotosocial.0sn.net",
-    "gotosocial.alkahan.net",
-    "gotosocial.almacenero.uk",
-    "gotosocial.barr0w.net",
-    "gotosocial.celeborn.de",
-    "gotosocial.ewonchang.com",
-    "gotosocial.gts.hazmat.jacksonchen666.com",
-    "gotosocial.hybridlehrer.de",
-    "gotosocial.i.eta.st",
-    "gotosocial.incenbie.eu.org",
-    "gotosocial.isaaccronk.com",
-    "gotosocial.kaputt.cloud",
-    "gotosocial.karliner.net",
-    "gotosocial.karliner.org",
-    "gotosocial.lapineige.fr",
-    "gotosocial.linuxkompis.se",
-    "gotosocial.miikka.dev",
-    "gotosocial.nannal.com",
-    "gotosocial.oceansurf.org",
-    "gotosocial.patatas.ca",
-    "gotosocial.polonkai.eu",
-    "gotosocial.sequentialread.com",
-    "gotosocial.social",
-    "gotosocial.srv0.lol",
-    "gotosocial.stripittoride.club",
-    "gotosocial.tooot.app",
-    "gotosocial.tryptophonic.com",
-    "gotosocial.yvesdennels.com",
-    "gott.social",
-    "goyim.social",
-    "gpose.site",
-    "gr33n0.me",
-    "graeber.social",
-    "grafana.social",
-    "grafton.me",
-    "gram.ello.tech",
-    "gram.social",
-    "grammar.jp",
-    "grammus.net",
-    "grand-duchy.net",
-    "grandma.space",
-    "granit.social",
-    "grants.cafe",
-    "granvalenti.art",
-    "grapevyne.space",
-    "grapheneos.social",
-    "graphics.social",
-    "graphvisualization.masto.host",
-    "gratefuldread.masto.host",
-    "gravityzero.nylarea.com",
-    "gravure.club",
-    "graz.social",
-    "greatestgen.social",
-    "greatfallsarcade.com",
-    "greatjustice.net",
-    "greenfield.masto.host",
-    "greenfield.social",
-    "greengame.dev",
-    "greenhill.zone",
-    "greenish.red",
-    "greenjobs.social",
-    "greenmushroomnetwork.masto.host",
-    "greennet.social",
-    "greennuclear.online",
-    "greenpeace.social",
-    "greenplenty.social",
-    "gregism.com",
-    "greifswald.lgbt",
-    "greiner.social",
-    "greywolf.social",
-    "grifoni.futbol",
-    "grimau.dynamic-dns.net",
-    "grimfeast.com",
-    "grimgreenfo.rest",
-    "grimoire.party",
-    "grimoire.social",
-    "grinch.social",
-    "groningen.social",
-    "gronp.masto.host",
-    "groovytoot.com",
-    "grosshans.online",
-    "groupe-tazor.com",
-    "groupsebelah.com",
-    "groupthink.fun",
-    "grove.cyberdruids.club",
-    "growers.social",
-    "grrtt.net",
-    "gruene.social",
-    "grumble.social",
-    "grumpys.online",
-    "grupa.nadbugiem.org",
-    "grzeca.eu",
-    "grzeca.pl",
-    "gs.leftic.club",
-    "gs.yvt.jp",
-    "gshep.social",
-    "gsw.social",
-    "gt.gockandgum.party",
-    "gts-02.owo.monster",
-    "gts-dev.pixie.town",
-    "gts-test.oniricorpe.eu",
-    "gts-test.urmaul.com",
-    "gts-w.zhaohai.li",
-    "gts.0x7be.net",
-    "gts.1bitsquared.com",
-    "gts.2a03.party",
-    "gts.4d73.0x0.re",
-    "gts.7colou.red",
-    "gts.aethernaut.eu",
-    "gts.altgr.xyz",
-    "gts.am-gen.org",
-    "gts.amk.ie",
-    "gts.ancilla.ca",
-    "gts.aperturescience.net",
-    "gts.artemisia.systems",
-    "gts.asthalter.de",
-    "gts.astolfo.cool",
-    "gts.bassinet.uber.space",
-    "gts.batsense.net",
-    "gts.bebear.net",
-    "gts.bekserver.xyz",
-    "gts.blahaj.pl",
-    "gts.boehmke.net",
-    "gts.bread-z.one",
-    "gts.brunofontes.net",
-    "gts.callwall.xyz",
-    "gts.camnet.site",
-    "gts.cazzaserver.com",
-    "gts.churanova.eu",
-    "gts.codecoffin.com",
-    "gts.comilab.net",
-    "gts.controlfreak.live",
-    "gts.corvid.ca",
-    "gts.creve.com",
-    "gts.crisq.top",
-    "gts.cupcakerob.nl",
-    "gts.cybre.ninja",
-    "gts.daemons.it",
-    "gts.daevien.com",
-    "gts.dayl.in",
-    "gts.decafbad.com",
-    "gts.dinn.ca",
-    "gts.distinctivestatic.com",
-    "gts.djs.to",
-    "gts.dodgy.download",
-    "gts.doggirl.me",
-    "gts.doskel.net",
-    "gts.dtth.ch",
-    "gts.eilhart.cz",
-    "gts.elendia.net",
-    "gts.endgameviable.com",
-    "gts.eunach.scot",
-    "gts.ewancroft.uk",
-    "gts.fabianvillena.cl",
-    "gts.fale.io",
-    "gts.fellr.net",
-    "gts.ferreo.dev",
-    "gts.flra.eu",
-    "gts.fly.dev",
-    "gts.foxesare.sexy",
-    "gts.fsociety.social",
-    "gts.fyrfli.social",
-    "gts.gensokyo.shop",
-    "gts.goat.rocks",
-    "gts.h.mero.je",
-    "gts.hackaroun.de",
-    "gts.han.do",
-    "gts.interlace.space",
-    "gts.io18.top",
-    "gts.jermey.cn",
-    "gts.kelbie.scot",
-    "gts.keysmash.xyz",
-    "gts.kianga.eu",
-    "gts.kulupu.party",
-    "gts.kureshisen.com",
-    "gts.lacoloc.cafe",
-    "gts.lapidak.is",
-    "gts.lhochet.dev",
-    "gts.liberated.press",
-    "gts.lilyb.it",
-    "gts.linuxfiend.net",
-    "gts.linuxkompis.se",
-    "gts.lmao.ch",
-    "gts.lob-online.de",
-    "gts.lorenzana.engineer",
-    "gts.luca.run",
-    "gts.lyrion.ch",
-    "gts.mahiru.app",
-    "gts.millistice.com",
-    "gts.motcha.tech",
-    "gts.nixgeek.com",
-    "gts.noc.blue",
-    "gts.noize.guru",
-    "gts.nyro2.com",
-    "gts.octopusx.de",
-    "gts.okaris.de",
-    "gts.olowe.co",
-    "gts.oniricorpe.eu",
-    "gts.ordchaos.top",
-    "gts.panz.online",
-    "gts.passthejoe.net",
-    "gts.pentagirls.gay",
-    "gts.portend.place",
-    "gts.pouet.im",
-    "gts.prplecake.com",
-    "gts.r8z.us",
-    "gts.radhitya.id",
-    "gts.rascals.net",
-    "gts.river.lgbt",
-    "gts.rkd.pw",
-    "gts.root.sx",
-    "gts.scambier.xyz",
-    "gts.schalanda.name",
-    "gts.scoobysnack.net",
-    "gts.sgrankin.com",
-    "gts.skew-t.com",
-    "gts.snoot.tube",
-    "gts.soopy.moe",
-    "gts.staging.e2net.social",
-    "gts.superseriousbusiness.org",
-    "gts.tbh.gay",
-    "gts.tela.moe",
-    "gts.test.fedi.monster",
-    "gts.thatcat.space",
-    "gts.thekitty.zone",
-    "gts.theliberatededge.org",
-    "gts.thenullpointer.net",
-    "gts.tiuxo.com",
-    "gts.tommy.gg",
-    "gts.travelpandas.eu",
-    "gts.trycht.cz",
-    "gts.tunpok.com",
-    "gts.typer.sh",
-    "gts.u8.is",
-    "gts.umany222.net",
-    "gts.urgle.com",
-    "gts.urmaul.com",
-    "gts.varia.zone",
-    "gts.walloftext.ca",
-    "gts.werefox.cafe",
-    "gts.xa0.uk",
-    "gts.xmgz.eu",
-    "gts.xylja.omg.lol",
-    "gts.y.la",
-    "gts.yujinakao.com",
-    "gts.yuyutsu.one",
-    "gts.zimbatm.com",
-    "gts.zknt.org",
-    "gts.zzncx.top",
-    "gts1.entities.org.uk",
-    "gts1.zatnosk.dk",
-    "gtsc.coppelab.net",
-    "gtstest.handlerug.me",
-    "gueck.com",
-    "guerrill.art",
-    "guerrillagardening.club",
-    "guglhupf.social",
-    "guild.combinehonnete.com",
-    "guild.pmdcollab.org",
-    "guillemette.social",
-    "guitar.rodeo",
-    "guitarmageddon.net",
-    "gulo.monster",
-    "gulp.cafe",
-    "gultsch.social",
-    "gummybrain.com",
-    "gumzo.africa",
-    "guns.krackhou.se",
-    "gursoy.social",
-    "gutelaunewelle.social",
-    "guzmer.social",
-    "gw2.lubar.me",
-    "gwah.social",
-    "gweep.cat",
-    "gwitter.li",
-    "gxtech.social",
-    "gyatt.cc",
-    "gyp-www03.dynv6.net",
-    "gyptazy.ch",
-    "gyudon.org",
-    "h-i.social",
-    "h-net.social",
-    "h.kokuda.org",
-    "h3xtacy.party",
-    "h4.io",
-    "h4johan.0am.jp",
-    "h55.social",
-    "h5q.net",
-    "habitat.zelle.one",
-    "hachyderm.io",
-    "hachyderm.wtf",
-    "hackaday.social",
-    "hackademiker.se",
-    "hacker.photos",
-    "hackers.org",
-    "hackers.town",
-    "hackerspace.au",
-    "hackodon.com",
-    "hackr.org",
-    "hacks.fi",
-    "hacksaw.space",
-    "hacksrus.xyz",
-    "hacktheplanet.com.au",
-    "hacky.town",
-    "hades.is",
-    "hades.town",
-    "hagale.net",
-    "hagerman.social",
-    "hagew.blog",
-    "hahei.life",
-    "hai.kendoo.eu",
-    "hails.org",
-    "hairbow.lol",
-    "hal9.ooo",
-    "halcyon.neon.jp.net",
-    "halfey.moe",
-    "halfon.me",
-    "halfstaff.mexibang.com",
-    "hallb.me",
-    "hallen.kr",
-    "hallihan.net",
-    "halo.nu",
-    "hambon.es",
-    "hameln.social",
-    "hamilton.social",
-    "haminoa.net",
-    "hammer.viking-gaming.community",
-    "hammertonbarbados.social",
-    "hammyhavoc.com",
-    "hamont.social",
-    "hamradio.tel",
-    "hamro.social",
-    "handlewalks.masto.host",
-    "handmade.social",
-    "handon.club",
-    "handwave.org.uk",
-    "hannover.masto.host",
-    "hannover.social",
-    "hannover.town",
-    "happ.ystatic.buzz",
-    "happytobehe.re",
-    "happytoo.cyou",
-    "hapyyr.com",
-    "haqueers.com",
-    "harbour.cafe",
-    "hard.blue",
-    "hardly.social",
-    "harekiet.com",
-    "harrisroxashealth.com",
-    "harrystyl.es",
-    "harton.social",
-    "harukakanata.net",
-    "haruska.social",
-    "harutobit.fedicity.net",
-    "harz.social",
-    "has.scammed.me",
-    "hasa.blog",
-    "hasacow.com",
-    "hasestall.com",
-    "hashapp.space",
-    "hashtaggames.online",
-    "haskell.social",
-    "hasthebig.gay",
-    "hat-eine.entenbru.st",
-    "hata.casa",
-    "hatchee.bz",
-    "hatedon.1984.cz",
-    "hates.company",
-    "hatoba.fedicity.net",
-    "haunt.graveyard.boo",
-    "haunted.computer",
-    "havent.org",
-    "hawk.acosi.com",
-    "hawk.life",
-    "hawks.im",
-    "hax.social",
-    "hax0rbana.social",
-    "haxe.social",
-    "haxx.us",
-    "haylandt.social",
-    "hayu.sh",
-    "haz.pink",
-    "hazymaze.club",
-    "hbghosting.social",
-    "hci.social",
-    "hckr.lol",
-    "hcommons.social",
-    "hda.zone",
-    "hdev.im",
-    "hdr.social",
-    "hdty.in",
-    "headcannon.xyz",
-    "headmates.social",
-    "headpat.cafe",
-    "headpat.exchange",
-    "headpats.cafe",
-    "heads.social",
-    "hear-me.social",
-    "heartystarty.net",
-    "heath.social",
-    "heckin.how",
-    "hed.im",
-    "hedgebound.net",
-    "hedgehog.pub",
-    "heffalump.club",
-    "height.social",
-    "heimat.drensteinfurt.net",
-    "heislandmine.work",
-    "helfer.animexx.de",
-    "helheim.seidr.fr",
-    "helix.cafe",
-    "hell.twtr.plus",
-    "hellhound.cc",
-    "hellinger.wtf",
-    "hellions.cloud",
-    "hello.2heng.xin",
-    "hello.adsh.no",
-    "hello.kittywi.re",
-    "hellowelcome.club",
-    "hellsite.site",
-    "hellyeah.social",
-    "helmholtz.social",
-    "helmi.social",
-    "helo.fuse.pl",
-    "helvede.net",
-    "hemipenes.club",
-    "hemmer.land",
-    "henshaw.social",
-    "hepburn.social",
-    "herd.bovid.space",
-    "hereiszyn.com",
-    "heretic.social",
-    "herkenhoff.com",
-    "hermit.cafe",
-    "hersch.xyz",
-    "herstand.social",
-    "herthafans.de",
-    "hespere.de",
-    "hessen.social",
-    "hewwo.space",
-    "hex.st",
-    "hexadon.net",
-    "hexagon.space",
-    "hexcode.wychwit.ch",
-    "hey.gary.cool",
-    "hey.gregor.link",
-    "hey.hagelb.org",
-    "heychrismackintosh.com",
-    "heystory.net",
-    "hfms.chaunchy.com",
-    "hhghhgh.envs.subut.ai",
-    "hhsocial.de",
-    "hi-low.social",
-    "hi.47041.net",
-    "hi.jonk.org",
-    "hi.lysianth.us",
-    "hi.moe.tips",
-    "hi.nighten.fr",
-    "hi.sogo.la",
-    "hi6.io",
-    "hibiscus.pink",
-    "hidamari.apartments",
-    "hidden.mystical.properties",
-    "hidden.pics",
-    "hideouts.space",
-    "hieron.cc",
-    "hifish.social",
-    "higgy.social",
-    "high.cat",
-    "higheredweb.social",
-    "hikoukidon.jp",
-    "hilltown.studio",
-    "himagine.club",
-    "himbo.life",
-    "himself.alexanderdunkel.com",
-    "hintertupf.ing",
-    "hintz.social",
-    "hinzundcode.social",
-    "hippyjim.uk",
-    "hips.social",
-    "hirata.hostdon.ne.jp",
-    "hiryu-yakiniku.hostdon.ne.jp",
-    "hispagatos.space",
-    "historians.social",
-    "history.lol",
-    "hitchhiker.social",
-    "hitsuji.cloud",
-    "hive.institute",
-    "hivemind.plus",
-    "hiyashi.shimapan.moe",
-    "hj.9fs.net",
-    "hkc.social",
-    "hkgk.nishi.boats",
-    "hlad.org",
-    "hlavac.social",
-    "hlidacstatu.social",
-    "hoagie.fun",
-    "hobapolis.social",
-    "hobbiton.masto.host",
-    "hobbs-end.uk",
-    "hobkinboi.duckdns.org",
-    "hodapp.club",
-    "hodlr.one",
-    "hodltech.com",
-    "hofra.rocks",
-    "hofund.berzerk.pl",
-    "hokutodon.co",
-    "hol.ogra.ph",
-    "hole.ucas.icu",
-    "hollablog.at",
-    "hollypop.xyz",
-    "holme.social",
-    "holonet.imperialba.se",
-    "holonet.social",
-    "holopics.imperialba.se",
-    "holyassociates.com",
-    "holycarp.org",
-    "holygrena.de",
-    "holzer.social",
-    "hom.ph",
-    "home-lab.social",
-    "home.ajacks.net",
-    "home.solitude.bar",
-    "home.speakfree.social",
-    "home.tj-h.com",
-    "homeless.group",
-    "hometech.social",
-    "hometown.synapthein.org",
-    "hometown.team13h.com",
-    "homo.dev",
-    "homo.promo",
-    "homoo.social",
-    "honey.town",
-    "honeybadger.social",
-    "honeybank.net",
-    "honeycomb.engineer",
-    "honeytree.social",
-    "honk.masto.host",
-    "honks.io",
-    "hoops.chat",
-    "hooray.computer",
-    "hoosier.social",
-    "hoots.aldragon.net",
-    "hopmann.xyz",
-    "hoppclan.com",
-    "horche.demkontinuum.de",
-    "hordburh.autophagy.io",
-    "horizon.nordgaming.eu",
-    "hornyjail.pro",
-    "horror.town",
-    "horrorhub.club",
-    "hoshipaso.info",
-    "hosszu.social",
-    "host.blahaj.date",
-    "hostc.at",
-    "hostux.social",
-    "hota.hirachon.otakan.jp",
-    "hotdog.place",
-    "hotdok.dk",
-    "hotgarbage.zone",
-    "hotspot.katiska.eu",
-    "hounds.online",
-    "houseofcreativeweirdos.com",
-    "houseofloy.net",
-    "howcyborgs.chat",
-    "howdee.social",
-    "howdidthisgethere.masto.host",
-    "howes.nz",
-    "howse.social",
-    "howseven.social",
-    "hpi.social",
-    "hrusecky.net",
-    "hsnl.social",
-    "htb.social",
-    "htt.social",
-    "huaren.social",
-    "huaskey.ddns.net",
-    "huaskey.xyz",
-    "hub.azkware.net",
-    "hub.gjdwebserver.nl",
-    "hub.key4.digital",
-    "hub.moon.moe",
-    "hub.mtf.party",
-    "hub.pythia.cloud",
-    "hub.raf.rs",
-    "hub.sakuragawa.moe",
-    "hub.superheroactivism.com",
-    "hub.uckermark.social",
-    "hub.vahfoom3iquahfah.infinitedisk.com",
-    "hub.winslow.cloud",
-    "hub13.xyz",
-    "hubbz.de",
-    "huber.social",
-    "hubzil.la",
-    "huck.social",
-    "hucnet.ch",
-    "hueck.social",
-    "hugs.lgbt",
-    "hulvr.com",
-    "human.5550d.xyz",
-    "humber.news",
-    "humoro.us",
-    "humphry.uk",
-    "hungryhacker.com",
-    "hunlympic.info",
-    "hunted.one",
-    "hunterlife.net",
-    "huskies.online",
-    "husky.xyz",
-    "hutt.social",
-    "hutte.macskatze.art",
-    "hwang.me.uk",
-    "hxr.social",
-    "hyan.ink",
-    "hybridby.design",
-    "hydaelyn.coerthansnowstorm.online",
-    "hydrate.space",
-    "hydrocube.space",
-    "hyem.tech",
-    "hype.cm",
-    "hypercube.masto.host",
-    "hypermute.com",
-    "hypers.social",
-    "hyperstar.mywire.org",
-    "hypno.cafe",
-    "hypno.church",
-    "hypno.social",
-    "hyss.us",
-    "i-love.liloandstit.ch",
-    "i-nonaka.net",
-    "i.audon.space",
-    "i.cancn.com",
-    "i.cymaphore.net",
-    "i.dongxi.ca",
-    "i.oois.xyz",
-    "i.qwp.moe",
-    "i.transmit.love",
-    "i.use.archlinux.fyi",
-    "i.wildserver.ru",
-    "i1.no",
-    "iaccessibility.social",
-    "iam.mikei.sh",
-    "iam.reasonably.social",
-    "iamafard.ir",
-    "iamanerd.club",
-    "iambsd.org",
-    "iame.li",
-    "iamthecookie.monster",
-    "ian.mn",
-    "ianstormtaylor.social",
-    "ibe.social",
-    "ibenot.com",
-    "ibh.social",
-    "ibiocephalus.hostdon.ne.jp",
-    "ibite.lol",
-    "iblis.crisis.city",
-    "icanteventoot.help",
-    "iccomics.xyz",
-    "ice-cream.social",
-    "ice-lolly.social",
-    "ice.pepecyb.de",
-    "ice1.soda.jp.eu.org",
-    "icedlatte.chat",
-    "icedtux.no",
-    "iceshrimp.aperture-science.engineering",
-    "iceshrimp.bat-pike.ts.net",
-    "iceshrimp.chrt.dev",
-    "iceshrimp.de",
-    "iceshrimp.furtenbach.social",
-    "iceshrimp.kmkz.moe",
-    "iceshrimp.pomatron.dev",
-    "iceshrimp.social",
-    "iceshrimp.spathoche.ovh",
-    "iceshrimp.travelpandas.eu",
-    "ich.gay",
-    "ichidan.io",
-    "ichiji.social",
-    "ichinyo.site",
-    "ichraum.social",
-    "icom.lol",
-    "iconfactory.world",
-    "icosahedron.kal-tsit.halcy.de",
-    "icosahedron.website",
-    "icosahedron.website.",
-    "icosaverse.social",
-    "iculture.social",
-    "icy.arcticfluff.eu",
-    "id.cc",
-    "iddqd.social",
-    "idea.oksocial.net",
-    "idf.social",
-    "idic.social",
-    "idiomdrottning.org",
-    "idiots.chat",
-    "idlethumbs.social",
-    "idolheaven.org",
-    "idolmaster.live",
-    "idtech.space",
-    "idw-online.social",
-    "iee.engineer",
-    "ieji.de",
-    "ifrit.gaia.ff14-mstdn.xyz",
-    "ifthisthenwhat.uk",
-    "ifwo.eu",
-    "ig.techeasy.org",
-    "ignifi.social",
-    "iguana.masto.host",
-    "iguanapalace.com",
-    "ihatebeinga.live",
-    "ijaron.life",
-    "ijug.social",
-    "ik1-430-47331.vs.sakura.ne.jp",
-    "ika.queloud.net",
-    "ikamesuki.hostdon.ne.jp",
-    "ikbenpiraat.nl",
-    "ikebukuro.city",
-    "ikuhumituki.fedicity.net",
-    "il-magnifico.xyz",
-    "ilbery.family",
-    "ilja.space",
-    "ill.moe",
-    "illo.social",
-    "ilot.social",
-    "ilotroyo.ilustrelina.li",
-    "ilustrelina.li",
-    "ilys.fm",
-    "im-in.space",
-    "im.alstadheim.no",
-    "im.cm",
-    "im.dameshark.studio",
-    "im.mibo.live",
-    "ima.cm",
-    "imacme.ca",
-    "image.linc.systems",
-    "image.medienzentrum.rocks",
-    "images.miekeroth.org",
-    "imaginair.es",
-    "imastodon.blue",
-    "imastodon.net",
-    "imastodon.org",
-    "imc.sh",
-    "imd.social",
-    "img.fabienphoto.eu",
-    "imgfed.nl",
-    "imjasek.one",
-    "imker.social",
-    "imkerei.social",
-    "impa.cc",
-    "impact.live",
-    "impeccable.social",
-    "imperialba.se",
-    "implausiblyaverage.online",
-    "impostersyndrome.online",
-    "impreg.net",
-    "imsb.app",
-    "in.unover.se",
-    "inaccessible.ac",
-    "inane.chat",
-    "inari.click",
-    "inari.opencocon.org",
-    "incipientjoy.com",
-    "inclusion.click",
-    "indahood.de",
-    "independent-media.co.uk",
-    "indexof.co.uk",
-    "indg.club",
-    "india.goonj.xyz",
-    "indieapps.space",
-    "indieauthors.social",
-    "indiebasement.live",
-    "indiehackers.social",
-    "indiepocalypse.social",
-    "indiepop.band",
-    "indieweb.social",
-    "indigenousgulf.online",
-    "inductive.space",
-    "indw.social",
-    "infinitumnihil.social",
-    "infinitychuu.xyz",
-    "info.performing-arts.ch",
-    "infoclog.com",
-    "infodump.ing",
-    "information.garden",
-    "infosec.exchange",
-    "infosec.place",
-    "infosec.space",
-    "infosec.town",
-    "infra.social",
-    "infrastruct.social",
-    "ingwine.social",
-    "inherently.digital",
-    "inkspill.co",
-    "inn4tel.social",
-    "inne.city",
-    "inner.hollow.capital",
-    "innerinsight.industries",
-    "innerpeace.social",
-    "innesrichens.co.uk",
-    "innocent.yukimochi.io",
-    "innoq.social",
-    "inoot.net",
-    "inosoft.social",
-    "inscribe.social",
-    "insecure.umbreon.online",
-    "insightful.systems",
-    "insoumis.social",
-    "insta.landofkittens.social",
-    "insta.sakuragawa.moe",
-    "insta.sdns.club",
-    "instafops.net",
-    "instance.digital",
-    "instance1.fossibl.com",
-    "instance2.fossibl.com",
-    "intahnet.co.uk",
-    "intentional.network",
-    "interconnected.systems",
-    "interestingtimes.club",
-    "interfriender.org",
-    "interlace.space",
-    "interlan.ec",
-    "interledger.social",
-    "internaluse.net",
-    "international.idontcare.club",
-    "internaut.club",
-    "internetsladd.se",
-    "interrobang.pizza",
-    "inthebeliefofbetter.social",
-    "inthenews.social",
-    "intotheriff.com",
-    "introvert.country",
-    "introvert.social",
-    "intuitivefuture.com",
-    "inuh.net",
-    "io.bennyp.org",
-    "io.lu",
-    "io.mwl.io",
-    "io.waxandleather.com",
-    "ioc.exchange",
-    "ioioioio.io",
-    "iosdev.space",
-    "ip-central.ca",
-    "ippandon.hopto.org",
-    "ipv6.camp",
-    "ipv6.party",
-    "ipv6.social",
-    "iquit.nativosoft.com",
-    "irclocal.com",
-    "ironwynch.com",
-    "irrelephant.co",
-    "irrelevant.me.uk",
-    "irrsinn.life",
-    "irsoluciones.social",
-    "is-a.cat",
-    "is-a.horse",
-    "is-a.wyvern.rip",
-    "is-he.re",
-    "is.0w0.is",
-    "is.a.horrific.dev",
-    "is.a.qute.dog",
-    "is.aaronbsmith.com",
-    "is.awoo.ing",
-    "is.badat.dev",
-    "is.burntout.org",
-    "is.lewd.pm",
-    "is.nota.live",
-    "is.notaweso.me",
-    "is.slonk.ing",
-    "is.verweg.com",
-    "is0.ryanccn.dev",
-    "ischool.social",
-    "iscute.moe",
-    "isfeeling.social",
-    "isidai.com",
-    "islameye.com",
-    "islet.drapor.me",
-    "isnot.online",
-    "isnt.social",
-    "isntvery.social",
-    "isocial.cloud",
-    "israelmemories.com",
-    "ist-ur.org",
-    "ist.social",
-    "istanza.ch",
-    "istheguy.com",
-    "istoleyour.pw",
-    "it.szeged.social",
-    "itabashi.0j0.jp",
-    "italkedtostrangers.com",
-    "itcountrythai.com",
-    "itdev.social",
-    "itemis.social",
-    "itools.jp",
-    "itryhrd.com",
-    "its.ryjelsum.me",
-    "its.waah.day",
-    "itsme.lgbt",
-    "itsmf.online",
-    "iu.social",
-    "ivoor.eu",
-    "ivory.rosebloom.one",
-    "iwatedon.net",
-    "iway.social",
-    "ix.md",
-    "ix.uy",
-    "iyasaretai.pw",
-    "iyke.owncast.neofrakture.club",
-    "iys.io",
-    "iztasocial.site",
-    "j-ch.net",
-    "j2.logzinga.com",
-    "jabberwocky.moe",
-    "jachimowski.nl",
-    "jackdeighton.co.uk",
-    "jacksonhomestead.me",
-    "jacobcovell.com",
-    "jade.moe",
-    "jadero.com",
-    "jaegersocial.de",
-    "jaehanley.social",
-    "jaesharp.social",
-    "jakeromero.net",
-    "jakira.space",
-    "jako.social",
-    "jam.gay",
-    "jam.xwx.moe",
-    "jambo.social",
-    "jamesgallagher.photos",
-    "jamesgallagher.social",
-    "jamesravey.me",
-    "jamit.social",
-    "jammer.social",
-    "janitor.chat",
-    "janky.jacksonbates.com",
-    "janogdon.net",
-    "japix.schuerz.at",
-    "jar.informatik.uni-oldenburg.de",
-    "jaranmiller.com",
-    "jardinminiature.fedicity.net",
-    "jasdemi.com",
-    "jasette.facil.services",
-    "jasondavis.net",
-    "jasondavis.org",
-    "jauntygoat.net",
-    "javabubble.social",
-    "javisst.space",
-    "jawa.gay",
-    "jawns.club",
-    "jaxbeach.social",
-    "jaye.sh",
-    "jayesh.info",
-    "jaywll.co",
-    "jazztodon.com",
-    "jb.md",
-    "jbo.social",
-    "jcx.nu",
-    "jdracademy.fr",
-    "jeffburg.social",
-    "jellyfishtxt.hostdon.ne.jp",
-    "jellystyle.social",
-    "jemal.contact",
-    "jenkins.cc",
-    "jenkins.social",
-    "jenna.masto.host",
-    "jenrweb.com",
-    "jerryleetv.itvend.eu",
-    "jesusfan.de",
-    "jeunesse-communiste29.masto.host",
-    "jforo.com",
-    "jhr.social",
-    "jiaojiao.org",
-    "jibberjabber.online",
-    "jiggle.club",
-    "jinxd.tech",
-    "jiong.us",
-    "jir.moe",
-    "jistflow.com",
-    "jit.social",
-    "jitakurack.chotto.moe",
-    "jittr.click",
-    "jkpg.rocks",
-    "jlfr.me",
-    "jluo.io",
-    "jmm.kr",
-    "jmswag.xyz",
-    "joachymstal.cz",
-    "joeydrew.studio",
-    "johanv.net",
-    "johnmastodon.eu",
-    "johnnywebber.com",
-    "join.ahabitual.dev",
-    "join.mttv.it",
-    "joinfriendica.de",
-    "jointakahe.takahe.social",
-    "jollyville.net",
-    "jonburns.uk",
-    "jonleibowitz.social",
-    "jonmasters.social",
-    "jonpro.de",
-    "jontka.fi",
-    "joopleberry.garden",
-    "joost.net",
-    "joranwitte.com",
-    "jorts.horse",
-    "josa.social",
-    "josemurilo.com",
-    "josemurilo.peixe.co",
-    "josephcizek.com",
-    "josephgruber.space",
-    "josh.tel",
-    "joshbutts.social",
-    "joshuastrobl.social",
-    "jotboard.masto.host",
-    "journa.host",
-    "journalism.place",
-    "journme.social",
-    "journodon.com",
-    "jpmaxman.com",
-    "jpmstdn.com",
-    "jrollans.com",
-    "jrpg.town",
-    "jseggers.com",
-    "jsemholkacz.todon.de",
-    "jtlm.masto.host",
-    "jtrem.me",
-    "jubi.life",
-    "jugendtrier.de",
-    "juick.com",
-    "juju.house",
-    "julialang.social",
-    "julianjulian.moe",
-    "junebug.masto.host",
-    "juni.tube",
-    "junia.social",
-    "junimo.party",
-    "junk.rs",
-    "junkhub.org",
-    "jupiterslanding.social",
-    "juso.social",
-    "justabit.social",
-    "justanother.social",
-    "justbros.xyz",
-    "justfollow.me.uk",
-    "justice.tech",
-    "justinyost.social",
-    "justjake.masto.host",
-    "justme.masto.host",
-    "justsave.space",
-    "justsome.photos",
-    "justweb.dev",
-    "jvalleroy.me",
-    "jvm.social",
-    "jvpiter.net",
-    "jws.news",
-    "jxmsocial.xyz",
-    "k-on.kr",
-    "k-shiigi-136.masto.host",
-    "k.iim.gay",
-    "k.my-sky.blue",
-    "k18plus.social",
-    "k4o2vok.i.maeul.company",
-    "k67.club",
-    "k7v3qcc.i.maeul.company",
-    "k8s.social",
-    "kaartinen.photos",
-    "kaartinen.social",
-    "kabedon.space",
-    "kachel.social",
-    "kadono.moe",
-    "kafeneio.social",
-    "kafija.space",
-    "kahtlane.place",
-    "kaiju.social",
-    "kainehm.com",
-    "kaixin.meme",
-    "kaji.social",
-    "kalaclista.com",
-    "kalakukko.social",
-    "kalax.me",
-    "kaleido.moe",
-    "kali.lol",
-    "kalina.world",
-    "kalmar.social",
-    "kamel.social",
-    "kamiyacho.net",
-    "kampftoast.de",
-    "kamu.social",
-    "kancolle.social",
-    "kangaroo.to",
-    "kanina.be",
-    "kannitverstan.eu",
-    "kanoa.de",
-    "kaputtendorf.de",
-    "kapuverse.net",
-    "kar.ly",
-    "karakun.social",
-    "karel.today",
-    "karkador.com",
-    "karlsoderstrom.social",
-    "karlspace.masto.host",
-    "karlsruhe-social.de",
-    "karlsruhe.social",
-    "karmalife.io",
-    "karp.lol",
-    "kassel.social",
-    "kasukabe-leon.me",
-    "katasumi.no-monogatari.com",
-    "katchat.ddns.net",
-    "katsuru.live",
-    "katzebot.space",
-    "kauaku.us",
-    "kave.kibbutz.gay",
-    "kavlak.uk",
-    "kawaii.social",
-    "kawaiinet.com.au",
-    "kawakawa.fun",
-    "kayii.goe.land",
-    "kazee.social",
-    "kazunafr.f5.si",
-    "kazunapl.f5.si",
-    "kazv.moe",
-    "kb.kurotanesou.online",
-    "kb.usbharu.dev",
-    "kblue.10rino.net",
-    "kclc.us",
-    "kcmo.social",
-    "kde.social",
-    "kei.fashion",
-    "keikohori.com",
-    "kein.chat",
-    "kelleher.social",
-    "kemoner-don.tokyo",
-    "kemonodon.club",
-    "kemonololi.com",
-    "kenpo.social",
-    "kenryo-mastodon.f5.si",
-    "kernkraft.social",
-    "kerr.social",
-    "kestral.dev",
-    "keuwel.com",
-    "kevinianbryan.social",
-    "key.portend.place",
-    "key.weeb.su",
-    "keybiscayne.social",
-    "keyboards.social",
-    "keybored.me",
-    "keysmash.xn--q9jyb4c",
-    "kfalumni.social",
-    "kfem.cat",
-    "kfogel.org",
-    "khalifa.tn",
-    "khiar.net",
-    "kho.dev",
-    "khuluma.de",
-    "khw-pixelfed.archeron.eu",
-    "ki6bjv.social",
-    "kibitz.cloud",
-    "kibris.be",
-    "kicou.info",
-    "kiddush.social",
-    "kids.0px.io",
-    "kiefersfelden.social",
-    "kiessling.social",
-    "killyour.dad",
-    "kiloduck.com",
-    "kimpire.net",
-    "kinbaku.club",
-    "kind.social",
-    "kinetix.social",
-    "kink.clinic",
-    "kinkpic.site",
-    "kinktroet.social",
-    "kinkworks.com",
-    "kinky.baguette.cafe",
-    "kinky.business",
-    "kinkycats.org",
-    "kinkyelephant.com",
-    "kinney.social",
-    "kinryouku.tenshi.zip",
-    "kinu.ee",
-    "kiracollie.dog",
-    "kirakiratter.com",
-    "kiran.dog",
-    "kirbyfediverse.masto.host",
-    "kirche.social",
-    "kirchner.social",
-    "kiri.to",
-    "kirikabu.fedicity.net",
-    "kirishima.cloud",
-    "kiritan.work",
-    "kirk.social",
-    "kish.social",
-    "kishkush.net",
-    "kitch.win",
-    "kite.labs.seungjin.net",
-    "kite.seungjin.net",
-    "kitsunes.church",
-    "kitsunes.club",
-    "kitsunes.gay",
-    "kitsunet.net",
-    "kitsunet.org",
-    "kitty.community",
-    "kitty.haus",
-    "kitty.haus-alias.owo69.me",
-    "kitty.social",
-    "kitty.town",
-    "kittycat.homes",
-    "kittyshards.net",
-    "kitzmiller.social",
-    "kiwi.soda.jp.eu.org",
-    "kiyi.ca",
-    "kjas.no",
-    "klaus.positiveinfinity.net",
-    "klein.idyllische.monster",
-    "klein.social",
-    "kleinebackstube.org",
-    "klezmor.im",
-    "klog.tw",
-    "klunscher.social",
-    "kms.social",
-    "kmy.blue",
-    "kneel.before.dog",
-    "knottybeast.com",
-    "knottywolf.sexy",
-    "know.me.uk",
-    "knowledgehub.social",
-    "knowscore.social",
-    "knse.net",
-    "kobukobu.org",
-    "kocinski.me",
-    "kocour.club",
-    "koehler.social",
-    "koehlercode.dev",
-    "kogumus.masto.host",
-    "kohodon.com",
-    "kohodon.fedicity.net",
-    "koko.micenest.xyz",
-    "kokoni.co",
-    "kokoniha.nanimona.in",
-    "kokoro.garden",
-    "kokoro.shugetsu.space",
-    "kokuusa.club",
-    "kolektiva.social",
-    "kollegin.eu",
-    "komachan.jp",
-    "kommentakerfid.is",
-    "kommunismus.social",
-    "kompost.cz",
-    "komuna.minadoraserver.art",
-    "kon.tanukitsu.net",
-    "konbini.social",
-    "koneczny.info",
-    "konfigurationsmanufaktur.de",
-    "kongwoo.icu",
-    "kono.pub",
-    "konvergo.co.uk",
-    "kooktzi.ch",
-    "kopepasah.com",
-    "kopimi.space",
-    "kopiti.am",
-    "korallenherz.masto.host",
-    "koreadon.com",
-    "koreus.social",
-    "korikata.hostdon.ne.jp",
-    "korora.social",
-    "kos.ong",
-    "kosmos.social",
-    "kosonya.social",
-    "kotaro.me",
-    "kotatsu.cafe",
-    "kotlin.social",
-    "koto.moe",
-    "kotobaphil-mtdn.eu",
-    "koware-ship-g.fly.dev",
-    "kowelenz.social",
-    "kozterulethasznalatienge.day",
-    "kpop.social",
-    "kramerc.social",
-    "krapp.masto.host",
-    "krassestegang.social",
-    "kraut.social",
-    "krefeld.life",
-    "krems.social",
-    "krigskunst.social",
-    "kriwil.net",
-    "kroo.co",
-    "krpgpub.net",
-    "kryptopraktik.se",
-    "ku-kan-ya.hostdon.ne.jp",
-    "ku.vin.pet",
-    "kudzu.ca",
-    "kufstein.social",
-    "kuicker.koogle.sk",
-    "kulturfront.org",
-    "kulturwerkstatt.de",
-    "kumi.life",
-    "kunichogi.icu",
-    "kurage.cc",
-    "kurry.social",
-    "kuru.si",
-    "kurz.social",
-    "kuzko.eu",
-    "kvalhe.im",
-    "kvasir.lanofthedead.xyz",
-    "kvinneby.vendicated.dev",
-    "kvlt.zone",
-    "kw.social",
-    "kwak.cab",
-    "kwick.rip",
-    "kwiecien.us",
-    "kyou.social",
-    "kys.moe",
-    "kznk.hostdon.ne.jp",
-    "kzoo.to",
-    "l3ib.org",
-    "laalaa.land",
-    "lab-01.arewesecureyet.org",
-    "lab.nyanide.com",
-    "lab.tusk.city",
-    "labo.nora.social",
-    "laburo.social",
-    "laburrak.balaena.eus",
-    "labview.social",
-    "labyrinth.social",
-    "labyrinth.zone",
-    "lackthereof.info",
-    "lacommune.social",
-    "laconic.social",
-    "ladies.community",
-    "ladragonera.com",
-    "lafriks.id.lv",
-    "lain.com",
-    "lairds.com",
-    "lajna.si",
-    "lakedistrict.social",
-    "lambdaschmiede.social",
-    "lambdon.social",
-    "landofkittens.social",
-    "landshut.social",
-    "landwirtschaft.todon.de",
-    "langsec.social",
-    "lapincretin.fr",
-    "lapse2.owncast.neofrakture.club",
-    "large.social",
-    "larkspur.one",
-    "larry.town",
-    "larsen.social",
-    "larsfosdal.blog",
-    "laserdisc.party",
-    "lasersare.fun",
-    "lasersword.club",
-    "lastfree.space",
-    "latenight.social",
-    "latex.monster",
-    "laura.social",
-    "lausitz.social",
-    "lavacat-akkoma.v6.rocks",
-    "laviadililith.social",
-    "law.builders",
-    "lawfedi.blue",
-    "lawnerd.org",
-    "lawsocial.org",
-    "layer8.space",
-    "lazyatom.social",
-    "lazybear.social",
-    "lazysocial.de",
-    "lbry.world",
-    "ldwg.me",
-    "lea.lgbt",
-    "lea.pet",
-    "leafposter.club",
-    "leafy.town",
-    "leaninto.it",
-    "leanside.org",
-    "learningdisability.social",
-    "learningscienc.es",
-    "learnk8s.news",
-    "lebalkon.de",
-    "lebe.gg",
-    "lebrady.net",
-    "lectura.social",
-    "lediomar.masto.host",
-    "lediva.masto.host",
-    "lediver.se",
-    "leds.social",
-    "left-tusk.com",
-    "leftist.network",
-    "leftodon.social",
-    "leftover.puscii.nl",
-    "legal.social",
-    "legaltech.social",
-    "legionify.com",
-    "legit.dog",
-    "lehrerzimmer.social",
-    "lehrmastodon.com",
-    "leibniz.ap.social",
-    "leibniz.pub",
-    "leipzig.town",
-    "lejaua6.club",
-    "lemonparty.social",
-    "lentil.social",
-    "lepisma.novababilonia.me",
-    "leporid.net",
-    "lepoulsdumonde.com",
-    "leroma.shrieker.net",
-    "les-carnets-de-lecture-de.l-arbre-a-bafouilles.fr",
-    "lesbi.in",
-    "lesbian.masto.host",
-    "lesbian.solutions",
-    "lesbianschool.com",
-    "leselog.de",
-    "letallmortalfleshfindtheirvoice.social",
-    "lethallava.land",
-    "lethargic.talkative.fish",
-    "letovostudent.ru",
-    "letus.inspiredlife.fun",
-    "leuchtetgruen.me",
-    "leuno.kr",
-    "levallo.is",
-    "lewacki.space",
-    "lewd.lgbt",
-    "lewdpost.com",
-    "lexvox.org",
-    "lfnt.site",
-    "lgbt.io",
-    "lgbtcz.social",
-    "lgbtqia.space",
-    "lgtm.systems",
-    "lgv2.com",
-    "lia.fail",
-    "libella.social",
-    "libera.tokyo",
-    "liberal.city",
-    "liberal.lgbt",
-    "liberalsociety.uk",
-    "liberdon.com",
-    "libertaria.space",
-    "libertynode.cam",
-    "libertynode.net",
-    "libori.social",
-    "libranet.de",
-    "libranigans.com",
-    "librarian.fyi",
-    "library.chatan.cc",
-    "library.love",
-    "library.southfox.me",
-    "library.xwyqi.org",
-    "libraryland.social",
-    "librarysocialism.social",
-    "librenet.co.za",
-    "libretooth.gr",
-    "libretweet.com",
-    "libroj.org",
-    "libros.dev.rizoma1.ar",
-    "libros.rizoma1.ar",
-    "librosphere.fr",
-    "lieurance.social",
-    "life.omx.ch",
-    "life.starly.blue",
-    "lifehack.social",
-    "lifeof.ahabitual.dev",
-    "lifergeek.social",
-    "liga.schach.social",
-    "lightcrystal.fedicity.net",
-    "lighthouse-eco.co.za",
-    "lights.tokyo",
-    "lighttheunicorn.horse",
-    "ligma.pro",
-    "likeme.social",
-    "liker.social",
-    "lil.thot.yoga",
-    "lile.cl",
-    "lilienthal.social",
-    "lilkev.dev",
-    "lily.network",
-    "lilymagic.com",
-    "limbo.nullafati.xyz",
-    "lime.fuo.fi",
-    "lime.soda.jp.eu.org",
-    "limepeeps.perchinup.top",
-    "liminalgici.spacc.eu.org",
-    "liminalisland.xyz",
-    "lin.cat",
-    "lincolnite.net",
-    "linden.social",
-    "lindgren.tech",
-    "line.yamanote.tokyo.jp",
-    "linernotes.club",
-    "linfan.moe",
-    "lingo.lol",
-    "linguisten.info",
-    "linguistic.earth",
-    "linguists.social",
-    "linh.social",
-    "link.baai.ac.cn",
-    "linke.social",
-    "linkedlist.social",
-    "links.potsda.mn",
-    "linux.pt",
-    "linux.social",
-    "linuxhotel.social",
-    "linuxjobs.social",
-    "linuxlab.sh",
-    "linuxrocks.online",
-    "lioncourt.social",
-    "lipn.info",
-    "lipsia.casa",
-    "lire.boitam.eu",
-    "lislegaard.stream",
-    "listodon.com",
-    "lit.tlespace.xyz",
-    "literally.pictures",
-    "literatur.social",
-    "litrpg.online",
-    "little.illithid.online",
-    "littlefo.rest",
-    "liuli.lol",
-    "live.absturztau.be",
-    "live.acra.cloud",
-    "live.apesshelter.org.uk",
-    "live.birdcat.cafe",
-    "live.bungle.chat",
-    "live.byzero.de",
-    "live.cheri.pink",
-    "live.clar.ke",
-    "live.commander1024.de",
-    "live.davbot.media",
-    "live.deb.at",
-    "live.dehub.club",
-    "live.denmanrooke.com",
-    "live.edinburghman.com",
-    "live.enoent.one",
-    "live.eulerroom.com",
-    "live.excal.ru",
-    "live.faejr.gay",
-    "live.famkos.net",
-    "live.fellr.net",
-    "live.gamers-pub.de",
-    "live.gamerstavern.online",
-    "live.gianmarco.gg",
-    "live.glennon.online",
-    "live.grafo.zone",
-    "live.greenboi.me",
-    "live.hatnix.net",
-    "live.hdrs.nl",
-    "live.hermitcollective.net",
-    "live.ianandjayspaceout.com",
-    "live.ilyamikcoder.com",
-    "live.imsofucking.gay",
-    "live.isolinear.space",
-    "live.jacen.moe",
-    "live.jacky.wtf",
-    "live.janez.cz",
-    "live.jenoki.net",
-    "live.jugregator.org",
-    "live.kd0bpv.name",
-    "live.kemonomimifan.club",
-    "live.kirigiri.me",
-    "live.kitsunech.jp.net",
-    "live.kloenk.dev",
-    "live.linfan.moe",
-    "live.loveyourdemons.games",
-    "live.lukaprincic.si",
-    "live.malenfant.net",
-    "live.mrfunkedude.com",
-    "live.n3rd.cc",
-    "live.naln1.ca",
-    "live.nano.lgbt",
-    "live.nategullion.com",
-    "live.njion.org",
-    "live.nomadgeek.org",
-    "live.nuemedia.se",
-    "live.olimaia.net",
-    "live.osintukraine.com",
-    "live.overcharged.dev",
-    "live.phoenixup.link",
-    "live.plantsand.coffee",
-    "live.pretok.tv",
-    "live.qyliss.net",
-    "live.rachel.cafe",
-    "live.rappet.xyz",
-    "live.ravenholm.club",
-    "live.retrostrange.com",
-    "live.rhys.wtf",
-    "live.rijndael.cc",
-    "live.rtrace.io",
-    "live.sabilewcreates.com",
-    "live.sebsite.pw",
-    "live.secluded.site",
-    "live.shom.dev",
-    "live.shrik3.com",
-    "live.skobk.in",
-    "live.soafen.love",
-    "live.superseriousbusiness.org",
-    "live.szkod.ovh",
-    "live.tackoor.tv",
-    "live.termer.net",
-    "live.theminxshow.com",
-    "live.valvin.fr",
-    "live.vencabot.com",
-    "live.vending-machine.xyz",
-    "live.waartz.fr",
-    "live.weebvr.com",
-    "live.xenua.me",
-    "livecast.vervillos.com",
-    "liveinthemoment.blue",
-    "livellosegreto.it",
-    "liveplatform.ca",
-    "liverpoolfootballclub.social",
-    "livers.jp",
-    "livester.net",
-    "livingblindfully.social",
-    "livingevil.de",
-    "liyhu.social",
-    "lizard.zone",
-    "lizards.live",
-    "ljs.social",
-    "lllsecurity.com",
-    "lm.kazv.moe",
-    "lmnop.social",
-    "lncn.dev",
-    "lobsters.social",
-    "local.abtmtr.link",
-    "localization.cafe",
-    "localization.social",
-    "loci.onl",
-    "locked.canids.de",
-    "locksport.space",
-    "lodestar85.xyz",
-    "loerzweiler.social",
-    "lofi.org.uk",
-    "loforo.com",
-    "log.lu",
-    "logjam.city",
-    "logoff.website",
-    "lol.dydx.moe",
-    "lol.lamp.wtf",
-    "loli.best",
-    "loli.exposed",
-    "loli.vodka",
-    "lolic.at",
-    "lolison.network",
-    "loma.ml",
-    "lomo.live",
-    "loneliness.academy",
-    "lonely.town",
-    "lonestar.chat",
-    "longcovid.biocomm.net",
-    "longcovid.social",
-    "longshadowgames.com",
-    "lookingup.francois-rincon.org",
-    "lopp.social",
-    "lor.sh",
-    "lorazepam.lol",
-    "lore.livellosegreto.it",
-    "lorenzana.social",
-    "loser.academy",
-    "loser.cafe",
-    "lost-in-outer.space",
-    "lostall.faith",
-    "lostfocus.de",
-    "lotor.network",
-    "lottev.moe",
-    "lottia.net",
-    "lotuseffect.social",
-    "lotz.cloud",
-    "lou.lt",
-    "loud.computer",
-    "lounge.fan",
-    "lounge.swineair.com",
-    "lounge.town",
-    "lousydomain.xyz",
-    "loutre.info",
-    "love.alicecomplex.com",
-    "lovelace.social",
-    "lovelysweetdreamers.cool",
-    "loves.reisen",
-    "lovingcounty.cafe",
-    "lowkey.zone",
-    "lowlab.social",
-    "loxodon.balafon.net",
-    "lsbt.me",
-    "lsngl.us",
-    "lsof.uk",
-    "lubar.me",
-    "luc.cat",
-    "lucaire.ovh",
-    "lucha.nyc",
-    "lucitt.social",
-    "ludosphere.fr",
-    "lug.sh",
-    "lugnasad.eu",
-    "lukas.stancik.cz",
-    "lumberjacks.social",
-    "luminoushaven.de",
-    "lumiose.city",
-    "luna.social",
-    "luna.vg",
-    "lunaire.io",
-    "lunar.place",
-    "lust4love.eu.org",
-    "lustigetiernamenbubble.de",
-    "luther.social",
-    "luvndestiny.com",
-    "lux-nightclub.com",
-    "luzeed.org",
-    "lvb.io",
-    "lviv.social",
-    "lviv.today",
-    "lyctor.space",
-    "lyingvoid.social",
-    "lynham.xyz",
-    "lyre.live",
-    "m-i.im",
-    "m-test.254.network",
-    "m.0x.mk",
-    "m.170908.xyz",
-    "m.9yz.de",
-    "m.aardling.social",
-    "m.abunchtell.com",
-    "m.abxy.games",
-    "m.abyss.moe",
-    "m.adventurehound.io",
-    "m.affekt.org",
-    "m.ai6yr.org",
-    "m.aki-null.net",
-    "m.alexyang.me",
-    "m.allistodon.xyz",
-    "m.andrewcantino.com",
-    "m.ansd.xyz",
-    "m.antelopelovefan.com",
-    "m.appdevs.io",
-    "m.aqr.af",
-    "m.aqra.farm",
-    "m.arenzana.org",
-    "m.askesis.pl",
-    "m.astest.org",
-    "m.astodon.app",
-    "m.ating.press",
-    "m.b3.hk",
-    "m.baldhead.be",
-    "m.banjo.camp",
-    "m.barcelo.ynh.fr",
-    "m.bavetta.com",
-    "m.benonis.net",
-    "m.benui.ca",
-    "m.beow.party",
-    "m.biendeo.com",
-    "m.bit-friends.de",
-    "m.blablu.de",
-    "m.blackcat.cx",
-    "m.blank.org",
-    "m.blasteh.uk",
-    "m.bohlenlabs.com",
-    "m.bonzoesc.net",
-    "m.bratpfannenberg.com",
-    "m.brokep.com",
-    "m.burzmali.com",
-    "m.campfi.rs",
-    "m.catpowered.net",
-    "m.cestlavie.moe",
-    "m.chronosaur.us",
-    "m.chun.pro",
-    "m.cmx.im",
-    "m.comfycamp.space",
-    "m.coolhost.fr",
-    "m.corduba.tech",
-    "m.csgo.gg",
-    "m.daevien.com",
-    "m.daize.xin",
-    "m.danq.me",
-    "m.debianlinux.de",
-    "m.devep.net",
-    "m.dikmax.name",
-    "m.divita.eu",
-    "m.djw.li",
-    "m.dsnv.net",
-    "m.eallion.com",
-    "m.edgarpierre.fr",
-    "m.ef.gg",
-    "m.ehlxr.me",
-    "m.einverne.info",
-    "m.ellicstudio.net",
-    "m.epon.io",
-    "m.eula.dev",
-    "m.fa.gl",
-    "m.fedica.com",
-    "m.femboy.im",
-    "m.feyo.pw",
-    "m.flyemoji.moe",
-    "m.fnwl.uk",
-    "m.fru.bar",
-    "m.furryfandom.me",
-    "m.futex.au",
-    "m.g3l.org",
-    "m.g3rv4.com",
-    "m.galaxybound.com",
-    "m.gctxl.com",
-    "m.geraffel.net",
-    "m.ggrks.moe",
-    "m.gom.tools",
-    "m.gravitystorm.co.uk",
-    "m.gtk.pw",
-    "m.gui.do",
-    "m.gy.gl",
-    "m.heine.xyz",
-    "m.hirad.it",
-    "m.hpkns.uk",
-    "m.ie9.org",
-    "m.in0rdr.ch",
-    "m.indefinitely.social",
-    "m.ipoac.nl",
-    "m.ix.is",
-    "m.jeppesen.io",
-    "m.jinwei.me",
-    "m.jling.dev",
-    "m.justbartek.ca",
-    "m.kaij.tech",
-    "m.karoukin.us",
-    "m.kawaii.gg",
-    "m.kc4kqe.org",
-    "m.keng42.com",
-    "m.kev.cc",
-    "m.kirishima.cloud",
-    "m.knucklebones.rip",
-    "m.kog.to",
-    "m.krbonne.net",
-    "m.kretschmann.social",
-    "m.krikkert.net",
-    "m.lanciano.it",
-    "m.loffe.nu",
-    "m.lonet.org",
-    "m.luvz.me",
-    "m.marchbox.com",
-    "m.meredith.cc",
-    "m.moe.cat",
-    "m.monika.im",
-    "m.mou.best",
-    "m.mtjm.eu",
-    "m.mtlynch.io",
-    "m.mu7ou.com",
-    "m.mushus.net",
-    "m.nagoya832.net",
-    "m.nickching.com",
-    "m.nintendojo.fr",
-    "m.nithou.net",
-    "m.nogamenolife.me",
-    "m.nov.im",
-    "m.noxie.ch",
-    "m.objc.io",
-    "m.occ.me",
-    "m.ocsf.in",
-    "m.ojodojo.casa",
-    "m.on-trails.com",
-    "m.onweb.idv.tw",
-    "m.orbx.net",
-    "m.otta.world",
-    "m.otter.homes",
-    "m.pandasemi.co",
-    "m.parp.ing",
-    "m.petrus.sk",
-    "m.phantomthieves.net",
-    "m.phase.org",
-    "m.pigeonburger.xyz",
-    "m.poitr.us",
-    "m.posterdati.it",
-    "m.powerweb.io",
-    "m.prettyshiny.org",
-    "m.progi.vet",
-    "m.prt.si",
-    "m.pupu.moe",
-    "m.qqs.tw",
-    "m.quaoar.xyz",
-    "m.r8z.us",
-    "m.rakyll.org",
-    "m.rosania.org",
-    "m.rse43.com",
-    "m.rselbach.com",
-    "m.rthome.me",
-    "m.rua.plus",
-    "m.rvf6.com",
-    "m.rwhb.me",
-    "m.rymnd.net",
-    "m.rynftz.gr",
-    "m.santolin.eu",
-    "m.sax.net",
-    "m.selden.page",
-    "m.servperso.net",
-    "m.sim.onl",
-    "m.sirousa.me",
-    "m.socialyeti.club",
-    "m.somincola.org",
-    "m.sportshaus.ca",
-    "m.stad.social",
-    "m.superuser.one",
-    "m.surf.social",
-    "m.takamoriai.co",
-    "m.techsocial.site",
-    "m.teela.jp",
-    "m.terryx.com",
-    "m.tgl.eu",
-    "m.thebroom.us",
-    "m.thibau.lt",
-    "m.tigercubden.com",
-    "m.tim.do",
-    "m.tkw.fm",
-    "m.toad.host",
-    "m.tomaz.me",
-    "m.tpaschalis.me",
-    "m.tripulse.link",
-    "m.trisweb.com",
-    "m.tweepsmap.com",
-    "m.twi.wtf",
-    "m.tzyl.eu",
-    "m.udrei.org",
-    "m.understars.dev",
-    "m.undertone.org",
-    "m.undreaming.org",
-    "m.universetoday.com",
-    "m.unix.house",
-    "m.upsilo.net",
-    "m.uwuntu.org",
-    "m.vilcor.org",
-    "m.vlekken.net",
-    "m.vogt.dev",
-    "m.webtoo.ls",
-    "m.wedgi.us",
-    "m.winblad.io",
-    "m.windy.me",
-    "m.wingu.se",
-    "m.with.moe",
-    "m.withconor.com",
-    "m.wulingate.com",
-    "m.xuv.be",
-    "m.y.community",
-    "m.yerp.io",
-    "m.yihao.moe",
-    "m.youcune.com",
-    "m.yufushiro.dev",
-    "m.zaatar.org",
-    "m.zkc.se",
-    "m.zr40.nl",
-    "m.zyxl.xyz",
-    "m.zzzxxx.xyz",
-    "m1.minorthoughts.com",
-    "m1.thosemartins.net",
-    "m1x.app",
-    "m29.us",
-    "m6n.akimasa.jp",
-    "m6n.ca",
-    "m6n.eu",
-    "m6n.io",
-    "m6n.onsen.tech",
-    "m7.social",
-    "ma.ak11tm.any64.de",
-    "ma.bitraten.net",
-    "ma.diacrown.com",
-    "ma.fellr.net",
-    "ma.fono.jp",
-    "ma.id10t.it",
-    "ma.minimal.blue",
-    "ma.rokoucha.net",
-    "ma.s0c.in",
-    "ma.zcx.cc",
-    "ma2moto.hostdon.ne.jp",
-    "maaw.social",
-    "mabe.space",
-    "macavity.cat",
-    "macaw.social",
-    "mace.social",
-    "mach-o.com",
-    "machikadon.online",
-    "machine.elves.icu",
-    "machines.social",
-    "machteburch.social",
-    "maciaszek.social",
-    "maciek.pics",
-    "maclock.social",
-    "macnemo.social",
-    "macrofurs.social",
-    "madameplay.com.br",
-    "maddie.rocks",
-    "maddox.io",
-    "maddux.blog",
-    "madmullins.live",
-    "mado.clatter.cc",
-    "madr.it",
-    "madworld.social",
-    "maeh.social",
-    "maestas.photos",
-    "maestas.us",
-    "mafis242.de",
-    "mage.town",
-    "magentix.space",
-    "magic.win",
-    "magical-ribbon.net",
-    "magincia.cafe",
-    "magnetic-ink.dk",
-    "magnificentbeardsfan.club",
-    "magpie.gay",
-    "magpie.masto.host",
-    "magray.family",
-    "maguire.social",
-    "mahalo.social",
-    "mahiradon.com",
-    "mahiro222.fedicity.net",
-    "mahler.earth",
-    "mahno.zacepil.com",
-    "maho.app",
-    "mai.waifuism.life",
-    "maid.zip",
-    "maidsin.space",
-    "maier.social",
-    "maik.social",
-    "mailcow.social",
-    "mainburg.hallertau.social",
-    "mainframe.club",
-    "mainspitze.social",
-    "majak.de",
-    "majors.social",
-    "makegayfriends.com",
-    "makersocial.online",
-    "makerspace.au",
-    "makerspace.social",
-    "makervine.net",
-    "makito.moe",
-    "mako3sun.com",
-    "malaga.social",
-    "malenfant.net",
-    "malnacido.com",
-    "malone.social",
-    "malt.social",
-    "malu.today",
-    "maly.io",
-    "mammonte.us",
-    "mammoth.64b1t.com",
-    "mammoth.gry.st",
-    "mammothcirc.us",
-    "mammouth.inframed.net",
-    "mammouth.mulot.org",
-    "mammut.cyou",
-    "mammut.gogreenit.net",
-    "mammut.moe",
-    "mammut.mx",
-    "mammut.sekhen.com",
-    "mammuthus.xyz",
-    "mamoot.dev",
-    "mamoswine.pkmn.cloud",
-    "mamot.fr",
-    "mamut.social",
-    "mamut.tic-ac.org",
-    "mamuti.ieleja.lv",
-    "mamutovo.cz",
-    "mamutut.space",
-    "managingengineers.net",
-    "mancavgeek.co.uk",
-    "mandelbrotsetapp.com",
-    "mandra.us",
-    "manel-masto.mooo.com",
-    "manfre.net",
-    "manganiello.social",
-    "manitu.social",
-    "manny.dilithium.fr",
-    "manohitotoki.com",
-    "mao.mastodonhub.com",
-    "mapstodon.space",
-    "mapstodon.technology",
-    "mapsupport.de",
-    "mar.archipielago.uno",
-    "maratang.life",
-    "marchingband.social",
-    "marctodon.marci.one",
-    "margaras.k47.cz",
-    "mariameeting.masto.host",
-    "mariko2406.fedicity.net",
-    "marimoko.biz",
-    "marinthecatto.com",
-    "markku.raitisoja.cloud",
-    "markusklein.cc",
-    "marnanel.org",
-    "maro.xyz",
-    "maron.blue",
-    "marshall.house",
-    "martianbase.net",
-    "martin.farrent.de",
-    "martinh.net",
-    "marx21.social",
-    "mas.aifeel.top",
-    "mas.akdub.club",
-    "mas.atmx.ca",
-    "mas.corq.co",
-    "mas.erb.pw",
-    "mas.ggr.me",
-    "mas.gordons.gen.nz",
-    "mas.greatlakes.club",
-    "mas.home.monsiteinternet.org",
-    "mas.n0t.net",
-    "mas.neuroscience.day",
-    "mas.nocogabriel.fr",
-    "mas.nzcow.com",
-    "mas.panix.com",
-    "mas.pub",
-    "mas.sirtf.com",
-    "mas.skip2.net",
-    "mas.structuraltrauma.org",
-    "mas.to",
-    "mas.todon.de",
-    "mas.todon.rocks",
-    "mas.town",
-    "mas.trolled.lol",
-    "mas.whippy.kr",
-    "mas.wrong.tools",
-    "mas.xadacka.com",
-    "mas2.kyosakuyo.com",
-    "masatodon.net",
-    "masayuki.haruho.net",
-    "mascodon.jp",
-    "maser.social",
-    "mashtodon.alterracloud.com",
-    "maskodon.org",
-    "masktodon.social",
-    "masse.xn--qubec-csa.tk",
-    "mast.2enp.cc",
-    "mast.benstokman.me",
-    "mast.boston",
-    "mast.cat.scot",
-    "mast.clippyco.com",
-    "mast.codingjim.com",
-    "mast.dragon-fly.club",
-    "mast.eu.org",
-    "mast.evulid.cc",
-    "mast.fedicity.net",
-    "mast.fslurs.gay",
-    "mast.giants-club.net",
-    "mast.holistichackers.org",
-    "mast.hpc.social",
-    "mast.hutchie.scot",
-    "mast.j5155.page",
-    "mast.keyd.ru",
-    "mast.lat",
-    "mast.liaw.me",
-    "mast.linuxgamecast.com",
-    "mast.lukeog.com",
-    "mast.mako.li",
-    "mast.mmwelch.net",
-    "mast.moe",
-    "mast.mrrl.me",
-    "mast.nh1.network",
-    "mast.odon.irish",
-    "mast.pceninja.com",
-    "mast.qixto.com",
-    "mast.querie.net",
-    "mast.shbbl.ru",
-    "mast.shitpostbot.com",
-    "mast.srweaver.com",
-    "mast.stalker.ee",
-    "mast.sudrien.net",
-    "mast.thatalex.dev",
-    "mast.the-hopkins.com",
-    "mast.thomasdmn.net",
-    "mast.tpz.de",
-    "mast.ttk.is",
-    "mast.uxp.de",
-    "mast.wangwood.house",
-    "mast.wurmela.de",
-    "mast.yourautisticlife.com",
-    "mast.yurec.online",
-    "mast.yuri.place",
-    "mastadano.com",
-    "mastadon.astuto.cc",
-    "mastadon.dumbthing.org",
-    "mastadon.gabrielfelipe.com",
-    "mastadon.littlebonsai.co.uk",
-    "mastadon.thelibrary.social",
-    "mastd.dev",
-    "mastd.racing",
-    "mastdn.io",
-    "mastdn.social",
-    "masterbatedone.social",
-    "masticore.co.uk",
-    "mastinsaan.in",
-    "mastnode.faith",
-    "masto-lab-01.arewesecureyet.org",
-    "masto-lab-02.arewesecureyet.org",
-    "masto-test.home.ctu.cx",
-    "masto.1146.nohost.me",
-    "masto.4lgorhythm.io",
-    "masto.98degrees.co.uk",
-    "masto.a0s.de",
-    "masto.aartwix.fr",
-    "masto.adamchandler.me",
-    "masto.ai",
-    "masto.al2.in",
-    "masto.alancfrancis.com",
-    "masto.alittleofnothing.co.uk",
-    "masto.allerlei.it",
-    "masto.allrite.at",
-    "masto.amosamos.net",
-    "masto.anarch.cc",
-    "masto.antovolk.co.uk",
-    "masto.aranfielder.art",
-    "masto.archous.net",
-    "masto.ashfurrow.com",
-    "masto.asonix.dog",
-    "masto.astrra.space",
-    "masto.batichi.net",
-    "masto.bcan.org",
-    "masto.bg",
-    "masto.big.sb",
-    "masto.bike",
-    "masto.bimbiribase.xyz",
-    "masto.binaryworks.ca",
-    "masto.blasters.fr",
-    "masto.bobbybasement.noho.st",
-    "masto.bot",
-    "masto.brightfur.net",
-    "masto.canadiancivil.com",
-    "masto.chelmi.info",
-    "masto.chezwam.eu",
-    "masto.chrisbarnes.xyz",
-    "masto.chronos-tachyon.net",
-    "masto.cloudnull.network",
-    "masto.colonelinux.org",
-    "masto.comversive.com",
-    "masto.craftcms.com",
-    "masto.ctms.me",
-    "masto.cyanbane.com",
-    "masto.danslesbois.info",
-    "masto.dentora.social",
-    "masto.deoan.org",
-    "masto.design",
-    "masto.destructatron.net",
-    "masto.digittante.com",
-    "masto.donte.com.br",
-    "masto.dopiaza.org",
-    "masto.doserver.top",
-    "masto.drydenhouse.org",
-    "masto.edtrots.com",
-    "masto.efdnet.com",
-    "masto.epoch.dk",
-    "masto.es",
-    "masto.esophiamedias.fr",
-    "masto.evelynyap.com",
-    "masto.extragornax.fr",
-    "masto.ezhevita.dev",
-    "masto.fam-weidig.de",
-    "masto.fanfic.army",
-    "masto.fediverse.be",
-    "masto.floofy.city",
-    "masto.flyingburri.to",
-    "masto.flyonthewall.buzz",
-    "masto.ford.id.au",
-    "masto.futbol",
-    "masto.fuzzy.systems",
-    "masto.galooph.com",
-    "masto.garriguv.io",
-    "masto.gerkenator.com",
-    "masto.globaleas.org",
-    "masto.glorious-space.eu",
-    "masto.granvalenti.art",
-    "masto.gred.al",
-    "masto.gregnewman.io",
-    "masto.gruezi.us",
-    "masto.gundan.es",
-    "masto.halfpastfour.club",
-    "masto.henchmonkey.org",
-    "masto.hitorino.tv",
-    "masto.hivane.net",
-    "masto.hoffman.studio",
-    "masto.id",
-    "masto.ink",
-    "masto.jacobrayschwartz.com",
-    "masto.jatm.link",
-    "masto.jln.io",
-    "masto.kinluwi.net",
-    "masto.kix2902.dev",
-    "masto.koutoupis.com",
-    "masto.krashboyz.org",
-    "masto.kreks.nl",
-    "masto.kruythoff.net",
-    "masto.lema.org",
-    "masto.lilith.ynh.fr",
-    "masto.louzao.network",
-    "masto.macaddict89.me",
-    "masto.machlis.com",
-    "masto.masto.com",
-    "masto.mcgeo.xyz",
-    "masto.measure.chat",
-    "masto.migou.synology.me",
-    "masto.mkm.scot",
-    "masto.mo.tt",
-    "masto.moe",
-    "masto.monero.space",
-    "masto.mtcrew.org",
-    "masto.musicto.com",
-    "masto.namtao.com",
-    "masto.nd2.uk",
-    "masto.neb.host",
-    "masto.nerdy-technician.social",
-    "masto.nicolastissot.fr",
-    "masto.nobigtech.es",
-    "masto.notso.net",
-    "masto.nox-rhea.org",
-    "masto.nu",
-    "masto.nuteburn.com",
-    "masto.nyc",
-    "masto.onemanandhisblog.com",
-    "masto.onurb.net",
-    "masto.p-nintendo.com",
-    "masto.phoenixlair.net",
-    "masto.pizzac.at",
-    "masto.pogmom.me",
-    "masto.popgeeks.com",
-    "masto.pt",
-    "masto.qa.urbanwildlife.biz",
-    "masto.queerscience.net",
-    "masto.rigolo.fun",
-    "masto.ruzik.xyz",
-    "masto.sadrarin.com",
-    "masto.sangberg.se",
-    "masto.saturnforge.com",
-    "masto.ser.dfmab.eu",
-    "masto.simbafs.cc",
-    "masto.skylinehub.live",
-    "masto.sneeu.com",
-    "masto.social",
-    "masto.spottyer.one",
-    "masto.syntheticmemory.net",
-    "masto.tab-e.de",
-    "masto.terabyte-computing.com",
-    "masto.theoks.net",
-    "masto.thepit.space",
-    "masto.toadking.com",
-    "masto.trtmn.io",
-    "masto.tux.tf",
-    "masto.twib.me",
-    "masto.ukrainedao.love",
-    "masto.uno",
-    "masto.vocata.one",
-    "masto.vy-let.software",
-    "masto.wardenburg.social",
-    "masto.wizardfrag.co.uk",
-    "masto.wumix.net",
-    "masto.yttrx.com",
-    "masto1.100flowers.tech",
-    "masto1.ultrafeed.dev",
-    "mastoadmin.io",
-    "mastoart.social",
-    "mastobate.social",
-    "mastoben.rocks",
-    "mastobot.ping.moi",
-    "mastobotti.eu",
-    "mastochist.social",
-    "mastocomm.org",
-    "mastod.no",
-    "mastod1.ddns.net",
-    "mastodaix.de",
-    "mastoden.com",
-    "mastodev.fedilab.app",
-    "mastodns.net",
-    "mastodo.fi",
-    "mastodo.it",
-    "mastodo.neoliber.al",
-    "mastodo.ng",
-    "mastodoh.com",
-    "mastodol.jp",
-    "mastodom.social",
-    "mastodon-0139d495.cloudplane.app",
-    "mastodon-1p-u12491.vm.elestio.app",
-    "mastodon-36ba00f2.cloudplane.app",
-    "mastodon-7ecc009c.cloudplane.app",
-    "mastodon-belgium.be",
-    "mastodon-blablalinux.be",
-    "mastodon-dev.mainasuk.com",
-    "mastodon-dev.stevex.online",
-    "mastodon-efa303e0.cloudplane.app",
-    "mastodon-elestio-u1962.vm.elestio.app",
-    "mastodon-ero.xyz",
-    "mastodon-f3c89072.cloudplane.app",
-    "mastodon-fipa.fr",
-    "mastodon-japan.net",
-    "mastodon-jp.com",
-    "mastodon-nieuwspaal.nl",
-    "mastodon-pa.sorbonne-universite.fr",
-    "mastodon-qu.net",
-    "mastodon-s.com",
-    "mastodon-sheep-smile.com",
-    "mastodon-stage.stanford.edu",
-    "mastodon-swiss.org",
-    "mastodon-test-1.cameko.org",
-    "mastodon-test.event-federation.eu",
-    "mastodon-uk.net",
-    "mastodon.0ne.day",
-    "mastodon.0x01.me",
-    "mastodon.0x82.com",
-    "mastodon.0xcb.dev",
-    "mastodon.0xd8.dk",
-    "mastodon.100terres.com",
-    "mastodon.137i.de",
-    "mastodon.1984.cz",
-    "mastodon.1in1.net",
-    "mastodon.24bit48khz.de",
-    "mastodon.287industries.com",
-    "mastodon.31337.eu",
-    "mastodon.360.cymru",
-    "mastodon.3dcandy.social",
-    "mastodon.3dgo.net",
-    "mastodon.3fx.ch",
-    "mastodon.481516.xyz",
-    "mastodon.4af.eu",
-    "mastodon.536.fr",
-    "mastodon.54park.de",
-    "mastodon.7365000.xyz",
-    "mastodon.7sdre.am",
-    "mastodon.8086.net",
-    "mastodon.8086.org",
-    "mastodon.a09.uk",
-    "mastodon.a17t.dev",
-    "mastodon.a7tech.net",
-    "mastodon.aargaunet.ch",
-    "mastodon.abstractbits.net",
-    "mastodon.abushady.com",
-    "mastodon.acc.sunet.se",
-    "mastodon.acc.umu.se",
-    "mastodon.accelsukiru.de",
-    "mastodon.accessinformationnews.com",
-    "mastodon.accolade.digital",
-    "mastodon.acerbo.me",
-    "mastodon.acm.org",
-    "mastodon.acolono.me",
-    "mastodon.activitypub.be",
-    "mastodon.actors.social",
-    "mastodon.adamazing.de",
-    "mastodon.adamgeitgey.com",
-    "mastodon.addo.art",
-    "mastodon.adida.net",
-    "mastodon.adju.st",
-    "mastodon.adorsaz.ch",
-    "mastodon.adrien.run",
-    "mastodon.adrienlacombe.me",
-    "mastodon.adsaminu.com",
-    "mastodon.adtension.com",
-    "mastodon.ae02.de",
-    "mastodon.africa",
-    "mastodon.afromunkee.live",
-    "mastodon.aguiarvieira.pt",
-    "mastodon.ahorn.info",
-    "mastodon.ai-vidence.com",
-    "mastodon.ai8w.ddns.net",
-    "mastodon.aioo.ooo",
-    "mastodon.airi.tv",
-    "mastodon.airstrip1.uk",
-    "mastodon.aiursoft.cn",
-    "mastodon.ajhughes.dev",
-    "mastodon.akhepcat.com",
-    "mastodon.akmentins.com",
-    "mastodon.akop.online",
-    "mastodon.akxnet.de",
-    "mastodon.albertoluna.es",
-    "mastodon.alex.net",
-    "mastodon.alexnackenoff.com",
-    "mastodon.alfheimr.xyz",
-    "mastodon.alkaabi.io",
-    "mastodon.alljoin.me",
-    "mastodon.allnutt.net",
-    "mastodon.alphapi.me",
-    "mastodon.alrescha.com",
-    "mastodon.altf4.fun",
-    "mastodon.alvani.me",
-    "mastodon.amaseto.com",
-    "mastodon.ameo.dev",
-    "mastodon.amesgen.de",
-    "mastodon.ameth.org",
-    "mastodon.ampericus.net",
-    "mastodon.andert.me",
-    "mastodon.andreasrohner.dev",
-    "mastodon.andreasvongunten.com",
-    "mastodon.andreubotella.com",
-    "mastodon.andrewbversfeld.co.za",
-    "mastodon.andrewfesta.com",
-    "mastodon.andreybondarenko.com",
-    "mastodon.anesthetizeme.net",
-    "mastodon.angusworld.org",
-    "mastodon.annleckie.com",
-    "mastodon.antanst.com",
-    "mastodon.anteiku.mydns.jp",
-    "mastodon.antisocial.science",
-    "mastodon.antonengelhardt.de",
-    "mastodon.antonovich.me",
-    "mastodon.anura.team",
-    "mastodon.ap-msk.com",
-    "mastodon.apexhunter.de",
-    "mastodon.app.araneum.org",
-    "mastodon.app.stefanberggren.se",
-    "mastodon.applevis.com",
-    "mastodon.apps.scolterius.net",
-    "mastodon.aquati.cat",
-    "mastodon.ar.al",
-    "mastodon.arakawa-lab.com",
-    "mastodon.arasaka.uk",
-    "mastodon.arcepi.net",
-    "mastodon.arch-linux.cz",
-    "mastodon.archfiend.org",
-    "mastodon.archive.org",
-    "mastodon.aridgwayweb.com",
-    "mastodon.arnos-vale.net",
-    "mastodon.arrakis.se",
-    "mastodon.art",
-    "mastodon.artichokenetwork.com",
-    "mastodon.arul.io",
-    "mastodon.ash.ineru.cc",
-    "mastodon.ashevillains.org",
-    "mastodon.askan.cloud",
-    "mastodon.askk.cc",
-    "mastodon.aspectsof.love",
-    "mastodon.astifter.com",
-    "mastodon.asty.org",
-    "mastodon.atikoro.net",
-    "mastodon.atlab.hku.hk",
-    "mastodon.au",
-    "mastodon.augustinus.jp",
-    "mastodon.aurooba.com",
-    "mastodon.aventer.biz",
-    "mastodon.awo.agency",
-    "mastodon.ax",
-    "mastodon.azadehafzar.io",
-    "mastodon.azapft.is",
-    "mastodon.b2b-marketing.pl",
-    "mastodon.baazee.social",
-    "mastodon.babb.be",
-    "mastodon.babb.no",
-    "mastodon.babyl.ca",
-    "mastodon.bach-bellan.fr",
-    "mastodon.bachgau.social",
-    "mastodon.bachmann.wtf",
-    "mastodon.bah.io",
-    "mastodon.baie.me",
-    "mastodon.baker.uk",
-    "mastodon.balamb.fr",
-    "mastodon.bandshell.rocks",
-    "mastodon.banzan.uk",
-    "mastodon.barrierfreecanada.org",
-    "mastodon.bartchampagne.be",
-    "mastodon.bartmathijssen.com",
-    "mastodon.basjes.nl",
-    "mastodon.bastelfreak.cloud",
-    "mastodon.bastelgarage.ch",
-    "mastodon.batato.be",
-    "mastodon.baufreton.fr",
-    "mastodon.bawue.social",
-    "mastodon.bayern",
-    "mastodon.bbfactory.it",
-    "mastodon.bbguimaraes.com",
-    "mastodon.bdmuvt.de",
-    "mastodon.beatrice.wtf",
-    "mastodon.becking.saarland",
-    "mastodon.beehive.ee",
-    "mastodon.beer",
-    "mastodon.bekesi.org",
-    "mastodon.bellamazz.com",
-    "mastodon.bendodson.com",
-    "mastodon.benefice.io",
-    "mastodon.benkard.de",
-    "mastodon.benpettis.ninja",
-    "mastodon.bentasker.co.uk",
-    "mastodon.bentobin.com",
-    "mastodon.benzas.lt",
-    "mastodon.bergen.social",
-    "mastodon.berget.nu",
-    "mastodon.berlin",
-    "mastodon.berton.me",
-    "mastodon.berze.lol",
-    "mastodon.bgzashtita.es",
-    "mastodon.bhop.zone",
-    "mastodon.bida.im",
-    "mastodon.bierschutzpartei.de",
-    "mastodon.bigpod.si",
-    "mastodon.bigsecretwebsite.net",
-    "mastodon.binwang.me",
-    "mastodon.bitcoin.ninja",
-    "mastodon.bitfrost.gg",
-    "mastodon.bits-und-baeume.org",
-    "mastodon.bitsandlinux.com",
-    "mastodon.bizarreworker.de",
-    "mastodon.bizkitbros.com",
-    "mastodon.bkrn.org",
-    "mastodon.blackblock.rocks",
-    "mastodon.blaede.family",
-    "mastodon.blaho.info",
-    "mastodon.blankdevaux.fr",
-    "mastodon.blanu.net",
-    "mastodon.blaster.com.ar",
-    "mastodon.bleep.social",
-    "mastodon.blindwith.science",
-    "mastodon.blip.rocklin.dev",
-    "mastodon.blitz-netzwerk.de",
-    "mastodon.blizzard.systems",
-    "mastodon.blocki.net",
-    "mastodon.bludood.com",
-    "mastodon.bluecatnet.work",
-    "mastodon.blueworlds.org",
-    "mastodon.blumensath.com",
-    "mastodon.bobbyl140.com",
-    "mastodon.bofhers.es",
-    "mastodon.boiler.social",
-    "mastodon.bolha.dev",
-    "mastodon.boogstreken.be",
-    "mastodon.bores.com",
-    "mastodon.boris.syncloud.it",
-    "mastodon.borsos.at",
-    "mastodon.borstis.cloud",
-    "mastodon.bosio.info",
-    "mastodon.boston",
-    "mastodon.bostoncaucus.club",
-    "mastodon.bot",
-    "mastodon.boxofbugs.com",
-    "mastodon.boyd.cloud",
-    "mastodon.boyfails.me",
-    "mastodon.boyos.org",
-    "mastodon.bozg.se",
-    "mastodon.bram.dev",
-    "mastodon.brdsnest.net",
-    "mastodon.breiteberg.de",
-    "mastodon.brendan.ie",
-    "mastodon.brendans-bits.com",
-    "mastodon.bres.cat",
-    "mastodon.breuils.com",
-    "mastodon.brigadadigital.tec.br",
-    "mastodon.brittg.com",
-    "mastodon.brk.io",
-    "mastodon.brnrs.pl",
-    "mastodon.brockhus.com.au",
-    "mastodon.brown-silva.social",
-    "mastodon.bryce.co",
-    "mastodon.bsd.cafe",
-    "mastodon.bstly.de",
-    "mastodon.bubblesthebunny.com",
-    "mastodon.burntcomma.com",
-    "mastodon.business",
-    "mastodon.buyiihoo.xyz",
-    "mastodon.buzhangjiuzhou.com",
-    "mastodon.bv.linksjugend-solid.de",
-    "mastodon.bvmensvoort.nl",
-    "mastodon.bwnet.it",
-    "mastodon.byte23.net",
-    "mastodon.bzh",
-    "mastodon.c.smoothnet.org",
-    "mastodon.c99.org",
-    "mastodon.cab",
-    "mastodon.cabaal.net",
-    "mastodon.cacheblasters.com",
-    "mastodon.cackhanded.net",
-    "mastodon.caffeinated.computer",
-    "mastodon.caille.fr",
-    "mastodon.calacademy.org",
-    "mastodon.calciumsigma.com",
-    "mastodon.cameko.org",
-    "mastodon.cannerycoders.com",
-    "mastodon.canonicity.org",
-    "mastodon.caputoweb.eu.org",
-    "mastodon.cardina1.red",
-    "mastodon.caruhel.fr",
-    "mastodon.castelrosso.net",
-    "mastodon.cat",
-    "mastodon.catgirl.cloud",
-    "mastodon.cathect.net",
-    "mastodon.catvibers.me",
-    "mastodon.catwuschel.com",
-    "mastodon.caylee.de",
-    "mastodon.cc",
-    "mastodon.ccqjv.com",
-    "mastodon.cde.social",
-    "mastodon.cemea.org",
-    "mastodon.cescobarresi.it",
-    "mastodon.cesko.digital",
-    "mastodon.cevn.io",
-    "mastodon.cgx.me",
-    "mastodon.ch3n2k.com",
-    "mastodon.chabal.es",
-    "mastodon.chadhigh.com",
-    "mastodon.chaika.me",
-    "mastodon.chainfire.eu",
-    "mastodon.chanoa.de",
-    "mastodon.chantierlibre.org",
-    "mastodon.chaosfield.at",
-    "mastodon.chaoticqueers.org",
-    "mastodon.charles-axel.com",
-    "mastodon.chasalin.nl",
-    "mastodon.chateaude.luxe",
-    "mastodon.chatinbit.com",
-    "mastodon.checkinchicken.social",
-    "mastodon.chedski.net",
-    "mastodon.chester.id.au",
-    "mastodon.chieldouwes.nl",
-    "mastodon.chotto.moe",
-    "mastodon.chr.ddnss.de",
-    "mastodon.chrisduffley.com",
-    "mastodon.chrisedwards.tech",
-    "mastodon.chrisliebaer.de",
-    "mastodon.chrispelli.fun",
-    "mastodon.chrissabato.com",
-    "mastodon.christophfink.com",
-    "mastodon.chriswiegman.com",
-    "mastodon.chriswright.photography",
-    "mastodon.chuggybumba.com",
-    "mastodon.cipherbliss.com",
-    "mastodon.circle.lt",
-    "mastodon.cisti.org",
-    "mastodon.cjl.io",
-    "mastodon.cl",
-    "mastodon.claesjonsson.net",
-    "mastodon.clausgames.com",
-    "mastodon.clinicians-exchange.org",
-    "mastodon.clipperz.is",
-    "mastodon.clodo.it",
-    "mastodon.closedless.xyz",
-    "mastodon.cloud",
-    "mastodon.cloud.karagory.com",
-    "mastodon.cloudsecurityofficehours.com",
-    "mastodon.cluboftone.com",
-    "mastodon.clusterfucks.nl",
-    "mastodon.cmnr.eu",
-    "mastodon.cocoasamurai.social",
-    "mastodon.codelyoko.me",
-    "mastodon.codingfield.com",
-    "mastodon.codyevanscomputer.com",
-    "mastodon.coffee",
-    "mastodon.coffee-break.cc",
-    "mastodon.cogindo.net",
-    "mastodon.coley.au",
-    "mastodon.coley.co",
-    "mastodon.colincogle.name",
-    "mastodon.collazo.ws",
-    "mastodon.com.br",
-    "mastodon.com.pl",
-    "mastodon.com.py",
-    "mastodon.com.tr",
-    "mastodon.comame.xyz",
-    "mastodon.common.se",
-    "mastodon.comms.social",
-    "mastodon.communick.com",
-    "mastodon.compositecomputer.club",
-    "mastodon.computingcache.com",
-    "mastodon.comwork.io",
-    "mastodon.concordia.social",
-    "mastodon.conii.co",
-    "mastodon.conquestuniverse.com",
-    "mastodon.constant.social",
-    "mastodon.content.town",
-    "mastodon.cooleysekula.net",
-    "mastodon.cortex-innovation.com",
-    "mastodon.cosmic.media",
-    "mastodon.cosmicanimal.jp",
-    "mastodon.cosmicnation.co",
-    "mastodon.cosmoscraft.network",
-    "mastodon.cowebapapa.nohost.me",
-    "mastodon.cr",
-    "mastodon.cr.yp.to",
-    "mastodon.craftingcomrades.net",
-    "mastodon.crazynewworld.net",
-    "mastodon.creation.md",
-    "mastodon.criticalbasics.xyz",
-    "mastodon.cromie.org",
-    "mastodon.cronenberg.cc",
-    "mastodon.cross-solution.de",
-    "mastodon.cross.net.uk",
-    "mastodon.crossfamilyweb.com",
-    "mastodon.crovaxon.de",
-    "mastodon.cryobyte.net",
-    "mastodon.cse.wtf",
-    "mastodon.cthos.dev",
-    "mastodon.ctor.tech",
-    "mastodon.ctrl-c.liu.se",
-    "mastodon.ctseuro.com",
-    "mastodon.cube4fun.net",
-    "mastodon.cultuurparticipatie.nl",
-    "mastodon.cuso.tk",
-    "mastodon.cute.camp",
-    "mastodon.cyberhub.sbs",
-    "mastodon.cyberpeaceinstitute.org",
-    "mastodon.cybersamurai.ch",
-    "mastodon.cyberveins.eu",
-    "mastodon.cybirdtech.com",
-    "mastodon.cyborch.com",
-    "mastodon.cyborgcentral.net",
-    "mastodon.cyprin.eu",
-    "mastodon.cyprin.me",
-    "mastodon.cyrilix.bzh",
-    "mastodon.cysioland.pl",
-    "mastodon.cywa.ch",
-    "mastodon.czleteron.net",
-    "mastodon.d.gs",
-    "mastodon.d.sh",
-    "mastodon.d09.app",
-    "mastodon.d14n.club",
-    "mastodon.d2dx.com",
-    "mastodon.d4.social",
-    "mastodon.d5o.eu",
-    "mastodon.dagorlad.cc",
-    "mastodon.dakes.de",
-    "mastodon.damutten.ch",
-    "mastodon.danielnorton.com",
-    "mastodon.danquinney.com",
-    "mastodon.dapor.net",
-    "mastodon.darkbackdoor.thcon.party",
-    "mastodon.darkflame.dev",
-    "mastodon.darkou.fr",
-    "mastodon.darkplanetego.de",
-    "mastodon.darksheep.social",
-    "mastodon.datablob.de",
-    "mastodon.dataden.gay",
-    "mastodon.datanom.net",
-    "mastodon.dataseal.de",
-    "mastodon.davepeck.org",
-    "mastodon.davidciani.com",
-    "mastodon.dazed-gerbil.com",
-    "mastodon.dbatley.com",
-    "mastodon.dbfmradio.org",
-    "mastodon.dchapa.synology.me",
-    "mastodon.dcreager.net",
-    "mastodon.ddcloud.info",
-    "mastodon.dduel.dev",
-    "mastodon.de",
-    "mastodon.deadname.gay",
-    "mastodon.deathbybandaid.net",
-    "mastodon.debugco.de",
-    "mastodon.decentralised.chat",
-    "mastodon.decentralised.social",
-    "mastodon.decwebb.com",
-    "mastodon.deepak.science",
-    "mastodon.deeplab.fr",
-    "mastodon.defiantjc.synology.me",
-    "mastodon.delic.fi",
-    "mastodon.delroth.net",
-    "mastodon.delta-t.work",
-    "mastodon.demo.cloudron.io",
-    "mastodon.demonoftheday.eu",
-    "mastodon.demortes.com",
-    "mastodon.dendiz.xyz",
-    "mastodon.deniau.org",
-    "mastodon.denibol.com",
-    "mastodon.denizencity.com",
-    "mastodon.dennisforbes.ca",
-    "mastodon.dentrassi.de",
-    "mastodon.derg.nz",
-    "mastodon.dergrimm.net",
-    "mastodon.dermarcus.de",
-    "mastodon.derpstra.nl",
-    "mastodon.derstandard.at",
-    "mastodon.derveni.org",
-    "mastodon.design",
-    "mastodon.desmu.fr",
-    "mastodon.desord.re",
-    "mastodon.despise.computer",
-    "mastodon.dev.iftas.org",
-    "mastodon.developage.de",
-    "mastodon.devlibre.fr",
-    "mastodon.devontechnologies.com",
-    "mastodon.devsforce.org",
-    "mastodon.devua.club",
-    "mastodon.dfxn.org",
-    "mastodon.dgfp.club",
-    "mastodon.dgtl-service.com",
-    "mastodon.dhusch.de",
-    "mastodon.dias.ie",
-    "mastodon.dictatorshipcake.co.uk",
-    "mastodon.diegopeinador.com",
-    "mastodon.digi.rodeo",
-    "mastodon.digitaino.com",
-    "mastodon.digital-science.com",
-    "mastodon.diglateam3.com",
-    "mastodon.digspace.de",
-    "mastodon.diniscorreia.com",
-    "mastodon.discourse-research.net",
-    "mastodon.distos.org",
-    "mastodon.dkl.jp",
-    "mastodon.dlants.me",
-    "mastodon.dlgreen.com",
-    "mastodon.dlun.ch",
-    "mastodon.dnet.one",
-    "mastodon.dnurg.net",
-    "mastodon.doesnotexist.club",
-    "mastodon.dommunicate.com",
-    "mastodon.doneydenouden.com",
-    "mastodon.donttrust.me",
-    "mastodon.dopcrew.com",
-    "mastodon.doufen.org",
-    "mastodon.douvk.co.uk",
-    "mastodon.draeh.org",
-    "mastodon.dragonbox.de",
-    "mastodon.dragoncave.dev",
-    "mastodon.dravidam.net",
-    "mastodon.dredgelords.com",
-    "mastodon.drewhess.social",
-    "mastodon.drjpdns.com",
-    "mastodon.dropmann.org",
-    "mastodon.dsdrive.fr",
-    "mastodon.dtalens.com",
-    "mastodon.dtris.moe",
-    "mastodon.duncanhart.com",
-    "mastodon.duong.social",
-    "mastodon.durel.org",
-    "mastodon.dustinwilson.com",
-    "mastodon.dygytally.academy",
-    "mastodon.dymaxoid.net",
-    "mastodon.dymc.win",
-    "mastodon.dystroy.org",
-    "mastodon.e4b4.eu",
-    "mastodon.earth",
-    "mastodon.eatswap.fun",
-    "mastodon.eble.name",
-    "mastodon.ecnelises.com",
-    "mastodon.eco",
-    "mastodon.economiasocial.org",
-    "mastodon.ecosyste.ms",
-    "mastodon.eddmil.es",
-    "mastodon.edelmann.bond",
-    "mastodon.edkbarber.com",
-    "mastodon.education",
-    "mastodon.edufor.me",
-    "mastodon.ee",
-    "mastodon.eenoog.org",
-    "mastodon.eew.dk",
-    "mastodon.ef67daisuki.club",
-    "mastodon.effektio.org",
-    "mastodon.ehlo.world",
-    "mastodon.ehret.me",
-    "mastodon.eiabea.com",
-    "mastodon.einfachmc.de",
-    "mastodon.elandrion.net",
-    "mastodon.electric-goat.net",
-    "mastodon.electro.social",
-    "mastodon.electroncash.de",
-    "mastodon.elest.io",
-    "mastodon.elevenways.be",
-    "mastodon.ellipsis.fi",
-    "mastodon.ellouisdocker.synology.me",
-    "mastodon.elmoecho.de",
-    "mastodon.elmund.io",
-    "mastodon.elon.li",
-    "mastodon.elte.hu",
-    "mastodon.elvandalinq.com",
-    "mastodon.em.id.lv",
-    "mastodon.emmetcoughlan.com",
-    "mastodon.emy.lu",
-    "mastodon.encryptionin.space",
-    "mastodon.endtech.fr",
-    "mastodon.energy",
-    "mastodon.enitin.xyz",
-    "mastodon.enlightware.ch",
-    "mastodon.eole.education",
-    "mastodon.epicpix.dev",
-    "mastodon.erasethis.net",
-    "mastodon.erdbeerbaerlp.de",
-    "mastodon.ergosteur.com",
-    "mastodon.eric.ovh",
-    "mastodon.ericbeckers.nl",
-    "mastodon.ericlathrop.com",
-    "mastodon.eroticmohel.com",
-    "mastodon.escepticos.es",
-    "mastodon.eskimo.com",
-    "mastodon.esmevane.com",
-    "mastodon.esparrec.net",
-    "mastodon.eternalaugust.com",
-    "mastodon.ethibox.fr",
-    "mastodon.eticadigital.eu",
-    "mastodon.eu90h.com",
-    "mastodon.eus",
-    "mastodon.eveland.dev",
-    "mastodon.evertools.io",
-    "mastodon.everythingistacos.net",
-    "mastodon.evl.fi",
-    "mastodon.evolix.org",
-    "mastodon.evolution.codes",
-    "mastodon.excbadacc.es",
-    "mastodon.exok.com",
-    "mastodon.experienceadvisors.io",
-    "mastodon.expiredpopsicle.com",
-    "mastodon.exposed",
-    "mastodon.ez-oo.com",
-    "mastodon.ezytech.fr",
-    "mastodon.f-on.at",
-    "mastodon.f-si.org",
-    "mastodon.f12n.de",
-    "mastodon.f2a.io",
-    "mastodon.f4n.de",
-    "mastodon.faithtree.social",
-    "mastodon.fajne.eu",
-    "mastodon.faked.org",
-    "mastodon.falconk.rocks",
-    "mastodon.falktx.com",
-    "mastodon.falkvinge.net",
-    "mastodon.fam-ribbers.com",
-    "mastodon.familie-de-boer.net",
-    "mastodon.familie-jauss.de",
-    "mastodon.familie-tux.de",
-    "mastodon.familleboisteau.fr",
-    "mastodon.fancy.org.uk",
-    "mastodon.farenjihn.cloud",
-    "mastodon.farktronix.com",
-    "mastodon.fathermaurer.com",
-    "mastodon.feb.re",
-    "mastodon.federated.club",
-    "mastodon.fedi.100terres.com",
-    "mastodon.fedi.bzh",
-    "mastodon.fedi.quebec",
-    "mastodon.fediversity.eu",
-    "mastodon.fedivienne.org",
-    "mastodon.feedly.com",
-    "mastodon.feedmechocolate.com",
-    "mastodon.feets.tv",
-    "mastodon.femboy.page",
-    "mastodon.femboyfurry.net",
-    "mastodon.feraltodayfriendtomorrow.org",
-    "mastodon.fi",
-    "mastodon.fibee.fr",
-    "mastodon.ficosi.de",
-    "mastodon.fidess.org",
-    "mastodon.fiera.social",
-    "mastodon.fifo-f.eu",
-    "mastodon.fightforthefuture.org",
-    "mastodon.finonet.de",
-    "mastodon.firo.org",
-    "mastodon.fishnet.vip",
-    "mastodon.fiveop.de",
-    "mastodon.fivest.one",
-    "mastodon.fixermark.com",
-    "mastodon.fjerland.no",
-    "mastodon.fkpk.org",
-    "mastodon.fl0w.fr",
-    "mastodon.flaircheck.ca",
-    "mastodon.flifloo.fr",
-    "mastodon.flisol.info",
-    "mastodon.flockofnazguls.com",
-    "mastodon.floe.earth",
-    "mastodon.flooey.org",
-    "mastodon.florian.moe",
-    "mastodon.flossir.org",
-    "mastodon.floyd.dk",
-    "mastodon.flying-snail.de",
-    "mastodon.flyingmou.se",
-    "mastodon.fo",
-    "mastodon.fonsos.com",
-    "mastodon.fosslife.org",
-    "mastodon.foxfam.club",
-    "mastodon.foxfire.dev",
-    "mastodon.foxocube.xyz",
-    "mastodon.fozztexx.com",
-    "mastodon.fractalcoffee.duckdns.org",
-    "mastodon.fraize.com",
-    "mastodon.francoacg.com",
-    "mastodon.fredprod.com",
-    "mastodon.free-solutions.org",
-    "mastodon.freeit247.eu",
-    "mastodon.freelands.cloud",
-    "mastodon.freetalk.club",
-    "mastodon.freie.app",
-    "mastodon.freumh.org",
-    "mastodon.freyahaus.casa",
-    "mastodon.friendnet.eu",
-    "mastodon.frl",
-    "mastodon.from-de.com",
-    "mastodon.fsinf.at",
-    "mastodon.fsu-snuipp.fr",
-    "mastodon.ftp.rip",
-    "mastodon.fun",
-    "mastodon.fun7.de",
-    "mastodon.functional.computer",
-    "mastodon.funigtor.fr",
-    "mastodon.funkturm7.de",
-    "mastodon.furrybrigade.net",
-    "mastodon.furrycon.social",
-    "mastodon.furrypaws.cc",
-    "mastodon.futaba.social",
-    "mastodon.futurelab.social",
-    "mastodon.fyksen.me",
-    "mastodon.g2od.ch",
-    "mastodon.gabrieldebonis.es",
-    "mastodon.gadgetoid.com",
-    "mastodon.gaide.me",
-    "mastodon.gaitenis.id.lv",
-    "mastodon.gal",
-    "mastodon.galileivr.org",
-    "mastodon.gamedev.place",
-    "mastodon.gamedevalliance.fr",
-    "mastodon.gamespirit.eu",
-    "mastodon.gar.dev",
-    "mastodon.garden",
-    "mastodon.gardensoul.org",
-    "mastodon.gargantia.fr",
-    "mastodon.garrlab.it",
-    "mastodon.gassner.io",
-    "mastodon.gastrokon.com",
-    "mastodon.gatewayy.net",
-    "mastodon.gcreate.jp",
-    "mastodon.gdickinson.co.uk",
-    "mastodon.geekcorner.eu.org",
-    "mastodon.geekery.org",
-    "mastodon.geneticjen.com",
-    "mastodon.geofox.org",
-    "mastodon.gesteves.com",
-    "mastodon.gethsemane.pro",
-    "mastodon.ghostdub.de",
-    "mastodon.gibald.com",
-    "mastodon.gibbens.dev",
-    "mastodon.gideonstar.de",
-    "mastodon.giema.net",
-    "mastodon.giftedmc.com",
-    "mastodon.gimp.chat",
-    "mastodon.girino.org",
-    "mastodon.girondi.net",
-    "mastodon.gizm0.dev",
-    "mastodon.gizmo4487.dev",
-    "mastodon.glenparva.com",
-    "mastodon.glz.ca",
-    "mastodon.gmb.cz",
-    "mastodon.goip.de",
-    "mastodon.goldenhillsoftware.com",
-    "mastodon.goldingerit.ch",
-    "mastodon.golgoth.org",
-    "mastodon.gomzik.xyz",
-    "mastodon.goroundtrip.co",
-    "mastodon.goto.bi",
-    "mastodon.gouacheairship.com",
-    "mastodon.gougere.fr",
-    "mastodon.graceteng.me",
-    "mastodon.grafen.info",
-    "mastodon.grafxgear.com",
-    "mastodon.grahammay.me",
-    "mastodon.gramschladen.de",
-    "mastodon.granto.cloud",
-    "mastodon.grants.cafe",
-    "mastodon.green",
-    "mastodon.greenpeace.ch",
-    "mastodon.greenwichmeanti.me",
-    "mastodon.greg.ca",
-    "mastodon.gregnilsen.com",
-    "mastodon.greilach.dev",
-    "mastodon.gremlins.eu",
-    "mastodon.griefed.de",
-    "mastodon.grimerica.ca",
-    "mastodon.grimmauld.de",
-    "mastodon.grin.hu",
-    "mastodon.grml.de",
-    "mastodon.grozav.dev",
-    "mastodon.gruenerfaecher.eu",
-    "mastodon.gruezi.net",
-    "mastodon.gryphon.is",
-    "mastodon.gsdgames.com",
-    "mastodon.gsugambit.com",
-    "mastodon.guerilla.studio",
-    "mastodon.guerra24.net",
-    "mastodon.gurney.dev",
-    "mastodon.gurubert.de",
-    "mastodon.gxvwb.dev",
-    "mastodon.gza.jp",
-    "mastodon.h0lmes.com",
-    "mastodon.habets.dev",
-    "mastodon.hach.re",
-    "mastodon.hackerdrinks.social",
-    "mastodon.hackerfoo.com",
-    "mastodon.hackret.com",
-    "mastodon.haetsal.me",
-    "mastodon.hakurei.win",
-    "mastodon.haley.io",
-    "mastodon.half-shot.uk",
-    "mastodon.halibut.com",
-    "mastodon.hamburg",
-    "mastodon.hams.social",
-    "mastodon.hansup.be",
-    "mastodon.haojia-wu.com",
-    "mastodon.haolit.de",
-    "mastodon.haolitsys.de",
-    "mastodon.happykraken.net",
-    "mastodon.hardcoredevs.com",
-    "mastodon.hardcover.app",
-    "mastodon.haris.paris",
-    "mastodon.harrykantas.com",
-    "mastodon.haruska.com",
-    "mastodon.hausofhomeaux.ca",
-    "mastodon.hawaga.org.uk",
-    "mastodon.hccp.org",
-    "mastodon.headcrashing.eu",
-    "mastodon.heavenly-united.se",
-    "mastodon.heavymusic.rocks",
-    "mastodon.heavyrubberslave.com",
-    "mastodon.hedenstroem.com",
-    "mastodon.heer.xyz",
-    "mastodon.helaosteraker.se",
-    "mastodon.hellsite.net",
-    "mastodon.helvetet.eu",
-    "mastodon.hepper.net",
-    "mastodon.heppycat.com",
-    "mastodon.hett.org",
-    "mastodon.hevertonfreitas.com.br",
-    "mastodon.hexix.de",
-    "mastodon.hexsix.me",
-    "mastodon.hgs.moe",
-    "mastodon.hhar.cc",
-    "mastodon.hidupmanis.studio",
-    "mastodon.highteq.net",
-    "mastodon.hillbillyer.dev",
-    "mastodon.himanshuanand.com",
-    "mastodon.hinata.cz",
-    "mastodon.hiveagile.com",
-    "mastodon.hk",
-    "mastodon.hli.fi",
-    "mastodon.hnaportal.net",
-    "mastodon.hochschule-trier.de",
-    "mastodon.hofud.com",
-    "mastodon.holeyfox.co",
-    "mastodon.holmosapien.com",
-    "mastodon.home.dnlm.de",
-    "mastodon.home.little.place",
-    "mastodon.homelab.tokyo",
-    "mastodon.honex.life",
-    "mastodon.hong.io",
-    "mastodon.hongkongers.net",
-    "mastodon.honnef.co",
-    "mastodon.hopbox.net",
-    "mastodon.hopman.nl",
-    "mastodon.hoppinglife.com",
-    "mastodon.hopstudio.fr",
-    "mastodon.horrendum.com",
-    "mastodon.horvath.com",
-    "mastodon.hosnet.fr",
-    "mastodon.hosted.frl",
-    "mastodon.hotmilk.space",
-    "mastodon.houchouas.name",
-    "mastodon.hr",
-    "mastodon.hsablonniere.com",
-    "mastodon.hsslj.de",
-    "mastodon.hucnet.ch",
-    "mastodon.hugopoi.net",
-    "mastodon.huntsvillain.com",
-    "mastodon.hupel.info",
-    "mastodon.hurley.page",
-    "mastodon.hydrantosaurus.com",
-    "mastodon.hyggeverset.dk",
-    "mastodon.hyperfreedom.org",
-    "mastodon.hypnoguys.com",
-    "mastodon.i-am.nexus",
-    "mastodon.i4m1k0.su",
-    "mastodon.ianmorrill.com",
-    "mastodon.ibax.org",
-    "mastodon.idiot.sh",
-    "mastodon.ie",
-    "mastodon.iftas.org",
-    "mastodon.ig.nore.me",
-    "mastodon.igl.ooo",
-    "mastodon.iking.ca",
-    "mastodon.iklem.fr",
-    "mastodon.im",
-    "mastodon.im.sb",
-    "mastodon.imaginatrix.xyz",
-    "mastodon.imagisphe.re",
-    "mastodon.imichka.me",
-    "mastodon.immae.eu",
-    "mastodon.improved-madness.de",
-    "mastodon.in-two.com",
-    "mastodon.in.th",
-    "mastodon.in.ua",
-    "mastodon.inclusion.cc",
-    "mastodon.incognitus.net",
-    "mastodon.incrediblepbx.net",
-    "mastodon.indie.host",
-    "mastodon.indiegames.online",
-    "mastodon.indiegamesdevel.com",
-    "mastodon.inf.ethz.ch",
-    "mastodon.inferiorlattice.com",
-    "mastodon.infinitelibraries.com",
-    "mastodon.infinitybeardesigns.com",
-    "mastodon.infodocs.eu",
-    "mastodon.infra.de",
-    "mastodon.infrageeks.social",
-    "mastodon.inman.xyz",
-    "mastodon.insa.lol",
-    "mastodon.integrata-stiftung.de",
-    "mastodon.internet-czas-dzialac.pl",
-    "mastodon.inubo.ch",
-    "mastodon.io.seg.br",
-    "mastodon.iosdevhappyhour.com",
-    "mastodon.iow.social",
-    "mastodon.ipv6.jetzt",
-    "mastodon.ir0k.de",
-    "mastodon.irenala.edu.mg",
-    "mastodon.irex.aretex.ca",
-    "mastodon.iriseden.eu",
-    "mastodon.irohanano.nl",
-    "mastodon.is-a.horse",
-    "mastodon.is-hardly.online",
-    "mastodon.ist",
-    "mastodon.itman.guru",
-    "mastodon.ito.com",
-    "mastodon.itseris.dev",
-    "mastodon.iut-larochelle.fr",
-    "mastodon.ivan.computer",
-    "mastodon.izzz.fr",
-    "mastodon.j15r.com",
-    "mastodon.jabbxi.de",
-    "mastodon.jacen.moe",
-    "mastodon.jackf.red",
-    "mastodon.jacobwhite.us",
-    "mastodon.jakecoppinger.com",
-    "mastodon.jakewharton.com",
-    "mastodon.jalgi.eus",
-    "mastodon.jameslynch.dev",
-    "mastodon.jamesoff.net",
-    "mastodon.jamidisi-edu.de",
-    "mastodon.janbudke.de",
-    "mastodon.jangho.io",
-    "mastodon.janke.biz",
-    "mastodon.jannis-goeing.de",
-    "mastodon.janstenpickle.io",
-    "mastodon.janusweb.org",
-    "mastodon.jaquanor.com",
-    "mastodon.jatlarge.com",
-    "mastodon.javant.xyz",
-    "mastodon.jawa.moe",
-    "mastodon.jbx.com",
-    "mastodon.jcaicedo.com",
-    "mastodon.jeckyll.net",
-    "mastodon.jepsen.io",
-    "mastodon.jfmblinux.fr",
-    "mastodon.jfr.im",
-    "mastodon.jgilje.net",
-    "mastodon.jhcooke.com",
-    "mastodon.jinc.io",
-    "mastodon.jing.lgbt",
-    "mastodon.jing8956.com",
-    "mastodon.jisaba.life",
-    "mastodon.jj5fxl.net",
-    "mastodon.joaoleitao.org",
-    "mastodon.joebuhlig.com",
-    "mastodon.joelving.dk",
-    "mastodon.johndevine.co.uk",
-    "mastodon.joinhaven.us",
-    "mastodon.jonak.org",
-    "mastodon.jonasled.de",
-    "mastodon.joohanv.nl",
-    "mastodon.jordanwages.com",
-    "mastodon.jorgejarai.xyz",
-    "mastodon.joshdata.me",
-    "mastodon.jp-studios.de",
-    "mastodon.jparenas.com",
-    "mastodon.jswc.de",
-    "mastodon.jubison.fr",
-    "mastodon.juggler.jp",
-    "mastodon.jumping.wang",
-    "mastodon.justinweiss.com",
-    "mastodon.k8s.forster.cc",
-    "mastodon.k9max.de",
-    "mastodon.kaelig.ovh",
-    "mastodon.kaltes.beer",
-    "mastodon.kalua.im",
-    "mastodon.kame.moe",
-    "mastodon.kangaroopunch.com",
-    "mastodon.kapler.family",
-    "mastodon.karolwos.com",
-    "mastodon.karottenfabrik.net",
-    "mastodon.karrmedia.com",
-    "mastodon.kaskadee.eu",
-    "mastodon.kassepied.org",
-    "mastodon.katniss.top",
-    "mastodon.kbpmessick.com",
-    "mastodon.kd9nsc.com",
-    "mastodon.kebree.fr",
-    "mastodon.keekerdc.com",
-    "mastodon.keks.club",
-    "mastodon.kelvsyc.com",
-    "mastodon.kempkens.io",
-    "mastodon.kenpo.social",
-    "mastodon.ketz.io",
-    "mastodon.kevnet.cloud",
-    "mastodon.kichi2004.jp",
-    "mastodon.kiklhorn.cz",
-    "mastodon.kingant.net",
-    "mastodon.kino.ma",
-    "mastodon.kintsugi-lab.com",
-    "mastodon.kirgus.net",
-    "mastodon.kitamurakz.com",
-    "mastodon.kitchen",
-    "mastodon.kk7.uk",
-    "mastodon.klaaspier.nl",
-    "mastodon.km6g.us",
-    "mastodon.kmkz.moe",
-    "mastodon.kn-cloud.de",
-    "mastodon.kneitzel.de",
-    "mastodon.knight.fyi",
-    "mastodon.knizefamily.net",
-    "mastodon.knuspel.eu",
-    "mastodon.kodeklang.social",
-    "mastodon.koehler.ca",
-    "mastodon.koehlercode.dev",
-    "mastodon.kohanikin.com",
-    "mastodon.konc.wtf",
-    "mastodon.kondofrey.net",
-    "mastodon.korbip.de",
-    "mastodon.korfmann.xyz",
-    "mastodon.kosti.dev",
-    "mastodon.kotet.jp",
-    "mastodon.kovarovi.org",
-    "mastodon.kristofferjohansson.com",
-    "mastodon.kronk.info",
-    "mastodon.kroy.io",
-    "mastodon.kryptykphysh.xyz",
-    "mastodon.krzysiu69.ovh",
-    "mastodon.kt.nnn1590.org",
-    "mastodon.ktachibana.party",
-    "mastodon.kuenet.ch",
-    "mastodon.kumolabo.com",
-    "mastodon.kurumah.dev",
-    "mastodon.kuylar.dev",
-    "mastodon.kvalhe.im",
-    "mastodon.kvasta.se",
-    "mastodon.kvecchione.com",
-    "mastodon.kwinkunks.org",
-    "mastodon.kwmns.eu",
-    "mastodon.kxn4t.tech",
-    "mastodon.kylemacquarrie.co.uk",
-    "mastodon.kylerank.in",
-    "mastodon.kypeli.com",
-    "mastodon.l0nax.org",
-    "mastodon.la",
-    "mastodon.laca.dev",
-    "mastodon.lacan.net",
-    "mastodon.ladd.network",
-    "mastodon.ladn.org",
-    "mastodon.ladon-dragon.net",
-    "mastodon.lafhq.nl",
-    "mastodon.lagy.org",
-    "mastodon.lajaqueria.org",
-    "mastodon.lamacchinadesiderante.org",
-    "mastodon.lambertz.xyz",
-    "mastodon.land",
-    "mastodon.landlordsguild.com",
-    "mastodon.landonsonline.me.uk",
-    "mastodon.lanham.id.au",
-    "mastodon.lanhq.be",
-    "mastodon.lanofthedead.xyz",
-    "mastodon.lare.cc",
-    "mastodon.laserjesus.se",
-    "mastodon.launay.org",
-    "mastodon.laurakalbag.com",
-    "mastodon.laurenweinstein.org",
-    "mastodon.lavergne.online",
-    "mastodon.lawprofs.org",
-    "mastodon.le-palantir.com",
-    "mastodon.lebeaunuage.net",
-    "mastodon.leblanc.io",
-    "mastodon.lebreton.fr",
-    "mastodon.leftist.work",
-    "mastodon.lemarchand.io",
-    "mastodon.lepik.eu",
-    "mastodon.lermer.nl",
-    "mastodon.lerngern.net",
-    "mastodon.lertsenem.com",
-    "mastodon.lescommuns.org",
-    "mastodon.letmetellyousomething.net",
-    "mastodon.lettucegarden.net",
-    "mastodon.levis.name",
-    "mastodon.li",
-    "mastodon.li7g.com",
-    "mastodon.libre-entreprise.com",
-    "mastodon.librelabucm.org",
-    "mastodon.libreon.fr",
-    "mastodon.libresilicon.com",
-    "mastodon.libretic.fr",
-    "mastodon.libutzki.de",
-    "mastodon.liersch.it",
-    "mastodon.lieter.nl",
-    "mastodon.lighti.de",
-    "mastodon.likids.info",
-    "mastodon.lilysthings.org",
-    "mastodon.limulus.net",
-    "mastodon.linux-tin.io",
-    "mastodon.linuxmuster.net",
-    "mastodon.linuxserver.io",
-    "mastodon.lithium03.info",
-    "mastodon.living.tech",
-    "mastodon.liyuan.app",
-    "mastodon.llarian.net",
-    "mastodon.lnsystems.de",
-    "mastodon.lo0.uk",
-    "mastodon.local.lubar.me",
-    "mastodon.localecho.net",
-    "mastodon.logilab.fr",
-    "mastodon.london",
-    "mastodon.longlandclan.id.au",
-    "mastodon.lookbusy.org",
-    "mastodon.loopa.site",
-    "mastodon.lordofthedummies.com",
-    "mastodon.loss.com.de",
-    "mastodon.lostcheese.com",
-    "mastodon.lothlorien.net",
-    "mastodon.lottiste.fr",
-    "mastodon.louino.fr",
-    "mastodon.louis-vallat.fr",
-    "mastodon.louisematic.site",
-    "mastodon.loutaci.cz",
-    "mastodon.lovetux.net",
-    "mastodon.lplab.net",
-    "mastodon.lqx.net",
-    "mastodon.lrdf.fr",
-    "mastodon.lt",
-    "mastodon.ltratcliff.com",
-    "mastodon.lubar.me",
-    "mastodon.lucas.inf.br",
-    "mastodon.lucci.xyz",
-    "mastodon.luemy.eu",
-    "mastodon.lug.ts.it",
-    "mastodon.lunabooks.synology.me",
-    "mastodon.lundgrensjostrom.com",
-    "mastodon.lw1.at",
-    "mastodon.lwr.wtf",
-    "mastodon.lyng.space",
-    "mastodon.lynxcore.org",
-    "mastodon.lys.ee",
-    "mastodon.m1234.de",
-    "mastodon.mabama.de",
-    "mastodon.macalinao.org",
-    "mastodon.macato.net",
-    "mastodon.macneilmediagroup.com",
-    "mastodon.macsnet.cz",
-    "mastodon.macstories.net",
-    "mastodon.madder-mad.net",
-    "mastodon.madhammer.club",
-    "mastodon.madhouse.org",
-    "mastodon.madmanmarkau.net",
-    "mastodon.madnight.co.uk",
-    "mastodon.mado.moe",
-    "mastodon.maechler.cloud",
-    "mastodon.maescool.be",
-    "mastodon.magnatranquillo.it",
-    "mastodon.magnor.ovh",
-    "mastodon.magnox.me",
-    "mastodon.magoniadb.com",
-    "mastodon.mags.ai",
-    "mastodon.maho-do.jp",
-    "mastodon.mail.at",
-    "mastodon.mailgourmet.de",
-    "mastodon.mailstation.de",
-    "mastodon.mainasuk.com",
-    "mastodon.makerforce.io",
-    "mastodon.makotoworkshop.org",
-    "mastodon.malbela.net",
-    "mastodon.mallegolhansen.com",
-    "mastodon.manalejandro.com",
-    "mastodon.marcogiorgio.net",
-    "mastodon.marcusquinn.com",
-    "mastodon.marguerat.ch",
-    "mastodon.mariobonales.com",
-    "mastodon.mariobreskic.de",
-    "mastodon.mariusdavid.fr",
-    "mastodon.mariustimmer.de",
-    "mastodon.martin-benson.com",
-    "mastodon.martinm.de",
-    "mastodon.martyhausters.com",
-    "mastodon.mashi.ro",
-    "mastodon.masip.cat",
-    "mastodon.maswag.net",
-    "mastodon.mat.ynh.fr",
-    "mastodon.math.unipd.it",
-    "mastodon.mathys.social",
-    "mastodon.matrix.org",
-    "mastodon.matthewmcvickar.com",
-    "mastodon.mattjon.es",
-    "mastodon.maurovanetti.info",
-    "mastodon.mauve.moe",
-    "mastodon.maxdec.fr",
-    "mastodon.maxweiss.io",
-    "mastodon.maxynetwork.it",
-    "mastodon.mayer.rocks",
-    "mastodon.mbonnin.net",
-    "mastodon.mbuf.net",
-    "mastodon.mcfood.org",
-    "mastodon.mckee.family",
-    "mastodon.mdelaunay.fr",
-    "mastodon.mdmck10.xyz",
-    "mastodon.mdr-services.com",
-    "mastodon.me.uk",
-    "mastodon.mebitek.com",
-    "mastodon.mechanicalmischief.com",
-    "mastodon.medica.im",
-    "mastodon.medienzentrenbw.de",
-    "mastodon.meguhub.com",
-    "mastodon.meinserver.co",
-    "mastodon.meissners.me",
-    "mastodon.mejatto.com",
-    "mastodon.mel.social",
-    "mastodon.melin.org",
-    "mastodon.melroy.org",
-    "mastodon.memes.observer",
-    "mastodon.mengjiang.org",
-    "mastodon.menzns.de",
-    "mastodon.merkel.info",
-    "mastodon.mernacher.at",
-    "mastodon.mesolvarde.eu",
-    "mastodon.mesothermal.science",
-    "mastodon.metalbanana.net",
-    "mastodon.metawarrior.army",
-    "mastodon.mfbfreaks.nl",
-    "mastodon.mg",
-    "mastodon.mgtow.pl",
-    "mastodon.mhemeryck.com",
-    "mastodon.micha.priv.at",
-    "mastodon.michael-anders.net",
-    "mastodon.michonline.com",
-    "mastodon.migennes.net",
-    "mastodon.mihalis.net",
-    "mastodon.miicat.eu",
-    "mastodon.mike.it-bildung.ch",
-    "mastodon.mikmak.cc",
-    "mastodon.milll.ws",
-    "mastodon.millwoodonline.co.uk",
-    "mastodon.mim-libre.fr",
-    "mastodon.mindlesstux.com",
-    "mastodon.minesco.ch",
-    "mastodon.minetestserver.ru",
-    "mastodon.minionflo.net",
-    "mastodon.miri.site",
-    "mastodon.missing-deadlines.com",
-    "mastodon.misty.garden",
-    "mastodon.mit.edu",
-    "mastodon.mitmaro.dev",
-    "mastodon.mixed-reality.social",
-    "mastodon.ml",
-    "mastodon.mlaga97.space",
-    "mastodon.mlejnas.com",
-    "mastodon.mlsn.fr",
-    "mastodon.mmjo.com",
-    "mastodon.mnemi.moe",
-    "mastodon.mnetwork.co.kr",
-    "mastodon.mnte.ro",
-    "mastodon.mobi.com",
-    "mastodon.modern-industry.com",
-    "mastodon.modspil.dk",
-    "mastodon.moeyy.cn",
-    "mastodon.mohamednazmi.com",
-    "mastodon.monich.dk",
-    "mastodon.monkeydiesel.net",
-    "mastodon.monoceros.co.za",
-    "mastodon.monotropa-satellite.social",
-    "mastodon.montagne.uk",
-    "mastodon.moonglade.net",
-    "mastodon.moonling.nl",
-    "mastodon.morgiano.it",
-    "mastodon.morgurth.com",
-    "mastodon.morolog.us",
-    "mastodon.morwud.cz",
-    "mastodon.moscow",
-    "mastodon.mossferatu.monster",
-    "mastodon.mossy.page",
-    "mastodon.motcha.tech",
-    "mastodon.mou-da.me",
-    "mastodon.mouchkine.fr",
-    "mastodon.moule.world",
-    "mastodon.mountainash.id.au",
-    "mastodon.moussaclarke.co.uk",
-    "mastodon.mrak.at",
-    "mastodon.mudkips.net",
-    "mastodon.muhammadsamir.com",
-    "mastodon.muito.top",
-    "mastodon.multiclan.ninja",
-    "mastodon.multimob.be",
-    "mastodon.munsell.io",
-    "mastodon.murkworks.net",
-    "mastodon.murphnet.uk",
-    "mastodon.musicstudio.pro",
-    "mastodon.mustlove.net",
-    "mastodon.musubi.moe",
-    "mastodon.mvoss.eu",
-    "mastodon.mwegner.com",
-    "mastodon.mx",
-    "mastodon.my-ant.myds.me",
-    "mastodon.my.id",
-    "mastodon.myaddomain.org",
-    "mastodon.mycozy.space",
-    "mastodon.myepicserver.de",
-    "mastodon.myfed.space",
-    "mastodon.myhome.pm",
-    "mastodon.myocci.social",
-    "mastodon.mythoughtprocess.info",
-    "mastodon.n41.lat",
-    "mastodon.n6.io",
-    "mastodon.nagaseyami.com",
-    "mastodon.naii.io",
-    "mastodon.naiveapps.com",
-    "mastodon.nanashinonozomi.com",
-    "mastodon.natrinicle.com",
-    "mastodon.naturalorder.me",
-    "mastodon.naturemag.org",
-    "mastodon.naugrim.org",
-    "mastodon.navarro.pub",
-    "mastodon.nealgroothuis.name",
-    "mastodon.near.social",
-    "mastodon.neat.computer",
-    "mastodon.nebby.de",
-    "mastodon.nebulon.de",
-    "mastodon.neelc.org",
-    "mastodon.neg9.org",
-    "mastodon.neilzone.co.uk",
-    "mastodon.neither-nor.net",
-    "mastodon.nekoconeko.nl",
-    "mastodon.nekohell.eu",
-    "mastodon.nekojimi.moe",
-    "mastodon.nekomimi.jp",
-    "mastodon.nekusoul.de",
-    "mastodon.nelson.fun",
-    "mastodon.nerdlings.net",
-    "mastodon.nerfherders.club",
-    "mastodon.nervesocket.com",
-    "mastodon.neshweb.net",
-    "mastodon.nesven.eu",
-    "mastodon.net.au",
-    "mastodon.net2o.de",
-    "mastodon.nether.net",
-    "mastodon.networkback.synology.me",
-    "mastodon.nextcraft.link",
-    "mastodon.nexus",
-    "mastodon.nexusuk.org",
-    "mastodon.nfriedly.com",
-    "mastodon.ngen15.tv",
-    "mastodon.ngo",
-    "mastodon.nichi.co",
-    "mastodon.nickcharlton.net",
-    "mastodon.nickscloud.social",
-    "mastodon.nightmared.fr",
-    "mastodon.nilswloka.com",
-    "mastodon.ninth-sekai.monster",
-    "mastodon.nissesdomain.org",
-    "mastodon.niu.ne.jp",
-    "mastodon.nk.ca",
-    "mastodon.nl",
-    "mastodon.nlmakers.ca",
-    "mastodon.nmaggioni.xyz",
-    "mastodon.nnn1590.org",
-    "mastodon.no2nd.earth",
-    "mastodon.nogods.be",
-    "mastodon.noizycat.com",
-    "mastodon.noldal.net",
-    "mastodon.nominom.de",
-    "mastodon.noraworld.com",
-    "mastodon.nordgedanken.dev",
-    "mastodon.noreboot.org",
-    "mastodon.northstar.social",
-    "mastodon.nosotros.ong.br",
-    "mastodon.nothus.fr",
-    "mastodon.notlegit.net",
-    "mastodon.notsobig.co",
-    "mastodon.novadata.app",
-    "mastodon.novak.to",
-    "mastodon.nove.team",
-    "mastodon.novylen.net",
-    "mastodon.noyer.app",
-    "mastodon.nrgup.net",
-    "mastodon.nsnw.ca",
-    "mastodon.nu",
-    "mastodon.nuage-libre.fr",
-    "mastodon.nuages.noho.st",
-    "mastodon.nube61.syncloud.it",
-    "mastodon.nudecri.unicamp.br",
-    "mastodon.number251.duckdns.org",
-    "mastodon.nuwus.org",
-    "mastodon.nyanshell.com",
-    "mastodon.nyanstorm.fun",
-    "mastodon.nycmesh.net",
-    "mastodon.nyoxfox.com",
-    "mastodon.nyveir.fr",
-    "mastodon.nz",
-    "mastodon.nzoss.nz",
-    "mastodon.o3o.icu",
-    "mastodon.obdev.at",
-    "mastodon.obspm.fr",
-    "mastodon.oceand.org",
-    "mastodon.ocert.at",
-    "mastodon.ocfox.me",
-    "mastodon.oconnellamethyst.com",
-    "mastodon.octobot.space",
-    "mastodon.oday.net",
-    "mastodon.odessen.com",
-    "mastodon.ody.si",
-    "mastodon.oeru.org",
-    "mastodon.offerman.com",
-    "mastodon.ohiobroadcastnetwork.com",
-    "mastodon.oi7.de",
-    "mastodon.ok1bt.cz",
-    "mastodon.oldstyle-project.org",
-    "mastodon.olisti.co",
-    "mastodon.oliverfalvai.xyz",
-    "mastodon.oliversteptoe.co.uk",
-    "mastodon.olivr.me",
-    "mastodon.omedia.cloud",
-    "mastodon.omikron-alpha.net",
-    "mastodon.omnigroup.com",
-    "mastodon.omx.nl",
-    "mastodon.onepointzero.com",
-    "mastodon.online",
-    "mastodon.open-web.fr",
-    "mastodon.opencloud.lu",
-    "mastodon.opencollective.com",
-    "mastodon.opendots.social",
-    "mastodon.openformation.io",
-    "mastodon.opportunis.me",
-    "mastodon.orbitmines.com",
-    "mastodon.org.uk",
-    "mastodon.orko.it",
-    "mastodon.oromit.de",
-    "mastodon.ostertag.team",
-    "mastodon.otherworldsink.com",
-    "mastodon.ounce.zone",
-    "mastodon.ouvaton.coop",
-    "mastodon.overholts.dev",
-    "mastodon.oxus.net",
-    "mastodon.oysta.au",
-    "mastodon.ozioso.online",
-    "mastodon.paftech.se",
-    "mastodon.paladinzero.com",
-    "mastodon.palewi.re",
-    "mastodon.palmer.house",
-    "mastodon.pandapa.ws",
-    "mastodon.pandoli365.com",
-    "mastodon.panxl.net",
-    "mastodon.pappenklatsch.de",
-    "mastodon.parastor.net",
-    "mastodon.pariserstr.de",
-    "mastodon.parkingmeter.info",
-    "mastodon.parleur.net",
-    "mastodon.partipirate.org",
-    "mastodon.pastleo.me",
-    "mastodon.patchbox.i234.me",
-    "mastodon.pathconnect.de",
-    "mastodon.paulklipp.com",
-    "mastodon.paulo-sc.com",
-    "mastodon.paulober.eu",
-    "mastodon.pavilion.tech",
-    "mastodon.pccl.me",
-    "mastodon.pcgaldo.com",
-    "mastodon.peaceful.social",
-    "mastodon.pekkasipila.com",
-    "mastodon.pelica.net",
-    "mastodon.pena.mobi",
-    "mastodon.peregrinecross.com",
-    "mastodon.persempio.de",
-    "mastodon.perso.org",
-    "mastodon.personalspaceshow.lawyer",
-    "mastodon.pertinent-ops.com",
-    "mastodon.peterjanes.ca",
-    "mastodon.petertodd.org",
-    "mastodon.petripulkkinen.social",
-    "mastodon.pfy.ch",
-    "mastodon.ph",
-    "mastodon.phikai.com",
-    "mastodon.philtanner.com",
-    "mastodon.phukuile.com",
-    "mastodon.pierremkb.fr",
-    "mastodon.ping.de",
-    "mastodon.pinqin.cloud",
-    "mastodon.pirate.lgbt",
-    "mastodon.pirateparty.be",
-    "mastodon.pirati.cz",
-    "mastodon.pitty.hu",
-    "mastodon.pix-n-chill.fr",
-    "mastodon.pixeloasis.eu",
-    "mastodon.pl",
-    "mastodon.platformgoblin.com",
-    "mastodon.plong.eu",
-    "mastodon.plwd.cloud",
-    "mastodon.pnpde.social",
-    "mastodon.pocketgrok.com",
-    "mastodon.podmed.tech",
-    "mastodon.podycust.co.uk",
-    "mastodon.pointless.net",
-    "mastodon.polariton.space",
-    "mastodon.poldrugo.synology.me",
-    "mastodon.pom.community",
-    "mastodon.pontalk.com",
-    "mastodon.portal.org",
-    "mastodon.positivenerd.duckdns.org",
-    "mastodon.postmoderns.info",
-    "mastodon.potager.org",
-    "mastodon.potproject.net",
-    "mastodon.poukpouk.com",
-    "mastodon.powernut.rocks",
-    "mastodon.praxis.red",
-    "mastodon.preppers-shelter.nl",
-    "mastodon.pressthebutton.pw",
-    "mastodon.pretendo.network",
-    "mastodon.probesys.com",
-    "mastodon.producttalk.org",
-    "mastodon.profiklickser.com",
-    "mastodon.progaccess.net",
-    "mastodon.projetretro.io",
-    "mastodon.proquality.ro",
-    "mastodon.ptmsoft.fr",
-    "mastodon.ptolemaios.fr",
-    "mastodon.pu2ttz.app.br",
-    "mastodon.pub.solar",
-    "mastodon.publicinterest.town",
-    "mastodon.pundo.com",
-    "mastodon.pwei.at",
-    "mastodon.pwnt.io",
-    "mastodon.pyraster.fr",
-    "mastodon.pyrignis.fr",
-    "mastodon.q2r.net",
-    "mastodon.qamoe.cyou",
-    "mastodon.qassim.uk",
-    "mastodon.qowala.org",
-    "mastodon.qrpth.eu",
-    "mastodon.qtmlabs.xyz",
-    "mastodon.quantumindigo.org",
-    "mastodon.quantumobserver.eu",
-    "mastodon.que-sera.io",
-    "mastodon.quebec",
-    "mastodon.queensnkings.de",
-    "mastodon.quirijngb.com",
-    "mastodon.r-flash.eu",
-    "mastodon.r3networks.uk",
-    "mastodon.r3pek.org",
-    "mastodon.raddemo.host",
-    "mastodon.radfoote.net",
-    "mastodon.radiant.social",
-    "mastodon.radicalityincident.com",
-    "mastodon.radio",
-    "mastodon.radiotube.org",
-    "mastodon.rafaelbailon.com",
-    "mastodon.raikee.fi",
-    "mastodon.raleurs.eu.org",
-    "mastodon.ramatak.com",
-    "mastodon.ramble.moe",
-    "mastodon.rand0m.me",
-    "mastodon.randomcat.org",
-    "mastodon.randompherret.com",
-    "mastodon.raptorpond.com",
-    "mastodon.rasalf.pw",
-    "mastodon.raudssus.de",
-    "mastodon.raumfahrer.net",
-    "mastodon.raviteja.computer",
-    "mastodon.raykoworld.com",
-    "mastodon.rcockburn.com",
-    "mastodon.rcrowley.org",
-    "mastodon.rctatman.com",
-    "mastodon.rdan.net",
-    "mastodon.re",
-    "mastodon.red",
-    "mastodon.redgarterclub.com",
-    "mastodon.redstonelp2.com",
-    "mastodon.redwoods.dev",
-    "mastodon.rehtiniko.xyz",
-    "mastodon.reichhome.synology.me",
-    "mastodon.rejas.se",
-    "mastodon.replacementhipster.com",
-    "mastodon.researchinstitute.at",
-    "mastodon.retr0.party",
-    "mastodon.return12.net",
-    "mastodon.returntosander.net",
-    "mastodon.rfc1925.org",
-    "mastodon.rferee.dev",
-    "mastodon.rhadamanthe.ch",
-    "mastodon.rhys.wtf",
-    "mastodon.richardloxley.com",
-    "mastodon.rickisen.com",
-    "mastodon.rio20.net",
-    "mastodon.rip",
-    "mastodon.riverglide.com",
-    "mastodon.rjm.id.au",
-    "mastodon.rkd.pw",
-    "mastodon.rkvl.org",
-    "mastodon.rlp.schule",
-    "mastodon.robmccoll.com",
-    "mastodon.robomwm.com",
-    "mastodon.robserv.de",
-    "mastodon.rockhost.se",
-    "mastodon.roe.dev",
-    "mastodon.roelz.me",
-    "mastodon.rogafe.pw",
-    "mastodon.rokugan.fr",
-    "mastodon.roon.fr",
-    "mastodon.rosenberg-watt.com",
-    "mastodon.rosenha.in",
-    "mastodon.rosiesocosy.com",
-    "mastodon.rosseaux.com",
-    "mastodon.roundpond.net",
-    "mastodon.rozhlas.cz",
-    "mastodon.rp-taki.com",
-    "mastodon.rpdev.net",
-    "mastodon.rpicloud.de",
-    "mastodon.rpsychologist.com",
-    "mastodon.rubend.nl",
-    "mastodon.rubywhite.com",
-    "mastodon.rueffer.ch",
-    "mastodon.rulla.net",
-    "mastodon.run",
-    "mastodon.runcheck.net",
-    "mastodon.runninginthenight.com",
-    "mastodon.rxbrad.com",
-    "mastodon.rydlabs.com",
-    "mastodon.rym.social",
-    "mastodon.ryotosaito.com",
-    "mastodon.rzgierskopp.de",
-    "mastodon.s-a.at",
-    "mastodon.s-yurama.com",
-    "mastodon.s.wrongplace.be",
-    "mastodon.s7.rs",
-    "mastodon.saadatmand.pk",
-    "mastodon.saarland",
-    "mastodon.saatanantunar.it",
-    "mastodon.sacamano.net",
-    "mastodon.sacklzefix.de",
-    "mastodon.saltwater.blue",
-    "mastodon.sambands.net",
-    "mastodon.samfira.com",
-    "mastodon.samr1.net",
-    "mastodon.sandbox.skygrid-test.com",
-    "mastodon.sandwich.net",
-    "mastodon.sanpo-an.site",
-    "mastodon.sapara.com",
-    "mastodon.sarunint.com",
-    "mastodon.satellite.earth",
-    "mastodon.satoshishop.de",
-    "mastodon.savvy.ch",
-    "mastodon.sboots.ca",
-    "mastodon.sbpk.fr",
-    "mastodon.sbs",
-    "mastodon.sc07.group",
-    "mastodon.scapior.dev",
-    "mastodon.scheller.es",
-    "mastodon.schenkel.net",
-    "mastodon.schiessle.org",
-    "mastodon.schle.nz",
-    "mastodon.schlesser.net",
-    "mastodon.schnuffle.de",
-    "mastodon.schoentoon.com",
-    "mastodon.schub.social",
-    "mastodon.schule",
-    "mastodon.schwanzer.online",
-    "mastodon.schweren.dev",
-    "mastodon.scientiam.org",
-    "mastodon.scollectif.fr",
-    "mastodon.scop.coop",
-    "mastodon.scot",
-    "mastodon.scottbking.com",
-    "mastodon.screentimes.net",
-    "mastodon.scuzzyfox.com",
-    "mastodon.scy.name",
-    "mastodon.sdf.org",
-    "mastodon.sdm-it.com",
-    "mastodon.seabreeze.synology.me",
-    "mastodon.seals.social",
-    "mastodon.seanos.net",
-    "mastodon.seattlematrix.org",
-    "mastodon.sebbo.net",
-    "mastodon.seclusionis.me",
-    "mastodon.seishiono.com",
-    "mastodon.selbstgehostet.de",
-    "mastodon.self-hosted.site",
-    "mastodon.selfhosted.no",
-    "mastodon.sergal.org",
-    "mastodon.server.fifthdread.com",
-    "mastodon.sethb.com",
-    "mastodon.setsuna.kr",
-    "mastodon.sg",
-    "mastodon.shantih19.xyz",
-    "mastodon.sharking.com",
-    "mastodon.sharma.io",
-    "mastodon.sharpletters.net",
-    "mastodon.shatteredsky.net",
-    "mastodon.sherbers.de",
-    "mastodon.shodan.io",
-    "mastodon.shukriadams.com",
-    "mastodon.shura.live",
-    "mastodon.si",
-    "mastodon.silkroad.net",
-    "mastodon.simonhardwick.com",
-    "mastodon.simounet.net",
-    "mastodon.simply-life.net",
-    "mastodon.simpreative.network",
-    "mastodon.simulakrum.vpndns.org",
-    "mastodon.singularpoint.cc",
-    "mastodon.sinoru.me",
-    "mastodon.sipior.net",
-    "mastodon.sirrahd.com",
-    "mastodon.siteop.biz",
-    "mastodon.sjolin.io",
-    "mastodon.sk",
-    "mastodon.skalnik.com",
-    "mastodon.skapmedia.xyz",
-    "mastodon.sketchwave.club",
-    "mastodon.skookum.cc",
-    "mastodon.skorpil.cz",
-    "mastodon.skrimmage.com",
-    "mastodon.skweb.io",
-    "mastodon.skye.vg",
-    "mastodon.skylarkservers.net",
-    "mastodon.skylord.io",
-    "mastodon.sl",
-    "mastodon.slayers.com.br",
-    "mastodon.slightlycyberpunk.com",
-    "mastodon.small-home.group",
-    "mastodon.smears.org",
-    "mastodon.smeets.ee",
-    "mastodon.smeets.re",
-    "mastodon.smither.org",
-    "mastodon.snakenode.eu",
-    "mastodon.snek.dev",
-    "mastodon.sngsk.info",
-    "mastodon.sniff122.tech",
-    "mastodon.snld.ca",
-    "mastodon.snmsoc.org",
-    "mastodon.snthtns.jp",
-    "mastodon.socdojo.com",
-    "mastodon.social",
-    "mastodon.social.obscuravpn.io",
-    "mastodon.soft-qui-peut.dev",
-    "mastodon.softwarecurmudgeon.social",
-    "mastodon.solar",
-    "mastodon.solidev.net",
-    "mastodon.solsystem.social",
-    "mastodon.someotherguy.xyz",
-    "mastodon.sonsofliberty.red",
-    "mastodon.sophieversum.net",
-    "mastodon.soregashi.me",
-    "mastodon.souperk.gr",
-    "mastodon.southcoastgeek.uk",
-    "mastodon.spacefox.fr",
-    "mastodon.spacegirl.nl",
-    "mastodon.spacenode.net",
-    "mastodon.spacetraveller.com",
-    "mastodon.spanner.codes",
-    "mastodon.spesh.com",
-    "mastodon.spideynn.net",
-    "mastodon.sponda.nl",
-    "mastodon.spotek.io",
-    "mastodon.spotfestival.dk",
-    "mastodon.spowage.info",
-    "mastodon.sprawl.club",
-    "mastodon.spse.dev",
-    "mastodon.spv.sh",
-    "mastodon.spydar007.com",
-    "mastodon.stack.black",
-    "mastodon.staf.dev",
-    "mastodon.stahlstadt.cloud",
-    "mastodon.star-one.org.uk",
-    "mastodon.starfyre.de",
-    "mastodon.starlink.cz",
-    "mastodon.starnet.cz",
-    "mastodon.staropa.net",
-    "mastodon.starshipchangeling.net",
-    "mastodon.staton.us",
-    "mastodon.ste.no",
-    "mastodon.steamedfish.org",
-    "mastodon.steinernebruecke.de",
-    "mastodon.stellarspace.net",
-    "mastodon.stellbr.ink",
-    "mastodon.stennmedia.nl",
-    "mastodon.stevebate.dev",
-    "mastodon.stevenz.net",
-    "mastodon.stevesworld.co",
-    "mastodon.stevex.online",
-    "mastodon.stevijo.me",
-    "mastodon.stibma.com",
-    "mastodon.stickbear.me",
-    "mastodon.stickfishery.com",
-    "mastodon.stillsunbound.co.uk",
-    "mastodon.stoile.name",
-    "mastodon.strangeparts.com",
-    "mastodon.strasser.wien",
-    "mastodon.straylight.engineering",
-    "mastodon.stsecurity.moe",
-    "mastodon.stuartoram.com",
-    "mastodon.student-factory.de",
-    "mastodon.stuttgart.international",
-    "mastodon.suderman.dev",
-    "mastodon.sujets-libres.fr",
-    "mastodon.sunflowerfuchs.dev",
-    "mastodon.sunn.net",
-    "mastodon.surazal.net",
-    "mastodon.sus-thoss.de",
-    "mastodon.svgun.ru",
-    "mastodon.sxpert.org",
-    "mastodon.symbolic.software",
-    "mastodon.sympatic.cloud",
-    "mastodon.sysctl.io",
-    "mastodon.taewaloni.net",
-    "mastodon.tails.ch",
-    "mastodon.tal.org",
-    "mastodon.tals.dev",
-    "mastodon.tarmil.fr",
-    "mastodon.tass.is",
-    "mastodon.tcbailey.com",
-    "mastodon.tds.xyz",
-    "mastodon.teachmaths.org",
-    "mastodon.teamnerds.cool",
-    "mastodon.teamrocket.nz",
-    "mastodon.tech-nico.de",
-    "mastodon.techgremlin.com",
-    "mastodon.technosorcery.net",
-    "mastodon.techrekt.com",
-    "mastodon.techtriage.guru",
-    "mastodon.tedomum.net",
-    "mastodon.teia.art",
-    "mastodon.teilzeitphilosoph.de",
-    "mastodon.tejat.net",
-    "mastodon.tekdmn.me",
-    "mastodon.tenshu.net",
-    "mastodon.teppotastic.co.uk",
-    "mastodon.terpotiz.net",
-    "mastodon.test.micheal65536.duckdns.org",
-    "mastodon.testausserveri.fi",
-    "mastodon.tetaneutral.net",
-    "mastodon.tetragir.com",
-    "mastodon.tevinzhang.com",
-    "mastodon.tgjb.org",
-    "mastodon.thapaliya.com",
-    "mastodon.thbps.com",
-    "mastodon.the937.rocks",
-    "mastodon.thebeeches.house",
-    "mastodon.thecrimsontint.com",
-    "mastodon.thedirtydis.co",
-    "mastodon.thefediverse.net",
-    "mastodon.thefword.club",
-    "mastodon.thegovlab.com",
-    "mastodon.themarkup.org",
-    "mastodon.thenewoil.org",
-    "mastodon.thentrythis.org",
-    "mastodon.theorangeone.net",
-    "mastodon.theserver.se",
-    "mastodon.theshowshow.tv",
-    "mastodon.thesilentlink.org",
-    "mastodon.thesmircios.synology.me",
-    "mastodon.theultraworld.org",
-    "mastodon.thewarrens.name",
-    "mastodon.thewdhanat.com",
-    "mastodon.thexboxcast.co.nz",
-    "mastodon.theyosh.nl",
-    "mastodon.thi.ng",
-    "mastodon.thirring.org",
-    "mastodon.thomaspreece.net",
-    "mastodon.three-weeks-later.com",
-    "mastodon.ti-fr.com",
-    "mastodon.tianshengli.me",
-    "mastodon.tiennot.net",
-    "mastodon.till.net",
-    "mastodon.timnolte.com",
-    "mastodon.timo.systems",
-    "mastodon.timotheejulien.fr",
-    "mastodon.tinycart.club",
-    "mastodon.tinyfox.dev",
-    "mastodon.tinynews.org",
-    "mastodon.tipsyvixen.com",
-    "mastodon.titi.me.uk",
-    "mastodon.titipat.net",
-    "mastodon.tlo.xyz",
-    "mastodon.tmm.cx",
-    "mastodon.tn",
-    "mastodon.toaruden.net",
-    "mastodon.tocaj.ch",
-    "mastodon.tod.net",
-    "mastodon.todfox.site",
-    "mastodon.tojo.tokyo",
-    "mastodon.tokyo",
-    "mastodon.tolleham.top",
-    "mastodon.tomaszdunia.pl",
-    "mastodon.tomwaits.progressivwerk.de",
-    "mastodon.tonywebster.com",
-    "mastodon.toon.town",
-    "mastodon.top",
-    "mastodon.toptechtidbits.com",
-    "mastodon.totepoi.com",
-    "mastodon.toti.is",
-    "mastodon.totmin.ru",
-    "mastodon.trabus322.eu",
-    "mastodon.tradingcardarchives.com",
-    "mastodon.train.cz",
-    "mastodon.tramasoli.com",
-    "mastodon.trancart.eu",
-    "mastodon.transmutagen.net",
-    "mastodon.transneptune.net",
-    "mastodon.transparentedge.eu",
-    "mastodon.transportevolved.com",
-    "mastodon.treegecko.com",
-    "mastodon.trege-soft.com",
-    "mastodon.trek3.io",
-    "mastodon.triathlon.one",
-    "mastodon.triformine.dev",
-    "mastodon.triggerphra.se",
-    "mastodon.trochalakis.com",
-    "mastodon.truesciphi.org",
-    "mastodon.trueten.de",
-    "mastodon.truongan.name.vn",
-    "mastodon.trustzero.nl",
-    "mastodon.try-to-hack.me",
-    "mastodon.tstm.info",
-    "mastodon.tsubame-jnr.f5.si",
-    "mastodon.ttg6.net",
-    "mastodon.tucsonsentinel.com",
-    "mastodon.tudgwal.fr",
-    "mastodon.tuidao.me",
-    "mastodon.tux-hausen.de",
-    "mastodon.tuxtendo.nl",
-    "mastodon.twatter.com",
-    "mastodon.twictee.org",
-    "mastodon.twiddlebang.org",
-    "mastodon.twocanoes.com",
-    "mastodon.twoslashes.com",
-    "mastodon.txmrl.net",
-    "mastodon.tymoon.eu",
-    "mastodon.tz.is",
-    "mastodon.uguu.io",
-    "mastodon.umucat.day",
-    "mastodon.undef.org.uk",
-    "mastodon.underworld.fr",
-    "mastodon.une.fi",
-    "mastodon.uniastur.com",
-    "mastodon.unicornies.de",
-    "mastodon.unified.contact",
-    "mastodon.uniteddiversity.coop",
-    "mastodon.unknownrealm.org",
-    "mastodon.unlogged.it",
-    "mastodon.uno",
-    "mastodon.unpluggedrva.com",
-    "mastodon.unsupervised.online",
-    "mastodon.unsuspicious.website",
-    "mastodon.upx.moe",
-    "mastodon.urbancloud.cz",
-    "mastodon.useless.one",
-    "mastodon.uwuwatch.club",
-    "mastodon.uy",
-    "mastodon.valha.la",
-    "mastodon.vandegraaf.xyz",
-    "mastodon.vandevan.net",
-    "mastodon.vandevoor.de",
-    "mastodon.vandewaetere.be",
-    "mastodon.vanlife.is",
-    "mastodon.vaporghost.at",
-    "mastodon.vapronva.pw",
-    "mastodon.variousbits.net",
-    "mastodon.vaucher.org",
-    "mastodon.vda-group.de",
-    "mastodon.vdoor.ch",
-    "mastodon.veen.world",
-    "mastodon.vegh.social",
-    "mastodon.versme.net",
-    "mastodon.vhack.eu",
-    "mastodon.vhome.info",
-    "mastodon.vief.email",
-    "mastodon.vierkantor.com",
-    "mastodon.virton13.ovh",
-    "mastodon.vishnurajeevan.com",
-    "mastodon.vlaanderen",
-    "mastodon.vladovince.com",
-    "mastodon.vm.statshelix.com",
-    "mastodon.vnaganami.com",
-    "mastodon.vnvie.ws",
-    "mastodon.vofr.net",
-    "mastodon.voidconspiracy.com",
-    "mastodon.vornik.net",
-    "mastodon.vpx.moe",
-    "mastodon.vshn.social",
-    "mastodon.vtip.me",
-    "mastodon.vuillaume.ovh",
-    "mastodon.vx0.dev",
-    "mastodon.waarisguus.com",
-    "mastodon.wakoma.co",
-    "mastodon.wappler.systems",
-    "mastodon.warbel.net",
-    "mastodon.washdcmail.com",
-    "mastodon.wasnt.net",
-    "mastodon.wastaken.xyz",
-    "mastodon.waxwing.studio",
-    "mastodon.wazongtest.de",
-    "mastodon.wdorff.dev",
-    "mastodon.we-cloud.de",
-    "mastodon.webarch.org.uk",
-    "mastodon.weber.fi.eu.org",
-    "mastodon.weinzierlweb.com",
-    "mastodon.well.com",
-    "mastodon.wellington.gen.nz",
-    "mastodon.wellperns.com",
-    "mastodon.wenzit.de",
-    "mastodon.westsideblogger.eu",
-    "mastodon.wg0.xyz",
-    "mastodon.whitakernet.com",
-    "mastodon.white-void.net",
-    "mastodon.wien",
-    "mastodon.wihel.de",
-    "mastodon.willnorris.net",
-    "mastodon.wingsman2.net",
-    "mastodon.wiorca.com",
-    "mastodon.wisellama.rocks",
-    "mastodon.wivodaim.net",
-    "mastodon.wkf.wtf",
-    "mastodon.wladyspb.pro",
-    "mastodon.woitschetzki.de",
-    "mastodon.wolf-yuan.dev",
-    "mastodon.wolfpaw.kr",
-    "mastodon.wolfssocial.space",
-    "mastodon.wolvar.net",
-    "mastodon.woodburn.au",
-    "mastodon.woojinkim.org",
-    "mastodon.wootton.dev",
-    "mastodon.workingweb.nl",
-    "mastodon.world",
-    "mastodon.wormhole.eu",
-    "mastodon.wowne.ro",
-    "mastodon.wrye-labs.ovh",
-    "mastodon.wssmagazine.com",
-    "mastodon.wtfomfg.org",
-    "mastodon.wulfsige.com",
-    "mastodon.wurzelmann.at",
-    "mastodon.wyngraphs.com",
-    "mastodon.xcsdm.com",
-    "mastodon.xeac.org",
-    "mastodon.xethos.net",
-    "mastodon.xingxing.digital",
-    "mastodon.xn--9cs231j0ji.xn--p8s937b.net",
-    "mastodon.xn--q9jyb4c",
-    "mastodon.xn--t8jzbl7g.jp",
-    "mastodon.xnop.yt",
-    "mastodon.xolus.net",
-    "mastodon.xorp.hu",
-    "mastodon.xrh0905.top",
-    "mastodon.xxlab.tech",
-    "mastodon.xxx",
-    "mastodon.xy-space.de",
-    "mastodon.xyaren.de",
-    "mastodon.xylonx.com",
-    "mastodon.xyz",
-    "mastodon.yaat.org",
-    "mastodon.yakka.art",
-    "mastodon.yakovlev.me",
-    "mastodon.yasa.gs",
-    "mastodon.ydkn.social",
-    "mastodon.yiffyfosque.com",
-    "mastodon.ynerant.fr",
-    "mastodon.yoanndelattre.com",
-    "mastodon.yockow.jp",
-    "mastodon.yoctomath.com",
-    "mastodon.yohan.es",
-    "mastodon.yorglemedia.org",
-    "mastodon.yousack.net",
-    "mastodon.youusme.com",
-    "mastodon.yshi.org",
-    "mastodon.ysr.ie",
-    "mastodon.yuangezhizao.cn",
-    "mastodon.yujin.me",
-    "mastodon.yung.au",
-    "mastodon.yupgup.com",
-    "mastodon.yuuki.pictures",
-    "mastodon.yuuta.moe",
-    "mastodon.yyyyy.world",
-    "mastodon.z27.ch",
-    "mastodon.z6100tanneau.fr",
-    "mastodon.zacekj.cz",
-    "mastodon.zaclys.com",
-    "mastodon.zanderz.com",
-    "mastodon.zazamankh.com",
-    "mastodon.zbecker.cc",
-    "mastodon.zergy.net",
-    "mastodon.zero.lgbt",
-    "mastodon.zerstoererbande.de",
-    "mastodon.zeteo.me",
-    "mastodon.zeus.gent",
-    "mastodon.zevs.me",
-    "mastodon.zombor.net",
-    "mastodon.zorqz.com",
-    "mastodon.zougloub.eu",
-    "mastodon.zs-studanka.cz",
-    "mastodon.zufki.de",
-    "mastodon.zunda.ninja",
-    "mastodon.zuzakistan.com",
-    "mastodon.zwanenburg.info",
-    "mastodon.zweifel.cloud",
-    "mastodon.zyun.jp",
-    "mastodon1.iceman.synology.me",
-    "mastodon2.artsrn.ualberta.ca",
-    "mastodon2.cameko.org",
-    "mastodon2.juggler.jp",
-    "mastodonapp.uk",
-    "mastodonarchitecture.org",
-    "mastodonbooks.net",
-    "mastodonchina.com",
-    "mastodonczech.cz",
-    "mastodongx.com",
-    "mastodonian.org",
-    "mastodonmusic.social",
-    "mastodonnederland.online",
-    "mastodonserver.ipv64.net",
-    "mastodonsweden.se",
-    "mastodont.cat",
-    "mastodont.social",
-    "mastodont.yvees.ovh",
-    "mastodonte.com.br",
-    "mastodonte.quebec",
-    "mastodontech.de",
-    "mastodonten.kukernetes.se",
-    "mastodonters.nl",
-    "mastodonti.st",
-    "mastodonts.se",
-    "mastodontti.fi",
-    "mastodoom.social",
-    "mastodooooooon.xyz",
-    "mastodos.com",
-    "mastoflute.social",
-    "mastohack.com",
-    "mastoid.dev",
-    "mastomarc.ddns.net",
-    "mastomo.online",
-    "mastonederland.nl",
-    "mastoneuron.com",
-    "mastoot.fr",
-    "mastorol.es",
-    "mastoscat.club",
-    "mastotest.jmessage.org",
-    "mastothreads.net",
-    "mastoturk.org",
-    "mastotut.cat",
-    "mastouille.fr",
-    "mastoverse.social",
-    "mastoworx.social",
-    "mastoxiv.page",
-    "masts.lv",
-    "mastsocial.de",
-    "masturb.ating.press",
-    "masturbated.one",
-    "mastvie.eu",
-    "matcha.pub",
-    "mathewson.social",
-    "mathstodon.xyz",
-    "mathtod.online",
-    "matitodon.com",
-    "mato.social",
-    "matricaria.de",
-    "matstar.error.pe.kr",
-    "matsudon.hostdon.ne.jp",
-    "mattebox.social",
-    "matthewbogart.com",
-    "matthewbogart.live",
-    "matthijs.social",
-    "matts.network",
-    "mattstodon.xyz",
-    "matya.social",
-    "maxodon.com",
-    "maxpe.todon.de",
-    "maxtodon.lol",
-    "mayhap.org",
-    "mayson.us",
-    "mazanec.social",
-    "mazaska.social",
-    "mazzo.masto.host",
-    "mb.bobobo80.com",
-    "mb.draculaojisan.com",
-    "mb.jenot.info",
-    "mb.slime.digital",
-    "mblog.zhaohai.li",
-    "mcd.dk",
-    "mcirc.us",
-    "mck.pub",
-    "mckellar.social",
-    "mcnamarii.town",
-    "mcr.wtf",
-    "mctetsudou.net",
-    "mcyt.cc",
-    "md.cdonley.com",
-    "md.cpafisud.net",
-    "md.echoplex.info",
-    "md.epiphyte.ie",
-    "md.ggtea.org",
-    "md.ilyamikcoder.com",
-    "md.korako.me",
-    "md.muyactual.com",
-    "md.nakn.jp",
-    "md.net-p.org",
-    "md.songtronix.com",
-    "md.startide.jp",
-    "md.tals.dev",
-    "md.therwi.sawrams.ru",
-    "md.uzla.net",
-    "md.wikiwiki.li",
-    "md.xps2.net",
-    "md02q.obh8.net",
-    "mddev.a9z.dev",
-    "mdn.dodge.me.uk",
-    "mdn.hinaloe.net",
-    "mdn.keasti.net",
-    "mdn.xn--sthle-nra.dk",
-    "mdon.ee",
-    "mdon.stefanomarinelli.it",
-    "mdoufu.hostdon.ne.jp",
-    "mdx.ggtea.org",
-    "me.8w.ee",
-    "me.aedifex.dk",
-    "me.dm",
-    "me.konklone.com",
-    "me.memories.am",
-    "me.not.cy",
-    "me.ns.ci",
-    "me.nzen.ski",
-    "me.oer.me",
-    "me.pptry.info",
-    "me.syslog.eu",
-    "mecha.garden",
-    "mechanical.cat",
-    "med-mastodon.com",
-    "mededelingen.civieleautoriteiten.nl",
-    "mederland.nl",
-    "media.freespeechextremist.com",
-    "media.lukeog.com",
-    "mediaformat.org",
-    "mediapart.social",
-    "mediastudies.berlin",
-    "medibubble.org",
-    "medic.cafe",
-    "medien.social",
-    "medievalarchives.social",
-    "medievalist.masto.host",
-    "mediocre.photos",
-    "medium-sandbox.social",
-    "medsocionwheels.com",
-    "meedan.social",
-    "meemu.org",
-    "meeple.social",
-    "meerjungfrauengrotte.de",
-    "meersje.social",
-    "meet.communitymedia.network",
-    "meetbeauties.social",
-    "meetplay.net",
-    "mefi.social",
-    "megalonyx.social",
-    "meganekeesu.tokyo",
-    "megantoots.com",
-    "megatherium.org",
-    "meh.social",
-    "meikai.chaotic.ninja",
-    "meikle.social",
-    "meinl.space",
-    "meinmuenster.land",
-    "meinungsschubla.de",
-    "mejia.social",
-    "melb.social",
-    "melder.social",
-    "melendez.land",
-    "melijn.me",
-    "melle.social",
-    "mellified.men",
-    "mellow.zone",
-    "melon.blue",
-    "melonbread.dev",
-    "melonsoda.site",
-    "member.ro",
-    "meme.kaixin.meme",
-    "memelords.zone",
-    "mementomori.social",
-    "memes.observer",
-    "memory-art.xyz",
-    "memory.sda1.net",
-    "memtech.social",
-    "mendeddrum.org",
-    "menot.social",
-    "mensmaaktmooi.nl",
-    "mental.camp",
-    "mental.social",
-    "mentalhealth-masto.com",
-    "meow.academy",
-    "meow.binaryfeline.com",
-    "meow.church",
-    "meow.cloud",
-    "meow.day",
-    "meow.kiwa.space",
-    "meow.lgbt",
-    "meow.miabaka.moe",
-    "meow.social",
-    "meow.unyacat.net",
-    "meow.woem.cat",
-    "meowcity.club",
-    "meowing.online",
-    "meowr.me",
-    "meowstodon.net",
-    "mergl.in",
-    "merida.hair",
-    "meron.io",
-    "merovingian.club",
-    "merta.social",
-    "merveilles.town",
-    "mescl.in",
-    "meshed.cloud",
-    "mesmerized.online",
-    "mess.social",
-    "messydesk.social",
-    "meta.dog",
-    "meta.enafore.social",
-    "meta.jorun.dev",
-    "meta.masto.host",
-    "metalhead.club",
-    "metalverse.social",
-    "metapan.online",
-    "metapixl.com",
-    "metasocial.com",
-    "metcha.me",
-    "meteo.social",
-    "meteorite-song.masto.host",
-    "methedr.one",
-    "metro.social",
-    "metrobus.masto.host",
-    "metsubo-jinrai.net",
-    "metuba.hostdon.jp",
-    "mew.lgbt",
-    "mew.pm",
-    "mewblog.thepolarbear.co.uk",
-    "mewitoot.de",
-    "mexico-pensante.blog",
-    "mfjt-gotosocial.fly.dev",
-    "mfy.social",
-    "mhc.social",
-    "mhenry.social",
-    "mhz.social",
-    "miantiao.me",
-    "miau.jeder.pl",
-    "miau.le-chat-a-velo.at",
-    "miauws.life",
-    "micah.social",
-    "micahcraig.net",
-    "micc.masto.host",
-    "michaonline.net",
-    "michidon.com",
-    "micko.dy.fi",
-    "micro.alden.page",
-    "micro.alochana.net",
-    "micro.arda.pw",
-    "micro.baixllobregat.social",
-    "micro.bbalm.me",
-    "micro.blog",
-    "micro.blogs.princeton.edu",
-    "micro.deadringing.blog",
-    "micro.hrsn.me",
-    "micro.jacksonchen666.com",
-    "micro.koray.al",
-    "micro.mitrich.me",
-    "micro.mkp.ca",
-    "micro.mnino.us",
-    "micro.rumproarious.com",
-    "micro.sadlerjw.com",
-    "micro.shitpost.blog",
-    "micro.srvr.dev",
-    "micro.towards.vision",
-    "microbe.vital.org.nz",
-    "microblog.at",
-    "microblog.illum.dev",
-    "microblog.lunai.re",
-    "microblog.net",
-    "microblog.robot-disco.net",
-    "microblog.shivering-isles.com",
-    "microblog.veen.world",
-    "microhive.org",
-    "microhive.social",
-    "microscopic.network",
-    "microsocial.club",
-    "microsoftsource.social",
-    "middleearth.social",
-    "midnight.delivery",
-    "midorinasu.hostdon.ne.jp",
-    "miekeroth.org",
-    "mielke.social",
-    "mieth.social",
-    "mightyena.com",
-    "mijn.masto.host",
-    "mikecoats.social",
-    "mikroblog.at",
-    "mikroblog.dk",
-    "mikrobloggen.no",
-    "mikrotik.social",
-    "miku.place",
-    "mikumikudance.cloud",
-    "mikuobsession.net",
-    "milker.cafe",
-    "millcrick.social",
-    "millefeuilles.cloud",
-    "milliways.social",
-    "miltackink.space",
-    "miltodon.social",
-    "minamina3710.com",
-    "minazukey.uk",
-    "minby.info",
-    "mince.network",
-    "mindcreatesmeaning.com",
-    "mindly.social",
-    "mindplex.sotatek.works",
-    "minds.excession.llc",
-    "miniature.photography",
-    "miniatures.social",
-    "minidisc.gay",
-    "minimal.social",
-    "minimeadow.art",
-    "minions.social",
-    "minitel.cloud",
-    "minitor.su",
-    "minivelo.coffee",
-    "miniwa.moe",
-    "minmin.hostdon.ne.jp",
-    "minohdon.jp",
-    "mint.choco.ink",
-    "minutiae.cerritus.eu",
-    "mipple.love",
-    "mipuertorico.social",
-    "miraiverse.xyz",
-    "mirus.club",
-    "mirwarso.de",
-    "misaka.chat",
-    "misanthrope.social",
-    "misc.name",
-    "miscreants.party",
-    "miserables.net",
-    "misjump.net",
-    "mislibros.net",
-    "misp-community.org",
-    "missiletest.site",
-    "misskey.takahe.social",
-    "misskey.yandere.love",
-    "mister.computer",
-    "mistodon.cloud",
-    "mitchelltribe.social",
-    "miteff.co",
-    "mitente.club",
-    "mitra-dev.stesan.dev",
-    "mitra.076.moe",
-    "mitra.0ut0f.space",
-    "mitra.anon-kenkai.com",
-    "mitra.haruki7049.dev",
-    "mitra.karapara.net",
-    "mitra.manueldorso.rip",
-    "mitra.social",
-    "mitrofanov.su",
-    "mitten.dur.ch",
-    "mivox.net",
-    "mixedmedia.page",
-    "mk.absturztau.be",
-    "mk.aleteoryx.me",
-    "mk.cpluspatch.com",
-    "mk.kiber-ogur4ik.space",
-    "mk.magicka.org",
-    "mk.noob.quest",
-    "mk.nyaa.place",
-    "mk.phreedom.club",
-    "mk.plasmatrap.com",
-    "mk.sekundenklebertransportverbot.de",
-    "mk.woem.space",
-    "mku.social",
-    "mkultra.me",
-    "mkultra.monster",
-    "mm.xxooxx.xyz",
-    "mmasuda.hostdon.ne.jp",
-    "mmi.todon.de",
-    "mmrw.de",
-    "mn.drunu.be",
-    "mn.p.starxy.cc",
-    "mn.siru.tokyo",
-    "mn.social",
-    "mnglw.xyz",
-    "mnstdn.monster",
-    "mo-na.space",
-    "mo.social",
-    "mo.tt",
-    "mo.zhz.moe",
-    "moates.blog",
-    "mochi.social",
-    "mochitodon.com",
-    "mochiwasadon.com",
-    "modalnode.club",
-    "modelrailroadballast.com",
-    "modem.network",
-    "moderately.social",
-    "moe.cat",
-    "moe.mitchi.moe",
-    "moe.onl",
-    "moe.pastwind.top",
-    "moe.social",
-    "moeda.me",
-    "moessingen.social",
-    "moetz.social",
-    "moew.app",
-    "mofmof.coffee",
-    "mofu.kemo.no",
-    "mofu.one",
-    "mofucloud.com",
-    "mog.blue",
-    "mograph.social",
-    "moin.lol",
-    "mojobus.org",
-    "mojt.net",
-    "mokete.de",
-    "mokomokohouse.com",
-    "molaguay.xyz",
-    "molotov.sanrizuka-struggle.com",
-    "moments.hidupmanis.studio",
-    "momo.mame.moe",
-    "mon-desu.com",
-    "mona.do",
-    "monads.online",
-    "monarchists.uk",
-    "monastery.ink",
-    "monb.work",
-    "mond-basis.eu",
-    "mone.dev",
-    "monitoring.cafe",
-    "monk.ey.business",
-    "monkey.tunk.org",
-    "monkeyhex.com",
-    "monks.city",
-    "monocles.social",
-    "monofed.com",
-    "monogram.org",
-    "monospacedmagic.dev",
-    "monoxane.io",
-    "monrepos.casa",
-    "monsterfuckers.online",
-    "montereybay.social",
-    "montevista.net",
-    "montmast.com",
-    "montpellier.buzz",
-    "moo.nz",
-    "moo.pub",
-    "moodoo.org",
-    "moonbeam.town",
-    "moonblade.social",
-    "moonbow.garden",
-    "moongteng.club",
-    "moonlight-party.net",
-    "moonlit.city",
-    "moonmoth.de",
-    "moores.org",
-    "moosetodon.com",
-    "mooskirsch.xyz",
-    "moot.pub",
-    "moparisthe.best",
-    "morash.me",
-    "mordor.social",
-    "more.me",
-    "morehammer.uk",
-    "moreofacomment.my",
-    "moresci.sale",
-    "moris.social",
-    "morph.oksocial.net",
-    "morph.todon.de",
-    "morphnet.de",
-    "morrow.social",
-    "mortifer.online",
-    "morumotto.agnesta.ch",
-    "moss.church",
-    "moss.haus",
-    "moss.vegas",
-    "mossycab.in",
-    "mosteverywhere.com",
-    "mostlychris.net",
-    "mostlygood.xyz",
-    "mostodon.de",
-    "mosw.work",
-    "motern.media",
-    "moth.homeofcode.com",
-    "moth.science",
-    "moth.social",
-    "moth.zone",
-    "motinagi.masto.host",
-    "motley.club",
-    "motmot.cx",
-    "moto.exchange",
-    "mountaincommunity.co",
-    "mountains.social",
-    "mouse.photos",
-    "mousectrl.org",
-    "mousehole.online",
-    "mousetodon.com",
-    "mousetodon.social",
-    "mouth.semperpax.com",
-    "movie.calciumsigma.com",
-    "movsw.0x0.st",
-    "moytura.org",
-    "moyu.foundation",
-    "moyu.social",
-    "mozilla.social",
-    "mp.tylinux.com",
-    "mr.am",
-    "mr.lollyclaw.xyz",
-    "mrbot.de",
-    "mrcippy.xyz",
-    "mrdiamondj.social",
-    "mreow.de",
-    "mrhands.horse",
-    "mrnet.pt",
-    "mrow.pet",
-    "mrrob.in",
-    "mrrp.cat",
-    "mrrp.chimmie.k.vu",
-    "mrsjumbo.ucc.asn.au",
-    "mrtodon.net",
-    "ms.beniceplease.com",
-    "ms.cratonsed.ge",
-    "ms.linuch.pl",
-    "ms.maritime.social",
-    "ms.phocks.org",
-    "ms.twtcomm.shop",
-    "ms.vg",
-    "msc.pics",
-    "msd.fedcast.ch",
-    "msdyn365bc.social",
-    "msgs.ee",
-    "msk.mzyy94.com",
-    "mskey.nekomimi.party",
-    "mslink.com",
-    "msnws.online",
-    "msoc.hostdon.ne.jp",
-    "msocial.top",
-    "msps.io",
-    "mspsocial.net",
-    "mst-staging.collocall.de",
-    "mst.akari-network.jp",
-    "mst.canor.kr",
-    "mst.cebo29.ipv64.de",
-    "mst.csoundc.info",
-    "mst.doskel.net",
-    "mst.estrisabnor.com",
-    "mst.fpotfk.org",
-    "mst.mineown.de",
-    "mst.muiiio.com",
-    "mst.nekonohige.jp",
-    "mst.ramsdr.ru",
-    "mst.slu.mx",
-    "mst.small.cloud",
-    "mst.thumped.com",
-    "mst.universoalterno.es",
-    "mst3k.interlinked.me",
-    "mstd.animax.moe",
-    "mstd.bobobo80.com",
-    "mstd.dansmonorage.blue",
-    "mstd.gg",
-    "mstd.ink",
-    "mstd.ircta.lk",
-    "mstd.onl",
-    "mstd.seungjin.net",
-    "mstdev.stcpt.com",
-    "mstdn-amadeus.tech",
-    "mstdn-bike.net",
-    "mstdn-dystopia.com",
-    "mstdn-huahin.com",
-    "mstdn-jp.site",
-    "mstdn-kitakubu.com",
-    "mstdn-social.com",
-    "mstdn-stg.monapii.net",
-    "mstdn-test.sublimer.me",
-    "mstdn-test.yuicho.net",
-    "mstdn-vrchat.com",
-    "mstdn.221b.uk",
-    "mstdn.3naly.xyz",
-    "mstdn.47tya.net",
-    "mstdn.4ushiyu.jp",
-    "mstdn.abf.li",
-    "mstdn.adminero.it",
-    "mstdn.alicia.ne.jp",
-    "mstdn.animexx.de",
-    "mstdn.anqou.net",
-    "mstdn.aoirint.com",
-    "mstdn.aomushionline.com",
-    "mstdn.aotake91.net",
-    "mstdn.ap-srv-gw.net",
-    "mstdn.asterism.xyz",
-    "mstdn.at",
-    "mstdn.axtch.net",
-    "mstdn.b-shock.org",
-    "mstdn.bar",
-    "mstdn.barippi.com",
-    "mstdn.baxter.sh",
-    "mstdn.bbktsk.io",
-    "mstdn.bdms.ca",
-    "mstdn.beah.jp",
-    "mstdn.beer",
-    "mstdn.bgmn.net",
-    "mstdn.bitwalker.eu",
-    "mstdn.blue.wirednet.jp",
-    "mstdn.blueday.blue",
-    "mstdn.bluestreakradio.com",
-    "mstdn.bmw-and-more.info",
-    "mstdn.books-lighthouse.com",
-    "mstdn.business",
-    "mstdn.buzz",
-    "mstdn.bx23.net",
-    "mstdn.ca",
-    "mstdn.camora.dev",
-    "mstdn.cbult.space",
-    "mstdn.cc",
-    "mstdn.centerbase.cc",
-    "mstdn.ch",
-    "mstdn.chao.tokyo",
-    "mstdn.chitose.org",
-    "mstdn.chizroid.info",
-    "mstdn.choosingjoy.us",
-    "mstdn.chrisalemany.ca",
-    "mstdn.co.uk",
-    "mstdn.constellatory.net",
-    "mstdn.cool",
-    "mstdn.cordx.cx",
-    "mstdn.costmiku.net",
-    "mstdn.couvcourier.com",
-    "mstdn.crakac.com",
-    "mstdn.crfan.net",
-    "mstdn.crispius.ca",
-    "mstdn.crmbl.uk",
-    "mstdn.crux.noho.st",
-    "mstdn.cryptic-command.net",
-    "mstdn.ctero.dev",
-    "mstdn.cumulonimbus-cloud.com",
-    "mstdn.cygnan.com",
-    "mstdn.cyou",
-    "mstdn.dasmirnov.net",
-    "mstdn.delepine.info",
-    "mstdn.delmulin.com",
-    "mstdn.dgm.pw",
-    "mstdn.di-do.net",
-    "mstdn.ditu.jp",
-    "mstdn.dk",
-    "mstdn.dmynerd78.me",
-    "mstdn.doosom.com",
-    "mstdn.drawsdraws.com",
-    "mstdn.dsj-toot.com",
-    "mstdn.dsnv.net",
-    "mstdn.duckdns.org",
-    "mstdn.elwedritsche.ovh",
-    "mstdn.erblaboratory.com",
-    "mstdn.es",
-    "mstdn.esp.nl",
-    "mstdn.eternalflame24.com",
-    "mstdn.eternalreliquary.com",
-    "mstdn.ethnet.io",
-    "mstdn.facb69.com.br",
-    "mstdn.fan",
-    "mstdn.fedi.kirigiri.me",
-    "mstdn.fenslaw.nl",
-    "mstdn.feshiba.me",
-    "mstdn.fr",
-    "mstdn.fujii-yuji.net",
-    "mstdn.fun.systems",
-    "mstdn.funil.de",
-    "mstdn.gamercast.net",
-    "mstdn.games",
-    "mstdn.gao.works",
-    "mstdn.geanix.com",
-    "mstdn.gergely-szabo.com",
-    "mstdn.gingarenpo.com",
-    "mstdn.glaux.io",
-    "mstdn.glorificatio.org",
-    "mstdn.gsi.li",
-    "mstdn.gunma.jp",
-    "mstdn.guru",
-    "mstdn.h-o-soft.com",
-    "mstdn.haku-kazamaru.club",
-    "mstdn.hitoxu.com",
-    "mstdn.hiyuki2578.net",
-    "mstdn.hokkaido.jp",
-    "mstdn.hokkaidosm.net",
-    "mstdn.home.neso.tech",
-    "mstdn.homes",
-    "mstdn.host116.ru",
-    "mstdn.hostdon.jp",
-    "mstdn.ht164.jp",
-    "mstdn.husku.net",
-    "mstdn.hyogo.jp",
-    "mstdn.icu",
-    "mstdn.ijs01140.com",
-    "mstdn.ikaruga.me",
-    "mstdn.ikebuku.ro",
-    "mstdn.im",
-    "mstdn.imi.moe",
-    "mstdn.immatrix.de",
-    "mstdn.in.th",
-    "mstdn.incmplt.net",
-    "mstdn.ingrats.net",
-    "mstdn.internetyame.ro",
-    "mstdn.io",
-    "mstdn.ipol.social",
-    "mstdn.ipv6-only.com",
-    "mstdn.iroh.tv",
-    "mstdn.isometry.group",
-    "mstdn.itsnero.com",
-    "mstdn.ivtune.net",
-    "mstdn.janiak.cc",
-    "mstdn.jaws-ug.okinawa",
-    "mstdn.jetzou.com",
-    "mstdn.jklmno.org",
-    "mstdn.jmiguel.eu",
-    "mstdn.jmrp.io",
-    "mstdn.jnsk.info",
-    "mstdn.jp",
-    "mstdn.jrashford.com",
-    "mstdn.kapteinis.lv",
-    "mstdn.kazu34.net",
-    "mstdn.ke1go360.net",
-    "mstdn.keen.sx",
-    "mstdn.kemono-friends.info",
-    "mstdn.kernel-panic.lol",
-    "mstdn.kgtkr.net",
-    "mstdn.kizaing.ca",
-    "mstdn.klageweib.de",
-    "mstdn.klamath.jp",
-    "mstdn.kodein.be",
-    "mstdn.kousaka.co",
-    "mstdn.kurame.net",
-    "mstdn.kurosuke.org",
-    "mstdn.laccoske.online",
-    "mstdn.lalafell.org",
-    "mstdn.lalafell.org.",
-    "mstdn.lemontastica.net",
-    "mstdn.linfiel.com",
-    "mstdn.lite24.net",
-    "mstdn.litschner.com",
-    "mstdn.love",
-    "mstdn.lowbaud.io",
-    "mstdn.m3press.jp",
-    "mstdn.manas.website",
-    "mstdn.matsu.icu",
-    "mstdn.matthewmcgranahan.me",
-    "mstdn.maud.io",
-    "mstdn.md",
-    "mstdn.mell0w-5phere.net",
-    "mstdn.mfmfuyu.net",
-    "mstdn.midori-biyori.com",
-    "mstdn.midyuki.net",
-    "mstdn.mimikun.jp",
-    "mstdn.mini4wd-engineer.com",
-    "mstdn.minnanasi.net",
-    "mstdn.mix-food.net",
-    "mstdn.mk39.xyz",
-    "mstdn.mkihr-ojisan.com",
-    "mstdn.mlmie.net",
-    "mstdn.mmmalia.com",
-    "mstdn.moe",
-    "mstdn.moew.art",
-    "mstdn.monapii.net",
-    "mstdn.mrmts.com",
-    "mstdn.mv2k.com",
-    "mstdn.mx",
-    "mstdn.my",
-    "mstdn.myifn.de",
-    "mstdn.myutsutaka.com",
-    "mstdn.n-s.tokyo",
-    "mstdn.nagito.net",
-    "mstdn.nan1.casa",
-    "mstdn.nanamachi.net",
-    "mstdn.naomini.tel",
-    "mstdn.nekogata.com",
-    "mstdn.nekonote.cc",
-    "mstdn.nere9.help",
-    "mstdn.nial.to",
-    "mstdn.nicolog.jp",
-    "mstdn.nijist.info",
-    "mstdn.nostalgia-tns.net",
-    "mstdn.nrkn.fr",
-    "mstdn.nursing.unibas.ch",
-    "mstdn.o-nature-culture.net",
-    "mstdn.ofraglapis.net",
-    "mstdn.omer.land",
-    "mstdn.omisosiru.net",
-    "mstdn.one",
-    "mstdn.online",
-    "mstdn.osaka",
-    "mstdn.osfree.org",
-    "mstdn.otyakai.xyz",
-    "mstdn.paparasitic.com",
-    "mstdn.party",
-    "mstdn.patatas.ca",
-    "mstdn.penguinhub.org",
-    "mstdn.pentaprogram.tokyo",
-    "mstdn.pepepper.net",
-    "mstdn.philia.work",
-    "mstdn.plus",
-    "mstdn.plusminus.io",
-    "mstdn.pokete.com",
-    "mstdn.poyo.me",
-    "mstdn.progressiv.dev",
-    "mstdn.pulala.net",
-    "mstdn.qiyana.jp",
-    "mstdn.rcode.fi",
-    "mstdn.res.ac",
-    "mstdn.restall.io",
-    "mstdn.ringonegichikuwa.com",
-    "mstdn.rinsuki.net",
-    "mstdn.rkunkunr.com",
-    "mstdn.ro",
-    "mstdn.robw.me",
-    "mstdn.rosaceae.net",
-    "mstdn.rukin.me",
-    "mstdn.ryanak.xyz",
-    "mstdn.s7t.de",
-    "mstdn.sagami-yashiro.net",
-    "mstdn.sastudio.jp",
-    "mstdn.schoolidol.club",
-    "mstdn.science",
-    "mstdn.sekirrworks.dev",
-    "mstdn.sengenzakura.com",
-    "mstdn.shalyu.run",
-    "mstdn.shihoya.tokyo",
-    "mstdn.shinkaifan.com",
-    "mstdn.shinminato.com",
-    "mstdn.sidh.bzh",
-    "mstdn.sirmaple.ca",
-    "mstdn.smbd.jp",
-    "mstdn.social",
-    "mstdn.social.setsuzokustudio.com",
-    "mstdn.soine.site",
-    "mstdn.soysoftware.net",
-    "mstdn.spin-off.com",
-    "mstdn.sssc.cc",
-    "mstdn.starnix.network",
-    "mstdn.strafpla.net",
-    "mstdn.stroan.net",
-    "mstdn.studiofreesia.com",
-    "mstdn.sublimer.me",
-    "mstdn.superspeed-fall.com",
-    "mstdn.swiso.org",
-    "mstdn.syoshida.org",
-    "mstdn.sysinfra.info",
-    "mstdn.syui.ai",
-    "mstdn.t-rg.ws",
-    "mstdn.tacowolf.net",
-    "mstdn.taiha.net",
-    "mstdn.takuya-a.net",
-    "mstdn.tamag.org",
-    "mstdn.team-rescue.com",
-    "mstdn.teamblow.jp",
-    "mstdn.ten4ward.social",
-    "mstdn.tentonic.de",
-    "mstdn.test.emacsen.net",
-    "mstdn.tharyrok.eu",
-    "mstdn.thms.uk",
-    "mstdn.thndl.com",
-    "mstdn.thymefield.jp",
-    "mstdn.tian-shen.pro",
-    "mstdn.tivy.work",
-    "mstdn.toad-in-the-hole.net",
-    "mstdn.tokyocameraclub.com",
-    "mstdn.tomokiwakimoto.com",
-    "mstdn.toonspell.net",
-    "mstdn.toya.blog",
-    "mstdn.twst.me",
-    "mstdn.uec.tokyo",
-    "mstdn.unasuke.com",
-    "mstdn.uno",
-    "mstdn.v-elf.com",
-    "mstdn.vientos.live",
-    "mstdn.virtecam.net",
-    "mstdn.vodka",
-    "mstdn.wasamon.org",
-    "mstdn.whitepig.net",
-    "mstdn.wildtree.jp",
-    "mstdn.wiper.dev",
-    "mstdn.wtsnjp.com",
-    "mstdn.xicon.eu",
-    "mstdn.xn--b4h400bgey186p.st",
-    "mstdn.xophoros.com",
-    "mstdn.y-zu.org",
-    "mstdn.yaesu-eas.tokyo",
-    "mstdn.yakitamago.info",
-    "mstdn.yamaken.jp",
-    "mstdn.yishibashi.me",
-    "mstdn.ys217.tokyo",
-    "mstdn.ysnr5102.com",
-    "mstdn.ything.xyz",
-    "mstdn.yue-kichi.world",
-    "mstdn.yuicho.net",
-    "mstdn.yurutan.net",
-    "mstdn.zeku.org",
-    "mstdn.zoddo.fr",
-    "mstdn2.ht164.jp",
-    "mstdon.com",
-    "mstest.uid0.hu",
-    "mstn.apps4net.eu",
-    "mstn.rayven.mx",
-    "msto.sukara.dev",
-    "msz.baz.bar",
-    "mt.abscue.de",
-    "mt.amethyst.moe",
-    "mt.shc.kanagawa.jp",
-    "mtd.ax9.eu",
-    "mtd.bashell.com",
-    "mtd.coffee.link",
-    "mtd.dgs.town",
-    "mtd.grandcoeff.bzh",
-    "mtd.naraku.cc",
-    "mtd.nekonohige.jp",
-    "mtd.pythonasia.org",
-    "mtd.sysblog.at",
-    "mtd.task.vc",
-    "mtd.usagi-gumi.jp",
-    "mtdn.anyqn.com",
-    "mtdn.level8tech.com",
-    "mtdn.saprayworld.com",
-    "mtg.garden",
-    "mtgjudge.social",
-    "mthie.net",
-    "mtl.rocks",
-    "mtyp.in",
-    "mu-ori.me",
-    "mu.conn.rs",
-    "mu.zaitcev.nu",
-    "mublog.nl",
-    "mudhut.social",
-    "muenchen.social",
-    "muenster.im",
-    "muensterland.social",
-    "muenzl.net",
-    "mugicha.club",
-    "muknown.jp",
-    "mulberryphotowerx.social",
-    "multicorp.properties",
-    "multiplayer-notepad.net",
-    "mumm.pepecyb.de",
-    "muon.social",
-    "muri.network",
-    "murraydata.uk",
-    "musa.rocks",
-    "musain.cafe",
-    "muscula.aa0.netvolante.jp",
-    "musee.social",
-    "museum.community",
-    "music-social.com",
-    "music.benzianium.ch",
-    "music.social",
-    "musicdn.jp",
-    "musician.social",
-    "musicians.today",
-    "musicworld.social",
-    "musik.mauer-park.de",
-    "muslim.social",
-    "muslimsorganize.masto.host",
-    "muso.social",
-    "mustard.blog",
-    "mustardon.tokyo",
-    "mustel.id",
-    "mustodon.kattsu.com",
-    "mutant.cz",
-    "mutant.pizza",
-    "mutual.tls.zone",
-    "muuzikku.produkti.se",
-    "muzzlespace.com",
-    "mwtaylor.social",
-    "mx.pontual.social",
-    "mxin.org",
-    "mxtthxw.art",
-    "my-create.art",
-    "my-spaces.social",
-    "my.diligiant.com",
-    "my.dolezal.one",
-    "my.elven.pw",
-    "my.lono.space",
-    "my.myrmidon.social",
-    "my.privacymatters.pro",
-    "my.talesofmy.life",
-    "my0.net",
-    "myapple.social",
-    "mycrowd.ca",
-    "mydo.meme",
-    "myf.one",
-    "myfriendsare.gay",
-    "myglobal.site",
-    "myhobby.zone",
-    "myke.social",
-    "mylittlenut.com",
-    "myna.social",
-    "myonlinepi.uk",
-    "myopic.one",
-    "myprivate.social",
-    "myside-yourside.net",
-    "mysmallinstance.homelinux.org",
-    "mysocial.community",
-    "mysportgallery.com",
-    "mystech.ink",
-    "mystic-cave.zone",
-    "mysticaccess.online",
-    "mystical.garden",
-    "mystickynotes.com",
-    "mytoot.de",
-    "mytoot.net",
-    "mytter.jp",
-    "myxoz.port0.org",
-    "mzn-potatochips.me",
-    "n-odes.social",
-    "n.kdecherf.com",
-    "n.noxexcelsis.online",
-    "n00b.fr",
-    "n0m.de",
-    "n3trunn3r.org",
-    "na.social",
-    "naapurinpoika.com",
-    "naarm.social",
-    "nacchan.ca",
-    "nacq.me",
-    "nafo.army",
-    "nafo.uk",
-    "nagoyadon.jp",
-    "nahe.social",
-    "naked.dequbed.space",
-    "nalocal519.social",
-    "namelesscitizen.space",
-    "namknat.win",
-    "nanakumo.xyz",
-    "nanao.cybtex.fr",
-    "nanasina.com",
-    "nangang.travnewmatic.com",
-    "nanitebased.club",
-    "nannerpuss.club",
-    "nanobyte.cafe",
-    "nantabe.fedicity.net",
-    "nap.social",
-    "narf.social",
-    "narikiri.hostdon.ne.jp",
-    "narrativ.es",
-    "nasface.cz",
-    "nashtodon.com",
-    "nasnfl.com",
-    "nastycandy.com",
-    "natestodon.social",
-    "nathalie.social",
-    "nationalist.social",
-    "natsu.page",
-    "natter.wtf",
-    "natterati.com",
-    "natudon-fishing.net",
-    "naturalstate.social",
-    "naturtrunken.de",
-    "nautical.social",
-    "navisocial.club",
-    "nayukana.info",
-    "nbaden.club",
-    "nblo.ws",
-    "nc.social",
-    "ncbt.space",
-    "ncc1701e.social",
-    "ncpb.social",
-    "ndrgrnd.social",
-    "ne.codes",
-    "nebbia.fail",
-    "nebu.social",
-    "nebula.borj.org",
-    "nebula.neo7.kim",
-    "neckarwie.se",
-    "nederland.online",
-    "nedludd.social",
-    "neenster.org",
-    "neet.social",
-    "nefmolojten.anqou.net",
-    "negative.social",
-    "negino.social",
-    "neighborli.xyz",
-    "neilturner.me.uk",
-    "nein.club",
-    "nejiamasi.com",
-    "neko.academy",
-    "neko.cat",
-    "neko.computer",
-    "nekocave.xyz",
-    "nekoland.fangluo.top",
-    "nekonote.fedicity.net",
-    "nekonya.nekosnowy.moe",
-    "nekos.cloud",
-    "nekosat.work",
-    "nekton.social",
-    "nelkat.net",
-    "nelson.fun",
-    "nelson.social",
-    "nemargut.com",
-    "nemtie.net",
-    "nemushee.net",
-    "neo.bella-barmbek.de",
-    "neo.gyara.moe",
-    "neo.knzk.me",
-    "neodb.social",
-    "neomobius.com",
-    "neon.nightbulb.net",
-    "neonsoup.house",
-    "neontechnica.lol",
-    "neos.social",
-    "neovibe.app",
-    "neph.social",
-    "nerd-gemein.de",
-    "nerd.megahuge.com",
-    "nerd.town",
-    "nerdcast.space",
-    "nerdcore.social",
-    "nerdculture.de",
-    "nerdfoo.dev",
-    "nerdica.net",
-    "nerdistan.cloud",
-    "nerdjoy.social",
-    "nerdout.club",
-    "nerdstadt.de",
-    "nerdynate.io",
-    "nere.social",
-    "net.mastodontrends.com",
-    "net4sw.com",
-    "netauthority.org",
-    "netcup.cafe",
-    "netcup.social",
-    "netfg.net",
-    "nether-orchid.top",
-    "netmonkey.xyz",
-    "netmynd.org",
-    "netshrimp.jeder.pl",
-    "netsphere.one",
-    "netstream.media-techport.de",
-    "network.aipioneers.org",
-    "network.blackwhitemint.de",
-    "networker.social",
-    "networkteam.social",
-    "netz.darknight-coffee.org",
-    "netzkms.de",
-    "netzsphaere.xyz",
-    "netzverpetzer.de",
-    "neubau.social",
-    "neuland.social",
-    "neuro.cooking",
-    "neurodifferent.me",
-    "neurodiversity-in.au",
-    "neurology.social",
-    "neuromatch.social",
-    "neuropunks.org",
-    "neuroqueer.net",
-    "neuroscience-mastodon.com",
-    "neuss.social",
-    "neuzerling.com",
-    "never.legalizenuclearbombs.com",
-    "neverhill.social",
-    "neverland.shiningcube.top",
-    "neverwhe.re",
-    "neverwhere.social",
-    "newan.net",
-    "newmusic.social",
-    "newnet.live",
-    "news.ganeshapress.net",
-    "newsbots.californialocal.com",
-    "newsie.social",
-    "newsletter.mobileatom.net",
-    "newsmast.community",
-    "newsmast.social",
-    "newspapers.se",
-    "newwest.social",
-    "nexific.social",
-    "nexorium.social",
-    "next.e2net.social",
-    "next.iceshrimp.dev",
-    "nextham.duckdns.org",
-    "nextpayge.social",
-    "nexus.kraut.press",
-    "nexusofnerd.org",
-    "nexxis.online",
-    "nfb.social",
-    "nfdi.social",
-    "nfld.me",
-    "nfld.social",
-    "nfra.club",
-    "ng.cathoderay.tube",
-    "ngmx.com",
-    "ngrdk.fedicity.net",
-    "nhs69ers.com.au",
-    "nhw.social",
-    "ni.hil.ist",
-    "niagara.social",
-    "nicagram.com",
-    "nicaloro.com",
-    "nicecrew.digital",
-    "nicht-so.social",
-    "nickslaney.net",
-    "nicoban.one",
-    "nicolas.social",
-    "nicuverse.org",
-    "niederbayern.social",
-    "niedersachsen.social",
-    "nigga.academy",
-    "nightcity.bar",
-    "nightcord.de",
-    "nightly.fedibird.com",
-    "nightly.owncast.tv",
-    "nightshift.social",
-    "niice.social",
-    "nijinofune.com",
-    "nikayin.social",
-    "nikkel.xyz",
-    "niklas.social",
-    "nikomidon.fedicity.net",
-    "nileane.fr",
-    "nine.land",
-    "nineworlds.social",
-    "ninplayback.world",
-    "nitech.online",
-    "nitecrew.rip",
-    "nitiasa.com",
-    "nix.ac",
-    "nixeneko.info",
-    "nixer.info",
-    "nixie.name",
-    "nixnet.social",
-    "nixorigin.one",
-    "nixos.paris",
-    "njalla.social",
-    "njcp.uk",
-    "njust.club",
-    "nkantar.social",
-    "nlogic.systems",
-    "nluug.social",
-    "nlyze.net",
-    "nnia.cc",
-    "nnia.space",
-    "nnmdon.com",
-    "no-outlet.com",
-    "no-pony.farm",
-    "no.run.place",
-    "noagendasocial.com",
-    "noagendasocial.nl",
-    "noam.social",
-    "noauthority.social",
-    "nobert.zone",
-    "noc.social",
-    "noclick.se",
-    "noctalgia.space",
-    "nocte.0am.jp",
-    "noctua.social",
-    "nocturne.cx",
-    "node.isonomia.net",
-    "nodespace.social",
-    "nodotsam.com",
-    "nodutiesowed.com",
-    "noeldemartin.social",
-    "noexce.pt",
-    "nofan.xyz",
-    "nofed01.heguro.com",
-    "nofun.social",
-    "nogafam.zone",
-    "nohopers.xyz",
-    "noise.j-w.au",
-    "noisy-lab.com",
-    "noitl.space",
-    "nojack.easydns.ca",
-    "nojober.work",
-    "nokinoki.net",
-    "nolabooks.social",
-    "nolineage.com",
-    "nologo.social",
-    "nom.apronbrothers.cooking",
-    "nomadic.social",
-    "nomanssky.social",
-    "non-designer.studio",
-    "nona.social",
-    "nonbiridon.hostdon.ne.jp",
-    "noncorporate.network",
-    "nondeterministic.computer",
-    "none.com",
-    "nonentity.fedicity.net",
-    "nonexiste.net",
-    "nonexistent.ca",
-    "nongrata.social",
-    "nonomastodon.redirectme.net",
-    "nonprofits.masto.host",
-    "nonsense.direct",
-    "nonsequiturs.social",
-    "nonsocialand.space",
-    "nonzero.social",
-    "noodle.social",
-    "noods.fun",
-    "noot.noot.cloud",
-    "noot.pingu4.me",
-    "noquieromierdas.com",
-    "nora.social",
-    "norbertmarteau.fr",
-    "norcal.social",
-    "norden.social",
-    "nordicshutter.com",
-    "norfolk.social",
-    "normal.style",
-    "normalunicorn.com",
-    "norrebro.space",
-    "norse.social",
-    "northlandia.net",
-    "northofthewall.social",
-    "norwoodzero.net",
-    "nos.pub",
-    "nosh.ultramookie.com",
-    "nosocialnet.work",
-    "nostalghia.xyz",
-    "nostream.mastodon.uno",
-    "noswipe.se",
-    "not-ok.computer",
-    "not-very.social",
-    "not.an.evilcyberhacker.net",
-    "not.iee.engineer",
-    "not.nobelium.xyz",
-    "notacult.social",
-    "notasquirrel.dev",
-    "notbird.app",
-    "notbook.club",
-    "notclickable.social",
-    "note.computer",
-    "notes.chatopera.com",
-    "notes.whatthefuck.computer",
-    "nothankyou.hostdon.ne.jp",
-    "nothing.tacowolf.net",
-    "nothingburger.club",
-    "notify.mstdn.wiki",
-    "notiz.blog",
-    "notmyfavourite.one",
-    "notnow.dev",
-    "notnull.click",
-    "notnull.space",
-    "noto.social",
-    "notorious.gay",
-    "notpickard.com",
-    "notroot.online",
-    "notsocial.chronostase.net",
-    "nottwitter.puhtahtoe.com",
-    "notvery.social",
-    "notwork.in",
-    "noutori.space",
-    "nova.community",
-    "novaloop.social",
-    "noventech.social",
-    "novo-atlantis.null.media",
-    "nowheycreamery.com",
-    "nowplaying.radiofreefedi.net",
-    "noxon.cc",
-    "nozzi.social",
-    "npf.moe",
-    "nrg2.net",
-    "nrkn.fr",
-    "nro.io",
-    "nrw.social",
-    "nsfw.finance",
-    "nsfw.lehtiin.eu",
-    "nsfw.social",
-    "nsfw.wnymathguy.com",
-    "nsfwphotography.social",
-    "nsinteger.com",
-    "nso.group",
-    "nt.mstdon.app",
-    "nth.io",
-    "ntks.crcr.works",
-    "nton.cx",
-    "nualmere.nl",
-    "nuernberg.social",
-    "nuked.social",
-    "nuklear.family",
-    "null.codes",
-    "null.ptr.fm",
-    "nulla8.stream",
-    "nullio.net",
-    "nullisland.social",
-    "nullpointer.org",
-    "nullspace.ie",
-    "nulltea.cc",
-    "nullwhere.social",
-    "nunes.uk",
-    "nunu.fedicity.net",
-    "nutmeg.social",
-    "nuvem.lgbt",
-    "nuwardia.xyz",
-    "nuwasocial.com",
-    "nwb.social",
-    "nx12.net",
-    "nxt.social",
-    "nya.coffee",
-    "nya.house",
-    "nya.lemonade.moe",
-    "nya.otter.sh",
-    "nyan.live",
-    "nyan.lol",
-    "nyan.mdn.hinaloe.net",
-    "nyan.network",
-    "nyan.pics",
-    "nyanya.net",
-    "nycity.social",
-    "nycr.social",
-    "nyxa.jojess.net",
-    "o.bar.fo",
-    "o.jen.im",
-    "o0o.social",
-    "o3o.ca",
-    "oak.social",
-    "obak-key.com",
-    "obapom.work",
-    "oberberg.nrw",
-    "obeya.social",
-    "objc.social",
-    "obscura-px.work",
-    "observatory.social",
-    "obsidianmoon.com",
-    "obufalus.jp",
-    "oc.todon.fr",
-    "oc.unyu.live",
-    "ocalaavenue.net",
-    "occitania.social",
-    "occitanie-decroissance.info",
-    "occm.cc",
-    "occommu.xyz",
-    "occult.institute",
-    "occult.town",
-    "ocean.herry001.cc",
-    "oceanplayground.social",
-    "oceanvibe.nz",
-    "ocf.masto.host",
-    "octodon.social",
-    "ocw.social",
-    "odakyu.app",
-    "oddballs.online",
-    "oddprocess.social",
-    "odenwald.social",
-    "odon.mast.zone",
-    "odragaover.de",
-    "oe-doutoku.net",
-    "of.rijndael.cc",
-    "offanon.masto.host",
-    "official.community",
-    "official.resource.org",
-    "officiell-info.se",
-    "offroad.town",
-    "ofplayers.net",
-    "oft.social",
-    "ofurodon.com",
-    "ofuton.io",
-    "oh-hi.social",
-    "oh.mastocaz.zone",
-    "ohai.social",
-    "ohay.ooo",
-    "ohbear.wtf",
-    "ohelig.me",
-    "ohgodohfuck.fraudulent.link",
-    "ohjames.eu",
-    "ohnepunktundkomma.org",
-    "ohnoim.online",
-    "ohrj.social",
-    "ohsan.cc",
-    "oisaur.com",
-    "oita.blue",
-    "ok.programmer.town",
-    "okapi.website",
-    "okcinfo.news",
-    "okde.me",
-    "okla.social",
-    "okpeace.org",
-    "ol-tele.com",
-    "ol2ol.com",
-    "olching.social",
-    "old.mermaid.town",
-    "old.sharlayan.city",
-    "oldbytes.space",
-    "oldeink.net",
-    "oldfriends.live",
-    "oldinternet.net",
-    "oldos.me",
-    "oldpeople.cafe",
-    "oldruts.masto.host",
-    "olender.me",
-    "olia.geocities.institute",
-    "olifant.fi",
-    "oliphant.social",
-    "oliphaunt.social",
-    "oma.xy-space.de",
-    "omani.social",
-    "omemoji.net",
-    "omfg.town",
-    "omg.sayitditto.net",
-    "omg.wtf.sh",
-    "omglol.fun",
-    "omgwars.com",
-    "omnitest.social",
-    "omochi.xyz",
-    "omoro.info",
-    "omusubi.ayarika.com",
-    "on.ixvd.net",
-    "on1000mark.club",
-    "onboardthefilm.community",
-    "ondergrond.org",
-    "one.darnell.one",
-    "one.telmina.com",
-    "onemorestop.photo",
-    "onenerdarmy.net",
-    "onephoto.club",
-    "onepicaday.com",
-    "onewilshire.la",
-    "onion.social",
-    "onionslices.social",
-    "onisoc.xyz",
-    "onjase.quebec",
-    "online-marketing.social",
-    "onlineofflinesocial.inet.place",
-    "onlyarts.social",
-    "onlybsds.com",
-    "onlycasino.legal",
-    "onlycosplays.social",
-    "onlyfeds.cc",
-    "onlyfranz.com",
-    "onlyfriends.social",
-    "onlynugs.net",
-    "onmasto.com",
-    "ono-sendai.jevidl.net",
-    "onpartage.autroisieme.top",
-    "onsbos.hopto.org",
-    "onya.social",
-    "onycha.monster",
-    "ooe.social",
-    "oogy.club",
-    "oomfie.city",
-    "oomfie.world",
-    "ooo.eidantoei.org",
-    "oopsall.gay",
-    "oour.org",
-    "oozuze.social",
-    "opalstack.social",
-    "opayq.social",
-    "open-source-eschaton.net",
-    "open3dlab.social",
-    "openbiblio.social",
-    "opencoaster.net",
-    "openedtech.social",
-    "opennieuwsbank.nl",
-    "openrealm.org",
-    "opensalon.social",
-    "openshare.me",
-    "openshores.co.uk",
-    "opensimsocial.com",
-    "opensocial.at",
-    "opensocial.media",
-    "opensource.network",
-    "openstringshow.com",
-    "opinuendo.com",
-    "opsone.social",
-    "oraclearm.nsupdate.info",
-    "oransns.com",
-    "orbiscognito.com",
-    "orbital.horse",
-    "orbitalstation.one",
-    "orbsafe.masto.host",
-    "orc.forest.hostdon.ne.jp",
-    "orc.social",
-    "orchard.social",
-    "orctavern.pub",
-    "ordinary.cafe",
-    "orfodon.org",
-    "ori.social",
-    "origami.community",
-    "originstory.coffee",
-    "orikumi.social",
-    "orionfoundation.masto.host",
-    "orlovsky.online",
-    "orphaned.monster",
-    "orreadi.com",
-    "ors.novababilonia.me",
-    "orthis.social",
-    "orwell.fun",
-    "orx.me",
-    "orz.uno",
-    "osada.gidikroon.eu",
-    "osadl.social",
-    "osaka.myxoz.port0.org",
-    "osakanacreate.com",
-    "osbar.space",
-    "osintua.eu",
-    "osintunleashed.masto.host",
-    "oslo.town",
-    "osmcast.social",
-    "osna.social",
-    "ostalb.social",
-    "ostatus.ikeji.ma",
-    "ostatus.isidai.com",
-    "ostatus.lardbucket.org",
-    "ostatus.shade3d.jp",
-    "ostatus.taiyolab.com",
-    "osten.social",
-    "ostfrie.se",
-    "ostfrieslnd.social",
-    "ostheater.city",
-    "otadon.com",
-    "otakufarms.com",
-    "otlab.dev",
-    "otogamer.me",
-    "otoge.ch",
-    "otokono.co",
-    "otome.xyz",
-    "otonadon.hostdon.ne.jp",
-    "otoya.space",
-    "otp.akkoma.dev",
-    "otr.rocks",
-    "ots.social",
-    "ottawa.place",
-    "ottawaks.us",
-    "otter.cx",
-    "otter.garden",
-    "otter.tube",
-    "oubliette.city",
-    "ouin.land",
-    "oulipo.dev.rizoma1.ar",
-    "oulipo.social",
-    "our-town.social",
-    "our.betternetwork.us",
-    "our.blahaj.date",
-    "our.devchatter.com",
-    "ourdoma.in",
-    "ourempty.pub",
-    "ourislandgeorgia.net",
-    "ouroboros.gay",
-    "oursaintfrancis.org",
-    "ourselves.space",
-    "oursky.social",
-    "ourtribeonline.com",
-    "ous-unofficial-social.com",
-    "out.ruin.io",
-    "outdoorenthusiasts.space",
-    "outer.spaceandtim.es",
-    "outergod.art",
-    "outerheaven.club",
-    "outerspace.place",
-    "outmo.de",
-    "outre.social",
-    "outside.ofa.dog",
-    "outskirts.town",
-    "outwith.biz",
-    "oval.cc",
-    "over9k.tech",
-    "overcomplicated.systems",
-    "overgrown.garden",
-    "overkill.social",
-    "overland.social",
-    "ow3.cn",
-    "owncast.alphawaveradio.co.uk",
-    "owncast.asmodeus.org",
-    "owncast.bowlafterbowl.com",
-    "owncast.c3d2.de",
-    "owncast.cavestri.net",
-    "owncast.codingneko.com",
-    "owncast.cryptoschizo.club",
-    "owncast.deadtom.me",
-    "owncast.djbrine1.ru",
-    "owncast.dragonslave.de",
-    "owncast.everythingbut.fish",
-    "owncast.fireglow.de",
-    "owncast.funcube.space",
-    "owncast.heavymusic.rocks",
-    "owncast.heckin.how",
-    "owncast.hufman.me",
-    "owncast.kemonine.info",
-    "owncast.lab.how",
-    "owncast.mattjon.es",
-    "owncast.mitch.science",
-    "owncast.mizah.xyz",
-    "owncast.msoddfox.xyz",
-    "owncast.mxks.dj",
-    "owncast.nextgamers.eu",
-    "owncast.privateger.me",
-    "owncast.racheklos.com",
-    "owncast.rafal06.dev",
-    "owncast.rennerocha.com",
-    "owncast.retronerd.at",
-    "owncast.robflop.me",
-    "owncast.scrubbles.tech",
-    "owncast.small-web.org",
-    "owncast.svc.0x0a.network",
-    "owncast.teklynk.com",
-    "owncast.tffppodcast.com",
-    "owncast.tuiter.ovh",
-    "owncast.undrground.org",
-    "owncast.voidconspiracy.com",
-    "owncast.xylinvale.space",
-    "owns.com",
-    "owo.cafe",
-    "owo.ff15.eu",
-    "owo.is",
-    "owo.rs",
-    "owo.sg",
-    "owo.town",
-    "owocrafts.logzinga.com",
-    "oxytodon.com",
-    "oyasumi.space",
-    "oye.social",
-    "ozhika.me",
-    "ozlabs.house",
-    "p-dev.net",
-    "p.7shiro.com",
-    "p.antsu.net",
-    "p.ashiato45.net",
-    "p.bg.sb",
-    "p.changeme.fr.eu.org",
-    "p.enes.lv",
-    "p.falai.se",
-    "p.floyd.dk",
-    "p.girlc.at",
-    "p.gow.fr",
-    "p.kretschmann.social",
-    "p.median.moe",
-    "p.mr64.net",
-    "p.mrzm.io",
-    "p.nextgeimu.net",
-    "p.node.pk",
-    "p.palindro.me.uk",
-    "p.phundrak.com",
-    "p.rhinoworks.info",
-    "p.run-girls.run",
-    "p.sugar-free-jazz.com",
-    "p.testitfor.me",
-    "p.tfk.one",
-    "p.tkw.fm",
-    "p.tty7.uk",
-    "p.umbriel.fr",
-    "p.vinchent.xyz",
-    "p.xnu.kr",
-    "p1337.dev",
-    "p3.macgirvin.com",
-    "p42.social",
-    "pachy.youshallnotpass.com",
-    "pachyder.me",
-    "pachyderm.robertwatts.com",
-    "packetfactory.social",
-    "packmates.org",
-    "pacmanfan.co.nz",
-    "pad.venzano.fr",
-    "pagan.plus",
-    "page.lgbt",
-    "pageofwords.com",
-    "pajcevina.net",
-    "paktodon.asia",
-    "pal.camp",
-    "palau.pro",
-    "palindro.me.uk",
-    "palinoia.xyz",
-    "palm.weboslives.eu",
-    "palmsy.club",
-    "pan.rent",
-    "panatropic.social",
-    "pancake.masto.host",
-    "pancake.place",
-    "pandapla.net",
-    "pandas.social",
-    "pandoli365.com",
-    "pangu.hengsha.host",
-    "pantsfree.cc",
-    "panzner.net",
-    "pao.fusagi.com",
-    "pao.moe",
-    "paopu.social",
-    "paperbay.org",
-    "paperjale.eus",
-    "paquita.masto.host",
-    "paramira.org",
-    "parasocial.network",
-    "paravielfalt.zone",
-    "parcero.bond",
-    "pardal.agoranet.info",
-    "parens.social",
-    "parez.ca",
-    "parfait.day",
-    "parkfans.network",
-    "parody.town",
-    "parrygod.club",
-    "pars.ee",
-    "parsa.transmom.love",
-    "parsec.social",
-    "parta.ge",
-    "partageflex.com",
-    "particle.lol",
-    "party.radiofreefedi.net",
-    "partyon.xyz",
-    "partyparrot.social",
-    "paskell.social",
-    "passive.edtrots.com",
-    "pasta.social",
-    "pastafaristes.fr",
-    "patashnik.club",
-    "patavium.social",
-    "patchouli.today",
-    "patchwork.online",
-    "pate.social",
-    "patelish.org",
-    "patesadon.com",
-    "pateti.co",
-    "patogh.co",
-    "patriciadrive.com",
-    "patrick.social",
-    "patriot.online",
-    "pauljacobson.me",
-    "paupau.masto.host",
-    "pavlik.top",
-    "paw.best",
-    "paw.photo",
-    "pawb.fun",
-    "pawoo.net",
-    "paws.moe",
-    "paws.press",
-    "paws.town",
-    "paxation.info",
-    "payravi.xyz",
-    "pb.craignt.com",
-    "pb.todon.de",
-    "pbs.idv.tw",
-    "pccl.me",
-    "pcgamer.social",
-    "pcgaming.club",
-    "pcwizards.nl",
-    "pdx.land",
-    "pdx.masto.host",
-    "pdx.sh",
-    "pdx.social",
-    "peak.pub",
-    "peal.mydns.jp",
-    "peasej.me",
-    "pebble.social",
-    "pech.tech",
-    "peck.li",
-    "peculiar.florist",
-    "pedestal.social",
-    "peep.anca.tv",
-    "peering.social",
-    "peertubetest.owncast.tv",
-    "peerverse.space",
-    "pegelinux.top",
-    "peister.org",
-    "pellicule.bim.land",
-    "penfount.social",
-    "peninsula.industries",
-    "pennytucker.social",
-    "pentacop.moellus.net",
-    "people.awayfrompeople.com",
-    "people.unfoo.net",
-    "peoplegroup.social",
-    "peoplemaking.games",
-    "pepple.us",
-    "perfect.moe",
-    "perfumefan.jp",
-    "perish.restricted.garden",
-    "perkins.pub",
-    "perl.social",
-    "permaculture.masto.host",
-    "persadon.com",
-    "persia.social",
-    "persiansmastodon.com",
-    "personal.community",
-    "pertsch.social",
-    "pet.tax",
-    "petbutler.club",
-    "peter0x48.social",
-    "petersen.social",
-    "peterwenz.net",
-    "petlover.eu.org",
-    "petronel.info",
-    "petroskowo.pl",
-    "petrous.vislae.town",
-    "pets.contact",
-    "pf.gogreenit.net",
-    "pf.nobl.ink",
-    "pf.r8z.us",
-    "pf.tomlawson.io",
-    "pfadi.social",
-    "pfalz.social",
-    "pfed.sbcloud.cc",
-    "pfeed.ayotocorp.com",
-    "pfefferle.org",
-    "pfeifling.de",
-    "pff.o.hina.dev",
-    "pfft.lol",
-    "pflegezirkus.de",
-    "pftest2.anotherfauxtographer.com",
-    "pgh.social",
-    "pha.one",
-    "phalanstere.social",
-    "phantomthieves.net",
-    "phar.social",
-    "phediverse.social",
-    "phenomena.oksocial.net",
-    "phh.me",
-    "philately.social",
-    "philipjohn.social",
-    "philiptalk.berwanger-and-kin.com",
-    "phillips.fun",
-    "philly.vs-the.world",
-    "philos.fkn-systems.de",
-    "philpot.org",
-    "phire.place",
-    "pho.social",
-    "phocks.eu.org",
-    "phone.floofy.city",
-    "phonetown.net",
-    "photo.akunyiba.net",
-    "photo.ergedd.com",
-    "photo.horslimites.org",
-    "photo.kevread.fr",
-    "photo.lapineige.fr",
-    "photo.sarsworld.eu",
-    "photo.syslog.eu",
-    "photocave.net",
-    "photodn.net",
-    "photofed.world",
-    "photofeed.social",
-    "photog.social",
-    "photography.social.pekkasipila.com",
-    "photolovers.net",
-    "photon.surf",
-    "photos.4f9e1738.ignorelist.com",
-    "photos.adlerhorst.net",
-    "photos.apokrupha.com",
-    "photos.brokenbydesign.org",
-    "photos.communitymedia.video",
-    "photos.cookiefan.club",
-    "photos.deathbycomputers.co.uk",
-    "photos.festivalparminous.org",
-    "photos.heath.social",
-    "photos.inclusion.cc",
-    "photos.kurau.tokyo",
-    "photos.mattbowen.net",
-    "photos.mroberts.me",
-    "photos.nvitucci.social",
-    "photos.peacememori.es",
-    "photos.racf.guru",
-    "photos.sprig.gs",
-    "photos.thefishermenandthepriestess.com",
-    "photos.tsrats.net",
-    "photos.xavs.ca",
-    "photosharing.work",
-    "phouon.com",
-    "phparch.social",
-    "phpc.social",
-    "phx.pub",
-    "phx.zct-mrl.com",
-    "phyrexia.ru",
-    "physchem.science",
-    "physfluids.fr",
-    "physics.social",
-    "physik.cool",
-    "phystown.ravenholm.club",
-    "pi.dead.guru",
-    "pi4li.social",
-    "piaf.stilobique.com",
-    "piaille.fr",
-    "piano.masto.host",
-    "piazza.today",
-    "pic.fossdle.org",
-    "pic.krashboyz.org",
-    "pic.kukernetes.se",
-    "pic.mascodon.jp",
-    "picfeed.beatty.family",
-    "piconic.co",
-    "pics.80px.com",
-    "pics.brocolis.party",
-    "pics.chez.gay",
-    "pics.chiefgyk3d.com",
-    "pics.gayfr.online",
-    "pics.houba.rocks",
-    "pics.ourselves.space",
-    "pics.rys.io",
-    "pics.voiceover.bar",
-    "picto.anartist.org",
-    "pictochat.net",
-    "pictogram.social",
-    "picture.veen.world",
-    "pictureofreality.com",
-    "pictures.yidhra.farm",
-    "pidibi.com",
-    "pie.gd",
-    "pierce.xyz",
-    "piero.bosio.info",
-    "pieville.net",
-    "pigeon.place",
-    "pigeons.club",
-    "piggo.space",
-    "piggy.lol",
-    "piipitin.fi",
-    "piko.social",
-    "pikopiko.party",
-    "pilote.me",
-    "pink.7d.gg",
-    "pinkorange.red",
-    "pinksheep.org",
-    "pinnipedia.fedicity.net",
-    "piou.foolbazar.eu",
-    "pioupiou.social",
-    "pipou.academy",
-    "pippo.dev",
-    "piracy.zip",
-    "piratasdelcaribe.xyz",
-    "pirated.mobi",
-    "piraten-holzminden.de",
-    "piraten-partei.social",
-    "piratenpartei.social",
-    "pirateradio.social",
-    "pirati.ca",
-    "piupiupiu.com.br",
-    "pix.0m.ax",
-    "pix.3zi.ru",
-    "pix.7shiro.com",
-    "pix.9wd.eu",
-    "pix.anduin.net",
-    "pix.antiorario.it",
-    "pix.berdaguermontes.eu",
-    "pix.bothhands.ca",
-    "pix.brass.host",
-    "pix.calculate.social",
-    "pix.caselibre.fr",
-    "pix.closeuprussia.com",
-    "pix.darkou.fr",
-    "pix.diaspodon.fr",
-    "pix.domanske.de",
-    "pix.freiraumzittau.de",
-    "pix.gemnoc.ca",
-    "pix.gjermo.com",
-    "pix.glauca.space",
-    "pix.hackerbun.social",
-    "pix.io18.top",
-    "pix.ismus.net",
-    "pix.josh.tel",
-    "pix.kestrelsnest.social",
-    "pix.klein.ruhr",
-    "pix.konuro.net",
-    "pix.lalafell.org",
-    "pix.le-chat-a-velo.at",
-    "pix.mastodont.cat",
-    "pix.mattedwards.org",
-    "pix.metaversum.wtf",
-    "pix.mexibang.com",
-    "pix.miri64.xyz",
-    "pix.mornie.org",
-    "pix.multimob.be",
-    "pix.myrkit.com",
-    "pix.nah.re",
-    "pix.norcal.social",
-    "pix.norse.social",
-    "pix.oubliette.solutions",
-    "pix.pastwind.top",
-    "pix.rheall.me",
-    "pix.rousset.nom.fr",
-    "pix.s1gm4.eu",
-    "pix.saiyajin.space",
-    "pix.salocin.eu",
-    "pix.securelab.eu",
-    "pix.sekretaerbaer.net",
-    "pix.shikiryu.ovh",
-    "pix.shirtless.gay",
-    "pix.solarpunk.moe",
-    "pix.speakeasy.estate",
-    "pix.tedomum.net",
-    "pix.test.fedi.monster",
-    "pix.thedav.is",
-    "pix.thewalkingdeaf.social",
-    "pix.toot.wales",
-    "pix.travelpandas.eu",
-    "pix.ublog.tech",
-    "pix.unixcat.net",
-    "pix.urface.social",
-    "pix.webm.ink",
-    "pix.y-y.li",
-    "pix.yapbreak.fr",
-    "pixcture.com",
-    "pixel.3xd.eu",
-    "pixel.afop.social",
-    "pixel.aire.ml",
-    "pixel.aldiserver.de",
-    "pixel.alphonso.fr",
-    "pixel.archworks.co",
-    "pixel.art3mis.de",
-    "pixel.aschwege.me",
-    "pixel.baez.io",
-    "pixel.bascht.space",
-    "pixel.bimbiribase.xyz",
-    "pixel.bluemedia.dev",
-    "pixel.brettspielpony.de",
-    "pixel.cairobraga.com",
-    "pixel.chladny.de",
-    "pixel.cloud.nerdraum.de",
-    "pixel.cyano.at",
-    "pixel.d3fc0n.one",
-    "pixel.digitalesozialearbeit.de",
-    "pixel.diniscorreia.com",
-    "pixel.easter.fr",
-    "pixel.elbmatsch.de",
-    "pixel.everythingbagel.me",
-    "pixel.fabulousfabs.fr",
-    "pixel.fedifriends.social",
-    "pixel.fedisphere.net",
-    "pixel.fediverse.be",
-    "pixel.felunis.de",
-    "pixel.fenetre.dev",
-    "pixel.geor.gs",
-    "pixel.gruene.social",
-    "pixel.infosec.exchange",
-    "pixel.internationalotaku.com",
-    "pixel.jelliefrontier.net",
-    "pixel.johalla.org",
-    "pixel.kapteinis.lv",
-    "pixel.kitchen",
-    "pixel.krivokuca.dev",
-    "pixel.lauercloud.de",
-    "pixel.lecker.coffee",
-    "pixel.livellosegreto.it",
-    "pixel.maddie.info",
-    "pixel.mamutut.space",
-    "pixel.media-techport.de",
-    "pixel.melin.org",
-    "pixel.michel.uber.space",
-    "pixel.moahr.de",
-    "pixel.netzspielplatz.de",
-    "pixel.nobigtech.es",
-    "pixel.noff.co",
-    "pixel.nx-pod.de",
-    "pixel.pol.social",
-    "pixel.polli.social",
-    "pixel.pressthebutton.pw",
-    "pixel.redsnake.io",
-    "pixel.rhadamanthe.ch",
-    "pixel.rights.ninja",
-    "pixel.sadrarin.com",
-    "pixel.sendero.social",
-    "pixel.sharebright.net",
-    "pixel.skylinehub.live",
-    "pixel.sp-codes.de",
-    "pixel.stadel.win",
-    "pixel.strubbl.de",
-    "pixel.tarka.dev",
-    "pixel.tchncs.de",
-    "pixel.tiny-host.nl",
-    "pixel.tromdienste.de",
-    "pixel.uckermark.social",
-    "pixel.ventora.net",
-    "pixel.webschneider.org",
-    "pixel.whisper.tf",
-    "pixel.winklerfamilie.eu",
-    "pixel.xarxa.cloud",
-    "pixel.zentribe.social",
-    "pixelfassa.de",
-    "pixelfed.21314.de",
-    "pixelfed.3dcandy.social",
-    "pixelfed.aargaunet.ch",
-    "pixelfed.adamazing.de",
-    "pixelfed.aguiarvieira.pt",
-    "pixelfed.am-networks.fr",
-    "pixelfed.andreasrohner.dev",
-    "pixelfed.art",
-    "pixelfed.artsrn.ualberta.ca",
-    "pixelfed.au",
-    "pixelfed.automat.click",
-    "pixelfed.babb.no",
-    "pixelfed.babyl.ca",
-    "pixelfed.bachgau.social",
-    "pixelfed.badabam.net",
-    "pixelfed.belajkorpoj.art",
-    "pixelfed.bleh.au",
-    "pixelfed.bunix.de",
-    "pixelfed.calemooth.com",
-    "pixelfed.casually.cat",
-    "pixelfed.cat",
-    "pixelfed.catmargue.org",
-    "pixelfed.caylee.de",
-    "pixelfed.cc",
-    "pixelfed.co.za",
-    "pixelfed.coffeeandtrains.de",
-    "pixelfed.coupou.fr",
-    "pixelfed.crimedad.work",
-    "pixelfed.cyberveins.eu",
-    "pixelfed.cz",
-    "pixelfed.de",
-    "pixelfed.de.",
-    "pixelfed.debian.social",
-    "pixelfed.desmu.fr",
-    "pixelfed.dinn.ca",
-    "pixelfed.dk",
-    "pixelfed.dynlinux.io",
-    "pixelfed.eigenlab.org",
-    "pixelfed.ethibox.fr",
-    "pixelfed.eticadigital.eu",
-    "pixelfed.eu",
-    "pixelfed.eus",
-    "pixelfed.f4n.de",
-    "pixelfed.familie-jauss.de",
-    "pixelfed.festnoz.de",
-    "pixelfed.fftlt.net",
-    "pixelfed.fi",
-    "pixelfed.fixerupper.me",
-    "pixelfed.flawbee.net",
-    "pixelfed.fotosleben.art",
-    "pixelfed.fr",
-    "pixelfed.freespeech.club",
-    "pixelfed.furryfandom.me",
-    "pixelfed.gouacheairship.com",
-    "pixelfed.graz.social",
-    "pixelfed.hamdorf.org",
-    "pixelfed.hareware.xyz",
-    "pixelfed.heavyrubberslave.com",
-    "pixelfed.helvetet.eu",
-    "pixelfed.hirad.it",
-    "pixelfed.home.monsiteinternet.org",
-    "pixelfed.hostpath.de",
-    "pixelfed.hylobatidae.org",
-    "pixelfed.hyperfreedom.org",
-    "pixelfed.icedtux.no",
-    "pixelfed.imagisphe.re",
-    "pixelfed.in.ua",
-    "pixelfed.jannis-goeing.de",
-    "pixelfed.jascha.wtf",
-    "pixelfed.jonak.org",
-    "pixelfed.judesign.vision",
-    "pixelfed.kawakawa.fun",
-    "pixelfed.koehler.ca",
-    "pixelfed.kollar.cloud",
-    "pixelfed.kolosowscy.pl",
-    "pixelfed.kontrollapparat.de",
-    "pixelfed.l0g.is",
-    "pixelfed.lclsea.icu",
-    "pixelfed.louy.social",
-    "pixelfed.lovetux.net",
-    "pixelfed.lqx.net",
-    "pixelfed.lukepetrolekas.com",
-    "pixelfed.lundgrensjostrom.com",
-    "pixelfed.mags.ai",
-    "pixelfed.maplatefor.me",
-    "pixelfed.matias49.eu",
-    "pixelfed.mayer.rocks",
-    "pixelfed.media-techport.de",
-    "pixelfed.mediasculp.com",
-    "pixelfed.meerjungfrauengrotte.de",
-    "pixelfed.memeradio.org",
-    "pixelfed.mirwarso.de",
-    "pixelfed.moe",
-    "pixelfed.mrak.at",
-    "pixelfed.mrpetovan.com",
-    "pixelfed.mx",
-    "pixelfed.mywire.org",
-    "pixelfed.nakamura.io",
-    "pixelfed.nicolastissot.fr",
-    "pixelfed.noellabo.jp",
-    "pixelfed.nz",
-    "pixelfed.orko.it",
-    "pixelfed.pandainthecloud.de",
-    "pixelfed.pdx.social",
-    "pixelfed.photos",
-    "pixelfed.pix-n-chill.fr",
-    "pixelfed.podycust.co.uk",
-    "pixelfed.privatsocial.de",
-    "pixelfed.projetretro.io",
-    "pixelfed.qayamat.se",
-    "pixelfed.r3networks.uk",
-    "pixelfed.retronerd.at",
-    "pixelfed.rhetro.de",
-    "pixelfed.rittenserver.synology.me",
-    "pixelfed.rlp.schule",
-    "pixelfed.robertwatts.com",
-    "pixelfed.ru",
-    "pixelfed.rzgierskopp.de",
-    "pixelfed.s-w2.de",
-    "pixelfed.sadecki.com",
-    "pixelfed.salecroix.fr",
-    "pixelfed.sandbox.connection.fr",
-    "pixelfed.scot",
-    "pixelfed.sdf.org",
-    "pixelfed.se",
-    "pixelfed.services.coupou.fr",
-    "pixelfed.smashnet.de",
-    "pixelfed.snakenode.eu",
-    "pixelfed.snld.ca",
-    "pixelfed.social",
-    "pixelfed.social.kinojocastle.xyz",
-    "pixelfed.stevex.online",
-    "pixelfed.sysctl.io",
-    "pixelfed.takeko.cyou",
-    "pixelfed.tal.org",
-    "pixelfed.tardar.social",
-    "pixelfed.tcjc.uk",
-    "pixelfed.teaandbiscuits.net",
-    "pixelfed.teachmaths.org",
-    "pixelfed.techguy.social",
-    "pixelfed.techhangout.social",
-    "pixelfed.techtriage.guru",
-    "pixelfed.tekdmn.me",
-    "pixelfed.thebubble.noho.st",
-    "pixelfed.tnxip.de",
-    "pixelfed.tokyo",
-    "pixelfed.uno",
-    "pixelfed.v.st",
-    "pixelfed.vajonet.org",
-    "pixelfed.vapronva.pw",
-    "pixelfed.virusschleuder.de",
-    "pixelfed.vpx.moe",
-    "pixelfed.wildsplash.photography",
-    "pixelfed.wivodaim.net",
-    "pixelfed.wolfie.pw",
-    "pixelfed.xm1.de",
-    "pixelfed.xn--pikabl-0xa.se",
-    "pixelfed.yojik.net",
-    "pixelfed.zergy.net",
-    "pixelfed.zwerfcat.world",
-    "pixelfed.zwoelfdreifuenfundvierzig.net",
-    "pixelfedapp.uk",
-    "pixelho.me",
-    "pixelig.social",
-    "pixelpups.place",
-    "pixels.abraum.de",
-    "pixels.digital-artifacts.net",
-    "pixels.gsi.li",
-    "pixels.guaranteedstruggle.host",
-    "pixels.jdt.io",
-    "pixels.jonpark.co.uk",
-    "pixels.pks.ai",
-    "pixels.runningwithbulls.com",
-    "pixels.stocksfamily.online",
-    "pixels.stormgrass.com",
-    "pixels.tinybog.io",
-    "pixey.org",
-    "pixfd.com",
-    "pixies.nylarea.com",
-    "pixl.fi",
-    "pixls.courat.fr",
-    "pixtagram.social",
-    "pkm.social",
-    "pkteerium.xyz",
-    "pkutalk.com",
-    "pl.8mitsu.net",
-    "pl.apathy.tv",
-    "pl.autumnsky.jp",
-    "pl.brodi.me",
-    "pl.catboyindustries.co",
-    "pl.comofas.org",
-    "pl.dira.cc",
-    "pl.ebin.zone",
-    "pl.eragon.re",
-    "pl.evilmuff.in",
-    "pl.fanyx.xyz",
-    "pl.fediverse.pl",
-    "pl.firechicken.net",
-    "pl.glitch.pm",
-    "pl.gnu.moe",
-    "pl.gozou.moe",
-    "pl.inu.is",
-    "pl.izaten.net",
-    "pl.jugregator.org",
-    "pl.kasma.cyou",
-    "pl.kazuna.pgw.jp",
-    "pl.kitsunemimi.club",
-    "pl.kotobank.ch",
-    "pl.kpherox.dev",
-    "pl.lain.ch",
-    "pl.linkov.net",
-    "pl.loveforlandlords.com",
-    "pl.m0e.space",
-    "pl.nagi.fan",
-    "pl.nudie.social",
-    "pl.nulled.llc",
-    "pl.psion.co",
-    "pl.pube.tk",
-    "pl.pyrope.net",
-    "pl.qou.moe",
-    "pl.r8z.us",
-    "pl.salushnes.solutions",
-    "pl.savant.so",
-    "pl.slash.cl",
-    "pl.starnix.network",
-    "pl.thj.no",
-    "pl.tkammer.de",
-    "pl.trainnet.kr",
-    "pl.uwu.is",
-    "pl.valkyrie.world",
-    "pl.veryamt.com",
-    "pl.voltrina.net",
-    "pl.waku.dev",
-    "pl.wire.garden",
-    "pl22.telteltel.com",
-    "place-of-refuge.com",
-    "plaerdemavida.cat",
-    "plag.gy",
-    "plagu.ee",
-    "plaid.boxpleats.com",
-    "planet.chrisbeckstrom.com",
-    "planet.moe",
-    "planetboca.com",
-    "planetearth.social",
-    "planetrage.social",
-    "plantegg.wiki.gd",
-    "plantex.top",
-    "plantroon.com",
-    "plantsand.coffee",
-    "plasmatrap.com",
-    "plasticmodels.tokyo",
-    "platica.io",
-    "platopunk.com",
-    "playpen.social",
-    "playset.social",
-    "plaza.vaporpolis.net",
-    "ple.praze.net",
-    "ple.rorea.moe",
-    "please-dominate.me",
-    "pleiades.s0.is",
-    "plenum-r.org",
-    "plero.antopie.org",
-    "plero.wiwie.dk",
-    "plerom.ator.cz",
-    "pleroma-in.ouda.space",
-    "pleroma.0x68756773.moe",
-    "pleroma.1d4.us",
-    "pleroma.1of444.top",
-    "pleroma.2207.fr",
-    "pleroma.7365000.xyz",
-    "pleroma.7seven.cloud",
-    "pleroma.8777.ch",
-    "pleroma.adenine.fr",
-    "pleroma.afy.jp",
-    "pleroma.al45tair.net",
-    "pleroma.amefur.asia",
-    "pleroma.andho.xyz",
-    "pleroma.anduin.net",
-    "pleroma.antiniveau.eu",
-    "pleroma.aorinngo.top",
-    "pleroma.arielbecker.com",
-    "pleroma.arutemilia.com",
-    "pleroma.astro.clinic",
-    "pleroma.autogeree.net",
-    "pleroma.bergada.cat",
-    "pleroma.bhamtech.net",
-    "pleroma.bigzu.cc",
-    "pleroma.boingo00.wtf",
-    "pleroma.booths.cyou",
-    "pleroma.bosio.info",
-    "pleroma.breizh.pm",
-    "pleroma.bufanda.de",
-    "pleroma.bushi.moe",
-    "pleroma.carbonnotes.zone",
-    "pleroma.carya.software",
-    "pleroma.chagratt.site",
-    "pleroma.chaoswit.ch",
-    "pleroma.chez-papy-daarky.ovh",
-    "pleroma.chillout.chat",
-    "pleroma.chladny.de",
-    "pleroma.chroju.dev",
-    "pleroma.chtisurel.net",
-    "pleroma.collectifdhun.ovh",
-    "pleroma.comix.gr",
-    "pleroma.cucked.me",
-    "pleroma.cyber.gent",
-    "pleroma.cybertopia.xyz",
-    "pleroma.cybervalley.org",
-    "pleroma.d5o.eu",
-    "pleroma.dark-alexandr.net",
-    "pleroma.davidgtl.me",
-    "pleroma.debian.social",
-    "pleroma.dirb.xyz",
-    "pleroma.doingyourmom.club",
-    "pleroma.dokyun.club",
-    "pleroma.dragast.me",
-    "pleroma.dragonborn.app",
-    "pleroma.drmandrewtoad.com",
-    "pleroma.electronblueberry.xyz",
-    "pleroma.elinvention.ovh",
-    "pleroma.enimihil.net",
-    "pleroma.envs.net",
-    "pleroma.faba.icu",
-    "pleroma.fapuro.dscloud.me",
-    "pleroma.fly.dev",
-    "pleroma.fordfairlaneonline.com",
-    "pleroma.foxarmy.org",
-    "pleroma.foxden.party",
-    "pleroma.frickalou.com",
-    "pleroma.fuba.dev",
-    "pleroma.g2887349.com",
-    "pleroma.gidikroon.eu",
-    "pleroma.glueoh.com",
-    "pleroma.gnulinux.si",
-    "pleroma.gugli.me",
-    "pleroma.guse.fr",
-    "pleroma.haruki7049.dev",
-    "pleroma.hiden.pw",
-    "pleroma.hohbukuro.work",
-    "pleroma.huttiesroow.nl",
-    "pleroma.id",
-    "pleroma.idiot.sh",
-    "pleroma.in.th",
-    "pleroma.interhacker.space",
-    "pleroma.io",
-    "pleroma.iselfhost.com",
-    "pleroma.jarade-pieniek.nohost.me",
-    "pleroma.jcaicedo.com",
-    "pleroma.jezra.net",
-    "pleroma.jling.dev",
-    "pleroma.k8s.wdwconsulting.net",
-    "pleroma.kenhutton.uk",
-    "pleroma.kitsunemimi.club",
-    "pleroma.kjr-mooot.de",
-    "pleroma.kollar.cloud",
-    "pleroma.koteidenwa.uk",
-    "pleroma.kwe-private.net",
-    "pleroma.labrat.space",
-    "pleroma.lclsea.icu",
-    "pleroma.ledoian.cz",
-    "pleroma.leopold.fajtak.at",
-    "pleroma.linarphy.net",
-    "pleroma.lokean.org",
-    "pleroma.lord.re",
-    "pleroma.m68k.church",
-    "pleroma.marchera-pas.fr",
-    "pleroma.marussy.com",
-    "pleroma.mass-trespass.uk",
-    "pleroma.memiks.fr",
-    "pleroma.meneeraart.nl",
-    "pleroma.mercurial.blog",
-    "pleroma.microblog.se",
-    "pleroma.microkod.xyz",
-    "pleroma.miguelcr.me",
-    "pleroma.mikegerwitz.com",
-    "pleroma.minecloud.ro",
-    "pleroma.monotremata.xyz",
-    "pleroma.morphnet.de",
-    "pleroma.n-kru.se",
-    "pleroma.namar.ie",
-    "pleroma.namelivia.com",
-    "pleroma.neuromante.net",
-    "pleroma.nindanaoto.dev",
-    "pleroma.niuez.net",
-    "pleroma.noellabo.jp",
-    "pleroma.noury.li",
-    "pleroma.nuclearlimes.co.uk",
-    "pleroma.nyan.click",
-    "pleroma.ochinchin.dev",
-    "pleroma.oleg.kim",
-    "pleroma.oomurosakura.co",
-    "pleroma.oook.fr",
-    "pleroma.otter.sh",
-    "pleroma.p4g.club",
-    "pleroma.paderborn.social",
-    "pleroma.pavluk.org",
-    "pleroma.payfrit.com",
-    "pleroma.pibvt.net",
-    "pleroma.polyserv.xyz",
-    "pleroma.popolon.org",
-    "pleroma.prazaar.de",
-    "pleroma.purexo.mom",
-    "pleroma.pyche.ovh",
-    "pleroma.raluy.fr",
-    "pleroma.rauhala.info",
-    "pleroma.rbq.social",
-    "pleroma.rdcl.dev",
-    "pleroma.ribes.ovh",
-    "pleroma.rucknium.me",
-    "pleroma.s-a.at",
-    "pleroma.s1gm4.eu",
-    "pleroma.s4if.dev",
-    "pleroma.salastil.com",
-    "pleroma.schuerz.at",
-    "pleroma.servantweb.fr",
-    "pleroma.sha1.nl",
-    "pleroma.shakalaka.club",
-    "pleroma.shinamikaidou42.com",
-    "pleroma.shunderdo.me",
-    "pleroma.simple-gear.com",
-    "pleroma.skeptikon.fr",
-    "pleroma.skyshanty.xyz",
-    "pleroma.sokosoko.info",
-    "pleroma.someotherguy.xyz",
-    "pleroma.soykaf.com",
-    "pleroma.sparkburst.net",
-    "pleroma.srv.steinert-ese.de",
-    "pleroma.staminaonline.com",
-    "pleroma.stuebinm.eu",
-    "pleroma.subsonics.nl",
-    "pleroma.sxpert.org",
-    "pleroma.takeko.cyou",
-    "pleroma.tcweb.org",
-    "pleroma.tenjuu.net",
-    "pleroma.tenkoff.ru",
-    "pleroma.terminaldweller.com",
-    "pleroma.tevps.net",
-    "pleroma.thinkof.name",
-    "pleroma.thisawfuldungeon.art",
-    "pleroma.tojan.icu",
-    "pleroma.tr00st.co.uk",
-    "pleroma.tulln.social",
-    "pleroma.unigiri.net",
-    "pleroma.viridianpatriots.com",
-    "pleroma.virtual-earth.de",
-    "pleroma.volzel.net",
-    "pleroma.vorona.ca",
-    "pleroma.wafflec.one",
-    "pleroma.waynetec.us",
-    "pleroma.what.re",
-    "pleroma.wheretogo.in.th",
-    "pleroma.woodynet.net",
-    "pleroma.xdavidwu.link",
-    "pleroma.xeno.darksair.org",
-    "pleroma.xyenon.bid",
-    "pleroma.yodan.ninja",
-    "pleroma.yuyutsu.one",
-    "pleroma.zabaglione.net",
-    "pleroma.zenwillow.website",
-    "pleroma.zuikou.dev",
-    "pleromaatanaz.spacehost.dev",
-    "pleromashit.nexus",
-    "pleromer.net",
-    "plerormasep.spacehost.dev",
-    "plesiosaur.net",
-    "plm.ranranhome.info",
-    "plnetwork.xyz",
-    "plock.social",
-    "ploen.social",
-    "plone.social",
-    "plrm.biboumail.fr",
-    "plrm.capslock.dev",
-    "plrm.ddns.net",
-    "plrm.izaten.net",
-    "plrm.komaniya.work",
-    "plrm.podcastalot.com",
-    "plrm.polyohm.net",
-    "plshug.me",
-    "plsnobully.me",
-    "pluffy.monster",
-    "plumbob.social",
-    "plumes.io",
-    "plural.cafe",
-    "plush.city",
-    "plushies.social",
-    "plustodon.net",
-    "plutus.social",
-    "plz.7td.org",
-    "pmai.social",
-    "pmakholm.takahe.hacking.dk",
-    "pmth.us",
-    "pneumastodon.com",
-    "pneutig.org",
-    "pnw-mastodon.com",
-    "pnw.zone",
-    "poa.st",
-    "poag.one",
-    "poast.org",
-    "pocketpixels.club",
-    "pocmo.social",
-    "pod.dou.bet",
-    "pod.social",
-    "podcast.noppy.jp",
-    "podcasters.social",
-    "podcastindex.social",
-    "podcasts.social",
-    "podhubie.vsieti.sk",
-    "podkos.xyz",
-    "podlibre.social",
-    "podvibes.co",
-    "pogfish.party",
-    "poggers.pogcha.mp",
-    "pogs.cafe",
-    "poils.pachyderme.net",
-    "pointbob.org",
-    "pointless.chat",
-    "poit.io",
-    "pokemon.mastportal.info",
-    "pokemon.men",
-    "pokorny.ca",
-    "pol.social",
-    "polaris.masto.host",
-    "polarnight.xyz",
-    "polaroid.absturztau.be",
-    "politehumans.com",
-    "politics.rip",
-    "politiek.social",
-    "poliversity.it",
-    "poliverso.org",
-    "polkadot.hostdon.ne.jp",
-    "pollyanna.social",
-    "polsci.social",
-    "poly.cybre.city",
-    "polyam.space",
-    "polycycle.io",
-    "polyglot.city",
-    "polyomino.app",
-    "pomdon.work",
-    "pon.ee",
-    "ponder.a.reallybigh.at",
-    "pone.social",
-    "ponies.social",
-    "ponjour.com",
-    "pont-bl.eu.org",
-    "pony.social",
-    "ponysocial.ru",
-    "poofion.com",
-    "pooper.fantranslation.org",
-    "pooper.jakest.us",
-    "poopy.social",
-    "poorlyrendered.com",
-    "popindustry.org",
-    "popkulturreferenz.de",
-    "popon.pptdn.jp",
-    "poppuna.xyz",
-    "pore.run",
-    "porkribs.social",
-    "pornanime.club",
-    "porny.social",
-    "porpoise.social",
-    "port443.eu",
-    "port87.social",
-    "portal.redp.icu",
-    "portraits.social.pekkasipila.com",
-    "portside.social",
-    "possum.city",
-    "post.anteumbra.art",
-    "post.ebin.club",
-    "post.habitattt.it",
-    "post.jyrgi.de",
-    "post.liaru.link",
-    "post.lurk.org",
-    "post.michae.lv",
-    "post.nuro.lol",
-    "post.poo.ing",
-    "post.rodeo",
-    "post.skyizwhite.dev",
-    "postagram.net",
-    "postb.org",
-    "postchat.io",
-    "posthat.ca",
-    "postin.dumbgeon.gay",
-    "posting.expert",
-    "posting.lolicon.rocks",
-    "posting.solutions",
-    "postingbrain.com",
-    "postnstuffds.lol",
-    "postpandemicparty.org",
-    "postrad.social",
-    "posts.adamw.social",
-    "posts.banu.com",
-    "posts.cafesocietyonline.org",
-    "posts.dani.cool",
-    "posts.digitaldemocracies.org",
-    "posts.dumb.stuff.donaberger.xyz",
-    "posts.dynamic.land",
-    "posts.jacobhaddon.com",
-    "posts.jondoes.com",
-    "posts.legrand.design",
-    "posts.polity.social",
-    "posts.rat.pictures",
-    "posts.thiart.com",
-    "poststoffarm.de",
-    "posvib.es",
-    "potate.space",
-    "potla.ch",
-    "poto.cafe",
-    "pouchi.ca",
-    "pouet.aliel.fr",
-    "pouet.april.org",
-    "pouet.badprocess.me",
-    "pouet.chapril.org",
-    "pouet.couchet.org",
-    "pouet.evolix.org",
-    "pouet.fedi.quebec",
-    "pouet.fedisphere.net",
-    "pouet.gddb.ovh",
-    "pouet.it",
-    "pouet.jablon.fr",
-    "pouet.me",
-    "pouet.mickaelgillot.xyz",
-    "pouet.pas.la",
-    "pouet.peuw.net",
-    "pouet.pt",
-    "pouet.quebec",
-    "pouet.space",
-    "pouet.vabois.fr",
-    "pouet.yazae.eu.org",
-    "pounced-on.me",
-    "pouque.net",
-    "pourparler.ca",
-    "pourparlers.social",
-    "poweredbygay.social",
-    "powerg.love",
-    "poyoro.id",
-    "poyusbuddy.com",
-    "pp-social.com",
-    "ppb.social",
-    "ppdbook.sa-safeme.com",
-    "ppiy.ac",
-    "pqcdao.com",
-    "pr-ingelheim.de",
-    "pr.ag925.top",
-    "pr.shc.kanagawa.jp",
-    "pr0mised.life",
-    "praise.udongein.xyz",
-    "prattle.org.uk",
-    "prattle.top",
-    "prattohome.com",
-    "pravda.me",
-    "pravdasocial.net",
-    "prazeworks.uk",
-    "preciouslittle.life",
-    "precise.space",
-    "precure.ml",
-    "prehl.social",
-    "press.anyaforger.art",
-    "press.community",
-    "press.coop",
-    "pretix.social",
-    "prettypics.eu",
-    "prf.me",
-    "primarycare.social",
-    "primitivebits.social",
-    "princess.industries",
-    "princess.wedding",
-    "pritter.work",
-    "privacyofficers.social",
-    "privatter.info",
-    "privex.social",
-    "prlic.social",
-    "pro104b.online",
-    "probablyfreespeech.com",
-    "proc.social",
-    "procolix.social",
-    "procursus.social",
-    "procydon.net",
-    "prodromou.pub",
-    "profa.co",
-    "profiles.lol",
-    "prognesubis.net",
-    "program-theia.monster",
-    "progressivecafe.social",
-    "progressives.social",
-    "project-nex.net",
-    "project-p.jp",
-    "projectnewgeneration.online",
-    "projectseeker.fedicity.net",
-    "promessia.masto.host",
-    "propaganda.lol",
-    "proptech.news",
-    "propulse.club",
-    "proquestinations.com",
-    "prost.staendsche.de",
-    "protagonist.run",
-    "proto.lgbt",
-    "proto7.io",
-    "protogen.social",
-    "proud.social",
-    "provo.lol",
-    "prowniesoftware.net",
-    "proyectozero.org",
-    "prsm.space",
-    "prutsclub.nl",
-    "ps-sw145sd.hostdon.ne.jp",
-    "ps.m0n5t3r.info",
-    "psiren.eu",
-    "psjb.me",
-    "psst.al0.de",
-    "psu.social",
-    "psych.hostdon.ne.jp",
-    "psychobatic.com",
-    "psychotherapy.social",
-    "psyopshop.com",
-    "psysocial.net",
-    "ptibistrot.danslesbois.net",
-    "ptpverse.dns-cloud.net",
-    "pub.52poke.net",
-    "pub.atomaka.com",
-    "pub.calebhearth.com",
-    "pub.communistparty.org.uk",
-    "pub.deferpanic.dev",
-    "pub.eeruwang.me",
-    "pub.ehrengruppe.de",
-    "pub.frostillic.us",
-    "pub.is4.site",
-    "pub.ivasilev.net",
-    "pub.kaifei.net",
-    "pub.killrobot.com",
-    "pub.kimiaki.space",
-    "pub.kreig.rocks",
-    "pub.miscworks.net",
-    "pub.o-nc.me",
-    "pub.org.il",
-    "pub.osrx.social",
-    "pub.qu1x.one",
-    "pub.sapzil.org",
-    "pub.senggol.in",
-    "pub.str.rs",
-    "pub.zx.dev",
-    "pubble.social",
-    "pubby.social",
-    "pubeurope.com",
-    "public.kijy.net",
-    "public.mitra.social",
-    "publicgood.social",
-    "publicgoods.social",
-    "publichealth.space",
-    "publichouse.mensgardening.club",
-    "publicidentity.net",
-    "publiclaw.space",
-    "publicsquare.global",
-    "publishing.social",
-    "pubnex.us",
-    "pubsub.fun",
-    "pubsub.leastfixedpoint.com",
-    "puddle.town",
-    "puffin.fly.dev",
-    "puffin.social",
-    "pug.ninja",
-    "puget.social",
-    "pullopen.xyz",
-    "pulpunte-chinpun.xyz",
-    "puls.im",
-    "puls.social",
-    "punk.demon.gay",
-    "punk.ro",
-    "punkland.masto.host",
-    "punkrock-underground.com",
-    "puntarella.party",
-    "puppet.town",
-    "puppo.space",
-    "puppybear.social",
-    "puppyfire.social",
-    "pupy.cafe",
-    "purengom.kr",
-    "puritan.pub",
-    "purplepenguin.lol",
-    "purplespider.social",
-    "purposefully.social",
-    "puyopuyotetr.is",
-    "puyosuki.com",
-    "puz.fun",
-    "puzich.social",
-    "pvl.pw",
-    "pwet.me",
-    "pwet.what.tf",
-    "px.c-p-b.com",
-    "px.filmfreedom.net",
-    "px.fux.is",
-    "px.gordons.gen.nz",
-    "px.lutoma.org",
-    "px.mathias777.com",
-    "px.micmun.de",
-    "px.ms.vg",
-    "px.owu.one",
-    "px.signboard.fun",
-    "pxfd.t-rg.ws",
-    "pxi.social",
-    "pxl.bub.org",
-    "pxl.fedi.bub.org",
-    "pxl.mx",
-    "pxl.mxhdr.net",
-    "pxl.roflcopter.fr",
-    "pxlfd.dsnv.net",
-    "pxlfd.fun.systems",
-    "pxlfd.plus",
-    "pxlfed.de",
-    "pxlfed.nl",
-    "pxlmo.com",
-    "pxlmo.net",
-    "pxtst.schuerz.at",
-    "pynews.com.br",
-    "pyratt.sh",
-    "pythonplayer123.xyz",
-    "pz.lc",
-    "q8masto.social",
-    "qa.social",
-    "qaf.men",
-    "qauoc.mooo.com",
-    "qdon.space",
-    "qishen.dev",
-    "qlink.social",
-    "qn.krig.jp",
-    "qnmd.info",
-    "qoto.org",
-    "qpixel.pw",
-    "qratedspace.com",
-    "qth.social",
-    "qtxiv.masto.host",
-    "qua.ntumfy.re",
-    "quakers.social",
-    "quarium.xyz",
-    "quarry.ravenholm.club",
-    "quarteredcircle.net",
-    "quasar.uber.space",
-    "quasisocial.lone-starr.net",
-    "quasselkopf.de",
-    "quasstodon.social",
-    "qubit-social.xyz",
-    "queef.social",
-    "queer.blahaj.solutions",
-    "queer.cool",
-    "queer.dev",
-    "queer.garden",
-    "queer.group",
-    "queer.hacktivis.me",
-    "queer.ofmd.social",
-    "queer.party",
-    "queer.town",
-    "queer.witchli.eu",
-    "queerdon.social",
-    "queernerds.social",
-    "queerspirituality.social",
-    "queralt.social",
-    "quickbrb.social",
-    "quiet.social",
-    "quietcar.social",
-    "quietude.space",
-    "quietzero.net",
-    "quinnwitz.house",
-    "quite.exposed",
-    "quite.social",
-    "quixotic.info",
-    "qunagi.qunagi.net",
-    "quodlibet.social",
-    "qwerty.onl",
-    "qwq.ooo",
-    "qwwwq.cat",
-    "qz.asdser.net",
-    "r.oblox.gay",
-    "r.town",
-    "r2.do",
-    "r2beat.jp",
-    "r3dp1ll.sh",
-    "r3o3n3.today",
-    "ra.0lb.be",
-    "rabbit.x86.town",
-    "rabbitea.rs",
-    "rabbithou.se",
-    "rabbitrabbitbrownrabbit.hostdon.ne.jp",
-    "raccoon.cafe",
-    "raccoon.place",
-    "raccoon.zone",
-    "rack.social",
-    "rada.sotamedia.org",
-    "radar.fail",
-    "radicalsocial.work",
-    "radig.social",
-    "radikal.social",
-    "radio.arsrobotics.org",
-    "radio.gamethattune.com",
-    "radio.quaqoostore.net",
-    "radio.w0abe.com",
-    "radiogeek.me",
-    "radiopatio.noatodo.com",
-    "radiosocial.de",
-    "radiostatler.social",
-    "radon.rocks",
-    "radon.social",
-    "radz-at-han.city",
-    "rage.love",
-    "raggedfeathers.com",
-    "ragol.uk",
-    "rah.social",
-    "raikow.online",
-    "rail.chat",
-    "rail.siberia.work",
-    "railcarenthusiast.org",
-    "railend.xyz",
-    "rails.social",
-    "rainbow.lol",
-    "rairarai.hostdon.ne.jp",
-    "raki.club",
-    "rally.guide",
-    "rama3.jp",
-    "ramble.space",
-    "rambleon.social",
-    "ramblingreaders.org",
-    "ramblings.social",
-    "ramen-fsm.eu.org",
-    "ramshackle.town",
-    "rando.social",
-    "randomcorner.space",
-    "ranovers.fr",
-    "rants.au",
-    "rap.social",
-    "rape.pet",
-    "raphus.social",
-    "rapidsloth.xyz",
-    "raptol.net",
-    "rarified.online",
-    "raru.re",
-    "rascalking.com",
-    "raspberrypi.social",
-    "raspidon.mamemo.online",
-    "rasterdon.com",
-    "rat.academy",
-    "rat.party",
-    "rat.social",
-    "rathbone.foundation",
-    "rathe.social",
-    "ratherbemaking.games",
-    "ratingen.social",
-    "rattle.wtf",
-    "rattodon.nexus",
-    "raum.klang.is",
-    "rave.ineptiarum.ca",
-    "ravearizona.club",
-    "ravenation.club",
-    "rawkode.social",
-    "rawr.sillydragon.ca",
-    "rawr.space",
-    "rawr.tf",
-    "rayci.st",
-    "rayolson.info",
-    "raza.social",
-    "rb.2snc.eu",
-    "rbrtr.com",
-    "rcelko.ch",
-    "rcj1.mstdon.app",
-    "rcsocial.net",
-    "rda.komintern.work",
-    "reactions-test.mara.guru",
-    "read.cratonsed.ge",
-    "read.gender.systems",
-    "read.iridescent.nz",
-    "read.oddte.ch",
-    "reading.taks.garden",
-    "reads.caskey-demaret.se",
-    "reads.netsphere.pub",
-    "real-escape.jp",
-    "real.badanalys.is",
-    "reality2.social",
-    "really.sleepytealcoder.com",
-    "realms.jardin-des-slimes.fr",
-    "realsocial.life",
-    "realworld.szs.net",
-    "rebased.io",
-    "rebased.social",
-    "rebased.taihou.website",
-    "rebel-lion.uk",
-    "rebel.ar",
-    "rebel.iero.org",
-    "rebelbase.site",
-    "recht.social",
-    "rechtscafe.de",
-    "reckless.dev",
-    "reclaim.rocks",
-    "reclaim.tv",
-    "recluse.social",
-    "recogiendofrutos.interlan.ec",
-    "recordon.mamemo.online",
-    "recordplug.club",
-    "recoveryposse.social",
-    "recsys.social",
-    "rect.al",
-    "recurse.social",
-    "recusant.app",
-    "red-eye.monster",
-    "red.colegiocontempora.com",
-    "red.fox.yt",
-    "red.niboe.info",
-    "redbeard.social",
-    "redbeardsec.com",
-    "redbeardthe.ninja",
-    "redcook.social",
-    "redd.live",
-    "redegeld-e.nl",
-    "redgate.social",
-    "redmountain.club",
-    "redpanda.pics",
-    "redpawcollective.co",
-    "redrosewriter.com",
-    "redsnake.io",
-    "redspinning.top",
-    "redwings.social",
-    "redwombat.social",
-    "refi64.social",
-    "regenerate.social",
-    "region-bergstrasse.social",
-    "reidodon.net",
-    "reima.rocks",
-    "reimalab.art",
-    "reincubate.social",
-    "reiseblog.knut-hildebrandt.de",
-    "rejoignez.toutournai.social",
-    "rejoiner.eu",
-    "relay.john.pub",
-    "relay.soy",
-    "relayfm.social",
-    "relib.re",
-    "religion.masto.host",
-    "religious.social",
-    "reliverse.social",
-    "reluctantly.social",
-    "remeika.social",
-    "remerge.net",
-    "remnant.social",
-    "remolino.town",
-    "remotelab.uk",
-    "rempath.social",
-    "rencher.industries",
-    "reparierecke.de",
-    "repeat.retrostrange.tv",
-    "reporter.social",
-    "republik.social",
-    "res.social",
-    "researchbuzz.masto.host",
-    "reseau.dupeuple.fr",
-    "reseau.innooo.fr",
-    "reshet.social",
-    "resistit.net",
-    "respiroaventura.com.br",
-    "response4.com",
-    "respublicae.eu",
-    "restive.social",
-    "restof.social",
-    "restraint.social",
-    "rethinkplaces.social",
-    "retia.delaage.fr",
-    "retirenow.top",
-    "retr0.id",
-    "retro.pizza",
-    "retro.social",
-    "retrochat.online",
-    "retrodon.jp",
-    "retrogaming.social",
-    "retrogarde.de",
-    "retrohangout.club",
-    "retroparadise.tech",
-    "retrophisch.social",
-    "retrorewind.social",
-    "retroverse.social",
-    "retrykillerwhale.site",
-    "rettiwtkcuf.social",
-    "rettungsdienst.social",
-    "revcybertrucker.com",
-    "reve.land",
-    "reverendelvis.de",
-    "reverie.masto.host",
-    "revillas.es",
-    "rewa.mobi",
-    "rewrite.in.rs",
-    "rewt.link",
-    "rey.ivan.ac",
-    "reyuzenfold.com",
-    "rezchannel5.mawsnpaws.live",
-    "rfj.social",
-    "rhabarberbarbara.bar",
-    "rheinhessen.social",
-    "rheinland.social",
-    "rheinneckar.social",
-    "rhythmgame.rs",
-    "ribbit.froggirl.club",
-    "ribeiro.social",
-    "ricard.social",
-    "richtig.spielleiten.de",
-    "ricko.photos",
-    "ricko.social",
-    "rickyleong.me",
-    "ricorda.social",
-    "ricotta.cheesecake.observer",
-    "ridgewood.social",
-    "riedstadt.social",
-    "riegai.com",
-    "riemann.social",
-    "rigcz.club",
-    "rigor-mortis.nmrc.org",
-    "riin.fr",
-    "rikka-zine.jp",
-    "rinarin.social",
-    "rincha.club",
-    "ring2.de",
-    "ringed.space",
-    "risc.social",
-    "risk.social",
-    "risonchu.social",
-    "rivals.space",
-    "rivendell.cafe",
-    "river.group.lt",
-    "rivervalleymaine.social",
-    "rjan.site",
-    "rlidea.com",
-    "rls.social",
-    "rly.at",
-    "rm4.me",
-    "rmrs.nl",
-    "rngm-zakaecommu.fedicity.net",
-    "ro-mastodon.puyo.jp",
-    "roadhouse.libreserver.org",
-    "roar.draboros.net",
-    "roark.voluminum.net",
-    "roastbeast.org",
-    "rob365.online",
-    "robermar.social",
-    "robertparker.se",
-    "robertwhite.social",
-    "robodon.social",
-    "robot.rodeo",
-    "roc.social",
-    "rockcd.jp",
-    "rocketsnail.masto.host",
-    "rocklin.dev",
-    "rockosbasilisk.com",
-    "rococo.masto.host",
-    "rodent.city",
-    "rodent.life",
-    "rodentdisco.co.uk",
-    "rodina-sucha.cz",
-    "rodvand.net",
-    "rofl.im",
-    "rogbone.com",
-    "rogersfam.co",
-    "roggenkamp.social",
-    "rogue-scholar.social",
-    "roleplayers.bub.org",
-    "rollenspiel.social",
-    "rollforcupcakes.com",
-    "roma.sodo-shed.com",
-    "romancelandia.club",
-    "romeros.link",
-    "room19.com",
-    "room1969.net",
-    "roomtone.social",
-    "roots.entangledothers.studio",
-    "rope-access-work.com",
-    "ropeburn.social",
-    "ropedrop.social",
-    "rosafamily.social",
-    "rosaryfaith.com",
-    "roseraie.me",
-    "roshless.me",
-    "rosiemma.nohost.me",
-    "rosti.social",
-    "rottmann.social",
-    "rouge.eu.org",
-    "roughdraft.party",
-    "route.shinamikaidou42.net",
-    "route66.social",
-    "routing.center",
-    "routingmagic.club",
-    "rouven-volkmann.de",
-    "rovers.social",
-    "roysbeer.place",
-    "rpgmaker.cafe",
-    "rpi.akko.wtf",
-    "rps.moe",
-    "rpvortex.online",
-    "rrgeorge.live",
-    "rsngrtn.fyi",
-    "rsocial.eu",
-    "rss-mstdn.studiofreesia.com",
-    "rssfeed.media",
-    "rstats.me",
-    "rter.io",
-    "rtfm.co.ua",
-    "rtfm.fr",
-    "rtio.dev",
-    "rtmp.easytron24.net",
-    "rtsn.dev",
-    "rtypedbs.hostdon.ne.jp",
-    "rubber.social",
-    "rubberchicken.social",
-    "rubberdr.one",
-    "rubedo.cloud",
-    "rubi.gd",
-    "rubi.masto.host",
-    "ruby.good.news",
-    "ruby.social",
-    "ruhr.social",
-    "ruhrpott.social",
-    "ruinous.social",
-    "rukii.net",
-    "runbsd.ca",
-    "runicfire.masto.host",
-    "runty.social",
-    "ruraiocht.cc",
-    "russiaukraine.world",
-    "rustedneuron.com",
-    "rustodon.hopto.org",
-    "rusty.cat",
-    "ruud.social",
-    "ruz.social",
-    "rva.fyi",
-    "rvagc.social",
-    "rwfertilizer.mydns.jp",
-    "rwx.ch",
-    "ryona.agency",
-    "ryona.quasivoid.net",
-    "rytter.me",
-    "s-h.social",
-    "s-t.club",
-    "s.aj.immo",
-    "s.arns.lt",
-    "s.awoo.dev",
-    "s.boykisser.systems",
-    "s.chode.org",
-    "s.costpap.me",
-    "s.crschmidt.net",
-    "s.danfoster.me",
-    "s.fyfy.eu.org",
-    "s.geno.is",
-    "s.hirtz.pm",
-    "s.humopery.space",
-    "s.jonsson.es",
-    "s.krbonne.net",
-    "s.lennysh.com",
-    "s.lowsamplingrate.eu",
-    "s.mysw.moe",
-    "s.neguse.net",
-    "s.nomya.net",
-    "s.o2l.ie",
-    "s.ourneu.space",
-    "s.ovalerio.net",
-    "s.pebcak.de",
-    "s.poweredbydev.com",
-    "s.schof.org",
-    "s.sneak.berlin",
-    "s.sunville.org",
-    "s.the-brannons.com",
-    "s.thenautilus.net",
-    "s.tynityper.io",
-    "s.und.ooo",
-    "s.veikr.com",
-    "s.voxint.net",
-    "s.waq.dk",
-    "s.yelvington.com",
-    "s.zholnay.name",
-    "s0l.x0r.org",
-    "s2.uplink.fail",
-    "s3th.me",
-    "saarmupfel.de",
-    "saasycloud.social",
-    "sabbat.hexe.net",
-    "sabbeln.social",
-    "sac.moe",
-    "sachsen-medien.social",
-    "sackheads.social",
-    "sacred.harpy.faith",
-    "sacredchild.world",
-    "sacspace.com",
-    "sacto.xyz",
-    "sad.cab",
-    "sad.earth",
-    "sadoway.com",
-    "saezuri.app",
-    "safareig.calbasi.net",
-    "safejust.space",
-    "sagdas.net",
-    "saguzi.jp",
-    "said.social",
-    "saigyouji.cyou",
-    "sailing.masto.host",
-    "sailstrails.cafe",
-    "saintmon.day",
-    "sakae-m.hostdon.ne.jp",
-    "sakamichi.fun",
-    "sakh.social",
-    "sakurajima.moe",
-    "sakurajima.social",
-    "sakuyo.net",
-    "sal.freyhult.net",
-    "salamander.space",
-    "salieri.hostdon.ne.jp",
-    "saltedskies.social",
-    "saltwatercity.org",
-    "saltybrackets.com",
-    "saltylike.us",
-    "salva.ge",
-    "salvo.chat",
-    "salzman.uk",
-    "sam.upstate.blog",
-    "samariter.social",
-    "samaschke.social",
-    "samenet.social",
-    "samh.us",
-    "samo.place",
-    "samschmitt.social",
-    "samstodon.net",
-    "san-antonio.social",
-    "san-junipero.gimme-sympathy.org",
-    "sanam.xyz",
-    "sanchayanmaity.com",
-    "sandbox.cybre.stream",
-    "sandbox.mastodon.iftas.org",
-    "sandbox.nyanya.net",
-    "sandbox.skoji.jp",
-    "sanders.life",
-    "sandfrog.streamturtle.de",
-    "sandiegourbanists.com",
-    "sandpix.eenoog.org",
-    "sangpaul.site",
-    "sanguinem.space",
-    "sanguok.com",
-    "sanjuans.life",
-    "santadog.social",
-    "santogoyunwol.today",
-    "santos.social",
-    "sap.my.to",
-    "sapphic.engineer",
-    "sapphic.ninja",
-    "saptodon.org",
-    "sarber.social",
-    "sarcasm.stream",
-    "sardegna.social",
-    "sardina.love",
-    "sarnia.lambton.social",
-    "saronno.one",
-    "sasa.africa",
-    "saskodon.ca",
-    "satania.social",
-    "satanodon.com",
-    "satcho-dohi.fedicity.net",
-    "satori.cafe",
-    "saturation.social",
-    "saturno.com.ve",
-    "satzfetzen.de",
-    "sauleau.social",
-    "sauna.social",
-    "saurier.social",
-    "sauropods.win",
-    "sausage.social",
-    "savageworlds.social",
-    "sawakai.space",
-    "say.berk.es",
-    "saysrelax.com",
-    "sayurili.hostdon.ne.jp",
-    "sb.yohjo.zip",
-    "sb17.space",
-    "sbg-social.at",
-    "sc.dc09.ru",
-    "sc.sigmaris.info",
-    "sc.skrlet13.xyz",
-    "scalie.business",
-    "scalie.club",
-    "scalie.eu",
-    "scalie.zone",
-    "scalies.cc",
-    "scaringtheho.es",
-    "sccn.club",
-    "scfzfilm.org",
-    "scg.owu.one",
-    "schach.social",
-    "schafweide.net",
-    "schaumburg.social",
-    "schelling.pt",
-    "schildt.social",
-    "schipper.social",
-    "schlechter.info",
-    "schleuss.online",
-    "schmaker.eu",
-    "schnauzer.social",
-    "scholar.social",
-    "schoolahead.social",
-    "schoonens.social",
-    "schottkydio.de",
-    "schraepler.de",
-    "schreibt.jetzt",
-    "schuppentier.social",
-    "sci.kiwi",
-    "scicomm.xyz",
-    "sciencemastodon.com",
-    "sciencemediacenter.social",
-    "sciences.dental",
-    "sciences.social",
-    "scientificnetwork.de",
-    "scientists.today",
-    "scifience.zone",
-    "scintilla.social",
-    "scipost.social",
-    "scl.clttr.info",
-    "scl.csns.xyz",
-    "scl.kaffeemonster.com",
-    "scl.zmb.cm",
-    "scoat.es",
-    "scookeoni.com",
-    "scores.social",
-    "scorpinc.social",
-    "scottishlad.me.uk",
-    "scottmallinson.com",
-    "scottodon.com",
-    "scrambled.news",
-    "scrappydog.com",
-    "scratch.webhop.me",
-    "screaming.com",
-    "screaminginsi.de",
-    "screamshitter.club",
-    "screencastsonline.social",
-    "scribe.io",
-    "scrivimi.ch",
-    "scrubjay.social",
-    "scruffy.parts",
-    "scull.social",
-    "sculpin.social",
-    "scuttle.cloud",
-    "scz.social",
-    "sdasocial.org",
-    "sddn.space",
-    "sdemp.masto.host",
-    "sdf.land",
-    "sdfjp.org",
-    "sdj.au",
-    "sdu.closed.social",
-    "seacow.social",
-    "seafoam.cafe",
-    "seafoam.space",
-    "seal.cafe",
-    "seals.social",
-    "seanstaffiery.com",
-    "seaoco.com",
-    "seaofog.com",
-    "seaside.cafe",
-    "seaswallow.me",
-    "sebastianlohmann.com",
-    "sebitech.social",
-    "secluded.ch",
-    "secondchancecomuworld.site",
-    "secret.draculo.net",
-    "secretbearlibrary.org",
-    "secretbearsociety.org",
-    "secretstage.club",
-    "sector25.de",
-    "secularfaith.site",
-    "securitycafe.ca",
-    "secuwing.social",
-    "seda.social",
-    "seeds.social",
-    "seeedstudio.social",
-    "seepocke.at",
-    "seglerinfo.social",
-    "seine.fleuv.es",
-    "sekretaerbaer.de",
-    "selbsthilfe.social",
-    "seldo.dev",
-    "selea.se",
-    "selenian.space",
-    "selent.ca",
-    "self-down69.space",
-    "self.regalijan.com",
-    "self.social",
-    "selfdon.0x7c4.com",
-    "selfhosted.cafe",
-    "selfhostedsocial.com",
-    "selfy.army",
-    "semiosen.de",
-    "senate.social",
-    "sendtoot.co",
-    "senigallia.one",
-    "senpainoticedme.moe",
-    "sensitive.hostdon.ne.jp",
-    "seo.chat",
-    "seocommunity.social",
-    "seoul.earth",
-    "ser.endipito.us",
-    "serenityos.social",
-    "serialexperiments.dev",
-    "serval.club",
-    "server.mastodon.ocjtech.us",
-    "serverhosting.social",
-    "servernerds.net",
-    "set.wordperf.com",
-    "sethlong.social",
-    "setouchi.social",
-    "sevenscreens.net",
-    "seyfro.social",
-    "sfba.club",
-    "sfba.photos",
-    "sfba.social",
-    "sfcoder.social",
-    "sfe.pics",
-    "sgc.social",
-    "sgtk.net",
-    "sha256safehouse.sigmaenterprisesltd.com",
-    "shabsters.social",
-    "shadowland.social",
-    "shadows.rest",
-    "shadowverdon.info",
-    "shakedown.social",
-    "shaktzu.org",
-    "shakuhachi.social",
-    "shaler.social",
-    "shao.life",
-    "share.elouworld.org",
-    "sharebright.net",
-    "shared.graphics",
-    "sharedresource.social",
-    "sharetron.com",
-    "shark.community",
-    "shark.ctrl.gay",
-    "shark.cyber77.de",
-    "shark.distantserver.org",
-    "shark.fedinet.de",
-    "shark.jyrgi.de",
-    "shark.lightnovel-dungeon.de",
-    "sharkey-testing.owo69.me",
-    "sharkey.anton-exe.eu",
-    "sharkey.asdfzdfj.xyz",
-    "sharkey.bat-pike.ts.net",
-    "sharkey.coffeeandtrains.de",
-    "sharkey.cronyakatsuki.xyz",
-    "sharkey.donadvr.de",
-    "sharkey.fancy.org.uk",
-    "sharkey.furryvile.net",
-    "sharkey.kimberlychase.com",
-    "sharkey.lundgrensjostrom.com",
-    "sharkey.meerjungfrauengrotte.de",
-    "sharkey.tamaki-shimai.moe",
-    "sharkey.tombies.eu",
-    "sharkey.travelpandas.eu",
-    "sharkey.world",
-    "sharkey.xprmnt42.de",
-    "sharknado.tombies.eu",
-    "sharktale.xyz",
-    "sharktest.baka.social",
-    "sharlayan.in",
-    "sharpletters.net",
-    "shaughnessy.xyz",
-    "sheep.network",
-    "sheffield.pub",
-    "shekel.masto.host",
-    "shellbytes.me",
-    "shellsharks.social",
-    "shelter.moe",
-    "sheppi.es",
-    "sheppo.au",
-    "sherlockholmes.social",
-    "shermdog.com",
-    "shibe.family",
-    "shigusegubu.club",
-    "shiina.cafe",
-    "shimanchu.social",
-    "shine.d-lowl.space",
-    "shinkai.party",
-    "shiro.dog",
-    "shirtless.gay",
-    "shitpisscum.mooo.com",
-    "shitpost.cloud",
-    "shitpost.school",
-    "shitposte.rs",
-    "shitposter.club",
-    "shitpostinc.business",
-    "shitposting.on.incorrigible.moe",
-    "shk.mv2k.com",
-    "shmg.online",
-    "shoddy.site",
-    "shoghi.rocks",
-    "shoni.town",
-    "shonk.phite.ro",
-    "shonk.reimu.info",
-    "shonk.social",
-    "shortens.net",
-    "shortstacksran.ch",
-    "shot.thiemoo.at",
-    "shota.house",
-    "shotgunlife.social",
-    "shouldagoneoffroad.com",
-    "shout.3xd.eu",
-    "shout.battlestance.org",
-    "shoutbox.blog",
-    "showmy.world",
-    "shpposter.club",
-    "shr.ohs.cx",
-    "shredderfood.com",
-    "shrediverse.net",
-    "shrike.club",
-    "shrimp.fear.garden",
-    "shrimp.foxwit.ch",
-    "shrimp.quest",
-    "shrimply.social",
-    "shrimpposter.club",
-    "shrin.es",
-    "shrine.moe",
-    "shrmp.constellatory.net",
-    "shrug.pro",
-    "shutinnerd.space",
-    "shuuji3.takahe.social",
-    "si.okin-jp.net",
-    "sicem.social",
-    "sick.pictures",
-    "sick.social",
-    "sidehearts.com",
-    "sideofburritos.social",
-    "sidraco.in",
-    "sieg-dragon.blue",
-    "sien.no",
-    "siena.group.lt",
-    "sights.omgwars.com",
-    "sigin.fo",
-    "sigmoid.social",
-    "signal.dadalo.pl",
-    "signalnine.net",
-    "signs.codes",
-    "siina.live",
-    "silence.horse",
-    "siliconflorist.com",
-    "silicorn.social",
-    "silke.wierlemann.net",
-    "silly.rest",
-    "sillynet.theonetruedimwit.tech",
-    "silva.social",
-    "silvan.cloud",
-    "silverark.social",
-    "silvernight.social",
-    "silversword.online",
-    "simian.rodeo",
-    "simon.vreeman.com",
-    "simongreenwood.me.uk",
-    "simplo.social",
-    "simracing.community",
-    "sin.tyaku.com",
-    "sind.muede.monster",
-    "sindicato.social",
-    "singsingsing.party",
-    "sink.love",
-    "sinophone.world",
-    "sio.masto.host",
-    "siren.jp",
-    "sironi.tk",
-    "sirtaptap.com",
-    "sistrunk.dev",
-    "sisulink.social",
-    "sith.is",
-    "sivalik.com",
-    "sivar.cafe",
-    "sixfeetup.social",
-    "sizecraft.social",
-    "sizeriot.com",
-    "sizestation.com",
-    "sjtu.closed.social",
-    "sk.gensokyo.shop",
-    "skastodon.com",
-    "skaverat.net",
-    "skeleton.town",
-    "skepteis.social",
-    "skeptics.social",
-    "skinheads.eu",
-    "skinheads.io",
-    "skinheads.social",
-    "skinheads.uk",
-    "skiscratcher.com",
-    "skj.ca",
-    "skj.social",
-    "skol.social",
-    "skoops.social",
-    "skoshtech.com",
-    "skrivel.se",
-    "skrt.social",
-    "skull.town",
-    "skullvines.xyz",
-    "skunkhollow.tech",
-    "skvip.lol",
-    "sky.staropensource.de",
-    "skyenet.social",
-    "skyhook.monster",
-    "skyhoppers.club",
-    "skyjake.fi",
-    "skyland.social",
-    "skynet.social",
-    "skytatu.com",
-    "slap.masterdan.net",
-    "slashine.onl",
-    "slattery.social",
-    "slayers.online",
-    "sldon.com",
-    "sled.social",
-    "sleepless.cafe",
-    "sleepy.cool",
-    "sleepy.pleasant.rest",
-    "sleepy.social",
-    "sleepybear.dev",
-    "sleepycatz.com",
-    "sleepycrew.social",
-    "sleuth.world",
-    "slightly.social",
-    "slime.computer",
-    "slime.global",
-    "slimegirl.social",
-    "slkr.space",
-    "slon.binarylife.ru",
-    "slon.yojik.net",
-    "slonik.0chan.ru",
-    "slothfc.net",
-    "sloths.chat",
-    "slowest.network",
-    "slut.town",
-    "slvn.social",
-    "small-pieces.au",
-    "small.circlez.social",
-    "smallposts.net",
-    "smartcity.social",
-    "smartinwriter.social",
-    "smeap.com",
-    "smellslike.sparklef.art",
-    "smilodon.chatslibres.com",
-    "smilton.net",
-    "smitenet.com",
-    "smithereen.bsrealm.net",
-    "smithstar.masto.host",
-    "smithtodon.org",
-    "smnn.ch",
-    "smokecircle.co",
-    "smol.boo",
-    "smol.cafe",
-    "smolhaj.social",
-    "smolhaj.space",
-    "smooth.guru",
-    "smores.town",
-    "smpl.hostdon.ne.jp",
-    "sms.cybik.moe",
-    "smuganimeavatar.xyz",
-    "smugglersbbs.com",
-    "smutlandia.com",
-    "sn.angry.im",
-    "sn.emiliabear.com",
-    "sn.rongyi.io",
-    "snabel.party",
-    "snabelen.no",
-    "snac.bsd.cafe",
-    "snac.emacs.ch",
-    "snac.foolbazar.eu",
-    "snac.frieren.icu",
-    "snac.haijo.eu",
-    "snac.heycitizen.com",
-    "snac.jamesoff.net",
-    "snac.juzam.net",
-    "snac.lowkey.party",
-    "snac.nitkiewicz.me",
-    "snac.noc.blue",
-    "snac.notnull.space",
-    "snac.nya.pub",
-    "snac.solobsd.org",
-    "snac.subversida.de",
-    "snac.weebyte.com",
-    "snac.wkwk.land",
-    "snac2.1e41.com",
-    "snac2.yuyutsu.one",
-    "snac24.keysmash.xyz",
-    "snacc.hoi.st",
-    "snack.haus",
-    "snack.social",
-    "snacka.org",
-    "snaggletooth.life",
-    "snailedit.social",
-    "snake.club",
-    "snake.cool",
-    "snap.st",
-    "snapp.social",
-    "snarky.club",
-    "snarthelg.no",
-    "sndcstle.fedicity.net",
-    "sneakerwave.net",
-    "snep.place",
-    "snet.theonetruedimwit.tech",
-    "snipetteville.in",
-    "snooker.uk.to",
-    "snoot.tube",
-    "snooter.space",
-    "snowdon.jp",
-    "snowdon.social",
-    "snowfan.masto.host",
-    "snowmans.land",
-    "snowmastodon.social",
-    "snowpiercer.co.uk",
-    "sns.ayokura.net",
-    "sns.chandr1000.net",
-    "sns.feistel.party",
-    "sns.govanify.com",
-    "sns.internationalotaku.com",
-    "sns.kianting.info",
-    "sns.lightnovel.jp",
-    "sns.limelee.xyz",
-    "sns.lunaticducks.com",
-    "sns.minovsky.space",
-    "sns.moeq.ing",
-    "sns.mszpro.com",
-    "sns.neonka.info",
-    "sns.oki-don.net",
-    "sns.ooto.me",
-    "sns.opencourse.kr",
-    "sns.scwhost.org",
-    "sns.secretsealing.club",
-    "sns.taizona.jp",
-    "sns.tinax.work",
-    "snug.moe",
-    "snug.town",
-    "so.denk-nach-mcfly.de",
-    "so.eddyn.net",
-    "so.fnky.nz",
-    "so.prx.link",
-    "so.rezzedup.com",
-    "so.scnr.it",
-    "soap.abhishek-dhakal.com.np",
-    "soap.bosio.info",
-    "soap.shitposter.club",
-    "soapbox.fedposters.club",
-    "soapbox.hackdefendr.com",
-    "soapbox.midwaytrades.com",
-    "soapbox.minaduki.dev",
-    "soapbox.ruby2sday.net",
-    "soapbox.samicrusader.me",
-    "soapbox.smbi.community",
-    "soapbox.vpx.moe",
-    "sobieski.social",
-    "soc.7thmagic.net",
-    "soc.abnv.me",
-    "soc.bosio.info",
-    "soc.citizen4.eu",
-    "soc.crashed.org",
-    "soc.dudenas.lt",
-    "soc.eli173.com",
-    "soc.feditime.com",
-    "soc.gng.io",
-    "soc.gsg.live",
-    "soc.haj.gay",
-    "soc.hardwarepunk.de",
-    "soc.hyena.network",
-    "soc.ironwyn.ch",
-    "soc.jae.fi",
-    "soc.jra.sh",
-    "soc.jrconlin.com",
-    "soc.kouett.net.eu.org",
-    "soc.kurator.tech",
-    "soc.kvet.ch",
-    "soc.mod-12.com",
-    "soc.nes.sh",
-    "soc.nochn.net",
-    "soc.noob.quest",
-    "soc.nunolopes.co",
-    "soc.nym.se",
-    "soc.ottr.uk",
-    "soc.oyasai-jct.net",
-    "soc.phreedom.club",
-    "soc.psynet.me",
-    "soc.punktrash.club",
-    "soc.pyrox.dev",
-    "soc.redeyes.site",
-    "soc.rnrd.eu",
-    "soc.saiyajin.space",
-    "soc.schuerz.at",
-    "soc.sekundenklebertransportverbot.de",
-    "soc.stepman.guide",
-    "soc.triangleidiot.online",
-    "soc.ua-fediland.de",
-    "soc.ultratumba.dynu.net",
-    "soc.umrath.net",
-    "soc.unixcat.net",
-    "soc.utzer.de",
-    "soc.vis4valentine.com",
-    "soc.webair.xyz",
-    "soc.zom.bi",
-    "soc42.com",
-    "socal.rooby.io",
-    "socel.net",
-    "socia.dev",
-    "sociaal.cirkeltrek.nl",
-    "sociabl.be",
-    "sociafk.mym41l.co.uk",
-    "social-entorno-pruebas.wikimedia.es",
-    "social-me.online",
-    "social-systems.space",
-    "social-t.uibk.ac.at",
-    "social-test.davidlohner.eu",
-    "social-test.sunet.se",
-    "social-wahn.de",
-    "social.0badc0.de",
-    "social.0daysto.live",
-    "social.0ko.me",
-    "social.0x.kiwi",
-    "social.0x2142.com",
-    "social.0x4711.org",
-    "social.0x6a64.com",
-    "social.0x705h.com",
-    "social.0xa1.red",
-    "social.0xc0edba.be",
-    "social.1000grad.com",
-    "social.12vpx.com",
-    "social.13-dx.de",
-    "social.1bitsquared.com",
-    "social.1up.ninja",
-    "social.1xx.io",
-    "social.1zl.nl",
-    "social.2600hz.site",
-    "social.33co.de",
-    "social.343max.de",
-    "social.3detplus.ch",
-    "social.3dots.lv",
-    "social.3q3.de",
-    "social.4142.io",
-    "social.465789.xyz",
-    "social.4f9e1738.ignorelist.com",
-    "social.4gl.io",
-    "social.4score7pongs.com",
-    "social.4vr.me",
-    "social.52wochen.org",
-    "social.56k.guru",
-    "social.584817.xyz",
-    "social.5f9.de",
-    "social.5ma.eu",
-    "social.5pace.cloud",
-    "social.64i.de",
-    "social.9tail.net",
-    "social.a11y.fr",
-    "social.a2.io",
-    "social.a3size.com",
-    "social.aa.net.uk",
-    "social.aaroncrocco.com",
-    "social.abakas.com",
-    "social.abdulakh.fun",
-    "social.abohiccups.com",
-    "social.abolivier.bzh",
-    "social.abraum.de",
-    "social.abwesend.com",
-    "social.accessbhsystems.com",
-    "social.accolades.coop",
-    "social.accum.se",
-    "social.aclevo.com",
-    "social.action0.com",
-    "social.adamasnemesis.com",
-    "social.adamperfect.com",
-    "social.adamwolf.org",
-    "social.adawesome.tech",
-    "social.adeptor.ru",
-    "social.adlerhorst.net",
-    "social.adlerweb.info",
-    "social.adm.ink",
-    "social.admin.ch",
-    "social.admtz.fr",
-    "social.adridoesthings.com",
-    "social.advancedsoftware.engineering",
-    "social.afontaine.dev",
-    "social.afront.org",
-    "social.after-work-photo.eu",
-    "social.aghd.org",
-    "social.agnos.is",
-    "social.aguilera.soy",
-    "social.ahlroos.me",
-    "social.aklsh.me",
-    "social.akrabat.com",
-    "social.akunyiba.net",
-    "social.alacasa.fr",
-    "social.alarsyo.net",
-    "social.aldiserver.de",
-    "social.alebit.com",
-    "social.alemi.dev",
-    "social.alesan.io",
-    "social.alexayers.com",
-    "social.alexdobin.com",
-    "social.alexhyett.com",
-    "social.alexn.org",
-    "social.alexschroeder.ch",
-    "social.alexwlchan.net",
-    "social.alfredbuehler.ch",
-    "social.algathia.fr",
-    "social.aliceice.de",
-    "social.alliejp.tv",
-    "social.allmers.de",
-    "social.allround.digital",
-    "social.alorenzi.eu",
-    "social.alphasupport.xyz",
-    "social.alquimidia.org",
-    "social.alster.space",
-    "social.alt-text.org",
-    "social.alteria.xyz",
-    "social.alternativebit.fr",
-    "social.alternatives.network",
-    "social.altetanke.com",
-    "social.altgothic.com",
-    "social.alton.cloud",
-    "social.alyve.be",
-    "social.alyx.pink",
-    "social.am-networks.fr",
-    "social.amas.dev",
-    "social.amatriain.site",
-    "social.amauryjoly.fr",
-    "social.amd.im",
-    "social.amefrea.space",
-    "social.amichan.de",
-    "social.amsterdam.nl",
-    "social.anacreonte.eu",
-    "social.anafabula.de",
-    "social.analogpixels.online",
-    "social.anantshri.info",
-    "social.anaproy.nl",
-    "social.anarchy-nomad.de",
-    "social.anartist.org",
-    "social.anayo.de",
-    "social.anchel.nl",
-    "social.ancow.name",
-    "social.andreva.cc",
-    "social.andrew.rip",
-    "social.anemoneprune.fr",
-    "social.anime-avatar.moe",
-    "social.animeprincess.net",
-    "social.animint.fr",
-    "social.anjara.eu",
-    "social.annacon.be",
-    "social.anno79.de",
-    "social.anoxinon.de",
-    "social.anthro.fun",
-    "social.anthropi.st",
-    "social.antifa.gmbh",
-    "social.antio.top",
-    "social.antonywalton.com",
-    "social.anufrij.de",
-    "social.aoxiang.online",
-    "social.apcn.nz",
-    "social.apes.org.uk",
-    "social.apfelfunk.com",
-    "social.applied-langua.ge",
-    "social.appuio.ch",
-    "social.apreslanu.it",
-    "social.aptx-4869.de",
-    "social.arachnitech.com",
-    "social.arazil.net",
-    "social.arbolitoloco.xyz",
-    "social.arcaneassociation.network",
-    "social.arcanelab.net",
-    "social.arcatar.com",
-    "social.archworks.co",
-    "social.arctian.org",
-    "social.arctron.nl",
-    "social.ardchey.com",
-    "social.arekkusu.net",
-    "social.arinbasu.online",
-    "social.ariona.fr",
-    "social.arkm.de",
-    "social.arnaus.net",
-    "social.arneckestrasse.de",
-    "social.arneson.org",
-    "social.arpakuut.io",
-    "social.arroutaflix.com",
-    "social.ars.electronica.art",
-    "social.artemislena.eu",
-    "social.artificialgravity.dev",
-    "social.artsytype.com",
-    "social.as59715.net",
-    "social.as743.org",
-    "social.asafniv.me",
-    "social.asdf.wf",
-    "social.asgardius.company",
-    "social.asjk.xyz",
-    "social.askleo.com",
-    "social.asobear.com",
-    "social.asraelvudogel.de",
-    "social.astralsystem.com",
-    "social.asturias.red",
-    "social.ataxya.net",
-    "social.atho.me",
-    "social.atiusamy.com",
-    "social.atom42-games.ru",
-    "social.atommac.com",
-    "social.atovia.org",
-    "social.attlas.tech",
-    "social.atypique.net",
-    "social.auc.edu.au",
-    "social.audacis.net",
-    "social.audiovalentine.com",
-    "social.aufentha.lt",
-    "social.authbypass.com",
-    "social.authorhelp.uk",
-    "social.automaphoni.ca",
-    "social.averge.eu",
-    "social.avery.cafe",
-    "social.aviating.com",
-    "social.awmb.uk",
-    "social.axbom.com",
-    "social.axidstudios.com",
-    "social.axiixc.com",
-    "social.ayco.io",
-    "social.aylett.co.uk",
-    "social.azcyouth.in",
-    "social.azkware.net",
-    "social.azlux.fr",
-    "social.azuki.co",
-    "social.azunyu.moe",
-    "social.azureheads.gr",
-    "social.b0t.at",
-    "social.b10m.net",
-    "social.b4tech.cc",
-    "social.bacardi55.io",
-    "social.badabam.net",
-    "social.badjack.org",
-    "social.bakdos.de",
-    "social.bakunin.nohost.me",
-    "social.balad.in",
-    "social.balpha.de",
-    "social.balsillie.net",
-    "social.bannedwagon.team",
-    "social.baradoz.cloud",
-    "social.barcelona",
-    "social.bardia.tech",
-    "social.bartificer.ie",
-    "social.basilweb.net",
-    "social.bastelbude.eu",
-    "social.batpa.ws",
-    "social.bau-ha.us",
-    "social.bau-ha.us.",
-    "social.baubs.net",
-    "social.bawnet.io",
-    "social.bbc",
-    "social.bbdao.dev",
-    "social.bd.pub",
-    "social.bdash.net.nz",
-    "social.beachcom.org",
-    "social.beardishly.com",
-    "social.bearygoosey.com",
-    "social.beaware.live",
-    "social.beebl.es",
-    "social.begyn.be",
-    "social.beispieltext.net",
-    "social.belkadan.com",
-    "social.benjaminturner.me",
-    "social.benlopatin.com",
-    "social.benny.de",
-    "social.berry.consulting",
-    "social.bert.org",
-    "social.beshir.org",
-    "social.besties.house",
-    "social.bethejustin.com",
-    "social.beutner.name",
-    "social.bgp.rodeo",
-    "social.biblioco.de",
-    "social.bierochs.org",
-    "social.bigcavemaps.com",
-    "social.bij1.org",
-    "social.bim.land",
-    "social.bimtv.dev",
-    "social.binarydad.com",
-    "social.bird.style",
-    "social.bissgigi.art",
-    "social.bitbybitwhatever.com",
-    "social.bitdrift.io",
-    "social.bitfolk.com",
-    "social.bitplumber.de",
-    "social.bitsammelwanne.de",
-    "social.bitschubser.dev",
-    "social.bitsec.org",
-    "social.bitsofsimplicity.com",
-    "social.bitten2up.dev",
-    "social.bitwig.community",
-    "social.blach.io",
-    "social.blackmetal.club",
-    "social.blakesmith.me",
-    "social.blep.cz",
-    "social.blimped.net",
-    "social.blinkfire.ai",
-    "social.blipdrifter.com",
-    "social.bloecker.dev",
-    "social.blogsofwar.com",
-    "social.bloom.casa",
-    "social.bloomanalytics.net",
-    "social.blueforest.cc",
-    "social.blueshell.club",
-    "social.bngtzn.se",
-    "social.bnrub.in",
-    "social.bobek.cz",
-    "social.boeckli.net",
-    "social.boelz.eu",
-    "social.bonifacelabs.ca",
-    "social.boochan.family",
-    "social.boom.army",
-    "social.bopinions.de",
-    "social.boykisser.systems",
-    "social.br-linux.org",
-    "social.br0ken.de",
-    "social.brage.fr",
-    "social.brainsys.com",
-    "social.braxo.se",
-    "social.bremen.social",
-    "social.brennanbenkert.com",
-    "social.briankoopman.com",
-    "social.brianmorrison.com",
-    "social.briller.one",
-    "social.brittle.st",
-    "social.broforce.gay",
-    "social.brokaw.org",
-    "social.brokenbydesign.org",
-    "social.brothertec.eu",
-    "social.browser.org",
-    "social.brucknerite.net",
-    "social.brunk.io",
-    "social.brunomassa.com",
-    "social.bsc.ovh",
-    "social.btbytes.com",
-    "social.bternes.com",
-    "social.buffering.rocks",
-    "social.buller.cc",
-    "social.bumbleflies.de",
-    "social.bunch.dev",
-    "social.bund.co",
-    "social.bund.de",
-    "social.bundesparlament.de",
-    "social.burch-hill.com",
-    "social.burschel.com",
-    "social.busterboys.net",
-    "social.butnot.today",
-    "social.butt.team",
-    "social.butterknifeestates.com",
-    "social.buzzworkers.com",
-    "social.bwpost.online",
-    "social.bytten-studio.com",
-    "social.c-zert.nl",
-    "social.c1710.de",
-    "social.c18l.com",
-    "social.c3l.lu",
-    "social.caa-ins.org",
-    "social.cabotcove.us",
-    "social.cadusilva.com",
-    "social.callingallpapers.com",
-    "social.campusgemeinde.de",
-    "social.careerminder.io",
-    "social.cartaxo.eu",
-    "social.caruso.one",
-    "social.caserio.de",
-    "social.caskey-demaret.se",
-    "social.casuallyblue.dev",
-    "social.catboy.airforce",
-    "social.cativa.net",
-    "social.cavac.at",
-    "social.caviala.de",
-    "social.cbeck.dev",
-    "social.ccc-ffm.space",
-    "social.ccw.icu",
-    "social.cdacosta.com",
-    "social.cemocom.de",
-    "social.ceod.net",
-    "social.ceyal.me",
-    "social.cezeri.tech",
-    "social.ch4lox.com",
-    "social.chadda.se",
-    "social.chadwaltercummings.me",
-    "social.championpictures.at",
-    "social.chaos.fyi",
-    "social.chaos.koeln",
-    "social.chaotikum.org",
-    "social.charlesbeadle.tech",
-    "social.chatty.monster",
-    "social.chiefgyk3d.com",
-    "social.chilliet.eu",
-    "social.chilly.cloud",
-    "social.chinwag.org",
-    "social.chireiden.cafe",
-    "social.chregu.tv",
-    "social.chriswb.dev",
-    "social.chvp.be",
-    "social.ciaranmc.com",
-    "social.cibernautas.club",
-    "social.circl.lu",
-    "social.cisoft.co.cr",
-    "social.citizensoasis.com",
-    "social.citsc.de",
-    "social.city-of-glass.net",
-    "social.cizmar.net",
-    "social.clacks.network",
-    "social.clawhammer.net",
-    "social.cliffhouse.app",
-    "social.clotted-cream.dev",
-    "social.cloudless.world",
-    "social.cloudonaut.io",
-    "social.cloudron.io",
-    "social.cms.garden",
-    "social.cnschn.com",
-    "social.coabai.com",
-    "social.coates.life",
-    "social.cobalto.net",
-    "social.cobryce.com",
-    "social.code-feather.de",
-    "social.codehearth.com",
-    "social.codespawn.space",
-    "social.codethink.co.uk",
-    "social.codeword.info",
-    "social.codi.moe",
-    "social.codigoparallevar.com",
-    "social.coffeeshopped.com",
-    "social.cofob.dev",
-    "social.colectif.de",
-    "social.coletivos.org",
-    "social.colinmartin.com",
-    "social.colinschlueter.com",
-    "social.collies.dev",
-    "social.cologne",
-    "social.comacero.com",
-    "social.compensis.de",
-    "social.completext.com",
-    "social.computational.beauty",
-    "social.computerfox.xyz",
-    "social.computermachin.es",
-    "social.connorbode.me",
-    "social.conrad.cafe",
-    "social.consoledated.com",
-    "social.consummatetinkerer.net",
-    "social.control9.dev",
-    "social.coolbug.org",
-    "social.coolsma.com",
-    "social.cooltux.net",
-    "social.coop",
-    "social.corteel.org",
-    "social.corticarte.com",
-    "social.cosnomi.com",
-    "social.cotman.info",
-    "social.cottongin.xyz",
-    "social.coukaratcha.fr",
-    "social.cowingtonpost.com",
-    "social.cowokr.de",
-    "social.coyote.name",
-    "social.cozytronics.com",
-    "social.cpress.org",
-    "social.crablab.uk",
-    "social.crabs.life",
-    "social.craig0990.net",
-    "social.crate.foi.se",
-    "social.crazydan.org",
-    "social.crem.in",
-    "social.crew23.de",
-    "social.criminallycute.fi",
-    "social.crinstamcamp.com",
-    "social.critter.camp",
-    "social.critter.ink",
-    "social.crop.selfhost.co",
-    "social.crouchingpanda.co.za",
-    "social.crowsnestlanding.com",
-    "social.cryptography.dog",
-    "social.cs.swarthmore.edu",
-    "social.cscip.io",
-    "social.ctrlz.es",
-    "social.ctsollars.com",
-    "social.cu-it.de",
-    "social.cu2d.com",
-    "social.cultofprimes.com",
-    "social.curious.bio",
-    "social.curlyphries.net",
-    "social.cute.engineering",
-    "social.cutiecluster.cc",
-    "social.cwill.us",
-    "social.cwts.nl",
-    "social.cyannyan.com",
-    "social.cyano.at",
-    "social.cyberendroit.net",
-    "social.cyberhelden.com",
-    "social.cyberspark.co.uk",
-    "social.cybre.town",
-    "social.cyrusbio.com",
-    "social.d2evs.net",
-    "social.dachs-it.de",
-    "social.daemonlair.org",
-    "social.daenarion.com",
-    "social.dairydemon.net",
-    "social.daleth.cafe",
-    "social.dallasgroot.ca",
-    "social.damianwajer.com",
-    "social.damu.page",
-    "social.daneknecht.com",
-    "social.danger.blue",
-    "social.daniel-spilker.eu",
-    "social.danielmaxson.com",
-    "social.danksquad.org",
-    "social.danpalmer.me",
-    "social.dansonline.space",
-    "social.danux.uk",
-    "social.darc.de",
-    "social.dario.cloud",
-    "social.darkcrow.org",
-    "social.darn.fish",
-    "social.darndt.de",
-    "social.darnielle.me",
-    "social.daspr.io",
-    "social.data.coop",
-    "social.datalabour.com",
-    "social.datanoodles.net",
-    "social.datarek.nl",
-    "social.datenschutz-guru.de",
-    "social.datsteves.me",
-    "social.dauen.name",
-    "social.dave-vlab.com",
-    "social.davesnider.com",
-    "social.davidbrush.info",
-    "social.dawdling.net",
-    "social.dayvancowboy.net",
-    "social.dbkr.me",
-    "social.dbzfans.online",
-    "social.dc6jgk.de",
-    "social.dcsl.dk",
-    "social.ddrpodcast.com",
-    "social.deadbeef.cafe",
-    "social.deckard.apps.glenux.net",
-    "social.decrue.be",
-    "social.defenestrate.it",
-    "social.degrowth.club",
-    "social.dekay.se",
-    "social.delaage.org",
-    "social.delcake.com",
-    "social.deliwa.me",
-    "social.deltabeard.com",
-    "social.demariaaviation.com",
-    "social.demi-sec.org",
-    "social.demonix.fr",
-    "social.denbby.com",
-    "social.densco.net",
-    "social.denseanalysis.org",
-    "social.desbasques.com",
-    "social.design.systems",
-    "social.detektor.fm",
-    "social.detroit.hockey",
-    "social.deuill.org",
-    "social.dev-c.at",
-    "social.dev-qq.de",
-    "social.dev-wiki.de",
-    "social.devanooga.com",
-    "social.devnamic.com",
-    "social.devopsdays.org",
-    "social.devries.frl",
-    "social.devsnorte.com",
-    "social.devteams.at",
-    "social.dextender.com",
-    "social.dezinezync.com",
-    "social.dgrammatiko.dev",
-    "social.di2.io",
-    "social.di20.de",
-    "social.diableco.com",
-    "social.diamondcreeper.org",
-    "social.dianthus.site",
-    "social.dib.de",
-    "social.diehildebrands.de",
-    "social.diehumanisten.de",
-    "social.diekershoff.de",
-    "social.digital-artifacts.net",
-    "social.digitaldragon.dev",
-    "social.digitalesozialearbeit.de",
-    "social.digitalmountains.co.uk",
-    "social.digitalundso.net",
-    "social.dilavni.com",
-    "social.diluvian.cc",
-    "social.dimitar.dev",
-    "social.dinn.ca",
-    "social.dino.icu",
-    "social.dinoex.de",
-    "social.dinoleaf.com",
-    "social.dinotopia.org",
-    "social.diod.es",
-    "social.dirigibly.ltd",
-    "social.dirik.no",
-    "social.diskseven.com",
-    "social.disputemag.com",
-    "social.dissidence.ovh",
-    "social.diva.exchange",
-    "social.dje.li",
-    "social.djuber.name",
-    "social.dlazaro.ca",
-    "social.dm4.tw",
-    "social.dmcblue.com",
-    "social.dmorozov.info",
-    "social.dmz.skyfritt.net",
-    "social.dnitza.com",
-    "social.dnix.de",
-    "social.do.srb2.org",
-    "social.dociq.io",
-    "social.dog-s.global",
-    "social.doggoat.de",
-    "social.doghub.eu",
-    "social.dogondo.de",
-    "social.dolphin-emu.org",
-    "social.doma.dev",
-    "social.domjh.com",
-    "social.domov.de",
-    "social.donadvr.de",
-    "social.donkeymedia.eu",
-    "social.dont-panic.quest",
-    "social.dorf-post.de",
-    "social.dos-dingos.com",
-    "social.doseofnews.com",
-    "social.doshi.re",
-    "social.dotyonline.net",
-    "social.downey.net",
-    "social.dpb587.me",
-    "social.dragonsare.gay",
-    "social.dragoofamily.com",
-    "social.drastical.tech",
-    "social.drazisil.com",
-    "social.drenth.xyz",
-    "social.drgnz.club",
-    "social.driftless.dev",
-    "social.driveby.cool",
-    "social.dromografos.report",
-    "social.drop.moe",
-    "social.dropbear.xyz",
-    "social.droppedbits.com",
-    "social.dryan.com",
-    "social.dryusdan.fr",
-    "social.ds106.us",
-    "social.dsanj.org",
-    "social.dsbeans.com",
-    "social.dsimon.com",
-    "social.dsmouse.net",
-    "social.dssc.io",
-    "social.dssr.ch",
-    "social.dual-space.solutions",
-    "social.duan.ca",
-    "social.duarte.vg",
-    "social.duckie.chat",
-    "social.duclaria.com",
-    "social.duergner.io",
-    "social.dumijay.com",
-    "social.dunamisanddragons.com",
-    "social.duplos.org",
-    "social.durell.net",
-    "social.dusanmitrovic.xyz",
-    "social.dvsn.net",
-    "social.dwards.org",
-    "social.dynamicfiles.de",
-    "social.dytrych.cloud",
-    "social.e-editiones.org",
-    "social.earth.li",
-    "social.eastmetrocommunitymusic.org",
-    "social.easya.solutions",
-    "social.easyrpg.org",
-    "social.ecliptik.com",
-    "social.eden.one",
-    "social.edgeoftheuniver.se",
-    "social.edist.ro",
-    "social.edu.nl",
-    "social.edzilla.info",
-    "social.effy.space",
-    "social.egalwaat.lu",
-    "social.ei8fdb.org",
-    "social.eichler-bg.de",
-    "social.eiden.ch",
-    "social.eightballde.luxe",
-    "social.ekseiz.com",
-    "social.elarial.tech",
-    "social.elbespace.de",
-    "social.elbullazul.com",
-    "social.electrafish.tech",
-    "social.electrickite.org",
-    "social.elia.garden",
-    "social.ellie.pet",
-    "social.ellijaymakerspace.org",
-    "social.elmoecho.de",
-    "social.elstabloserver.de",
-    "social.em.id.lv",
-    "social.ember.li",
-    "social.emfcamp.org",
-    "social.emily.news",
-    "social.emisocks.com",
-    "social.emma.coop",
-    "social.empathytree.org",
-    "social.emphisia.nl",
-    "social.encryptomatic.com",
-    "social.eng.chat",
-    "social.engard.me",
-    "social.epenguin.com",
-    "social.ephaone.org",
-    "social.eqver.se",
-    "social.ericandamanda.net",
-    "social.ericcodes.io",
-    "social.ericvandam.me",
-    "social.ericwbailey.website",
-    "social.erikinkinen.fi",
-    "social.ersei.net",
-    "social.erti.us",
-    "social.erw.ink",
-    "social.esadhar.net",
-    "social.esmailelbob.xyz",
-    "social.esmarconf.org",
-    "social.espeweb.net",
-    "social.etacassiopeiae.net",
-    "social.etc-services.de",
-    "social.etke.cc",
-    "social.etwas42.de",
-    "social.etwg.xyz",
-    "social.eubf.net",
-    "social.europlus.zone",
-    "social.eviealways.com",
-    "social.evilcyberhacker.net",
-    "social.evilma.id",
-    "social.evl.im",
-    "social.evolved.systems",
-    "social.ewatchers.org",
-    "social.exclaimindustries.net",
-    "social.exo.icu",
-    "social.exotic.sh",
-    "social.exozy.me",
-    "social.exs.gay",
-    "social.extremelyoffline.org",
-    "social.eyluldogruel.com",
-    "social.f1sh.de",
-    "social.fabean.xyz",
-    "social.factorial.io",
-    "social.fairphone.community",
-    "social.fallenbeck.com",
-    "social.fanbards.net",
-    "social.fantorovevo.com",
-    "social.farend.co.jp",
-    "social.fast-break.de",
-    "social.fast-email.link",
-    "social.fbievan.live",
-    "social.fbsweb.de",
-    "social.fbxl.net",
-    "social.fcourtois.net",
-    "social.fd-ag.de",
-    "social.feastcoast.com",
-    "social.feather.onl",
-    "social.feathers.link",
-    "social.fedcast.ch",
-    "social.fedida.com",
-    "social.fedinet.de",
-    "social.fedipost.net",
-    "social.fediverse.events",
-    "social.feelslike.life",
-    "social.feep.org",
-    "social.feinschmeckergarten.de",
-    "social.fennell.dev",
-    "social.ferd.at",
-    "social.ferrocarril.net",
-    "social.ferrous-systems.com",
-    "social.festus-asbestos.ca",
-    "social.fetedelamusique.de",
-    "social.fetziverse.de",
-    "social.ffconf.org",
-    "social.ffl.name",
-    "social.ffmuc.net",
-    "social.fidart.it",
-    "social.fifteen40.com",
-    "social.filik.eu",
-    "social.filipesm.eu",
-    "social.fimpern.de",
-    "social.findmyown.space",
-    "social.fingerprintsoftware.ca",
-    "social.finkhaeuser.de",
-    "social.finsec.systems",
-    "social.finton.cc",
-    "social.firescry.com",
-    "social.firlefanz.one",
-    "social.fisch3rs.de",
-    "social.fischbyte.de",
-    "social.fishpool.org",
-    "social.flaig.name",
-    "social.flal.net",
-    "social.flipboard.com",
-    "social.flipdot.org",
-    "social.floof.org",
-    "social.florianjensen.com",
-    "social.fluxfox.dev",
-    "social.flylumo.co.uk",
-    "social.fmvilas.me",
-    "social.fnev.eu",
-    "social.focused.systems",
-    "social.foederiert.de",
-    "social.fogcloud.org",
-    "social.fohte.net",
-    "social.fomin.site",
-    "social.foolish.computer",
-    "social.forestroad.xyz",
-    "social.forgesparks.com",
-    "social.forgottentea.xyz",
-    "social.forstner.dev",
-    "social.foss.place",
-    "social.fossdle.org",
-    "social.fossee.net",
-    "social.fouquet.me",
-    "social.foxdn.net",
-    "social.foxes.life",
-    "social.foxskulk.org",
-    "social.fpsource.info",
-    "social.fqserv.eu",
-    "social.franco.net.eu.org",
-    "social.franssen.xyz",
-    "social.fredrikohlin.com",
-    "social.freeland.country",
-    "social.freetalklive.com",
-    "social.freifunk-ansbach.de",
-    "social.freifunk.net",
-    "social.freya.cat",
-    "social.fribbledom.com",
-    "social.fricklers.org",
-    "social.fringe.com",
-    "social.frith.dev",
-    "social.frndc.de",
-    "social.fro.ge",
-    "social.frogeye.fr",
-    "social.froghat.ca",
-    "social.froonix.org",
-    "social.frrobert.com",
-    "social.ft-k.de",
-    "social.ftm.nl",
-    "social.fuhlbrueck.net",
-    "social.fungalhalo.com",
-    "social.funkwhale.audio",
-    "social.funnyna.me",
-    "social.furry.nz",
-    "social.furryrefuge.com",
-    "social.fussenegger.pro",
-    "social.futurnumerique.com",
-    "social.fuzzyoverlords.org",
-    "social.fym.moe",
-    "social.fz-juelich.de",
-    "social.g5t.de",
-    "social.gabekangas.com",
-    "social.gabisonntag.art",
-    "social.gajsin.name",
-    "social.galacticcoders.com",
-    "social.galaxy-control.org",
-    "social.gallauner.fun",
-    "social.gamesathome.net",
-    "social.gamingecke.space",
-    "social.ganba.re",
-    "social.garnix.dev",
-    "social.garudalinux.org",
-    "social.gautampk.com",
-    "social.gaycum.de",
-    "social.gbraad.nl",
-    "social.geekwisdom.org",
-    "social.gekritzel.at",
-    "social.gemnoc.ca",
-    "social.generallyrubbish.net",
-    "social.genesismachina.ca",
-    "social.genky.duckdns.org",
-    "social.genya0407.link",
-    "social.georgeb.net",
-    "social.gerben.dev",
-    "social.gerbet.me",
-    "social.gergen.family",
-    "social.gerotintin.com",
-    "social.gerwitz.com",
-    "social.gfsc.studio",
-    "social.ghost7.com",
-    "social.giantstagbeetle.com",
-    "social.gibiris.org",
-    "social.gilespaterson.com",
-    "social.gillich.me",
-    "social.gitea.io",
-    "social.giurdanella.it",
-    "social.giurgiu.io",
-    "social.gkstn.de",
-    "social.gl-como.it",
-    "social.gladtherescake.eu",
-    "social.glass-lab.net",
-    "social.glennfitzpatrick.com",
-    "social.gllmr.fr",
-    "social.globalpirates.net",
-    "social.glyphy.com",
-    "social.gmtz.me",
-    "social.gnieh.org",
-    "social.gnuweeb.org",
-    "social.goatzone.net",
-    "social.goblfc.org",
-    "social.gochiuma.net",
-    "social.godataflow.com",
-    "social.golurk.de",
-    "social.goober.cloud",
-    "social.goodanser.com",
-    "social.goonj.xyz",
-    "social.goose.rodeo",
-    "social.gorritodeplata.xyz",
-    "social.gould.cx",
-    "social.gpiccolo.com",
-    "social.gr-al-ch.duckdns.org",
-    "social.gr0k.net",
-    "social.grafo.zone",
-    "social.grahamedgecombe.com",
-    "social.grahamharper.net",
-    "social.granularperspective.com",
-    "social.grautier.com",
-    "social.graves.cl",
-    "social.gravitons.org",
-    "social.greinr.com",
-    "social.griesser.me",
-    "social.griff.la",
-    "social.grimneko.de",
-    "social.grnwds.uk",
-    "social.grobwiefein.de",
-    "social.groene.nl",
-    "social.growyourown.services",
-    "social.growzrom.org",
-    "social.grunert.dev",
-    "social.gt-mod.site",
-    "social.gtw.lt",
-    "social.guaranteedstruggle.host",
-    "social.guckt.info",
-    "social.gugod.fr",
-    "social.gulacsi.eu",
-    "social.gulas.ch",
-    "social.gunju.de",
-    "social.gyahunkoubou.biz",
-    "social.gyahunkoubou.com",
-    "social.gyt.is",
-    "social.h12r.de",
-    "social.hach.chat",
-    "social.hackea.org",
-    "social.hackersgarage.dev",
-    "social.hackerspace.pl",
-    "social.hackistliebe.de",
-    "social.hacktheplanet.be",
-    "social.hairydiode.xyz",
-    "social.haj.gf",
-    "social.halfast.com",
-    "social.halfling13.com",
-    "social.halfrealm.com",
-    "social.handlerug.me",
-    "social.hanntac.net",
-    "social.harakiri.pw",
-    "social.harding.dev",
-    "social.hardlimit.com",
-    "social.harekiet.com",
-    "social.harpia.red",
-    "social.harter.us",
-    "social.harukizaemon.com",
-    "social.haven.family",
-    "social.haveyouevenmet.me",
-    "social.hayalmasal.org",
-    "social.headbright.eu",
-    "social.heathanderson.net",
-    "social.hechtinsgefecht.de",
-    "social.heck.beer",
-    "social.heiber.im",
-    "social.heinlein-support.de",
-    "social.heise.de",
-    "social.helios42.de",
-    "social.hell0friend.de",
-    "social.helpmedog.com",
-    "social.helpsterte.eu",
-    "social.hendrixgames.com",
-    "social.here.blue",
-    "social.hergorn.com",
-    "social.herrhannes.de",
-    "social.hessen.de",
-    "social.hetnieuweinstituut.nl",
-    "social.hetzel.net",
-    "social.hifriends.info",
-    "social.hillprice.net",
-    "social.hinter.bayern",
-    "social.hintersphere.com",
-    "social.hispabot.freemyip.com",
-    "social.hit.moe",
-    "social.hkit.de",
-    "social.hnnng.space",
-    "social.hnws.me",
-    "social.hodgson.io",
-    "social.hodos.ro",
-    "social.holocaust.tatar",
-    "social.holovaty.com",
-    "social.home.retiolus.net",
-    "social.homeland.network",
-    "social.hoppet.cool",
-    "social.horak.hu",
-    "social.horrid-creatu.re",
-    "social.horrorhub.club",
-    "social.hosted.eu.org",
-    "social.hostpath.de",
-    "social.houngbo.net",
-    "social.house-of.xyz",
-    "social.housesmith.dev",
-    "social.hows.id.au",
-    "social.hp-gauster.name",
-    "social.htoo.de",
-    "social.hubrecht.ovh",
-    "social.huginn.uk",
-    "social.hulb.club",
-    "social.huslage.com",
-    "social.hutch.chat",
-    "social.huyduong.com",
-    "social.hwsc.link",
-    "social.hylas.au",
-    "social.hyp3r.link",
-    "social.hypernodemedia.com",
-    "social.hyteck.de",
-    "social.hyuki.net",
-    "social.i-solutions.dev",
-    "social.iamglenn.be",
-    "social.iavael.name",
-    "social.icewind.nl",
-    "social.ichibi.eu",
-    "social.ichor.work",
-    "social.icod.de",
-    "social.ifthenel.se",
-    "social.igotout.de",
-    "social.igox.org",
-    "social.iheartmichelle.com",
-    "social.illegalpornography.com",
-    "social.illusory.ink",
-    "social.imastags.com",
-    "social.imirhil.fr",
-    "social.immibis.com",
-    "social.in-athens.gr",
-    "social.in-purple.de",
-    "social.incenp.org",
-    "social.incrementby.one",
-    "social.indycompanion.com",
-    "social.inetol.net",
-    "social.informatic.ai",
-    "social.infoteddy.info",
-    "social.inmediahk.net",
-    "social.inrollio.com",
-    "social.insider-it.de",
-    "social.insula.org.ua",
-    "social.int21.dev",
-    "social.int21h.eu",
-    "social.integritymo.de",
-    "social.inter-mundos.de",
-    "social.interferencias.tech",
-    "social.intergalactic.computer",
-    "social.interlan.ec",
-    "social.interru.io",
-    "social.intothecloud.net",
-    "social.invalidentry.engineer",
-    "social.invisible.ch",
-    "social.inzeiten.de",
-    "social.io18.top",
-    "social.ionazun.net",
-    "social.ions.sh",
-    "social.ipfire.org",
-    "social.ipsyn.net",
-    "social.irinadragos.co.uk",
-    "social.ironboundsoftware.com",
-    "social.irrwitz.com",
-    "social.isaa.it",
-    "social.ishikuro.info",
-    "social.issacdowling.com",
-    "social.it-xpert.biz",
-    "social.iterna.de",
-    "social.itfm.xyz",
-    "social.itm.osaka",
-    "social.itsumoonazicode.com",
-    "social.itsze.ro",
-    "social.itu.dk",
-    "social.ivor.org",
-    "social.ivydra.com",
-    "social.iwanthorror.com",
-    "social.iwascoding.com",
-    "social.j62.de",
-    "social.jabjab.de",
-    "social.jackhumphrey.me",
-    "social.jacklinke.com",
-    "social.jackscott.id.au",
-    "social.jacobi-bs.de",
-    "social.jacobian.org",
-    "social.jacobpa.com",
-    "social.jakob.space",
-    "social.jamstation.ddns.net",
-    "social.jaredzimmerman.com",
-    "social.jasnell.me",
-    "social.jasondavies.com",
-    "social.jasonjgw.net",
-    "social.jasonsanta.xyz",
-    "social.jaypee.solutions",
-    "social.jazzbutcher.com",
-    "social.jcarbaugh.com",
-    "social.jcm.re",
-    "social.jcs-net.de",
-    "social.jcs.org",
-    "social.jdbnet.co.uk",
-    "social.jedillama.net",
-    "social.jeffl.es",
-    "social.jellejansen.eu",
-    "social.jelliefrontier.net",
-    "social.jeronimodesign.com",
-    "social.jerrynya.fun",
-    "social.jesser.dev",
-    "social.jesuislibre.net",
-    "social.jh220.de",
-    "social.jifish.co.uk",
-    "social.jigmedatse.com",
-    "social.jirutka.cz",
-    "social.jjgadgets.tech",
-    "social.jjohnson.org",
-    "social.jlamothe.net",
-    "social.jlinuxer.org",
-    "social.jliu.xyz",
-    "social.jlkj.de",
-    "social.jmenning.com",
-    "social.jmstevens.ca",
-    "social.joelle.us",
-    "social.joelwatts.com",
-    "social.joespace.ca",
-    "social.johnassel.de",
-    "social.johnwarne.com",
-    "social.jolheiser.com",
-    "social.jonaskoeritz.de",
-    "social.jonathancandler.com",
-    "social.joncamfield.com",
-    "social.joncaruana.com",
-    "social.jondev.lol",
-    "social.joomla.org",
-    "social.jorquera.net",
-    "social.joshanders.com",
-    "social.joshlevy.ca",
-    "social.joshrandall.net",
-    "social.joshthomas.dev",
-    "social.joshtriplett.org",
-    "social.joshuaochs.com",
-    "social.jp3d.de",
-    "social.jpa.com",
-    "social.jpi.io",
-    "social.jrg.systems",
-    "social.jsantos.eu",
-    "social.jsr.com",
-    "social.jsteuernagel.de",
-    "social.jstsmthrgk.eu",
-    "social.jtn.us",
-    "social.jtworld.net",
-    "social.juanlu.space",
-    "social.jugendarbe.it",
-    "social.jugendhacker.de",
-    "social.juliestbagel.me",
-    "social.juliusgamanyi.com",
-    "social.jumaru.net",
-    "social.jumpartifact.com",
-    "social.jurgenfranse.nl",
-    "social.just-joshin.lol",
-    "social.justcoding.tech",
-    "social.justelex.de",
-    "social.jvan.be",
-    "social.jvns.ca",
-    "social.jwunited.org",
-    "social.k-fx.de",
-    "social.kabela.family",
-    "social.kabi.tk",
-    "social.kaisare.in",
-    "social.kaiteki.app",
-    "social.kakmix.co",
-    "social.kallestruik.nl",
-    "social.kalterwinter.info",
-    "social.kangtaylor.com",
-    "social.kanhuji.eu",
-    "social.kaniyam.cloudns.nz",
-    "social.kanni.de",
-    "social.kaoskvlt.de",
-    "social.kapellen.onl",
-    "social.karabro.net",
-    "social.karapetyans.com",
-    "social.kararyli.net",
-    "social.karebu.gay",
-    "social.karlsson.xyz",
-    "social.karotte.org",
-    "social.karsten-voigt.de",
-    "social.kartoffelcheetah.eu",
-    "social.kazehiko.com",
-    "social.kazu634.com",
-    "social.kd0ioe.com",
-    "social.kechpaja.com",
-    "social.keiths-place.com",
-    "social.kejadlen.dev",
-    "social.kelliwic.net",
-    "social.kemitix.net",
-    "social.kendoo.eu",
-    "social.kennyqin.com",
-    "social.kenodriscoll.com",
-    "social.kern.pm",
-    "social.kernel.org",
-    "social.ketupat.me",
-    "social.kevinvandam.me",
-    "social.kevjack.eu",
-    "social.kghorvath.com",
-    "social.khajiit.de",
-    "social.kharkiv.dcomm.net.ua",
-    "social.khaus.io",
-    "social.kherson.dcomm.net.ua",
-    "social.khmelnytskyi.dcomm.net.ua",
-    "social.khoa.cool",
-    "social.khomri.com",
-    "social.khromatic-myst.com",
-    "social.kiesow.net",
-    "social.kijy.net",
-    "social.kimberlychase.com",
-    "social.kindbook.us",
-    "social.kithop.ca",
-    "social.kittenapproved.com",
-    "social.kittywi.re",
-    "social.kiziah.cloud",
-    "social.klaps.me",
-    "social.klein.ruhr",
-    "social.kleinerdrei.org",
-    "social.klinikretter.de",
-    "social.knot.space",
-    "social.knubbel.me",
-    "social.kodraus.com",
-    "social.koeia.de",
-    "social.koenigsmuenster.de",
-    "social.konecnyjakub.top",
-    "social.kontrollapparat.de",
-    "social.kopis.de",
-    "social.koszarek.dev",
-    "social.koti.site",
-    "social.kotiboksi.xyz",
-    "social.kramse.org",
-    "social.krasovs.ky",
-    "social.krebsco.de",
-    "social.kreuder.me",
-    "social.krige.nl",
-    "social.krisdoc.net",
-    "social.kryta.app",
-    "social.ksite.de",
-    "social.kubiak.me",
-    "social.kuester7.com",
-    "social.kuiper.dog",
-    "social.kultwiki.net",
-    "social.kunveni.net",
-    "social.kusako.de",
-    "social.kyiv.dcomm.net.ua",
-    "social.kylebronsdon.com",
-    "social.l2d2.de",
-    "social.la-scic.fr",
-    "social.la10cy.net",
-    "social.laaw.nrw",
-    "social.laber.berg.cl",
-    "social.labmonkeys.space",
-    "social.laboratomium.de",
-    "social.labriks.com",
-    "social.labsconnect.se",
-    "social.lacheiner.at",
-    "social.lacot.org",
-    "social.ladd.network",
-    "social.lafronz.com",
-    "social.lahevirta.fi",
-    "social.lainon.life",
-    "social.lama-corp.space",
-    "social.lambda.ski",
-    "social.laniustrolling.dev",
-    "social.lank.es",
-    "social.lansky.name",
-    "social.lantredugeek.net",
-    "social.laramy.black",
-    "social.laroche.dev",
-    "social.larus.se",
-    "social.lasanha.org",
-    "social.lauercloud.de",
-    "social.lavanderblue.art",
-    "social.laze.today",
-    "social.lc",
-    "social.learnaddict.academy",
-    "social.learnlangs.com",
-    "social.learntosolveit.com",
-    "social.lebka.at",
-    "social.lecker.coffee",
-    "social.leckse.net",
-    "social.leecalvin.xyz",
-    "social.legionworlds.net",
-    "social.legrand.im",
-    "social.lein.us",
-    "social.leinde.de",
-    "social.lelgenio.xyz",
-    "social.lemee.co",
-    "social.lemue.org",
-    "social.levrailucien.fr",
-    "social.lex-blog.eu",
-    "social.lexevo.net",
-    "social.lfx.dev",
-    "social.lgug2z.com",
-    "social.liberated.network",
-    "social.libre-chat.net",
-    "social.librem.one",
-    "social.librenode.org",
-    "social.lichfieldlive.co.uk",
-    "social.lifeofpablo.com",
-    "social.lifetime.academy",
-    "social.lightbeamapps.com",
-    "social.lightlyseared.online",
-    "social.liip.ch",
-    "social.likeadragonmaid.dev",
-    "social.lil-bird.xyz",
-    "social.lila.network",
-    "social.lilac.lab.shortcord.com",
-    "social.lillin.net",
-    "social.lily.flowers",
-    "social.linc.systems",
-    "social.lindhom.no",
-    "social.linksfraktion.de",
-    "social.lino.cooking",
-    "social.linux-help.org",
-    "social.linux-magazin.de",
-    "social.linux.pizza",
-    "social.linuxine.net",
-    "social.lisathomasius.de",
-    "social.litehell.info",
-    "social.lithio.fr",
-    "social.litu.at",
-    "social.lizzy.rs",
-    "social.lkw.tf",
-    "social.lncn.dev",
-    "social.lnyan.com",
-    "social.lochetfamily.com",
-    "social.locrealloc.de",
-    "social.logicalpilot.com",
-    "social.logilab.org",
-    "social.lokinet.uk",
-    "social.lol",
-    "social.lond.com.br",
-    "social.looprock.com",
-    "social.losno.co",
-    "social.lostcause.house",
-    "social.lostinok.com",
-    "social.lsnet.eu",
-    "social.luap42.de",
-    "social.luca.run",
-    "social.luca0n.com",
-    "social.lucci.xyz",
-    "social.lucentinian.com",
-    "social.luckow.org",
-    "social.lugal.io",
-    "social.luizpicolo.com.br",
-    "social.lukas-schieren.de",
-    "social.lukepreston.xyz",
-    "social.lullis.net",
-    "social.lunasqu.ee",
-    "social.luoe.dev",
-    "social.lutra-it.eu",
-    "social.luxiferapp.com",
-    "social.lviv2.dcomm.net.ua",
-    "social.lwis.me",
-    "social.lxsameer.com",
-    "social.lykledevries.nl",
-    "social.lyratris.com",
-    "social.lyrenhex.com",
-    "social.lyros.net",
-    "social.m0nikasingh.xyz",
-    "social.m1n1ster.com",
-    "social.mac-vicar.eu",
-    "social.macbeth.cc",
-    "social.macer.life",
-    "social.macg.co",
-    "social.machauer.dev",
-    "social.maciej.website",
-    "social.macleod.space",
-    "social.macmynatt.com",
-    "social.macwinlin.cloud",
-    "social.madeoutofmeat.com",
-    "social.mageti.fr",
-    "social.magikh.fr",
-    "social.magzu.net",
-    "social.mailbox.org",
-    "social.mailpace.com",
-    "social.main-angler.de",
-    "social.makerforums.info",
-    "social.malachi.cc",
-    "social.malacology.net",
-    "social.malan.family",
-    "social.maleo.uk",
-    "social.malolepszy.org",
-    "social.manalejandro.com",
-    "social.manfre.net",
-    "social.mango.vg",
-    "social.manofaction.xyz",
-    "social.manulanglois.fr",
-    "social.manysid.com",
-    "social.maou-maou.fr",
-    "social.maplatefor.me",
-    "social.maplecrew.org",
-    "social.mapleshrine.eu",
-    "social.mapolist.com",
-    "social.marc1307.de",
-    "social.marcorennmaus.de",
-    "social.marcosilva.eu",
-    "social.markmckeague.com",
-    "social.markofall.com",
-    "social.markoonline.de",
-    "social.markusgran.de",
-    "social.marschik.me",
-    "social.martiabernathey.com",
-    "social.martinez.sh",
-    "social.martinhaynes.me",
-    "social.martins-almeida.com",
-    "social.marud.fr",
-    "social.masawada.me",
-    "social.maschinendeck.org",
-    "social.mashed.cloud",
-    "social.masi.family",
-    "social.masked.cloud",
-    "social.massalabs.com",
-    "social.masto.host",
-    "social.masto.land",
-    "social.mastodon.my",
-    "social.mastodon.site",
-    "social.mastolivre.fr",
-    "social.matarillo.com",
-    "social.matchu.dev",
-    "social.matej-lach.me",
-    "social.matriphe.net",
-    "social.matsuuratomoya.com",
-    "social.mattarkin.com",
-    "social.mattburkedev.com",
-    "social.matthewreynolds.net",
-    "social.matthias-bender.de",
-    "social.mattloomis.com",
-    "social.mattrnet.org",
-    "social.mauldasch.de",
-    "social.maurizi.org",
-    "social.maxemoose.com",
-    "social.maxxroot.com",
-    "social.mazingars.fr",
-    "social.mb-it.com",
-    "social.mbbit.de",
-    "social.mbirth.uk",
-    "social.mca.is",
-    "social.mcavey.net",
-    "social.mckendrick.io",
-    "social.mclegoman.com",
-    "social.mcqn.com",
-    "social.mcwhirter.io",
-    "social.meadowing.club",
-    "social.mecanis.me",
-    "social.mechanizedarmadillo.com",
-    "social.media-techport.de",
-    "social.medienzentrum.rocks",
-    "social.medlab.host",
-    "social.medusmedia.com",
-    "social.meenzen.net",
-    "social.meghadeep.com",
-    "social.megorei.net",
-    "social.mei-home.net",
-    "social.meissa-gmbh.de",
-    "social.melteampotes.fr",
-    "social.memes.nz",
-    "social.menuel.eu",
-    "social.metaccount.de",
-    "social.metadata.moe",
-    "social.metakaos.space",
-    "social.metalmatze.de",
-    "social.metaways.de",
-    "social.meteocon.com",
-    "social.meyer.cz",
-    "social.mezzo.moe",
-    "social.mf1.dev",
-    "social.mfojtik.io",
-    "social.mfraters.net",
-    "social.mgm-tp.com",
-    "social.michael-webber.com",
-    "social.michaels.world",
-    "social.michels.xyz",
-    "social.microscopium.de",
-    "social.middleearth.fr",
-    "social.miekyll.com",
-    "social.miichelle.moe",
-    "social.mikewells.name",
-    "social.mikutter.hachune.net",
-    "social.milchreislieferei.de",
-    "social.mildlyfunctional.gay",
-    "social.milhousfamily.com",
-    "social.milktea.io",
-    "social.minbash.de",
-    "social.mindplex.ai",
-    "social.minecodes.de",
-    "social.minx.space",
-    "social.mirkwood.io",
-    "social.mjohnson.net",
-    "social.mjohnson.tech",
-    "social.mkg20001.io",
-    "social.mkj.earth",
-    "social.mkr-tech.ch",
-    "social.mnh48.moe",
-    "social.mobile-adenum.fr",
-    "social.mochi.academy",
-    "social.modest.com",
-    "social.modimido.tech",
-    "social.modscleo4.dev.br",
-    "social.moerks.dk",
-    "social.mojo.fyi",
-    "social.mollejuo.com",
-    "social.molthagen.de",
-    "social.moment.at",
-    "social.mondoweiss.net",
-    "social.monkeysthumb.co.uk",
-    "social.monmusu.me",
-    "social.mono0x.net",
-    "social.montceleste.fr",
-    "social.mookiesplace.com",
-    "social.moormaker.space",
-    "social.mootech.eu",
-    "social.moreati.org.uk",
-    "social.morgenroth.me",
-    "social.mossrc.me",
-    "social.motoristic.org",
-    "social.mottokrosh.com",
-    "social.moxxis.space",
-    "social.mp0.jp",
-    "social.mpdl.mpg.de",
-    "social.mqtr.es",
-    "social.mrcol.es",
-    "social.mrdonaldson.net",
-    "social.mrjeda.de",
-    "social.mrks.network",
-    "social.mrsimon.dev",
-    "social.mrtoto.net",
-    "social.msa2p.be",
-    "social.mtrichardson.com",
-    "social.muchametow.de",
-    "social.mudb0y.com",
-    "social.multiverset.net",
-    "social.murana.uy",
-    "social.murf.org",
-    "social.musgrovegreen.co.uk",
-    "social.mushroomfm.com",
-    "social.muxodious.org",
-    "social.mv-software.de",
-    "social.mwsq.de",
-    "social.myconan.net",
-    "social.myexp.de",
-    "social.mykolayiv.dcomm.net.ua",
-    "social.myl.moe",
-    "social.mymiggi.de",
-    "social.mynacol.xyz",
-    "social.mythic-beasts.com",
-    "social.n0g.de",
-    "social.n1mtp.com",
-    "social.n33.eu",
-    "social.n8e.dev",
-    "social.nabber.org",
-    "social.nah.re",
-    "social.nahuelwexd.com",
-    "social.naked.cash",
-    "social.nanaka.love",
-    "social.nancengka.com",
-    "social.nanosector.nl",
-    "social.nanoyun.net",
-    "social.naomielliott.net",
-    "social.nateshivar.com",
-    "social.nathandyer.me",
-    "social.nauk.io",
-    "social.nauka.moe",
-    "social.nautik.io",
-    "social.nayab.dev",
-    "social.nb-tort.com",
-    "social.nblumhardt.com",
-    "social.nbwp.uk",
-    "social.ncc1701.fr",
-    "social.ncot.uk",
-    "social.ndlug.org",
-    "social.ndn.digital",
-    "social.neb.cx",
-    "social.nebula.lgbt",
-    "social.nekover.se",
-    "social.nelson.zone",
-    "social.neocloradas.com",
-    "social.nerd.net",
-    "social.nerdnet.ovh",
-    "social.nerdszondergrenzen.nl",
-    "social.nerdyfam.tech",
-    "social.nerdzoom.media",
-    "social.nestbox.club",
-    "social.net.ua",
-    "social.netdc.ca",
-    "social.netlabs.org",
-    "social.netlandish.com",
-    "social.netsecured.info",
-    "social.nettek.at",
-    "social.network.europa.eu",
-    "social.netz.org",
-    "social.netzspielplatz.de",
-    "social.neurer.com",
-    "social.nevira.net",
-    "social.newt.li",
-    "social.nextgamers.eu",
-    "social.niarisa.com",
-    "social.nibis.de",
-    "social.nico-bayati.de",
-    "social.nicolas-constant.com",
-    "social.niconicorose.com",
-    "social.nielsegberts.nl",
-    "social.nightshade.fun",
-    "social.nihil.ws",
-    "social.nihilum.space",
-    "social.nikhil-aryal.com.np",
-    "social.nikkasystems.com",
-    "social.nikos410.de",
-    "social.nil.nu",
-    "social.nishtahir.com",
-    "social.niso.org",
-    "social.nisso.dev",
-    "social.niszogen.com",
-    "social.nix.ai",
-    "social.nixt.de",
-    "social.niyawe.de",
-    "social.nkb.fr",
-    "social.nlnet.nl",
-    "social.noagendashow.io",
-    "social.noahschmitz.me",
-    "social.node001.net",
-    "social.nodered.org",
-    "social.nofftopia.com",
-    "social.nog.community",
-    "social.nogafam.zone",
-    "social.noggel.de",
-    "social.nokes.name",
-    "social.noleron.com",
-    "social.nomagic.uk",
-    "social.noparking.net",
-    "social.nopineapples.com",
-    "social.nopro.be",
-    "social.noraa.gay",
-    "social.nordgaming.eu",
-    "social.nordic-dev.net",
-    "social.noriakisana.dev",
-    "social.nortel.cloud",
-    "social.northbaypython.org",
-    "social.northernvoice.app",
-    "social.northwestvoip.com",
-    "social.notadroid.com",
-    "social.notandy.de",
-    "social.notaphish.fyi",
-    "social.notashelf.dev",
-    "social.notjustbikes.com",
-    "social.notqmail.org",
-    "social.nowicki.io",
-    "social.nox.onl",
-    "social.noyu.me",
-    "social.nozbe.com",
-    "social.npo.nl",
-    "social.nptcomputing.net",
-    "social.nsivertsen.com",
-    "social.nubecula.org",
-    "social.nuemedia.se",
-    "social.nullrequest.com",
-    "social.nullsense.net",
-    "social.numerique.gouv.fr",
-    "social.nursetonyf.com",
-    "social.nuu.cat",
-    "social.nwego.com",
-    "social.nwex.de",
-    "social.nyan.in",
-    "social.nyerm.com",
-    "social.oaf.org.au",
-    "social.oarsnet.nl",
-    "social.oberhauser.space",
-    "social.obeygravity.de",
-    "social.obrien.ws",
-    "social.oc.is",
-    "social.oddly-influenced.dev",
-    "social.odessa.dcomm.net.ua",
-    "social.odka.org",
-    "social.offsign.nl",
-    "social.ohaa.xyz",
-    "social.ohess.org",
-    "social.ojour.de",
-    "social.okoyono.de",
-    "social.oktadev.dev",
-    "social.olchis.net",
-    "social.oliverlorenz.com",
-    "social.olstrom.be",
-    "social.omaelse.de",
-    "social.omar.website",
-    "social.omni.ms",
-    "social.on2it.net",
-    "social.onlyfinland.com",
-    "social.open-plug.eu",
-    "social.openbuddhism.org",
-    "social.opendesktop.org",
-    "social.opendium.com",
-    "social.openearth.org",
-    "social.openhood.ru",
-    "social.openiap.io",
-    "social.openinfra.dev",
-    "social.opennerds.org",
-    "social.openrightsgroup.org",
-    "social.opensource.org",
-    "social.opentalk.eu",
-    "social.oper.io",
-    "social.optimus.ovh",
-    "social.orangechair.org",
-    "social.orangespatula.com",
-    "social.oranki.net",
-    "social.ordinal.garden",
-    "social.oriol.ie",
-    "social.ornella.xyz",
-    "social.osb-alliance.de",
-    "social.osla.site",
-    "social.otsuka.haus",
-    "social.oupsman.fr",
-    "social.our-space.xyz",
-    "social.ourwebgrove.com",
-    "social.outof.coffee",
-    "social.outsourcedmath.com",
-    "social.ovegard.se",
-    "social.overheid.nl",
-    "social.overlappingmagisteria.org",
-    "social.overminddl1.com",
-    "social.owlcode.tech",
-    "social.owo.digital",
-    "social.owotel.com",
-    "social.oxom.co",
-    "social.oxom.de",
-    "social.oyam.ca",
-    "social.ozoned.net",
-    "social.p0d.fr",
-    "social.p0lymer.net",
-    "social.p6drad-teel.net",
-    "social.pacna.org",
-    "social.pagenstedt.de",
-    "social.paladyn.org",
-    "social.pancakesontuesday.com",
-    "social.panic.com",
-    "social.papayankee.fr",
-    "social.param.codes",
-    "social.parentfamily.ca",
-    "social.parentheticalrecluse.com",
-    "social.paris12.pcf.fr",
-    "social.partiarazem.pl",
-    "social.pathfinderdreams.com",
-    "social.patrick.wtf",
-    "social.paulderaaij.nl",
-    "social.pauldev.co",
-    "social.paulg.fr",
-    "social.pawsitiv.space",
-    "social.pcwideopen.com",
-    "social.pedalkickers.de",
-    "social.pedesen.de",
-    "social.peekeend.nl",
-    "social.pekkasipila.com",
-    "social.pengins.dev",
-    "social.penguinability.net",
-    "social.penguinite.dev",
-    "social.penner.party",
-    "social.perceptiveconstructs.com",
-    "social.peregrinor.net",
-    "social.perspective-daily.de",
-    "social.peterlew.is",
-    "social.petertoushkov.eu",
-    "social.petko.me",
-    "social.petris.net",
-    "social.pfsmusic.net",
-    "social.phenjara.de",
-    "social.phigro.de",
-    "social.phillipjordan.com",
-    "social.phoenixradio1208.com",
-    "social.photationsfilms.com",
-    "social.photo",
-    "social.photogabble.co.uk",
-    "social.pieter.ninja",
-    "social.piewpiew.se",
-    "social.pigelet.org",
-    "social.pikafan.de",
-    "social.pincade.com.au",
-    "social.pint.com",
-    "social.pinter.family",
-    "social.piperrak.cc",
-    "social.piweb.be",
-    "social.pixelgesicht.de",
-    "social.pixelpusher.no",
-    "social.pixels.pizza",
-    "social.pixie.town",
-    "social.pkg.schule",
-    "social.planetfifty.one",
-    "social.pleco.ca",
-    "social.plerodatech.fr",
-    "social.plhk.dev",
-    "social.plom.net",
-    "social.plumey.com",
-    "social.plux.wtf",
-    "social.pmj.rocks",
-    "social.pneumasolutions.com",
-    "social.pnyhf.eu",
-    "social.podnews.net",
-    "social.podsnack.se",
-    "social.pogo.community",
-    "social.politicaconciencia.org",
-    "social.polonkai.eu",
-    "social.polotek.net",
-    "social.poltava.dcomm.net.ua",
-    "social.polymath.net",
-    "social.polynom.me",
-    "social.polysecure.ca",
-    "social.popcoding.com",
-    "social.pornstarpromote.com",
-    "social.portertech.ca",
-    "social.postfixnotation.org",
-    "social.pouill.eu",
-    "social.pp.lu",
-    "social.practicalbytes.de",
-    "social.prado.it",
-    "social.praxis.nyc",
-    "social.prepedia.org",
-    "social.primehq.co",
-    "social.primeos.dev",
-    "social.prisciou.v6.rocks",
-    "social.priv42.freemyip.com",
-    "social.process-one.net",
-    "social.prodottoinrete.com",
-    "social.producer-network.de",
-    "social.programmier.bar",
-    "social.project-insanity.org",
-    "social.proko.ovh",
-    "social.prosumer.dev",
-    "social.protectors.moe",
-    "social.proximitysculptor.com",
-    "social.psjb.me",
-    "social.psychodog.co.uk",
-    "social.publicspaces.net",
-    "social.pueseso.club",
-    "social.pulpie.xyz",
-    "social.pupsplus.fans",
-    "social.purple-horizon-clan.net",
-    "social.purrucker.de",
-    "social.pygos.space",
-    "social.pyngu.com",
-    "social.python-gsoc.org",
-    "social.python.it",
-    "social.qlyoung.net",
-    "social.qownnotes.org",
-    "social.quake.host",
-    "social.queer.computer",
-    "social.quent1.fr",
-    "social.quitaxd.online",
-    "social.qunn.eu",
-    "social.qutic.com",
-    "social.qvi.st",
-    "social.r0r1.de",
-    "social.r4v3.party",
-    "social.ra-phi.ch",
-    "social.raatiniemi.me",
-    "social.raccoon.college",
-    "social.racf.guru",
-    "social.radioprogres.fr",
-    "social.radon.rocks",
-    "social.raghukamath.com",
-    "social.ragol.org",
-    "social.rahim.li",
-    "social.rainevixen.com",
-    "social.raise-uav.com",
-    "social.raitisoja.net",
-    "social.ralnode.net",
-    "social.rand0m.fail",
-    "social.randomgeekage.com",
-    "social.randommumble.org",
-    "social.randomserver.org",
-    "social.randomsonicnet.org",
-    "social.rangaya.com",
-    "social.rapotec.org",
-    "social.rappappa.com",
-    "social.rascalking.net",
-    "social.raspinerd.de",
-    "social.rat.cafe",
-    "social.ratliff.space",
-    "social.rawa.io",
-    "social.raytec.co",
-    "social.razernok.net",
-    "social.rbs.io",
-    "social.rcelko.ch",
-    "social.rdl.ph",
-    "social.realmofespionage.xyz",
-    "social.realnephestate.xyz",
-    "social.reapers.de",
-    "social.rebellion.global",
-    "social.redbarrel.net",
-    "social.regenpfeifer.net",
-    "social.remoteplay.im",
-    "social.reparierecke.de",
-    "social.repnop.dev",
-    "social.researchanddestroy.technology",
-    "social.reset.tech",
-    "social.resihold.com",
-    "social.restless.systems",
-    "social.retroedge.tech",
-    "social.retronerd.at",
-    "social.rfiori.com",
-    "social.rhamzeh.com",
-    "social.rhea.art",
-    "social.rheinland.international",
-    "social.rhumbs.fr",
-    "social.rickelobe.com",
-    "social.ridetrans.it",
-    "social.right.wtf",
-    "social.rights.ninja",
-    "social.riversouldiers.dk",
-    "social.rivne.dcomm.net.ua",
-    "social.riz-om.network",
-    "social.rjp.is",
-    "social.rkowl.com",
-    "social.rlin.eu",
-    "social.rndm.ovh",
-    "social.robtarr.net",
-    "social.robviously.me",
-    "social.rocketeer.be",
-    "social.rocklobster.cat",
-    "social.rockychurch.org",
-    "social.rodere.systems",
-    "social.rodriguezrullan.com",
-    "social.roeckoe.be",
-    "social.rokimuc.de",
-    "social.romaricpascal.com",
-    "social.rootaccess.org",
-    "social.rootnode.xyz",
-    "social.rossabaker.com",
-    "social.roteserver.de",
-    "social.roughyeds.lol",
-    "social.rousselie.name",
-    "social.routing.rocks",
-    "social.rpicciotti.com",
-    "social.rpigroup.it",
-    "social.rrrr.wtf",
-    "social.rubber.family",
-    "social.rubikoid.ru",
-    "social.rubyonmac.dev",
-    "social.rucksfuchs.de",
-    "social.runloop.dev",
-    "social.running.cafe",
-    "social.russellmcc.com",
-    "social.rust-lang.org",
-    "social.rustysoft.de",
-    "social.ruth.run",
-    "social.rutland.org.uk",
-    "social.rverse.club",
-    "social.ryan77627.xyz",
-    "social.ryankes.eu",
-    "social.rynth.net",
-    "social.saarland",
-    "social.sabletopia.co.uk",
-    "social.sachsen-anhalt.de",
-    "social.sachsen.de",
-    "social.saela.eu",
-    "social.saghul.net",
-    "social.sailor.cat",
-    "social.saltypugs.com",
-    "social.samf.me",
-    "social.samizdatpixelpress.net",
-    "social.sanfranciscan.org",
-    "social.sankara.me",
-    "social.sargasso.nl",
-    "social.saria.fun",
-    "social.sattvalife.ru",
-    "social.savemy.name",
-    "social.saw.dev",
-    "social.sawpitgully.net",
-    "social.sbbsystems.com",
-    "social.sceneworld.org",
-    "social.schaffenburg.org",
-    "social.scharner.me",
-    "social.schenkel.net",
-    "social.scheske.de",
-    "social.schillis.ch",
-    "social.schleswig-holstein.de",
-    "social.schmarrn.dev",
-    "social.schoepski.de",
-    "social.scholzbande.de",
-    "social.schuldt.dev",
-    "social.schwarzer.dev",
-    "social.schwerkraftlabor.de",
-    "social.sciences.re",
-    "social.screamingatmyscreen.com",
-    "social.scribblers.club",
-    "social.scriptjunkie.us",
-    "social.sd.ai",
-    "social.sdf.org",
-    "social.sdfcn.org",
-    "social.sdfeu.org",
-    "social.sdfin.org",
-    "social.seancarpenter.net",
-    "social.seanzach.com",
-    "social.seaquillcatstone.com",
-    "social.seattle.wa.us",
-    "social.sebastian-neu.de",
-    "social.sebastianwoehrl.name",
-    "social.secclo.community",
-    "social.secondjarl.com",
-    "social.secret-wg.org",
-    "social.secret.pub",
-    "social.security.plumbing",
-    "social.securitypuppy.com",
-    "social.securitytheater.net",
-    "social.secwarz.com",
-    "social.sedders123.me",
-    "social.seekahead.eu",
-    "social.seiichiro0185.org",
-    "social.selbstlernserver.de",
-    "social.semiotic.systems",
-    "social.sengeis.priv.at",
-    "social.sengotta.net",
-    "social.sentynel.com",
-    "social.senyuuri.info",
-    "social.sergeant.net",
-    "social.server17.net",
-    "social.serversonic.co.uk",
-    "social.servus.at",
-    "social.servyy.duckdns.org",
-    "social.severa.name",
-    "social.sfconservancy.org",
-    "social.sgawolf.com",
-    "social.sgsknote.org",
-    "social.shaarad.me",
-    "social.shadowkat.net",
-    "social.shanti.cafe",
-    "social.shas.am",
-    "social.sheepdev.xyz",
-    "social.shinyuu.net",
-    "social.shirokurostone.com",
-    "social.shrimp.faith",
-    "social.shrn.co",
-    "social.sieprawski.pl",
-    "social.signalthirteen.online",
-    "social.sigsoft.org",
-    "social.sileachim.net",
-    "social.silicon.moe",
-    "social.silosneeded.com",
-    "social.simcu.com",
-    "social.simoncook.org",
-    "social.simonjon.es",
-    "social.simonschoof.com",
-    "social.simonwgill.com",
-    "social.sineware.ca",
-    "social.singing.dog",
-    "social.singularity-node.net",
-    "social.singularity.sh",
-    "social.sinnesro.se",
-    "social.sir-photch.xyz",
-    "social.sitedethib.com",
-    "social.sixi.me",
-    "social.skaperiet.no",
-    "social.skewed.de",
-    "social.skrep.in",
-    "social.skynetcloud.site",
-    "social.skyshaper.org",
-    "social.slat.org",
-    "social.slsrepo.com",
-    "social.slug.it",
-    "social.smaier.net",
-    "social.smalldog.club",
-    "social.smallint.net",
-    "social.smnz.de",
-    "social.snamellit.com",
-    "social.sndevs.com",
-    "social.sneak.ovh",
-    "social.snircle.space",
-    "social.snorklr.com",
-    "social.snowcat.link",
-    "social.snowcloud.one",
-    "social.sociopathic.ca",
-    "social.sodajerker.com",
-    "social.softinio.com",
-    "social.solitorian.com",
-    "social.sonicbunny.com",
-    "social.sopuzzled.com",
-    "social.soundforsound.co.uk",
-    "social.sourcemac.com",
-    "social.sousunepluie.com",
-    "social.sowelijanpona.xyz",
-    "social.sp-codes.de",
-    "social.spacebear.ee",
-    "social.sparkforge.pro",
-    "social.sparkles.cafe",
-    "social.sparkway.org",
-    "social.spejset.org",
-    "social.spheron.one",
-    "social.spicysources.de",
-    "social.spicyweb.dev",
-    "social.spiezmaestro.ch",
-    "social.spkt.studio",
-    "social.spline.de",
-    "social.spork.gg",
-    "social.sprig.gs",
-    "social.sqrrl.xyz",
-    "social.sqrts.net",
-    "social.squeep.com",
-    "social.ssbx.dev",
-    "social.sschnabe.eu",
-    "social.stackunderflow.com",
-    "social.standyck.com",
-    "social.starglitcher.xyz",
-    "social.starmade.de",
-    "social.startupstack.tech",
-    "social.stately.ai",
-    "social.stealthy.club",
-    "social.stefanberger.net",
-    "social.stefanomarinelli.it",
-    "social.stenyan.dev",
-    "social.stephanbradshaw.com",
-    "social.stephenfirth.co.uk",
-    "social.stephenson.cc",
-    "social.stilbedarf.de",
-    "social.still-ai.net",
-    "social.stlouist.com",
-    "social.stmh.io",
-    "social.storkeus.xyz",
-    "social.stormsvale.no",
-    "social.stormux.org",
-    "social.storydragon.nl",
-    "social.stracknet.com",
-    "social.strangetextures.com",
-    "social.strobel.one",
-    "social.studio.link",
-    "social.stumblestore.de",
-    "social.sublingual.xyz",
-    "social.subluminal.industries",
-    "social.subversida.de",
-    "social.sucb.de",
-    "social.suchtbasis.de",
-    "social.sudduth.me",
-    "social.sudovim.net",
-    "social.sukany.cz",
-    "social.sullivanservices.xyz",
-    "social.sumeru.top",
-    "social.sunet.se",
-    "social.sunflowerdojo.com",
-    "social.suppenhase.de",
-    "social.sveken.au",
-    "social.svhub.de",
-    "social.swordandfiddle.co.uk",
-    "social.swrlab.org",
-    "social.syndae.de",
-    "social.syndicalism.org",
-    "social.synerate.com",
-    "social.synergetic-design.com",
-    "social.synesthesia.co.uk",
-    "social.sys2nix.de",
-    "social.sysmike.net",
-    "social.systemz.pl",
-    "social.syum.ai",
-    "social.t12.online",
-    "social.taborsky.cz",
-    "social.tacty.org",
-    "social.tadzik.net",
-    "social.takehi.to",
-    "social.taker.fr",
-    "social.talldude.net",
-    "social.tanelpoder.com",
-    "social.tangoz.de",
-    "social.tarasis.net",
-    "social.targaryen.house",
-    "social.tarsis.me",
-    "social.tarxvf.tech",
-    "social.tasartir.cz",
-    "social.tastefuldinosaurerotica.com",
-    "social.taupehat.com",
-    "social.tavi.moe",
-    "social.tbqdrn.de",
-    "social.tchncs.de",
-    "social.tcit.fr",
-    "social.tcpcat.net",
-    "social.tealshark.net",
-    "social.team-prism.rocks",
-    "social.team-unix.de",
-    "social.teamb.space",
-    "social.teamlight.stream",
-    "social.teamtuck.xyz",
-    "social.teapots.fr",
-    "social.techie.org",
-    "social.techliminal.com",
-    "social.techn1k.de",
-    "social.technoetic.com",
-    "social.technomancy.nexus",
-    "social.teci.world",
-    "social.teddycaddy.com",
-    "social.tedium.co",
-    "social.teia.bio.br",
-    "social.telemetrydeck.com",
-    "social.teleprinter.exchange",
-    "social.tellco.ca",
-    "social.tempest.dev",
-    "social.tengu.ch",
-    "social.tepitus.de",
-    "social.ter0.net",
-    "social.terbeest.net",
-    "social.terbeest.org",
-    "social.territorisostenibili.org",
-    "social.texomabrass.org",
-    "social.teyvat.cloud",
-    "social.tfdn.cloud",
-    "social.tfkhdyt.my.id",
-    "social.tfwnogf.nl",
-    "social.tgj.services",
-    "social.thasauce.net",
-    "social.the-goblin.net",
-    "social.the-mansfields.co.uk",
-    "social.the-thirstiest-mawile.com",
-    "social.thearchitects.world",
-    "social.theboxcollective.org",
-    "social.thecrow.uk",
-    "social.thecum.zone",
-    "social.thedevane.family",
-    "social.thefishermenandthepriestess.com",
-    "social.theformer.faith",
-    "social.thegeneral.chat",
-    "social.theindiestone.com",
-    "social.thej.in",
-    "social.thelabs.online",
-    "social.thembo-industries.com",
-    "social.theokadas.com",
-    "social.theredcaps.net",
-    "social.therestartproject.org",
-    "social.therman.eu",
-    "social.therobots.org",
-    "social.thespiralbound.com",
-    "social.thesuccubus.club",
-    "social.thetransagenda.gay",
-    "social.theunwashed.org",
-    "social.thewhole.site",
-    "social.thierrytalbert.fr",
-    "social.thilo.app",
-    "social.thimic.no",
-    "social.thinkingguy.com",
-    "social.thirdstage.ca",
-    "social.thisisjoes.site",
-    "social.thiskurt.me",
-    "social.thms.uk",
-    "social.thomasjaggi.ch",
-    "social.thorjhanson.com",
-    "social.thunderkeys.net",
-    "social.thyra-inflatables.eu",
-    "social.tidusfox9.online",
-    "social.tille.ch",
-    "social.tilosp.de",
-    "social.timespiral.co.jp",
-    "social.timotheejulien.fr",
-    "social.timothyhay.org",
-    "social.timstallard.me.uk",
-    "social.tinfoil-hat.net",
-    "social.tinh.at",
-    "social.tinycyber.space",
-    "social.tinygo.org",
-    "social.tinytip.de",
-    "social.tkschland.de",
-    "social.tmprs.net",
-    "social.tnhh.org",
-    "social.tobiasm.dev",
-    "social.tobru.ch",
-    "social.tofu.pt",
-    "social.tollofsen.se",
-    "social.tomkrizan.com",
-    "social.tomster.org",
-    "social.tomstu.art",
-    "social.tomtaylor.co.uk",
-    "social.tonkku.me",
-    "social.toot9.de",
-    "social.topbridge.io",
-    "social.toplap.org",
-    "social.touha.me",
-    "social.touhey.org",
-    "social.tourmentine.com",
-    "social.town-square.de",
-    "social.toxwat.cz",
-    "social.toyuzuko.dev",
-    "social.tpapak.com",
-    "social.tpile.net",
-    "social.tr0llhoehle.de",
-    "social.tr4ck.net",
-    "social.trackers-world.org",
-    "social.translunar.academy",
-    "social.transpeak.lgbt",
-    "social.transrights.art",
-    "social.transsafety.network",
-    "social.trap.lol",
-    "social.travisshears.xyz",
-    "social.trayd.xyz",
-    "social.trechnex.com",
-    "social.tree.dance",
-    "social.treehouse.systems",
-    "social.tripelix.com",
-    "social.trizz.io",
-    "social.troll.academy",
-    "social.trom.tf",
-    "social.tromdienste.de",
-    "social.troplo.com",
-    "social.trout.garden",
-    "social.troxelhome.page",
-    "social.truman.me.uk",
-    "social.trumpi.co.za",
-    "social.tryptophonic.com",
-    "social.tsak.net",
-    "social.tsd.zone",
-    "social.tsst.net",
-    "social.tsueri.cloud",
-    "social.tsun.co",
-    "social.tthi.as",
-    "social.ttnrtsite.me",
-    "social.tubul.net",
-    "social.tulsa.ok.us",
-    "social.tumelum.de",
-    "social.tupo.space",
-    "social.turpish.vote",
-    "social.tuttipazzi.cyou",
-    "social.twolife.be",
-    "social.twotenlabs.net",
-    "social.ty-penguin.org.uk",
-    "social.tylerjfisher.com",
-    "social.tyngsboroughma.net",
-    "social.typica.us",
-    "social.tzi.fr",
-    "social.tzimos.xyz",
-    "social.u2s.cloud",
-    "social.uberbrady.com",
-    "social.ucml.dev",
-    "social.uden.ai",
-    "social.uggs.io",
-    "social.ugoday.co",
-    "social.uhh.monster",
-    "social.uhoreg.ca",
-    "social.uibk.ac.at",
-    "social.uitsmijter.io",
-    "social.uji.es",
-    "social.ullrich.is",
-    "social.ulysses.app",
-    "social.umiamz.me",
-    "social.unboiled.info",
-    "social.undarkpixel.com",
-    "social.undeadnetwork.de",
-    "social.underdesk.net",
-    "social.underza.net",
-    "social.undisruptable.technology",
-    "social.undrground.org",
-    "social.unextro.net",
-    "social.unitoo.it",
-    "social.unruhig.eu",
-    "social.unsafe.link",
-    "social.unturf.com",
-    "social.unx.pw",
-    "social.up.edu.ph",
-    "social.urlxl.com",
-    "social.ursaoskius.com",
-    "social.urspringer.de",
-    "social.usedbytes.com",
-    "social.utdoasn.com",
-    "social.v.b4tman.ru",
-    "social.v.st",
-    "social.v4v.dev",
-    "social.vaenner.net",
-    "social.vaguelydamp.com",
-    "social.val-sans-retour.fr",
-    "social.validpostage.com",
-    "social.valvisio.one",
-    "social.vampyrebytes.net",
-    "social.van-der-velde.net",
-    "social.van-hemmen.com",
-    "social.van.buu.re",
-    "social.vanilli.uk",
-    "social.varnham.net",
-    "social.vasi.li",
-    "social.vasilis.nl",
-    "social.vates.tech",
-    "social.vaughnhannon.com",
-    "social.vcfed.org",
-    "social.vdavez.com",
-    "social.vdheide.net",
-    "social.vdna.be",
-    "social.vegan.im.it",
-    "social.veltens.org",
-    "social.vengeful.eu",
-    "social.vennis.no",
-    "social.veraciousnetwork.com",
-    "social.vermona.com",
-    "social.vfly2.com",
-    "social.vicicode.com",
-    "social.victimcache.com",
-    "social.villains.live",
-    "social.violetmillie.me",
-    "social.violoncello.ch",
-    "social.viorsan.space",
-    "social.vit-connect.de",
-    "social.vitrubio.net",
-    "social.viufa.ca",
-    "social.vivaldi.net",
-    "social.vleij.com",
-    "social.vlhl.dev",
-    "social.vmbrasseur.com",
-    "social.vodkabull0.de",
-    "social.vonnordmann.de",
-    "social.vouaix.com",
-    "social.vrutkovs.eu",
-    "social.vsp.ink",
-    "social.vvdog.net",
-    "social.vwolfe.io",
-    "social.vyvojari.dev",
-    "social.w3b0.de",
-    "social.w4230.de",
-    "social.w7f.eu",
-    "social.wafflecity.org",
-    "social.wagler.it",
-    "social.wagnersnetz.de",
-    "social.wake.st",
-    "social.wakemu.fr",
-    "social.walljm.com",
-    "social.walterebert.com",
-    "social.wanderview.com",
-    "social.warnick.me",
-    "social.wasscher.com",
-    "social.wastedalpaca.wtf",
-    "social.watdalos.de",
-    "social.watercoolertrivia.com",
-    "social.wcore.org",
-    "social.web-wi.de",
-    "social.webitel.me",
-    "social.webvsn.com",
-    "social.wedistribute.org",
-    "social.weiznich.de",
-    "social.wethethinking.com",
-    "social.whoart.art",
-    "social.whydoesntmycode.work",
-    "social.whytheyfight.com",
-    "social.wieser-hv.de",
-    "social.wigger.one",
-    "social.wikidex.net",
-    "social.wikimedia.de",
-    "social.wikimedia.es",
-    "social.wilboard.nl",
-    "social.wildasoftware.pl",
-    "social.wildeboer.net",
-    "social.wildparadox.com",
-    "social.willfurnell.com",
-    "social.williamyam.com",
-    "social.winscloud.net",
-    "social.winter.ink",
-    "social.wintermade.it",
-    "social.wiredancer.hu",
-    "social.wirnify.de",
-    "social.wistly.net",
-    "social.witch.gay",
-    "social.wittemeier.de",
-    "social.wittenberg.onl",
-    "social.wiwie.dk",
-    "social.wjt.je",
-    "social.wjtje.dev",
-    "social.wohlfarth.name",
-    "social.wolfe.casa",
-    "social.woodbine.nyc",
-    "social.woon.my",
-    "social.worgames.com",
-    "social.wowmedia.net",
-    "social.wps.de",
-    "social.wrenix.eu",
-    "social.wuatek.is",
-    "social.wub.site",
-    "social.wurtshell.com",
-    "social.wxcafe.net",
-    "social.wynning.tech",
-    "social.x220.co.uk",
-    "social.xaq.cz",
-    "social.xavierbigfox.net",
-    "social.xbm.se",
-    "social.xcetera.biz",
-    "social.xenofem.me",
-    "social.xenrox.net",
-    "social.xin.cat",
-    "social.xinghaizhandui.com",
-    "social.xivdata.com",
-    "social.xiven.com",
-    "social.xm1.de",
-    "social.xmflsct.com",
-    "social.xoddiel.net",
-    "social.xqz.ca",
-    "social.xwyqi.org",
-    "social.xyntion.consulting",
-    "social.y-gallery.net",
-    "social.yakshed.org",
-    "social.yaofur.com",
-    "social.yba.dev",
-    "social.yearg.in",
-    "social.yellowgoat.net",
-    "social.yeschenko.com",
-    "social.yesterweb.org",
-    "social.yetaga.in",
-    "social.yewdar.world",
-    "social.yey.nu",
-    "social.yharnam.town",
-    "social.yjk.im",
-    "social.yl.ms",
-    "social.ynnx.eu",
-    "social.yob.id.au",
-    "social.yoichihirai.com",
-    "social.yolo.ventures",
-    "social.yonix.eu",
-    "social.yorkshiregeek.xyz",
-    "social.youarewrong.org",
-    "social.youhoo.fr",
-    "social.younger.wtf",
-    "social.yukinobu.jp",
-    "social.yussuv.com",
-    "social.zaaltek.net",
-    "social.zachcapalbo.com",
-    "social.zagrodnick.de",
-    "social.zaphar.net",
-    "social.zarchbox.fr",
-    "social.zarrouk.eu",
-    "social.zdx.fr",
-    "social.zedpro.me",
-    "social.zell-mbc.com",
-    "social.zentonic.org",
-    "social.zeroplex.tw",
-    "social.zerospire.com",
-    "social.zerotier.com",
-    "social.zeruhur.icu",
-    "social.zete.tk",
-    "social.zeuke.me",
-    "social.ziez.eu",
-    "social.zigzak.net",
-    "social.zischundweg.cloud",
-    "social.zlatko.dev",
-    "social.zlendy.com",
-    "social.zoc.me",
-    "social.zocradio.info",
-    "social.zoeyvid.de",
-    "social.zop.se",
-    "social.zoski.fr",
-    "social.zotha.de",
-    "social.zteo.com",
-    "social.zvavybir.eu",
-    "social.zwoelfdreifuenfundvierzig.net",
-    "social.zym.lol",
-    "social.zyphyr.de",
-    "social1.ortolo.eu",
-    "sociala.me",
-    "socialclub.nyc",
-    "socialcoders.org",
-    "socialcoderz.com",
-    "socialconde.condenastdigital.com",
-    "sociale.network",
-    "socialfed.nl",
-    "socialgoblins.club",
-    "socialis.me",
-    "sociall.se",
-    "socially.bymyself.org",
-    "socially.drinkingatmy.computer",
-    "socially.terrible.systems",
-    "sociallydental.org",
-    "socialmedia.mobilite-mobiliteit.brussels",
-    "socialnotwork.net",
-    "socialpa.ws",
-    "socialpapiga.top",
-    "socialrep.info",
-    "socials.hainsate.com",
-    "socialserver.science",
-    "socialtest.guldan.net",
-    "socialtodon.de",
-    "socialturtle.eu",
-    "socialweb.maho.dev",
-    "society.kalli.st",
-    "society.oftrolls.com",
-    "society2.world",
-    "socio.forkexec.net",
-    "socio.scronch.com",
-    "socks.masto.host",
-    "socl.au",
-    "socl.conr.ca",
-    "socl.win",
-    "soctest.vurtdefurk.com",
-    "softer.social",
-    "softwareguild.org",
-    "softwaremill.social",
-    "sogga.top",
-    "soir.wtf",
-    "sola.social",
-    "solarcene.community",
-    "solarpunk.moe",
-    "solarpunkdruid.com",
-    "solarsystem.social",
-    "solawi.farm",
-    "solchefreu.de",
-    "solderma.sk",
-    "solidarite.social",
-    "solitary.social",
-    "solo.masto.host",
-    "solosociety.social",
-    "solutionpoint.in",
-    "somaliland.media",
-    "somamis.it",
-    "some.evvk.fi",
-    "some.hacklab.fi",
-    "some.henkkalaukka.fi",
-    "some.juttu.asia",
-    "some.oddte.ch",
-    "some.skrolli.fi",
-    "some.tehy.fi",
-    "someone.elses.computer",
-    "sometimes.social",
-    "sometimes.when.computer",
-    "sometimesantisocial.media",
-    "somewhy.net",
-    "sona.live",
-    "songbird.cloud",
-    "songsforno.one",
-    "sonomaca.social",
-    "sonomu.club",
-    "soothing.cloud",
-    "sophie.cafe",
-    "sorbit.no",
-    "sorcie.re",
-    "sorgatronmedia.social",
-    "sos.nekoweb.my.id",
-    "sosial.agdersam.no",
-    "sosial.nyheimen.no",
-    "sosialen.nyheimen.no",
-    "sosialist.party",
-    "sosocial.dedioste.net",
-    "sosu.nkb.moe",
-    "sota.sotamedia.org",
-    "sotl.social",
-    "sotong.cloud",
-    "soulcrash.net",
-    "soundbyte.social",
-    "soundcafe.nl",
-    "sourcegate.com",
-    "sovran.me",
-    "sovran.photos",
-    "soweli.usa-chan.pink",
-    "soykaf.org",
-    "soylent.green",
-    "sozial.cyberpunk.gmbh",
-    "sozial.ismus.net",
-    "sozial.roter-kreis.de",
-    "soziale.cloud",
-    "soziale.verwirrung.institute",
-    "sozialwelten.de",
-    "sp.kub2091.ru",
-    "space-pirates.org",
-    "space.jeroenvd.nl",
-    "space.sangelo.space",
-    "spaceballs.masto.host",
-    "spacehost.team",
-    "spacelase.rs",
-    "spacelion.me",
-    "spacenoid.social",
-    "spacerslike.us",
-    "spaceshipguy.no-ip.biz",
-    "spaceup.city",
-    "spacey.space",
-    "spaekhugger.de",
-    "spaeth.social",
-    "spanner.works",
-    "sparingly.social",
-    "sparkgap.marsfreeradio.org",
-    "sparkly.uni.horse",
-    "sparrow.cs.uni-magdeburg.de",
-    "sparrowhawk.social",
-    "spartanburg.social",
-    "spatlo.com",
-    "spatzenpost.eu",
-    "spd.social",
-    "spectreofcommunism.boo",
-    "speedlines.stctp.zone",
-    "speicherbereich.net",
-    "spellcaster.social",
-    "spergi.ng",
-    "spezi.social",
-    "sphere.fx4.net",
-    "spielwiese.rwsr-xr-x.de",
-    "spinny.city",
-    "spinster.xyz",
-    "spirelli.net",
-    "spla.tech",
-    "splashcat.social",
-    "splat00n.ink",
-    "splodge.fluff.org",
-    "spodeli.org",
-    "spoilertv.social",
-    "spojnik.works",
-    "spondr.cz",
-    "spooky.social",
-    "spookykitties.com",
-    "spooner.social",
-    "spoonie.community",
-    "spore.social",
-    "sporedrive.space",
-    "sportsball.host",
-    "sportsbots.xyz",
-    "sportsfans.social",
-    "sportsfeed.me",
-    "spragleknas.no",
-    "spt.social",
-    "spurlock.social",
-    "spv.sh",
-    "sqrt.to",
-    "squ.alid.pw",
-    "squabble.org",
-    "squad.town",
-    "squawk.mytransponder.com",
-    "squawk.social",
-    "squeak.games",
-    "squeak.social",
-    "squeaky.social",
-    "squeet.me",
-    "squid.cafe",
-    "squidnet.net",
-    "squidsocial.dontexist.net",
-    "squiggysholler.party",
-    "squirrel.pub",
-    "squirrelmob.com",
-    "srcr.nl",
-    "sre.masto.host",
-    "srostreamtest.sroallcap.com",
-    "ssda.me",
-    "st.mstdn.b-shock.org",
-    "stablegeniusliberal.com",
-    "stackpointer.ws",
-    "stade.social",
-    "stadtbu.de",
-    "stadtmg.social",
-    "stage.ctfoto-galerie.heise.de",
-    "stage.pixelfed.de",
-    "stage.social.cologne",
-    "stage8.die.one",
-    "staging-07b6-blogjwsjoesteinbringsthoughtsoncodingtravelandlife.wpcomstaging.com",
-    "staging.brighteon.social",
-    "staging.carhenge.club",
-    "staging.crunchygrandmas.com",
-    "staging.e2net.social",
-    "staging.moth.social",
-    "staging.mstdn.maud.io",
-    "staging.mstdn.misaca.network",
-    "staging.mystical.garden",
-    "staging.owo.cafe",
-    "staging.pixelfed.net",
-    "staging.social.azuki.co",
-    "staging.social.mikutter.hachune.net",
-    "stammy.design",
-    "stamps.town",
-    "standup-comics.net",
-    "stansells.org",
-    "starbase1.earth",
-    "starbase80.wtf",
-    "starcitizen.name",
-    "starcitizen.social",
-    "stardust.elysium.gay",
-    "stareinto.space",
-    "starflower.space",
-    "starfruit.cafe",
-    "starlight.camp",
-    "starrwulfe.xyz",
-    "stars.eroaward.com",
-    "starside.social",
-    "startrekdiscussionboard.blog",
-    "startrekshitposting.com",
-    "starwarslong.xyz",
-    "statesnewsroom.social",
-    "stats.dullplanet.de",
-    "status.2metz.fr",
-    "status.andrelop.org",
-    "status.caasn.de",
-    "status.fberriman.com",
-    "status.kinlan.me",
-    "status.nanoyagi.com",
-    "status.pointless.one",
-    "status.sexyferret.science",
-    "status.steren.fr",
-    "status92.social",
-    "stay.woke.institute",
-    "staysilent.party",
-    "stdx.social",
-    "steamedbread.pro",
-    "steampunk.social",
-    "stefanbohacek.online",
-    "stefankoopmanschap.nl",
-    "stegodon.nl",
-    "stegodon.org",
-    "stella.mnms.casa",
-    "stellar.build",
-    "stellaria.network",
-    "stemfurs.masto.host",
-    "stephenanfield.social",
-    "stephenwuebker.social",
-    "stereodon.social",
-    "stereophonic.space",
-    "stg.mstdn.plusminus.io",
-    "stgregus.masto.host",
-    "stibi.social",
-    "stimky.one",
-    "stl.fyi",
-    "stoat.zone",
-    "stocksfamily.online",
-    "stolat.town",
-    "stoneartprod.xyz",
-    "stoner.cafe",
-    "stonerkitty.monster",
-    "stoners.space",
-    "stoney.monster",
-    "stoney.social",
-    "stop.pe",
-    "stories.ahlroos.me",
-    "storiesoficeland.com",
-    "stormcloak.info",
-    "stormlight.space",
-    "stormwaltz.net",
-    "storynetworks.kr",
-    "stoyko.space",
-    "stpauli.social",
-    "straightouttacotton.com",
-    "strandgut.net",
-    "strangeanarchy.xyz",
-    "strangeminds.social",
-    "strangeobject.space",
-    "strangeplace.me",
-    "stranger.social",
-    "strangeweb.page",
-    "stray.shee.pink",
-    "straybits.social",
-    "straylight.expectnomore.net",
-    "stream.0cx.de",
-    "stream.777.tf",
-    "stream.allcaps.club",
-    "stream.amoonrabbit.reisen",
-    "stream.arles.cloud",
-    "stream.bapril.pl",
-    "stream.box464.com",
-    "stream.braindudecreations.com",
-    "stream.brulijam.com",
-    "stream.byabbe.se",
-    "stream.cincodenada.com",
-    "stream.collins.pub",
-    "stream.communityreeftank.com",
-    "stream.cresi.be",
-    "stream.cybersystems.engineer",
-    "stream.davlin.io",
-    "stream.deloughry.co.uk",
-    "stream.djradim.click",
-    "stream.donadvr.de",
-    "stream.dpm.social",
-    "stream.emile.space",
-    "stream.everythingbagel.me",
-    "stream.foggymtndrifter.com",
-    "stream.fossdle.org",
-    "stream.fournieit.com",
-    "stream.gamedev.lgbt",
-    "stream.genky.duckdns.org",
-    "stream.genuineparts.org",
-    "stream.ghoti.me",
-    "stream.gmem.ca",
-    "stream.gravitons.org",
-    "stream.greennuclear.online",
-    "stream.hylas.au",
-    "stream.j51b5.me",
-    "stream.krakatoa.bar",
-    "stream.kylebronsdon.com",
-    "stream.labr.online",
-    "stream.lamer-ethos.site",
-    "stream.landofkittens.community",
-    "stream.lgbtqanime.club",
-    "stream.linkybook.com",
-    "stream.lolicon.monster",
-    "stream.lorialet.fr",
-    "stream.ludoviko.ch",
-    "stream.megagtrwrath.co.uk",
-    "stream.melody.cat",
-    "stream.melonbread.dev",
-    "stream.mikkas.world",
-    "stream.monkee.ch",
-    "stream.moparisthe.best",
-    "stream.mykdeen.com",
-    "stream.nik.mx",
-    "stream.nononymous.fr",
-    "stream.oscdev.tv",
-    "stream.owo.monster",
-    "stream.oxtyped.net",
-    "stream.ozoned.net",
-    "stream.pavot.ca",
-    "stream.ppmx.org",
-    "stream.provo.lol",
-    "stream.r3networks.uk",
-    "stream.reimu.info",
-    "stream.robbyzambito.me",
-    "stream.samtripoli.com",
-    "stream.schenklklopfer.de",
-    "stream.sdowns.xyz",
-    "stream.sidh.bzh",
-    "stream.sigma-star.io",
-    "stream.silsha.me",
-    "stream.sleepy.ink",
-    "stream.steele.blue",
-    "stream.stevegoo.de",
-    "stream.sveken.com",
-    "stream.sweetestdelilah.com",
-    "stream.takios.de",
-    "stream.tasartir.cz",
-    "stream.thibug.net",
-    "stream.togen.xyz",
-    "stream.tumocs.eu",
-    "stream.uknow.moe",
-    "stream.unifiedberets.com",
-    "stream.var1able.network",
-    "stream.vulpinecitrus.info",
-    "stream.wandy.dev",
-    "stream.ystrbag.xyz",
-    "stream.yurupath.net",
-    "stream.zerojay.com",
-    "streamerchat.social",
-    "streamers.social",
-    "streamfurs.com",
-    "streaming.gnieh.org",
-    "streaming.marud.fr",
-    "streaming.spicysources.de",
-    "streaming.thies.xyz",
-    "streams.primordiagamers.com",
-    "streamund.schmus.is",
-    "streamz.ca",
-    "strectuna.me",
-    "strelizia.net",
-    "strelsky.net",
-    "strigo.social",
-    "strimolec.jeder.pl",
-    "stringcast.net",
-    "strings.io",
-    "strode.zone",
-    "structuregeek.social",
-    "stryder.cc",
-    "sts.lqt.moe",
-    "stuartpb.com",
-    "stubn.hallertau.social",
-    "studio.minipaint.ing",
-    "studio.musicvideoshow.ai",
-    "studio8502.ca",
-    "studyabroad.social",
-    "stunlock.social",
-    "su.kurotanesou.online",
-    "subcarrier.tv",
-    "subculture-space.com",
-    "subculture.chat",
-    "subdued.social",
-    "subeki.net",
-    "sublimity.net",
-    "subspacelink.com",
-    "substdn.feshiba.me",
-    "subversida.de",
-    "subversive.zone",
-    "suckersforstatus.social",
-    "sudo.cx",
-    "sudojudo.com",
-    "sudomakecake.ddns.net",
-    "sudovoodoo.ninja",
-    "sueden.social",
-    "sugar.dad",
-    "suivez.moi.ovh",
-    "sukebe.hostdon.ne.jp",
-    "sukebeneko.com",
-    "sukebepacos.com",
-    "sully.site",
-    "suma-ev.social",
-    "sumanko.com",
-    "summerhill.cafe",
-    "summerwind.blue",
-    "summoners-riftodon.jp",
-    "sunbeam.city",
-    "suncoast.dev",
-    "sundet.io",
-    "sunny.garden",
-    "sunpowered.house",
-    "sunrise.social",
-    "sunshine.town",
-    "sunshine.v6.rocks",
-    "sunshinecoast.social",
-    "sunspot.garden",
-    "sunspot.icu",
-    "suomi.social",
-    "sup.lelehier.de",
-    "super-gay.co",
-    "super.cybercyber.lol",
-    "superawesomeclub.vip",
-    "superchonkycat.social",
-    "superfun.club",
-    "supergood.social",
-    "superhappy.social",
-    "superheronecromancer.games",
-    "superhighway.social",
-    "superhollowknight.sytes.net",
-    "supernatural.fans",
-    "supernets.social",
-    "supernormalreads.nl",
-    "superpets.social",
-    "superrad.social",
-    "supersocial.space",
-    "supervolcano.angryshark.eu",
-    "sur.social",
-    "surberus.com",
-    "surf.cyberspace.club",
-    "surfin.dog",
-    "surfnet.space",
-    "surfzone.nz",
-    "surgeons.social",
-    "surreptitious.ly",
-    "surus.keepcoding.io",
-    "surutodon.net",
-    "survivalclass0.xyz",
-    "susunu.hostdon.ne.jp",
-    "susururu0.hostdon.ne.jp",
-    "sutra.rs",
-    "sutrofan.com",
-    "suya.place",
-    "sv-antares.de",
-    "sv1.in-deep.blue",
-    "svltan.at",
-    "svoboda.contact",
-    "svrdn.drillion.net",
-    "svu.social",
-    "sw-development-is.social",
-    "swain.social",
-    "swebb.social",
-    "swecyb.com",
-    "sweet.succubi.services",
-    "sweetappleacr.es",
-    "sweetie.moe",
-    "sweetme.at",
-    "swiftdevs.space",
-    "swinden.social",
-    "swingset.social",
-    "swiss-chaos.social",
-    "swiss-talk.net",
-    "swiss.social",
-    "swissodon.ch",
-    "swisttal.social",
-    "swj.io",
-    "swmnu.net",
-    "swop.social",
-    "sxgr.fun",
-    "sxl.cc",
-    "sxnlabs.social",
-    "sy.nthia.dev",
-    "syasai.club",
-    "sylfox.one",
-    "syma.social",
-    "symas.social",
-    "synaps.space",
-    "synapse.cafe",
-    "syndicat.chat",
-    "syndicat.solidaires.org",
-    "syngevity.hosted.spacebear.ee",
-    "syntaxerror.space",
-    "synth.senil888.com",
-    "synth.zip",
-    "synyx.social",
-    "syo.bar",
-    "syringa.social",
-    "sysadmin.run",
-    "systemli.social",
-    "systems.social",
-    "systerserver.town",
-    "syzito.xyz",
-    "szalacsi.social",
-    "szegoklub.hu",
-    "szklankaolowiu.pl",
-    "t-mobile.community",
-    "t.aqn.jp",
-    "t.chadole.com",
-    "t.den.yt",
-    "t.fred.social",
-    "t.freesky.im",
-    "t.hermine.in",
-    "t.joeldebruijn.nl",
-    "t.kaikoga.net",
-    "t.kiriha.me",
-    "t.manfre.net",
-    "t.number5.dev",
-    "t.q12.im",
-    "t.sugar.dad",
-    "t.testitfor.me",
-    "t.tusooa.xyz",
-    "t00t.cloud",
-    "t00t.it",
-    "t3n.social",
-    "t51b.org",
-    "taakka.fillari.xyz",
-    "taas.jokin.fi",
-    "tablegame.mstdn.cloud",
-    "tabletop.social",
-    "tabletop.vip",
-    "taciturn.social",
-    "taco.cc",
-    "tacobelllabs.net",
-    "tacocat.space",
-    "tacos3vian.de",
-    "tacticalpedia.social",
-    "tad.me",
-    "taedcke.social",
-    "tafarn.glauca.space",
-    "taffytavern.com",
-    "tagessch.eu",
-    "taidum.social",
-    "taidum.space",
-    "tailored.social",
-    "tailswish.industries",
-    "taiwan.riley-tech.net",
-    "taiwan.works",
-    "taiwan.wtf",
-    "takahe-gihyo-trial.shuuji3.xyz",
-    "takahe.blankpad.net",
-    "takahe.hacking.dk",
-    "takahe.humberto.io",
-    "takahe.ixvd.net",
-    "takahe.manfre.net",
-    "takahe.mercadosocial.madrid",
-    "takahe.pdp7.net",
-    "takahe.schach.social",
-    "takahe.scrun.ch",
-    "takahe.social",
-    "takahe.staging.django-cast.com",
-    "takahe.x59.us",
-    "takeko.monster",
-    "takeo.social",
-    "takoverse.syutin.com",
-    "talamanca.social",
-    "talipallopeli.club",
-    "talk.anmol.net.in",
-    "talk.brydge.dev",
-    "talk.drdiddlybadger.com",
-    "talk.halvbrax.se",
-    "talk.marq42.xyz",
-    "talk.mls20.de",
-    "talk.pupcostudios.com",
-    "talk.stayas.one",
-    "talk.wack.industries",
-    "talkedabout.social",
-    "talking.dev",
-    "talkingdrupal.social",
-    "talkonclimate.social",
-    "talks.edimood.com",
-    "talksmacky.com",
-    "tallahasseesocial.org",
-    "tallman.social",
-    "talos.link",
-    "tama.social",
-    "tambayan.us",
-    "tammenpaa.com",
-    "tams.tech",
-    "tane.codes",
-    "tangofam.space",
-    "tanuki.hostdon.ne.jp",
-    "tanztee.social",
-    "tapbots.social",
-    "tapenoise.cafe",
-    "tapeymctapeface.internaluse.net",
-    "taproot.social",
-    "taquiones.net",
-    "tarasupadon.com",
-    "tardis.pw",
-    "tardis.team",
-    "taruntarun.net",
-    "tassaron.com",
-    "tastybugs.club",
-    "tatooine.club",
-    "tatze.net",
-    "tau-ceti.space",
-    "taur.zone",
-    "tauri.earth",
-    "taurus-web.de",
-    "taverne-zum-wanderer.de",
-    "taxes.theron.kane-il.us",
-    "taxinews.pl",
-    "tbs.social",
-    "tchafia.be",
-    "tcp.fm",
-    "tcrscorner.social",
-    "tdd.social",
-    "tea.codes",
-    "teabag.ninja",
-    "teal.social",
-    "team.yarnspinner.dev",
-    "teamfmradio.com",
-    "teamfmradio.masto.host",
-    "teamhydra.social",
-    "teapot.zone",
-    "tearoom.tearmoon.com",
-    "teasmith.au",
-    "tebukuro.xyz",
-    "tech-nico.de",
-    "tech-savvy.social",
-    "tech.intersects.art",
-    "tech.lgbt",
-    "tech.retrotalk.live",
-    "tech.social.pekkasipila.com",
-    "techbacon.social",
-    "techdon.dev",
-    "techdonuts.uk",
-    "techeasy.org",
-    "techfieldday.net",
-    "techforgood.social",
-    "techguy.social",
-    "techhangout.social",
-    "techhub.social",
-    "techlover.eu",
-    "technodon.org",
-    "techopolis.social",
-    "techotakugamerz.com",
-    "techpolicy.social",
-    "techtoots.com",
-    "techy.jp",
-    "tecirli.family",
-    "tecnfy.com",
-    "tedcarstensen.social",
-    "teh.entar.net",
-    "tekkadon.manimani.cc",
-    "tekton.network",
-    "teldarpaper.com",
-    "tele.kenobit.it",
-    "telefant.net",
-    "telegrafverket.cc",
-    "telemoritz.de",
-    "teletoot.nl",
-    "teleurstellend.nl",
-    "telex.disinfo.zone",
-    "temp.odon.moe",
-    "tempo-rubato.xyz",
-    "temporary.baka.social",
-    "tenforward.social",
-    "tenochtitlan.city",
-    "tentacle.social",
-    "teqpot.info",
-    "teqqy.social",
-    "terapeldigitaal.nl",
-    "terberlo.dog",
-    "terere.social",
-    "terminal-gravity.com",
-    "terminal.ink",
-    "terra.incognita.net",
-    "terra.social",
-    "terrible.city",
-    "terrible.computer",
-    "terrible.fail",
-    "terrible.gay",
-    "terribly.social",
-    "terror.black",
-    "terz.at",
-    "tesdon.otasky.ja-jp.org",
-    "teslam.in",
-    "teslapwners.club",
-    "test-hideout.usbharu.dev",
-    "test.bvp.me",
-    "test.emelyne.eu",
-    "test.esi.is",
-    "test.itemis.social",
-    "test.jnktn.tv",
-    "test.lol.camp",
-    "test.mahood.dev",
-    "test.mascodon.jp",
-    "test.metaversum.wtf",
-    "test.monoceros.co.za",
-    "test.mstddntfdn.online",
-    "test.netzsphaere.xyz",
-    "test.oc.todon.fr",
-    "test.oliphant.social",
-    "test.ouda.space",
-    "test.queer.group",
-    "test.returntosander.net",
-    "test.sciences.social",
-    "test.tyrol.social",
-    "test.woof.tech",
-    "tester.social",
-    "testing.pixeldroid.org",
-    "testserver.capubara.com",
-    "tetrahedron.trisec.se",
-    "tetrax.de",
-    "tew.social",
-    "tewt.me",
-    "texano.cymru",
-    "texasobserver.social",
-    "textdump.juliannthestagelady.co.uk",
-    "tf3.social",
-    "tffp.masto.host",
-    "tfk.one",
-    "tfq.social",
-    "th-pape.de",
-    "tha.closed.social",
-    "thames.blisses.org",
-    "thatssofetch.pink",
-    "the-crossroads-inn.com",
-    "the-gathering.space",
-    "the-last-time.life",
-    "the-pit.uk",
-    "the-pub.fifo-f.eu",
-    "the.ait.place",
-    "the.asbestos.cafe",
-    "the.caffeination.space",
-    "the.cat.broker",
-    "the.enchanted.quest",
-    "the.gayest.dev",
-    "the.goofs.space",
-    "the.howl.moe",
-    "the.infinity.garden",
-    "the.others.social",
-    "the.tonytiger.club",
-    "the.unforgiven.pl",
-    "the.voiceover.bar",
-    "the.zymocosm.com",
-    "theaddict.ink",
-    "theaddict.xyz",
-    "theapex.social",
-    "theater.im",
-    "theatl.social",
-    "theatrez.day",
-    "thebag.social",
-    "thebigeasy.space",
-    "thebird.website",
-    "theblab.org",
-    "theblinkcorporation.com",
-    "theblower.au",
-    "thebristol.social",
-    "thecanadian.social",
-    "thecentralfinitecurve.com",
-    "thechairman.info",
-    "thechimp.zone",
-    "theclacks.cloud",
-    "thecommandline.social",
-    "theconsciousness.club",
-    "thecooltable.wtf",
-    "thecovertgeek.xyz",
-    "thecroft.masto.host",
-    "thedoodleprojectcom.network.thedoodleproject.net",
-    "thedreaming.city",
-    "theendpaper.social",
-    "theexpan.se",
-    "thefaith.social",
-    "thefamilyhangout.masto.host",
-    "thefire.work",
-    "thefishbowl.link",
-    "thefloweringash.com",
-    "thefolklore.cafe",
-    "thefooty.club",
-    "thefoxandalien.club",
-    "thegem.city",
-    "thegoatery.dyndns.org",
-    "thegoblin.market",
-    "thegrows.net",
-    "theha.us",
-    "thehacker.jp",
-    "thehappyfamily.stream",
-    "thehb.me",
-    "theinternet.social",
-    "thejesus.fish",
-    "thejoyo.com",
-    "thejuniverse.no",
-    "thelake.town",
-    "thelife.boats",
-    "theloading.bar",
-    "thelounge.network",
-    "them.cheeky.wales",
-    "themepark.community",
-    "themeparks.social",
-    "themiddleofthestreet.xyz",
-    "themondragons.com",
-    "thenks.social",
-    "theolddude.masto.host",
-    "theomega.zone",
-    "theophany.world",
-    "thepage.house",
-    "thepathbegins.social",
-    "thephpcc.social",
-    "thepit.social",
-    "theplace.social",
-    "theplant.social",
-    "thepollen.garden",
-    "theradio.au",
-    "theragnarbay.org",
-    "theres.life",
-    "thericydon.fedicity.net",
-    "thesenate.cc",
-    "thesinalab.de",
-    "thesix.social",
-    "thesnakepostoffice.online",
-    "thesystem.masto.host",
-    "thetake.zone",
-    "thetavern.social",
-    "thetransagenda.gay",
-    "thevillastraylight.com",
-    "thevipvipers.space",
-    "thewalkingdeaf.social",
-    "theweird.space",
-    "thewinter.space",
-    "thewired.wtf",
-    "thewiring.com",
-    "thewizardingworld.com",
-    "thias.hellqui.st",
-    "thicc.horse",
-    "thieves.quest",
-    "things.uk",
-    "thingy.social",
-    "thinkinginsystems.online",
-    "thinktanki.social",
-    "thinkydoers.social",
-    "third-party.cyou",
-    "thirdeyedesign.shop",
-    "this.mouse.rocks",
-    "this.wplr.rocks",
-    "thisbot.day",
-    "thisguy.wtf",
-    "thisis.mylegendary.quest",
-    "thisisnotaserver.com",
-    "thomashaley.social",
-    "thomasjpr.social",
-    "thonkbox.rightmouse.click",
-    "thoresson.social",
-    "thorstrom.fi",
-    "thoughtbot.social",
-    "thoughtful.social",
-    "thoughts.pehnet.org",
-    "threads.beep.computer",
-    "threads.social",
-    "threatactor.club",
-    "thu.closed.social",
-    "thunderstruck.fedicity.net",
-    "thx.gg",
-    "ti22.pro",
-    "tibia.life",
-    "tibus.social",
-    "ticker.hostdon.ne.jp",
-    "ticos.social",
-    "tiddyhonkers.com",
-    "tierranietos.tupambae.org",
-    "tietz.social",
-    "tiflo.social",
-    "tiggi.es",
-    "tighnari.site",
-    "tigr.dad",
-    "tilde.zone",
-    "time.wastr.com",
-    "timeriver.xyz",
-    "times.nekohack.me",
-    "timetheft.social",
-    "tincanphone.club",
-    "tines.spork.org",
-    "tinfoil.social",
-    "tingles.social",
-    "tinkertofu.com",
-    "tinnies.club",
-    "tinokaltsas.com",
-    "tiny.tilde.website",
-    "tinycities.net",
-    "tinylad.social",
-    "tiphon.nerv-project.eu",
-    "tippetarius.ru",
-    "tirami.hostdon.ne.jp",
-    "tired.umbreon.online",
-    "tirnanog.space",
-    "tivia.social",
-    "tiz.social",
-    "tjakosquad.nl",
-    "tjatse.no",
-    "tk.foytik.us",
-    "tkz.one",
-    "tl1.yumenosora.net",
-    "tldr.nettime.org",
-    "tldr.wesl.ee",
-    "tlef.social",
-    "tlpbro.nl",
-    "tlv.cool",
-    "tmi.community",
-    "tmi.pics",
-    "tmint.social",
-    "tmp20231105.kuroan.co",
-    "tmspk.net",
-    "tmss2291-1.hostdon.ne.jp",
-    "tmux.f5.si",
-    "tnku.co",
-    "tny.social",
-    "toad.social",
-    "toast.dragon2611.net",
-    "toastedlord.sytes.net",
-    "toddcast.website",
-    "todfox.photos",
-    "todon.eu",
-    "todon.jsna.dev",
-    "todon.nl",
-    "todon.ploud.fr",
-    "toepi.moe",
-    "toet.dnzm.nl",
-    "togethr.party",
-    "togl.me",
-    "tokhmi.xyz",
-    "toki.social",
-    "tokonatsu.social",
-    "tolppa.thermopylas.fi",
-    "tomarra.social",
-    "tombraidersocial.com",
-    "tomes.tchncs.de",
-    "tomica.social",
-    "tomkahe.com",
-    "tomo.airen-no-jikken.icu",
-    "tomredford.eu",
-    "ton-ton.link",
-    "tongfamily.com",
-    "tonibot.ddns.net",
-    "tonybark.art",
-    "tonybark.com",
-    "toolsforthought.rocks",
-    "toolsforthought.social",
-    "toon.social",
-    "toonvandeputte.be",
-    "tooot.im",
-    "toot-lab.reclaim.technology",
-    "toot-toot.wyrihaxim.us",
-    "toot.0upti.me",
-    "toot.2o4.ca",
-    "toot.4t2.uk",
-    "toot.8th.world",
-    "toot.9wd.eu",
-    "toot.a-lec.org",
-    "toot.abdulocra.cy",
-    "toot.abuzz.social",
-    "toot.acula.me",
-    "toot.ale.gd",
-    "toot.andr3.net",
-    "toot.anotherfauxtographer.com",
-    "toot.aquilenet.fr",
-    "toot.backbord.net",
-    "toot.ballioljcr.org",
-    "toot.beep.computer",
-    "toot.beer",
-    "toot.berdaguermontes.eu",
-    "toot.berlin",
-    "toot.beyondbinary.ovh",
-    "toot.bieniek-it.de",
-    "toot.bike",
-    "toot.bldrweb.org",
-    "toot.blue",
-    "toot.boston",
-    "toot.brsu.me",
-    "toot.brz9.dev",
-    "toot.burns.is",
-    "toot.c.pizzafactory.jp",
-    "toot.cafe",
-    "toot.cairobraga.com",
-    "toot.cat",
-    "toot.chalec.org",
-    "toot.chez.gay",
-    "toot.chifilly.co.uk",
-    "toot.cho.pm",
-    "toot.chx.ovh",
-    "toot.cloud",
-    "toot.cm-social.com",
-    "toot.codatory.com",
-    "toot.coinfund.app",
-    "toot.coinfundit.com",
-    "toot.community",
-    "toot.con-centric.com.au",
-    "toot.coupou.fr",
-    "toot.crewing.social",
-    "toot.cryolog.in",
-    "toot.cyano.uk",
-    "toot.d.sb",
-    "toot.d3fc0n.one",
-    "toot.darkcooger.net",
-    "toot.dddug.in",
-    "toot.design",
-    "toot.dianaband.info",
-    "toot.dice.quest",
-    "toot.digitaldebauchery.wtf",
-    "toot.diglet.ca",
-    "toot.dogboy.xyz",
-    "toot.drownthewitch.com",
-    "toot.dubdub.space",
-    "toot.dummy.cafe",
-    "toot.dusepo.co.uk",
-    "toot.earth",
-    "toot.ebu.io",
-    "toot.ecclesias.net",
-    "toot.eleith.com",
-    "toot.empathyintech.com",
-    "toot.ericrie.se",
-    "toot.eskuel.net",
-    "toot.ewsandor.com",
-    "toot.execbase.net",
-    "toot.fabulousfabs.fr",
-    "toot.facelord.com",
-    "toot.fan",
-    "toot.fedilab.app",
-    "toot.femboy.page",
-    "toot.feralsec.tv",
-    "toot.finfur.net",
-    "toot.foundation",
-    "toot.fromseabed.com",
-    "toot.fs.al",
-    "toot.funami.tech",
-    "toot.funnylookinhat.com",
-    "toot.g5n.de",
-    "toot.gagniard.org",
-    "toot.gaiac.io",
-    "toot.garden",
-    "toot.gathernorust.net",
-    "toot.gemeinschaffen.com",
-    "toot.gemma.ee",
-    "toot.glomzubuk.fr",
-    "toot.gnous.eu",
-    "toot.grelli.org",
-    "toot.groundctrl.earth",
-    "toot.hackrc.dev",
-    "toot.haulo.fi",
-    "toot.hoi-polloi.org",
-    "toot.home.biesdorfer.com",
-    "toot.hoppet.cool",
-    "toot.host",
-    "toot.hostdon.ne.jp",
-    "toot.houba.rocks",
-    "toot.houbahouba.de",
-    "toot.hoyle.me.uk",
-    "toot.hutor.duckdns.org",
-    "toot.huynguyen.org",
-    "toot.iamninja.ru",
-    "toot.igniterealtime.org",
-    "toot.ikata.co",
-    "toot.imowl.net",
-    "toot.infoteck.ru",
-    "toot.io",
-    "toot.iopush.net",
-    "toot.ipghod.tech",
-    "toot.ipmorris.com",
-    "toot.irithys.com",
-    "toot.j3b.in",
-    "toot.jasonscheirer.com",
-    "toot.jeena.net",
-    "toot.jhnc.me.uk",
-    "toot.jimmygulp.co.uk",
-    "toot.jkiviluoto.fi",
-    "toot.kabuff.club",
-    "toot.kakurady.ca",
-    "toot.kartonrad.de",
-    "toot.kasa-tomo.com",
-    "toot.kennery.com",
-    "toot.ketanvijayvargiya.com",
-    "toot.kevinschachtschneider.net",
-    "toot.kif.rocks",
-    "toot.kingj.net",
-    "toot.kliberal.com",
-    "toot.kobold.cafe",
-    "toot.kotocoop.org",
-    "toot.kottman.xyz",
-    "toot.kra.hn",
-    "toot.krinetzki.de",
-    "toot.krivokuca.dev",
-    "toot.kuba-orlik.name",
-    "toot.lab.how",
-    "toot.legacycode.rocks",
-    "toot.leif.pl",
-    "toot.lgbt",
-    "toot.li",
-    "toot.liw.fi",
-    "toot.lixo.org",
-    "toot.lmorchard.com",
-    "toot.lobrai.co",
-    "toot.lqdev.tech",
-    "toot.lt",
-    "toot.lucidragons.de",
-    "toot.lugbz.social",
-    "toot.lv",
-    "toot.majorshouse.com",
-    "toot.manji.dev",
-    "toot.mantyke.icu",
-    "toot.martyn.berlin",
-    "toot.matereal.eu",
-    "toot.mattedwards.org",
-    "toot.me.uk",
-    "toot.menkissing.gay",
-    "toot.metasyntactical.com",
-    "toot.mirbsd.org",
-    "toot.monny.cloud",
-    "toot.monster",
-    "toot.morikka.me",
-    "toot.mundane-semantics.net",
-    "toot.murderhobos.party",
-    "toot.nclf.net",
-    "toot.net-pbx.com",
-    "toot.niflheim.monster",
-    "toot.nimantu.de",
-    "toot.norbipeti.eu",
-    "toot.nsgn.eu",
-    "toot.nsobj.com",
-    "toot.nul.ie",
-    "toot.nx-pod.de",
-    "toot.oar-online.uk",
-    "toot.ohhh.no",
-    "toot.onitato.com",
-    "toot.onlyfans.tokyo",
-    "toot.orchid-cottage.uk",
-    "toot.org.il",
-    "toot.pacbard.duckdns.org",
-    "toot.paris",
-    "toot.party",
-    "toot.phasorburn.com",
-    "toot.phseiff.com",
-    "toot.pikopublish.ing",
-    "toot.pingu4.me",
-    "toot.pizza",
-    "toot.plus.yt",
-    "toot.poedelwitz.de",
-    "toot.portes-imaginaire.org",
-    "toot.prettyhefty.com",
-    "toot.protect.earth",
-    "toot.pyxel.cloud",
-    "toot.quebec",
-    "toot.queer-lexikon.net",
-    "toot.quest",
-    "toot.rainbow-100.com",
-    "toot.ramuuns.com",
-    "toot.rayonnant.org",
-    "toot.re",
-    "toot.renn.es",
-    "toot.reseed.it",
-    "toot.revelin.fr",
-    "toot.rhetro.de",
-    "toot.rhizome.red",
-    "toot.ring0.space",
-    "toot.robzazueta.com",
-    "toot.root.se",
-    "toot.rwell.org",
-    "toot.salted.fish",
-    "toot.scenetin.net",
-    "toot.scott.ee",
-    "toot.seiyuu.fans",
-    "toot.selfy.social",
-    "toot.senkitahara.com",
-    "toot.seraliane.org",
-    "toot.sh",
-    "toot.shoes",
-    "toot.shortbus.fail",
-    "toot.si",
-    "toot.sissom.net",
-    "toot.site",
-    "toot.smwhr.net",
-    "toot.snipesearch.co.uk",
-    "toot.somnium.fi",
-    "toot.sosh.co.uk",
-    "toot.spaill.net",
-    "toot.spooky.computer",
-    "toot.ss23.geek.nz",
-    "toot.subak.club",
-    "toot.supremesyntax.com",
-    "toot.team.jetzt",
-    "toot.techbeat.in",
-    "toot.teckids.org",
-    "toot.texasoct.tech",
-    "toot.the-cloud.io",
-    "toot.theantshill.co.uk",
-    "toot.thedoodleproject.net",
-    "toot.thoughtworks.com",
-    "toot.tom-eric.info",
-    "toot.tomais.nz",
-    "toot.tomn.co.uk",
-    "toot.treffenstaedt.de",
-    "toot.turbo.chat",
-    "toot.tux.si",
-    "toot.unisono.noho.st",
-    "toot.uoga.net",
-    "toot.upthis.io",
-    "toot.village.one",
-    "toot.wales",
-    "toot.whatever.cz",
-    "toot.whatif.org.uk",
-    "toot.whmcr.com",
-    "toot.works",
-    "toot.x2a.io",
-    "toot.xdncs.com",
-    "toot.y-y.li",
-    "toot.yosh.is",
-    "toot.you.havebroken.it",
-    "toot.yukimochi.jp",
-    "toot.zehaeva.com",
-    "toot.zerojay.com",
-    "toot.zof.sh",
-    "toot24.de",
-    "tootaloo.me",
-    "tootbot.org",
-    "tooteam.potchan.org",
-    "tooted.space",
-    "tooter.hellcat.net",
-    "tooter.kr",
-    "tooter.sftn.eu",
-    "tooter.social",
-    "tooter.srijan.site",
-    "tooter.thespawn.net",
-    "tooter.wishy.co.uk",
-    "tooters.org",
-    "toothole.org",
-    "tooting.cc",
-    "tooting.ch",
-    "tooting.intensifi.es",
-    "tooting.ninja",
-    "tootingwafu.rikozone.net",
-    "tootnet.nl",
-    "tootoro.monigatti.net",
-    "tootr.co",
-    "toots.258990001.xyz",
-    "toots.a-deed.com",
-    "toots.ahf9.ddnss.de",
-    "toots.ananace.dev",
-    "toots.benpro.fr",
-    "toots.cactys.xyz",
-    "toots.cc",
-    "toots.ch",
-    "toots.chamook.lol",
-    "toots.cl",
-    "toots.codeenigma.com",
-    "toots.cordelya.net",
-    "toots.coronet.io",
-    "toots.deds.nl",
-    "toots.dgplug.org",
-    "toots.downey.family",
-    "toots.fr.wtf",
-    "toots.hallanalysis.com",
-    "toots.hd0.eu",
-    "toots.hubns.net",
-    "toots.im",
-    "toots.inbutts.lol",
-    "toots.janl.eu",
-    "toots.kestrelsnest.social",
-    "toots.matapacos.dog",
-    "toots.meetwoof.com",
-    "toots.morepablo.com",
-    "toots.n7.gg",
-    "toots.niark.nexus",
-    "toots.nu",
-    "toots.pp.ua",
-    "toots.ravenoak.dev",
-    "toots.ro",
-    "toots.sahilister.in",
-    "toots.schwanksta.com",
-    "toots.social",
-    "toots.tangoit.net",
-    "toots.toby.ink",
-    "toots.tylerdavis.xyz",
-    "toots.valken.org",
-    "tootsfrom.ahabitual.dev",
-    "tootsmcgoots.io",
-    "tootsmygoots.com",
-    "tootspace.nl",
-    "tootsweet.social",
-    "toottoot.eu",
-    "tootworld.social",
-    "tootz.org",
-    "tootzi.ch",
-    "top-netz.de",
-    "topenddevs.social",
-    "topher.social",
-    "topofthe.city",
-    "topspicy.social",
-    "toque.town",
-    "tor.lat",
-    "torguard.social",
-    "torisan.party",
-    "torlaz.online",
-    "torment.nexus",
-    "tormentnexus.dev",
-    "tormentnexus.social",
-    "torontodiy.xyz",
-    "torsi.ca",
-    "torsten.cz",
-    "tosenberg.de",
-    "tosk.in",
-    "tot.yt",
-    "totallynormalis.land",
-    "totoot.social",
-    "touhou.vodka",
-    "toulouse.social",
-    "town.friendmaterial.lgbt",
-    "towns.gay",
-    "townsends.online",
-    "toyvey.xyz",
-    "tpjapub.us",
-    "tpo.world",
-    "tracyverse.social",
-    "tragically.social",
-    "trailblazer.social",
-    "trailrunning.social",
-    "trans.enby.town",
-    "trans.house",
-    "transden.lgbt",
-    "transfem.cloud",
-    "transfem.social",
-    "transforthe.win",
-    "transfur.social",
-    "transgirl.cafe",
-    "transient.garden",
-    "transitory.social",
-    "translesbian.top",
-    "transmom.love",
-    "transportation.social",
-    "transwo.men",
-    "tranvender.site",
-    "trapped.genoq.org",
-    "trash.boutique",
-    "trashbrain.org",
-    "traumatised.monster",
-    "traumatized.umbreon.online",
-    "travel-friends.chat",
-    "travelling-lurtles.world",
-    "travelpandas.fr",
-    "travis.webseitler.com",
-    "trebo.chat",
-    "treehouse.technopagans.de",
-    "trees.social",
-    "trefoil-mux.net",
-    "trek3.io",
-    "trekkies.social",
-    "trg.social",
-    "triangle.social",
-    "triangletoot.party",
-    "tribe.net",
-    "tricorder.social",
-    "trigaux.me",
-    "triggeron.net",
-    "trilobite.space",
-    "trilogy.lostswordfish.com",
-    "tripleeyegames.social",
-    "triptico.com",
-    "tristram.uber.space",
-    "trivia.to",
-    "trivia.town",
-    "trivial.observer",
-    "trn.social",
-    "troet.burg-halle.de",
-    "troet.cafe",
-    "troet.church",
-    "troet.elmoecho.de",
-    "troet.fediverse.at",
-    "troet.karlvalentin.de",
-    "troet.tay-tec.de",
-    "troet.wandel.social",
-    "troet.yavin3.de",
-    "troetbande.social",
-    "troeterei.de",
-    "troetet.de",
-    "troetmund.de",
-    "troettroet.de",
-    "troidy.social",
-    "trolley.seattlebus.space",
-    "trollian.space",
-    "trombas.vost.pt",
-    "troot.social",
-    "troublemaker.social",
-    "trouth.eu",
-    "trpg-o.xyz",
-    "trpg.cloud",
-    "true.kawi.fr",
-    "truflun.net",
-    "trumbeta.me",
-    "trunk.jmtr.org",
-    "trunk.lol",
-    "trunk.mad-scientist.club",
-    "truthandfreedom.social",
-    "truthsocial.co.in",
-    "truthsocial.com",
-    "tryme.social",
-    "trystero.social",
-    "tsarolion.com",
-    "tschopp.net",
-    "tschuss.li",
-    "tsellhorn.social",
-    "tsrats.net",
-    "tsubuyaki.choro3.net",
-    "tsukeru.moe",
-    "tsukihi.me",
-    "tsxs1.com",
-    "tt.myxoz.net",
-    "tt.vvxq.ca",
-    "ttocs.io",
-    "ttrpg-hangout.social",
-    "tty.icu",
-    "tty0.social",
-    "tu.social",
-    "tubul.net",
-    "tubular.social",
-    "tucows.social",
-    "tuebingen.network",
-    "tuffidon.de",
-    "tuit.fr",
-    "tuiter.rocks",
-    "tukkers.online",
-    "tulipgardenshow.masto.host",
-    "tulpa.social",
-    "tuluk.nl",
-    "tum.social",
-    "tummy.town",
-    "tunahan.social",
-    "tupambae.org",
-    "tupek.org",
-    "tur.bot",
-    "turath.tn",
-    "turbotime.turboteam.xyz",
-    "turingfesten.dk",
-    "turtle.pizza",
-    "turtleisland.art",
-    "turtleisland.buzz",
-    "turtleisland.rocks",
-    "turtleisland.social",
-    "turturea.online",
-    "tusk.chat",
-    "tusk.nali.social",
-    "tusk.schoollibraries.net",
-    "tusk.sfunk1x.com",
-    "tuskular.com",
-    "tusky.gravyflex.ca",
-    "tusky.pink",
-    "tusky.town",
-    "tut.alltatalla.se",
-    "tut.andreer.no",
-    "tut.iterate.no",
-    "tutoteket.no",
-    "tuttle.club",
-    "tutut.delire.party",
-    "tuusin.misono-ya.info",
-    "tux.social",
-    "tuxz.one",
-    "tv.aethernaut.eu",
-    "tv.coolpics.biz",
-    "tv.duc.gay",
-    "tv.gabsta.live",
-    "tv.kangaroopunch.com",
-    "tv.keithhacks.cyou",
-    "tv.schenklradio.de",
-    "tv.twigwhite.com",
-    "tv.yumeka.live",
-    "tvitero.com",
-    "tvwatch.party",
-    "tw.azazel.fun",
-    "tw.mnck.dev",
-    "tw.raziel-kanos.com",
-    "tw.town",
-    "twatter.com",
-    "tweesecake.social",
-    "tweet.assilvestrar.club",
-    "tweet.gleamorb.co.jp",
-    "tweet.reud.net",
-    "tweetrex.co.uk",
-    "tweets.makerbox.net",
-    "twentyzen.social",
-    "twexit.de",
-    "twhtv.club",
-    "twilight.social",
-    "twincities.photo",
-    "twinports.us",
-    "twipped.social",
-    "twit.dispersio.us",
-    "twit.social",
-    "twitchfr.social",
-    "twitter.oksocial.net",
-    "twitter.resolvt.net",
-    "twitter4.me",
-    "twitterexiles.social",
-    "twiukraine.com",
-    "twixter.eu",
-    "twlght.net",
-    "two-bits.org",
-    "twogate.social",
-    "twoheaded.monster",
-    "twoot.site",
-    "twoot.space",
-    "twothree.space",
-    "twt.mona.party",
-    "twt.turqtoise-soup.com",
-    "twtter.net",
-    "txnet.social",
-    "txs.es",
-    "txwb.org",
-    "tylernguyen.social",
-    "tyloves.coffee",
-    "typer.sh",
-    "types.pl",
-    "typetura.social",
-    "typhy.club",
-    "typing.fish",
-    "typing.ink",
-    "typo.social",
-    "typo3.social",
-    "typrout.ml",
-    "tyrol.social",
-    "tyt.maanebedotten.no",
-    "tzcafe.com",
-    "u.miaomiao.li",
-    "u1v83njxe.duckdns.org",
-    "u2.social",
-    "u222news.fedicity.net",
-    "uaqh-devices.masto.host",
-    "ublog.byme.at",
-    "ublog.fedi.bbrks.me",
-    "ublog.tech",
-    "ublog.thirdlaw.net",
-    "ubuntu.social",
-    "ucb.social",
-    "uchu-teien.com",
-    "uchujin.space",
-    "uddannelse.social",
-    "udongein.xyz",
-    "ue.oiaa.aaio.eu",
-    "uec-mstdn.com",
-    "uestc.social",
-    "uff.rip",
-    "ufm.lol",
-    "ufoo9k.space",
-    "ufotofu.e17.dev",
-    "uglymachine.social",
-    "uhlig.social",
-    "uhlmann.social",
-    "ukadon.shillest.net",
-    "ukgb.social",
-    "ukraine.rs",
-    "ukrainian.network",
-    "uksocial.net",
-    "ukuru.net",
-    "uldegrova.com",
-    "uli.pub",
-    "ulman.social",
-    "ulmd.de",
-    "ultrametric.space",
-    "um.lugarzinho.top",
-    "umaikebab.xyz",
-    "umbracocommunity.social",
-    "umet.us",
-    "ummah.ps",
-    "umwelt.social",
-    "unam.social",
-    "unaone.social",
-    "unbound.social",
-    "unboxed.social",
-    "uncontrollablegas.com",
-    "undefined.social",
-    "under-bank.blue",
-    "undernopretext.social",
-    "underwear.social",
-    "uneducatedopinion.nl",
-    "unfufadoo.net",
-    "unfug.social",
-    "unholymemes.com",
-    "uni.vuwuv.com",
-    "uninspired.dev",
-    "union.place",
-    "union.sh",
-    "unipar.online",
-    "unitedmastodon.com",
-    "univention.social",
-    "universe.feliver.se",
-    "universeodon.com",
-    "unix.family",
-    "unixspace.online",
-    "unkomaker.hostdon.ne.jp",
-    "unkworks.net",
-    "unleashedbones.life",
-    "unmute.community",
-    "unnerv.jp",
-    "unocha.social",
-    "unperson.us",
-    "unpopular.me",
-    "unreliable.associates",
-    "unsociable.social",
-    "unstable.icu",
-    "unstable.solutions",
-    "unstraight.club",
-    "unsupervised.ca",
-    "unteraffen.de",
-    "untrusted.website",
-    "unvaxxed.nl",
-    "unverified.club",
-    "unvernunft.social",
-    "unxpnx.farm",
-    "uoh.cx",
-    "upallnight.minnix.dev",
-    "updates-physics-principle-colombia.trycloudflare.com",
-    "updog.no",
-    "upload.chat",
-    "upp2.com",
-    "uprise.rd4j.familyds.net",
-    "urbanists.social",
-    "urbansolarpunk.social",
-    "urbansound.social",
-    "urda.social",
-    "urface.social",
-    "urgo.social",
-    "urhub.co",
-    "uri.life",
-    "ursa.cafe",
-    "ursal.zone",
-    "ursula.ahlamon.org",
-    "urusai.social",
-    "us.andrewscom.net",
-    "us.woundclinic.space",
-    "usr.cloud",
-    "usuzakuraya.us",
-    "utih.net",
-    "utopia.cool",
-    "utopie.peacefrogs.net",
-    "utter.online",
-    "utveckla.re",
-    "uuchten.lu",
-    "uuu.moe",
-    "uvensys.social",
-    "uvix.cc",
-    "uwu.mikkonen.com",
-    "uwu.social",
-    "uwu.town",
-    "uwunifi.com",
-    "uwuzunext.info",
-    "uwyn.net",
-    "v-insanity.com",
-    "v2.flyingcube.tech",
-    "v2.mstdn-dystopia.com",
-    "v2.nyoki.club",
-    "v2.social",
-    "v2br.social",
-    "v45423.1blu.de",
-    "v64.net",
-    "va-11-hall-a.cafe",
-    "vacatureforum.nl",
-    "vael.town",
-    "vahera.social",
-    "valenciapa.ws",
-    "valerio.se",
-    "valkyriecoms.com",
-    "vampiremaid.cafe",
-    "van-der-boom.nl",
-    "vandrare.page",
-    "vanilla.choco.ink",
-    "vapers.jp",
-    "vapeslurry.social",
-    "var.one",
-    "varishangout.net",
-    "varjo.org",
-    "varjoalitajunta.link",
-    "varmint.town",
-    "varwest.fr",
-    "vasra.masto.host",
-    "vaughan.social",
-    "vault322.net",
-    "vault37.xyz",
-    "vbucks.me",
-    "vdlc.social",
-    "vdome.net",
-    "vebinet.com",
-    "vectemis.social",
-    "vedimak.ru",
-    "veenus.art",
-    "veganbyproxy.net",
-    "vegane.schule",
-    "veganism.social",
-    "vegenx.social",
-    "vegoon.party",
-    "velhaestante.com.br",
-    "velocipederider.com",
-    "velodrama.cc",
-    "velour.social",
-    "venera.social",
-    "venture.smugcat.moe",
-    "venturom.social",
-    "veoh.social",
-    "verbraucherzentrale.social",
-    "verces.vercel.app",
-    "verhu.xyz",
-    "verified.coop",
-    "verified.mastodonmedia.xyz",
-    "verkehrswende.social",
-    "vermont.masto.host",
-    "vernissage.photos",
-    "veronaxxx.masto.host",
-    "verr.cc",
-    "verse.aubrielee.com",
-    "verse.averagedood.xyz",
-    "verse.belltower.it",
-    "verse.c0de.works",
-    "verse.r73.info",
-    "vertexspew.social",
-    "verumsocial.com",
-    "very.photos",
-    "very.stupid.fish",
-    "very.tastytea.de",
-    "vesper.xizero.com",
-    "veterinary.education",
-    "vgg.lol",
-    "vgn.church",
-    "vhs.social",
-    "vhspace.social",
-    "vickerson.me",
-    "vicks.social",
-    "victoria.masto.host",
-    "vidbin.social",
-    "video.asulia.fr",
-    "video.collado.eu",
-    "video.mezzo.moe",
-    "video.myocci.social",
-    "video.paavi.eu",
-    "video.radioriquelme.cl",
-    "videochina.net",
-    "videohosting.social",
-    "vierays.net",
-    "view.voided.ee",
-    "vigaucho.eu",
-    "viidalepp.me",
-    "viii.0x42.net",
-    "village.feathertrail.fun",
-    "vim.town",
-    "vinegarinn.studio",
-    "vinzenz.social",
-    "violet-apple-machine.fedicity.net",
-    "violetists.violetism.com",
-    "vipper.party",
-    "virus.org",
-    "vis.social",
-    "visalian.com",
-    "visions.007media.ddns.net",
-    "visitors.sk",
-    "vivaldi.social",
-    "vivaristics.net",
-    "vivatucson.net",
-    "vive.im",
-    "vivere.uno",
-    "vivinezz.hostdon.ne.jp",
-    "vixen.zone",
-    "vk5fj.net",
-    "vkfksdmltl.co",
-    "vkl.world",
-    "vlad.d2dx.com",
-    "vltava.cloud",
-    "vmh.rest",
-    "vmst.io",
-    "vnecke.social",
-    "vnil.de",
-    "vnyanzo.com",
-    "vocalfry.social",
-    "vocalodon.net",
-    "vocalounge.cafe",
-    "vocationnet.com",
-    "vogtland.social",
-    "voi.social",
-    "voiceover.actor",
-    "void.0x0a.de",
-    "void.abnormalfreq.com",
-    "void.danitheskunk.com",
-    "void.holdings",
-    "void.hostdon.ne.jp",
-    "void.lgbt",
-    "void.rehab",
-    "voidfarm.pw",
-    "voidwood.online",
-    "voip.social",
-    "volksverpetzer.social",
-    "volt.cafe",
-    "volumetrics.social",
-    "vonhaller.social",
-    "vonsee.de",
-    "vorlon.space",
-    "vorny-animals.online",
-    "vortex.masto.host",
-    "vostain.net",
-    "votho.social",
-    "vox.social",
-    "voxdiva.poorabstraction.dev",
-    "voxtek.enterprises",
-    "voyager.interstellar.flights",
-    "voyagersocial.inet.place",
-    "vps.globaltech-hub.com",
-    "vps.oh-kei.info",
-    "vps98938.inmotionhosting.com",
-    "vran.as",
-    "vrc-ins.net",
-    "vrc-instance.xyz",
-    "vrchat.today",
-    "vrcjp.hostdon.ne.jp",
-    "vrnd.network",
-    "vrparty.social",
-    "vrsimility.masto.host",
-    "vshn.social",
-    "vss365mast.org",
-    "vt.social",
-    "vtdon.com",
-    "vtgcomp.com",
-    "vtor.me",
-    "vtuber.house",
-    "vtubers.site",
-    "vucica.net",
-    "vulpes.directory",
-    "vulpini.zone",
-    "vyizis.tech",
-    "vymazal.social",
-    "vyos.social",
-    "vyrse.social",
-    "w.ow3.cn",
-    "w3c.social",
-    "waag.social",
-    "waarland.eu",
-    "waf.social",
-    "wafer.baby",
-    "waff.club",
-    "waha.work",
-    "wahni.at",
-    "waifuhub.lol",
-    "wakoka.com",
-    "wakuwakuwayama.net",
-    "waldorf.fyi",
-    "waldvogel.family",
-    "walkah.social",
-    "walkwithme.today",
-    "wall.demouliere.eu",
-    "wallflowersocial.club",
-    "wallofconfusion.org",
-    "wallonie-bruxelles.social",
-    "wanderers-waypoint.com",
-    "wandering.shop",
-    "wanderingdj.hostdon.ne.jp",
-    "wanderingwires.net",
-    "wandzeitung.xyz",
-    "wang.nz",
-    "wank.social",
-    "wants.coffee",
-    "waq.anqou.net",
-    "warband.cc",
-    "wargamers.social",
-    "warhammer.social",
-    "warped.dev",
-    "washcan.social",
-    "washington.communitynetwork.us",
-    "waskuisland.com",
-    "wasnever.cool",
-    "watch.brvy.space",
-    "watch.chjh.nl",
-    "watch.frostyfrog.net",
-    "watch.geewiz.dev",
-    "watch.kawen.site",
-    "watch.onilynx69.live",
-    "watch.techspot.live",
-    "watch.tela.moe",
-    "watch.thepolarbear.co.uk",
-    "watch.vcr.party",
-    "water.house",
-    "waterford.international",
-    "waterlily.tokyo",
-    "wave.kaosteam.net",
-    "wavebird.party",
-    "wawa-huayuan.blue",
-    "wayland.social",
-    "wayne.social",
-    "waytoomuch.info",
-    "wb.takesato.io",
-    "wbrew.radom.pl",
-    "we.defake.app",
-    "we.tei.li",
-    "we.weirdos.social",
-    "weareprolife.net",
-    "wearman.cyberwa.re",
-    "weatherbot.xyz",
-    "weatherby2378.social",
-    "weatherishappening.network",
-    "weaviate.community",
-    "web-dev.social",
-    "web4.us",
-    "webassembly.social",
-    "webdev.so",
-    "webmapping.social",
-    "webperf.social",
-    "webscroll.ing",
-    "webwizard.uk",
-    "webworker.social",
-    "webxr.social",
-    "wedin.us",
-    "wedistribute.org",
-    "wedomad.science",
-    "weed.reimu.download",
-    "weedyverse.de",
-    "weekly.org",
-    "wehavecookies.social",
-    "wei.brainsocks.xyz",
-    "weibo.zhangyuqing.cn",
-    "weide.social",
-    "weilnboeck.social",
-    "weird.autos",
-    "weirder.earth",
-    "weirdgone.pro",
-    "weirdo.network",
-    "weirdstar.stream",
-    "weirwood.social",
-    "weiser.social",
-    "welcometo.squelfland.com",
-    "wellcr.app",
-    "welldn.net",
-    "wellduck.me",
-    "welsea.site",
-    "welt.all.de",
-    "wenxi.link",
-    "wer.social",
-    "werd.social",
-    "were.party",
-    "were.social",
-    "werebeast.net",
-    "weremember.social",
-    "werewolf.town",
-    "werm.world",
-    "weserbergland.social",
-    "westen.social",
-    "westend61.social",
-    "westergaard.photos",
-    "westergaard.social",
-    "westpsyche.masto.host",
-    "westvisions.social",
-    "wetdry.world",
-    "wetoot.xyz",
-    "wetshaving.social",
-    "weyhe.social",
-    "weyr.social",
-    "whale.party",
-    "what.entire.website",
-    "whatwasidoingagain.com",
-    "where.keri.is",
-    "whereismysupersuit.com",
-    "whet.whetmoser.com",
-    "whinge.house",
-    "whinge.town",
-    "whisper.tf",
-    "whistlergw.life",
-    "white-gerbera.net",
-    "whitehouse.org",
-    "whitelakeisland.hostdon.ne.jp",
-    "whitelion.me",
-    "whitesmokebbq.social",
-    "whitespashe.uk",
-    "whitewomen.dog",
-    "who.needsmo.re",
-    "wholesome.computer",
-    "whoneedsabudget.cheap",
-    "whoseknowledge.social",
-    "whut.social",
-    "why.161.sh",
-    "whyso.social",
-    "widerweb.org",
-    "widget.uk",
-    "wiebeatomic.wpcomstaging.com",
-    "wien.rocks",
-    "wienermobile.rentals",
-    "wiesbaden.social",
-    "wig.gl",
-    "wig.social",
-    "wiggle.website",
-    "wiimote.party",
-    "wiir.libtar.de",
-    "wiki.style",
-    "wikimedia.social",
-    "wikis.world",
-    "wildarrow.ink",
-    "wildarrow.net",
-    "wilddog.hendikins.id.au",
-    "wildebeest.fediverse.pl",
-    "wildebeest.gmad.dev",
-    "wildebeest.tooot.app",
-    "wildfire.social",
-    "williamscloud.space",
-    "wim.lol",
-    "windbag.org",
-    "windows11sucks.com",
-    "windscribe.social",
-    "winecountry.social",
-    "winnick.io",
-    "winther.social",
-    "wir.muessenreden.de",
-    "wired.fedicity.net",
-    "wired.icu",
-    "wireless-iot.social",
-    "wires.social",
-    "wirnity.de",
-    "wisc.social",
-    "wisdomhole.com",
-    "wisehex.social",
-    "wisskomm.social",
-    "wisteria.cafe",
-    "wistodon.org",
-    "witches.live",
-    "witches.pub",
-    "witches.rest",
-    "witches.social",
-    "witchli.eu",
-    "witchlounge.ca",
-    "witchy.ink",
-    "withbrains.com",
-    "without-magic.world",
-    "witten.social",
-    "witter.cz",
-    "wiwi.blog",
-    "wiz.social",
-    "wizard.casa",
-    "wizarding-world.icu",
-    "wizards.business",
-    "wizards.social",
-    "wizzards.club",
-    "wizzzard.online",
-    "wjlafrance.net",
-    "wk30.com",
-    "wkfa.org",
-    "wkly.ws",
-    "wmd.social",
-    "wobbl.xyz",
-    "wobbly.ninja",
-    "wobscale.social",
-    "woehl.social",
-    "woem.men",
-    "woem.space",
-    "wohnzimmer.social",
-    "wokka.be",
-    "wolfbunny.lgbt",
-    "wolfdo.gg",
-    "wolfgirl.bar",
-    "wolfhaus.me",
-    "wolfi.ee",
-    "wolke7.meinzeug24.de",
-    "wollig.social",
-    "wolvesare.sexy",
-    "wonderful.social",
-    "wonkodon.com",
-    "woodland.cafe",
-    "woodweb.social",
-    "woodwideweb.social",
-    "woodworking.group",
-    "woof.group",
-    "woof.lokinet.uk",
-    "woof.place",
-    "woof.tech",
-    "woofy.social",
-    "woolly.monster",
-    "wor.mnino.us",
-    "wordcraft.social",
-    "wordmine.com",
-    "wordnik.social",
-    "wordsmith.reverie.club",
-    "work-at-hospital.com",
-    "workaholic.cloud",
-    "worklifepsych.social",
-    "worldkey.io",
-    "worldnl.com",
-    "worldparty.xyz",
-    "worldtravel.photos",
-    "worm.horse",
-    "worst.computer",
-    "woz.ap.social",
-    "wp-activitypub.kher.nl",
-    "wp-punks.social",
-    "wp-social.net",
-    "wp.rolandmoriz.de",
-    "wp.selfhosting.rocks",
-    "wp.winedeck.net",
-    "wpbuilds.social",
-    "wpmastodon.es",
-    "wptoots.social",
-    "wrannek.me",
-    "wrestle.town",
-    "wrestling.social",
-    "writ.live",
-    "write.echoless.space",
-    "writeout.ink",
-    "writersaur.us",
-    "writing.exchange",
-    "wrong.tools",
-    "wsb.social",
-    "wspanialy.eu",
-    "wstrsd.masto.host",
-    "wtwo.me",
-    "wubba.boo",
-    "wud.me",
-    "wue.social",
-    "wuffs.org",
-    "wug.fun",
-    "wulf.social",
-    "wwbaker.net",
-    "www.1nd33d.social",
-    "www.acor3.it",
-    "www.acortech.it",
-    "www.acts13.net",
-    "www.advrider.net",
-    "www.alberniweather.ca",
-    "www.ams.su",
-    "www.aquinoscuidamos.org",
-    "www.artblock.de",
-    "www.asso-sterenn.fr",
-    "www.bachhausen.de",
-    "www.blabbergoats.com",
-    "www.blimps.xyz",
-    "www.blogdeviajes.com.ar",
-    "www.bookwyrm.social",
-    "www.brighteon.social",
-    "www.consumertraveltips.com",
-    "www.diegogabriele.it",
-    "www.erica.moe",
-    "www.extropian.net",
-    "www.fachkraeftesicherer.de",
-    "www.factelves.com",
-    "www.familienfreund.de",
-    "www.fedica.de",
-    "www.firr.cam",
-    "www.gadgetgedanken.de",
-    "www.gayonly.ch",
-    "www.gctaisentl.com",
-    "www.glidden.life",
-    "www.gregnilsen.com",
-    "www.hatabowyou.com",
-    "www.importanthings.it",
-    "www.jdracademy.com",
-    "www.kanoa.de",
-    "www.karlskron-politik.info",
-    "www.knowicles.com",
-    "www.laka.org",
-    "www.ldwg.me",
-    "www.librepunk.club",
-    "www.listbuglar.com",
-    "www.littlefaqs.com",
-    "www.llun.me",
-    "www.lykledevries.nl",
-    "www.mancavgeek.co.uk",
-    "www.masto.pt",
-    "www.mastodon.scot",
-    "www.matatabi.com",
-    "www.miriamrobern.com",
-    "www.mstddntfdn.online",
-    "www.myronland.com",
-    "www.naturistlife.co.uk",
-    "www.nekotodon.com",
-    "www.olisny.com",
-    "www.omeowgle.com",
-    "www.operationpuppet.com",
-    "www.operationpuppet.live",
-    "www.pandoli365.com",
-    "www.paradiseve.com",
-    "www.paxasteriae.co.uk",
-    "www.perspectist.com",
-    "www.philos.refchat.net",
-    "www.polylux.xyz",
-    "www.portale.fuci.net",
-    "www.psychocloud.tech",
-    "www.seo-theory.com",
-    "www.sharebright.net",
-    "www.snowracer.se",
-    "www.sociale.network",
-    "www.streamfurs.com",
-    "www.swiftdevjournal.com",
-    "www.taxinews.pl",
-    "www.timprobst.com",
-    "www.trailrunnersdog.de",
-    "www.trplane.com",
-    "www.vnyanzo.com",
-    "www2.kt2003.info",
-    "www2.patriot.online",
-    "wx.social",
-    "wxcloud.social",
-    "wxw.moe",
-    "wybt.net",
-    "wyrm.glauca.space",
-    "wyrm.mad-goat.tech",
-    "wyrm.maraval.net",
-    "wyrms.de",
-    "wyrmsign.org",
-    "wyvern.blue",
-    "wzrds.fun",
-    "x.4j.ee",
-    "x.80px.com",
-    "x.bch.at",
-    "x.compi.lol",
-    "x.good.news",
-    "x.goonj.xyz",
-    "x.gthree.win",
-    "x.iceblack.coffee",
-    "x.ir31.com",
-    "x.isalman.dev",
-    "x.kauaku.us",
-    "x.liquichat.com",
-    "x.lunatiki.de",
-    "x.nichipon.com",
-    "x.rulook.net",
-    "x.rushover.me",
-    "x.tkw.fm",
-    "x.zyi.io",
-    "x0.dk",
-    "x0f.org",
-    "x0r.be",
-    "x41.social",
-    "x86.social",
-    "xarxa.cloud",
-    "xarxamontgri.masto.host",
-    "xavier.ooo",
-    "xcloud.zone",
-    "xcoder.org",
-    "xd.trispadsmit.com",
-    "xelebre.com",
-    "xeno.chat",
-    "xeno.glyphpress.com",
-    "xerg.rais.au",
-    "xeri.irex.aretex.ca",
-    "xerrem.xyz",
-    "xforum.dev",
-    "xianlandia.com",
-    "xierqi.club",
-    "xinyang.life",
-    "xmitter.cc",
-    "xmob.social",
-    "xn--00w656a.xn--2os22eixx6na.xn--kpry57d",
-    "xn--56a.social",
-    "xn--69a.xn--99axc.xn--y9a3aq",
-    "xn--69aa8bzb.xn--y9a3aq",
-    "xn--80aaid7au.su",
-    "xn--8r9a.com",
-    "xn--baw-joa.social",
-    "xn--blahaj-1125e.ws",
-    "xn--brd-zma.app",
-    "xn--c9j1b.xn--r9j630glz6a.xn--q9jyb4c",
-    "xn--eckycf7j.com",
-    "xn--eckza.net",
-    "xn--j5r817a.com",
-    "xn--kdk0c930v.com",
-    "xn--llq98d.jp",
-    "xn--lofll-1sat.is",
-    "xn--nanako--c83f6n.mooo.com",
-    "xn--netzsphre-12a.xyz",
-    "xn--nrrebro-q1a.space",
-    "xn--p1abe3d.xn--80asehdb",
-    "xn--pnibles-bya.xn--transposes-i7a.eu",
-    "xn--r9j630glz6a.xn--q9jyb4c",
-    "xn--ratatskr-r4a.de",
-    "xn--t8j1bd0a4k.xn--q9jyb4c",
-    "xn--trt-tna.eu",
-    "xn--trt-tna.wala2x.de",
-    "xn--xxa.computer",
-    "xn--y9a6bah4ck.xn--y9a3aq",
-    "xn--zck4ad5f2e.xn--q9jyb4c",
-    "xno.social",
-    "xo.se",
-    "xoxo.zone",
-    "xreality.social",
-    "xscape.top",
-    "xtaldave.net",
-    "xtom.social",
-    "xtux.org",
-    "xu.rs",
-    "xuha.net",
-    "xvlt.net",
-    "xx0r.eu",
-    "xxx-stg.azyobuzi.net",
-    "xxx.azyobuzi.net",
-    "xys.town",
-    "xyu.social",
-    "xyzyx.org",
-    "xyzzy.link",
-    "xz.vc",
-    "xz6.ch",
-    "y.cubalibre.social",
-    "y.diskcat.com",
-    "y.sukiyaki.fr",
-    "yabtm.us",
-    "yakker.app",
-    "yakumo.foundation",
-    "yakyudon.net",
-    "yallywood.club",
-    "yamabi.co",
-    "yamagadon.com",
-    "yandere.cc",
-    "yaong.org",
-    "yap.bls.ooo",
-    "yap.nishy.fr",
-    "yapstreams.com",
-    "yarmo.live",
-    "yasaiseikatsu.net",
-    "yatil.social",
-    "yearning.gay",
-    "yee.camp",
-    "yeen.exposed",
-    "yeen.social",
-    "yeg.bike",
-    "yelling.it",
-    "yellingata.cloud",
-    "yellowmustard.club",
-    "yeoldepub.social",
-    "yetanother.place",
-    "yfwu.org",
-    "yggdrasil.social",
-    "yharnam.singles",
-    "yiff.life",
-    "yik.kero.pw",
-    "yinyang.social",
-    "yinzer.city",
-    "yip.gay",
-    "yip.vulpine.engineer",
-    "ykzts.technology",
-    "ynotnetwork.com",
-    "yodasec.blog",
-    "yodogawa.hostdon.ne.jp",
-    "yoitsu.moe",
-    "yoix.com",
-    "yokai.cafe",
-    "yokonegi.hostdon.ne.jp",
-    "yonkeydonkey.be",
-    "yonle.host.lecturify.net",
-    "yonle.lecturify.net",
-    "york.social",
-    "yoshida2015.net",
-    "yotie.blue",
-    "youmewrite.com",
-    "your-face.social",
-    "your.sensor.community",
-    "yourwalls.today",
-    "youtaite.xyz",
-    "youth.social",
-    "youthweb.social",
-    "yrrsdn.rukonichi.com",
-    "yttrx.com",
-    "yuga.surf",
-    "yukari.cafe",
-    "yukisou.xyz",
-    "yulran.masto.host",
-    "yumeka.pw",
-    "yunase.com",
-    "yunochi.moe",
-    "yunyun.moe",
-    "yutacar.info",
-    "yuustan.space",
-    "yuzupon.fedicity.net",
-    "yxsr9ynv9njacchd2o47uovq4pvda5f2.hostdon.ne.jp",
-    "yyc.bike",
-    "yygq.de",
-    "yysk.icu",
-    "z.gidikroon.eu",
-    "z0ne.stream",
-    "za.la",
-    "zachwolfe.me",
-    "zacpwhite.social",
-    "zaidin.lgbt",
-    "zany.tech",
-    "zap.amiok.net",
-    "zarapito.cl",
-    "zarja.crq.systems",
-    "zdf.social",
-    "zeal.center",
-    "zebra.gnubox.org",
-    "zecko.social",
-    "zeeborn.social",
-    "zeero.dev",
-    "zeigt-seine.entenbru.st",
-    "zeitung.social",
-    "zeka.cloud",
-    "zentribe.social",
-    "zenyasai.g-fukurowl.club",
-    "zenzone.social",
-    "zephyr.place",
-    "zepi.social",
-    "zeppelin.flights",
-    "zeroes.ca",
-    "zeroping.cc",
-    "zerschnurrt.de",
-    "zetaspace.org",
-    "zettel.haus",
-    "zh.pp.social",
-    "zhenmei.li",
-    "zhub.link",
-    "zia.io",
-    "zifengling.com",
-    "zika.social",
-    "zirk.us",
-    "zitidar.barsoom.cc",
-    "zitrusrot.de",
-    "ziurkes.group.lt",
-    "zk.gotdns.ch",
-    "zmtdn.de",
-    "znajomi.suwerenni.org",
-    "znark.us",
-    "znsk.ca",
-    "zocial.cc",
-    "zocial.ee",
-    "zoeoconnell.co.uk",
-    "zoinks.one",
-    "zombie.beauty",
-    "zombie.social",
-    "zombienet.org",
-    "zombofant.net",
-    "zomglol.wtf",
-    "zone.liolok.com",
-    "zoner.work",
-    "zonk.be",
-    "zoo.retro-ink.com",
-    "zoomlife.me",
-    "zoot.fun",
-    "zoroark.cafe",
-    "zov.oti.st",
-    "zpravobot.news",
-    "zrq.io",
-    "zsiegel.social",
-    "ztechnical.net",
-    "zug.network",
-    "zuhair.social",
-    "zurich-mastodon.ch",
-    "zusammenhalt.de",
-    "zusammenkunft.net",
-    "zweibruecken.social",
-    "zx81.social",
-    "zxz.moe",
-    "zy.gy",
-    "zyl.se",
-    "zzuli.closed.social",
-    "zzz.grtsk.com",
-    "zzz.hirunekingdom.com",
-}
-
-__all__ = ['instances']
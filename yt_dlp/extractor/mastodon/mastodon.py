@@ -5,11 +5,7 @@
 import json
 import re
 
-try:
-    from .instances import instances
-except ImportError:
-    instances = ('gab.com', )
-
+from .._instances import InstanceList
 from ..common import SelfHostedInfoExtractor
 from ..peertube.peertube import PeerTubeIE
 from ...utils import (
@@ -33,9 +29,6 @@
 )
 
 
-known_valid_instances = set()
-
-
 class MastodonBaseIE(SelfHostedInfoExtractor):
     _SH_VALID_CONTENT_STRINGS = (
         ',"settings":{"known_fediverse":',  # Mastodon initial-state
@@ -54,8 +47,7 @@ class MastodonBaseIE(SelfHostedInfoExtractor):
 
     _IMPOSSIBLE_HOSTNAMES = ('medium.com', 'lbry.tv')
     _HOSTNAME_GROUPS = ('domain_1', 'domain_2', 'domain')
-    _INSTANCE_LIST = instances
-    _DYNAMIC_INSTANCE_LIST = known_valid_instances
+    _INSTANCE_LIST = InstanceList('mastodon', ('gab.com', ))
     _NODEINFO_SOFTWARE = ('mastodon', 'pleroma', 'gab')
     _SOFTWARE_NAME = 'Mastodon'
 
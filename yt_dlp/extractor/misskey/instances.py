@@ -1,1143 +0,0 @@
-# coding: utf-8
-# AUTOMATICALLY GENERATED FILE. DO NOT EDIT.
-# Generated by ./devscripts/make_misskey_instance_list.py
-from __future__ import unicode_literals
-
-instances = {
-    # list of instances here
-    "0001.misskey.one",
-    "114514.misskey.one",
-    "14141004.xyz",
-    "16bit.picopico.party",
-    "21stcentury.day",
-    "2248.live",
-    "230029.xyz",
-    "2done.club",
-    "2nx.io",
-    "45sukey.net",
-    "829.hu",
-    "84bami.net",
-    "9ineverse.com",
-    "a.sukazyo.cc",
-    "a1.miclear.casa",
-    "abs.17oc.com",
-    "abyssal.rip",
-    "ains-no-misskey.wkspcloud.com",
-    "anarkey.xennippon.net",
-    "anime.midday.top",
-    "ankokunogrove.space",
-    "anymanystreams.cc",
-    "ap.nsr.life",
-    "ap.thev0id.io",
-    "archexart.net",
-    "ark.misskey.online",
-    "artificial.place",
-    "atto.town",
-    "august26th.net",
-    "auroradrop.com",
-    "awawa.gay",
-    "az.calmo.blue",
-    "b.koa.im",
-    "b612.moe",
-    "bbs.fedibox.com",
-    "beta.misskey.social",
-    "bgempire.net",
-    "bilibili.org",
-    "binah.blue",
-    "birb.space",
-    "black.len-q-phantom.stream",
-    "blatant-lizardry.moe",
-    "bluewhite.pink",
-    "bodybag.zip",
-    "brigadeofthetwilight.tplinkdns.com",
-    "bskey.social",
-    "buicha.social",
-    "bungwangsi.xyz",
-    "burikione.net",
-    "buttersc.one",
-    "byeolvit.space",
-    "cafe.otter.homes",
-    "casper.ayu-mermaid.ts.net",
-    "catcore.life",
-    "catgirl.life",
-    "catgirls.technology",
-    "cathedral.tokyo",
-    "catlog.jp",
-    "chamacha.misskey.one",
-    "chamochi.club",
-    "channel.veru.moe",
-    "char.lissocial.com",
-    "chars.moe",
-    "chaskey.net",
-    "chatsubo.cbrpnk.dev",
-    "chiakey.io",
-    "chunchun.world",
-    "clanwood.com",
-    "cld1.ains-no-misskey.com",
-    "cld2.ains-no-misskey.com",
-    "cld2a.ains-no-misskey.com",
-    "cliq.social",
-    "clockcrock.click",
-    "cloudpirat.es",
-    "co.misskey.io",
-    "cocoa.kemomi.me",
-    "cocoronavi.com",
-    "com.in-nw.net",
-    "comfy.social",
-    "cosmisskey.cc",
-    "cozy-space.blue",
-    "crecom.moe",
-    "cremebrul.ee",
-    "crownel.monster",
-    "curren.win",
-    "cx.opantu.jp",
-    "cxfunacg.top",
-    "cyb3r.moe",
-    "d.kg-misskey.net",
-    "d0nuts.im",
-    "daepi.so",
-    "darapapa.misskey.one",
-    "darnell.moe",
-    "decent.moe",
-    "den.raccoon.quest",
-    "den6262.net",
-    "dendai.app",
-    "dev.kasei.ski",
-    "dev.misskey.omhnc.net",
-    "dev.nya.one",
-    "dev1.simkey.net",
-    "dicekey.jp",
-    "dis.piconet.co.uk",
-    "doomscroller.social",
-    "dosei.fun",
-    "dpr.kim",
-    "drdr.club",
-    "dubblecross.work",
-    "dw.n1l.dev",
-    "e4le.me",
-    "earthshaker.fygod.life",
-    "ebiverse.social",
-    "eei-misskey.com",
-    "eenyoe.net",
-    "elderscrolls.space",
-    "elpiskey.com",
-    "empire.miyaco.moe",
-    "eostagram.com",
-    "erica.hiyuki2578.net",
-    "estrella.misskey.masato.jp",
-    "exekey.net",
-    "existentialis.me",
-    "f.jymuoyu.com",
-    "fan.sufl.dev",
-    "fbk.moe",
-    "fe.ecarlate.app",
-    "fed.bajsicki.com",
-    "fed.nanao.moe",
-    "fedi.fyralabs.com",
-    "fedi.mezzart.fr",
-    "fedi.tyil.nl",
-    "fediland.nl",
-    "fedimagazine.info",
-    "fediverse.projectftm.com",
-    "feed.vance.land",
-    "fet.bar",
-    "fishstar.pe.kr",
-    "fle.st",
-    "fluffy.social",
-    "flushed.party",
-    "focalorus.io",
-    "foralltime.icu",
-    "forget-not.me",
-    "forwriter.homes",
-    "fotoclub.lono.space",
-    "freaksonly.space",
-    "freesia.space",
-    "frennet.xyz",
-    "friends-g1.reins-no-misskey.com",
-    "friends-g2.reins-no-misskey.com",
-    "froggie.town",
-    "fullof.buzz",
-    "furuyoni-misskey.online",
-    "fuzzle.me.uk",
-    "fuzzy.zone",
-    "fw3rd-bc.jp",
-    "fwedivewse.vfpmedia.com",
-    "gameguard.moe",
-    "gc-key.xn--vusz0j.life",
-    "gensoukyou.jp.net",
-    "geoplanetary.net",
-    "gespenst-jaeger.net",
-    "giglio.blue",
-    "go.coffee-break.cc",
-    "gomasaba.xyz",
-    "gp.miku2go.com",
-    "gp.tsukimi.club",
-    "gravityone.nylarea.com",
-    "gyatt.monster",
-    "gyutte.site",
-    "hashi.icu",
-    "hello-kiwi.com",
-    "hello.io0288.cn",
-    "hemokey.hemomo.com",
-    "herbscat.f5.si",
-    "hey.ditatompel.com",
-    "hi-na.org",
-    "hi.hashi.icu",
-    "highlightmilk.net",
-    "hirasakain.ninja",
-    "hiroikey-dev.stesan.dev",
-    "hiruuki.com",
-    "holomisskey.net",
-    "honi.club",
-    "honi.stesan.dev",
-    "hope-pf27.moe",
-    "hoto.moe",
-    "houshindai.net",
-    "hub.solarnight.net",
-    "hvac-tf.net",
-    "i.peacht.art",
-    "iam.charon.monster",
-    "icunny.co",
-    "ikaskey.bktsk.com",
-    "iksky.ikasoba.net",
-    "im.etheirys.ovh",
-    "imsim.dev",
-    "in.coffin.rip",
-    "indiegameskey.net",
-    "ingen.work",
-    "inokashiraskey.jp",
-    "invillage-outvillage.com",
-    "ippaitaberukimigasukey.com",
-    "iqhina.org",
-    "iris-no-misskey.wkspcloud.com",
-    "itsukey.net",
-    "jbgs.jp",
-    "jc.opprimo.jp",
-    "jiskey.dev",
-    "jumbler.jacab.net",
-    "k.yumeka.xyz",
-    "kafka.icu",
-    "kafuu.space",
-    "kagamisskey.com",
-    "kagura.ch",
-    "kajereto.com",
-    "kaoism.xyz",
-    "kasakoso.lol",
-    "kawaiivrc.site",
-    "kawane.misskey.online",
-    "kemoshiko.com",
-    "kets.me",
-    "key.aoki.app",
-    "key.cashless.gr.jp",
-    "key.dokodare.ovh",
-    "key.tpc3.org",
-    "key.zct-mrl.com",
-    "khronos-rain.xyz",
-    "kids.0px.io",
-    "kinoko.pw",
-    "kira.zone",
-    "kitsui.life",
-    "kitsune.moe",
-    "kmlg.jp",
-    "knightclub.0am.jp",
-    "koboksdon.net",
-    "kokagenotes.net",
-    "kokt.club",
-    "koliosky.com",
-    "komugisuki.com",
-    "kousaka.space",
-    "kr.akirin.xyz",
-    "ktnfm.com",
-    "kuinya.net",
-    "kuroyuki-server.misskey.one",
-    "kusso-yotta.com",
-    "labo.wovs.tk",
-    "lancetia.day",
-    "lapy.moe",
-    "lavacat.dns.army",
-    "lesbian.energy",
-    "live-theater.net",
-    "lokyoski.casacamelia.xyz",
-    "loli.church",
-    "lolison.top",
-    "lolita.technology",
-    "lotus-eater.cc",
-    "lounge.dtzbts.xyz",
-    "lovelive-misskey.t1nyb0x.cloud",
-    "m.7shiro.com",
-    "m.chariri.moe",
-    "m.chars.jp",
-    "m.d3bu.net",
-    "m.doany.io",
-    "m.estampie.work",
-    "m.filmfreedom.net",
-    "m.huling.org",
-    "m.isle.moe",
-    "m.k0r.in",
-    "m.mashiro.top",
-    "m.moec.top",
-    "m.n1l.dev",
-    "m.okaprog.com",
-    "m.ryugu.link",
-    "m.smdr.io",
-    "m.stcat.com",
-    "m.t327.net",
-    "m.telecom.moe",
-    "m.tsai.it",
-    "m.tty7.uk",
-    "m.ytpmv.info",
-    "m.zimiao.moe",
-    "m.zuiho.moe",
-    "m1.kzkr.xyz",
-    "m11.t8n.dev",
-    "m12.t8n.dev",
-    "m5y.usuyuki.net",
-    "mabi.ski",
-    "madost.one",
-    "magiasskey.magialabs.blog",
-    "maid.army",
-    "maid.lat",
-    "makai.chaotic.ninja",
-    "maniakey.com",
-    "maniakey.homes",
-    "marte.city",
-    "masost.one",
-    "matrix.rocks",
-    "mattyaski.co",
-    "mech-misskey.com",
-    "mede.family",
-    "memoriski.cc",
-    "meron.cloud",
-    "metaskey.net",
-    "metreee.com",
-    "mewl.me",
-    "mewmew.moe",
-    "mfmf.club",
-    "mi-balloon.okin-jp.net",
-    "mi.4587-aya-0p.work",
-    "mi.7mi.site",
-    "mi.8mitsu.net",
-    "mi.9lab.jp",
-    "mi.ablaze.one",
-    "mi.amari-noa.com",
-    "mi.antoru.me",
-    "mi.ap-log.net",
-    "mi.arkw.work",
-    "mi.ashchang.org",
-    "mi.bedohswe.eu.org",
-    "mi.bisco.moe",
-    "mi.c-at.jp",
-    "mi.caind.live",
-    "mi.cbrx.io",
-    "mi.chikage.net",
-    "mi.ekke.jp",
-    "mi.floccus.net",
-    "mi.fosfor.dev",
-    "mi.ghz00.net",
-    "mi.ginnannman.com",
-    "mi.growthers.dev",
-    "mi.halu.ink",
-    "mi.harumakizaemon.net",
-    "mi.hk-shuttle.net",
-    "mi.ichigo.dev",
-    "mi.ikepe.xyz",
-    "mi.irunu.co",
-    "mi.iruto.co",
-    "mi.jugesuke.net",
-    "mi.kabo.cab",
-    "mi.kimama-lab.net",
-    "mi.kitsunebi-ya.com",
-    "mi.kivotos.io",
-    "mi.kochudaho.me",
-    "mi.kuropen.org",
-    "mi.kyanos.one",
-    "mi.les-requin.net",
-    "mi.magamogreen.net",
-    "mi.maikaze.moe",
-    "mi.mashiro.site",
-    "mi.miyaco.moe",
-    "mi.moeyuki.works",
-    "mi.myhr.space",
-    "mi.nakn.jp",
-    "mi.nca10.moe",
-    "mi.neko3.dev",
-    "mi.nekonet.cyou",
-    "mi.nem.one",
-    "mi.nu1.dev",
-    "mi.nukumori-gay.space",
-    "mi.nxsux.xyz",
-    "mi.nyaa.app",
-    "mi.okin-jp.net",
-    "mi.orito-itsuki.net",
-    "mi.oya0831.net",
-    "mi.oyasumi.dev",
-    "mi.pal-mate.jp",
-    "mi.potofu.moe",
-    "mi.seanut.app",
-    "mi.see2et.dev",
-    "mi.shellgei.org",
-    "mi.shi-jk.com",
-    "mi.siotter.xyz",
-    "mi.soli0222.com",
-    "mi.starlamp.su",
-    "mi.sunset0916.net",
-    "mi.taichan.site",
-    "mi.takaion.net",
-    "mi.tebukuro.xyz",
-    "mi.tepbyte.dev",
-    "mi.ter05.net",
-    "mi.tkw.fm",
-    "mi.tsubasa.pro",
-    "mi.tsujigoya.net",
-    "mi.u-nlimited.page",
-    "mi.ul0829.net",
-    "mi.underscore.world",
-    "mi.usounds.work",
-    "mi.yude.moe",
-    "mi.yufushiro.dev",
-    "mi0.robotician.jp",
-    "mi0.uleh.net",
-    "mi11th.ysfh.jp",
-    "mi13.ijs01140.dev",
-    "mi2.icu",
-    "microblog.nalzus.com",
-    "mihari.splatnet3.com",
-    "mikancat-lab.com",
-    "miki.live4you.one",
-    "miku.social",
-    "milkiyatelier.quest",
-    "min.aqualitore-lily.com",
-    "minecraft.bktsk.com",
-    "mineskey.xyz",
-    "miniskey.com",
-    "minsterhorn.com",
-    "mis.hokkaidoskey.com",
-    "mis.suzakurin.work",
-    "misachan.net",
-    "misaka.social",
-    "misakey.net",
-    "misc.brainsoap.net",
-    "misk.mikanbako.blog",
-    "misk.pmhonpo.net",
-    "misky.rikunagiweb.jp",
-    "miss.jo3qma.com",
-    "miss.kabeuchi.monster",
-    "miss.mouse.services",
-    "miss.theeum.org",
-    "miss.va-11-hall-a.cafe",
-    "misskey-blackbote.net",
-    "misskey-dabansky.com",
-    "misskey-naosuki.net",
-    "misskey-r1.hopeinthefield.net",
-    "misskey-square.net",
-    "misskey-test-1.yunochi.com",
-    "misskey.04.si",
-    "misskey.0sakana.xyz",
-    "misskey.2000cho.me",
-    "misskey.3dcg.love",
-    "misskey.4nm1tsu.com",
-    "misskey.5unl1fe3.com",
-    "misskey.7ka.org",
-    "misskey.9tail.net",
-    "misskey.accordi.online",
-    "misskey.adlyrs.io",
-    "misskey.adolfritos.es",
-    "misskey.adzukimame.com",
-    "misskey.akyoz.net",
-    "misskey.always-we-need.games",
-    "misskey.amfedisr.net",
-    "misskey.ancientumamisuki.link",
-    "misskey.anemoneya.me",
-    "misskey.anizumin.com",
-    "misskey.anjara.eu",
-    "misskey.araisan.club",
-    "misskey.argentum-lacrima.live-on.net",
-    "misskey.ariela.jp",
-    "misskey.art",
-    "misskey.arumino-om.net",
-    "misskey.ashigayahomura.com",
-    "misskey.assaultli.ly",
-    "misskey.auroraplanet.blue",
-    "misskey.ayutsuki.net",
-    "misskey.azumabashi.dev",
-    "misskey.backspace.fm",
-    "misskey.bainroom.info",
-    "misskey.betaful.life",
-    "misskey.betopia.net",
-    "misskey.bktsk.com",
-    "misskey.bocc.de",
-    "misskey.bootjp.me",
-    "misskey.bori.icu",
-    "misskey.bosio.info",
-    "misskey.br-project.jp",
-    "misskey.bubbletea.dev",
-    "misskey.bugarin.com.br",
-    "misskey.byter.io",
-    "misskey.caligula-sea.net",
-    "misskey.cascade.moe",
-    "misskey.chatagiriii.com",
-    "misskey.chiffon-lab.tech",
-    "misskey.chiffon-sepxipl.com",
-    "misskey.chilitreat.dev",
-    "misskey.chn.moe",
-    "misskey.ciffelia.com",
-    "misskey.cloud",
-    "misskey.crashrt.work",
-    "misskey.cyakigasi.net",
-    "misskey.damnx.net",
-    "misskey.day",
-    "misskey.db0.jp",
-    "misskey.de",
-    "misskey.delmulin.com",
-    "misskey.design",
-    "misskey.dev",
-    "misskey.distraction.engineer",
-    "misskey.dobu.page",
-    "misskey.dog",
-    "misskey.donokoanoko.jp",
-    "misskey.doujin.games",
-    "misskey.dummy.red",
-    "misskey.dyselon.com",
-    "misskey.edel-ornstein.pro",
-    "misskey.ee",
-    "misskey.ekurea.net",
-    "misskey.elmakyu.net",
-    "misskey.emymin.net",
-    "misskey.en0taka.com",
-    "misskey.eolh.jp",
-    "misskey.erenoa.com",
-    "misskey.eulious.com",
-    "misskey.faidra.net",
-    "misskey.fal.moe",
-    "misskey.fancy.org.uk",
-    "misskey.flat.place",
-    "misskey.flowertea.uk",
-    "misskey.frainsan.net",
-    "misskey.frick96.com",
-    "misskey.fryer.net.au",
-    "misskey.furry-r-moonrabbitbower.com",
-    "misskey.fusenstage.com",
-    "misskey.fxmech.com",
-    "misskey.gamelore.fun",
-    "misskey.ganyariya.net",
-    "misskey.gekka.sexy",
-    "misskey.gfserver.jp",
-    "misskey.gg",
-    "misskey.giatsuki.net",
-    "misskey.gochiuma.net",
-    "misskey.gothloli.club",
-    "misskey.gourry.zip",
-    "misskey.grawlily.com",
-    "misskey.greent.jp",
-    "misskey.hacusk.net",
-    "misskey.hakoniwa-project.com",
-    "misskey.haku-kazamaru.club",
-    "misskey.halby24.com",
-    "misskey.halcat.org",
-    "misskey.haru3.me",
-    "misskey.haun.jp",
-    "misskey.hawk-tomy.dev",
-    "misskey.heonian.org",
-    "misskey.hikalium.dev",
-    "misskey.himriu.com",
-    "misskey.hoshihara.co.jp",
-    "misskey.id",
-    "misskey.ie.u-ryukyu.ac.jp",
-    "misskey.ihoronir.com",
-    "misskey.ikalga.net",
-    "misskey.im-neko.net",
-    "misskey.imosskey.dev",
-    "misskey.injabie3.moe",
-    "misskey.inux39.me",
-    "misskey.invr.chat",
-    "misskey.io",
-    "misskey.iorar.net",
-    "misskey.joji-ani.me",
-    "misskey.kakunpc.com",
-    "misskey.kanarikanaru.com",
-    "misskey.kartolitan.com",
-    "misskey.kasu.me",
-    "misskey.kcs1959.jp",
-    "misskey.kinelab.cc",
-    "misskey.kirameki.cafe",
-    "misskey.kiryuanzu.dev",
-    "misskey.klamath.jp",
-    "misskey.kokshi.com",
-    "misskey.komekome09.jp",
-    "misskey.kurenai.life",
-    "misskey.kusoneko.moe",
-    "misskey.kyoupro.com",
-    "misskey.kzkr.xyz",
-    "misskey.lalafell.org",
-    "misskey.lapy.kr",
-    "misskey.lazywildcat.net",
-    "misskey.lehhair.net",
-    "misskey.liberuntime.com",
-    "misskey.life",
-    "misskey.lina.inverse.moe",
-    "misskey.lovelive.net",
-    "misskey.luke256.dev",
-    "misskey.mabope.com",
-    "misskey.maco.pics",
-    "misskey.magokorobin.com",
-    "misskey.maintedor.com",
-    "misskey.mamisrv.ne.jp",
-    "misskey.meiryo7743.net",
-    "misskey.menhera.org",
-    "misskey.mfmfuyu.net",
-    "misskey.midorichan.net",
-    "misskey.mikuta0407.net",
-    "misskey.mintcream.blue",
-    "misskey.mirenk.net",
-    "misskey.miro-sv.net",
-    "misskey.mkihr-ojisan.com",
-    "misskey.mochi33.com",
-    "misskey.moe",
-    "misskey.moe.ceo",
-    "misskey.mofumofu.me",
-    "misskey.molina.jp",
-    "misskey.mswitchy.ink",
-    "misskey.mt224244.com",
-    "misskey.mugiko.moe",
-    "misskey.myuu.dev",
-    "misskey.na2na.dev",
-    "misskey.natsu.works",
-    "misskey.neka.site",
-    "misskey.neos.love",
-    "misskey.neptunearchivist.net",
-    "misskey.nicovrc.net",
-    "misskey.niri.la",
-    "misskey.nnct18j.com",
-    "misskey.noeling.com",
-    "misskey.noellabo.jp",
-    "misskey.nokotaro.com",
-    "misskey.notr.app",
-    "misskey.nrps.xyz",
-    "misskey.nukora.jp",
-    "misskey.nukumori-sky.net",
-    "misskey.numbertales-radiann.net",
-    "misskey.objektiv2.net",
-    "misskey.okayurisotto.net",
-    "misskey.okitsu.net",
-    "misskey.omhnc.net",
-    "misskey.orapp.net",
-    "misskey.osu.si",
-    "misskey.osyakasyama.me",
-    "misskey.otofu.xyz",
-    "misskey.otsumami.bar",
-    "misskey.parpok.lomza.pl",
-    "misskey.parsleague.jp",
-    "misskey.pepabo.com",
-    "misskey.petit-rabbit.work",
-    "misskey.pkkis.com",
-    "misskey.pokete.dev",
-    "misskey.polyhymnia.page",
-    "misskey.potp.ro",
-    "misskey.qwjyh.net",
-    "misskey.rabbit-paradise.com",
-    "misskey.ranranhome.info",
-    "misskey.resonite.love",
-    "misskey.ritec.jp",
-    "misskey.romira.dev",
-    "misskey.roolone.me",
-    "misskey.room4.dev",
-    "misskey.rup.one",
-    "misskey.ruste.red",
-    "misskey.ryopon404.net",
-    "misskey.sagt.xyz",
-    "misskey.sakaki333.com",
-    "misskey.sakanana.me",
-    "misskey.sasakulab.com",
-    "misskey.scorpios.uk",
-    "misskey.sdfjp.org",
-    "misskey.seacolorswind.com",
-    "misskey.secinet.jp",
-    "misskey.seediqbale.xyz",
-    "misskey.seitendan.com",
-    "misskey.shima-pan.com",
-    "misskey.shimanami.online",
-    "misskey.shinaaamo.com",
-    "misskey.shunrin.com",
-    "misskey.sigma-project.jp",
-    "misskey.silkroad.net",
-    "misskey.sindastra.net",
-    "misskey.sk85.org",
-    "misskey.sksat.run",
-    "misskey.snowdrop.cloud",
-    "misskey.soa3.net",
-    "misskey.social",
-    "misskey.soda-net.com",
-    "misskey.srgr0.com",
-    "misskey.ss.gv.vc",
-    "misskey.ssskkk.top",
-    "misskey.stream",
-    "misskey.sui-ryu.net",
-    "misskey.suikoden.info",
-    "misskey.suzuri.jp",
-    "misskey.sweshelo.jp",
-    "misskey.syahu.com",
-    "misskey.syakesaba.com",
-    "misskey.systems",
-    "misskey.t1nyb0x.cloud",
-    "misskey.tailc0bbe.ts.net",
-    "misskey.takanotume24.com",
-    "misskey.takehi.to",
-    "misskey.takeko.cyou",
-    "misskey.takingalook.dev",
-    "misskey.tea-soak.org",
-    "misskey.temama.soy",
-    "misskey.the-menz.com",
-    "misskey.tobitti.net",
-    "misskey.todanano-fune.moe",
-    "misskey.tpt.works",
-    "misskey.traction.jp",
-    "misskey.tsub.me",
-    "misskey.tsukiyo.dev",
-    "misskey.tsuyabashi.dev",
-    "misskey.tunamaguro.dev",
-    "misskey.tunetalk.jp",
-    "misskey.turretlabs.io",
-    "misskey.typeling1578.dev",
-    "misskey.uk",
-    "misskey.umicat.de",
-    "misskey.until.tsukuba.one",
-    "misskey.uranus-net.com",
-    "misskey.usbharu.dev",
-    "misskey.vermilion3.xyz",
-    "misskey.virtualrocketwatching.net",
-    "misskey.vocalodon.net",
-    "misskey.void.gift",
-    "misskey.vpx.moe",
-    "misskey.walnuts.dev",
-    "misskey.waya0125.com",
-    "misskey.xania.fr",
-    "misskey.xianon.net",
-    "misskey.xinglili.love",
-    "misskey.yakijake.net",
-    "misskey.yakishamo.com",
-    "misskey.yancya.club",
-    "misskey.ycrack.net",
-    "misskey.yoxoy.server-on.net",
-    "misskey.ytom.myds.me",
-    "misskey.yude.jp",
-    "misskey.yuetsubu.com",
-    "misskey.yufarch.com",
-    "misskey.yukineko.me",
-    "misskey.yukoduka.com",
-    "misskey.yunpon.club",
-    "misskey.zerozaski.tech",
-    "misskey.zyoshoka.com",
-    "misskey00.moirai.dev",
-    "misskey23.uec-tech.net",
-    "misskeybeta.takehi.to",
-    "misskeymint.net",
-    "misskeytsf.love",
-    "misskirara.net",
-    "misspi.net",
-    "missty.world",
-    "mitir.social",
-    "miwkey.miwpayou0808.info",
-    "mk.alicey.dev",
-    "mk.aqr.af",
-    "mk.arks.cafe",
-    "mk.asie.pl",
-    "mk.chiwa.net",
-    "mk.commojun.com",
-    "mk.cybre.ninja",
-    "mk.depra.net",
-    "mk.dev-c.at",
-    "mk.double-oxygen.net",
-    "mk.f72u.net",
-    "mk.fediland.in.ua",
-    "mk.gabe.rocks",
-    "mk.godspeed.moe",
-    "mk.grailwar.com",
-    "mk.headpats.org",
-    "mk.himbeer.me",
-    "mk.hoshisaki-h.com",
-    "mk.howamun.day",
-    "mk.huimao.xyz",
-    "mk.humblemagica.org",
-    "mk.igwigg.space",
-    "mk.kakun.jp",
-    "mk.loupe.page",
-    "mk.marroq.xyz",
-    "mk.mgmn.jp",
-    "mk.na.in.th",
-    "mk.nekokaze.cc",
-    "mk.nitadori.net",
-    "mk.noyaskey.net",
-    "mk.nworm.icu",
-    "mk.outv.im",
-    "mk.pon-jp.com",
-    "mk.precure.fun",
-    "mk.rurinya.com",
-    "mk.sakanaa.moe",
-    "mk.samicrusader.me",
-    "mk.shiro.ink",
-    "mk.shrimpia.network",
-    "mk.skima.jp",
-    "mk.spook.social",
-    "mk.starnix.network",
-    "mk.szkod.ovh",
-    "mk.taiy.me",
-    "mk.tenpest-moon.uk",
-    "mk.u0conveni.club",
-    "mk.udongein.reisen",
-    "mk.umearbo.net",
-    "mk.vijf.life",
-    "mk.xiupos.net",
-    "mk.xn--ponek-1sa8t.eu",
-    "mk.yopo.work",
-    "mk.yurax2.dev",
-    "mk.zn.rs",
-    "mk.zvz.be",
-    "mk2.toyoko.in",
-    "mkacg.social",
-    "mkdev.a9z.dev",
-    "mkey.enzan.org",
-    "mkiii.amplifie.red",
-    "mko.fedcast.ch",
-    "mkultra.x27.one",
-    "moar.cachapa.xyz",
-    "moeanime.io",
-    "mof.kemomi.me",
-    "mof.rorea.moe",
-    "mogeko.monster",
-    "mogmogkeynet.com",
-    "mogumogu-croquette.com",
-    "monologue.kazatsuyu.com",
-    "moonsky.decl.jp",
-    "morale.ch",
-    "morijio.space",
-    "moriyashrine.net",
-    "msk.canor.kr",
-    "msk.i-red.info",
-    "msk.ilnk.info",
-    "msk.kitazawa.me",
-    "msk.mv2k.com",
-    "msk.seppuku.club",
-    "msky.41kg.com",
-    "msky.alicia.ne.jp",
-    "msky.co8rt.blue",
-    "msky.crawling-with-love.com",
-    "msky.engawa.social",
-    "msky.halfdos.net",
-    "msky.haruyjsn.net",
-    "msky.kentaro1043.com",
-    "msky.launchpencil.f5.si",
-    "msky.lord-mayo.uk",
-    "msky.mfz.jp",
-    "msky.mkakh.com",
-    "msky.negset.com",
-    "msky.nekokawa.net",
-    "msky.nenohi.net",
-    "msky.ntr.homes",
-    "msky.ospn.jp",
-    "msky.penini.xyz",
-    "msky.summersweet.jp",
-    "msky.tmpra.jp",
-    "msky.toma09to.com",
-    "msky.work",
-    "msky.z-n-a-k.net",
-    "mssj.work",
-    "mu.nagisite.xyz",
-    "muimi.moe",
-    "munesky.net",
-    "munochi.moe",
-    "munskey.net",
-    "mxin.fun",
-    "my-sky.blue",
-    "myamisskey.ddo.jp",
-    "mycircle.events",
-    "mylittle.boutique",
-    "mystics-den.club",
-    "n-kaiwai.work",
-    "n7.social",
-    "nagisa.town",
-    "nazokey.com",
-    "negi.fjordur.net",
-    "nekomiya.net",
-    "nekoplanet.xyz",
-    "nekusuchan.net",
-    "nemu.suiminn.moe",
-    "nemudaru.uk",
-    "nep.one",
-    "nerv.agency",
-    "netko.kr",
-    "never.bid",
-    "newskey.cc",
-    "newskey.ja-jp.org",
-    "next.sizedon.com",
-    "next.yncrypt.net",
-    "nicomedkey.cc",
-    "nightcord.live",
-    "nightly.hvac-tf.net",
-    "nightly.pastwind.top",
-    "nijimiss.moe",
-    "niscii.xyz",
-    "nishimin.net",
-    "nmnm.na2na.dev",
-    "nobl.ink",
-    "nonos-kitchen.net",
-    "novoa.nagoya",
-    "nozoo.jp",
-    "nr.akarinext.org",
-    "nsfwmisskey.narazaka.net",
-    "ntt.ee",
-    "nusskey.com",
-    "nya.one",
-    "nya.social",
-    "nyaw.xyz",
-    "nyon.marimo-net.com",
-    "oasys.earth",
-    "oekakiskey.com",
-    "oflosky.com",
-    "ohashi.nohost.me",
-    "ohtrmi.cbrx.io",
-    "ohuton.ippainetai.com",
-    "ojousama-tea.party",
-    "omata.club",
-    "omochifestival.com",
-    "onsen-musume.fun",
-    "oran.ski",
-    "orcacruises.pro",
-    "ortensia-moe-moe.club",
-    "osage.moe",
-    "otasky.ja-jp.org",
-    "owasikohu.com",
-    "owo.community",
-    "owovo.cc",
-    "oyasumi.ski",
-    "p1.a9z.dev",
-    "p1.ains-no-misskey.com",
-    "p2.ains-no-misskey.com",
-    "papi.n1l.dev",
-    "pari.cafe",
-    "paseo.casacamelia.xyz",
-    "pasokey.net",
-    "pastwind.top",
-    "ph1.ains-no-misskey.com",
-    "ph2.ains-no-misskey.com",
-    "phz.jp",
-    "pickey.net",
-    "pillbug.audio.amanogawa.work",
-    "ping.the-planet.space",
-    "pink-hair.studio",
-    "pinky.st",
-    "pisskey.io",
-    "platanus.top",
-    "pmk.noflm.cc",
-    "poi.cl",
-    "pon.icu",
-    "pool2.matcha1919.com",
-    "port.mk",
-    "post.yourein.net",
-    "potato.ski",
-    "ppplot.top",
-    "pqchub.com",
-    "premis.one",
-    "prismisskey.space",
-    "prodline.social",
-    "pub.lunakit.org",
-    "pub.odekake.love",
-    "purple.ist",
-    "pwp.space",
-    "quietplace.xyz",
-    "radio.mutebot.net",
-    "rafale.misskey.online",
-    "rainyme.ca",
-    "rasp.n1l.dev",
-    "reaired.com",
-    "realworldsunny.name",
-    "reax.work",
-    "redfuku.com",
-    "relict.one",
-    "reptileskey.jp",
-    "rhythmisskey.games",
-    "rimonce.one",
-    "rinpuhome.monster",
-    "rkgk.moe",
-    "rn.mozumi0w0.com",
-    "rsp1-iris-no-misskey.wkspcloud.com",
-    "rsp2-iris-no-misskey.wkspcloud.com",
-    "ru3a.com",
-    "russiachan.fun",
-    "rustearain.space",
-    "s.basspistol.org",
-    "s.ktsn.dev",
-    "s.lacko.network",
-    "sager.wang",
-    "sakana-no-bone.net",
-    "sanotsuki.me",
-    "sas.monster",
-    "satellite.nekoplanet.xyz",
-    "sayaka-mikey.com",
-    "sciencp.work",
-    "sd-69.space",
-    "sdbx.reins-no-misskey.com",
-    "seediqbale.xyz",
-    "seikora.one",
-    "sekai.social",
-    "serafuku.moe",
-    "setariam.net",
-    "shahu.ski",
-    "shibuya.top",
-    "shinamikaidou42.com",
-    "shitpost.poridge.club",
-    "showcase.meows.lol",
-    "side.misskey.productions",
-    "simkey.net",
-    "sk.204.jp",
-    "skaya.ligun.net",
-    "skey.sh1pc.dev",
-    "ski.takoyaki.xyz",
-    "skippers-bin.com",
-    "sky.drago.moe",
-    "slippy.xyz",
-    "sloppy-life.net",
-    "sn.nekojita.moe",
-    "snow-white.xyz",
-    "sns.copi.pe",
-    "sns.iwata.love",
-    "sns.lemondouble.com",
-    "sns.mochimochi-planet.com",
-    "sns.mouii.net",
-    "sns.onjann.club",
-    "sns.ourt-ai.work",
-    "soc.lecturify.net",
-    "soc0.outrnat.nl",
-    "social.a2x.pub",
-    "social.arunmozhi.in",
-    "social.bcicorporate.com",
-    "social.benki.net",
-    "social.boiledscript.com",
-    "social.calut.fr",
-    "social.camph.net",
-    "social.coolmathgames.tech",
-    "social.dumanovschi.com",
-    "social.edu.ci",
-    "social.electricladylan.net",
-    "social.hkpr.me",
-    "social.interordi.com",
-    "social.jumpsca.red",
-    "social.kwatra.me",
-    "social.kyaru.xyz",
-    "social.livepods.eu",
-    "social.matsukky.com",
-    "social.metamuffin.org",
-    "social.metrix.network",
-    "social.mikala.one",
-    "social.niceview.club",
-    "social.noordstar.me",
-    "social.ogiso.me",
-    "social.onlinesession.app",
-    "social.pseudo-whiskey.bar",
-    "social.snfsx.xyz",
-    "social.squiddev.cc",
-    "social.swagg.net",
-    "social.tuki.dev",
-    "social.uhy.ooo",
-    "social.zuendmasse.de",
-    "soratomo.info",
-    "soshar.dess.ga",
-    "soukun.io",
-    "sp8key.monster",
-    "space.lilygl.net",
-    "spygadget.club",
-    "startours.live",
-    "status.akionux.net",
-    "stellanaut.net",
-    "ster.email",
-    "stg.miria.shiosyakeyakini.info",
-    "stkr.dev",
-    "stormskey.works",
-    "submarin.online",
-    "succubi.services",
-    "sui-mag.com",
-    "sumisky.xyz",
-    "summary.ink",
-    "sun.freespace.moe",
-    "sunisky.club",
-    "superneko.net",
-    "sushi.ski",
-    "susiedev.wakuwakuanimals.com",
-    "suyasuya.love",
-    "swurl.land",
-    "syuilo.moe",
-    "syukuma.net",
-    "t.ancientmaple.com",
-    "t1.ztrehagem.dev",
-    "takanoriskey.toppu.jp",
-    "takuji.org",
-    "tanoshii.site",
-    "team.matechan.com",
-    "tears.intherain.club",
-    "tekigousya.net",
-    "tenpoku.com",
-    "tftt.net",
-    "the-box.work",
-    "the9thcircle.club",
-    "thecle.land",
-    "thxdaddy.xyz",
-    "todo.shiokazehs.jp",
-    "tokoyo.social",
-    "tokyoto.cyou",
-    "trackball.love",
-    "trpg.social",
-    "trpger.us",
-    "tru.neets.work",
-    "tsunami-art.com",
-    "tukika.com",
-    "tuta.besserwisser.org",
-    "twely.etn.icu",
-    "twt.rs",
-    "tyazzkey.work",
-    "u-stella.net",
-    "u.misskey.studio",
-    "uchinoko.club",
-    "udon.icu",
-    "uhouho.life",
-    "uma-aji.com",
-    "umaskey.net",
-    "unicuskey.com",
-    "usasa.ky",
-    "usasaki.net",
-    "v11-k.yumeka.xyz",
-    "v3.tamx.tk",
-    "vartist.fans",
-    "vcasskey.net",
-    "virtualkemomimi.net",
-    "vol.red",
-    "voskey.icalo.net",
-    "vote-mk.solveorpay.kr",
-    "vtuber.games",
-    "wakuwaku.boo",
-    "ward2.bouvardia.icu",
-    "warpday.net",
-    "warubure.online",
-    "wb.zcjwechat.tk",
-    "weebvr.social",
-    "weirds.org",
-    "whitelily.blue",
-    "www.highwizard.biz",
-    "www.kagura.ch",
-    "wxw.cat",
-    "x.coralbay.top",
-    "xn--qbtm095lrg0bfka60z.chn.moe",
-    "xn--s8w913fdga.chn.moe",
-    "yagamin.com",
-    "yagimofu.moe",
-    "yam.menac.at",
-    "ymsky.clovr.cc",
-    "yodangang.express",
-    "yojohan.cc",
-    "yukia.me",
-    "yumk.xyz",
-    "yuri.garden",
-    "yuukoma.online",
-    "zadankai.club",
-    "zmi.im",
-}
-
-__all__ = ['instances']
@@ -4,11 +4,7 @@
 import json
 import re
 
-try:
-    from .instances import instances
-except ImportError:
-    instances = ()
-
+from .._instances import InstanceList
 from ..common import SelfHostedInfoExtractor
 from ...utils import (
     ExtractorError,
@@ -24,9 +20,6 @@
 from ...compat import compat_str
 
 
-known_valid_instances = set()
-
-
 class MisskeyBaseIE(SelfHostedInfoExtractor):
     _SH_VALID_CONTENT_STRINGS = (
         '<meta name="application-name" content="Misskey"',
@@ -35,8 +28,7 @@ class MisskeyBaseIE(SelfHostedInfoExtractor):
     )
 
     _HOSTNAME_GROUPS = ('instance', )
-    _INSTANCE_LIST = instances
-    _DYNAMIC_INSTANCE_LIST = known_valid_instances
+    _INSTANCE_LIST = InstanceList('misskey')
     _NODEINFO_SOFTWARE = ('misskey', )
     _SOFTWARE_NAME = 'Misskey'
 
@@ -7,11 +7,7 @@
 from urllib.parse import urlencode
 
 
-try:
-    from .instances import instances
-except ImportError:
-    instances = ()
-
+from .._instances import InstanceList
 from ..common import SelfHostedInfoExtractor
 from ...compat import functools
 from ...utils import (
@@ -29,9 +25,6 @@
 )
 
 
-known_valid_instances = set()
-
-
 class PeerTubeBaseIE(SelfHostedInfoExtractor):
     _UUID_RE = r'[\da-zA-Z]{22}|[\da-fA-F]{8}-[\da-fA-F]{4}-[\da-fA-F]{4}-[\da-fA-F]{4}-[\da-fA-F]{12}'
     _SH_VALID_CONTENT_STRINGS = (
@@ -47,8 +40,7 @@ class PeerTubeBaseIE(SelfHostedInfoExtractor):
     _PAGE_SIZE = 25
 
     _HOSTNAME_GROUPS = ('host', 'host_2')
-    _INSTANCE_LIST = instances
-    _DYNAMIC_INSTANCE_LIST = known_valid_instances
+    _INSTANCE_LIST = InstanceList('peertube')
     _NODEINFO_SOFTWARE = ('peertube', )
     _SOFTWARE_NAME = 'PeerTube'
 
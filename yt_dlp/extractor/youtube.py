@@ -1171,6 +1171,10 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
         r'/(?P<id>[a-zA-Z0-9_-]{8,})/player(?:_ias\.vflset(?:/[a-zA-Z]{2,3}_[a-zA-Z]{2,3})?|-plasma-ias-(?:phone|tablet)-[a-z]{2}_[A-Z]{2}\.vflset)/base\.js$',
         r'\b(?P<id>vfl[a-zA-Z0-9_-]+)\b.*?\.js$',
     )
+    # Number of decrypted n values that are kept per player
+    _NSIG_CACHE_SIZE = 1000
+    # Number of players that are kept in the cache; a new one is released every few days
+    _PLAYER_CACHE_SIZE = 10
     _formats = {
         '5': {'ext': 'flv', 'width': 400, 'height': 240, 'acodec': 'mp3', 'abr': 64, 'vcodec': 'h263'},
         '6': {'ext': 'flv', 'width': 450, 'height': 270, 'acodec': 'mp3', 'abr': 64, 'vcodec': 'h263'},
@@ -2798,6 +2802,7 @@ def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._code_cache = {}
         self._player_cache = {}
+        self._nsig_cache = {}
 
     def _prepare_live_from_start_formats(self, formats, video_id, live_start_time, url, webpage_url, smuggled_data, is_live):
         lock = threading.Lock()
@@ -2993,10 +2998,16 @@ def _extract_player_info(cls, player_url, fatal=True):
     def _load_player(self, video_id, player_url, fatal=True):
         player_id = self._extract_player_info(player_url)
         if player_id not in self._code_cache:
-            code = self._download_webpage(
-                player_url, video_id, fatal=fatal,
-                note='Downloading player ' + player_id,
-                errnote='Download of %s failed' % player_url)
+            # The player of an id never changes, so it only has to make way for newer players
+            code = self.cache.load('youtube-player', player_id)
+            if not code:
+                code = self._download_webpage(
+                    player_url, video_id, fatal=fatal,
+                    note='Downloading player ' + player_id,
+                    errnote='Download of %s failed' % player_url)
+                if code:
+                    self.cache.store('youtube-player', player_id, code)
+                    self.cache.prune('youtube-player', self._PLAYER_CACHE_SIZE)
             if code:
                 self._code_cache[player_id] = code
         return self._code_cache.get(player_id)
@@ -3110,37 +3121,78 @@ def _decrypt_signature(self, s, video_id, player_url):
 
     def _decrypt_nsig(self, s, video_id, player_url):
         """Turn the encrypted n field into a working signature"""
+        ret = self._decrypt_nsig_batch([s], video_id, player_url)[s]
+        if isinstance(ret, ExtractorError):
+            raise ret
+        return ret
+
+    def _decrypt_nsig_batch(self, n_values, video_id, player_url):
+        """
+        Decrypt several n values with the same instance of the nsig function
+        @returns {n: decrypted n, or the ExtractorError if that value could not be decrypted}
+        """
         if player_url is None:
             raise ExtractorError('Cannot decrypt nsig without player_url')
         player_url = urljoin('https://www.youtube.com', player_url)
 
+        results, nsig_cache = {}, self._load_nsig_cache(player_url)
+        for s in dict.fromkeys(n_values):
+            if s in nsig_cache:
+                nsig_cache.move_to_end(s)
+                results[s] = nsig_cache[s]
+                self.write_debug(f'Decrypted nsig {s} => {results[s]} (cached)')
+        pending = [s for s in dict.fromkeys(n_values) if s not in results]
+        if not pending:
+            return results
+
         try:
-            jsi, player_id, func_code = self._extract_n_function_code(video_id, player_url)
+            jsi, player_id, func_code, parsed_code = self._extract_n_function_code(video_id, player_url)
         except ExtractorError as e:
             raise ExtractorError('Unable to extract nsig function code', cause=e)
         if self.get_param('youtube_print_sig_code'):
             self.to_screen(f'Extracted nsig function from {player_id}:\n{func_code[1]}\n')
 
+        for s in pending:
+            try:
+                results[s] = self._decrypt_nsig_value(s, jsi, parsed_code, video_id, player_url)
+            except ExtractorError as e:
+                results[s] = e
+                continue
+            self.write_debug(f'Decrypted nsig {s} => {results[s]}')
+            nsig_cache[s] = results[s]
+
+        if any(s in nsig_cache for s in pending):
+            while len(nsig_cache) > self._NSIG_CACHE_SIZE:
+                nsig_cache.popitem(last=False)
+            self.cache.store('youtube-nsig-values', player_id, list(nsig_cache.items()))
+        return results
+
+    def _decrypt_nsig_value(self, s, jsi, func_code, video_id, player_url):
         try:
             extract_nsig = self._cached(self._extract_n_function_from_code, 'nsig func', player_url)
-            ret = extract_nsig(jsi, func_code)(s)
+            return extract_nsig(jsi, func_code)(s)
         except JSInterpreter.Exception as e:
             self.report_warning(
                 f'Native nsig extraction failed: Trying with online solver\n'
                 f'         n = {s} ; player = {player_url}', video_id)
             self.write_debug(e, only_once=True)
 
-            response_data = self._download_json(
-                'https://bookish-octo-barnacle-nao20010128nao.vercel.app/youtube/nparams/decrypt', video_id,
-                query={'player': player_url, 'n': s},
-                note='Delegating n-param decryption and waiting for result')
-            if response_data['status'] != 'ok':
-                message = traverse_obj(response_data, ('data', 'message'))
-                raise ExtractorError(f'Failed at step "{response_data["step"]}" (message {message})')
-            ret = response_data['data']
-
-        self.write_debug(f'Decrypted nsig {s} => {ret}')
-        return ret
+        response_data = self._download_json(
+            'https://bookish-octo-barnacle-nao20010128nao.vercel.app/youtube/nparams/decrypt', video_id,
+            query={'player': player_url, 'n': s},
+            note='Delegating n-param decryption and waiting for result')
+        if response_data['status'] != 'ok':
+            message = traverse_obj(response_data, ('data', 'message'))
+            raise ExtractorError(f'Failed at step "{response_data["step"]}" (message {message})')
+        return response_data['data']
+
+    def _load_nsig_cache(self, player_url):
+        """The decrypted n values of the player, least recently used first"""
+        player_id = self._extract_player_info(player_url)
+        if player_id not in self._nsig_cache:
+            self._nsig_cache[player_id] = collections.OrderedDict(
+                self.cache.load('youtube-nsig-values', player_id, default=None) or [])
+        return self._nsig_cache[player_id]
 
     def _extract_n_function_name(self, jscode):
         funcname, idx = self._search_regex(
@@ -3156,12 +3208,22 @@ def _extract_n_function_name(self, jscode):
     def _extract_n_function_code(self, video_id, player_url):
         player_id = self._extract_player_info(player_url)
         func_code = self.cache.load('youtube-nsig', player_id, min_ver='2022.09.1')
+        # The parsed code is kept apart, since older versions only accept [argnames, code] in 'youtube-nsig'
+        parsed_code = func_code and self.cache.load('youtube-nsig-parsed', player_id)
+
         jscode = func_code or self._load_player(video_id, player_url)
         jsi = JSInterpreter(jscode)
 
-        if func_code:
-            return jsi, player_id, func_code
+        if not func_code:
+            func_code = self._extract_n_function_code_from_player(jsi, jscode)
+            self.cache.store('youtube-nsig', player_id, func_code)
+        if not parsed_code:
+            # The function expressions are moved out beforehand, so that the cached code is ready to run
+            parsed_code = jsi.parse_function_code(*func_code)
+            self.cache.store('youtube-nsig-parsed', player_id, parsed_code)
+        return jsi, player_id, func_code, parsed_code
 
+    def _extract_n_function_code_from_player(self, jsi, jscode):
         func_name = self._extract_n_function_name(jscode)
 
         # For redundancy
@@ -3171,16 +3233,12 @@ def _extract_n_function_code(self, video_id, player_url):
                      {(?P<code>.+?}\s*return\ [\w$]+.join\(""\))};''' % func_name,
             jscode, 'nsig function', group=('var', 'code'), default=None)
         if func_code:
-            func_code = ([func_code[0]], func_code[1])
-        else:
-            self.write_debug('Extracting nsig function with jsinterp')
-            func_code = jsi.extract_function_code(func_name)
-
-        self.cache.store('youtube-nsig', player_id, func_code)
-        return jsi, player_id, func_code
+            return [func_code[0]], func_code[1]
+        self.write_debug('Extracting nsig function with jsinterp')
+        return jsi.extract_function_code(func_name)
 
-    def _extract_n_function_from_code(self, jsi, func_code):
-        func = jsi.extract_function_from_code(*func_code)
+    def _extract_n_function_from_code(self, jsi, parsed_code):
+        func = jsi.build_parsed_function(parsed_code)
 
         def extract_nsig(s):
             try:
@@ -3782,6 +3840,23 @@ def _extract_formats_and_subtitles(self, streaming_data, video_id, player_url, l
         streaming_formats = traverse_obj(streaming_data, (..., ('formats', 'adaptiveFormats'), ...))
         all_formats = self._configuration_arg('include_duplicate_formats')
 
+        nsig_results = {}
+
+        def decrypt_nsig(n):
+            # All the n values of the video are decrypted at once, when the first one is needed
+            if n not in nsig_results:
+                n_values = [n, *traverse_obj(streaming_formats, (
+                    ..., {lambda f: f.get('url') or traverse_obj(
+                        urllib.parse.parse_qs(f.get('signatureCipher')), ('url', 0))},
+                    {parse_qs}, 'n', 0, {str}))]
+                try:
+                    nsig_results.update(self._decrypt_nsig_batch(n_values, video_id, player_url))
+                except ExtractorError as e:
+                    nsig_results.update(dict.fromkeys(n_values, e))
+            if isinstance(nsig_results[n], ExtractorError):
+                raise nsig_results[n]
+            return nsig_results[n]
+
         def build_fragments(f):
             return LazyList({
                 'url': update_url_query(f['url'], {
@@ -3841,10 +3916,7 @@ def build_fragments(f):
             throttled = False
             if query.get('n'):
                 try:
-                    decrypt_nsig = self._cached(self._decrypt_nsig, 'nsig', query['n'][0])
-                    fmt_url = update_url_query(fmt_url, {
-                        'n': decrypt_nsig(query['n'][0], video_id, player_url)
-                    })
+                    fmt_url = update_url_query(fmt_url, {'n': decrypt_nsig(query['n'][0])})
                 except ExtractorError as e:
                     if player_url:
                         self.report_warning(
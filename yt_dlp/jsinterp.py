@@ -1,5 +1,6 @@
 import collections
 import contextlib
+import functools
 import itertools
 import json
 import math
@@ -134,6 +135,24 @@ def _js_ternary(cndn, if_true=True, if_false=False):
 _MATCHING_PARENS = dict(zip(*zip('()', '{}', '[]')))
 _QUOTES = '\'"/'
 
+_INCREMENT_RE = re.compile(rf'''(?x)
+    (?P<pre_sign>\+\+|--)(?P<var1>{_NAME_RE})|
+    (?P<var2>{_NAME_RE})(?P<post_sign>\+\+|--)''')
+_EXPRESSION_RE = re.compile(fr'''(?x)
+    (?P<assign>
+        (?P<out>{_NAME_RE})(?:\[(?P<index>[^\]]+?)\])?\s*
+        (?P<op>{"|".join(map(re.escape, set(_OPERATORS) - _COMP_OPERATORS))})?
+        =(?!=)(?P<expr>.*)$
+    )|(?P<return>
+        (?!if|return|true|false|null|undefined|NaN)(?P<name>{_NAME_RE})$
+    )|(?P<indexing>
+        (?P<in>{_NAME_RE})\[(?P<idx>.+)\]$
+    )|(?P<attribute>
+        (?P<var>{_NAME_RE})(?:(?P<nullish>\?)?\.(?P<member>[^(]+)|\[(?P<member2>[^\]]+)\])\s*
+    )|(?P<function>
+        (?P<fname>{_NAME_RE})\((?P<args>.*)\)$
+    )''')
+
 
 class JS_Undefined:
     pass
@@ -242,10 +261,18 @@ def _regex_flags(cls, expr):
         return flags, expr[idx + 1:]
 
     @staticmethod
+    @functools.lru_cache(maxsize=16384)
     def _separate(expr, delim=',', max_split=None):
+        """
+        Split the expression at the delimiters that are not nested or quoted
+
+        The same code is split again every time it is evaluated, eg. in a loop,
+        so the results are cached; the cached tuples must not be modified
+        """
         OP_CHARS = '+-*/%&|^=<>!,;{}:['
         if not expr:
-            return
+            return ()
+        separated = []
         counters = {k: 0 for k in _MATCHING_PARENS.values()}
         start, splits, pos, delim_len = 0, 0, 0, len(delim) - 1
         in_quote, escaping, after_op, in_regex_char_group = None, False, True, False
@@ -273,22 +300,52 @@ def _separate(expr, delim=',', max_split=None):
             elif pos != delim_len:
                 pos += 1
                 continue
-            yield expr[start: idx - delim_len]
+            separated.append(expr[start: idx - delim_len])
             start, pos = idx + 1, 0
             splits += 1
             if max_split and splits >= max_split:
                 break
-        yield expr[start:]
+        separated.append(expr[start:])
+        return tuple(separated)
 
     @classmethod
     def _separate_at_paren(cls, expr, delim=None):
         if delim is None:
             delim = expr and _MATCHING_PARENS[expr[0]]
-        separated = list(cls._separate(expr, delim, 1))
+        separated = cls._separate(expr, delim, 1)
         if len(separated) < 2:
             raise cls.Exception(f'No terminating paren {delim}', expr)
         return separated[0][1:].strip(), separated[1].strip()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def _separate_at_operator(expr):
+        """@returns (op, left_expr, right_expr) for the operator of the lowest precedence, or None"""
+        for op in _OPERATORS:
+            separated = list(JSInterpreter._separate(expr, op))
+            right_expr = separated.pop()
+            while True:
+                if op in '?<>*-' and len(separated) > 1 and not separated[-1].strip():
+                    separated.pop()
+                elif not (separated and op == '?' and right_expr.startswith('.')):
+                    break
+                right_expr = f'{op}{right_expr}'
+                if op != '-':
+                    right_expr = f'{separated.pop()}{op}{right_expr}'
+            if separated:
+                return op, op.join(separated), right_expr
+        return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def _literal_json(expr):
+        """@returns the expression as JSON if it is a literal, or None"""
+        with contextlib.suppress(ValueError):
+            literal = js_to_json(expr, strict=True)
+            json.loads(literal)
+            return literal
+        return None
+
     def _operator(self, op, left_val, right_expr, expr, local_vars, allow_recursion):
         if op in ('||', '&&'):
             if (op == '&&') ^ _js_ternary(left_val):
@@ -534,9 +591,7 @@ def dict_item(key, val):
                     return ret, True
             return ret, False
 
-        for m in re.finditer(rf'''(?x)
-                (?P<pre_sign>\+\+|--)(?P<var1>{_NAME_RE})|
-                (?P<var2>{_NAME_RE})(?P<post_sign>\+\+|--)''', expr):
+        for m in _INCREMENT_RE.finditer(expr):
             var = m.group('var1') or m.group('var2')
             start, end = m.span()
             sign = m.group('pre_sign') or m.group('post_sign')
@@ -549,20 +604,7 @@ def dict_item(key, val):
         if not expr:
             return None, should_return
 
-        m = re.match(fr'''(?x)
-            (?P<assign>
-                (?P<out>{_NAME_RE})(?:\[(?P<index>[^\]]+?)\])?\s*
-                (?P<op>{"|".join(map(re.escape, set(_OPERATORS) - _COMP_OPERATORS))})?
-                =(?!=)(?P<expr>.*)$
-            )|(?P<return>
-                (?!if|return|true|false|null|undefined|NaN)(?P<name>{_NAME_RE})$
-            )|(?P<indexing>
-                (?P<in>{_NAME_RE})\[(?P<idx>.+)\]$
-            )|(?P<attribute>
-                (?P<var>{_NAME_RE})(?:(?P<nullish>\?)?\.(?P<member>[^(]+)|\[(?P<member2>[^\]]+)\])\s*
-            )|(?P<function>
-                (?P<fname>{_NAME_RE})\((?P<args>.*)\)$
-            )''', expr)
+        m = _EXPRESSION_RE.match(expr)
         if m and m.group('assign'):
             left_val = local_vars.get(m.group('out'))
 
@@ -596,28 +638,19 @@ def dict_item(key, val):
         elif m and m.group('return'):
             return local_vars.get(m.group('name'), JS_Undefined), should_return
 
-        with contextlib.suppress(ValueError):
-            return json.loads(js_to_json(expr, strict=True)), should_return
+        literal = self._literal_json(expr)
+        if literal is not None:
+            return json.loads(literal), should_return
 
         if m and m.group('indexing'):
             val = local_vars[m.group('in')]
             idx = self.interpret_expression(m.group('idx'), local_vars, allow_recursion)
             return self._index(val, idx), should_return
 
-        for op in _OPERATORS:
-            separated = list(self._separate(expr, op))
-            right_expr = separated.pop()
-            while True:
-                if op in '?<>*-' and len(separated) > 1 and not separated[-1].strip():
-                    separated.pop()
-                elif not (separated and op == '?' and right_expr.startswith('.')):
-                    break
-                right_expr = f'{op}{right_expr}'
-                if op != '-':
-                    right_expr = f'{separated.pop()}{op}{right_expr}'
-            if not separated:
-                continue
-            left_val = self.interpret_expression(op.join(separated), local_vars, allow_recursion)
+        separated = self._separate_at_operator(expr)
+        if separated:
+            op, left_expr, right_expr = separated
+            left_val = self.interpret_expression(left_expr, local_vars, allow_recursion)
             return self._operator(op, left_val, right_expr, expr, local_vars, allow_recursion), should_return
 
         if m and m.group('attribute'):
@@ -823,17 +856,37 @@ def extract_function(self, funcname):
             f'F<{funcname}>')
 
     def extract_function_from_code(self, argnames, code, *global_stack):
+        return self.build_parsed_function(self.parse_function_code(argnames, code), *global_stack)
+
+    def parse_function_code(self, argnames, code):
+        """
+        Move the function expressions out of the code, so that it need not be scanned again
+        @returns [argnames, code, {name: [argnames, code, {...}]}], which can be serialized as JSON
+        """
+        counter = itertools.count(1)
+
+        def parse(argnames, code):
+            functions = {}
+            while True:
+                mobj = re.search(r'function\((?P<args>[^)]*)\)\s*{', code)
+                if mobj is None:
+                    break
+                start, body_start = mobj.span()
+                body, remaining = self._separate_at_paren(code[body_start - 1:])
+                name = f'__yt_dlp_jsinterp_func{next(counter)}'
+                functions[name] = parse([x.strip() for x in mobj.group('args').split(',')], body)
+                code = code[:start] + name + remaining
+            return [list(argnames), code, functions]
+
+        return parse(argnames, code)
+
+    def build_parsed_function(self, parsed, *global_stack):
+        """Build a function from the output of parse_function_code"""
+        argnames, code, functions = parsed
         local_vars = {}
-        while True:
-            mobj = re.search(r'function\((?P<args>[^)]*)\)\s*{', code)
-            if mobj is None:
-                break
-            start, body_start = mobj.span()
-            body, remaining = self._separate_at_paren(code[body_start - 1:])
-            name = self._named_object(local_vars, self.extract_function_from_code(
-                [x.strip() for x in mobj.group('args').split(',')],
-                body, local_vars, *global_stack))
-            code = code[:start] + name + remaining
+        for name, func in functions.items():
+            local_vars[name] = function_with_repr(
+                self.build_parsed_function(func, local_vars, *global_stack), f'F<{name}>')
         return self.build_function(argnames, code, local_vars, *global_stack)
 
     def call_function(self, funcname, *args):
@@ -601,6 +601,11 @@ def _alias_callback(option, opt_str, value, parser, opts, nargs):
         dest='enable_file_urls', default=False,
         help='Enable file:// URLs. This is disabled by default for security reasons.'
     )
+    network.add_option(
+        '--no-keep-alive', action='store_false',
+        dest='http_keep_alive', default=True,
+        help='Open a new connection for every HTTP request instead of reusing idle ones',
+    )
 
     geo = optparse.OptionGroup(parser, 'Geo-restriction')
     geo.add_option(
@@ -905,6 +910,12 @@ def _alias_callback(option, opt_str, value, parser, opts, nargs):
         '-F', '--list-formats',
         action='store_true', dest='listformats',
         help='List available formats of each video. Simulate unless --no-simulate is used')
+    video_format.add_option(
+        '--explain-format',
+        action='store_true', dest='explain_format', default=False,
+        help=(
+            'Print how the format selection is compiled for each video, which formats it selects '
+            'and how long that takes. Simulate unless --no-simulate is used'))
     video_format.add_option(
         '--list-formats-as-table',
         action='store_true', dest='listformats_table', default=True,
@@ -979,10 +990,43 @@ def _alias_callback(option, opt_str, value, parser, opts, nargs):
         '-N', '--concurrent-fragments',
         dest='concurrent_fragment_downloads', metavar='N', default=1, type=int,
         help='Number of fragments of a dash/hlsnative video that should be downloaded concurrently (default is %default)')
+    downloader.add_option(
+        '--adaptive-concurrency',
+        action='store_true', dest='adaptive_fragment_concurrency', default=False,
+        help=(
+            'Adjust the number of fragments that are downloaded concurrently to the measured '
+            'throughput and to the errors returned by the server. --concurrent-fragments is the maximum'))
+    downloader.add_option(
+        '--no-adaptive-concurrency',
+        action='store_false', dest='adaptive_fragment_concurrency',
+        help='Always download --concurrent-fragments fragments concurrently (default)')
+    downloader.add_option(
+        '--concurrent-formats',
+        action='store_true', dest='concurrent_format_downloads', default=False,
+        help=(
+            'Download the formats that are merged into a single file, e.g. with -f bv+ba, at the same time. '
+            'The formats share --limit-rate'))
+    downloader.add_option(
+        '--no-concurrent-formats',
+        action='store_false', dest='concurrent_format_downloads',
+        help='Download the formats to be merged one after the other (default)')
+    downloader.add_option(
+        '--concurrent-entries',
+        dest='concurrent_playlist_entries', metavar='N', default=1, type=int,
+        help=(
+            'Number of playlist entries that are extracted and downloaded concurrently (default is %default). '
+            'The download archive, --max-downloads and --break-on-existing still apply in playlist order'))
+    downloader.add_option(
+        '--http-connections',
+        dest='http_connections', metavar='N', default=1, type=int,
+        help=(
+            'Number of connections to download a single http(s) file with. '
+            'The file is split into byte ranges that are downloaded concurrently, '
+            'if the server supports it (default is %default)'))
     downloader.add_option(
         '-r', '--limit-rate', '--rate-limit',
         dest='ratelimit', metavar='RATE',
-        help='Maximum download rate in bytes per second, e.g. 50K or 4.2M')
+        help='Maximum download rate in bytes per second, e.g. 50K or 4.2M. The limit applies to all the concurrent downloads together')
     downloader.add_option(
         '--throttled-rate',
         dest='throttledratelimit', metavar='RATE',
@@ -1028,6 +1072,14 @@ def _alias_callback(option, opt_str, value, parser, opts, nargs):
         '--no-keep-fragments',
         action='store_false', dest='keep_fragments',
         help='Delete downloaded fragments after downloading is finished (default)')
+    downloader.add_option(
+        '--fragment-memory-budget',
+        dest='fragment_memory_budget', metavar='SIZE', default=None,
+        help=(
+            'Keep downloaded fragments in memory instead of temporary files. '
+            'SIZE is the maximum size of the fragments that are held in memory while waiting for '
+            'the previous ones to finish (with --concurrent-fragments), e.g. 64M. '
+            'The fragments over this are written to temporary files (default is disabled)'))
     downloader.add_option(
         '--buffer-size',
         dest='buffersize', metavar='SIZE', default='1024',
@@ -1602,6 +1654,36 @@ def _alias_callback(option, opt_str, value, parser, opts, nargs):
     filesystem.add_option(
         '--no-cache-dir', action='store_false', dest='cachedir',
         help='Disable filesystem caching')
+    filesystem.add_option(
+        '--extraction-cache-ttl',
+        metavar='[EXTRACTOR:]SECONDS', dest='extraction_cache_ttl', default={}, type='str',
+        action='callback', callback=_dict_from_options_callback,
+        callback_kwargs={
+            'default_key': 'default',
+            'process': int,
+        }, help=(
+            'Reuse the extraction results from the cache directory if they are not older than SECONDS, '
+            'optionally prefixed by the extractor key (case-insensitive) to use it for. '
+            'You can use this option multiple times to set different times for different extractors. '
+            'E.g. --extraction-cache-ttl 86400 --extraction-cache-ttl youtube:3600. '
+            'Results with format URLs that expire earlier and live streams are always extracted again. '
+            'By default, extraction results are not cached'))
+    filesystem.add_option(
+        '--no-extraction-cache',
+        action='store_const', const={}, dest='extraction_cache_ttl',
+        help='Do not reuse extraction results from the cache directory (default)')
+    filesystem.add_option(
+        '--http-cache-size',
+        metavar='SIZE', dest='http_cache_size', default=None,
+        help=(
+            'Keep the web pages requested by the extractors in the cache directory, up to SIZE (e.g. 50M). '
+            'They are only downloaded again if they have changed, '
+            'or not even requested while they are fresh according to the server. '
+            'By default, web pages are not cached'))
+    filesystem.add_option(
+        '--no-http-cache',
+        action='store_const', const=None, dest='http_cache_size',
+        help='Do not cache web pages (default)')
     filesystem.add_option(
         '--rm-cache-dir', '--clear-cache',
         action='store_true', dest='rm_cachedir',
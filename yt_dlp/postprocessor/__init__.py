@@ -1,48 +1,53 @@
 # flake8: noqa: F401
+import sys
 
-from .common import PostProcessor
-from .embedthumbnail import EmbedThumbnailPP
-from .exec import ExecAfterDownloadPP, ExecPP
-from .ffmpeg import (
-    FFmpegConcatPP,
-    FFmpegCopyStreamPP,
-    FFmpegEmbedSubtitlePP,
-    FFmpegExtractAudioPP,
-    FFmpegFixupDuplicateMoovPP,
-    FFmpegFixupDurationPP,
-    FFmpegFixupM3u8PP,
-    FFmpegFixupM4aPP,
-    FFmpegFixupStretchedPP,
-    FFmpegFixupTimestampPP,
-    FFmpegMergerPP,
-    FFmpegMetadataPP,
-    FFmpegPostProcessor,
-    FFmpegSplitChaptersPP,
-    FFmpegSubtitlesConvertorPP,
-    FFmpegThumbnailsConvertorPP,
-    FFmpegVideoConvertorPP,
-    FFmpegVideoRemuxerPP,
-)
-from .metadataparser import (
-    MetadataFromFieldPP,
-    MetadataFromTitlePP,
-    MetadataParserPP,
-)
-from .metapulator import MetapulatorPP
-from .modify_chapters import ModifyChaptersPP
-from .movefilesafterdownload import MoveFilesAfterDownloadPP
-from .sponskrub import SponSkrubPP
-from .sponsorblock import SponsorBlockPP
-from .xattrpp import XAttrMetadataPP
+from ..compat.compat_utils import lazy_attributes
 from ..plugins import load_plugins
 
+# The postprocessors are only imported when they are first accessed
+_POSTPROCESSORS = {
+    'PostProcessor': '.common',
+    'EmbedThumbnailPP': '.embedthumbnail',
+    'ExecAfterDownloadPP': '.exec',
+    'ExecPP': '.exec',
+    **dict.fromkeys((
+        'FFmpegConcatPP',
+        'FFmpegCopyStreamPP',
+        'FFmpegEmbedSubtitlePP',
+        'FFmpegExtractAudioPP',
+        'FFmpegFixupDuplicateMoovPP',
+        'FFmpegFixupDurationPP',
+        'FFmpegFixupM3u8PP',
+        'FFmpegFixupM4aPP',
+        'FFmpegFixupStretchedPP',
+        'FFmpegFixupTimestampPP',
+        'FFmpegMergerPP',
+        'FFmpegMetadataPP',
+        'FFmpegPostProcessor',
+        'FFmpegSplitChaptersPP',
+        'FFmpegSubtitlesConvertorPP',
+        'FFmpegThumbnailsConvertorPP',
+        'FFmpegVideoConvertorPP',
+        'FFmpegVideoRemuxerPP',
+    ), '.ffmpeg'),
+    'MetadataFromFieldPP': '.metadataparser',
+    'MetadataFromTitlePP': '.metadataparser',
+    'MetadataParserPP': '.metadataparser',
+    'MetapulatorPP': '.metapulator',
+    'ModifyChaptersPP': '.modify_chapters',
+    'MoveFilesAfterDownloadPP': '.movefilesafterdownload',
+    'SponSkrubPP': '.sponskrub',
+    'SponsorBlockPP': '.sponsorblock',
+    'XAttrMetadataPP': '.xattrpp',
+}
+lazy_attributes(__name__, _POSTPROCESSORS)
+
 _PLUGIN_CLASSES = load_plugins('postprocessor', 'PP')
 
 
 def get_postprocessor(key):
-    return globals()[key + 'PP']
+    return getattr(sys.modules[__name__], key + 'PP')
 
 
 globals().update(_PLUGIN_CLASSES)
-__all__ = [name for name in globals().keys() if name.endswith('PP')]
-__all__.extend(('PostProcessor', 'FFmpegPostProcessor'))
+__all__ = [*_POSTPROCESSORS, *(name for name in _PLUGIN_CLASSES if name.endswith('PP'))]
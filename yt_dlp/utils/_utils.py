@@ -1,9 +1,11 @@
 import base64
 import binascii
+import bisect
 import calendar
 import codecs
 import collections
 import collections.abc
+import concurrent.futures
 import contextlib
 import datetime
 import email.header
@@ -28,6 +30,7 @@
 import platform
 import random
 import re
+import select
 import shlex
 import socket
 import ssl
@@ -35,6 +38,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import types
@@ -362,16 +366,20 @@ def get_element_html_by_attribute(attribute, value, html, **kargs):
 
 def get_elements_by_class(class_name, html, **kargs):
     """Return the content of all tags with the specified class in the passed HTML document as a list"""
-    return get_elements_by_attribute(
-        'class', r'[^\'"]*(?<=[\'"\s])%s(?=[\'"\s])[^\'"]*' % re.escape(class_name),
-        html, escape_value=False)
+    return [content for content, _ in _get_elements_text_and_html_by_class(class_name, html)]
 
 
 def get_elements_html_by_class(class_name, html):
     """Return the html of all tags with the specified class in the passed HTML document as a list"""
-    return get_elements_html_by_attribute(
-        'class', r'[^\'"]*(?<=[\'"\s])%s(?=[\'"\s])[^\'"]*' % re.escape(class_name),
-        html, escape_value=False)
+    return [whole for _, whole in _get_elements_text_and_html_by_class(class_name, html)]
+
+
+def _get_elements_text_and_html_by_class(class_name, html):
+    value = r'[^\'"]*(?<=[\'"\s])%s(?=[\'"\s])[^\'"]*' % re.escape(class_name)
+    index = PageIndex.get(html)
+    return _get_elements_text_and_html(
+        html, _partial_element_re('class', value, _ELEMENT_TAG_RE, False),
+        index, index and index._class_candidates(class_name))
 
 
 def get_elements_by_attribute(*args, **kwargs):
@@ -384,7 +392,10 @@ def get_elements_html_by_attribute(*args, **kwargs):
     return [whole for _, whole in get_elements_text_and_html_by_attribute(*args, **kwargs)]
 
 
-def get_elements_text_and_html_by_attribute(attribute, value, html, *, tag=r'[\w:.-]+', escape_value=True):
+_ELEMENT_TAG_RE = r'[\w:.-]+'
+
+
+def get_elements_text_and_html_by_attribute(attribute, value, html, *, tag=_ELEMENT_TAG_RE, escape_value=True):
     """
     Return the text (content) and the html (whole) of the tag with the specified
     attribute in the passed HTML document
@@ -392,19 +403,36 @@ def get_elements_text_and_html_by_attribute(attribute, value, html, *, tag=r'[\w
     if not value:
         return
 
+    index = PageIndex.get(html)
+    yield from _get_elements_text_and_html(
+        html, _partial_element_re(attribute, value, tag, escape_value), index,
+        index and tag == _ELEMENT_TAG_RE and escape_value and index._attribute_candidates(attribute, value))
+
+
+def _partial_element_re(attribute, value, tag, escape_value):
     quote = '' if re.match(r'''[\s"'`=<>]''', value) else '?'
 
     value = re.escape(value) if escape_value else value
 
-    partial_element_re = rf'''(?x)
+    return rf'''(?x)
         <(?P<tag>{tag})
          (?:\s(?:[^>"']|"[^"]*"|'[^']*')*)?
          \s{re.escape(attribute)}\s*=\s*(?P<_q>['"]{quote})(?-x:{value})(?P=_q)
         '''
 
-    for m in re.finditer(partial_element_re, html):
-        content, whole = get_element_text_and_html_by_tag(m.group('tag'), html[m.start():])
 
+def _get_elements_text_and_html(html, partial_element_re, index=None, candidates=None):
+    """
+    Yield the text and html of the elements that partial_element_re finds in html;
+    if candidates is a list, it is only tried at these positions (see PageIndex)
+    """
+    if not isinstance(candidates, list):
+        elements = (_get_element_text_and_html_by_tag(m.group('tag'), html[m.start():])
+                    for m in re.finditer(partial_element_re, html))
+    else:
+        elements = (index._element(m.group('tag'), m.start()) for m in index._finditer(partial_element_re, candidates))
+
+    for content, whole in elements:
         yield (
             unescapeHTML(re.sub(r'^(?P<q>["\'])(?P<content>.*)(?P=q)$', r'\g<content>', content, flags=re.DOTALL)),
             whole
@@ -453,12 +481,19 @@ def handle_endtag(self, tag):
             raise self.HTMLBreakOnClosingTagException()
 
 
-# XXX: This should be far less strict
 def get_element_text_and_html_by_tag(tag, html):
     """
     For the first element with the specified tag in the passed HTML document
     return its' content (text) and the whole element (html)
     """
+    index = PageIndex.get(html)
+    if index:
+        return index._element_by_tag(tag)
+    return _get_element_text_and_html_by_tag(tag, html)
+
+
+# XXX: This should be far less strict
+def _get_element_text_and_html_by_tag(tag, html):
     def find_or_raise(haystack, needle, exc):
         try:
             return haystack.index(needle)
@@ -489,6 +524,125 @@ def find_or_raise(haystack, needle, exc):
         raise compat_HTMLParseError('unexpected end of html')
 
 
+class PageIndex:
+    """
+    Index of the elements of a webpage, which is built lazily by the first lookups
+
+    Once created for a page, the get_element(s)_* helpers above and the OpenGraph and
+    meta helpers of InfoExtractor use it whenever they are passed that very string.
+    The results are the same as those of scanning the whole page: the index only finds
+    the positions their regexes can match at, where they are then tried as usual
+    """
+
+    _MAX_INDEXES = 8
+    _indexes = collections.OrderedDict()
+
+    # The start of a tag up to the first '>' outside of quotes
+    _TAG_RE = re.compile(r'''<[\w:.-]+(?:\s(?:[^>"']|"[^"]*"|'[^']*')*)?''')
+
+    def __init__(self, html):
+        self.html = html
+        self._tags = self._meta_tags = None
+        self._attributes, self._class_words, self._elements = {}, {}, {}
+        self._indexes.pop(id(html), None)
+        self._indexes[id(html)] = self
+        while len(self._indexes) > self._MAX_INDEXES:
+            self._indexes.popitem(last=False)
+
+    @classmethod
+    def get(cls, html):
+        """@returns the index of this very string, if one was created"""
+        index = cls._indexes.get(id(html))
+        return index if index is not None and index.html is html else None
+
+    def _tag_starts(self, pos):
+        """@returns the positions of the tags that pos is within"""
+        if self._tags is None:
+            starts, ends = [], []
+            for mobj in re.finditer(r'<[\w:.-]', self.html):
+                starts.append(mobj.start())
+                ends.append(self._TAG_RE.match(self.html, mobj.start()).end())
+            # Quoted attribute values can contain what looks like further tags
+            spanning = [(start, end) for start, end, next_start in zip(starts, ends, starts[1:]) if end > next_start]
+            self._tags = starts, ends, spanning
+
+        starts, ends, spanning = self._tags
+        idx = bisect.bisect_right(starts, pos) - 1
+        if idx < 0:
+            return []
+        return [start for start, end in spanning if start < starts[idx] and end > pos] + (
+            [starts[idx]] if ends[idx] > pos else [])
+
+    def _attribute(self, attribute):
+        """@returns ({quoted value: [tag positions]}, [([tag positions], unquoted value position)])"""
+        if attribute not in self._attributes:
+            quoted, unquoted = collections.defaultdict(list), []
+            for mobj in re.finditer(rf'''\s(?={re.escape(attribute)}\s*=\s*(?:"([^"]*)"|'([^']*)'|()))''', self.html):
+                starts = self._tag_starts(mobj.start())
+                if mobj.group(3) is None:
+                    quoted[mobj.group(1) if mobj.group(1) is not None else mobj.group(2)].extend(starts)
+                elif starts:
+                    unquoted.append((starts, mobj.start(3)))
+            self._attributes[attribute] = quoted, unquoted
+        return self._attributes[attribute]
+
+    def _attribute_candidates(self, attribute, value):
+        """@returns the positions of the tags that may have the attribute with the (literal) value"""
+        if '"' in value or "'" in value:
+            return None
+        quoted, unquoted = self._attribute(attribute)
+        return quoted.get(value, []) + [
+            start for starts, pos in unquoted if self.html.startswith(value, pos) for start in starts]
+
+    def _class_candidates(self, class_name):
+        """@returns the positions of the tags whose class may contain class_name"""
+        if '"' in class_name or "'" in class_name:
+            return None
+        quoted, unquoted = self._attribute('class')
+        if not class_name or any(c.isspace() for c in class_name):
+            candidates = [start for value, starts in quoted.items() if class_name in value for start in starts]
+        else:
+            if not self._class_words:
+                for value, starts in quoted.items():
+                    for word in set(value.split()):
+                        self._class_words.setdefault(word, []).extend(starts)
+            candidates = list(self._class_words.get(class_name, []))
+        return candidates + [start for starts, _ in unquoted for start in starts]
+
+    def _finditer(self, pattern, candidates):
+        """Like re.finditer, for a pattern that can only match at candidates"""
+        regex, end = re.compile(pattern), 0
+        for pos in sorted(set(candidates)):
+            if pos < end:
+                continue
+            mobj = regex.match(self.html, pos)
+            if mobj:
+                end = mobj.end()
+                yield mobj
+
+    def _element(self, tag, pos):
+        if (tag, pos) not in self._elements:
+            self._elements[(tag, pos)] = _get_element_text_and_html_by_tag(tag, self.html[pos:])
+        return self._elements[(tag, pos)]
+
+    def _element_by_tag(self, tag):
+        pos = self.html.find(f'<{tag}')
+        if pos == -1:
+            raise compat_HTMLParseError(f'opening {tag} tag not found')
+        return self._element(tag, pos)
+
+    def search_meta(self, pattern, flags=0):
+        """Like re.search, for a pattern that can only match at the start of a <meta> tag"""
+        if self._meta_tags is None:
+            self._meta_tags = [mobj.start() for mobj in re.finditer(r'(?i)<meta', self.html)]
+        regex = re.compile(pattern, flags)
+        for pos in self._meta_tags:
+            mobj = regex.match(self.html, pos)
+            if mobj:
+                return mobj
+        return None
+
+
 class HTMLAttributeParser(html.parser.HTMLParser):
     """Trivial HTML parser to gather the attributes for a single element"""
 
@@ -604,6 +758,113 @@ def decode(self, s):
         assert False, 'Too many attempts to decode JSON'
 
 
+class JSONScanner:
+    """
+    Finds the JSON objects that are embedded in a webpage and decodes them in place
+
+    Where the objects start and end is memoized per page, so that looking one up
+    again only costs decoding it. The results are those of the regexes that
+    InfoExtractor._search_json and _yield_json_ld use; whenever they could differ,
+    the lookups return None so that the caller falls back to those regexes
+    """
+
+    _MAX_SCANNERS = 8
+    _scanners = collections.OrderedDict()
+
+    _DECODER = json.JSONDecoder(strict=False)
+    # JSON_LD_RE up to the start of the object
+    _JSON_LD_START_RE = re.compile(r'''(?is)<script[^>]+type=(["\']?)application/ld\+json\1[^>]*>\s*(?=[{\[])''')
+    _JSON_LD_END_RE = re.compile(r'(?is)\s*</script>')
+    _SCRIPT_END_RE = re.compile(r'(?i)</script')
+
+    def __init__(self, page):
+        self.page = page
+        self._objects, self._json_ld = {}, None
+        self._scanners.pop(id(page), None)
+        self._scanners[id(page)] = self
+        while len(self._scanners) > self._MAX_SCANNERS:
+            self._scanners.popitem(last=False)
+
+    @classmethod
+    def of(cls, page):
+        """@returns the scanner of this very string, creating it if needed"""
+        scanner = cls._scanners.get(id(page))
+        if scanner is None or scanner.page is not page:
+            return cls(page)
+        cls._scanners.move_to_end(id(page))
+        return scanner
+
+    def search_object(self, start_pattern, end_pattern=''):
+        r"""
+        Decode the object that
+        re.search(rf'(?:{start_pattern})\s*(?P<json>{{(?s:.+)}})\s*(?:{end_pattern})', page)
+        finds, like LenientJSONDecoder(ignore_extra=True) does with the json group
+        """
+        key = (start_pattern, end_pattern)
+        if key in self._objects:
+            start = self._objects[key]
+            return None if start is None else self._DECODER.raw_decode(self.page, start)[0]
+
+        start, obj = self._find_object(start_pattern, end_pattern)
+        self._objects[key] = start
+        return obj
+
+    def _find_object(self, start_pattern, end_pattern):
+        mobj = re.search(rf'(?:{start_pattern})\s*(?={{)', self.page)
+        if not mobj:
+            return None, None
+        start = mobj.end()
+        try:
+            obj, end = self._DECODER.raw_decode(self.page, start)
+        except ValueError:
+            return None, None
+
+        # The regex ends the json group at the last "}" that end_pattern follows,
+        # so there has to be one at or after the end of the decoded object
+        end_re, pos = re.compile(rf'\s*(?:{end_pattern})'), max(start + 2, end - 1)
+        while True:
+            pos = self.page.find('}', pos)
+            if pos == -1:
+                return None, None
+            elif end_re.match(self.page, pos + 1):
+                return start, obj
+            pos += 1
+
+    def iter_json_ld(self):
+        """
+        Yield the objects of the matches of JSON_LD_RE in order;
+        the json_ld groups that cannot be decoded in place are yielded as strings
+        """
+        if self._json_ld is None:
+            self._json_ld = list(self._find_json_ld())
+        for start, json_string in self._json_ld:
+            yield json_string if start is None else self._DECODER.raw_decode(self.page, start)[0]
+
+    def _find_json_ld(self):
+        pos = 0
+        while True:
+            mobj = self._JSON_LD_START_RE.search(self.page, pos)
+            if not mobj:
+                return
+            start = end = mobj.end()
+            try:
+                _, end = self._DECODER.raw_decode(self.page, start)
+            except ValueError:
+                pass
+            # The regex ends the json group at the first "}" or "]" that </script> follows
+            closing = self._JSON_LD_END_RE.match(self.page, end)
+            if closing and end - start > 2 and not self._SCRIPT_END_RE.search(self.page, start, end):
+                yield start, None
+                pos = closing.end()
+                continue
+
+            mobj = re.compile(JSON_LD_RE).search(self.page, mobj.start())
+            if not mobj:
+                return
+            yield None, mobj.group('json_ld')
+            pos = mobj.end()
+
+
 def sanitize_open(filename, open_mode):
     """Try to open the given filename, and slightly tweak it if this fails.
 
@@ -1316,6 +1577,181 @@ def _create_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_a
     return hc
 
 
+class _KeepAliveHTTPResponse(http.client.HTTPResponse):
+    """Lets the HTTPConnectionPool know when the connection is free again"""
+    _ytdl_pool_entry = None
+
+    def _close_conn(self):
+        reusable = self.fp is not None and self._ytdl_pool_entry is not None
+        super()._close_conn()
+        if reusable:
+            # The body has been read to the end; the connection can be reused,
+            # but only once this response is closed, or it is not ready for the next request
+            self._ytdl_pool_entry.release()
+
+    def close(self):
+        if self.fp is not None and self._ytdl_pool_entry is not None:
+            # Closed before the end of the body; the rest is still in the socket
+            self._ytdl_pool_entry.discard()
+        super().close()
+
+
+class _HTTPConnectionPoolEntry:
+    def __init__(self, conn):
+        self.conn = conn
+        self.state = 'busy'  # busy, idle or broken
+        self.idle_since = None
+
+    def release(self):
+        if self.state == 'busy':
+            self.state, self.idle_since = 'idle', time.monotonic()
+
+    def discard(self):
+        self.state = 'broken'
+
+
+class HTTPConnectionPool:
+    """
+    Keeps HTTP/1.1 connections open after their response has been read,
+    so that later requests to the same server can reuse them.
+
+    Connections are pooled by (scheme, host, port, proxy). A connection is only
+    reused after the whole body of its previous response has been read, and if
+    it has not been idle for more than idle_timeout seconds or closed by the server.
+    At most maxsize connections are kept for each key.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=30):
+        self.maxsize, self.idle_timeout = maxsize, idle_timeout
+        self._lock = threading.Lock()
+        self._entries = collections.defaultdict(list)
+
+    def _is_usable(self, entry):
+        sock = entry.conn.sock
+        if entry.state != 'idle' or sock is None:
+            return False
+        if time.monotonic() - entry.idle_since > self.idle_timeout:
+            return False
+        try:
+            # Nothing is expected to arrive before the next request;
+            # a readable socket has been closed by the server
+            return not select.select([sock], [], [], 0)[0]
+        except (OSError, ValueError):
+            return False
+
+    def get(self, key):
+        """Take an idle connection for the key out of the pool, or return None"""
+        with self._lock:
+            entries = self._entries[key]
+            for entry in entries[:]:
+                if entry.state == 'busy':
+                    continue
+                entries.remove(entry)
+                if self._is_usable(entry):
+                    entry.state = 'busy'
+                    entries.append(entry)
+                    return entry
+                entry.conn.close()
+        return None
+
+    def put(self, key, conn):
+        """Add a connection that is in use, to be reused once its response has been read"""
+        entry = _HTTPConnectionPoolEntry(conn)
+        with self._lock:
+            entries = self._entries[key]
+            entries.append(entry)
+            for old_entry in [e for e in entries if e.state != 'busy'][:max(len(entries) - self.maxsize, 0)]:
+                entries.remove(old_entry)
+                old_entry.conn.close()
+        return entry
+
+    def remove(self, entry):
+        with self._lock:
+            for entries in self._entries.values():
+                if entry in entries:
+                    entries.remove(entry)
+        entry.conn.close()
+
+    def clear(self):
+        with self._lock:
+            for entries in self._entries.values():
+                for entry in entries:
+                    if entry.state != 'busy':
+                        entry.conn.close()
+            self._entries.clear()
+
+
+def _do_keep_alive_open(handler, http_class, req, **http_conn_args):
+    """
+    Like urllib.request.AbstractHTTPHandler.do_open,
+    but takes the connections from handler._connection_pool and leaves them open
+    """
+    pool = handler._connection_pool
+    socks_proxy = http_conn_args.pop('_ytdl_socks_proxy', None)
+    if pool is None:
+        return handler.do_open(http_class, req, **http_conn_args)
+    host = req.host
+    if not host:
+        raise urllib.error.URLError('no host given')
+
+    headers = dict(req.unredirected_hdrs)
+    headers.update({k: v for k, v in req.headers.items() if k not in headers})
+    headers = {name.title(): val for name, val in headers.items()}
+    tunnel_headers = {}
+    if req._tunnel_host and 'Proxy-Authorization' in headers:
+        # Proxy-Authorization should not be sent to origin server
+        tunnel_headers['Proxy-Authorization'] = headers.pop('Proxy-Authorization')
+
+    key = (req.type, host, req._tunnel_host, socks_proxy, tunnel_headers.get('Proxy-Authorization'))
+    # A body that is not bytes can't be sent again after a failure of a reused connection
+    can_resend = req.data is None or isinstance(req.data, (bytes, bytearray))
+
+    while True:
+        entry = pool.get(key)
+        if entry:
+            h = entry.conn
+            h.timeout = req.timeout
+            with contextlib.suppress(OSError):
+                h.sock.settimeout(req.timeout)
+        else:
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            h.set_debuglevel(handler._debuglevel)
+            h.response_class = _KeepAliveHTTPResponse
+            if req._tunnel_host:
+                h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+        try:
+            try:
+                h.request(req.get_method(), req.selector, req.data, headers,
+                          encode_chunked=req.has_header('Transfer-encoding'))
+            except OSError as err:  # timeout error
+                raise urllib.error.URLError(err)
+            r = h.getresponse()
+        except (urllib.error.URLError, ConnectionError, http.client.BadStatusLine) as err:
+            if entry:
+                pool.remove(entry)
+                if can_resend and not isinstance(getattr(err, 'reason', err), socket.timeout):
+                    # The server closed the idle connection just as it was reused
+                    continue
+            h.close()
+            raise
+        except BaseException:
+            if entry:
+                pool.remove(entry)
+            h.close()
+            raise
+        break
+
+    if r.will_close:
+        if entry:
+            pool.remove(entry)
+    else:
+        r._ytdl_pool_entry = entry or pool.put(key, h)
+
+    r.url = req.get_full_url()
+    r.msg = r.reason
+    return r
+
+
 class YoutubeDLHandler(urllib.request.HTTPHandler):
     """Handler for HTTP requests and responses.
 
@@ -1331,21 +1767,24 @@ class YoutubeDLHandler(urllib.request.HTTPHandler):
     public domain.
     """
 
-    def __init__(self, params, *args, **kwargs):
+    def __init__(self, params, *args, connection_pool=None, **kwargs):
         urllib.request.HTTPHandler.__init__(self, *args, **kwargs)
         self._params = params
+        self._connection_pool = connection_pool
 
     def http_open(self, req):
         conn_class = http.client.HTTPConnection
+        kwargs = {}
 
         socks_proxy = req.headers.get('Ytdl-socks-proxy')
         if socks_proxy:
             conn_class = make_socks_conn_class(conn_class, socks_proxy)
+            kwargs['_ytdl_socks_proxy'] = socks_proxy
             del req.headers['Ytdl-socks-proxy']
 
-        return self.do_open(functools.partial(
+        return _do_keep_alive_open(self, functools.partial(
             _create_http_connection, self, conn_class, False),
-            req)
+            req, **kwargs)
 
     @staticmethod
     def deflate(data):
@@ -1489,10 +1928,11 @@ def connect(self):
 
 
 class YoutubeDLHTTPSHandler(urllib.request.HTTPSHandler):
-    def __init__(self, params, https_conn_class=None, *args, **kwargs):
+    def __init__(self, params, https_conn_class=None, *args, connection_pool=None, **kwargs):
         urllib.request.HTTPSHandler.__init__(self, *args, **kwargs)
         self._https_conn_class = https_conn_class or http.client.HTTPSConnection
         self._params = params
+        self._connection_pool = connection_pool
 
     def https_open(self, req):
         kwargs = {}
@@ -1506,11 +1946,12 @@ def https_open(self, req):
         socks_proxy = req.headers.get('Ytdl-socks-proxy')
         if socks_proxy:
             conn_class = make_socks_conn_class(conn_class, socks_proxy)
+            kwargs['_ytdl_socks_proxy'] = socks_proxy
             del req.headers['Ytdl-socks-proxy']
 
         try:
-            return self.do_open(
-                functools.partial(_create_http_connection, self, conn_class, True), req, **kwargs)
+            return _do_keep_alive_open(
+                self, functools.partial(_create_http_connection, self, conn_class, True), req, **kwargs)
         except urllib.error.URLError as e:
             if (isinstance(e.reason, ssl.SSLError)
                     and getattr(e.reason, 'reason', None) == 'SSLV3_ALERT_HANDSHAKE_FAILURE'):
@@ -2936,6 +3377,162 @@ class IndexError(IndexError):
         pass
 
 
+class PlaylistEntryPool:
+    """
+    Process playlist entries concurrently, keeping their side effects in playlist order
+
+    Each entry is processed in a thread of its own, with up to `workers` entries
+    at a time. Before an entry does anything that depends on the entries before it
+    (archive and filter checks, --max-downloads accounting), it takes its turn.
+    An entry only gets its turn once the previous entries have ended theirs (or
+    have finished), so these happen in playlist order; the slow parts, extraction
+    and download, do not hold the turn. Actions that have to wait for the previous
+    entries to finish, like archive writes, can be deferred.
+
+    Once an entry fails, the entries after it are cancelled when they try to take their turn
+    """
+
+    class Turn:
+        def __init__(self, pool, seq):
+            self.pool, self.seq = pool, seq
+            self.taken = self.ended = False
+            # Nested playlists keep the turn until the whole entry is finished
+            self.hold = False
+            self._steps_left = None
+
+        def take(self):
+            if not self.taken:
+                self.pool._take_turn(self.seq)
+                self.taken = True
+
+        def end(self):
+            if self.taken and not self.ended:
+                self.pool._end_turn(self.seq)
+                self.ended = True
+
+        def end_after(self, steps):
+            """End the turn after `steps` more calls of step()"""
+            if not self.hold:
+                self._steps_left = steps
+
+        def step(self):
+            if self._steps_left is None:
+                return
+            self._steps_left -= 1
+            if self._steps_left <= 0:
+                self.end()
+
+        def defer(self, func):
+            """Call func once the previous entries have finished"""
+            self.pool._defer(self.seq, func)
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._next_turn = self._next_finish = 0
+        self._turns_ended, self._finished, self._deferred = set(), set(), {}
+        self._stop_after = float('inf')
+
+    @property
+    def current_turn(self):
+        """The turn of the entry that is processed by this thread, if any"""
+        return getattr(self._local, 'turn', None)
+
+    def map(self, tasks):
+        """
+        Run the (key, func) tasks concurrently and yield (key, func()) in order
+
+        The tasks are consumed in this thread. If that raises, the results of the
+        tasks that were already started are yielded before the exception is raised
+        """
+        tasks, pending, error = iter(tasks), collections.deque(), None
+        interrupted = False
+        try:
+            seq = 0
+            while True:
+                while error is None and len(pending) < self.workers:
+                    try:
+                        key, func = next(tasks)
+                    except StopIteration:
+                        break
+                    except Exception as e:
+                        error = e
+                        break
+                    pending.append((seq, key, self._start(seq, func)))
+                    seq += 1
+                if not pending:
+                    break
+                _, key, future = pending.popleft()
+                yield key, future.result()
+        except KeyboardInterrupt:
+            interrupted = True
+            raise
+        finally:
+            if pending:
+                # The results are not needed anymore
+                self._stop(pending[0][0] - 1)
+                # The threads are daemonic, so they do not hold up exiting on Ctrl+C
+                if not interrupted:
+                    concurrent.futures.wait([future for *_, future in pending])
+        if error is not None:
+            raise error
+
+    def _start(self, seq, func):
+        future = concurrent.futures.Future()
+
+        def run():
+            turn = self._local.turn = self.Turn(self, seq)
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                self._stop(seq)
+                future.set_exception(e)
+            finally:
+                self._local.turn = None
+                self._finish(turn)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _stop(self, seq):
+        with self._cond:
+            self._stop_after = min(self._stop_after, seq)
+            self._cond.notify_all()
+
+    def _take_turn(self, seq):
+        with self._cond:
+            self._cond.wait_for(lambda: seq > self._stop_after or self._next_turn >= seq)
+            if seq > self._stop_after:
+                raise DownloadCancelled('A previous playlist entry failed')
+
+    def _end_turn(self, seq):
+        with self._cond:
+            self._turns_ended.add(seq)
+            while self._next_turn in self._turns_ended:
+                self._turns_ended.remove(self._next_turn)
+                self._next_turn += 1
+            self._cond.notify_all()
+
+    def _defer(self, seq, func):
+        with self._cond:
+            if seq <= self._next_finish:
+                func()
+            else:
+                self._deferred.setdefault(seq, []).append(func)
+
+    def _finish(self, turn):
+        if not turn.ended:
+            self._end_turn(turn.seq)
+        with self._cond:
+            self._finished.add(turn.seq)
+            while self._next_finish in self._finished:
+                self._finished.remove(self._next_finish)
+                self._next_finish += 1
+                for func in self._deferred.pop(self._next_finish, []):
+                    func()
+
+
 def uppercase_escape(s):
     unicode_escape = codecs.getdecoder('unicode_escape')
     return re.sub(
@@ -3185,26 +3782,73 @@ def strip_jsonp(code):
         r'\g<callback_data>', code)
 
 
-def js_to_json(code, vars={}, *, strict=False):
-    # vars is a dict of var, val pairs to substitute
-    STRING_QUOTES = '\'"`'
-    STRING_RE = '|'.join(rf'{q}(?:\\.|[^\\{q}])*{q}' for q in STRING_QUOTES)
-    COMMENT_RE = r'/\*(?:(?!\*/).)*?\*/|//[^\n]*\n'
-    SKIP_RE = fr'\s*(?:{COMMENT_RE})?\s*'
-    INTEGER_TABLE = (
-        (fr'(?s)^(0[xX][0-9a-fA-F]+){SKIP_RE}:?$', 16),
-        (fr'(?s)^(0+[0-7]+){SKIP_RE}:?$', 8),
-    )
-
-    def process_escape(match):
-        JSON_PASSTHROUGH_ESCAPES = R'"\bfnrtu'
-        escape = match.group(1) or match.group(2)
-
-        return (Rf'\{escape}' if escape in JSON_PASSTHROUGH_ESCAPES
-                else R'\u00' if escape == 'x'
-                else '' if escape == '\n'
-                else escape)
+_JS_STRING_QUOTES = '\'"`'
+_JS_STRING_RE = '|'.join(rf'{q}(?:\\.|[^\\{q}])*{q}' for q in _JS_STRING_QUOTES)
+_JS_COMMENT_RE = r'/\*(?:(?!\*/).)*?\*/|//[^\n]*\n'
+_JS_SKIP_RE = fr'\s*(?:{_JS_COMMENT_RE})?\s*'
+_JS_INTEGER_TABLE = (
+    (re.compile(fr'(?s)^(0[xX][0-9a-fA-F]+){_JS_SKIP_RE}:?$'), 16),
+    (re.compile(fr'(?s)^(0+[0-7]+){_JS_SKIP_RE}:?$'), 8),
+)
+# A digit sequence that is not the start of a hex or octal literal
+_JS_DIGITS_RE = r'(?!\b(?:0[xX][0-9a-fA-F]|0+[0-7]))[0-9]+'
+# Runs of what is already JSON; they are matched first so that a single
+# callback converts many tokens of large configs at once
+_JS_JSON_RUN_RE = rf"""(?:
+    "(?:[^"\\]|\\["\\bfnrtu])*"|
+    (?:true|false|null)(?![.a-zA-Z_$0-9])|
+    -?{_JS_DIGITS_RE}(?:\.{_JS_DIGITS_RE})?(?:[eE][+-]?{_JS_DIGITS_RE})?(?![0-9])(?!{_JS_SKIP_RE}:)|
+    ,(?!{_JS_SKIP_RE}[\]}}])|
+    [\s{{}}\[\]:]
+){{1,64}}"""
+_JS_TOKEN_RE = re.compile(rf"""(?sx)
+    (?P<json>{_JS_JSON_RUN_RE})|
+    (?P<string>{_JS_STRING_RE})|
+    (?P<comment>{_JS_COMMENT_RE})|(?P<comma>,(?={_JS_SKIP_RE}[\]}}]))|
+    (?P<void>void\s0)|(?P<name>(?:(?<![0-9])[eE]|[a-df-zA-DF-Z_$])[.a-zA-Z_$0-9]*)|
+    (?P<integer>\b(?:0[xX][0-9a-fA-F]+|0+[0-7]+)(?:{_JS_SKIP_RE}:)?)|
+    (?P<key>[0-9]+(?={_JS_SKIP_RE}:))|
+    (?P<bang>!+)
+    """)
+# What may start a string or a comment that the tokenizer has not seen the end of yet
+_JS_UNTERMINATED_RE = re.compile(r'[\'"`]|/[*/]')
+# What the look-aheads of the tokens may skip over or look for
+_JS_LOOKAHEAD_RE = re.compile(r'[\s/:\]}]')
+_JS_WORD_RE = re.compile(r'\w')
+
+
+def _js_process_escape(match):
+    JSON_PASSTHROUGH_ESCAPES = R'"\bfnrtu'
+    escape = match.group(1) or match.group(2)
+
+    return (Rf'\{escape}' if escape in JSON_PASSTHROUGH_ESCAPES
+            else R'\u00' if escape == 'x'
+            else '' if escape == '\n'
+            else escape)
+
+
+def _js_prepare(code, vars, strict):
+    """Rewrite the constructs that js_to_json turns into JSON values before tokenizing"""
+    def create_map(mobj):
+        return json.dumps(dict(json.loads(js_to_json(mobj.group(1) or '[]', vars=vars))))
 
+    # The substitutions are only attempted when their literal prefix is present,
+    # which is much cheaper than scanning a large config with each of the regexes
+    if 'new Map(' in code:
+        code = re.sub(r'new Map\((\[.*?\])?\)', create_map, code)
+    if not strict:
+        if 'new Date(' in code:
+            code = re.sub(r'new Date\((".+")\)', r'\g<1>', code)
+        if 'new ' in code:
+            code = re.sub(r'new \w+\((.*?)\)', lambda m: json.dumps(m.group(0)), code)
+        if 'parseInt(' in code:
+            code = re.sub(r'parseInt\([^\d]+(\d+)[^\d]+\)', r'\1', code)
+        if '(function(' in code:
+            code = re.sub(r'\(function\([^)]*\)\s*\{[^}]*\}\s*\)\s*\(\s*(["\'][^)]*["\'])\s*\)', r'\1', code)
+    return code
+
+
+def _js_token_converter(vars, strict):
     def template_substitute(match):
         evaluated = js_to_json(match.group(1), vars, strict=strict)
         if evaluated[0] == '"':
@@ -3212,21 +3856,23 @@ def template_substitute(match):
         return evaluated
 
     def fix_kv(m):
-        v = m.group(0)
-        if v in ('true', 'false', 'null'):
+        v, kind = m.group(0), m.lastgroup
+        if kind == 'json':
+            return v
+        elif kind == 'string':
+            v = re.sub(r'(?s)\${([^}]+)}', template_substitute, v[1:-1]) if v[0] == '`' else v[1:-1]
+            if '"' in v or '\\' in v:
+                v = re.sub(r'(?s)(")|\\(.)', _js_process_escape, v)
+            return f'"{v}"'
+        elif kind in ('comment', 'comma', 'bang'):
+            return ''
+        elif v in ('true', 'false', 'null'):
             return v
         elif v in ('undefined', 'void 0'):
             return 'null'
-        elif v.startswith('/*') or v.startswith('//') or v.startswith('!') or v == ',':
-            return ''
-
-        if v[0] in STRING_QUOTES:
-            v = re.sub(r'(?s)\${([^}]+)}', template_substitute, v[1:-1]) if v[0] == '`' else v[1:-1]
-            escaped = re.sub(r'(?s)(")|\\(.)', process_escape, v)
-            return f'"{escaped}"'
 
-        for regex, base in INTEGER_TABLE:
-            im = re.match(regex, v)
+        for regex, base in _JS_INTEGER_TABLE:
+            im = regex.match(v)
             if im:
                 i = int(im.group(1), base)
                 return f'"{i}":' if v.endswith(':') else str(i)
@@ -3245,24 +3891,73 @@ def fix_kv(m):
 
         raise ValueError(f'Unknown value: {v}')
 
-    def create_map(mobj):
-        return json.dumps(dict(json.loads(js_to_json(mobj.group(1) or '[]', vars=vars))))
+    return fix_kv
+
+
+def _js_tokens_to_json(code, fix_kv):
+    """
+    Convert the tokens of code as far as no more code appended to it can change the result
+
+    @returns (json, end) where json is the conversion of code[:end]
+    """
+    tokens, pos, end, end_idx = [], 0, 0, 0
+    for mobj in _JS_TOKEN_RE.finditer(code):
+        start = mobj.start()
+        if start != pos:
+            gap = code[pos:start]
+            # A slash before a /* comment may start a // comment that is not terminated yet
+            if _JS_UNTERMINATED_RE.search(gap) or gap[-1] == '/' and mobj.lastgroup == 'comment':
+                break
+            tokens.append(gap)
+        # The rest can be converted separately if this token starts with a character that
+        # none of the look-aheads before it can skip over or look for, and is preceded
+        # by one that does not affect the look-behind or word boundary at its start
+        if not _JS_LOOKAHEAD_RE.match(code, start) and not (start and _JS_WORD_RE.match(code, start - 1)):
+            end, end_idx = start, len(tokens)
+        tokens.append(mobj)
+        pos = mobj.end()
+    return ''.join(token if isinstance(token, str) else fix_kv(token) for token in tokens[:end_idx]), end
+
+
+def js_to_json(code, vars={}, *, strict=False):
+    # vars is a dict of var, val pairs to substitute
+    return _JS_TOKEN_RE.sub(_js_token_converter(vars, strict), _js_prepare(code, vars, strict))
+
 
-    code = re.sub(r'new Map\((\[.*?\])?\)', create_map, code)
+def _js_prepare_end(code, strict):
+    """@returns the length of the start of code that _js_prepare can be applied to on its own"""
+    # Hold back what could be the start of a prefix, the code from a construct that can span
+    # lines on, and the rest of a line with a construct that may not be complete yet
+    end = max(len(code) - len('(function(') + 1, 0)
     if not strict:
-        code = re.sub(r'new Date\((".+")\)', r'\g<1>', code)
-        code = re.sub(r'new \w+\((.*?)\)', lambda m: json.dumps(m.group(0)), code)
-        code = re.sub(r'parseInt\([^\d]+(\d+)[^\d]+\)', r'\1', code)
-        code = re.sub(r'\(function\([^)]*\)\s*\{[^}]*\}\s*\)\s*\(\s*(["\'][^)]*["\'])\s*\)', r'\1', code)
+        end = min([end, *(idx for idx in (code.find('parseInt('), code.find('(function(')) if idx >= 0)])
+    idx = code.find('new ', code.rfind('\n', 0, end) + 1, end + len('new ') - 1)
+    return end if idx == -1 else idx
 
-    return re.sub(rf'''(?sx)
-        {STRING_RE}|
-        {COMMENT_RE}|,(?={SKIP_RE}[\]}}])|
-        void\s0|(?:(?<![0-9])[eE]|[a-df-zA-DF-Z_$])[.a-zA-Z_$0-9]*|
-        \b(?:0[xX][0-9a-fA-F]+|0+[0-7]+)(?:{SKIP_RE}:)?|
-        [0-9]+(?={SKIP_RE}:)|
-        !+
-        ''', fix_kv, code)
+
+def iter_js_to_json(chunks, vars={}, *, strict=False):
+    """
+    Incrementally convert JS code that is read in chunks, eg. from a stream
+
+    Yields pieces of JSON that join to the same result as js_to_json on the joined chunks.
+    A construct that is rewritten before tokenizing (new Map(...) etc) is held back until its
+    line is complete; unless strict, the code from a parseInt(...) or an IIFE on until the end
+    """
+    fix_kv = _js_token_converter(vars, strict)
+    pending = prepared = ''
+    for chunk in chunks:
+        pending += chunk
+        end = _js_prepare_end(pending, strict)
+        if end:
+            prepared += _js_prepare(pending[:end], vars, strict)
+            pending = pending[end:]
+        converted, end = _js_tokens_to_json(prepared, fix_kv)
+        if end:
+            prepared = prepared[end:]
+            yield converted
+    prepared += _js_prepare(pending, vars, strict)
+    if prepared:
+        yield _JS_TOKEN_RE.sub(fix_kv, prepared)
 
 
 def qualities(quality_ids):
@@ -3646,7 +4341,7 @@ def filter_using_list(row, filterArray):
 
 
 def _match_one(filter_part, dct, incomplete):
-    # TODO: Generalize code with YoutubeDL._build_format_filter
+    # TODO: Generalize code with FormatFilter
     STRING_OPERATORS = {
         '*=': operator.contains,
         '^=': lambda attr, value: attr.startswith(value),
@@ -3762,6 +4457,86 @@ def _match_func(info_dict, incomplete=False):
     return _match_func
 
 
+class FormatFilter:
+    """
+    Predicate for the formats, compiled from a filter of the format selection
+    such as "height<=?720" or "vcodec!^=avc1"; see "Filtering Formats" in README
+    """
+
+    _NUMERIC_OPERATORS = {
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+        '=': operator.eq,
+        '!=': operator.ne,
+    }
+    _STRING_OPERATORS = {
+        '=': operator.eq,
+        '^=': lambda attr, value: attr.startswith(value),
+        '$=': lambda attr, value: attr.endswith(value),
+        '*=': lambda attr, value: value in attr,
+        '~=': lambda attr, value: value.search(attr) is not None
+    }
+    _NUMERIC_FILTER_RE = re.compile(r'''(?x)\s*
+        (?P<key>[\w.-]+)\s*
+        (?P<op>%s)(?P<none_inclusive>\s*\?)?\s*
+        (?P<value>[0-9.]+(?:[kKmMgGtTpPeEzZyY]i?[Bb]?)?)\s*
+        ''' % '|'.join(map(re.escape, _NUMERIC_OPERATORS.keys())))
+    _STRING_FILTER_RE = re.compile(r'''(?x)\s*
+        (?P<key>[a-zA-Z0-9._-]+)\s*
+        (?P<negation>!\s*)?(?P<op>%s)\s*(?P<none_inclusive>\?\s*)?
+        (?P<quote>["'])?
+        (?P<value>(?(quote)(?:(?!(?P=quote))[^\\]|\\.)+|[\w.-]+))
+        (?(quote)(?P=quote))\s*
+        ''' % '|'.join(map(re.escape, _STRING_OPERATORS.keys())))
+
+    def __init__(self, filter_spec):
+        self.filter_spec, self.negated = filter_spec, False
+        m = self._NUMERIC_FILTER_RE.fullmatch(filter_spec)
+        if m:
+            try:
+                self.value = int(m.group('value'))
+            except ValueError:
+                self.value = parse_filesize(m.group('value'))
+                if self.value is None:
+                    self.value = parse_filesize(m.group('value') + 'B')
+                if self.value is None:
+                    raise ValueError(
+                        'Invalid value %r in format specification %r' % (
+                            m.group('value'), filter_spec))
+            self._op = self._NUMERIC_OPERATORS[m.group('op')]
+
+        if not m:
+            m = self._STRING_FILTER_RE.fullmatch(filter_spec)
+            if m:
+                if m.group('op') == '~=':
+                    self.value = re.compile(m.group('value'))
+                else:
+                    self.value = re.sub(r'''\\([\\"'])''', r'\1', m.group('value'))
+                self._op = self._STRING_OPERATORS[m.group('op')]
+                self.negated = bool(m.group('negation'))
+
+        if not m:
+            raise SyntaxError('Invalid filter specification %r' % filter_spec)
+        self.key, self.operator = m.group('key'), m.group('op')
+        self.none_inclusive = bool(m.group('none_inclusive'))
+
+    def __call__(self, f):
+        actual_value = f.get(self.key)
+        if actual_value is None:
+            return self.none_inclusive
+        result = self._op(actual_value, self.value)
+        return not result if self.negated else result
+
+    def __str__(self):
+        value = self.value.pattern if isinstance(self.value, re.Pattern) else self.value
+        return f'{self.key} {"!" * self.negated}{self.operator}{"?" * self.none_inclusive} {value!r}'
+
+    def __repr__(self):
+        return f'{__name__}.{type(self).__name__}({self.filter_spec!r})'
+
+
 class DownloadRange:
     def __init__(self, chapters, ranges):
         self.chapters, self.ranges = chapters, ranges
@@ -5171,242 +5946,10 @@ def get_system_config_dirs(package_name):
     yield os.path.join('/etc', package_name)
 
 
-def traverse_obj(
-        obj, *paths, default=NO_DEFAULT, expected_type=None, get_all=True,
-        casesense=True, is_user_input=False, traverse_string=False):
-    """
-    Safely traverse nested `dict`s and `Iterable`s
-
-    >>> obj = [{}, {"key": "value"}]
-    >>> traverse_obj(obj, (1, "key"))
-    "value"
-
-    Each of the provided `paths` is tested and the first producing a valid result will be returned.
-    The next path will also be tested if the path branched but no results could be found.
-    Supported values for traversal are `Mapping`, `Iterable` and `re.Match`.
-    Unhelpful values (`{}`, `None`) are treated as the absence of a value and discarded.
-
-    The paths will be wrapped in `variadic`, so that `'key'` is conveniently the same as `('key', )`.
-
-    The keys in the path can be one of:
-        - `None`:           Return the current object.
-        - `set`:            Requires the only item in the set to be a type or function,
-                            like `{type}`/`{func}`. If a `type`, returns only values
-                            of this type. If a function, returns `func(obj)`.
-        - `str`/`int`:      Return `obj[key]`. For `re.Match`, return `obj.group(key)`.
-        - `slice`:          Branch out and return all values in `obj[key]`.
-        - `Ellipsis`:       Branch out and return a list of all values.
-        - `tuple`/`list`:   Branch out and return a list of all matching values.
-                            Read as: `[traverse_obj(obj, branch) for branch in branches]`.
-        - `function`:       Branch out and return values filtered by the function.
-                            Read as: `[value for key, value in obj if function(key, value)]`.
-                            For `Iterable`s, `key` is the index of the value.
-                            For `re.Match`es, `key` is the group number (0 = full match)
-                            as well as additionally any group names, if given.
-        - `dict`            Transform the current object and return a matching dict.
-                            Read as: `{key: traverse_obj(obj, path) for key, path in dct.items()}`.
-
-        `tuple`, `list`, and `dict` all support nested paths and branches.
-
-    @params paths           Paths which to traverse by.
-    @param default          Value to return if the paths do not match.
-                            If the last key in the path is a `dict`, it will apply to each value inside
-                            the dict instead, depth first. Try to avoid if using nested `dict` keys.
-    @param expected_type    If a `type`, only accept final values of this type.
-                            If any other callable, try to call the function on each result.
-                            If the last key in the path is a `dict`, it will apply to each value inside
-                            the dict instead, recursively. This does respect branching paths.
-    @param get_all          If `False`, return the first matching result, otherwise all matching ones.
-    @param casesense        If `False`, consider string dictionary keys as case insensitive.
-
-    The following are only meant to be used by YoutubeDL.prepare_outtmpl and are not part of the API
-
-    @param is_user_input    Whether the keys are generated from user input.
-                            If `True` strings get converted to `int`/`slice` if needed.
-    @param traverse_string  Whether to traverse into objects as strings.
-                            If `True`, any non-compatible object will first be
-                            converted into a string and then traversed into.
-                            The return value of that path will be a string instead,
-                            not respecting any further branching.
-
-
-    @returns                The result of the object traversal.
-                            If successful, `get_all=True`, and the path branches at least once,
-                            then a list of results is returned instead.
-                            If no `default` is given and the last path branches, a `list` of results
-                            is always returned. If a path ends on a `dict` that result will always be a `dict`.
-    """
-    casefold = lambda k: k.casefold() if isinstance(k, str) else k
-
-    if isinstance(expected_type, type):
-        type_test = lambda val: val if isinstance(val, expected_type) else None
-    else:
-        type_test = lambda val: try_call(expected_type or IDENTITY, args=(val,))
-
-    def apply_key(key, obj, is_last):
-        branching = False
-        result = None
-
-        if obj is None and traverse_string:
-            if key is ... or callable(key) or isinstance(key, slice):
-                branching = True
-                result = ()
-
-        elif key is None:
-            result = obj
-
-        elif isinstance(key, set):
-            assert len(key) == 1, 'Set should only be used to wrap a single item'
-            item = next(iter(key))
-            if isinstance(item, type):
-                if isinstance(obj, item):
-                    result = obj
-            else:
-                result = try_call(item, args=(obj,))
-
-        elif isinstance(key, (list, tuple)):
-            branching = True
-            result = itertools.chain.from_iterable(
-                apply_path(obj, branch, is_last)[0] for branch in key)
-
-        elif key is ...:
-            branching = True
-            if isinstance(obj, collections.abc.Mapping):
-                result = obj.values()
-            elif is_iterable_like(obj):
-                result = obj
-            elif isinstance(obj, re.Match):
-                result = obj.groups()
-            elif traverse_string:
-                branching = False
-                result = str(obj)
-            else:
-                result = ()
-
-        elif callable(key):
-            branching = True
-            if isinstance(obj, collections.abc.Mapping):
-                iter_obj = obj.items()
-            elif is_iterable_like(obj):
-                iter_obj = enumerate(obj)
-            elif isinstance(obj, re.Match):
-                iter_obj = itertools.chain(
-                    enumerate((obj.group(), *obj.groups())),
-                    obj.groupdict().items())
-            elif traverse_string:
-                branching = False
-                iter_obj = enumerate(str(obj))
-            else:
-                iter_obj = ()
-
-            result = (v for k, v in iter_obj if try_call(key, args=(k, v)))
-            if not branching:  # string traversal
-                result = ''.join(result)
-
-        elif isinstance(key, dict):
-            iter_obj = ((k, _traverse_obj(obj, v, False, is_last)) for k, v in key.items())
-            result = {
-                k: v if v is not None else default for k, v in iter_obj
-                if v is not None or default is not NO_DEFAULT
-            } or None
-
-        elif isinstance(obj, collections.abc.Mapping):
-            result = (try_call(obj.get, args=(key,)) if casesense or try_call(obj.__contains__, args=(key,)) else
-                      next((v for k, v in obj.items() if casefold(k) == key), None))
-
-        elif isinstance(obj, re.Match):
-            if isinstance(key, int) or casesense:
-                with contextlib.suppress(IndexError):
-                    result = obj.group(key)
-
-            elif isinstance(key, str):
-                result = next((v for k, v in obj.groupdict().items() if casefold(k) == key), None)
-
-        elif isinstance(key, (int, slice)):
-            if is_iterable_like(obj, collections.abc.Sequence):
-                branching = isinstance(key, slice)
-                with contextlib.suppress(IndexError):
-                    result = obj[key]
-            elif traverse_string:
-                with contextlib.suppress(IndexError):
-                    result = str(obj)[key]
-
-        return branching, result if branching else (result,)
-
-    def lazy_last(iterable):
-        iterator = iter(iterable)
-        prev = next(iterator, NO_DEFAULT)
-        if prev is NO_DEFAULT:
-            return
-
-        for item in iterator:
-            yield False, prev
-            prev = item
-
-        yield True, prev
-
-    def apply_path(start_obj, path, test_type):
-        objs = (start_obj,)
-        has_branched = False
-
-        key = None
-        for last, key in lazy_last(variadic(path, (str, bytes, dict, set))):
-            if is_user_input and isinstance(key, str):
-                if key == ':':
-                    key = ...
-                elif ':' in key:
-                    key = slice(*map(int_or_none, key.split(':')))
-                elif int_or_none(key) is not None:
-                    key = int(key)
-
-            if not casesense and isinstance(key, str):
-                key = key.casefold()
-
-            if __debug__ and callable(key):
-                # Verify function signature
-                inspect.signature(key).bind(None, None)
-
-            new_objs = []
-            for obj in objs:
-                branching, results = apply_key(key, obj, last)
-                has_branched |= branching
-                new_objs.append(results)
-
-            objs = itertools.chain.from_iterable(new_objs)
-
-        if test_type and not isinstance(key, (dict, list, tuple)):
-            objs = map(type_test, objs)
-
-        return objs, has_branched, isinstance(key, dict)
-
-    def _traverse_obj(obj, path, allow_empty, test_type):
-        results, has_branched, is_dict = apply_path(obj, path, test_type)
-        results = LazyList(item for item in results if item not in (None, {}))
-        if get_all and has_branched:
-            if results:
-                return results.exhaust()
-            if allow_empty:
-                return [] if default is NO_DEFAULT else default
-            return None
-
-        return results[0] if results else {} if allow_empty and is_dict else None
-
-    for index, path in enumerate(paths, 1):
-        result = _traverse_obj(obj, path, index == len(paths), True)
-        if result is not None:
-            return result
-
-    return None if default is NO_DEFAULT else default
-
-
 def traverse_dict(dictn, keys, casesense=True):
     deprecation_warning(f'"{__name__}.traverse_dict" is deprecated and may be removed '
                         f'in a future version. Use "{__name__}.traverse_obj" instead')
-    return traverse_obj(dictn, keys, casesense=casesense, is_user_input=True, traverse_string=True)
-
-
-def get_first(obj, *paths, **kwargs):
-    return traverse_obj(obj, *((..., *variadic(keys)) for keys in paths), **kwargs, get_all=False)
+    return traversal.traverse_obj(dictn, keys, casesense=casesense, is_user_input=True, traverse_string=True)
 
 
 def bytes_to_scalar(value):
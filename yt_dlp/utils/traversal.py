@@ -5,9 +5,7 @@
 import re
 
 from ._utils import (
-    IDENTITY,
     NO_DEFAULT,
-    LazyList,
     int_or_none,
     is_iterable_like,
     try_call,
@@ -80,55 +78,147 @@ def traverse_obj(
                             If no `default` is given and the last path branches, a `list` of results
                             is always returned. If a path ends on a `dict` that result will always be a `dict`.
     """
-    casefold = lambda k: k.casefold() if isinstance(k, str) else k
-
-    if isinstance(expected_type, type):
+    if not expected_type:
+        type_test = None
+    elif isinstance(expected_type, type):
         type_test = lambda val: val if isinstance(val, expected_type) else None
     else:
-        type_test = lambda val: try_call(expected_type or IDENTITY, args=(val,))
-
-    def apply_key(key, obj, is_last):
-        branching = False
-        result = None
-
-        if obj is None and traverse_string:
-            if key is ... or callable(key) or isinstance(key, slice):
-                branching = True
-                result = ()
-
-        elif key is None:
-            result = obj
-
-        elif isinstance(key, set):
-            assert len(key) == 1, 'Set should only be used to wrap a single item'
-            item = next(iter(key))
-            if isinstance(item, type):
-                if isinstance(obj, item):
-                    result = obj
-            else:
-                result = try_call(item, args=(obj,))
+        type_test = lambda val: try_call(expected_type, args=(val,))
+
+    options = (casesense, is_user_input, traverse_string)
+    state = (default, get_all, type_test)
+    for index, path in enumerate(paths, 1):
+        if not isinstance(path, CompiledPath):
+            path = _compile_path_cached(path, options)
+        result = _traverse(obj, path, index == len(paths), True, state)
+        if result is not None:
+            return result
+
+    return None if default is NO_DEFAULT else default
+
+
+class CompiledPath:
+    """A path of `traverse_obj` that has been compiled by `compile_path`"""
+
+    def __init__(self, accessors, is_dict, test_type):
+        self.accessors, self.is_dict, self.test_type = accessors, is_dict, test_type
+
+
+def compile_path(path, *, casesense=True, is_user_input=False, traverse_string=False):
+    """
+    Turn a path of `traverse_obj` into a chain of accessors
+
+    The keys are checked and converted only once, instead of on every call.
+    The result can be given to `traverse_obj` instead of the path,
+    and is always traversed with the options that it was compiled with.
 
-        elif isinstance(key, (list, tuple)):
-            branching = True
-            result = itertools.chain.from_iterable(
-                apply_path(obj, branch, is_last)[0] for branch in key)
+    `traverse_obj` already caches the compiled forms of the paths it is given;
+    this is for the paths that cannot be cached, or the hottest ones
+    """
+    return _compile_path(path, (casesense, is_user_input, traverse_string))
+
+
+_COMPILED_PATHS = {}
+_COMPILED_PATHS_SIZE = 4096
+_DICT, _SET, _SLICE = object(), object(), object()
+
+
+def _freeze_path(path):
+    """A hashable key that is equal for the paths that are compiled the same way"""
+    if isinstance(path, str):
+        return path
+    elif isinstance(path, (tuple, list)):
+        return tuple(map(_freeze_path, path))
+    elif isinstance(path, dict):
+        return (_DICT, *((key, _freeze_path(value)) for key, value in path.items()))
+    elif isinstance(path, set):
+        return (_SET, *map(_freeze_path, path))
+    elif isinstance(path, slice):
+        return (_SLICE, path.start, path.stop, path.step)
+    elif isinstance(path, collections.abc.Iterator):
+        raise TypeError('An iterator is consumed by the traversal')
+    hash(path)  # Unhashable keys cannot be cached
+    # 1, 1.0 and True are equal, but are not the same keys
+    return type(path), path
+
+
+def _compile_path_cached(path, options):
+    try:
+        key = (_freeze_path(path), options)
+    except TypeError:
+        return _compile_path(path, options)
+
+    compiled = _COMPILED_PATHS.get(key)
+    if compiled is None:
+        if len(_COMPILED_PATHS) >= _COMPILED_PATHS_SIZE:
+            _COMPILED_PATHS.clear()
+        compiled = _COMPILED_PATHS[key] = _compile_path(path, options)
+    return compiled
+
+
+def _compile_path(path, options):
+    casesense, is_user_input, _ = options
+
+    key, accessors = None, []
+    keys = list(variadic(path, (str, bytes, dict, set)))
+    for index, key in enumerate(keys, 1):
+        if is_user_input and isinstance(key, str):
+            if key == ':':
+                key = ...
+            elif ':' in key:
+                key = slice(*map(int_or_none, key.split(':')))
+            elif int_or_none(key) is not None:
+                key = int(key)
+
+        if not casesense and isinstance(key, str):
+            key = key.casefold()
+
+        if __debug__ and callable(key):
+            # Verify function signature
+            inspect.signature(key).bind(None, None)
+
+        accessors.append(_compile_key(key, index == len(keys), options))
+
+    return CompiledPath(tuple(accessors), isinstance(key, dict), not isinstance(key, (dict, list, tuple)))
+
+
+def _compile_key(key, is_last, options):
+    """@returns a function (obj, state) -> (branching, results) that applies the key"""
+    casesense, _, traverse_string = options
+    casefold = lambda k: k.casefold() if isinstance(k, str) else k
+
+    if key is None:
+        accessor = lambda obj, state: (False, (obj,))
+
+    elif isinstance(key, set):
+        assert len(key) == 1, 'Set should only be used to wrap a single item'
+        item = next(iter(key))
+        if isinstance(item, type):
+            accessor = lambda obj, state: (False, (obj if isinstance(obj, item) else None,))
+        else:
+            accessor = lambda obj, state: (False, (try_call(item, args=(obj,)),))
 
-        elif key is ...:
-            branching = True
+    elif isinstance(key, (list, tuple)):
+        branches = [_compile_path(branch, options) for branch in key]
+
+        def accessor(obj, state):
+            return True, itertools.chain.from_iterable(
+                _apply_path(obj, branch, is_last, state)[0] for branch in branches)
+
+    elif key is ...:
+        def accessor(obj, state):
             if isinstance(obj, collections.abc.Mapping):
-                result = obj.values()
+                return True, obj.values()
             elif is_iterable_like(obj):
-                result = obj
+                return True, obj
             elif isinstance(obj, re.Match):
-                result = obj.groups()
+                return True, obj.groups()
             elif traverse_string:
-                branching = False
-                result = str(obj)
-            else:
-                result = ()
+                return False, (str(obj),)
+            return True, ()
 
-        elif callable(key):
-            branching = True
+    elif callable(key):
+        def accessor(obj, state):
             if isinstance(obj, collections.abc.Mapping):
                 iter_obj = obj.items()
             elif is_iterable_like(obj):
@@ -138,109 +228,96 @@ def apply_key(key, obj, is_last):
                     enumerate((obj.group(), *obj.groups())),
                     obj.groupdict().items())
             elif traverse_string:
-                branching = False
-                iter_obj = enumerate(str(obj))
+                # string traversal
+                return False, (''.join(v for k, v in enumerate(str(obj)) if try_call(key, args=(k, v))),)
             else:
                 iter_obj = ()
+            return True, (v for k, v in iter_obj if try_call(key, args=(k, v)))
 
-            result = (v for k, v in iter_obj if try_call(key, args=(k, v)))
-            if not branching:  # string traversal
-                result = ''.join(result)
+    elif isinstance(key, dict):
+        paths = {k: _compile_path(v, options) for k, v in key.items()}
 
-        elif isinstance(key, dict):
-            iter_obj = ((k, _traverse_obj(obj, v, False, is_last)) for k, v in key.items())
-            result = {
+        def accessor(obj, state):
+            default = state[0]
+            iter_obj = ((k, _traverse(obj, v, False, is_last, state)) for k, v in paths.items())
+            return False, ({
                 k: v if v is not None else default for k, v in iter_obj
                 if v is not None or default is not NO_DEFAULT
-            } or None
-
-        elif isinstance(obj, collections.abc.Mapping):
-            result = (try_call(obj.get, args=(key,)) if casesense or try_call(obj.__contains__, args=(key,)) else
-                      next((v for k, v in obj.items() if casefold(k) == key), None))
+            } or None,)
 
-        elif isinstance(obj, re.Match):
-            if isinstance(key, int) or casesense:
-                with contextlib.suppress(IndexError):
-                    result = obj.group(key)
-
-            elif isinstance(key, str):
-                result = next((v for k, v in obj.groupdict().items() if casefold(k) == key), None)
+    else:
+        def accessor(obj, state):
+            if isinstance(obj, collections.abc.Mapping):
+                return False, (try_call(obj.get, args=(key,)) if casesense or try_call(obj.__contains__, args=(key,))
+                               else next((v for k, v in obj.items() if casefold(k) == key), None),)
 
-        elif isinstance(key, (int, slice)):
-            if is_iterable_like(obj, collections.abc.Sequence):
-                branching = isinstance(key, slice)
-                with contextlib.suppress(IndexError):
-                    result = obj[key]
-            elif traverse_string:
-                with contextlib.suppress(IndexError):
-                    result = str(obj)[key]
+            result = None
+            if isinstance(obj, re.Match):
+                if isinstance(key, int) or casesense:
+                    with contextlib.suppress(IndexError):
+                        result = obj.group(key)
 
-        return branching, result if branching else (result,)
+                elif isinstance(key, str):
+                    result = next((v for k, v in obj.groupdict().items() if casefold(k) == key), None)
 
-    def lazy_last(iterable):
-        iterator = iter(iterable)
-        prev = next(iterator, NO_DEFAULT)
-        if prev is NO_DEFAULT:
-            return
+            elif isinstance(key, (int, slice)):
+                if is_iterable_like(obj, collections.abc.Sequence):
+                    branching = isinstance(key, slice)
+                    with contextlib.suppress(IndexError):
+                        result = obj[key]
+                    return branching, result if branching else (result,)
+                elif traverse_string:
+                    with contextlib.suppress(IndexError):
+                        result = str(obj)[key]
 
-        for item in iterator:
-            yield False, prev
-            prev = item
+            return False, (result,)
 
-        yield True, prev
+    if not traverse_string:
+        return accessor
 
-    def apply_path(start_obj, path, test_type):
-        objs = (start_obj,)
-        has_branched = False
+    branching = key is ... or callable(key) or isinstance(key, slice)
 
-        key = None
-        for last, key in lazy_last(variadic(path, (str, bytes, dict, set))):
-            if is_user_input and isinstance(key, str):
-                if key == ':':
-                    key = ...
-                elif ':' in key:
-                    key = slice(*map(int_or_none, key.split(':')))
-                elif int_or_none(key) is not None:
-                    key = int(key)
+    def accessor_or_none(obj, state):
+        if obj is None:
+            return (True, ()) if branching else (False, (None,))
+        return accessor(obj, state)
 
-            if not casesense and isinstance(key, str):
-                key = key.casefold()
+    return accessor_or_none
 
-            if __debug__ and callable(key):
-                # Verify function signature
-                inspect.signature(key).bind(None, None)
 
-            new_objs = []
-            for obj in objs:
-                branching, results = apply_key(key, obj, last)
-                has_branched |= branching
-                new_objs.append(results)
+def _apply_path(start_obj, path, test_type, state):
+    objs = (start_obj,)
+    has_branched = False
 
-            objs = itertools.chain.from_iterable(new_objs)
+    for accessor in path.accessors:
+        new_objs = []
+        for obj in objs:
+            branching, results = accessor(obj, state)
+            has_branched |= branching
+            new_objs.append(results)
 
-        if test_type and not isinstance(key, (dict, list, tuple)):
-            objs = map(type_test, objs)
+        objs = itertools.chain.from_iterable(new_objs)
 
-        return objs, has_branched, isinstance(key, dict)
+    if test_type and path.test_type and state[2]:
+        objs = map(state[2], objs)
 
-    def _traverse_obj(obj, path, allow_empty, test_type):
-        results, has_branched, is_dict = apply_path(obj, path, test_type)
-        results = LazyList(item for item in results if item not in (None, {}))
-        if get_all and has_branched:
-            if results:
-                return results.exhaust()
-            if allow_empty:
-                return [] if default is NO_DEFAULT else default
-            return None
+    return objs, has_branched, path.is_dict
 
-        return results[0] if results else {} if allow_empty and is_dict else None
 
-    for index, path in enumerate(paths, 1):
-        result = _traverse_obj(obj, path, index == len(paths), True)
-        if result is not None:
-            return result
+def _traverse(obj, path, allow_empty, test_type, state):
+    default, get_all, _ = state
+    results, has_branched, is_dict = _apply_path(obj, path, test_type, state)
+    results = (item for item in results if item not in (None, {}))
+    if get_all and has_branched:
+        results = list(results)
+        if results:
+            return results
+        if allow_empty:
+            return [] if default is NO_DEFAULT else default
+        return None
 
-    return None if default is NO_DEFAULT else default
+    result = next(results, None)
+    return result if result is not None else {} if allow_empty and is_dict else None
 
 
 def get_first(obj, *paths, **kwargs):
@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import importlib.util
+
 HAVE_WEBSOCKET = False
 WebSocket = None
 
@@ -29,10 +31,17 @@ def WebSocketClientWrapper(url, headers={}):
     WebSocketClientWrapper = None
 
 try:
-    from .websockets import WebSocketsWrapper
+    # websockets needs asyncio, which is slow to import; so the wrapper is only imported when it is used
+    if not importlib.util.find_spec('websockets'):
+        raise ImportError('websockets is not installed')
+
+    def WebSocketsWrapper(url, headers=None, connect=True):
+        from .websockets import WebSocketsWrapper
+        return WebSocketsWrapper(url, headers, connect)
+
     HAVE_WS_WEBSOCKETS = True
     HAVE_WEBSOCKET = True
-except (ImportError, ValueError, SyntaxError):
+except (ImportError, ValueError):
     WebSocketsWrapper = None
 
 WebSocket = (WebSocketClientWrapper or WebSocketsWrapper) if HAVE_WEBSOCKET else None